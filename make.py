@@ -2,6 +2,7 @@
 import os
 import sys
 import fnmatch
+import glob
 import shutil
 import subprocess
 
@@ -220,6 +221,14 @@ def translateall():
         "python", PYGETTEXT,
         "mu/*", "mu/debugger/*", "mu/modes/*", "mu/resources/*"
     ]).returncode
+    if result == 0:
+        # The API definitions are kept in JSON rather than Python files.
+        catalogues = sorted(glob.glob(os.path.join("mu", "modes", "api",
+                                                   "*.json")))
+        with open("messages.pot", "a", encoding="utf-8") as pot:
+            result = subprocess.run(
+                ["python", os.path.join("utils", "mkapi.py"), "--pot"] +
+                catalogues, stdout=pot).returncode
     print("\nNew messages.pot file created.")
     print("Remember to update the translation strings"
           "found in the locale directory.")
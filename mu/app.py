@@ -23,18 +23,22 @@ import logging
 from logging.handlers import TimedRotatingFileHandler
 import os
 import platform
-import pkgutil
 import sys
 
+# Imported before everything else so the cost of the imports is measured.
+from mu.profiler import PROFILER, PROFILE_FLAG
+
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtWidgets import QApplication, QSplashScreen
 
 from mu import __version__, language_code
-from mu.logic import Editor, LOG_FILE, LOG_DIR, DEBUGGER_PORT, ENCODING
+from mu.logic import (Editor, LOG_FILE, LOG_DIR, DEBUGGER_PORT, ENCODING,
+                      get_settings_path)
+from mu.logs import queue_handler, configure_levels, load_levels
 from mu.interface import Window
+from mu.instance import InstanceServer, forward_paths
 from mu.resources import load_pixmap, load_icon
-from mu.modes import (PythonMode, AdafruitMode, MicrobitMode, DebugMode,
-                      PyGameZeroMode)
+from mu.modes import ModeRegistry, BUILTIN_MODES
 from mu.debugger.runner import run as run_debugger
 from mu.interface.themes import NIGHT_STYLE, DAY_STYLE, CONTRAST_STYLE
 
@@ -58,36 +62,38 @@ def setup_logging():
     handler.setFormatter(formatter)
     handler.setLevel(logging.DEBUG)
 
-    # set up primary log
+    # set up primary log, written to the file in a background thread
     log = logging.getLogger()
     log.setLevel(logging.DEBUG)
-    log.addHandler(handler)
+    log.addHandler(queue_handler(handler))
+    # set the levels for parts of Mu specified in the settings file
+    configure_levels(load_levels(get_settings_path()))
     sys.excepthook = excepthook
     print(_('Logging to {}').format(LOG_FILE))
 
 
 def setup_modes(editor, view):
     """
-    Create a simple dictionary to hold instances of the available modes.
+    Create a registry of the available modes (both those built into Mu and
+    any installed by third party packages).
 
-    *PREMATURE OPTIMIZATION ALERT* This may become more complex in future so
-    splitting things out here to contain the mess. ;-)
+    Modes are only imported and instantiated when first used, so the cost of
+    modes the user never selects isn't paid at startup.
     """
-    modes = {
-        'python': PythonMode(editor, view),
-        'adafruit': AdafruitMode(editor, view),
-        'microbit': MicrobitMode(editor, view),
-        'debugger': DebugMode(editor, view),
-    }
-
-    # Check if pgzero is available (without importing it)
-    if any([m for m in pkgutil.iter_modules() if 'pgzero' in m]):
-        modes['pygamezero'] = PyGameZeroMode(editor, view)
-
-    # return available modes
+    modes = ModeRegistry(editor, view, BUILTIN_MODES)
+    modes.load_entry_points()
     return modes
 
 
+def report_startup_profile():
+    """
+    Write the startup profile (see mu.profiler) into the log directory.
+    """
+    summary_path = PROFILER.finish(LOG_DIR)
+    if summary_path:
+        print(_('Startup profile written to {}').format(summary_path))
+
+
 def excepthook(*exc_args):
     """
     Log exception and exit cleanly.
@@ -103,19 +109,31 @@ def run():
     then runs the application. Specific tasks include:
 
     - set up logging
+    - hand files to an already running copy of Mu (and stop) if possible
     - create an application object
     - create an editor window and status bar
     - display a splash screen while starting
     - close the splash screen after startup timer ends
     """
+    PROFILER.imports_done()
+    if PROFILE_FLAG in sys.argv:
+        sys.argv.remove(PROFILE_FLAG)
     setup_logging()
     logging.info('\n\n-----------------\n\nStarting Mu {}'.format(__version__))
     logging.info(platform.uname())
     logging.info('Python path: {}'.format(sys.path))
     logging.info('Language code: {}'.format(language_code))
 
+    # Hand any files to open to a copy of Mu that's already running, rather
+    # than starting another (unless startup is being profiled).
+    if not PROFILER.enabled and forward_paths(sys.argv[1:]):
+        logging.info('Passed {} to the running copy of Mu.'.format(
+            sys.argv[1:]))
+        return
+
     # The app object is the application running on your computer.
-    app = QApplication(sys.argv)
+    with PROFILER.phase('QApplication()'):
+        app = QApplication(sys.argv)
     # By default PyQt uses the script name (run.py)
     app.setApplicationName('mu')
     # Set hint as to the .desktop files name
@@ -127,31 +145,48 @@ def run():
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
 
     # Create the "window" we'll be looking at.
-    editor_window = Window()
+    with PROFILER.phase('Window()'):
+        editor_window = Window()
 
     @editor_window.load_theme.connect
     def load_theme(theme):
-        if theme == 'contrast':
-            app.setStyleSheet(CONTRAST_STYLE)
-        elif theme == 'night':
-            app.setStyleSheet(NIGHT_STYLE)
-        else:
-            app.setStyleSheet(DAY_STYLE)
+        with PROFILER.phase('stylesheet ({})'.format(theme)):
+            if theme == 'contrast':
+                app.setStyleSheet(CONTRAST_STYLE)
+            elif theme == 'night':
+                app.setStyleSheet(NIGHT_STYLE)
+            else:
+                app.setStyleSheet(DAY_STYLE)
 
     # Make sure all windows have the Mu icon as a fallback
     app.setWindowIcon(load_icon(editor_window.icon))
     # Create the "editor" that'll control the "window".
-    editor = Editor(view=editor_window)
-    editor.setup(setup_modes(editor, editor_window))
+    with PROFILER.phase('Editor.setup'):
+        editor = Editor(view=editor_window)
+        editor.setup(setup_modes(editor, editor_window))
     # Setup the window.
     editor_window.closeEvent = editor.quit
-    editor_window.setup(editor.debug_toggle_breakpoint, editor.theme)
+    with PROFILER.phase('Window.setup'):
+        editor_window.setup(editor.debug_toggle_breakpoint, editor.theme)
+    # Open files passed on by later copies of Mu and come to the front (just
+    # come to the front if they weren't given any files). Listen before
+    # restoring the session, so copies started in the meantime don't start
+    # up in full.
+    instance = InstanceServer(parent=app)
+    instance.paths_received.connect(editor.load_cli)
+    instance.paths_received.connect(lambda paths:
+                                    editor_window.bring_to_front())
+    instance.listen()
     # Restore the previous session along with files passed by the os
-    editor.restore_session(sys.argv[1:])
+    with PROFILER.phase('restore_session'):
+        editor.restore_session(sys.argv[1:])
     # Connect the various UI elements in the window to the editor.
     editor_window.connect_tab_rename(editor.rename_tab, 'Ctrl+Shift+S')
     editor_window.connect_find_replace(editor.find_replace, 'Ctrl+F')
     editor_window.connect_toggle_comments(editor.toggle_comments, 'Ctrl+K')
+    editor_window.connect_go_to_definition(editor.go_to_definition, 'F12')
+    editor_window.connect_toggle_outline(editor.toggle_outline,
+                                         'Ctrl+Shift+O')
     status_bar = editor_window.status_bar
     status_bar.connect_logs(editor.show_admin, 'Ctrl+Shift+D')
 
@@ -165,6 +200,12 @@ def run():
     splash_be_gone.setSingleShot(True)
     splash_be_gone.start(2000)
 
+    if PROFILER.enabled:
+        # Report once the session's files are restored (they're read in the
+        # background) and the event loop has started (so the window is shown).
+        editor.when_restored(
+            lambda: QTimer.singleShot(0, report_startup_profile))
+
     # Stop the program after the application finishes executing.
     sys.exit(app.exec_())
 
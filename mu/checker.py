@@ -0,0 +1,598 @@
+"""
+Checks code for problems with PyFlakes and PyCodeStyle.
+
+Checking a long script can take seconds on slow machines (such as a
+Raspberry Pi), so Mu does it in a separate worker process (see serve and
+mu.workers.CodeChecker). The worker runs this module (python -m mu.checker)
+rather than Mu itself, and this module doesn't need Qt, so it starts
+quickly.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import re
+import sys
+import ast
+import queue
+import pickle
+import hashlib
+import logging
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+import pyflakes
+import pycodestyle
+from pyflakes.api import check
+from pycodestyle import StyleGuide, Checker, BaseReport
+
+
+logger = logging.getLogger(__name__)
+
+
+# Regex to match flake8 output (newer versions of PyFlakes add the column).
+FLAKE_REGEX = re.compile(r'.*?:(\d+):(?:\d+:)?\s+(.*)')
+# Regex to match false positive flake errors if microbit.* is expanded.
+EXPAND_FALSE_POSITIVE = re.compile(r"^'microbit\.(\w+)' imported but unused$")
+# The text to which "from microbit import \*" should be expanded.
+EXPANDED_IMPORT = ("from microbit import pin15, pin2, pin0, pin1, "
+                   " pin3, pin6, pin4, i2c, pin5, pin7, pin8, Image, "
+                   "pin9, pin14, pin16, reset, pin19, temperature, "
+                   "sleep, pin20, button_a, button_b, running_time, "
+                   "accelerometer, display, uart, spi, panic, pin13, "
+                   "pin12, pin11, pin10, compass")
+# The names "from microbit import *" imports (see EXPANDED_IMPORT).
+MICROBIT_NAMES = tuple(alias.name for alias in
+                       ast.parse(EXPANDED_IMPORT).body[0].names)
+# Regex to match messages that refer to a line, such as "redefinition of
+# unused 'foo' from line 3".
+LINE_REFERENCE = re.compile(r'\bline \d+')
+# The number of documents checked incrementally about which the worker keeps
+# what it knows.
+MAX_DOCUMENTS = 10
+# PEP8 rules to ignore.
+STYLE_IGNORE = ('E121', 'E123', 'E126', 'E226', 'E302', 'E305', 'E24',
+                'E704', 'W291', 'W292', 'W293', 'W391', 'W503', )
+# The versions of the checkers (results may differ if they're upgraded).
+VERSION = 'pyflakes {} pycodestyle {}'.format(pyflakes.__version__,
+                                              pycodestyle.__version__)
+
+
+def check_key(code, builtins=None):
+    """
+    Return a key for the results of checking the code with the referenced
+    builtins (see check_flake). The key changes if the code, the builtins
+    or the versions of the checkers do.
+    """
+    digest = hashlib.sha256()
+    for part in (VERSION, ' '.join(sorted(builtins or [])), code):
+        digest.update(part.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=16)
+def builtins_regex(builtins):
+    """
+    Return a regex to match PyFlakes messages about the (tuple of) builtins
+    being undefined names. Each mode has its own builtins, so only a few
+    regexes are ever made.
+    """
+    return re.compile(r"^undefined name '(" + '|'.join(builtins) + r")'")
+
+
+def check_flake(filename, code, builtins=None):
+    """
+    Given a filename and some code to be checked, uses the PyFlakesmodule to
+    return a dictionary describing issues of code quality per line. See:
+
+    https://github.com/PyCQA/pyflakes
+
+    If a list symbols is passed in as "builtins" these are assumed to be
+    additional builtins available when run by Mu.
+    """
+    import_all = "from microbit import *" in code
+    if import_all:
+        # Massage code so "from microbit import *" is expanded so the symbols
+        # are known to flake.
+        code = code.replace("from microbit import *", EXPANDED_IMPORT)
+    reporter = MuFlakeCodeReporter()
+    check(code, filename, reporter)
+    if builtins:
+        undefined_builtin = builtins_regex(tuple(builtins))
+    feedback = {}
+    for log in reporter.log:
+        if import_all:
+            # Guard to stop unwanted "microbit.* imported but unused" messages.
+            message = log['message']
+            if EXPAND_FALSE_POSITIVE.match(message):
+                continue
+        if builtins:
+            if undefined_builtin.match(log['message']):
+                continue
+        if log['line_no'] not in feedback:
+            feedback[log['line_no']] = []
+        feedback[log['line_no']].append(log)
+    return feedback
+
+
+def check_pycodestyle(code):
+    """
+    Given some code, uses the PyCodeStyle module (was PEP8) to return a list
+    of items describing issues of coding style. See:
+
+    https://pycodestyle.readthedocs.io/en/latest/intro.html
+    """
+    style = StyleGuide(parse_argv=False, config_file=False,
+                       reporter=MuStyleReport)
+    style.options.ignore = STYLE_IGNORE
+    checker = Checker(lines=code.splitlines(True), options=style.options)
+    checker.check_all()
+    return checker.report.feedback
+
+
+class MuFlakeCodeReporter:
+    """
+    The class instantiates a reporter that creates structured data about
+    code quality for Mu. Used by the PyFlakes module.
+    """
+
+    def __init__(self):
+        """
+        Set up the reporter object to be used to report PyFlake's results.
+        """
+        self.log = []
+
+    def unexpectedError(self, filename, message):
+        """
+        Called if an unexpected error occured while trying to process the file
+        called filename. The message parameter contains a description of the
+        problem.
+        """
+        self.log.append({
+            'line_no': 0,
+            'filename': filename,
+            'message': str(message)
+        })
+
+    def syntaxError(self, filename, message, line_no, column, source):
+        """
+        Records a syntax error in the file called filename.
+
+        The message argument contains an explanation of the syntax error,
+        line_no indicates the line where the syntax error occurred, column
+        indicates the column on which the error occurred and source is the
+        source code containing the syntax error.
+        """
+        msg = _('Syntax error. Python cannot understand this line. Check for '
+                'missing characters!')
+        self.log.append({
+            'message': msg,
+            'line_no': int(line_no) - 1,  # Zero based counting in Mu.
+            'column': column - 1,
+            'source': source
+        })
+
+    def flake(self, message):
+        """
+        PyFlakes found something wrong with the code.
+        """
+        matcher = FLAKE_REGEX.match(str(message))
+        if matcher:
+            line_no, msg = matcher.groups()
+            self.log.append({
+                'line_no': int(line_no) - 1,  # Zero based counting in Mu.
+                'column': 0,
+                'message': msg,
+            })
+        else:
+            self.log.append({
+                'line_no': 0,
+                'column': 0,
+                'message': str(message),
+            })
+
+
+class MuStyleReport(BaseReport):
+    """
+    Collects the problems found by PyCodeStyle as structured data for Mu,
+    rather than printing them.
+    """
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.feedback = {}
+
+    def error(self, line_number, offset, text, check):
+        """
+        PyCodeStyle found something wrong with the code.
+        """
+        code = super().error(line_number, offset, text, check)
+        if code:
+            line_no = line_number - 1  # Zero based counting in Mu.
+            description = text[5:]
+            if code == 'E303':
+                description += _(' above this line')
+            self.feedback.setdefault(line_no, []).append({
+                'line_no': line_no,
+                'column': offset,
+                'message': description.capitalize(),
+                'code': code,
+            })
+        return code
+
+
+def split_blocks(tree, lines):
+    """
+    Given the parsed module and its lines, return a list of the (zero based)
+    line number at which each top-level statement's block starts. A block
+    includes the statement's decorators and the blank lines and comments
+    before it, so PyCodeStyle's blank line checks see them.
+    """
+    starts = [0]
+    for previous, node in zip(tree.body, tree.body[1:]):
+        decorators = getattr(node, 'decorator_list', [])
+        start = min([node.lineno] + [d.lineno for d in decorators]) - 1
+        # Never walk back into the previous statement (which may end with a
+        # string containing blank lines). Python < 3.8 doesn't record where
+        # statements end, so only its first line is certain.
+        limit = getattr(previous, 'end_lineno', previous.lineno)
+        while start > limit and (not lines[start - 1].strip() or
+                                 lines[start - 1].startswith('#')):
+            start -= 1
+        starts.append(start)
+    return starts
+
+
+def module_names(tree):
+    """
+    Return the names bound at the top level of the parsed module (by
+    imports, definitions, assignments and global statements), or None if
+    they can't be known because of a star import (other than "from microbit
+    import *").
+    """
+    return bound_names(tree.body)
+
+
+def bound_names(nodes):
+    """
+    Return the names bound at the top level of a module by the referenced
+    top-level statements (see module_names), or None if they can't be known.
+    """
+    names = set()
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef,
+                             ast.ClassDef)):
+            names.add(node.name)
+            # Functions can bind module level names with global statements.
+            for child in ast.walk(node):
+                if isinstance(child, ast.Global):
+                    names.update(child.names)
+        elif isinstance(node, ast.ImportFrom) and \
+                any(alias.name == '*' for alias in node.names):
+            if node.module != 'microbit':
+                return None
+            names.update(MICROBIT_NAMES)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names.add((alias.asname or alias.name).split('.')[0])
+        elif isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Store):
+                names.add(node.id)
+        elif isinstance(node, ast.Lambda):
+            continue
+        else:
+            stack.extend(ast.iter_child_nodes(node))
+    return names
+
+
+def summarize(node):
+    """
+    Return what checking the rest of a module depends on about one of its
+    top-level statements: the names it binds (see bound_names), a
+    description of its imports, the names they import, the names it uses
+    and the names it deletes.
+    """
+    imports = []
+    imported = set()
+    used = set()
+    deleted = set()
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            imports.append(ast.dump(child))
+            for alias in child.names:
+                imported.add((alias.asname or alias.name).split('.')[0])
+        elif isinstance(child, ast.Name):
+            used.add(child.id)
+        elif isinstance(child, ast.Delete):
+            deleted.update(target.id for target in child.targets
+                           if isinstance(target, ast.Name))
+    return bound_names([node]), imports, imported, used, deleted
+
+
+class IncrementalCheck:
+    """
+    Checks code as it's being edited, checking again only the top-level
+    statements (see split_blocks) changed since the last check.
+
+    The feedback about the other blocks is reused (moved to where the block
+    now starts). A changed block is checked on its own, after a line binding
+    the names bound by the blocks before it and followed by one binding
+    those bound by the blocks after it, so PyFlakes sees the names the rest
+    of the module defines in the order it defines them.
+
+    Everything is checked again whenever checking blocks on their own might
+    give different feedback from checking the whole module: when blocks are
+    added or removed, when a changed block contains an import, binds
+    __all__ or a name bound by another block, or comes before an import,
+    when the module's imports, the imported names it uses, the names it
+    binds at the top level or the builtins change, when it deletes names it
+    binds at the top level, when the feedback refers to other lines, and
+    when the code is indented with tabs or can't be parsed.
+    """
+
+    def __init__(self):
+        self.context = None  # What the feedback depends on at the last check.
+        self.blocks = []  # The text of each block at the last check.
+        self.feedback = []  # For each block, with lines from its start.
+        self.summaries = {}  # Block text: summary (see summarize).
+        self.references = False  # If the feedback refers to other lines.
+
+    def check(self, filename, code, builtins=None):
+        """
+        Return the feedback from PyFlakes and PyCodeStyle about the code
+        (see check_flake and check_pycodestyle).
+        """
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            tree = None
+        if not (tree and tree.body) or '\t' in code:
+            # PyCodeStyle's checks of tabs depend on the first indented line.
+            return self._check_all(filename, code, builtins)
+        lines = code.splitlines(True)
+        starts = split_blocks(tree, lines)
+        ends = starts[1:] + [len(lines)]
+        texts = [''.join(lines[start:end])
+                 for start, end in zip(starts, ends)]
+        summaries = [self.summaries.get(text) or summarize(node)
+                     for text, node in zip(texts, tree.body)]
+        bound = [summary[0] for summary in summaries]
+        if None in bound:
+            return self._check_all(filename, code, builtins)
+        counts = Counter(name for names in bound for name in names)
+        imported = set().union(*(summary[2] for summary in summaries))
+        used = set().union(*(summary[3] for summary in summaries))
+        deleted = set().union(*(summary[4] for summary in summaries))
+        context = (sorted(counts), sorted(name for name in counts
+                                          if counts[name] > 1),
+                   [line for summary in summaries for line in summary[1]],
+                   sorted(imported & used), sorted(builtins or []))
+        feedback = None
+        if context == self.context and not self.references and \
+                len(texts) == len(self.blocks) and not deleted & set(counts):
+            feedback = self._check_changed(filename, tree, texts, summaries,
+                                           builtins)
+        if feedback is None:
+            flake = check_flake(filename, code, builtins)
+            style = check_pycodestyle(code)
+            feedback = [(relative(flake, start, end),
+                         relative(style, start, end))
+                        for start, end in zip(starts, ends)]
+        else:
+            flake = {}
+            style = {}
+            for start, (block_flake, block_style) in zip(starts, feedback):
+                flake.update(moved(block_flake, start))
+                style.update(moved(block_style, start))
+        self.context = context
+        self.blocks = texts
+        self.feedback = feedback
+        self.summaries = dict(zip(texts, summaries))
+        self.references = refers_to_lines(flake)
+        return flake, style
+
+    def _check_all(self, filename, code, builtins):
+        """
+        Check all the code, forgetting what's known about it.
+        """
+        self.context = None
+        self.blocks = []
+        self.feedback = []
+        self.summaries = {}
+        return (check_flake(filename, code, builtins),
+                check_pycodestyle(code))
+
+    def _check_changed(self, filename, tree, texts, summaries, builtins):
+        """
+        Return the feedback about each block, checking only those that have
+        changed, or None if the whole module must be checked again.
+        """
+        imports = [index for index, node in enumerate(tree.body)
+                   if isinstance(node, (ast.Import, ast.ImportFrom))]
+        last_import = imports[-1] if imports else -1
+        bound = [summary[0] for summary in summaries]
+        feedback = list(self.feedback)
+        for index, text in enumerate(texts):
+            if text == self.blocks[index]:
+                continue
+            if index < last_import or '__all__' in bound[index] or \
+                    summaries[index][1]:
+                return None
+            before = set().union(*bound[:index])
+            after = set().union(*bound[index + 1:])
+            if bound[index] & (before | after):
+                return None
+            prelude = binding_line(before)
+            if not text.endswith('\n'):
+                text += '\n'
+            flake = check_flake(filename, prelude + text + binding_line(after),
+                                builtins)
+            offset = prelude.count('\n')
+            flake = relative(flake, offset, offset + text.count('\n'))
+            if refers_to_lines(flake):
+                return None
+            feedback[index] = (flake, check_pycodestyle(texts[index]))
+        return feedback
+
+
+def binding_line(names):
+    """
+    Return a line of code binding the referenced names (or nothing if there
+    are none).
+    """
+    if not names:
+        return ''
+    return ' = '.join(sorted(names)) + ' = None\n'
+
+
+def refers_to_lines(feedback):
+    """
+    Return True if any of the messages in the feedback refer to a line (such
+    as "redefinition of unused 'foo' from line 3"), which might move.
+    """
+    return any(LINE_REFERENCE.search(message['message'])
+               for messages in feedback.values() for message in messages)
+
+
+def relative(feedback, start, end):
+    """
+    Return the feedback about the lines from start to end, with the line
+    numbers counted from start.
+    """
+    return moved({line_no: messages for line_no, messages in feedback.items()
+                  if start <= line_no < end}, -start)
+
+
+def moved(feedback, offset):
+    """
+    Return the feedback with its line numbers moved by offset.
+    """
+    if not offset:
+        return feedback
+    return {line_no + offset: [dict(m, line_no=m['line_no'] + offset)
+                               for m in messages]
+            for line_no, messages in feedback.items()}
+
+
+def serve(requests, results):
+    """
+    Check code until told to stop (the worker process's main loop).
+
+    Each request is a tuple of a job number, filename, code, builtins (see
+    check_flake) and document, or None to stop (which is acknowledged by
+    putting None on the results queue). The PyFlakes results for a job are
+    put on the results queue as soon as they're ready, as a tuple of the job
+    number, 'error' and the feedback, followed by those from PyCodeStyle
+    ('style').
+
+    If the document isn't None, the code is checked incrementally (see
+    IncrementalCheck) using what's known about the last version of the
+    document to be checked.
+
+    If requests arrive while the worker is busy, only the latest is checked
+    and any checks left for the current job are skipped, since the code will
+    have changed.
+
+    If checking fails (e.g. with RecursionError for code nested too deeply to
+    parse) the failure is logged and the job gets empty feedback, so whoever
+    is waiting for it isn't left waiting forever.
+    """
+    documents = OrderedDict()  # Document: IncrementalCheck.
+    while True:
+        request = requests.get()
+        while request:
+            try:
+                request = requests.get_nowait()
+            except queue.Empty:
+                break
+        if request is None:
+            results.put(None)
+            return
+        job, filename, code, builtins, document = request
+        if document is None:
+            results.put((job, 'error',
+                         _safely(check_flake, filename, code, builtins)))
+            if requests.empty():
+                results.put((job, 'style', _safely(check_pycodestyle, code)))
+            continue
+        if document not in documents:
+            documents[document] = IncrementalCheck()
+            if len(documents) > MAX_DOCUMENTS:
+                documents.popitem(last=False)
+        documents.move_to_end(document)
+        try:
+            flake, style = documents[document].check(filename, code, builtins)
+        except Exception:
+            logger.exception('Could not check {}.'.format(filename))
+            # What's known about the document may be half updated.
+            del documents[document]
+            flake, style = {}, {}
+        results.put((job, 'error', flake))
+        results.put((job, 'style', style))
+
+
+def _safely(check, *args):
+    """
+    Return the feedback from calling check with the args, or (logging the
+    failure) no feedback if it fails.
+    """
+    try:
+        return check(*args)
+    except Exception:
+        logger.exception('Could not check {}.'.format(args[0]))
+        return {}
+
+
+class ResultWriter:
+    """
+    Writes the worker's results (pickled) to a stream, in place of the
+    results queue given to serve.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def put(self, result):
+        pickle.dump(result, self.stream)
+        self.stream.flush()
+
+
+def main():
+    """
+    Run the worker (see mu.workers.CodeChecker), reading pickled requests for
+    serve from stdin and writing pickled results to stdout.
+    """
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    sys.stdout = sys.stderr  # Stray output would corrupt the results.
+    requests = queue.Queue()
+
+    def read():
+        while True:
+            try:
+                request = pickle.load(stdin)
+            except EOFError:
+                request = None  # Mu has gone.
+            requests.put(request)
+            if request is None:
+                return
+
+    threading.Thread(target=read, daemon=True).start()
+    serve(requests, ResultWriter(stdout))
+
+
+if __name__ == '__main__':
+    main()
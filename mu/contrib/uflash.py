@@ -15,6 +15,7 @@ from __future__ import print_function
 import argparse
 import binascii
 import ctypes
+import gzip
 import os
 import struct
 import sys
@@ -28,6 +29,12 @@ try:
 except ImportError:  # pragma: no cover
     can_minify = False
 
+# Within Mu, files are watched for changes without polling.
+try:
+    from mu.watcher import watch_file as _watch_events
+except ImportError:  # pragma: no cover
+    _watch_events = None
+
 #: The magic start address in flash memory for a Python script.
 _SCRIPT_ADDR = 0x3e000
 
@@ -55,6 +62,15 @@ _MAX_SIZE = 8188
 MICROPYTHON_VERSION = '1.0.0'
 
 
+#: The gzip compressed MicroPython runtime hex, shipped alongside this module.
+_RUNTIME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'micropython.hex.gz')
+
+
+#: Cache of the decompressed runtime (populated by get_runtime).
+_RUNTIME = None
+
+
 def get_version():
     """
     Returns a string representation of the version information of this project.
@@ -71,6 +87,20 @@ def get_minifier():
     return None
 
 
+def get_runtime():
+    """
+    Returns a string representation of the built in MicroPython runtime hex.
+
+    The runtime is only read from disk and decompressed the first time it is
+    needed, after which the result is cached for subsequent calls.
+    """
+    global _RUNTIME
+    if _RUNTIME is None:
+        with gzip.open(_RUNTIME_PATH, 'rb') as runtime_file:
+            _RUNTIME = runtime_file.read().decode('ascii')
+    return _RUNTIME
+
+
 def strfunc(raw):
     """
     Compatibility for 2 & 3 str()
@@ -319,11 +349,12 @@ def flash(path_to_python=None, paths_to_microbits=None,
     elif python_script:
         python_hex = hexlify(python_script, minify)
 
-    runtime = _RUNTIME
     # Load the hex for the runtime.
     if path_to_runtime:
         with open(path_to_runtime) as runtime_file:
             runtime = runtime_file.read()
+    else:
+        runtime = get_runtime()
     # Generate the resulting hex file.
     micropython_hex = embed_hex(runtime, python_hex)
     # Find the micro:bit.
@@ -357,12 +388,15 @@ def extract(path_to_hex, output_path=None):
 
 def watch_file(path, func, *args, **kwargs):
     """
-    Watch a file for changes by polling its last modification time. Call the
+    Watch a file for changes, using notifications from the operating system
+    if possible or else by polling its last modification time. Call the
     provided function with *args and **kwargs upon modification.
     """
     if not path:
         raise ValueError('Please specify a file to watch')
     print('Watching "{}" for changes'.format(path))
+    if _watch_events:
+        return _watch_events(path, func, *args, **kwargs)
     last_modification_time = os.path.getmtime(path)
     try:
         while True:
@@ -452,14490 +486,5 @@ def main(argv=None):
             sys.exit(1)
 
 
-#: A string representation of the MicroPython runtime hex.
-_RUNTIME = """:020000040000FA
-:1000000000400020E98D0100258E0100278E0100AF
-:1000100000000000000000000000000000000000E0
-:10002000000000000000000000000000298E010018
-:1000300000000000000000002B8E01002D8E01004A
-:100040002F8E01005D3D00002D9501002F8E0100D7
-:100050002F8E010000000000E98E01002F8E0100AC
-:1000600069E800009D9A0100A19301002F8E010014
-:100070002F8E01002F8E01002F8E01002F8E010088
-:100080002F8E01002F8E01002F8E01002F8E010078
-:100090002F8E0100D5890100A18A0100A5E9000089
-:1000A000B5E900002F8E01000000000000000000F4
-:1000B0000000000000000000000000000000000040
-:1000C00010B5064C2378002B07D1054B002B02D02E
-:1000D000044800E000BF0123237010BD2001002070
-:1000E0000000000058870300044B10B5002B03D01C
-:1000F0000349044800E000BF10BDC04600000000F6
-:100100002401002058870300164B002B00D1144B0C
-:100110009D46402292029A1A924600218B460F4633
-:100120001348144A121A28F033FE0F4B002B00D04C
-:1001300098470E4B002B00D0984700200021040068
-:100140000D000D48002802D00C4800E000BF20F050
-:10015000C7FB2000290028F071FB20F00DFBC046F2
-:100160000000080000400020000000000000000027
-:1001700018010020E02F0020000000000000000017
-:1001800010B54A68014926F029FE10BD843B0300E2
-:1001900010B50400080021F070F90300002C03D012
-:1001A000012C06D0002003E00348002B00DC0348AC
-:1001B00010BD40002043FBE78CE7020084E702000B
-:1001C00043684B6083688B60C3680800CB60014B59
-:1001D0000B6070476890020030B5040087B00D00D6
-:1001E0000020042A25D1200021F047F9AB0722D1B5
-:1001F000184B2A689A421ED103AA290011F034FB39
-:10020000102026F03AF8144BE2680360039B616803
-:1002100053435B184360049B6168019353435B182D
-:10022000059983604A43C260002902DAE2689B1A9A
-:10023000836007B030BD002301002A00206802F06F
-:10024000F5FCE36858436368C01801234000184375
-:10025000EFE7C046A8A402002C900200F0B50E0003
-:10026000002785B0110003901D00012203233000F8
-:10027000009712F021F8102025F0FFFF039B0400E7
-:10028000036001234760C36028689E4205D102F0E5
-:10029000F5FBA060200005B0F0BD02F0EFFB606050
-:1002A000686802F0EBFBA060032EF3D1A86802F0AF
-:1002B000E5FBE0600028EDD101480DF087F8C0466D
-:1002C00096FB020070B50D004A688B68084904006F
-:1002D00026F084FDEA68012A04D10649200026F0B0
-:1002E000BCFC70BD0449200026F078FDF9E7C0464B
-:1002F000A0FB020060020300ADFB0200136810B512
-:100300001400002B05D1A42904D1406825F0BCF9C4
-:10031000206010BDB9235B00994201D18068F5E7E8
-:10032000024B9942F5D1C068F0E7C046BF02000019
-:100330000023820708D10068044A0133904203D0A9
-:10034000034BC01A4342434118007047E09002003B
-:10035000A4900200044B88600B60044B08004B60C3
-:100360000023CB607047C0462C9802005F15020046
-:1003700030B585B00500080069460CF0F7FB0400B5
-:1003800020000CF055FC011E02D1064805B030BD1E
-:100390002B1D0022180023F069F80028F0D0024835
-:1003A000F4E7C0468CE7020084E7020070B5050060
-:1003B000102025F062FF0400074B696808C023F095
-:1003C0004BF8AB68E968A3606B68E0689A0028F0B6
-:1003D000C3FC200070BDC046E0900200F7B50400E9
-:1003E0000D0000268B0704D10B68214E9E1B734223
-:1003F0005E41AB68002B0AD1002E03D01D492000BE
-:1004000026F02BFC1C49200026F027FCF7BD002E0F
-:1004100003D01A49200026F020FC1949200026F0BC
-:100420001CFC002701236A68BA4207D8154920003E
-:1004300026F013FC002EE9D01349E4E7BA0001923C
-:10044000EA68B9005258002A0FD0042A0DD0002BB8
-:1004500003D10E49200026F000FCEB68B900595882
-:100460000122200002F03AFA00230137DBE7C04600
-:10047000A4900200EBFB0200F2FB0200F8FB02007A
-:1004800003FC02001E0703006002030005FC0200DB
-:1004900010B5830707D1044B02689A4203D1034980
-:1004A000034824F0ABFA10BDA4900200B3FB020095
-:1004B000A0A7020070B50D000400FFF7E9FF2900B6
-:1004C000201D012222F0D2FF004870BDA4B302001B
-:1004D00070B50D000400FFF7DBFF2900201D02228C
-:1004E00022F0C4FF004870BDA4B3020070B506003E
-:1004F00008680D000124FFF7CBFFB44201D3044884
-:1005000070BDA300E958286820F0C7FF0134F4E764
-:10051000A4B3020070B50D000400FFF7B9FF280076
-:1005200000210CF023FB050028000CF081FB011ECC
-:1005300001D1044870BD231D0322180022F096FF4C
-:10054000F2E7C046A4B3020010B50400FFF7A0FF15
-:10055000201D23F019F8014810BDC046A4B30200C5
-:1005600010B5012220F0CAFF004810BDA4B302005C
-:1005700070B504000D00FFF78BFF201D022229003B
-:1005800022F074FF002804D1034822F022FE0CF070
-:10059000A5F8024870BDC04680A90200A4B30200BD
-:1005A00010B50400FFF774FF201D22F0CEFF0028D5
-:1005B00003D10249024824F021FA10BDD5FB020004
-:1005C00080A90200F8B50D0001280BD0002803D047
-:1005D00002280BD0002004E08B681448002B00D1C7
-:1005E0001348F8BD8B685B001843FAE7032400202A
-:1005F0000C408442F5D10F4B0E6820009E42F0D192
-:100600004F68A74203D1012076003043E9E7EA684A
-:10061000A3009958002906D0042904D002200CF028
-:100620003DF9401036180134EBE7C0468CE7020074
-:1006300084E70200A4900200F8B5040010200D0029
-:1006400025F01BFE0600094B210008C607003000FC
-:1006500022F002FFA4002C19A54201D13800F8BDF8
-:10066000012202CD300022F001FFF5E7E090020008
-:10067000F7B504000E00171E2CD0FFF709FF194D27
-:10068000B4422DD000210800FFF7D6FF002105005D
-:1006900030000CF06BFA019001980CF0C9FA061EBC
-:1006A0000CD1002F1CD0E06825F016FE6B6863604B
-:1006B000AB68A360EB680B4DE36011E0201D0022E6
-:1006C000310022F0D3FE0028E6D031002800FFF7E9
-:1006D000F1FEE1E78842D5D1200020F0F1FE0500CF
-:1006E0002800FEBDA4B30200F0B589B00400039059
-:1006F000029101920027FFF71BFEB84207D13A0092
-:1007000003AB0121224820F04FFF04000137029D76
-:1007100000262800FFF70CFEB04207D1320002ABE2
-:1007200001211B4820F040FF05000136019B002BF2
-:1007300005D00023AA680193A36893420DD0154BFE
-:1007400006940493144B05930023079304A820F008
-:1007500006FF011E12D101230193002F02D02000B9
-:10076000FFF7F2FE002E02D02800FFF7EDFE019BFE
-:100770000A48002B00D10A4809B0F0BD2B1D002209
-:10078000180022F073FE0028E0D10190E5E7C04692
-:10079000E09002002C9802005F1502008CE7020036
-:1007A00084E7020073B50C00150000910192002649
-:1007B0008B0704D10B68394E9E1B73425E41320099
-:1007C0001F2868D819F084FA2810176767671C6714
-:1007D0006767676767212D346767673B6767676788
-:1007E0006740464A5358675D2900200020F079FE93
-:1007F0000400200076BD2900200020F0CAFEF7E7A3
-:100800006946022020F0A6FEF2E7002E04D06946D9
-:100810000220FFF76BFEECE72900200020F057FED6
-:10082000E6E729002000002EE0D0FFF773FEE0E7A6
-:1008300029002000FFF71CFF002EDAD1D8E7694617
-:10084000022020F05BFED3E7012229002000FFF701
-:100850004BFFCDE7012221002800F8E72800FFF731
-:1008600067FD002815D0A368AA68934211D129001A
-:10087000200020F0CAFEBBE72900200020F0BDFECA
-:10088000B6E7201D0022290022F0F0FD044C0028CC
-:10089000AFD1044CADE70024ABE7C046E0900200C6
-:1008A0008CE7020084E70200F0B50F00496885B0CC
-:1008B00005001600002901D0002A05D139002800C2
-:1008C00020F0B4FF05B0F0BD0F321309C918009332
-:1008D00020F01DFF0F22A868B9687C68324000D163
-:1008E0001032009B1E19234BF3185B00C018214BDC
-:1008F0000290E3185B00CB18019010209C46210069
-:100900000023801A002921D1C3401A48029A844644
-:100910006400141B2380009B5B00E41A009B0234DC
-:1009200063445A00200028F033FA002E04D07300EC
-:10093000023BE35A002B1BD001216E603B78DB07A2
-:10094000DA0F2B788B4313432B70BBE76246128878
-:10095000013913431A00C2400393019B1A80019A84
-:10096000039B023A0192022252421B049444C9E7BB
-:10097000013EDAE7FFFFFF7FF0B54B6815005268D4
-:1009800089B006000C00934201D22C000D00012119
-:10099000227863680A4201D12A781140C9183000D0
-:1009A00020F0B5FEB36822780193A3681700029384
-:1009B000636829789C46AB684F4003930123180075
-:1009C0001F408B4306936346904302006046591EC6
-:1009D000019B04936B681B1A07934B1C18D1634649
-:1009E0005900019B5918002F02D001230B800231BE
-:1009F000019820F00FFE0121706022782B7853407F
-:100A00003278DB078A43DB0F1343337009B0F0BD44
-:100A1000029B13481B881B189B180593079B5B18A8
-:100A20008B421AD8039B039A1B8802321B1803922D
-:100A3000069A01399B18059A5A4092B21B0CD71995
-:100A40000693049A059B17801A0C049B3F0C0233F3
-:100A50000493029B02330293BFE7014BE8E7C046D1
-:100A6000FFFF0000F0B5060095B0069353680D0037
-:100A7000591C0492009320F04AFE049B00215B68FD
-:100A8000B0685A1C5200009328F082F9002373606A
-:100A9000049B28005B68591C009320F038FE0499E1
-:100AA000280020F0C3FEAB686F680193069B9B682B
-:100AB0000393069B5B680293B3680793029BBB4258
-:100AC0002DD82ED3039A3900019820F063FE002818
-:100AD00023D10123079A686013807360049B1A78FE
-:100AE000069B1B785A4001231A4214D032781343D4
-:100AF00033706B68002B0ED0012111A8494220F001
-:100B0000B4FE11AA3100300021F0B6F8069A29008F
-:100B1000280021F0B1F815B0F0BD002801DA00235B
-:100B2000DBE7824A029B9B185B009C460022039BEA
-:100B3000634405931B8800921AB2002A63DA0022EC
-:100B4000019B7C001A537B1C102709936B60019B4F
-:100B5000A01C00991B180893791A019B0A91089907
-:100B60008B4256D3059B009A1B8893400893029BA7
-:100B7000012B0AD91022039B00996344023B1B8876
-:100B8000521AD340089A1A430892019B029A1C19E0
-:100B9000099B9B1A654A73609B18079A5B00D318E0
-:100BA0000A93634602330E936B680B930B9A029B76
-:100BB000934239D313005D4A102194460024019AD0
-:100BC00063445B00D318009A891A019A9A4200D8AC
-:100BD0009EE07368002B07D0544A07999A18520078
-:100BE000525A002A00D19DE06B68002B00D175E7B6
-:100BF0004E4A01999A185200525A002A00D06DE7C5
-:100C0000013B6B60F0E7009A5B0001329BB292B24D
-:100C100091E71988009F0800B84002431A800A9A99
-:100C20000233D1408AB29AE7A31E20880D931B8815
-:100C300000041843089919F05FF80E9B0022E31A8C
-:100C40000C931900039B05909C4609928C4212D884
-:100C500023889A4234D3D31A5A42190C9BB2228069
-:100C60005A1E9341CA18002A2CD003990C9B8C461B
-:100C700000210F0041E0099B009F180C63461B8870
-:100C8000BB4018436B4609909F8C059B5F430B88C4
-:100C90009F4203D2D81B0F9090420CD8D31AFF1852
-:100CA0007B420B80BBB23A0C5F1EBB41D2180223C1
-:100CB00002319C44CAE70F9B9A1A0A800022F6E789
-:100CC0009A1A22800A9B059A023B5A800A930B9B30
-:100CD0000D9C013B6B6067E7380C09906046009FF4
-:100CE0000088B840099F074318884118B8B24118D6
-:100CF000022019808444090C02339C42ECD82388DA
-:100D00005918059B2180013B090C521A0593AAE74B
-:100D10001A88009F100038418A402043188094B2FE
-:100D2000023B52E7013B736053E7C046FFFFFF7F82
-:100D3000436870B55A00002384680A4DA218944293
-:100D400006D30278D20700D55B4201200B6070BD4C
-:100D5000023AAB4203D816881B043343EFE7002066
-:100D6000F5E7C046FF7F0000032230B502400121B5
-:100D7000002A04D1084C05680B00A54209D00B00DD
-:100D8000034006D1002A04D1036804481B1A5842C4
-:100D90004341180030BDC04694E70200ECB80200A1
-:100DA00010B50400FFF7E0FF012200280AD1032359
-:100DB00002002340022B05D103480440063C2200D8
-:100DC000541EA241100010BD070080FF044B886034
-:100DD0000B60044B08004B600023CB607047C0469B
-:100DE0002C980200B925020010B501F05FFD084BF8
-:100DF00042680848D31859424B41AC215B428B43AF
-:100E0000B02189005B18044907F04CFB0BF066FC2D
-:100E100040FDFFFF50AC020008FC0200F7B50400E3
-:100E20000E00019301208B180A0000210093009B03
-:100E3000934212D82725002900D0053D224F2A00D1
-:100E40003900200025F0CAFF009B9E4214D32A00DF
-:100E50003900200025F0C2FFF7BD1378272B08D0FA
-:100E6000223B5D426B41DBB20132002BDFD02725F4
-:100E7000E4E700230100F7E73278AA4205D12A000F
-:100E80001249200025F0AAFF1AE011495C2A14D06B
-:100E90001F2A09D97F2A15D0019B002B02D053B2FB
-:100EA000002B07DB3900ECE70A490A2A05D00A497A
-:100EB0000D2A02D0092A05D10849200025F0CDFECF
-:100EC0000136C1E70649DCE74200030041000300A8
-:100ED00045000300480003004B0003004E000300E0
-:100EE00051000300194B70B506000C0098420FD159
-:100EF0004968A0680FF0AEFD051E09D0200026F05D
-:100F000008F90023ED00236006331D43280070BD5F
-:100F1000102025F0B2F96168050081600660A068C4
-:100F20000FF07AFD63686860591C2368994208D104
-:100F3000A368EB600023EA68A9685354A3602360A8
-:100F4000E4E7A06825F0B7F9E860F3E7CC99020080
-:100F500070B504000D00002A05D00FF0ADFDC300F0
-:100F60000620184370BD0FF075FD0028F7D12A0048
-:100F70002100024821F0F8F9F4E7C046CC990200BC
-:100F800010B50A000100024821F0EEF910BDC0467C
-:100F900060920200094B10B50340062B01D1C00836
-:100FA00010BD830708D1064B02689A4204D18168BC
-:100FB000C0680FF081FDF3E7FFF716FF070080FF21
-:100FC000CC990200064B10B50340062B03D1C00894
-:100FD00024F0B9FC10BD8368C0680B60FAE7C04616
-:100FE000070080FFF0B50F00002589B01100060052
-:100FF0001C003800009503232A0011F05DF90E2033
-:10100000AF420FD0012F0FD102AA102104A814F073
-:10101000F7FE216802A82A0001F060FC04A9300054
-:10102000FFF760FF09B0F0BD2068830722D1164B9F
-:1010300002689A421ED104A9FFF7C4FF134B0500B2
-:1010400020680340062B13D1C00824F06DFC040077
-:10105000002C04D1049928000FF0DEFC04001020BD
-:10106000049F25F00AF906608760C5604460D9E7EF
-:101070004468EDE704A9012201F0BAFE00220599B7
-:101080000498FFF765FFCDE760920200070080FF3C
-:10109000F0B58DB00400039101F008FC04A906002E
-:1010A0002000FFF78FFF039B01902F489A0705D17F
-:1010B0001B6883420AD02D4A934207D0C36800229E
-:1010C0000293012103AB029CA0470390002406AACF
-:1010D00005A9039801F074FD2500059BA3420ED8D5
-:1010E0002900002508A826F003F80A9C059BAB42BE
-:1010F00021D808A93000FFF7F5FE0DB0F0BD069B22
-:10110000A700D85901F0D2FBB04202D018480CF029
-:1011100021FB002C01D0049BED18069BD859154BE0
-:101120000340062B05D1C00824F003FC2D18013420
-:10113000D3E78068FAE7002D06D02000049A0199D1
-:1011400027F00AFE049BE418069AAB00985807A9FA
-:10115000FFF738FF079A0100200027F0FDFD079BED
-:101160000135E418C2E7C04648E702000CA00200BF
-:101170007E000300070080FFF0B58BB00490086884
-:101180000D000692079301F091FB0400686801F0DE
-:101190008DFB0600A04202D06868FFF725FE08A973
-:1011A0002868FFF70FFF040009A96868FFF70AFF26
-:1011B000089A0590A3180393049B2700022B19D9C2
-:1011C000AB681D498B4206D00121300000912100FF
-:1011D00004F04AF80700049B032B0BD0EB68164A77
-:1011E000934207D00122210000923000089A04F0B7
-:1011F0003BF80390039B059AD91B069B380000938C
-:10120000099B21F092F8002806D1079B0138002B9A
-:101210000CD00A480CF0DAF8094B9E4208D10100C4
-:10122000200022F038F84400012020430BB0F0BD2C
-:10123000041B6400F8E7C046A4B302006A00030080
-:10124000CC990200F0B5070087B008680D0001F0E6
-:101250002DFB04A906002868FFF7B4FE05A90400C9
-:101260006868FFF7AFFE03902000022F07D9012323
-:101270000093AB68049A2100300003F0F5FF059A53
-:10128000041B049BA418064D9C4205D8039927F023
-:1012900054FD002800D1034D280007B0F0BDC04622
-:1012A00084E702008CE7020073B50D000600694672
-:1012B0002868FFF787FE01A904006868FFF782FE2F
-:1012C0000100022E02D908480CF072FA019A009827
-:1012D000064D824206D8801A201827F02EFD0028DD
-:1012E00000D1034D280076BD5800030084E70200BA
-:1012F0008CE70200F0B58FB0079010680C00160064
-:1013000001F0D4FA0690012C31D0706801F0CEFAC9
-:10131000069B984202D07068FFF766FD0DA97068C1
-:10132000FFF750FE0D9B089009930DA93068FFF759
-:1013300049FE0D9B0B900493079B012B1CD1049B32
-:101340005D1E01235B420A9300242700049B039443
-:101350000593059B002B13D1039B002B23D1214B1D
-:10136000069A0E209A4200D01F480FB0F0BD072306
-:1013700009931E4B0893D8E7012300250A93E3E75E
-:101380000B9B09995A1901230898009320F0CDFF6F
-:10139000002816D1039B002B19D1079B002B09D1E4
-:1013A0002F00049B5C1E049B0134E21B934212D16C
-:1013B0003068DAE7079B2C00012B0AD001232F00AD
-:1013C00003930A9BED18059B013B0593C1E72C0095
-:1013D000F7E7039FE7E70B9B0698D91920F0C4FFB6
-:1013E000C3E7C046CC99020050920200D700030028
-:1013F000F0B589B0049008680D0001F057FA0400B8
-:10140000686801F053FA0700A04202D06868FFF74D
-:10141000EBFC06A92868FFF7D5FD060007A9686858
-:10142000FFF7D0FD069A0590B3180393049B340090
-:10143000022B19D9AB681E498B4206D00121380016
-:101440000091310003F010FF0400049B032B0BD02C
-:10145000EB68174A934207D001223100009238000E
-:10146000069A03F001FF03900025079BAB4212D1BF
-:10147000039B2000191B21F01DFF013045000120B6
-:10148000284309B0F0BD0599200027F056FC00283C
-:1014900008D101353400079A039BA6189E42F2D961
-:1014A0006D00ECE7200021F0EDFE0600F2E7C046FB
-:1014B000A4B3020010B50100014821F047F810BDA7
-:1014C000D532020010B50100014821F03FF810BDEF
-:1014D000E7320200F7B50600080001A9FFF772FD28
-:1014E000019B0500002B01D11348FEBD134B0400E6
-:1014F0009E4207D10027019A631B9A4211D8002F00
-:1015000007D1F1E70E4B9E42F4D0019A631B9A4239
-:1015100001D80C48E9E72078B04701340028F4D11D
-:10152000E2E7207807F098F8002803D02078B04749
-:10153000071ED9D00134DEE784E70200C18600002F
-:10154000D98600008CE7020010B501000148FFF7C2
-:10155000C1FF10BD4186000010B501000148FFF732
-:10156000B9FF10BD5986000010B501000148FFF712
-:10157000B1FF10BD7186000010B501000148FFF7F2
-:10158000A9FF10BDC186000010B501000148FFF79A
-:10159000A1FF10BDD9860000F0B585B006000C0093
-:1015A000170001F083F9694605003000FFF70AFDD6
-:1015B0000600042F23D10098A30715D1114B2268F0
-:1015C0009A4211D101AA210010F04EF9002802D14F
-:1015D0000D480CF0EDF80199029A2800521A711882
-:1015E00020F0C2FE05B0F0BD00230100220028005B
-:1015F00001F01CFB335C01205B001843F2E7002084
-:10160000F0E7C046A8A4020066FC020070B51D0009
-:101610008EB0002900D174E018683B4C03002340D1
-:10162000062B05D0830726D1384B02689A4222D177
-:101630000239012962D80AA9FFF7C4FC060028680C
-:101640000440062C15D1C00824F06EF90400002CCB
-:1016500004D10A9930000FF0DFF9040010200A9D30
-:1016600024F00BFE2A4B85600360C66044600EB018
-:1016700070BD4468EBE7012940D80122104210D028
-:10168000441021000AA825F033FD0C9B0021220004
-:101690001800019327F07CFB0AA91D48FFF722FCE4
-:1016A000E5E703A920F0BEFF002805D0049A0399BE
-:1016B000174820F059FEDAE7286801F0F9FA1021FE
-:1016C000002800D0411006A825F001FD0AA92868CD
-:1016D0000BF04CFA040020000BF0AAFA002801D10C
-:1016E00006A9DAE701F0CAF9FF2802D909480BF088
-:1016F0006DFEC1B206A825F04AFDECE706480CF0E5
-:1017000029F80648B3E7C046070080FFCC990200DD
-:101710006092020033FC02004CFC02005092020076
-:1017200073B50400080001A91600FFF74BFC050083
-:10173000042E06D10300019A0749200025F04EFB34
-:1017400073BD0649200025F088FA0123019A29007B
-:101750002000FFF763FBF3E7C30003008F5903008A
-:101760000A001B4B73B51A4005000C000340062B02
-:101770000CD1062A04D1441A60426041C0B212E082
-:10178000C00824F0D1F80600606805E04668062A23
-:10179000FAD1C80824F0C8F8002E05D0002803D0DC
-:1017A000B04201D0002076BD69462800FFF70AFC50
-:1017B00001A905002000FFF705FC009A019B01002C
-:1017C0009A42EFD1280027F0B8FA44426041D5E7A9
-:1017D000070080FF084B07B50340062B08D083079E
-:1017E00004D10268054B92699A4201D0FFF7FCFAD6
-:1017F00001A9FFF7E7FB0EBD070080FF9D1D00005C
-:101800000A4B13B503400C00062B08D0830704D104
-:101810000268074B92699A4201D0FFF7E5FA01A9E5
-:10182000FFF7D0FB019B236016BDC046070080FF79
-:101830009D1D0000F0B59BB00B9005910892102102
-:101840000EAA12A8099314F0DBFA059B089A93429A
-:1018500008D30B9A12AB13CB13C21B6813600B98FF
-:101860001BB0F0BD059B19785D1C7D290ED1089B2E
-:10187000AB4208D9059B59787D2904D112A825F0DF
-:1018800086FC059507E0BC480BF0A0FD7B2906D03F
-:1018900012A825F07CFC059B01330593D5E7089B36
-:1018A000AB4216D9059B59787B29E7D02B007D29BF
-:1018B00003D0212901D03A290DD100252E001A7814
-:1018C000212A11D0002206921AE0089A01339A4286
-:1018D00001D1AA48D8E71A787D2A03D0212A01D05D
-:1018E0003A2AF2D11E00EAE708995A1C91421CD903
-:1018F0005A780692723A012A17D802339942E8D9E7
-:1019000000211A7805913A2A1FD15A1C5B7805925A
-:101910007D2B1DD1089B059A9342DAD90027059BA0
-:101920001B787D2B17D09648AEE79648ACE7197820
-:101930007B2905D10132013308998B42F7D3C8E7DF
-:101940007D29F8D1013A002AF5D1059F0593E6E7F4
-:10195000059B0122F0E7002D48D00023287816933C
-:1019600006F086FE00283DD0099B1B680793002BDC
-:1019700001DD854888E716AA3100280020F0BDFC6B
-:10198000209A169B013A04009A4203D87F49804866
-:1019900023F034F8219A01339B009D580122099BC2
-:1019A00052421A60B44231D27A480BF001FF01343E
-:1019B000B44204D223782E2B01D05B2BF7D1611BCC
-:1019C00001222800FFF7C4FA002205000100229836
-:1019D00007F0D2F8002807D129006F4821F0FFFB5B
-:1019E0000AF07CFE2C00E3E74568DBE7099B1B68F7
-:1019F000002B01DA694847E7209A013A9342C5D2A1
-:101A0000013321999A005558099A1360002F00D08C
-:101A1000A6E1069B3C00002B04D0069C733C631E91
-:101A20009C41E4B210AA102116A814F0E9F929008B
-:101A3000220010A800F052FF16A95948FFF752FAE9
-:101A400001235B4205000D931093002F00D18FE01E
-:101A50000EF096FF229B059A0293219B3900019379
-:101A6000209B16A80093099BFFF7E4FE16A825F01B
-:101A70007CFB0026179B0400C3180A930378069387
-:101A8000B34208D0474F1900380027F0BDF9B042E3
-:101A900000D16EE1013423782B2B4ED000272D2B63
-:101AA00002D0202B01D1043701342378232B02D11B
-:101AB000133B1F4301342378302B07D1069B002BA7
-:101AC00001D13D330693002E00D130360DAA0A997C
-:101AD000200020F012FC037807902C2B04D10C3B43
-:101AE0001F43030001330793079B1B782E2B06D15E
-:101AF000079810AA01300A9920F0FFFB0790079B76
-:101B00001C78002C1BD02100274827F07DF90028E5
-:101B100003D0079B5B78002B11D02448B4E631003A
-:101B2000380027F071F9002804D033000234069EF3
-:101B30000693B0E706900600ADE70227B4E716A8C3
-:101B400025F0E7FA069B002B08D12800FFF728F9BB
-:101B50003C230693002801D002330693002E00D1C7
-:101B6000203606231F4229D0732C23D110488BE640
-:101B70003C003E00E9E7C04691FD0200D2FD0200B4
-:101B8000EAFD0200B9FD02000EFE020058FE02004E
-:101B900044A9020071FE020080A902008EFE02002C
-:101BA000CC990200D8FE0200DDFE0200EDFE02002C
-:101BB00006FF0200632C01D1714865E6069B3D2BB0
-:101BC0001FD05E2B1FD03C2B01D13B3B1F43280075
-:101BD000FFF7CAF800282DD0632C50D026D8472C08
-:101BE00013D8452C26D2002C40D0252C22D02800FA
-:101BF00020F001FD220003006249634806F052FC18
-:101C0000EEE64023E2E78023E0E7582C53D0622C35
-:101C1000EDD1002303930D9B0222029361230196D1
-:101C2000009729000EA813F0FFF834E6672C17D8A8
-:101C3000652C1BD32800FFF7B3F800286CD0002CCC
-:101C400056D06E2C54D0472C3FD8452C41D2252C51
-:101C500050D0280020F0CFFC220003004B49CCE7F5
-:101C60006F2C1AD0782C26D06E2CC0D10023039371
-:101C70000D9B01960293009761230A22D1E7280069
-:101C800000F0FCFE0D9B16A90870012201933B0099
-:101C900000960EA813F06CF8FDE5FB0602D5802334
-:101CA0009B001F43002303930D9B01960293009713
-:101CB00061230822B5E70022230003920D9A173B07
-:101CC0000292019600971022ABE72300653B022B9E
-:101CD000BFD8280000F036FF109B220002930D9B16
-:101CE000011C01933B0000960EA825F032F8D2E5C6
-:101CF0006724EEE72800802400F024FF244918F030
-:101D000055FE109B640002930D9B3C430193011C04
-:101D1000009623006622E7E7069B3D2B01D11D4874
-:101D2000B2E5002C01D0732C13D116A92800FFF7BF
-:101D300067FD109B0100169A002B00DA1092109B91
-:101D40009A4200D916930D9B00960193169A3B0078
-:101D50009FE7280020F04FFC220003000E494CE7CB
-:101D6000069B002B00D058E601235B420D93109395
-:101D70006EE66678002E00D0D1E606968BE6C04669
-:101D800032FF020065FF0200C8AC020096FF0200AD
-:101D90000000C842CAFF0200FFFF0200F0B5A1B078
-:101DA00005000C000D920A2800D0E4E10DAB0F9362
-:101DB0000123073D1093059215403CD11368BF4A9B
-:101DC000934206D10FAA10A9059821F010F80595A5
-:101DD00002E0BB4A9342FAD1109B11A907930F9BD3
-:101DE00020000893FFF7EEF8002309900A93A30759
-:101DF00005D1B44A23689B1A5A425A410A9214AA3E
-:101E0000102118A813F0FCFF119A00279446099B93
-:101E1000099C63440493049BA3420FD8079BAA48E0
-:101E2000BB4229D10A9BA948002B00D0A54818A97C
-:101E3000FFF758F8BAE100230593CDE7217825296B
-:101E400004D018A825F0A3F90134E4E7049B661C2C
-:101E5000B34202D89E480BF0B9FA6178252904D123
-:101E600018A825F094F93400EEE70025282915D1AB
-:101E7000059BAB4202D197480BF06CFCA01C0600FE
-:101E80003378292B23D1311A0122FFF761F80100A1
-:101E900005980EF083F80127050001360023340071
-:101EA00040220026302104200B9320330693049B0C
-:101EB000A34213D800231293049BA34231D9237861
-:101EC0002A2B70D1079BBB4221D88348D4E7049BBF
-:101ED000B34201D88148BEE70136D1E723782D2BE4
-:101EE00003D12C3B1E430134E1E72B2B01D1293BCD
-:101EF000F8E7202B01D10643F5E7232B04D0302B44
-:101F0000D8D116430691EEE710230B93EBE77B1C29
-:101F10000C93089BBF00F85800F0B0FD0C9F129086
-:101F2000013401235B421393049BA34292D923788B
-:101F30002E2B17D1049B601C83428BD963782A2BEC
-:101F400038D1079BBB42C0D97B1C0C93089BBF00B8
-:101F5000F85800F093FD0C9F13900234049BA342A9
-:101F600000D877E7002D06D1079BBB42ADD9089A70
-:101F7000BB009D5801372278672A45D8652A00D3CF
-:101F8000B8E0582A5DD01DD81300453B022B00D87D
-:101F9000B0E0099B5249E41A00941300514806F03E
-:101FA00081FA0AF09BFB200012AA049920F0A5F9FF
-:101FB0000400B6E7002313AA0499139320F09DF9B7
-:101FC0000400CBE7632A49D0642AE2D103222B0024
-:101FD0001340022B0AD1444B2B40062B06D0FF2383
-:101FE000DB05E81890430AF0CBF90500139B0A22A1
-:101FF0000393129B00960293069B01936123290091
-:1020000014A812F011FF1FE7732A16D8722A00D302
-:1020100080E0692ADAD06F2ABBD10B9B002B02D05B
-:1020200084239B001E43139B00960393129B08225C
-:102030000293069B01936123E1E7752AC6D0782AB3
-:10204000A7D11300139A173B0392129A0292069A91
-:1020500001920B9A164300961022D0E7224B2B4098
-:10206000062B05D0AB0716D1184B2A689A4212D11D
-:102070001CA92800FFF7C4FB1C9A0100012A01D00B
-:102080001A48F9E6129B019320230093330014A809
-:1020900012F06EFED8E62800FEF766FE00280BD090
-:1020A000280000F0EBFC129B1CA908700193202370
-:1020B000012200933300EAE70D48DDE60CA00200A0
-:1020C00034C20200609202005CFD0200CC99020062
-:1020D00097FC0200A9FC0200D6FC0200C0FC020032
-:1020E00027FD0200C8AC0200070080FFFDFC0200D3
-:1020F00016FD0200280000F025FD139B22780293B4
-:10210000129B011C0193069B14A80093330024F03A
-:1021100020FE99E616AA10211CA813F071FE237860
-:102120001A00723A51424A41D2B2722B09D00A9B2C
-:10213000002B06D0AB0704D1594B2968994200D136
-:102140000422290016A800F0C9FB139A1D9B002A3F
-:1021500000DA1393139A9A4200D91A00129B1E991F
-:102160000193202314A80093330012F001FE1CA851
-:1021700024F0CFFF68E6080000F098FB16A90700DE
-:102180002000FEF71FFF0590072D22D118A90D98FA
-:1021900000F0B2FC03000020834207D0189981426E
-:1021A00006DC404B40489F4200D10E2021B0F0BDDC
-:1021B000169B1CA8594324F09BFF1E9B01210493EE
-:1021C00000930598189B169A23F0F7FC1CA9380079
-:1021D0002EE60D9800F06AFBB8420FD11CA90D98AD
-:1021E000FEF7F0FE1C9E04901D2D17D8192D4ED21F
-:1021F000052D21D0122D1FD00020D7E7284B0D9898
-:102200009F4209D101221CA920F00CFA0028CDD050
-:102210001C9B1D9E0493E7E7FEF7E6FD1F2DEBD107
-:102220000123049A009316993300059820F07DF855
-:1022300000282AD01D48B9E7169B002B07D10D981E
-:1022400000F034FBB84202D10D9C2000AEE7002E16
-:10225000FBD0169B1CA8F11824F04AFF1E9B169A6F
-:1022600005991800069326F077FD169A1E9B944652
-:102270000593634418003200049926F06DFD1CA9F3
-:102280003800FEF72FFE0400DFE709488EE70096CE
-:10229000049B169A0599280023F0C5FCC8E7C046A0
-:1022A00060920200CC990200509202008CE702007A
-:1022B00084E70200F0B5050087B008680C0000F064
-:1022C000F5FA0090012D28D96668022D26D0A06865
-:1022D00000F0D4FB05000021080024F0A5FB04A9B0
-:1022E00001902068FEF76EFE049B0400C7183E4B69
-:1022F0009E4241D1BC422AD2207806F0A1F90028A2
-:102300000FD1002D0FD121003A1B009820F02CF89E
-:102310000100019811F060FF19E0334E01256D4274
-:10232000D9E70134E6E72600307806F089F900287D
-:1023300002D10136B742F7D82100321B009820F0B5
-:1023400013F80100019811F047FFB74209D801982E
-:1023500007B0F0BD0136B74203D1002DF7DD013DD6
-:1023600006E0307806F06CF90028F3D1002DF6DC99
-:10237000BE42ECD23400C4E7300000F097FA009B74
-:10238000984202D03000FEF72FFD05A93000FFF77C
-:1023900037FA059B0390002B13D114480BF016F865
-:1023A0003E002100321B00981FF0DEFF0100019863
-:1023B00011F012FFBE42CAD2059BF418002D00DDB9
-:1023C000013D2600059B0293002DE9D0029BF318E6
-:1023D0009F42E5D3029A0399300026F0AEFC002814
-:1023E000DFD00136F0E7C046A4B30200310003009D
-:1023F000F0B507008BB00D00022807D8290038007F
-:10240000FFF758FF050028000BB0F0BD086800F08A
-:102410004DFA08A9049028686E68FEF7D3FD019074
-:10242000A86800F02BFB041EE8DB431C1800002109
-:10243000059324F0F9FA2F4B05009E4202D12E4855
-:102440000BF0B6F909A93000FFF7DAF9099B0690FD
-:10245000002B02D129480AF0B9FF089A019B944643
-:1024600063440293A3000393099F029BDE1B002C8D
-:102470000BD0019BB34208D83A000699300026F0F1
-:102480005CFC002821D0013EF1E7EB68A6009F1913
-:10249000019A029B01999A1A04981FF065FF38600F
-:1024A000002CB0D0059B1C1BEB68A70099193A00C3
-:1024B000180026F05AFC6B6800211A1BEB6892008A
-:1024C000D81926F065FCAC609DE7039AEB6894464A
-:1024D00063440793029BF1199A1BD21B04981FF0C7
-:1024E00043FF079B013C1860039B0296043B039348
-:1024F000BAE7C046A4B30200C800030031000300DD
-:1025000070B50C008AB0050004A920681600FEF71B
-:1025100059FD00230593049B0100C218029605ABE8
-:1025200006A801940095FFF785F906A90248FEF771
-:10253000D9FC0AB070BDC046CC99020010B50400A9
-:10254000002906D0044B8A6B03600968002306F05B
-:1025500015F820000AF0C2F8D8AB0200F0B504006C
-:1025600087B0039202936618002A06D0023A222A04
-:1025700003D935480AF02AFF0134B44229D2207821
-:1025800006F05EF8071EF7D123782B2B1CD10134FF
-:10259000311B200003AA20F0F8F923181C000025A5
-:1025A0000193B44217D3002F00D06D4201236D0078
-:1025B0001D43019B9C422FD12449039A244805F0D6
-:1025C00071FF0299FFF7BAFF2D2BE1D101340127EA
-:1025D000DEE70027DCE723781A00303A0092092A68
-:1025E00007D9202213431A00613A192ADBD8573B36
-:1025F00000930399009B9942D5D9280005F004FC6B
-:10260000002816D1039B5D43009BED186B006B40C7
-:102610000FD40134C5E70134B44205D2207806F066
-:102620000FF80028F7D1C7E7B442C5D1280007B09A
-:10263000F0BD019B3A000593F11A05A8039B23F016
-:1026400049F8059C0500B4E71501030038010300B3
-:10265000C8AC0200F0B504008BB008934318049294
-:102660000193019B9C4200D3F6E0207805F0E8FF3F
-:10267000071E38D123782B2B37D101340590019BCD
-:102680009C4200D3EAE0202322781A43692A33D1FE
-:102690000199A21C914200D8E6E062781A436E2AA2
-:1026A00000D0E1E0A2781A43662A00D0DCE0E21D07
-:1026B000E51C914214D9E2781A43692A10D1227993
-:1026C0001A436E2A0CD162791A43692A08D1A27979
-:1026D0001A43742A04D1E2791343792B00D10535CA
-:1026E000FF26F6051BE00134BBE705902D2BCAD170
-:1026F0002C3B01340593C2E76E2A2ED10199A21C0E
-:10270000914200D8B0E062781A43612A00D0ABE071
-:10271000A27813436E2B00D0A6E05D4EE51C059B0E
-:10272000002B02D080231B06F618A5427BD1594905
-:102730008CE03D002B786F1C18003038092834D805
-:10274000022E15D10A23029A53431B180293019BB0
-:10275000BB42EED8002304934DE000220792029280
-:102760004D4A250006920022002603920993E1E7D4
-:1027700018F092FC051C012E0DD1069918F016F9DF
-:10278000011C039817F0A0FD43490390069818F028
-:102790000DF90690DBE74149039818F007F9291C69
-:1027A00017F092FD00260390D1E7002E03D12E2BC7
-:1027B00003D10126CBE7022E16D0099A1A43652AC7
-:1027C00012D1019BBB4256D96B782B2B05D1AF1C84
-:1027D000019B9F42ABD00226B9E702262D2BA8D140
-:1027E0002C3BAF190793F3E7049A002A04D0202268
-:1027F00013436A2B13D13D00079B002B02D0029B91
-:102800005B420293029818F0FDFB011C23481BF069
-:10281000B9F8039918F0CAF8049F061C7FE7002353
-:102820000493E9E70135019B9D4205D2287805F024
-:1028300007FF0028F6D17AE7019B9D4200D076E79A
-:10284000089B002B01D1002F1AD01549154820F004
-:10285000CDFC1099FFF772FE00230593002303932C
-:10286000002325000493CCE7059B002B00D15EE7F5
-:102870002500002656E7019BBB4200D157E769E7D8
-:10288000032302209E43084B3043C0180BB0F0BD19
-:102890000000C07FFB000300CDCCCC3D00002041F8
-:1028A000DE000300C8AC020000008080074BC207B6
-:1028B0000AD4074A074B0240062A05D00322064BDA
-:1028C0000240022A00D0036818007047ECB80200EA
-:1028D000070080FFCC99020048B0020070B50D00DF
-:1028E000040016000EF04CF82800FFF7DFFF8368A5
-:1028F000002B04D0320029002000984770BD4268A8
-:102900000249200024F06AFAF8E7C046A402030056
-:1029100010B50A0001000248FFF7E0FF10BDC046F5
-:1029200044E80200F7B5050008000E0020F062FC44
-:10293000002810D001AA6946300005F053FE009B24
-:10294000002B08D01749280024F087F9009CE71EC7
-:10295000A400002F09DA310028000222FFF7BEFF91
-:102960002800114924F079F9F7BD019B28001A19B4
-:1029700011000C3A08390B6812680C4924F02EFA41
-:10298000019B1B19043B1A68002A06D1064928003E
-:1029900024F063F9033F0C3CDBE70549280024F0F1
-:1029A0001DFAF7E762020300254F030086020300C9
-:1029B0009B02030010B50400FFF778FF054B006988
-:1029C000984203D0431E9841C0B210BD200021F0B0
-:1029D0004BFFFAE7F5BA000070B505000C000120C6
-:1029E0008D4203D0214B9D4201D1002070BD994200
-:1029F000FBD001231D4204D01942F6D12B000D005B
-:102A00001C002A001A4B1A40062A05D0AA0711D129
-:102A1000184A296891420DD12340062B05D0A307FF
-:102A2000E3D1144B22689A42DFD121002800FEF73F
-:102A300097FEDBE72340062BD7D0A30703D10D4B2E
-:102A400022689A42D1D02800FFF730FF8369002B1B
-:102A5000CBD0220029001B2098470028C5D0064B68
-:102A6000C01A43425841C0B2C0E7C046A4B30200F6
-:102A7000070080FFCC9902008CE70200104B10B5D4
-:102A8000984219D00F4A0123904217D0184201D022
-:102A9000184110BD830706D10B4B02689A4202D140
-:102AA0000CF036FFF5E71FF0A6FD084902000848C4
-:102AB00005F0F8FC09F012FE0020EAE71800E8E74C
-:102AC00084E702008CE70200ECB802002902030050
-:102AD00050AC020010B5C30705D4830706D1054BDF
-:102AE00002689A4202D122F00CFE10BDFFF7C6FF29
-:102AF000FBE7C046ECB802000F4B70B50D00012497
-:102B0000984204D100230B602300180070BD0B4BCA
-:102B1000984201D10C60F7E70300234002D0401037
-:102B20002860F1E78207F0D1054A01689142ECD1B3
-:102B30000CF0EEFEF4E7C04684E702008CE70200EA
-:102B4000ECB80200184B10B5984228D0174B9842A9
-:102B500027D0C30703D5401018F054FA10BD032343
-:102B6000184206D1124A0168914202D122F0D2FDE8
-:102B7000F4E702001A40022A08D10E4A0240062A4F
-:102B800004D0FF22D20580189843E7E71FF033FDF9
-:102B900009490200094805F085FC09F09FFD002065
-:102BA000DCE7FE208005D9E784E702008CE702001D
-:102BB000ECB80200070080FF0F02030050AC0200D7
-:102BC00010B583070CD103680A4CA34202D120F050
-:102BD0000EF910BD084CA34202D123F03CFFF8E7E8
-:102BE0001FF009FD05490200054805F05BFC09F0EE
-:102BF00075FDC0460CA0020048E70200BF010300BB
-:102C000050AC020013B50C0001A9FFF7D9FF019BDE
-:102C1000A34206D022000349034805F043FC09F013
-:102C20005DFD13BDE2010300C8AC0200F7B505006D
-:102C30000C0017001E00D3070ED557100197019BFB
-:102C4000002B1FDA1B190193002E1DD0002B15DA63
-:102C5000002301930198FEBD01A91000FFF74CFF6E
-:102C60000028ECD138006C681FF0C5FC220003007E
-:102C70000B490C4805F016FC09F030FDA342E9D9D8
-:102C80000194E7E7002EF9D1019B002B01DBA34261
-:102C9000E0D36A680449054805F004FCECE7C04647
-:102CA0008501030050AC0200A901030044A9020001
-:102CB00010B50400830710D10D4B02689A420CD165
-:102CC0000C4B0340062B06D1C00822F032FE430015
-:102CD0000120184310BD8068F9E72000FFF7E6FDEA
-:102CE0004369181EF6D0210001209847F2E7C0463C
-:102CF00060920200070080FF164B70B504000020B0
-:102D00009C4203D0144DAC4201D1012070BD134B45
-:102D100000209C42FAD001262640864203D0601053
-:102D2000431E98410DE02000FFF7C0FD4369002BD2
-:102D300009D0210030009847002804D0401B4342AE
-:102D40005841C0B2E2E72000FFF7B2FF0028DCD014
-:102D50000138E5E784E702008CE70200A4B3020033
-:102D600010B50400FFF7A4FF002809D120001FF0D0
-:102D700042FC04490200044805F094FB09F0AEFC53
-:102D800010BDC0464102030050AC020070B5040003
-:102D90000D001600FFF78AFD036A002B05D03200F4
-:102DA000290020009847002818D10D4D2000002E42
-:102DB00008D11FF020FC02000A49280005F072FB30
-:102DC00009F08CFC042E04D11FF015FC064902000A
-:102DD000F3E71FF010FC05490200EEE770BDC046A6
-:102DE00050AC0200A9020300D4020300F502030064
-:102DF00010B51FF017FC002802D102480AF0AAFC07
-:102E000010BDC0466001030070B5050000291CDB41
-:102E1000032905D80800002416F05AFF18180606E2
-:102E20000123023999430C00FE26B52109023143E2
-:102E300028001FF011FC002C04D005492800214374
-:102E40001FF00AFCAE61EC6170BD0024F226ECE7D5
-:102E500080B0000010B50D4C206824F036FC00282E
-:102E600007D00B4B1B78002B03D1206803685B68ED
-:102E700098470023074A1370074A13700BF030FC81
-:102E80000CF05CFA0EF038F810BDC0465C2900204A
-:102E9000CB2D0020CA2D0020392E002070B5050052
-:102EA00094B0002804D13F481DF0B8FD14B070BDA7
-:102EB00008A809F0EDFB041E19D12E68290004A80A
-:102EC00001220EF0C7FE23002200310004A808F002
-:102ED00099F90400032001F0A1F8200021F043FD3E
-:102EE0000120404201F09AF809F0F0FBDEE70120F2
-:102EF000404201F093F809992B48FFF713FD099818
-:102F0000FFF7D4FC2949040008F0E6FE0028CDD1E3
-:102F10002749200008F0E0FE0028C7D1099C01AA3B
-:102F20006946200005F05EFB02AA322104A812F0D7
-:102F300067FF009B022B05D9019B1E495A6802A816
-:102F400023F04CFF2000FFF7B1FC1B4BC2689A42F4
-:102F500010D1236819495A6802A823F03FFFE3689B
-:102F6000002B07D05A68002A04D00022996802A8D2
-:102F7000FFF7B4FC032001F051F804A824F0F5F8A1
-:102F800006F034FC04A824F0C4F80120404201F00B
-:102F900045F80B4B9A6C002A00D187E700229A640F
-:102FA00084E7C0465803030044E8020014AC020062
-:102FB000BCA9020085030300658300008E030300A3
-:102FC0007C2E0020F8B54E4C1321200025F0A1FCEA
-:102FD0002000032125F033FD4A4C01234A4A1321E6
-:102FE000200015F0FBFF01220221200016F026F838
-:102FF000464C200013F0EAF9454F3860200013F0EA
-:10300000F3FB444D2860102025F03CFE04002968A5
-:103010000025414E3A68330013F026FF3F4B1C60F9
-:103020003F480DF08DFCE120C0000DF099FC3D49BA
-:103030003D480AF07FFE09F071FB06F053FB01F0FA
-:10304000A5FE13F031F8300024F086FF22F02EFAAE
-:1030500000F064F904F0E0F901F07EFC0AF0D4FC21
-:10306000324C3348230088331D600BF0ADFB0BF06E
-:1030700089FB0AF0DBFC2F4F3B78012B0ED100239C
-:1030800007211A002C4800F051FA031E1DD0010040
-:10309000F720400000F0D2FBFFF700FF3B78002B49
-:1030A0002AD112F0ABF90028F8D0244820F0E8FA31
-:1030B0000BF078FB08220021214825F069FE23004F
-:1030C00098348C331D602560AAE7F82292021178AB
-:1030D0004D2909D15178502906D1F7205288194934
-:1030E000400022F043FDD7E70122174917200AF0DC
-:1030F000A5F821F062FCD1E712F0D0F9D3E7C04681
-:103100003C29002054290020DF270200DC29002070
-:10311000582900205C290020642900206029002013
-:10312000004000203C2900203C0100207C2E002093
-:10313000552E0000EA000020920303009A030300CA
-:10314000FC2E002004E0030004A0020010B5084C8F
-:10315000084A0621200013F059FF074A07492000BA
-:1031600025F089FD00221E21054824F0FFFE10BD38
-:10317000642900204C94020000000020C56F01006B
-:10318000DC29002070B505000C200C0023F075F838
-:10319000024B45600360846070BDC04664940200C9
-:1031A00010B524F07FF8014810BDC046A4B302005A
-:1031B00010B5C30708D483070ED10368094A9342A8
-:1031C00002D0094A934207D1FFF758FC002801DDDD
-:1031D00020F063FA054810BDFFF7B4FC17F0F2FECB
-:1031E000F4E7C046ECB8020094E70200A4B3020082
-:1031F00001220B4B10B51A600A4A51680029FCD015
-:1032000000215160A1220131D2009A585960032354
-:10321000D01718408018801022F036FA10BDC04632
-:1032200000C00040FCC0004010B5002804D1044894
-:1032300012F05CFE034810BD0868FFF71FFCF7E7BB
-:10324000E7030000A4B3020080235B051869034B69
-:103250001B7843438020C002C01A7047C72D00204E
-:1032600080235B051869034B1B7843438020C00211
-:10327000C01A7047C82D002070B5084DC4012B68D6
-:103280000021181921F0C7FB2868054B00197F3071
-:1032900000781B788342F0D270BDC046F42900202C
-:1032A000C62D002010B5C3790400002B08D0064AB3
-:1032B000037981791068DB01C018013021F0ABFB84
-:1032C0000023237210BDC046F429002010B5124B14
-:1032D00001001A684379DB01D31818007F300478A5
-:1032E000FF2C08D10879C00112185278FF2A0FD09C
-:1032F000887990420CD08A799B180132D2B25878E2
-:103300007E2A01D08A7110BD00234C718B71FAE7BF
-:1033100001204042F7E7C046F429002070B5F824A8
-:103320008025A40223786D054D2B4CD12B6980207C
-:10333000E41A2B69C002E41A2969001B16F0DCFCB0
-:103340002B4B2C4918702B69E21852185D4215401E
-:10335000294B2A4A9B1A2A4A9B1880225205116936
-:103360009D4234D38020C002401B16F0C5FC254B83
-:10337000641B1870E411244BE4B21C70A1200123DB
-:103380000025224A22491360C0004D604B68002B83
-:10339000FCD01358DBB2A342F7D21E4901330B70A5
-:1033A00001235360FFF750FF037805001A4CFD2BF3
-:1033B0000FD180235B051869184BC009C018C001E4
-:1033C0002818206070BD80242B69E402AFE76D18D7
-:1033D000C5E7FFF745FF0378803DFD2B01D1256050
-:1033E000F0E7FFF73DFFFD2121F015FBF7E7C046B1
-:1033F000C82D0020FF87FFFF1401002000000020DF
-:1034000064870300C72D0020C62D002000D0004097
-:10341000FCD00040C92D0020F4290020FFFFFF014F
-:10342000F7B5254B254F1A78254B14001B783968C2
-:103430000133E001405CFF2829D00134E4B29C4212
-:1034400000D101249442F4D1802300265B051B693E
-:10345000DB090193E30100933B68E2019D182B789F
-:1034600028005A425341F61821F0EBFA002810D0F8
-:10347000002304E0DA01AA5C002A0AD10133019A90
-:103480009342F7D13868009BC01821F0D0FA200091
-:10349000FEBD0B4B01341B78E4B201339C4200D1DA
-:1034A0000124054B1B78A342D4D1072E02D91FF06B
-:1034B000F0F9B6E7FF24EAE7C92D0020F42900203F
-:1034C000C62D0020F7B507000D0001240E4B1B7818
-:1034D00001930E4B1E68019BA34202D2FF242000E1
-:1034E000FEBDE10171180B78FE2B09D18B78AB4240
-:1034F00006D103312A00380025F01FFC0028EED049
-:103500000134E4B2E7E7C046C62D0020F4290020CC
-:1035100010B5054A03791068DB01C01881780022D4
-:103520000330FDF715FD10BDF4290020F0B585B07E
-:1035300002900D0016000393782948D8FFF7C2FFC8
-:103540000400002E3BD0FF2801D0FFF795FEFFF7C7
-:1035500067FF0400FF2803D11E491F4821F04EFADF
-:103560001E4FC0013B680190FE21181821F053FA4C
-:103570003B68019AE9B29818023021F04CFA386899
-:10358000019B2A00C018033002990BF037FA0C2077
-:1035900022F073FE039A0300002A16D0104A1A6024
-:1035A0000E4A1C7112685C71E4011419A278DE7174
-:1035B00002329A7101221A72039A5A7202E033009F
-:1035C000FF28E4D1180005B0F0BD064AE7E7002364
-:1035D000F8E7C046A8030300E8AA0200F429002087
-:1035E000ACBA020058BB020007B501A9FEF708F902
-:1035F0000199FFF767FFFF2803D10449044821F030
-:10360000FDF9FFF739FE03480EBDC046DB0303009A
-:10361000E8AA0200A4B30200F7B50192027A0400FE
-:103620000091002A02D1244809F0D0FEC579002D6E
-:1036300006D1224A17680279D201D25D002A05D14B
-:10364000092201251A606D422800FEBD61797E22A3
-:10365000C901791808007F30A3790078D21AFF28B1
-:1036600009D12079C00138184078FF2819D0C01A34
-:10367000824200D902000198461B964200D91600EA
-:10368000002EE1D0009A01335019C918320025F0FC
-:1036900063FBA3799B19DBB27E2B04D0A371AD1918
-:1036A000D4E70022E7E70023A3716379DB01FB186D
-:1036B0007F331B786371F2E7BE030300F429002017
-:1036C000F0B585B00393037A040002910192002BB8
-:1036D00002D1304809F07AFEC379002B08D02E4A77
-:1036E00003791268DB019B5C019A0092002B25D1C3
-:1036F0000923039A13600A3B0193019805B0F0BDBA
-:103700007E22A379D71A009A974200D917006079D0
-:10371000214E0133C001C01833683A0018180299CD
-:103720000BF06CF9A379DB19DBB27E2B0AD0A37105
-:10373000029BDB190293009BDB1B0093009B002B79
-:10374000DED1DAE70023A371FFF76AFE0500FF2848
-:1037500009D12079FFF790FD002323721C23039ADF
-:1037600013601D3BC8E760793368C0011818290051
-:103770007F3021F050F93368ED015819617921F05B
-:103780004AF962793368D2019B187F331B786371E1
-:10379000CEE7C046BE030300F4290020002170B527
-:1037A000080023F041F9012405000C4B1B78A342CB
-:1037B00001D2280070BD0A4AE3011068C0180378DE
-:1037C000FE2B08D1817800220330FDF7C1FB0100F8
-:1037D000280010F001FD0134E4B2E6E7C62D002018
-:1037E000F429002073B501A9FEF70AF80199FFF743
-:1037F00069FEFF2803D10E490E4821F0FFF800258D
-:103800007E260D4B1C68C301E31859789B78023360
-:10381000DBB2C201A2187F321078FF2804D1C81A87
-:10382000401921F031FF76BDF31AED180023F0E7BF
-:10383000DB030300E8AA0200F42900201FB5034AB5
-:10384000034B22F056F905B000BDC046CD32000052
-:10385000A5320000044B054A05481A60054A5A6023
-:1038600000221A817047C046FC290020200307006F
-:10387000A4B3020074696275F7B51600314A0B00F3
-:1038800088321768002F02D12F4809F09FFD0221CE
-:103890002E4C2F4DE167A324E4002C592D4AE4B2AD
-:1038A00006343C192C4F3D68A54204D12B4B1160C6
-:1038B00001930198FEBD2578002832D1601C002BB1
-:1038C00004D12900FDF75CFB01900BE05A68AA4285
-:1038D00000D92A000100186825F047FA01226B0080
-:1038E0001A430192002E0ED0621953785B42336066
-:1038F000D37811791B0209040B43917852790B4359
-:103900001206134373603E68A91D6118721A2000E5
-:1039100025F02BFA0223751B0E4A063D3D6013600D
-:10392000C7E7022D04D8002303600E330193D9E7C3
-:103930002100042225F010FAE91E201D0022FDF7C7
-:1039400007FBC1E77C2E00206C04030004E100E0CB
-:103950000010004000E100E0082A0020A4B30200AB
-:103960007FB5002101AA0800FFF786FF0A4B9842A5
-:103970000FD00121019B03905A00029B0A438B4008
-:103980000492064A032013400B4303A9059302F057
-:1039900071FE07B000BDC046A4B30200FEFFFF7F6A
-:1039A000002213B501AC11002000FFF765FF094BA1
-:1039B00098420ED02378022B08D96378012B05D1C9
-:1039C000A378002B02D1E378012B02D0024809F042
-:1039D000FDFC16BDA4B302004C04030002220B4BF5
-:1039E00010B5DA6700220121094B5A61094A1161B9
-:1039F0005A69002AFCD0084C88342068002803D07B
-:103A000022F06AFC0023236010BDC04604E100E000
-:103A1000FC100040001000407C2E002010B5FFF785
-:103A2000DDFF014810BDC046A4B30200F8B5FFF7A2
-:103A3000D5FF364C26786578063601357543280063
-:103A400022F01BFC324A861916600022314B4519C0
-:103A500088331860304B01211D60304B5A60802242
-:103A6000D20511605A68002AFCD003212C4B615604
-:103A70002C4A00259950A178043A9950617A08326D
-:103A800099506168284A08269950217A274A284F78
-:103A900099500121274A9D5004329950264A9E5040
-:103AA0008122247892042243A324E4001A510224A0
-:103AB000224A9C50224A9F50224F043A9F50182776
-:103AC000214A9F50214AC0279850C12292009E50FF
-:103AD0001F4ABF00D0591F4E0640C020000230438D
-:103AE000D051C020400014501460102280301C5867
-:103AF00022431A50184A5560596051680029FCD079
-:103B00000021116101229A60F8BDC046FC29002005
-:103B1000082A00207C2E0020F8290020FC0000400C
-:103B2000001000400C0500001C05000024050000EA
-:103B3000FFFF00002C050000140500003405000004
-:103B40003C050000211001005405000004050000A0
-:103B500000E100E0FF00FFFFFC10004010B5FFF7A0
-:103B600065FF014810BDC046A4B30200F0B50500D2
-:103B70008DB01600002802D0694809F0EBFD694BB2
-:103B800009AA190091C991C21A781F7A06925A7827
-:103B900005929A78039203229A5604925A685B7AA5
-:103BA000019202937368AB424CD9EB000793B36860
-:103BB000EA009B181A68002A1BD0042A19D05868FA
-:103BC000FEF788FFB368EA0004009858FDF7E2F9B1
-:103BD0000200B338FF3806282ED816F079F8040C06
-:103BE000131920262800631EFA2B00D995E0E3B2B2
-:103BF00006930135D6E7631EFD2B00D98DE0E3B2B5
-:103C00000593F6E7532C00D987E0E3B20393F0E77E
-:103C1000072C00D981E0444B1B570493E9E7022CA1
-:103C200000D97AE0E3B20293E3E70194E1E7FF2CE5
-:103C300000D972E0E7B2DCE73C493D4804F032FCD1
-:103C400008F04CFD3B4B09AC88331B68002B12D1AC
-:103C5000069B27722370059B6370039BA370049BD4
-:103C6000E370019B0A93029B63722E4B07CC07C340
-:103C700031480DB0F0BD069B2A4D2370059B637043
-:103C800022882B889A420FD0FFF7A8FE039B277249
-:103C9000A370049BE370019B0A93029B63720ECC9A
-:103CA0000EC5FFF7C3FEE3E70222244B2449DA677F
-:103CB0000022244B4A6101321A614A69002AFCD071
-:103CC000039809AA907004981772D07001980A900E
-:103CD00002985072134870CA70C01B4A04989850DA
-:103CE0000398043A98500298083298500198174A5D
-:103CF0009850174A9F5000224A6001325A604A6821
-:103D0000002AFCD000220A61C02101329A60114BC6
-:103D1000013249005A501A60AAE70F498DE7C046A0
-:103D2000F6030300FC290020EE0303001104030046
-:103D3000C8AC02007C2E0020A4B3020004E100E025
-:103D4000FC100040001000400C0500001C050000A5
-:103D50002405000000E100E027040300214BF7B533
-:103D60005A68214D002A03D000225A600132AA600D
-:103D70001A69002A34D000221A61A323DB00E85814
-:103D80001A4BC2B2883319680C78A24201D21400CF
-:103D900008708023DB00EB58012B1FD1144E154A0D
-:103DA0003768A31D12680193FB189A4216D3621C50
-:103DB000380024F0D1FFA923DB00EB58621CBB5470
-:103DC00015F0DAFE3368020A1C19E270020C227147
-:103DD000019AA0709B18000E607133600123AB60E4
-:103DE000F7BDC046FC100040001000407C2E0020B3
-:103DF000082A0020F8290020F7B5314F00933B0036
-:103E0000883301921A680E00002A02D12D4809F069
-:103E1000DDFA02212C4B2D4CD96700232C4D636118
-:103E200001332B616369002BFCD0A323DB00EB582B
-:103E30000099DBB27118994203D9B3423DD39B1B61
-:103E40000093009B8837F31813703B68010001331F
-:103E50001800320024F080FF009B002B06D0386849
-:103E6000013680191A00019924F076FF002363605F
-:103E700001332B606368002BFCD00123AB6000236F
-:103E800023612369002BFCD00023636101332B6184
-:103E90006369002BFCD00023636001336B606368AF
-:103EA000002BFCD00023C021022223610133AB6030
-:103EB000084B49005A501A60F7BD1E000023BFE7A7
-:103EC0007C2E00206C04030004E100E0FC100040A4
-:103ED0000010004000E100E007B501A9FDF790FCEB
-:103EE000019B020003210248FFF786FF01480EBD37
-:103EF000EA030300A4B302001FB5012201A9FEF7E3
-:103F000077FF002301981A000299FFF775FF014817
-:103F100005B000BDA4B30200030010B50548002B96
-:103F200003D11FF056F908F0D9FB09681FF057F9C3
-:103F3000F9E7C04614AC020010B503480968FEF763
-:103F4000F1FC024810BDC04644E80200A4B30200E0
-:103F5000F0B5802787B02B4D02907F422C78002C43
-:103F60001CD063B2002B12DA6E787C40E4B2002ED3
-:103F700014D0013CE4B2FF2C02D101350135EDE74C
-:103F800004AB981D0121067005F0F2FBF1E704ABCC
-:103F9000D81D0121047005F0EBFBEFE7052702981F
-:103FA0001FF07BFB0124BC4227DA0025164E2200BD
-:103FB000290030000BF0A2FB6B4601901B79002B0F
-:103FC00015D0631E1A002900300003930BF096FBF6
-:103FD000031E0CD12200290030000BF05BFBFF22F6
-:103FE000019B290013403000621E0BF053FB01358A
-:103FF000052DDBD10134E4B2D5E7013F002FCED14E
-:1040000007B0F0BD870403001C00002010B5C820D5
-:10401000FFF79EFF004810BDA4B3020010B50400D6
-:10402000431C02D0024804F09BFA024B1C6010BDF6
-:10403000A42E0020782E0020014B024A9A6470477B
-:104040007C2E0020A42E002030B507240278084DD5
-:10405000A24314000222224302707F22039C41608B
-:104060002240D400028883602A402243028030BD6F
-:1040700007FCFFFF10B50B00072401782340A14384
-:1040800019437F23017004990A4C0B40D90003881F
-:10409000426023400B430380039B04685905064B91
-:1040A000C90A23400B430360029B8360059BC360E6
-:1040B00010BDC04607FCFFFFFF03E0FF70B513789B
-:1040C00004000A3BD8B20F2809D90A001048114948
-:1040D00004F0E8F90025636A1860280070BD002527
-:1040E00052781B021A43E36AAB420AD1238C0025A3
-:1040F000042BF2D10849064804F0D4F9636A186029
-:10410000EBE7206BA90009589142E6D00135EBE7B7
-:10411000D8AB0200A8060300BD060300F0B50400FA
-:1041200085B00D00100003A9A26A1E0021F022FF35
-:10413000002809D12A000B490B4804F0B3F9636A3F
-:104140001860002005B0F0BD0398FEF7C3FC030023
-:10415000B343F7D0030000962A000449024804F054
-:10416000A1F9ECE764060300D8AB02007C0603006B
-:10417000F7B51F0013780E000A3BD9B2050021489D
-:104180000F2904D850781B02184321F0D7FB1524BF
-:104190000378009315231C491B1B0193A300CB1A22
-:1041A000190055310978009A91421FD119005631F2
-:1041B000427809788A4219D1573381781B788B422B
-:1041C00014D1002B0FD1019B9A000F4BD05CB84249
-:1041D00008D93B0032000D490D4804F063F96B6AC1
-:1041E00018600020FEBDC378002BECD0013C002CF1
-:1041F000D0D132000749064804F054F96B6A1860C0
-:104200002000EFE7FB82030020070300D406030031
-:10421000D8AB0200ED060300F0B5137885B00500B9
-:104220000E00462B47D101A9100021F0D3FE019BBF
-:10423000834240D003781A000A3A0F2A0AD80200B3
-:104240000F2331002800FFF793FF01248440200052
-:1042500005B0F0BDB32B2ED121F0B7FE040021F044
-:10426000AFFE02900378B62B25D10127A73B220091
-:1042700031002800FFF77CFF3C0003A9844002982E
-:1042800021F0A8FE039B02909842E0D09D2102A855
-:1042900021F0AFFE029A039B9A42D8D00F2331003F
-:1042A0002800FFF765FF3B00834002981C4321F084
-:1042B00087FE0290EEE732000349044804F0F2F86A
-:1042C0006B6A00241860C2E705070300D8AB020040
-:1042D000F0B50E0087B0040004A930001F00019261
-:1042E00021F031FB019B0500002B0FD1A4239B0083
-:1042F0009E4205D1BF21090220001EF0ADF919E050
-:10430000BE4B9E4200D088E0BD49F5E7019B012BE2
-:1043100000D09AE00A23FF339E420DD101003A6893
-:104320002000FFF7CBFE010020001EF0DFF900287F
-:1043300000D116E207B0F0BDB24B9E4209D1010098
-:104340003A682000FFF7BAFE010020001EF026FAAE
-:10435000EDE7AD4B9E420AD101000F233A682000E1
-:10436000FFF706FF8E21C000C9010143C4E70378AF
-:10437000622B3BD1049B032B07D0052B36D1C3788E
-:104380005F2B33D103796E2B30D101230E265B4294
-:1043900069789E480293B300F31AC3181A002B32AF
-:1043A00012788A4209D1AA7894461A002C321278DF
-:1043B000944502D12A331B780293013E002EEAD1A4
-:1043C000029B013329D03A6829002000FFF776FECE
-:1043D000049B0200052B03D12E79773E73425E4188
-:1043E0003300029920001EF09DF9A0E7884B9E4201
-:1043F00001D1884980E7884B9E4201D187497BE7FC
-:10440000874B9E4212D129003A682000FFF704FF33
-:10441000FF231B02B421184215D0019B2A008149B9
-:10442000814804F03FF8636A186083E77F4B9E423F
-:10443000F3D13A6829002000FFF7EEFEFF231B02AC
-:104440001842EAD1BC2109028FE7019B022B00D060
-:1044500021E17B68764A1B780A3B0F2B48D89642AD
-:1044600012D13A6801000F232000FFF781FE7A681D
-:10447000060029000F232000FFF77AFE310002001A
-:1044800020001EF01CF955E700226A4B02929E4262
-:104490001AD18026F6013A68290007232000FFF789
-:1044A00067FE7A680190290007232000FFF760FE6D
-:1044B000019A0300310020001EF0FAF83AE7029B4F
-:1044C000013302930F2BA8D0029B03229E005A4B6C
-:1044D0002800991924F0B7FC0028F0D1EB78002BC4
-:1044E000EDD1564BF65C80233601DB011E43D2E74B
-:1044F00096421AD1802607233A6829002000FFF748
-:1045000037FEFF23019029007A682000FFF706FE9E
-:104510000100019BB6011B0231431943ECE6A026C2
-:10452000E9E7C026E7E7E026E5E787239B009E4210
-:10453000F5D01E3B9E42F4D0414B9E42F3D0414BFE
-:104540009E4251D0404B9E4250D0404B9E424FD055
-:104550004F339E424ED03E4B9E424DD03D4B9E42ED
-:1045600000D05AE705233C4A9B009B5A290002933E
-:104570003A6807232000FFF7FBFD7E68039033783D
-:10458000452B6BD1300021F060FD002866D1300052
-:1045900021F01BFD0378A62B60D105A921F01AFD9F
-:1045A0000599060021F000FD022857D1300021F0C6
-:1045B00007FD07233200070029002000FFF7D8FD80
-:1045C000029B0600DB0451D51F233A00290020007E
-:1045D000FFF7A4FDF100039B029E80011E433143BF
-:1045E000F826F6003040C0E60023BCE70123BAE716
-:1045F000019BB8E70323B6E70423B4E7E602000013
-:1046000030BF00000B0200000F0200002505030070
-:104610002202000072B600002302000062B6000011
-:104620009F020000DF050300D8AB02009A020000E1
-:104630008902000001020000290603002806030089
-:10464000C50200006E0200006F020000710200004F
-:10465000C1020000C302000058F602002A004449CB
-:10466000444803F01FFF636A1860D6E66B460822D1
-:104670009B5E002B07DA3E233A0029002000FFF75B
-:104680004DFD4008A6E77C233A0029002000FFF7F3
-:1046900045FD80089EE7019B032B00D0BDE69E23CD
-:1046A0009B009E4222D100263A6807232900200061
-:1046B000FFF75EFD7A680190072329002000FFF7CD
-:1046C00057FD1F230290BA6829002000FFF726FD3E
-:1046D000019F029B374381013943DE0031430BE6E2
-:1046E00080263601E0E780267601DDE7224B9E42F8
-:1046F000F6D0224B9E42F6D0093B9E422BD1C026DB
-:1047000007233A6829002000FFF732FD07230190B4
-:104710007A6829002000FFF72BFDBA68760113782C
-:1047200002900A3B0F2B0DD8072329002000FFF72A
-:104730001FFD029BD900019B194331430F008101EA
-:104740003943D9E58023DB001E43290007232000DD
-:10475000FFF7E4FCEDE70A4B9E4200D05DE6D02671
-:10476000CEE708490348646A1EF040FD2060E1E599
-:10477000B4050300D8AB0200790200000702000074
-:10478000C502000014060300F7B50E000700110073
-:10479000300021F009FC0025040004281ED97C6AA1
-:1047A000134914481EF022FD206000242000FEBDA5
-:1047B00073780002184321F0C1F80236019024F00A
-:1047C0003BFB022811D1019B1B78722B0DD1019B61
-:1047D0005A782B0030339A4207D10135A542E5D0F3
-:1047E00030780A38C3B20F2BE2D97C6A0249D8E785
-:1047F0004F050300D8AB020082050300054B10B53E
-:10480000186822F05EFF044B002800D1034B18000B
-:1048100010BDC0465C2900208CE7020084E702003E
-:1048200010B5034B186822F054FF024810BDC04673
-:104830005C290020A4B3020010B5034B186822F0D5
-:10484000B6FF20F021FF10BD5C29002010B5034BFE
-:10485000186822F0B3FF20F017FF10BD5C2900207C
-:1048600010B5034B186822F0B0FF20F00DFF10BD0B
-:104870005C29002010B5034B186822F05BFF20F084
-:1048800003FF10BD5C29002030B593B009F08AFF0A
-:10489000184C200023F05BFB174D286812F04CF8F1
-:1048A000200023F059FB09F06DFF20F0FFFD1EF002
-:1048B00072F90400296803A822F0F9FE0F4B2000CA
-:1048C0000A93039B0B93049B0C93059B0D93069BF0
-:1048D0000E93079B0F93089B1093099B01931193D1
-:1048E00020F0A5F8200020220AA90AF087F8044841
-:1048F00013B030BD642900205C29002055BA11C0D6
-:10490000A4B30200F8B5114D0400286822F0D9FEC6
-:10491000002802D12000FFF7B7FF0D4B1B78002BBA
-:104920000DD10C4E3478E4B2002C08D10127286850
-:10493000377003685B689847054B34701F702868B0
-:1049400012F0D6F820F0A0FEF8BDC0465C29002089
-:10495000CA2D0020CB2D0020F0B58DB01EF01BF924
-:104960000E4B02689A4217D1046941680894446961
-:104970008268C36809948469C0690A9484466C4655
-:1049800005910692079308A8E0C8E0C4604620603D
-:104990000348006822F075FE0DB0F0BD55BA11C095
-:1049A0005C290020F0B58FB00692426809939446C6
-:1049B0000368040002939B6804300093634403601F
-:1049C0000E001EF0F5F8059060681EF007F9431C14
-:1049D00063600378A24A0193831C636043780021DB
-:1049E0000093C31C63608378B5000393031D636069
-:1049F000C3782000049323001033A360059B143078
-:104A00009A1893000793C318E360079B0C331A00AE
-:104A1000089324F0BDF9099B009A5B190B93059B41
-:104A20009B1A039A0A939D1A2F1D009ABF00E7193B
-:104A30000123B24264D2019A1A4207D13300009A8C
-:104A40008849894803F02EFD07F048FE009B033596
-:104A50009900099BAD005918009B6519F01A01F0E7
-:104A600009FE009E043F68600022964200D070E07C
-:104A7000069B002B03D1019B1B0700D4D6E0022329
-:104A80000026019A1A400992B24204D0069820F0FA
-:104A90009EFE060038600027029B0B9DDB68089392
-:104AA000069B9F425ED10A9B029805339B00E1184A
-:104AB0000A00049D0C30002D00D080E0049A920082
-:104AC0008918079A2032A2188A4200D980E0143B44
-:104AD0000693009B089A9B00D3180793039B9D4263
-:104AE00000D27FE065680DA80D951EF061F82818CA
-:104AF0000578461CFF2D00D0A7E066600FB0F0BD22
-:104B0000019A1A4205D00335AD00584B6519043F90
-:104B10006B60069B002BA7D1019B1B07A4D4009BB5
-:104B2000049A9A1AB24212D8009A049B991A320037
-:104B30008900009B9A4297D29300029D581828182A
-:104B4000089D0069EB1AE31818610132F1E73300A0
-:104B500076E7099908989300C958C31AE3181961B0
-:104B6000013282E7009B039800221B189C462968AB
-:104B7000944505D8099B002B1CD1CA083C490EE07E
-:104B8000089B90001858884212D1059B013B9B1A44
-:104B90009B00E3185A69002A05D0CA0835493248F3
-:104BA00003F080FC50E76A685A610137083577E7FF
-:104BB0000132DDE76A68300020F042FEF5E7166852
-:104BC000002E02D1AE0086591660013D043272E714
-:104BD000081D0968002903D1121A92102649DEE740
-:104BE000010071E7069AAB00D71AE7193A69002A63
-:104BF00016D1082000996E180899B6008E190799E9
-:104C0000C958019B03420DD0049B029804339B00BA
-:104C10001858043003F0B0FF002803D043683B610C
-:104C200001355BE732681549D208B8E7039B002BD2
-:104C300002D0134808F08EFD019B9B0700D451E77A
-:104C4000039820F0C4FD38604CE7ED43059BED1858
-:104C5000AD00651968690AF0EBFD6861300047E74F
-:104C6000FDFFFF3F7407030050AC020004A00200E8
-:104C7000DC070300AD070300FD0703002F08030056
-:104C80005F0803000048704716FCFFFF00487047AC
-:104C900016FCFFFF82B007B591B204920593052977
-:104CA00009D01B2902D104A810F0C2FD002003B0D6
-:104CB00008BC02B0184704AB5B88032BF6D106A9E9
-:104CC0000822684624F048F80349049A059B0868BE
-:104CD00011F026FFEAE7C046602900200022044BBD
-:104CE0005A60044A08321A60034A13607047C0468B
-:104CF0000C2A002060990200A02B0020F8B5214E5C
-:104D00003568696801292DD9AA684B1ED05C0A282C
-:104D100028D1002B01DC1C0009E0581E145C0A2C71
-:104D2000F9D00300F5E7105D202802D10134A1423B
-:104D3000F9D8002B0BDD601C814208D1581E0028D9
-:104D400005D00138175C0A2F0CD0202FF7D052184D
-:104D5000023AE31A14789B083A3C624254411C1907
-:104D6000002C00D1F8BD084F04223900280022F0A1
-:104D700092F90421380004F0EDFC3369013C04335E
-:104D80003361EDE7142A00209B6F030010B5202249
-:104D90000021024823F0FCFF10BDC046DC2E00209D
-:104DA000084B10B5426818600020986018750138EB
-:104DB000D86008005A601A6199611EF061FCFFF723
-:104DC0009DFF10BD142A0020F8B503780400002BC5
-:104DD0001ED0104D286E002804D0210024F022F8A7
-:104DE000002815D0200024F027F8471C380021F0B7
-:104DF00051FA061E0CD03A00210023F0ADFF2A0024
-:104E0000054B5C321968043B99609342FAD12E66D7
-:104E1000F8BDC0467C2E0020F42E0020F0B5B84C22
-:104E200002002068A568436885B00193002D00D07A
-:104E3000FDE0531E042B11D8636801998B4200D109
-:104E400095E0012A00D12AE1022A07D1236962688C
-:104E5000934200D94FE10122524288E0032A00D157
-:104E600085E0042A00D12FE1052A00D107E1062AB6
-:104E70000ED12369019A9342AD416D42002DEADDC6
-:104E80002368290098682369C01804F063FC1FE0B8
-:104E90000B2A21D1019B2269991A22F0BCF92368BF
-:104EA000019A5B68934204D213002269981A04F0B5
-:104EB00087FC2268236951689068C91AC01804F0F9
-:104EC00049FC236858682369C01A401B04F066FC3B
-:104ED00023695D192561BEE70E2A13D1E368002B13
-:104EE000B9DB013BE3606268019B991A22F093F9F8
-:104EF000E368002B18DB1633824A9B00D3189968AD
-:104F000020680FE0102A16D1E368062BA3DC5D1C95
-:104F10007C4A17339B00D318996800299BD063689B
-:104F2000E560436022F03CF963682269D61A226882
-:104F30005568ED1A0AE0152A0CD123696268616888
-:104F40009A1A22F070F9236962689E1A0127002ECE
-:104F50002FDCA4E70D2A0DD16B481EF091FB2068D1
-:104F600022F003F96368C018FFF72EFF002210003B
-:104F700005B0F0BD01231B2A62D0082A01D07F2A88
-:104F800020D121696268914200D864E700238668D5
-:104F9000B618F75C202F13D101339F18B942F8D807
-:104FA0000426032B00DC033E891B320022F03BF970
-:104FB0000127300004F0F2FB23699E1B266178E094
-:104FC0000126F1E7092A28D1636822698068D11A8D
-:104FD000C0184E4A03AB02F025FB061E00D13AE78B
-:104FE0000027431C0BD1A0691EF04AFB63682269AD
-:104FF000D11A22689068C01804F0ACFB4FE723690F
-:105000002068F918039B01375A1C03921A7822F082
-:10501000F0F8BE42F3D1350041E71300203B5E2B90
-:1050200000D918E7216922F0EDF8012537E7012DB5
-:1050300008D104234F2A03D002235B2A00D0002387
-:10504000A36008E7022D20D11300303B092B03D8C1
-:1050500003232275A360FEE60023A360412A00D14A
-:1050600052E7422A00D139E7432A00D101E7442A16
-:1050700000D1EBE6482A12D0462A00D0EBE6002702
-:10508000019B22693E009D1A0EE00021032D29D1CB
-:105090007E2A24D1237D312B01D0372B0DD1002541
-:1050A0002F00236962689E1A0023A3609E4200DDE0
-:1050B0007FE7002F00D1E1E6F1E61A00FB25343A44
-:1050C0002A42DCD0332B0AD12169019B994206D2B6
-:1050D000012222F0A8F8002501272E00E4E7002590
-:1050E0002F00FAE7042D04D1462AC8D0482AD6D08A
-:1050F000A5E7A160AFE6002501262F0059E7C046CD
-:10510000142A00207C2E00209C3F030044E802006B
-:10511000044B88600B60044B08004B600023CB609D
-:105120007047C0462C980200FD2B020013B5040006
-:10513000080001A9FBF746FF002C03D0012C07D083
-:10514000002004E0019B0548002B00D1044816BD57
-:1051500001991EF0AFF840002043F8E78CE7020009
-:1051600084E70200F0B585B00400080003A915002B
-:10517000FBF728FF0600002D07D10300039A2F49F3
-:10518000200021F02BFE05B0F0BD039B0200C318E8
-:10519000002101200193019B934206D82727002973
-:1051A00000D0053F3A0026491AE01378272B08D093
-:1051B000223B5D426B41DBB20132002BEBD0272753
-:1051C000F0E700230100F7E730001EF040F805008B
-:1051D00030001EF057F80600AF4205D13A001949D9
-:1051E000200021F0FBFD14E017495C2D0ED02B00B0
-:1051F000203B5E2B01D82A00D5E714490A2D05D0A3
-:1052000013490D2D02D0092D0CD11249200021F097
-:1052100024FD019BB342D7D83A000949200021F070
-:10522000DDFDB0E7FF2D02D82A000B49D8E70B4B74
-:105230002A000B499D42D3D90A49D1E7C300030094
-:105240004200030041000300450003004800030042
-:105250004B0003004E00030051000300FFFF00005D
-:10526000C8080300CF080300F7B51E0008AB1D787F
-:10527000294B0C001700984206D12B003200390050
-:10528000FDF7D4FC2018FEBDF30715D57610019666
-:10529000019BE219002B2ADA00213F260127501E2C
-:1052A000A04219D2002900D001932000002DEAD19C
-:1052B0001A491B481FF0A2FB01A93000FDF71CFC96
-:1052C0000028E5D130001DF096F916490200164875
-:1052D00003F0E8F807F002FA0278B243802A01D01E
-:1052E00039000133421E002BCDD01000D8E720003A
-:1052F000012600243F27904204D3002C00D00193C4
-:105300001000D3E7013BBED3340001300178B9432C
-:105310008029F0D10130F9E760920200AE08030065
-:1053200044A902008608030050AC0200F0B587B023
-:1053300004000E001700FDF7B9FA02A905002000CD
-:10534000FBF740FE0400042F4ED1B30734D1274BA6
-:1053500032689A4230D105AB04AA03A930001DF08F
-:1053600082FE059B224FBB4204D0032B02D0214872
-:1053700008F01EFA039B2600BB4207D00122210041
-:1053800000922800029AFFF76FFF0600029A049B22
-:10539000A118BB4206D00121280000912100FFF78F
-:1053A00063FF01000E208E4204D88A1B28003100C2
-:1053B0001CF0DAFF07B0F0BD0023029A0093210031
-:1053C00033002800FFF750FF0278012153B2002B71
-:1053D00006DA4023012101E001315B081342FBD1D1
-:1053E0000122FBF7B5FDE5E70020E3E7A8A40200F2
-:1053F000A4B3020066FC020010B504000C2020F0EB
-:105400003CFF034B4460036001235B42836010BD9B
-:10541000C89A020001220020074B08495A60086020
-:10542000A821DA60064AC9005A5006495A50043188
-:105430005A5005495A50704700A000400CAC00403B
-:10544000FCFF0000440500004C050000034B04482D
-:105450001B78002B00D103487047C046CD2D00209B
-:105460008CE7020084E70200F8B5A826324A334BE5
-:10547000F600196813680420CB18C9181160304A67
-:105480008C4612781B11170009112E4A2E4C2F4DF5
-:10549000002F48D0002B3ADA9051C31AA920C0003F
-:1054A000135081239B00002937DA591A13515151A7
-:1054B0000123274CD3602378002B22D03F2225489C
-:1054C000254B01688C331B6801310A409D5C1C4BE5
-:1054D0001B78002B01D0803D6D001C2302606246CA
-:1054E0006B4308339B1A154A9B1013601F23194006
-:1054F00007D11A4B1A78002A03D01948197009F0FD
-:1055000069FA01232278042053402370F8BDA927AB
-:105510000433FF00D0519351C3E7535181239B00C3
-:10552000C9181151C4E7043390515351A920812364
-:10553000C0009B001350F3E7302A0020402A0020CF
-:10554000D800002000A000404C05000044050000E9
-:10555000CC2D0020342A00207C2E0020D9000020F1
-:10556000BB2C020030B585B001220400080001A95F
-:10557000FDF73EFC029A202A00D920220023019D3B
-:10558000934204D0E85CE11808710133F8E7014860
-:1055900005B030BDA4B3020070B5040008001500CA
-:1055A000FDF76CFA1F2802D90C4807F00FFF002DF9
-:1055B00002D10B4808F0CEF82418042D04D10120A4
-:1055C00023795B00184370BD2800FDF757FAFF28C8
-:1055D00001D90448E9E720710348F4E7080903000A
-:1055E0001C09030039FC0200A4B302000123A0221D
-:1055F000834010B5134CD20513510300C133124C34
-:10560000FF339B009C50114B8900C918A223DB007B
-:10561000CA580F4C00022240CA50F82252011040D2
-:10562000C022CC589202224310430322C850CC58C7
-:10563000084822432043C850C046C046C046CA500E
-:1056400010BDC0460C0500000303000000600040D0
-:10565000FFE0ECFF031F0000A0221E21114BD2002F
-:1056600070B59C58104D8C439C50A324E4001D51F0
-:105670000E4C0F4D0F4E5C5104355E510E4D8000A7
-:105680005C51A5240D4DE4001D51084C0C4D001932
-:105690000C4C185104341D510B4C185198580143AF
-:1056A000995070BD00F0014040A1004000600040F2
-:1056B0001C05000044A100402405000048A1004052
-:1056C0004CA100402C0500003405000010B504007A
-:1056D0000A4903F0F5FB0A4BA0211C600123607905
-:1056E000084A8340C9058B500021FFF77FFF002047
-:1056F000FFF7B2FF0022044B1A7010BDD8B10200B0
-:10570000382A00200C050000D800002070B50D00DC
-:105710000400134E2800310003F0D2FB31002000BA
-:1057200003F0CEFB0F4BA0221C600F4BD2051D6077
-:10573000607901242100814026000C4BD150697909
-:105740008E400021D650FFF751FF68792100FFF706
-:105750004DFF2000FFF780FF054B1C7070BDC04659
-:10576000D8B10200382A00203C2A00200C05000095
-:10577000D8000020F8B50025FFF74CFE214B28008B
-:1057800090331D6009F0F4F8A0221E201E4B1F4923
-:105790001D701F4BD2001D601E4B1F4C1D608B588F
-:1057A0001E4F83438B50A223DB00E2581C4E3A402D
-:1057B000E250E2581B493243E2500122E5501A4BB5
-:1057C000186843799A401300A022D205535003F081
-:1057D00061FB164B1B78AB4213D0154B1149E258B5
-:1057E0001740E750E25816430122E650E550114BAE
-:1057F000186843799A401300A022D205535003F051
-:1058000049FBF8BD7C2E0020CD2D002000F001408A
-:10581000302A0020402A002000600040FFE0ECFF1A
-:10582000001F03000C050000382A0020D8000020CB
-:10583000140500003C2A0020F0B53E4E8DB0330028
-:1058400090331B680500002B03D1FFF793FF0DB0C9
-:10585000F0BD002801D008F097FA684606F018FF5E
-:10586000002822D133009033186807F0B9F90400FA
-:1058700006F02CFF002D01D008F090FA2E4B2022CC
-:105880001D6833006D118C3301356D011B681540A7
-:105890005D19002C2DD1903621002800346023F0B2
-:1058A00077FA0122254B1A70D1E7002D01D008F0BC
-:1058B00075FA019B2249186806F00EFA00240500CB
-:1058C000A042DBD1019F3800FCF7F0FF1D4B98424E
-:1058D0000BD12900012000F0CDFE2A000400F86061
-:1058E0001F211948FBF734FBA060019B0024B3641F
-:1058F000C4E72000FCF7DAFF144B984209D03300CC
-:1059000000229033124913481A601DF06FFCB064F6
-:105910009DE763682B60A3686B60E368AB602369F5
-:10592000EB6063692B61A3696B61E369AB61236A17
-:10593000EB61B6E77C2E0020342A0020D90000203D
-:105940009CAB020034AA0200D6080300AC9B020004
-:10595000F608030050AC020010B5FFF70BFF01483A
-:1059600010BDC046A4B30200F0B589B00493734BD8
-:1059700003901B780E001500002B01D0FFF7FAFEF4
-:105980006F4C8C342368002B06D16D4A4020903236
-:10599000136020F072FC206080226A4BD200DA672C
-:1059A0000122694C694BE250FFF734FD0023684A3D
-:1059B000F021A3500432A3500832A350C22209039D
-:1059C0009200A150634F093AFF3AA3500594BE429A
-:1059D00000D0A3E0B54200D09DE05F4D07AC2800A9
-:1059E00003F062FA002805D001235C4928002370E7
-:1059F00003F066FA5A4D280003F056FA002805D045
-:105A0000012356492800637003F05AFA554D2800C7
-:105A100003F04AFA002805D0012350492800A3705A
-:105A200003F04EFA002307AA5F1C9B5C002B39D0C1
-:105A30004D4ABB00043BD458A02203213D006379AA
-:105A4000D205C133FF339B00995007ABEB5C002BB1
-:105A500026D00426444BAA00D3580193012263792F
-:105A6000A0219A40A123C905DB00CA50019B053340
-:105A7000180002931DF001F9012811D16379A021CA
-:105A800098403A4BC905C85002981DF0F6F8002816
-:105A900006D1013E002EE1D1019949E00225D4E76B
-:105AA000022DFBD10123022FBDD12B4801F0BEFCFA
-:105AB000FFF70CFE0021039807F058F80025012499
-:105AC0003F221F4B802190331860294B1D70294BBA
-:105AD0001C70294B1A601A4B12198C33186823F06A
-:105AE00057F92800FFF7A8FE244B144E1C60059BB5
-:105AF00050221C6022492800347008F005FF049BE6
-:105B0000AB4219D00E4B3278002A15D09A6C002A7D
-:105B100012D120BFF7E71B4807F01CFE300001F050
-:105B200085FC0400BD42C3D0280001F07FFC0100C9
-:105B30002000FFF7EBFDBDE709B0F0BDCD2D002043
-:105B40007C2E002004E100E000A00040FC0F0000DB
-:105B500004050000A4B302006CA20200A8B1020078
-:105B6000B4A20200C4A20200789B02000C0500004F
-:105B7000CC2D0020D9000020342A00200CAC00409D
-:105B8000695400004109030010B5084B86B002AC0F
-:105B90000093019404230CF0BFFB02982379E26880
-:105BA000A168FFF7E1FE024806B010BD849B020029
-:105BB000A4B30200014B1878C0B27047CD2D00206D
-:105BC00010B5242020F059FB0400044B202208C00B
-:105BD000802123F0DDF8200010BDC046AC9B020000
-:105BE000F8B5070008000D001600FCF75FFE304B0B
-:105BF00098425BD1781F0F2858D814F069F808082C
-:105C00003257575757575757575757303055FFF751
-:105C1000D7FF04230400EA5CE2540133242BFAD1B9
-:105C20003000FCF743FE224B98423FD10121052F63
-:105C300002D0122F00D002390422FF20B35CA55CF1
-:105C4000803B4B435B19FF2B03D90500DB179D43BA
-:105C50002B00A3540132242AF0D12000F8BD2C00DF
-:105C6000DEE7FFF7ADFF04230400EA5CE2540133F2
-:105C7000242BFAD13000FCF765FF0F211DF022F82C
-:105C80002100FF25221D24311378803B4343DB1381
-:105C90008033FF2B03D92E00DB179E433300137094
-:105CA00001329142F0D1D8E72C00E3E70024D4E799
-:105CB000AC9B0200F0B585B00C00FBF76BF903AAB2
-:105CC000070002A92000FCF77BFF029E039B350022
-:105CD0001035AD002800019320F0CFFA04002C22EB
-:105CE0001030002123F054F867602700104BE66362
-:105CF0002360104B019EA3600F4B403DE3600F4BB0
-:105D0000403763610E4B7519A3610E4BE3610E4B77
-:105D100023620E4B63620E4B6363AE4202D12000DE
-:105D200005B0F0BD01CEFBF735F901C7F5E7C04678
-:105D300018B80200555D0000B55D0000196600004E
-:105D4000B1660000795D0000B1670000A565000044
-:105D50000CA0020070B50C0005000B6805495A68DC
-:105D600021F03CF821682800403122000CF08CF929
-:105D700070BDC046843B0300136870B5002B10D182
-:105D80000568EE6BB34200D170BD9C002C19246CE9
-:105D9000A14201D00133F5E702339B001B58136089
-:105DA000F2E7024902481EF029FEC04663090300DB
-:105DB000A0A70200F0B51700C26B85B0CE19050090
-:105DC00001910393964206D033002549254802F0FD
-:105DD00069FB06F083FC0021300000F04BFC04005E
-:105DE000019B05609B001A0003990830029322F082
-:105DF000B3FF0298BA0008302018002122F0C8FF33
-:105E0000029A039B94466344F7191E00019BBB4210
-:105E100002D3200005B0F0BD3068FBF7BBF80021CD
-:105E20000200EB6B0293029B994204D10E490D488C
-:105E300002F038FBCDE78B00E818006C824201D0FD
-:105E40000131F0E7E3189968002901D00749EEE72E
-:105E5000726808369A60019B02330193D6E7C04608
-:105E60007407030050AC0200DC070300AD07030019
-:105E7000014B58687047C0467C2E0020014B1868C3
-:105E80007047C0467C2E0020F0B5194E87B03368AD
-:105E9000050000200C0001931FF099FC3060009079
-:105EA00020681EF060FD019B07003360114E022D3B
-:105EB00003D0A068FCF7FAFC0600210063680831F3
-:105EC000A81E039300F0D6FB009B049005930022CC
-:105ED00003AB0321300006F053FD074B04009F4243
-:105EE00003D0010038001FF061FB200007B0F0BDB7
-:105EF0007C2E002018B80200A4B302001FB569462A
-:105F000006F034FE0400200006F092FE002802D1C4
-:105F1000044804B010BDFCF7EFFE0028F3D102489E
-:105F2000F7E7C0468CE7020084E702001FB5694628
-:105F300006F01CFE0400200006F07AFE002802D1C4
-:105F4000044804B010BDFCF7D7FE0028F3D0024887
-:105F5000F7E7C04684E702008CE7020010B5FCF7C3
-:105F600029FD034B002800D1024B180010BDC0468C
-:105F70008CE7020084E7020037B5FCF77FFD01AB38
-:105F80007F2806D80121187001221800FAF7E0FFD7
-:105F90003EBD1E49820988420BD8402149420A432E
-:105FA0001A703F2202408020404210435870423114
-:105FB000EAE7174C010BA0420ED82024644221438B
-:105FC000197080215F344942224020400A43014336
-:105FD00099705A700321D7E70E4CA04212D81024B2
-:105FE000850C64422C431C703F2580242940644268
-:105FF0002A40284021432243204359709A70D87088
-:106000000421C1E7044807F0E1F9C046FF0700009A
-:10601000FFFF0000FFFF100077090300F0B589B013
-:10602000019204000D0000222F490198029302F012
-:10603000A3FD0090002801D043680093012C16D0E6
-:10604000A4002B19002427000193019B9D4224D01A
-:10605000009B2E68002B04D0310018001EF08AFC33
-:106060000600002C37D137002C680435EDE70024FA
-:1060700004A9286806F07AFD27000390039806F02B
-:10608000D7FD051E0CD1002C07D12200174901981D
-:1060900002F072FD00281BD04468200009B0F0BD5A
-:1060A000009B2E00002B04D0290018001EF062FC7B
-:1060B0000600002C09D03A003100029807F08EF952
-:1060C0000B4B984201D025003E002C003700D5E74D
-:1060D000084807F07BF93A003100029807F07EF992
-:1060E000034B9842C1D1BEE7561300002E110000A9
-:1060F0008CE702009809030037B501A90500FBF7FA
-:106100007FFB1E4B04002B40062B05D0AB072AD18A
-:106110001B4B2A689A4226D1019920001DF0CAF82B
-:106120000190012822D1207843B2002B04DB01200A
-:1061300023785B0018433EBD7F23013418403F3B6A
-:10614000034208D13F22237819009143802905D0CA
-:106150001FF09AFAEFE798435B10F1E780011340D4
-:1061600001341843EFE7019B012BE0D0019A054968
-:10617000054802F097F906F0B1FAC046070080FF23
-:10618000CC990200B109030050AC0200F0B5140034
-:1061900087B00290039100222349200002F0ECFC1A
-:1061A000002205002149200002F0E6FC0123040042
-:1061B000049305931E4F002D07D068681D4B98422D
-:1061C00003D004A9FBF71CFB07001B4E002C07D0D3
-:1061D0006068184B984203D005A9FBF711FB060035
-:1061E0000024029B154D9C420AD10023059A01937D
-:1061F0000093310028000EF0BBFD0E4807B0F0BD43
-:10620000002C07D00023049A019300933900280042
-:106210000EF0AEFD0399A3000022C9582800FCF738
-:106220005DFB0134DDE7C0468E15000096110000CD
-:106230009E6F0300A4B30200254F030044E8020050
-:1062400010B5040086B06A4602A810210FF0D8FDF0
-:10625000012221006846FCF741FB02A90248FAF737
-:1062600041FE06B010BDC046CC99020070B50C6866
-:10627000E30726D4A30703D1174B22689A4220D004
-:10628000012820D94868FCF7F9FB06002000FCF73C
-:1062900059FC051C300014F0B5FE011C0F4817F026
-:1062A00071FB011C041C281C14F080FB16F0DAFFA3
-:1062B000211C14F0A3F9032302249843084B044340
-:1062C000E418200070BD2000FCF73CFC16F0CAFF6B
-:1062D00006F056F80400F4E7ECB802000000204194
-:1062E0000000808030B50B0085B01400012802D971
-:1062F000094807F02FFA09480121C2680192019D5F
-:106300000022A8472200039003A901200DF0C4FF3A
-:10631000039805B030BDC046050A030048E70200F7
-:1063200013B504000800FAF735FE6A4601002000A4
-:1063300006F09EFB009B0248002B00D1014816BDD1
-:106340008CE7020084E7020037B50024022800D958
-:106350008C6848680D68FAF71DFE0A4B0100002C96
-:1063600000D0094B6A4628009847009B002B07D0B5
-:1063700001991C00002903D01800FCF703FF04005A
-:1063800020003EBDD5CA000071CA000070B50400EF
-:1063900008001500FAF7FEFD2A000100200006F0B3
-:1063A000C1FB014870BDC046A4B30200F8B5032686
-:1063B000050007003540022D16D10E4B0340062B79
-:1063C00012D0FF23DB05C418B443201C002113F0B6
-:1063D00059FE002806D080231B06E418B443064B60
-:1063E0002C43E7183800F8BD380009F069FA0700B7
-:1063F000F8E7C046070080FF000080807FB50B00F3
-:10640000012803D100211868FCF782FA102102A8A4
-:1064100020F05DFE0C4902A81CF0E6FB032804D125
-:106420000A481CF0D6FE06F059F9039B0193002B95
-:1064300003D1042801D10648F3E702A90548FAF779
-:1064400051FD07B000BDC046FB820300BCA902009D
-:1064500018A80200CC99020010B506F0C1FB002874
-:1064600004D103481CF0B5FE06F038F910BDC04653
-:106470009CAB020010B5022803D0054905481EF068
-:10648000BDFA4A680B20096806F0A8FF10BDC04697
-:10649000EB090300ACAA02007FB50D4D0400A84231
-:1064A00013D00C4E012201003000FCF717FA0A4904
-:1064B000300020F0D2FB04230293084B0394DB69E5
-:1064C00002AA0321064801939847280004B070BD32
-:1064D000A4B3020044E80200254F030058B10200B3
-:1064E0001C9D0200F8B50E0000280FD10400284BB7
-:1064F0001D680021080020F097FA00270600BD4221
-:1065000032D10025AC423ED13000F8BD0868830787
-:1065100014D103681F4A93420DD11CF06BFF050094
-:106520003068FCF7C3F91C4BC26800249A42E0D1E2
-:1065300034680434DDE7194A934201D0FCF7B6F918
-:10654000856B002DECD0164B2A689A42E8D00025C6
-:10655000E6E7EA68FB009958002904D0042902D034
-:1065600030000DF039FE0137AB68BB42F1D8C8E707
-:10657000A268EB009958002904D0042902D0300009
-:106580000DF02AFE01356368AB42F1D8BCE7C04686
-:106590007C2E002058B102007DB6000018B8020021
-:1065A00034C20200044B88600B60044B08004B604F
-:1065B0000023CB607047C0462C980200AF2D02002C
-:1065C00070B50E0010490400002520F046FB7368EA
-:1065D000AB420AD8012B03D10C49200020F03DFB2F
-:1065E0000B49200020F039FB70BD002D03D0094974
-:1065F000200020F032FBAB00F31801229968200044
-:10660000FCF76CF90135E2E7A20D0300300A030044
-:106610006002030005FC020070B50D0001281ED0C9
-:10662000002803D0022807D0002004E04B680E4861
-:10663000002B00D10D4870BD00260D4C6B689E42AA
-:1066400003D3012064002043F5E7B300EB189968F9
-:10665000022006F023F9401024180136EEE74B68BB
-:106660005B001843E7E7C0468CE7020084E70200BE
-:1066700004A0020070B506000D000B48002E0DD0DE
-:10668000B41CA40020001FF0F8FD084B4660036016
-:10669000002D03D00023083CA34200D170BDE9586F
-:1066A000C21891600433F7E704A002000CA00200B6
-:1066B000F0B5070085B00E0014001D2803D9002591
-:1066C000280005B0F0BD01238340324D1D4044D168
-:1066D000314A13421FD1F82292051342EFD0200015
-:1066E000FCF7E4F82D4B426A9A4205D020002C4971
-:1066F0001EF0DCF8041E0CD0230031006268083361
-:1067000000920831726838000BF02AF9254D0028F4
-:10671000D6D1254DD4E72000FCF7C8F8204905F074
-:10672000DBFA0028CBD07368626829009818FFF75D
-:10673000A1FF07003100736808379A00050008318F
-:10674000380022F009FB2100706863688000381867
-:106750009A00083122F000FBB2E703A91000FCF711
-:10676000CBF90025A842ABD00398104D0028A7DD37
-:10677000736800215843FFF77DFF05002B003000B0
-:10678000083300930830039B726804211FF015FA48
-:1067900096E7C0468000100020000400A5650000B8
-:1067A0000CA002008CE7020084E7020004A00200B3
-:1067B00030B5040085B0042A2DD1032540680D4072
-:1067C0001FD1164B0A689A421BD101AA0BF04CF854
-:1067D000002802D1124806F0EBFF019B0298290025
-:1067E000C01AFFF747FF050021006B6808319A00C7
-:1067F000019B08309C00091922F0AEFA280005B070
-:1068000030BD0A00002301002068FCF70FFA0230B7
-:1068100080000559F2E70025F0E7C046A8A4020071
-:1068200066FC0200F0B50C001100002285B01E00CD
-:106830000092012320000BF03FFD184D002C1ED0CC
-:106840003568AB0703D1164B2A689A4217D010203F
-:106850001FF013FD00210400306806F087F90025C1
-:1068600004260390039806F0E3F9071E0AD12800D6
-:106870002100FFF7FFFE050020001FF02DFD28007E
-:1068800005B0F0BDAE4205D8F10020001FF013FDA9
-:1068900004007600AB001F510135E3E704A00200BD
-:1068A0000CA002000022104B10491A6003001233A2
-:1068B000FF3341185A701A7004338B42FAD1010029
-:1068C0000300002209310833FF311A709A705A70A0
-:1068D000DA7004338B42F8D1C3237F229B00C25469
-:1068E000034B044A1A607047442A00201103000039
-:1068F00004000020320A0300F0B500267E24320096
-:1069000031009300C318FF335F7C7F2F4CD09B7CFA
-:10691000F618F6B2531CDBB2EF2E2AD9C1267D251C
-:10692000B60086193700AC469C4516DA9B00C318A2
-:10693000FF3359749974D97419757D230232D2B218
-:10694000934211DA9300C318FF335C749974D974BD
-:10695000197500260132D2B2D3E73D68043FBD600D
-:1069600001256D42AC44DFE73568013B7560043EAC
-:10697000E6E77D2FEED80D4DEF5D01252F42E9D0E2
-:10698000C1227D26920082189E4208DA9A0082185F
-:10699000FF3254749174D17411751A00D9E71568D7
-:1069A000013E5560043AEFE7F0BDC046150B030009
-:1069B00070B5002140250D4C8B00C318FF335A7C65
-:1069C0007F2A11D0A25C0131C9B22A42F4D05A7D8B
-:1069D0007F2AF1D0A25C7F2AEED9DA7D56B2002E52
-:1069E000EADD0132DA74E7E770BDC046C40A03008D
-:1069F0000300F7B500214B4A1333FF338218197097
-:106A000004339A42FBD1FC2300249C462200844498
-:106A100053B2002B04DA444B444A1A60002008E0C9
-:106A200063461F69BC4205D37F234432920013544E
-:106A30000120FEBDDE68355D602D01D9203DEDB23F
-:106A4000611CC9B28F4251D0735C602B01D9203BCD
-:106A5000DBB2232D4DD1303B092B02D9324B344AC6
-:106A6000DBE70234E1B28F4204D8FF2BF6D8437043
-:106A70000C00CDE7745C2500303D092DF5D80A25C2
-:106A80006B430131303BE318C9B2ECE70136512EBC
-:106A900030D10023274C1F5DDEB22A2F0CD1264FA8
-:106AA000FF5CAF4208D19300C318FF335E74447893
-:106AB00001321C75D2B2DBE70133512BEBD11F4CF5
-:106AC000493B08342678AE4208D0013C002B02D165
-:106AD000154B1B4AA1E7013BDBB2F3E7002BF7D0D4
-:106AE00014004334A4000419A370C1E7232DB5D0CA
-:106AF00000230026F7B201970F4FF75DAF42C5D1D3
-:106B00000C4FF75D2A2FC1D09F42BFD1930001994E
-:106B1000C318FF3359744178013202341975D2B267
-:106B2000E1B2A5E71203000004000020350A0300CB
-:106B3000470A0300540C0300030C0300A50C0300D8
-:106B4000550A030010B51130084A0949FF3003788F
-:106B50007F2B00D110BD02240457002C03DCCB5C3A
-:106B600043700430F3E7D35CFAE7C046B30B03008D
-:106B7000630B0300F0B50023070085B09E00BE192B
-:106B80003100FF314A7C9C467F2A01D105B0F0BD1F
-:106B90004F4B02209C5C63460133DBB20442EDD0D4
-:106BA000012560462C4242D15419E0B20090494878
-:106BB0007C35801840780190C87C097D0290039153
-:106BC000C1218900791808009D4226DA9B000098AF
-:106BD000FB18FF3358740198941C98740298E4B21F
-:106BE000D874039818753B48634682183000FF300C
-:106BF0009578027D023300927D22C67CDBB29A42F8
-:106C000010DA9B00FB18FF335C749D74DE74009AED
-:106C10001A7563460333DBB2B0E70468013D446094
-:106C20000438D1E70868013A48600439E7E70130E1
-:106C3000C0B2010044318900C95D0029F7D07F2925
-:106C400008D008242248405C204297D124390129E9
-:106C500000D893E73000511CC9B200911D49FF30A4
-:106C6000891849787D250191C17C0291017D0391AC
-:106C7000C121890079180C009D421FDA9B00009CFD
-:106C8000FB18FF335C74019C124D9C74029CDC74F5
-:106C9000039C1C75941CAA1863469678027D0233E7
-:106CA00000927D22C57CDBB2E4B29A420BDA9B00F3
-:106CB000FB18FF335C749E74DD74A8E72668013D01
-:106CC0006660043CD8E70868013A48600439ECE79C
-:106CD000C40A0300630B0300F7B500229300C31836
-:106CE000FF335C7C002C03D10132D1B20A00F5E7FE
-:106CF0007F2C00D126E1102693490D5D511CC9B2AD
-:106D0000354227D0DC7CAD06ED0FA4462C00C12512
-:106D10001434AD001F7D019445196D368E4214DA8E
-:106D20008D00019C4519FF356C740024AC746446D9
-:106D30002F75EC745C7C352C00D0C5E05A7B834CFD
-:106D4000A25C5207D2D5102285E02C68013E6C600F
-:106D5000043DE3E74E2C1CD118220D24DD7C5C742D
-:106D60001E7DC1239B00C31870348C420CDA8B004B
-:106D7000C318FF335A740022DD749A741E75B5E788
-:106D80001B22EAE71C22E8E71F68013C5F60043B26
-:106D9000EBE74F2CF4D0502CF4D06DB2002D2BDA51
-:106DA000DD7C002D28D00D004435AD002D5C002D7C
-:106DB00022D1961CF5B20195AD004519FF356F7CC7
-:106DC0007F2F19D0604EF75D7F2F15D9EF7C002FF4
-:106DD00012D0C1237D229B00C318019C944206DD82
-:106DE0001F236B740023AB74EB742B757EE71C6858
-:106DF000013A5C60043BF0E7172C2ED15C7B013A32
-:106E0000D2B2452C1DD11B3C5C7315004335AD003F
-:106E10004D4C2D5C655D7F2D00D867E70132D2B205
-:106E200092008218FF32557C002D00D180E0645D15
-:106E30007F2C00D85AE7D27C002A00D056E71E32B9
-:106E400009E0392C01D10D3CDEE73F4A125D7F2A73
-:106E500000D84BE712225A7448E7182C07D15A7B06
-:106E6000394CA25C7F2A00D840E71322F3E7202C9C
-:106E700005D15A7B3C2A00D038E7163AEBE7482C7C
-:106E800015D15C7D7F2C02D14B245C7403E02E4D28
-:106E90002C5DA406F8D55C7C2B4D2D5DED0700D450
-:106EA00048E75D7B202D3CD10C3C5C741EE73C2CFC
-:106EB000F1D15A7D7F2A00D118E7234CA25C9206BB
-:106EC00000D513E73F22C6E72A2C16D1DA7C1C7DB9
-:106ED000C1237D259B00C3188D4209DA2B258B0029
-:106EE000C318FF335D740025DA749D741C75FDE6CC
-:106EF0001E68013D5E60043BEEE72C2C11D1DA7C6C
-:106F00001C7DC1237D259B00C3188D4204DA8B00B4
-:106F1000C318FF332D25E5E71E68013D5E60043B85
-:106F2000F3E7452C00D170E7392C00D0DEE66CE7A2
-:106F3000527D7F2A00D1D9E6A25C7F2A00D8D5E60F
-:106F40001E2288E7F7BDC046C40A0300150B0300E4
-:106F5000F0B50022060085B0130044339B009B5D12
-:106F60007F2B31D05B4CE35CDB072AD51300511E2D
-:106F7000C9B244318900584F7118013BDBB2002B74
-:106F800023D008787F2803D0385C04397F28F4D9CF
-:106F900099007118FF31487C7F280ED02027255C8E
-:106FA0003D4204D04C4D285C0425284205D0887C05
-:106FB0004508AC460130604488740133DBB293422B
-:106FC000E6D10132D2B2C7E70023022712E06B07F5
-:106FD00008D4EB070DD56246FF32937CD9085B1AC3
-:106FE000937406E0039B039A9B7B99080133CB18AB
-:106FF0009373029B9A00B2181100FF3194464A7CA9
-:107000007F2A64D034485D1C845CEDB2029565B281
-:10701000002D21DA029A9200B218FF320392527CBC
-:107020000192855C019C2A0041257F2C00D015002F
-:1070300040242242CBD1019C123C012CD9D84022C1
-:107040000233DBB244339B009B5DC35C1342D0D060
-:107050008B7C013B8B74CCE71E4DAA5C08252A4231
-:107060000ED0029B9B00F318FF335A7C7F2AC0D0BE
-:10707000825C3A42BDD006229A7405229A73B8E720
-:107080003C421AD00133DBB21A0044329200925DC6
-:10709000002AF7D07F2AACD00F498A5C3A42A8D0A8
-:1070A0009B00F318FF339A7C520801329A746246AF
-:1070B000FF32937C5B08013392E710231A4298D089
-:1070C0004B7BC35C3B4294D08B7C023BC2E705B058
-:1070D000F0BDC046150B0300C40A030070B50400E0
-:1070E000FFF7E0FB2000FFF783FC23000022FC33C6
-:1070F000DA601A61904226D02500224E113533689D
-:10710000FF35934203D029001F4806F079FB200089
-:10711000FFF7E2FD2000FFF74BFC2000FFF712FD18
-:107120002000FFF715FF2000FFF724FDC4222B00ED
-:107130009200A1181A78502A06D97F2A07D0002079
-:10714000124B134A1A6070BD04338B42F2D133687C
-:10715000002B02D00F4819F061FC2000FFF7CCFB98
-:107160003368002B03D029000B4806F049FB2000B0
-:107170001BF04AFE054B0949186821F053FE4342B3
-:107180005841E0E7582A00206C0A03000400002060
-:107190007B0A0300A10A0300B10A0300320A0300BC
-:1071A00070B504000800FBF769FC0500431002D02D
-:1071B0000F4806F00BF90F49200001F081FE00286E
-:1071C00007D0A02203216379D205C133FF339B008E
-:1071D0009950012362799340A022D205002D04D05A
-:1071E000A121C9000448535070BD0449FAE7C046C4
-:1071F000FB0C0300B8B10200A4B302000C050000B0
-:1072000070B505000800FBF739FC0B2303410400AF
-:10721000DB0702D4094806F0D9F82800084901F034
-:107220004FFEFF22A40092001440A0226B79D205E9
-:10723000C133FF339B0003489C5070BDCD0C03004D
-:10724000B0B10200A4B3020010B50C49040001F073
-:1072500037FEA022D205002805D004216379C1336E
-:10726000FF339B00D150A223DB00D0586379D84074
-:10727000012318401EF008FA10BDC046B0B102004C
-:1072800010B5040001F0E8FD0A4B984205D00A4B06
-:10729000984202D0200001F0EDFDA0226379D205D2
-:1072A000C133FF339B0098580007800F1EF0ECF9A4
-:1072B00010BDC046B0B10200C8B10200032370B5D2
-:1072C0000B4004000800022B14D1194B0B40062B75
-:1072D00010D0FBF737FC15F06FFC0022154B13F0B4
-:1072E0001BFF15F0F9FB144B0500984205D9134814
-:1072F00006F06CF8FBF7C2FBF5E71149200001F03E
-:10730000DFFD002807D0A02203216379D205C13315
-:10731000FF339B0099506079290006F0B5FB002DE2
-:1073200003D10849200001F0CBFD074870BDC046DD
-:10733000070080FF0000E03FFF030000DA0C0300BD
-:10734000F8B10200A8B10200A4B3020013B50A49C3
-:10735000040001F0B5FD05216846615611F068FD95
-:10736000684611F08BFDA0230021044ADB00D150B8
-:107370001EF08AF916BDC046A8B102000070004098
-:1073800010B50800FBF77AFBFA239B00584306F080
-:1073900057FB002802D0024806F018F8014810BD3B
-:1073A000BE0C0300A4B3020010B50800FBF766FB97
-:1073B00006F046FB002802D0024806F007F8024813
-:1073C00010BDC046BE0C0300A4B3020010B50400FB
-:1073D00001F042FD0C4988420DD00C4B98420AD076
-:1073E000200001F06DFDA02200216379D205C13398
-:1073F000FF339B009950200007F0BCF9044B002894
-:1074000000D0044B180010BDE0B10200C8B102006A
-:107410008CE7020084E70200A0230C220249DB056E
-:107420005A5024315A5070474407000010B50400E8
-:10743000FBF73CFA064B984208D0064B984205D021
-:10744000054B984202D0054806F084F9200010BD93
-:107450003CA30200F4A1020030A20200AE0C030023
-:10746000F0B50D00002785B0110003901E00280024
-:10747000104B022200970AF01FFFAB1C9B00180064
-:1074800002931EF0FAFE0400039B013D0360456079
-:107490003368029D8360083D0437BD4202D120005D
-:1074A00005B0F0BD0021F05905F060FBE3199860CC
-:1074B000F2E7C046FFFF0000F7B503780400002B99
-:1074C0001FD0402B20D101230193002304221E0052
-:1074D0001D00190094462278002A3ED1013200296D
-:1074E00010DC002D0EDC002E0CDC033B934209D98E
-:1074F000013C23785C2B05D00199002901D00A2B8F
-:1075000000D100221000FEBD3F491BF0DEFC002828
-:10751000D9D13E4920001BF0D8FC0028D3D13C49EA
-:1075200020001BF0D2FC0028CDD13A4920001BF0EE
-:10753000CCFC0028C7D1384920001BF0C6FC00282D
-:10754000C1D1364920001BF0C0FC0028BBD1344912
-:1075500020001BF0BAFC0190B7E76778272A11D109
-:10756000002B4DD0032B09D1272F05D1A278272A34
-:1075700004D10234243AD31A0134ACE7012BFBD8EE
-:107580000122F8E7222A11D11A006046824309D16C
-:10759000222F05D1A278222A02D102346246EAE7DC
-:1075A000002B01D0022BE7D10222E4E75C2A0AD1AA
-:1075B000272F03D0222F01D05C2F04D11A00571E91
-:1075C000BA41A418D8E7002BD6D15B2A12D006D82E
-:1075D000282A0DD0293A57425741C91BCCE77B2AAC
-:1075E0000AD07D2A0AD05D3A57425741ED1BC3E7C6
-:1075F0000131C1E70135BFE70136BDE7013EBBE719
-:10760000272FBDD1B2E7C046476B03001C0D030016
-:10761000220D0300260D030032640300548703008B
-:1076200041390300F0B58BB00793431803900492DF
-:1076300001930093009B5C1E039BA34201D900931E
-:1076400010E0207801F008F8002801D00094F1E75C
-:10765000207801F00DF80028F8D123785F2BF5D0C1
-:107660002E2BF3D07D4B1D68009C019B9C4202D2C7
-:1076700023782E2B21D1009BE71A019B9C4241D3FA
-:107680000024260002940194AB68A34256D8019BC3
-:10769000002B00D084E0009B039A93422FD1704CC2
-:1076A0003A002100180021F048FB002827D1079B51
-:1076B000E41907301C60C01B22E00134D5E7013615
-:1076C000AB68B3421BD9F3000293EB68F200985801
-:1076D0000028F4D00428F2D009A9FAF791F8099B00
-:1076E0000100BB42EBD13A00009821F0ACFB00282E
-:1076F000E5D1EB68029A9B185868002804D1002055
-:107700000BB0F0BD0026DBE7032318420CD1036861
-:10771000544A934205D11BF06DFE0500631C009393
-:10772000A2E7514A934201D0FBF7C0F8856B002DC8
-:10773000E5D04E4B2A689A42F0D0E0E7EA68E300D1
-:10774000985800281CD004281AD009A9FAF758F82C
-:10775000099B06900593BB4212D301003A000098A2
-:1077600021F071FB00280BD1029B002B12D03B00B3
-:107770009E4202D3059A9A4204D2019B013301939F
-:10778000013481E7029AD15C069AD25C914205D11C
-:107790000133EDE7069B059E0293EEE71E00ECE742
-:1077A000019B012B01D0BE4254D9029B079ADB19E1
-:1077B0001360F01BA4E7029BEA68DB0098580028DE
-:1077C0003AD0042838D009A9FAF71AF8099B03908F
-:1077D0000593BB4230D301003A00009821F033FBFF
-:1077E0000190002828D133000F220F33DC171440FA
-:1077F000E41824112401A41B012C00DC1034059A88
-:1078000033199B18402B0DD9039A194904981FF07E
-:10781000E5FA099E10E0174904981FF01EFA019B33
-:1078200001330193019B9C42F5DC039904981FF0FE
-:1078300014FA099BF6183619029B01330293AB68C0
-:10784000029A9342B7D80C4904981FF006FA012017
-:10785000404255E7002340260293F0E77C2E0020AB
-:10786000100D030058B1020018B8020034C2020023
-:10787000180D03009E6F0300254F030010B5040090
-:107880001FF073FC1AF0B1FF01280BD0064920004D
-:107890001FF086FC20001FF068FC1AF0A6FF0228EB
-:1078A00000D0002010BDC046660D0300F0B59DB0AD
-:1078B00000AF0C68032835D9CB68FB60042835D0AD
-:1078C0000D6900206D102BD41C232000F918F9F746
-:1078D00097FF7861002D5AD0954C9649606808F062
-:1078E0005DFB0600606800229349043001F044F912
-:1078F0001823FA18D11804003000F9F781FF3B6B08
-:10790000013D0100C318002C05D1994203D2013B6F
-:107910001A782E2AF9D1013D0ED299420FD187480B
-:1079200005F054FD864B0025FB60CDE70025CBE735
-:10793000013B1A782E2AEED09942F9D3EBE7FE6983
-:107940005C1A2500002E01D0751C2D192B006A46EB
-:107950000E33DB08DB00D31A9D46220018003B6182
-:1079600021F0FAF9002E08D02E233A69601C135535
-:1079700010187969320021F0EFF92900386909F00F
-:107980009BF806243B69C0000443FD617B61200035
-:10799000F9F700FB01F0C4F8061E15D02E21786916
-:1079A00021F032FA00280BD0654BFA689A4207D1D1
-:1079B0007B69C11A180009F07FF801F0B1F80600E0
-:1079C0003000BD461DB0F0BD182318000125FA187F
-:1079D000D2183818103B4021C0181FF091FBBE6030
-:1079E0003E61FB69AB4205D2554BFA689A42E7D03B
-:1079F000BE68E5E7AB4204D07B695B5D2E2B00D00F
-:107A000094E02900786909F057F87B6A3860002B08
-:107A100017D12A00082479691833F81800191FF0C3
-:107A20003AFB1823FB181819FFF728FF78607B68CA
-:107A3000002B14D13A684349434800F033FD04F069
-:107A40004DFE18230824FA182F2110190EF0E4F91E
-:107A50003B693969EA1A7B6959181823DDE73868E8
-:107A600001F05EF8041E4BD1386801F027F8FB697D
-:107A70000400AB4213D1354BFA689A420FD17B68B0
-:107A8000012B0FD0324A2B4940681DF0D9FE182235
-:107A90000823BA18D11820001BF032FA30E07B68B6
-:107AA000012BF4D10022796AB86AF9F751FAF4216E
-:107AB0000200FF31200005F035F87B6A18227B6058
-:107AC0000823B818C0182F210EF0A6F91822082391
-:107AD000B818C0181F491FF063FB18220823BA18F2
-:107AE000D0181FF042FB1AF080FE022806D118229F
-:107AF0000823BA18D11820001BF002FA7B687B62B9
-:107B0000BB68002B0CD07A693B699446E91A634440
-:107B1000180008F0D1FF22000100B86805F002F853
-:107B2000002E00D126006B1C3B61BC60013558E77C
-:107B30007C2E0020860F00009E0F00002A0D0300FF
-:107B4000A4B30200490D0300CCA8020084E70200A0
-:107B5000760F00005E0D0300184BF7B530CB0F0019
-:107B6000160001281AD94B68154A934207D0990785
-:107B700011D114491C688C420DD11C001D00022833
-:107B80000CD0BB68934209D09A0704D10D4A1968FA
-:107B90001C00914202D0002005F0DCFD01A93868EC
-:107BA000F9F72EFE019A0100002310201DF0DEFFE0
-:107BB0002A003100230005F0C1FBFEBD7C2E002011
-:107BC000A4B3020034C20200F0B58BB00600080076
-:107BD00011001A0010AB1F78314B05AD01950093D1
-:107BE00005230AF099FB912000011EF046FB2D4B66
-:107BF00004A91860059B476043706B682A4F0370A7
-:107C0000AB6804008370EB68C3702B7C30003B6072
-:107C1000F9F7F6FD0025254B03900C201D601EF0A2
-:107C20002CFB234B06000360FDF7CAFFB060FDF795
-:107C3000C7FF204B204A1860204B11001D70204BBD
-:107C400070601D701F4B30001D602B00FDF78CFE17
-:107C50002000049A03991BF0D3F82000FFF73EFAA6
-:107C60000400A84207D1FDF785FD0E4B1C60164BA2
-:107C7000186805F0ABFB0122144B1A70FDF79AFF50
-:107C80000028FBD1124B943318603B68002B04D0C2
-:107C90000C4B1048196818F047FE07480BB0F0BDB0
-:107CA00010A40200102F0020582A00204C2A002087
-:107CB0005CA40200482A0020A4B30200D02D0020BA
-:107CC000CE2D0020502A002004000020CF2D0020BF
-:107CD0007C2E00206A0D030000220D4910B50B78A0
-:107CE000DBB2934210D10B4A1478002C02D001244D
-:107CF0000C701370084B1B78002B07D0074A1368D1
-:107D000020331360064B1A68100010BD8268FBE731
-:107D1000CE2D0020CF2D0020D02D00204C2A002079
-:107D2000482A002073B501A9F9F76AFD019B0600F6
-:107D30001748502B17D8802040001EF09EFA154C93
-:107D400005002300943318600023019A9A420CD155
-:107D50005B232800AB540AF0C5FF2B00002808D194
-:107D6000943420600C4805F031FBF15CE954013398
-:107D7000ECE75A1B0133591E09789B29F9D12900D8
-:107D800006481AF0F1FA00239434236076BDC04609
-:107D9000790D03007C2E0020870D0300CC99020092
-:107DA000D2235B005843134AF0B51368000C83429A
-:107DB00006D9114C2368013323601368203B1360FC
-:107DC0001F23050001270D4E9D431468A5420BD8C3
-:107DD00003401A1D202A00D92022094C246893420E
-:107DE00004D3084B1860F0BD3770EEE7E518297131
-:107DF0000133F4E74C2A0020502A0020D02D002027
-:107E0000482A0020542A002070B506000D000028E2
-:107E100014DD002907DD154811F0F8FF0124B042F8
-:107E200009DB002407E00100C020000611F0EEFF8E
-:107E30000124A842F5DDE4B2200070BD002907DD71
-:107E4000C020000611F0E2FF0124B042F3DCE8E7B5
-:107E50000024A042F0D00100044811F0D7FF012314
-:107E6000A84200DC231CDCB2E6E7C046FFFFFF3F70
-:107E700070B504000D0010491EF0EFFE6968012284
-:107E80002000FAF72BFD0D4E200031001EF0E5FE1C
-:107E9000A96801222000FAF721FD310020001EF020
-:107EA000DCFEE96801222000FAF718FD04492000F1
-:107EB0001EF0D3FE70BDC0469D0D030005FC020000
-:107EC0006002030070B5060010200D0014001EF0C3
-:107ED000D4F9034B466085600360C46070BDC04642
-:107EE000A8A4020010B5FAF72DFE054912F05EFDB8
-:107EF0000323020002209A43024B1043C01810BD16
-:107F0000E02E65420000808010B5FAF71BFE05499F
-:107F100012F04CFD0323020002209A43024B10434F
-:107F2000C01810BD35FA8E3C0000808010B5FAF7FD
-:107F300009FE011C13F030F8024B002800D1024B5F
-:107F4000180010BD8CE7020084E7020010B5FAF7B4
-:107F5000F9FD440064080849201C13F01DF80028AE
-:107F600005D10549201C12F0A1F8002801D00348D2
-:107F700010BD0348FCE7C046FFFF7F7F84E7020097
-:107F80008CE7020010B5FAF7DDFD034B0340022039
-:107F90001843024BC01810BDFCFFFF7F000080801B
-:107FA00010B5FAF7CFFD440064080849201C12F010
-:107FB000F3FF002807D10549201C12F06DF80028B6
-:107FC00001D1034810BD0348FCE7C046FFFF7F7F97
-:107FD0008CE7020084E702001FB500230193FAF743
-:107FE000B1FD01A915F020F90322030002209343FB
-:107FF000064903435B180293019B934303435B18B9
-:1080000002A90393FEF736FB05B000BD0000808097
-:1080100070B50D00FAF796FD041C2800FAF792FDE2
-:1080200012F0D0FF0100201C15F0DAF80323020043
-:1080300002209A43014B1043C01870BD000080809D
-:108040001FB500230193FAF77DFD01A915F09EF8F5
-:10805000032302249843074B2043C0180290019841
-:108060001DF012FB02A903902000FEF703FB04B0F1
-:1080700010BDC0460000808070B50D00FAF762FDAB
-:10808000041C2800FAF75EFD011C201C15F096FB6D
-:108090000323020002209A43014B1043C01870BD15
-:1080A0000000808070B50D00FAF74CFD041C28001C
-:1080B000FAF748FDC00FC3076000400818430323C8
-:1080C00002249843014B2043C01870BD00008080FB
-:1080D00070B50D00FAF736FD041C2800FAF732FDE2
-:1080E000011C201C15F0F2FA0323020002209A431F
-:1080F000014B1043C01870BD0000808010B5FAF726
-:1081000021FD14F059FE0323020002209A43024B82
-:108110001043C01810BDC0460000808010B5FAF7AB
-:1081200011FD15F081FA0323020002209A43024B4D
-:108130001043C01810BDC0460000808010B5FAF78B
-:1081400001FD15F01FFA0323020002209A43024B9F
-:108150001043C01810BDC0460000808010B5FAF76B
-:10816000F1FC15F075F90323020002209A43024B3B
-:108170001043C01810BDC0460000808010B5FAF74B
-:10818000E1FC15F027F90323020002209A43024B79
-:108190001043C01810BDC0460000808010B5FAF72B
-:1081A000D1FC14F067FF0323020002209A43024B24
-:1081B0001043C01810BDC0460000808010B5FAF70B
-:1081C000C1FC15F087FA0323020002209A43024BF8
-:1081D0001043C01810BDC0460000808070B50D006F
-:1081E000FAF7B0FC041C2800FAF7ACFC011C201CB8
-:1081F00015F0C8FB0323020002209A43014B1043F1
-:10820000C01870BD0000808010B5FAF79BFC0021FB
-:10821000041C11F037FF002802D0074805F0D6F8FB
-:10822000201C15F06FFD0323020002209A43034B2C
-:108230001043C01810BDC046B50D0300000080807B
-:1082400070B5060008680D00FAF77CFC0021041CDC
-:1082500011F022FF002802D0184805F0B7F8201CC2
-:1082600015F014FB041C012E06D1032302209C43AD
-:108270002043134BC01870BD6868FAF763FC0021F7
-:10828000051C11F009FF0028E6D1FE21281C8905F4
-:1082900011F0F2FE002803D00A490B481CF0AEFB97
-:1082A000281C15F0F3FA011C201C12F0A7F9032377
-:1082B000020002209A431043DBE7C046B50D0300DD
-:1082C00000008080A40D030004AD0200F0B50E0094
-:1082D0001100002285B0B71C03901C0030000D4B2C
-:1082E0000092BF0009F0E8FF38001DF0C6FF4660AD
-:1082F00006000500039B083F03600836E719BC42EF
-:1083000002D1280005B0F0BD002101CC04F02EFC04
-:1083100001C6F4E7FFFF0000F7B505002C200E00B2
-:10832000170001931DF0BBFF040005708660878174
-:10833000072D01D0012D0FD1337872780A3B1B0233
-:108340001343E381019B20206375042363841DF0A4
-:1083500094FFA0622000FEBD014B5B5DF1E7C046CB
-:10836000C70D0300F7B50D001100002206000092B2
-:1083700028001F000B4B09F09FFF10201DF08AFF03
-:10838000041E08D1084B094A094C5A620023266092
-:108390002000A360FEBD39002800FEF76BF9E06005
-:1083A000F4E7C046FFFF00007C2E002004A002007E
-:1083B000942E002010B5013810C9FEF75BF9E0607B
-:1083C000004810BDA4B30200F8B57F2553B20400E5
-:1083D0000E0017001540002B0ADB6B1E012B07D87F
-:1083E0000B6858681DF0AAFA010020001EF035FC49
-:1083F000022D16D10F4920001EF02FFCF368002B30
-:1084000002D05A68002A04D10B4920001EF025FC36
-:10841000F8BD012A07D1002299682000FAF75EFA18
-:10842000F6E7002DEAD03A00F1682000FEF7C8F820
-:10843000EEE7C046213A0300FB820300C36803480D
-:108440005A68002A00D098687047C046A4B302005A
-:10845000136810B51400002B0BD0FC23FF33994296
-:1084600006D10C4B52689A4202D10023C38023608C
-:1084700010BD094B994201D1C368F8E7074B026868
-:108480009A42F5D1064B9942F2D1FFF7D7FF20600F
-:10849000EEE7C046A4B30200030200009CAB02005A
-:1084A000E30200000EB470B5050087B010201DF087
-:1084B000F1FE041E0BD11A4B1A4A1B4C9D61186227
-:1084C0005A62200007B070BC08BC03B018470021F6
-:1084D000056081600120FEF7CDF82521E0600500F0
-:1084E0000B9820F091FC061E09D10B9820F0A4FCFB
-:1084F000320001000B98F8F72BFDA860E1E702A815
-:1085000010211EF0E4FD0CAA0B9902A801920DF0B7
-:10851000D7FC02A90548E568F8F7E4FCEDE7C0469A
-:108520007C2E002004A00200942E0020CC99020092
-:1085300010B50300820708D1064A0168914204D1B0
-:10854000054AD9680120914203D00449180003F07C
-:10855000C3FB10BD18B8020065830000DCA7020051
-:1085600010B50400FAF7A2F9034BC2689A4200D092
-:1085700024690023A36010BD65830000F8B51600D0
-:108580001D0004000F00FAF791F9154BC2689A42DA
-:1085900000D02469A068002811D10C301DF07AFEAB
-:1085A000A06000280AD003236360E288A1689300DA
-:1085B000CB180332E2801F605E609D60F8BDE388E7
-:1085C000A18802338B42F0DB0331890001221DF0C8
-:1085D0007FFE0028F2D0A388A0600333A380E4E7E5
-:1085E0006583000070B5150004000E00FAF75EF90F
-:1085F000064BC2689A4200D02469A368002B02D1BE
-:1086000033602B6070BDE2883260FAE7658300005A
-:10861000F8B5050010200C001F0016001DF02DFEFF
-:10862000054B44608460A4190760C4606B60034B11
-:108630002860AB60F8BDC04621320200373202002C
-:1086400000237F2803D8034B1B5C9B07DB0F18001C
-:108650007047C046CE0D030000237F2803D8034B8C
-:108660001B5C1B07DB0F18007047C046CE0D0300D4
-:1086700000237F2803D8034B1B5C5B07DB0F18002C
-:108680007047C046CE0D030000237F2803D8034B5C
-:108690001B5C5B06DB0F18007047C046CE0D030065
-:1086A00000227F2808D8054B0132195C0C2319429F
-:1086B00002D15F384242424110007047CE0D0300A4
-:1086C00000237F2803D8034B1B5CDB06DB0F18005D
-:1086D0007047C046CE0D030000237F2803D8034B0C
-:1086E0001B5C9B06DB0F18007047C046CE0D0300D5
-:1086F00070B50400FAF7DAF800230C49DA005218D2
-:108700001568A54205D1516809481EF0A6FA012056
-:1087100070BD0133612BF1D1064B9C4203D09842CE
-:1087200001D00020F4E70449EEE7C04640AD020066
-:1087300044E8020048E902004E0E0300FF23032232
-:10874000DB05CB1810B59343042804D811F0C0FA08
-:1087500006030F0416000021080010BD0021181C9C
-:1087600011F08AFC0A490028F6D00A49F4E7181CDF
-:1087700012F028FC012140000143EDE780210906A9
-:108780005B18022193431943034BC918E4E7C04621
-:108790008CE7020084E7020000008080FF23DB05F5
-:1087A00010B50400C81803239843002386B0019332
-:1087B000063300931022613302A903F00BFB02A9D8
-:1087C00020001EF04AFA2E2102A820F01DFB0028EE
-:1087D0000FD1652102A820F017FB002809D16E21D6
-:1087E00002A820F011FB002803D1034920001EF04D
-:1087F00034FA06B010BDC0468404030030B50C0046
-:108800001100002285B01D0000920123200009F014
-:1088100053FD002C23D02868124B0340062B06D0B2
-:10882000032420420ED1104B02689A420AD103A9B8
-:10883000F8F7E6FF0022039900921300F9F70AFF08
-:1088400005B030BD03002340022BF9D0FAF77AF9C6
-:1088500003000220A3431843044BC018F0E7044868
-:10886000EEE7C046070080FFCC9902000000808040
-:1088700002008080F0B5050087B010000191FAF782
-:1088800061F9041C0390681F182800D9BDE011F09D
-:108890001FFA0D121F24333E6F81BCBCBCBCBC0D43
-:1088A000121F24333E6F9FA8ADB2B7000198211C60
-:1088B00011F00AFD03E0211C019812F0A9F90190C2
-:1088C00003230198524A9843013B03439B187CE0E1
-:1088D000211C019812F06AF8F1E70021201C11F028
-:1088E000CBFB002803D04B494B481CF087F803A969
-:1088F00001A81AF008FDE3E70021201C11F0BCFBE1
-:108900000028F0D1211C019811F078FED7E7002152
-:10891000201C11F0B1FB0028E5D1211C019814F0B6
-:108920004DFF0021041C019011F0A6FB002807D088
-:10893000039A0023002A01DA80231B060193BFE774
-:108940000021201C039E012711F09CFB002800D170
-:10895000071C0021301C012511F094FB002800D1D8
-:10896000051CFFB2EDB2AF42AAD0311C201C9FE71C
-:10897000019D0021281C11F07FFB002805D000215B
-:10898000201C11F07FFB0028ADD1211C281C14F005
-:10899000F9FF94E70021201C11F06EFB0028A2D102
-:1089A00003A901A81AF0AFFC03220220019B184979
-:1089B000934303435B180493039B934303435B1864
-:1089C00004A90593FDF756FE0300180007B0F0BD9B
-:1089D0000199201C11F06AFB104B0028F5D1104BB7
-:1089E000F3E70199201C11F04DFBF5E70199201CDC
-:1089F00011F042FBF0E70199201C11F061FBEBE75D
-:108A00000199201C11F048FBE6E70023DDE7C04692
-:108A100000008080A40D030004AD02008CE702007A
-:108A200084E7020010B504004868002204300749BA
-:108A300000F0A2F8064A002803D04068F8F7CAFE02
-:108A40000200044920001EF0C9F910BD860F000085
-:108A5000FB8203005534030070B5150012680C004A
-:108A60004068002A0AD1CC0006210430214300F0DE
-:108A700083F8002801D043682B6070BD03799B0701
-:108A80000BD50C4B9842F8D10B4EF36D002B03D154
-:108A900001201CF09CFEF065F06D06216A68E40080
-:108AA0002143002A03D11CF0D5FE0023E4E71CF08B
-:108AB000C7FEFAE7249D02007C2E002070B5062533
-:108AC000C0000543012229000B4800F055F8446816
-:108AD0000600002C0ED108201DF0CFFB074B040030
-:108AE000036001201CF073FE2A00606004491CF042
-:108AF000A7FE7460200070BDB82E002058B102009F
-:108B0000860F000010B50C000621C00001430122B1
-:108B1000024800F031F8446010BDC046B82E002075
-:108B200073B50625C3001D43060000222900104826
-:108B300000F022F8041E18D1020029000D4800F0B0
-:108B40001BF8041E12D0EA216A46FF31406803F088
-:108B50008FFF009B002B08D000216A4608001BF005
-:108B600011FF61683000FFF7CDFF606876BDC04639
-:108B7000B82E002084B00200F0B587B000920278D1
-:108B800004000F00930703D5009B002B00D0F5E0F5
-:108B9000D307DB0F0ED07A4B3B40062B43D0032389
-:108BA0003B4003D177493868884203D0009B012BB2
-:108BB00000D0E3E0019353075FD52368A568DE0882
-:108BC000F600AE19B54230D3009B012B00D0D5E0A2
-:108BD0002368D9086368994210D104316160A068A4
-:108BE000C9001DF068FB23686268DB08D21ADB004D
-:108BF000A060D200C018002120F0CAF80721236825
-:108C0000DD086A1CD2000B4013432360A368ED000B
-:108C10005D195B4B2F601F40062F21D00122237866
-:108C2000934323701CE00123C4E72868B8421AD19B
-:108C3000009B022B14D129002368721BD210083B21
-:108C4000013A6F6828002360D200083120F08DF8C7
-:108C50002368DD08A368ED005D1900236F602B60B9
-:108C6000280007B0F0BD019B002B04D13900F9F7B3
-:108C7000B3FE0028DCD10835A4E76368002B05D1DA
-:108C8000009B012B7AD1200000F07EF83C4B3B404A
-:108C90000593062B27D1F8081CF046FE0390616867
-:108CA000039811F0AFF800260491049B0293029BF5
-:108CB000DD00A3685D19286800281BD1009B012BEB
-:108CC0005CD107212368DA080132D2000B4013433C
-:108CD0002360002E00D0350000236B60059B2F60C1
-:108CE000062B9BD1BCE73900022003F0D7FD4310CF
-:108CF0000393D4E7042803D1002E1DD12E001BE0DE
-:108D0000B84211D1009B022BAAD123680298083BDC
-:108D100023600130616811F075F8A368C900CB5871
-:108D2000002B25D12B609BE7019B002B04D1390040
-:108D3000F9F752FE0028E5D102986168013011F080
-:108D400061F8049B02918B42B1D1009B012B15D19C
-:108D5000002E0FD023683500083323600023736092
-:108D6000059B3760062B00D17AE72378009A57E7F6
-:108D70000423D7E7200000F007F890E700256FE70D
-:108D8000070080FFCC990200F7B543680400019307
-:108D90005A1C002317495800455AAA4206D90133E4
-:108DA000222BF8D15508AD18213B1D43E800A768D8
-:108DB0001DF075FA07232268656013400122002523
-:108DC000236013432370A060019B9D4203D13800B0
-:108DD0001DF082FAF7BDEE00B959002908D0042928
-:108DE00006D001222000FFF7C7FEBE19736843605A
-:108DF0000135E9E770F60200F8B5050000230468C4
-:108E000086681449621C5800405A824206D90133D0
-:108E1000222BF8D15008821801201043002328602B
-:108E20006B6080001DF03BFA3700A400A860A41915
-:108E3000A74203D130001DF04FFAF8BD3968002970
-:108E400005D0042903D0012228001AF00FFB0437B3
-:108E5000EEE7C04670F602000379044AD35C002BAB
-:108E600000D183790248DB00C0187047D12D002063
-:108E7000A0B1020010B50400FFF7EEFF22790368ED
-:108E800002490348FFF70EFB03F028FC633403009C
-:108E9000C8AC0200002803D001210379014AD15453
-:108EA0007047C046D12D002010B5FFF7D5FF034B0A
-:108EB0004068C01A431E9841C0B210BD758E0000B4
-:108EC00070B506000C00FFF7C7FF0C4D2B002833D0
-:108ED000984204D12A001032002394420BD0002380
-:108EE000A04208D0436830009847641B3379044A95
-:108EF000E410D4540123180070BDC046A0B1020094
-:108F0000D12D0020F0B589B0002807D1664B674805
-:108F100019681DF0A2FE664809B0F0BD0D68654BEA
-:108F20009D425BD1002108001DF07EFD002405005C
-:108F30000590614B5A680192944217D300255F4A0D
-:108F400005A901200BF0A8F907AA06A905981DF0AC
-:108F500082FD069B03339B0801939B000393019BB7
-:108F6000524EAB4210D156493000D2E79B68019374
-:108F7000019AE3009958002904D0042902D028005E
-:108F80000BF02AF90134D4E72F00AB000293079BC2
-:108F9000029A9858F8F71EFC010030001DF05DFEA3
-:108FA000019BFF18069B9F4212D212231C1A002C11
-:108FB00007DD013C07D2039A029B94466344029367
-:108FC000E5E71234F3E73F4930001DF046FEF0E7D5
-:108FD0003D4930001DF041FE0135C0E72800F9F79A
-:108FE00065FC3A4B42689A4200D16D682800FFF751
-:108FF0007FFB061E00D08EE72C4C354920001DF06B
-:109000002CFE31002800F9F783FC280019F0F3FA50
-:109010003049020020001DF0E1FEAB0732D12B6881
-:109020002D4A93422BD128001AF0E4F91CF01DFCC4
-:1090300000250600A84200D16DE773689D4200D369
-:1090400069E7B268EB00D3181F68002F15D05B6882
-:109050002249200001931DF000FE00213800F9F79D
-:1090600057FC1F4920001DF0F8FD00210198F9F779
-:109070004FFC154920001DF0F0FD0135DDE7194AD0
-:10908000934203D02800F9F711FC0500A86B0028D3
-:1090900000D140E7830700D03DE7134B02689A42B6
-:1090A00000D038E7C2E7C0460800002044E80200CC
-:1090B000A4B302004614000084B0020094B1020080
-:1090C000753403009E6F0300254F03000D0200005E
-:1090D00099340300A134030058B102009D6F0300CE
-:1090E000B134030018B8020034C20200002803D0D3
-:1090F000012807D0002004E08B680448002B00D131
-:10910000034870478B685B001843FAE78CE702005E
-:1091100084E70200034B48600B60002308008B606B
-:10912000CB60704758B202007FB5040001220800EE
-:1091300001A9F9F75DFE0022217940200BF0E6FA43
-:1091400001000500029810F0D7FD636806001A0AB6
-:10915000824218D2A368C1186943E0681DF0ABF8D9
-:109160006368E060DBB22A00A06863606843E3687C
-:109170007243181801991FF0EFFDA36804489E1967
-:10918000A66004B070BD121A1202DBB21343EAE704
-:10919000A4B30200F7B5FF27456804000191BD4361
-:1091A0001DD101792A0040200BF0B0FA6368060057
-:1091B0003B408027A1683F011F430831414367605E
-:1091C000E0681DF078F86368E0601A0AA368013A65
-:1091D000013372435E43290080191FF0D9FD2079C5
-:1091E000019BA268E1680BF031FCA36803480133DE
-:1091F000A3606368013BFF3B6360FEBDA4B3020054
-:10920000F8B5002207000D00010040200BF07EFAA7
-:10921000060010201DF031F8084B0400012F00D08B
-:10922000074B2800277123606368A560DBB2704399
-:1092300063601DF022F8E0602000F8BDF0B202008B
-:10924000B4B2020070B506008AB00C0015001228F6
-:109250005CD003D8052826D0002454E01B2800D178
-:109260006CE01F28F8D1012207A9280019F0DAF9CB
-:10927000032300284FD01C4213D13B4B22689A4253
-:109280000FD1012204A920001AF09CF90123079AAA
-:1092900000930599089B049819F047F8334C00286F
-:1092A00031D1334C2FE0012204A920001AF08AF9B1
-:1092B0002800012207A9F9F79BFD069B00220393D2
-:1092C0006B464020197B0BF021FA0100060008983C
-:1092D00010F012FD069BA16803936B464118050030
-:1092E000187BFFF78DFF059B04001A000499C068E6
-:1092F00003931FF031FD2A000598E36872431818A4
-:1093000007991FF029FD20000AB070BD1100200050
-:10931000FFF70AFFF7E7EA070DD41D4203D1154B0B
-:109320002A689A4207D003232B40022BB9D1124B53
-:109330001D40062DB5D0114804F03AFA012204A9C7
-:1093400020001AF03FF9012207A9280019F06AF954
-:109350000028A6D0089B059A00930499079B30002B
-:109360001CF061FC9AE7C046F0B202008CE70200F4
-:1093700084E70200ECB80200070080FFFB820300D4
-:10938000F0B5050087B00E00012808D08B0726D164
-:109390000B68264A934202D0254A93421FD10122EC
-:1093A00003A9300019F03EF9002818D00022290046
-:1093B00040200BF0ABF901000700049810F09CFC72
-:1093C000060001002800FFF71BFF320004007A436B
-:1093D0000399C0681FF0C0FC200007B0F0BD30004A
-:1093E000F9F766FC071E00D0471039002800FFF788
-:1093F00007FF00210400300003F0B8FB00260090B6
-:10940000009803F015FC031EE6D0002F04D11900CC
-:109410002000FFF7BFFEF3E7721C0192E168320003
-:1094200028000BF013FB019EEAE7C04660920200A1
-:10943000F0B2020070B50E7904000D00012E0DD1BE
-:1094400019491DF00AFC3300AA68E9682000F7F703
-:10945000E5FC164920001DF000FC70BD32001449E7
-:109460001DF0BCFCAB68002BF3D0124920001DF0AE
-:10947000F4FB0026AB68B34204D80F4920001DF06E
-:10948000ECFBE6E7002E03D00C4920001DF0E5FBC5
-:109490003200E96828790BF0A1F9012201002000CF
-:1094A000F9F71CFA0136E5E7B63403006002030061
-:1094B000C2340300CD340300DD05030005FC0200C7
-:1094C00070B5050086B0161E44D0032480680C4099
-:1094D0002BD1214B0A689A4227D103AA08F0C4F97C
-:1094E000002802D11D4804F063F9042E1AD122008D
-:1094F000297940200BF00AF9049B06000093039B96
-:1095000028790193019A009B991AFFF779FE039934
-:10951000049A0400521A71437243EE68C0687118CD
-:109520001FF01AFC200006B070BD0A0000230100E5
-:109530002868F9F77BFB02002879042E04D1E9683A
-:109540000BF04CF90400EDE73300E9680BF07EFA0C
-:10955000034CE7E71400E5E7A8A4020066FC02005C
-:10956000A4B3020037B50C00110000221D000092C8
-:109570000123200008F0A0FE002C05D121000120CD
-:10958000FFF73EFE040016E02968CB0705D48B07E1
-:1095900013D10C4B0A689A420FD10800F9F76EFA02
-:1095A000010005000120FFF72BFE2A000400002126
-:1095B000C0681FF0EDFB20003EBD0120FFF7E0FE7C
-:1095C000E0E7C046ECB8020037B50400A06803F03D
-:1095D0002FFB019000280ED06568074B9D4205D0F7
-:1095E00001AB00220121280003F0CAF9F9F784FB3E
-:1095F0000028EBD001983EBDA4B3020030B58DB079
-:109600000500684603F044F8011E10D12A1D012010
-:109610001BF0B8F90122EB6804005B1001335B001A
-:109620001343EB6003F052F820000DB030BD0198F9
-:10963000054A0368934205D0044A00249342F3D0BC
-:1096400003F04CF80024EFE79CAB020044A90200B1
-:10965000044B0B6003684B60436808008B60012378
-:10966000CB60704768B3020010B502491DF0F5FAEF
-:1096700010BDC046D134030010B50400034B036095
-:1096800040301DF012FE200010BDC046E4B50200BF
-:1096900010B50F4C20001FF00AF8002808D0200059
-:1096A0001EF0D7FF0B4B1B68984202D1FAF7C4FC9F
-:1096B00010BD3F21084A138801330B400749098830
-:1096C0008B42F5D01188064C13806054F0E7C046F9
-:1096D0005C2A0020782E0020BC2D0020BE2D00200A
-:1096E000F12D0020002210B5044B05491A80054BCE
-:1096F00005481A801EF0E0FF10BDC046BC2D0020BA
-:1097000091960000BE2D00205C2A0020034B188893
-:10971000034B1B88C01A431E98417047BE2D002082
-:10972000BC2D0020084A094B10881988884201D1B5
-:1097300030BFF9E713880649C85C3F21138801331D
-:109740000B4013807047C046BE2D0020BC2D00206A
-:10975000F12D002070B504004518AC4205D02178E9
-:1097600002481EF07AFF0134F7E770BD5C2A002042
-:1097700070B504004518AC420DD02378064E0A2B74
-:1097800003D10D2130001EF068FF217830001EF05B
-:1097900064FF0134EFE770BD5C2A002070B504005F
-:1097A0000825002C08D02100082C00D929000348E6
-:1097B000641AFFF7CFFFF4E770BDC046DF34030043
-:1097C00070B5050004000826002C08D02100082CE4
-:1097D00000D931000448641AFFF7BCFFF4E7280001
-:1097E000FFF7DCFF70BDC046D634030010B50100A2
-:1097F00001481BF031FE10BD1C000020142313B5DE
-:10980000064C00931922182120000DF04DFF044A48
-:10981000044920001FF02FFA13BDC0465C2A002027
-:10982000000000207996000010B5024B672219F065
-:10983000D6FF10BDFD40020010B5024B972219F073
-:10984000CEFF10BD59AA0000F7B50F0011001A0095
-:10985000C38A8579868A019300230400837143615A
-:109860000F4B19F0BCFFA368002B17D1E18A002928
-:1098700008D0A38A002B05D1206B1BF083FC206B42
-:109880001BF000FBA38AE28A3900200019F058FF80
-:109890006B1E9D41019BA571A682E382F7BDC04668
-:1098A00075A6000010B54379C26A012B03D11000E0
-:1098B00019F072FB10BD0B00006B024919F096FB0A
-:1098C000F8E7C046ECBC02007FB50B7804000D0041
-:1098D0004E1C002B0AD0032B0BD103A928001CF02F
-:1098E00034FB03990600206B1BF063FA300004B0D0
-:1098F00070BD012B07D18E1C49780429F6D0006B6E
-:1099000005F0F0F9F2E7042B0BD14B788978006B66
-:10991000090219431BF095FA28001CF051FB0600C0
-:10992000E4E7052B15D14379042B04D02649006BBD
-:109930001BF093FAF0E788784B780002184303A9EC
-:109940001CF001F80399246BF7F71AFB01002000C3
-:10995000EEE71A000A3A0F2A09D803A9280019F0DD
-:10996000C3FE039906002000FFF79CFFBEE7082B0B
-:109970000CD103A928001CF0DEFA039B226A9B008D
-:1099800006009958206B1BF068FAAFE703AB02AAF8
-:1099900001A928001CF045FB05000299206B05F089
-:1099A00055F9019B094A9B009B582900039A200006
-:1099B0009847A368002B04D0E368002B01D1029BD9
-:1099C000E360039E92E7C046A4B30200ECB5020038
-:1099D000F7B506000192FFF777FF04270500019B0A
-:1099E0009D4200D1F7BDA91C30006C78FFF76CFFD9
-:1099F0002F3CE4B205003900082C01D8024B195D58
-:109A0000306B1BF09DFBEAE7E834030010B54379A7
-:109A1000C26A012B03D1100019F0CFFA10BD0B0060
-:109A2000006B024919F0E2FAF8E7C046FCBC0200FC
-:109A300010B54379C26A012B03D1100019F0BDFAA9
-:109A400010BD0B00006B024919F0D0FAF8E7C046D0
-:109A5000DCBC0200836870B504000D00002B09D146
-:109A60001100054819F0C2FBA060200029000C304D
-:109A70001AF0D7F870BDC046D8AB020010B5024A44
-:109A8000FFF7E8FF10BDC04630380300F0B5040012
-:109A90000D00E162002162712B7891B005920161A5
-:109AA0009F4A072B3BD1059B012B06D00200836BFD
-:109AB00008321B680599406B9847AB6818000893FB
-:109AC0001CF07EFA63790890032B0FD10D90402192
-:109AD0000DA81CF08EFAA36B02009B680D99606BB9
-:109AE0009847A368E882002B00D0D4E008981CF0C7
-:109AF00067FA08900378002B4FD00A3B0F2B47D80A
-:109B00000DA919F0F1FD95220D9B9200934244D0CE
-:109B10000AD80125483A93420DD0824A089920007C
-:109B2000FFF798FF11B0F0BD7F4A934202D07F4A01
-:109B30000325F0E7002508981CF042FA1821089048
-:109B400008A81CF056FA089B07900693069B079AF4
-:109B5000934224D16379012B15D9A36B29005B684B
-:109B6000606B98476379042B0DD10023E06A03955D
-:109B70000293C18A626B0191009393680521D268B8
-:109B80000069FAF777FAA368002B00D083E0C9E7F1
-:109B90000100674A2000FFF75DFF0225CBE7069B27
-:109BA00008931B78222B04D106981CF009FA069022
-:109BB000CCE71F2B01D05F4AB0E709A906981CF03B
-:109BC00009FA03780600432BF5D11CF0F9F9099B3B
-:109BD0009842F0D109A930001CF0FCF90378070085
-:109BE0000A3B0F2BE7D81CF0EBF9099B06008342D8
-:109BF000E1D00378472BDED11CF0E2F9099B9842B3
-:109C0000D9D10AA9380019F06FFD30001CF0DDF938
-:109C10009F210B900BA81CF0ECF901000B981CF095
-:109C2000C3F99B220A9B0600920093421BD1012894
-:109C300004D10B9803780A3B0F2B01D93E4A6DE7FC
-:109C40002669731C2361059B012B21D00DA919F0F6
-:109C50004BFDA36B0D9ADB683100606B98470028C1
-:109C600016D1364A5AE7364A93421AD1012803D10F
-:109C70000B980378032B01D0324A4FE7059B012B49
-:109C800006D0666B1CF070F9010030001CF09CFAE5
-:109C9000A368002B88D0200008990C3019F0C1FF70
-:109CA00040E789229200934222D1012803D90B98E0
-:109CB0000378032B01D0244A30E7059B012BE7D022
-:109CC0000CA91CF042F901270B900B980378032B89
-:109CD00001D01E4A22E70DA91CF037F901370B907D
-:109CE0000D9A0C99606B1CF076FABE42EDD1CFE76D
-:109CF000059B012BCCD0032800D95CE70B9B1800F7
-:109D00000D931CF05DF90E901CF05AF9A36B0F90A7
-:109D10001F6932000DAB0A99606BB847B8E7C046BF
-:109D2000253703004937030091020000DA020000E2
-:109D3000563703007E370300A1370300BD37030009
-:109D4000FF010000CD370300E93703000E380300A0
-:109D5000F0B587B001920A000593531E9A410D0099
-:109D600006000599019804921CF01EF92C1E039020
-:109D700009D02B7800243A2B05D102002100306B4A
-:109D80001BF071FA2C00049B019F0293059B9F42DC
-:109D90001ED1002C3BD1039A049B944663441900C6
-:109DA000306B1BF054FA002D3ED1019B9F422CD00A
-:109DB000019B9C423BD120001CF007F900220100CE
-:109DC000300000F039F801981CF0FAF80190ECE747
-:109DD0003B783A2B0CD1002C12D1049B306B5A1ECD
-:109DE000039B3C00D218029BD21A19001BF03BFACD
-:109DF00038001CF0E5F8029B070001330293C5E729
-:109E00000C4A39003000FFF725FE07B0F0BD002DE9
-:109E1000CBD0AC4208D120001CF0D7F800220100C2
-:109E2000300000F009F8C0E700222900F8E700221E
-:109E30000199C5E75B350300F0B50B7817001A00F0
-:109E40000A3A85B004000D000F2A10D803A9280093
-:109E500019F04AFC03992000002F01D0022F03D1F2
-:109E6000FFF7D4FD05B0F0BDFFF71CFDFAE76A4A25
-:109E7000192B00D8CBE01A3B2A2B00D182E005DC5D
-:109E8000062B08D0292B11D0644AC0E02B2B00D11F
-:109E900094E0972BF8D1002F00D0B7E003A9280059
-:109EA0001CF098F80200039B00219BE002A9280007
-:109EB0001CF090F80600022F03D001002000FFF7ED
-:109EC00003FD30001CF07CF80299060019F001FC3B
-:109ED0000028D9D13378A22B13D1300003A91CF06C
-:109EE00079F8060030001CF06BF8039A019090425C
-:109EF00007D2022F03D031002000FFF7E5FC019EBE
-:109F0000F0E73378482B21D1022F06D1206B1BF0CC
-:109F100044F8206B1BF000F80EE030001CF055F800
-:109F200001002000FFF7D0FC206B012FF2D11BF0C5
-:109F300008F8206B1AF0D8FF30001CF041F80299A5
-:109F400019F0C7FB002800D08CE79DE7492B9BD177
-:109F500030001CF03AF803A919F0C6FB012F07D115
-:109F6000206B1AF0E4FF0399206B1AF095FFE3E7EA
-:109F7000022F02D1206B1AF0F9FF0399206B1AF01F
-:109F8000BEFFD9E703A928001CF024F803990600B6
-:109F900019F09FFB002800D076E7002F36D135005E
-:109FA00003A928001CF016F806001CF009F8037835
-:109FB000A92B1BD100231A00310013E0002F25D15B
-:109FC00003A928001CF006F80399050019F081FB8D
-:109FD000021E02D03B003A0066E72B78A62BDFD0AA
-:109FE000030029002000FFF7B3FE3BE7AA2B05D1B1
-:109FF00003A91BF0EFFF039B0200DDE7C12B00D19B
-:10A0000042E71BF0DDFF320003004DE7044A290060
-:10A010002000FFF71FFD25E7FC3403001435030083
-:10A020002F350300F0B5170085B0040008000D00BF
-:10A030001BF0C6FF3900060019F04BFB0190002809
-:10A040001FD02379002B17D0E36A1E78002E13D17E
-:10A05000F6212000FF31FFF725FC29002000FFF743
-:10A0600033FC330032000121206B1BF03AF9206BE6
-:10A070001AF071FF05B0F0BD29002000FFF724FCA5
-:10A08000F5E733786D2B1DD1290001222000FFF761
-:10A09000D3FE30001BF099FF4378811C4E3BDBB2AE
-:10A0A00018260A2B01D8234AD65C2000FFF70CFCA7
-:10A0B0003100206B1BF044F8022229002000FFF73A
-:10A0C000BBFED7E76E2B2ED1300003A91BF082FF19
-:10A0D00006000700039BBB421FD101992000FFF738
-:10A0E000F3FB206B1AF023FF002229002000FFF76A
-:10A0F000A3FE019BB342BDD030001BF061FF019B6A
-:10A100000500834202D0206B1AF011FF31000022BB
-:10A110002000FFF791FE2E00EBE738001BF050FF08
-:10A1200001970700D6E731002000FFF7CDFB019A29
-:10A13000C3E7C046F1340300F0B50B788FB00A3B9B
-:10A140000400019103920F2B00D906E108001BF0D7
-:10A1500037FF0378432B00D0FFE001981BF030FF5E
-:10A160000BA91BF037FF037842780A3B1B0213430D
-:10A17000A14A934200D0F0E01BF022FF03780500D3
-:10A18000472B00D0E9E01BF060FF002800D0E4E09E
-:10A1900028001BF015FF0B9B984200D0DDE0280043
-:10A1A0001BF013FF9F210C900CA81BF022FF0C9BAF
-:10A1B00007000293012302980D931BF001FF050095
-:10A1C0000C90B84200D1BDE01BF0FAFE0C90B842F2
-:10A1D0000ED00378032B00D0BFE00DA91BF0B5FE15
-:10A1E0000D9B0C90002B00D1B7E0B84200D0B4E03A
-:10A1F000029B1B784533DBB2022B00D8ADE02B78F5
-:10A200004533DBB2022B00D8A7E00B9B1800059367
-:10A210001BF0D6FE039B0700984200D100270D9B40
-:10A2200026690493238B26830693638B0793E38B22
-:10A230000893731C6383A38BE383331D23612B7803
-:10A24000D91E03930B00591E8B410993039B032BCB
-:10A2500003D029002000FFF737FB02992000FFF709
-:10A2600033FBF11C206B1AF0ADFEB11C206B1AF011
-:10A270006CFD206B1AF05BFE002201992000FFF7B5
-:10A28000DBFD05992000FFF71FFB711C206B1AF006
-:10A290005CFD0499206B1AF08CFD1221206B1AF0E2
-:10A2A0004FFF206BF11C1AF050FD039B206B032B1A
-:10A2B0004CD01AF046FE206B1AF058FE049B206B1F
-:10A2C0001921002B00DA1A2100251AF039FFB21CDF
-:10A2D0000121206B1AF082FE069B2383079B638378
-:10A2E000089BE383AF4218D0206B1AF034FE039B27
-:10A2F000032B02D0206B1AF02EFE39002000FFF74E
-:10A30000E3FA2569206B6B1C290023611AF05AFEC1
-:10A310000999206B01311AF05EFC3100206B1AF0B4
-:10A3200014FD206B1AF017FE039B032B02D0206B49
-:10A330001AF011FE002F03D02900206B1AF005FD42
-:10A340000FB0F0BD2D4B029D029351E71AF0EFFDC7
-:10A3500029002000FFF7B8FAB0E7238B25690293A4
-:10A36000638B6E1C0493E38B66830593AB1C06938F
-:10A37000A38B0198E383224B2B432383EB1C2361A4
-:10A380001BF01EFE01002000FFF79EFA07000121CE
-:10A39000206B1AF074FE3100206B1AF0D6FCA91C59
-:10A3A000206B1AF07FFE002201992000FFF744FD88
-:10A3B00039002000FFF788FA0700206B1AF006FC2E
-:10A3C000002803D13100206B1AF0FCFDA91C206B82
-:10A3D0001AF0BBFC206B1AF071FE029B2383049BD6
-:10A3E0006383059BE383039BBB42A5D03900200018
-:10A3F000FFF76AFAA0E7C046A2020000DA6C030089
-:10A400000080FFFFF0B589B005000591049200932C
-:10A410000191002904D09F2105A81BF0EAFD0190BD
-:10A4200000231E001F00059C03930293019BA3427F
-:10A430001AD1002E0DD0029B002B00D079E0286BA2
-:10A440001AF020FD039B002B00D077E0286B1AF058
-:10A4500019FD049B286B002B00D174E033003A00F7
-:10A4600000991AF047FF0AE02378BB2B14D1BA3BBE
-:10A470001E4206D0374A21002800FFF7EBFA09B048
-:10A48000F0BD012320001E431BF09FFD0290200021
-:10A490001BF096FD0400C9E7BC2B0BD1BA3B1E4252
-:10A4A00001D02D4AE7E7022320001E431BF08DFD5B
-:10A4B0000390ECE7BD2B2AD120001BF086FD0400A1
-:10A4C0001BF07EFD0378C12B0BD128000622210052
-:10A4D00019F015FA009B2000013300931BF070FD6A
-:10A4E000D6E723780A3B0F2B01D91C4AC3E707A9FB
-:10A4F000200019F0F9F804000799286B1AF0A1FC64
-:10A5000021002800FFF7E0F9013704008EE7002E54
-:10A5100001D0134AAFE7002F01D0124AABE7210068
-:10A520002800FFF7D1F9009B0400013300933E009F
-:10A530007CE702992800FFF7C7F983E70399280011
-:10A54000FFF7C2F985E733003A0000991AF0C9FE17
-:10A5500095E7C0464D380300643803007C3803009B
-:10A560009D380300B8380300F0B589B004000391AA
-:10A5700003A83D211BF03DFD0027E36A02905E7DAC
-:10A580000398029B984215D118001BF01EFD029BF8
-:10A5900003901B780100320020001D2B59D119F0C7
-:10A5A00059F90500013F57D229002000FFF72EFA84
-:10A5B00009B0F0BD05A91BF00DFD6821039003A8AB
-:10A5C0001BF017FD06A90500039819F08DF89623D6
-:10A5D000069AFF3301909A4213D003992000FFF7A7
-:10A5E00073F9013703900398A84229D105992800EF
-:10A5F00019F06FF800280CD129002000FFF764F94A
-:10A6000007E0019B9D4207D8174A00212000FFF771
-:10A6100021FA059B0393B3E701981BF0D1FC854217
-:10A62000F2D107A9019819F05FF8079B0F4A9342EE
-:10A6300004D00F4A9342E7D10426EAE70126E8E76F
-:10A6400007A919F051F807990390206B1AF024FC20
-:10A65000C9E719F049FBA4E7002301211A00206B88
-:10A660001AF03FFE9EE7C0461436030011020000B8
-:10A6700006020000F7B50A780E00130008215D3BC2
-:10A680008B43DBB20400002B02D101338371F7BD91
-:10A6900013005E3B8B43DBB2002BF8D013000A3B68
-:10A6A0000F2B2FD95C2A11D101A930001BF092FC8D
-:10A6B00007001BF085FC019B834205D01BF080FC4A
-:10A6C000019B0500834208D1002506E030001BF005
-:10A6D0007CFC07001BF074FC050001A9380019F090
-:10A6E00003F8A379002D02D02A78002A0CD1002B80
-:10A6F000CDD1E38A002BCAD0184A31002000FFF7E1
-:10A70000A9F9C4E73700DFE7002B1ED0A38A013385
-:10A710009BB2A382012B09D1E18A206B002911D0C1
-:10A720001AF030FD0021206B1AF046FD29002000B0
-:10A73000FFF7CAF8206B01991AF083FB206B1AF01F
-:10A7400047FDA4E71AF09EFBECE7E38A29000133FA
-:10A75000E3822000FFF7B8F899E7C04632360300DD
-:10A76000F0B504000E00056987B002936B1C0393DB
-:10A77000AB1C03612900006B17001AF05DFC200080
-:10A7800018F0BAFF31002000FFF79EF8206B1AF096
-:10A790009BFC691C206B1AF015FC2900206B1AF039
-:10A7A000D4FA206B1AF0EAFD2669731C2361029B20
-:10A7B0009F4218D1A38B206B013BA3831AF054FC5A
-:10A7C000206B1AF0E0FD0399206B1AF0BEFA0C9B87
-:10A7D000002B03D019002000FFF776F83100206B22
-:10A7E0001AF0B3FA1BE038001BF0EFFB00230593CF
-:10A7F000236905000193013323610378002B10D1F5
-:10A800001BF0DEFB1BF0DCFB029B984224D03C4A91
-:10A8100029002000FFF71EF9A38B013BA38307B09B
-:10A82000F0BD07008B2B07D11BF0CFFB07001BF0FF
-:10A83000C7FB05A918F058FF206B1AF078FB390008
-:10A840002000FFF741F82121206B1AF079FC019AD2
-:10A850000021206B1AF0C2FB28001BF0B1FB059908
-:10A860000700002948D1206B1AF075FB0025059BD5
-:10A87000AB4209D02569206B6B1C236129001AF0BB
-:10A88000E7FB200018F038FF39002000FFF71CF824
-:10A89000059B0700002B02D0206B1AF015FC206BE3
-:10A8A0001AF037FC059B002B19D00E21206B04F009
-:10A8B00019FA2900206B1AF048FA0E21206B04F0D7
-:10A8C00011FA05992000FFF7A1F820000599FFF77C
-:10A8D000AFF8A38B206B013BA3831AF0C5FB3100BB
-:10A8E000206B1AF06FFB0199206B1AF02EFA0121F0
-:10A8F000206B1AF070F95AE72000FFF787F8B5E7E8
-:10A90000DA380300F0B587B0039143790400012BD6
-:10A9100007D1C36A0D001B78002B04D1194AFFF739
-:10A9200099F807B0F0BD692103A81BF062FB029003
-:10A930000398029B9842F4D005A90B2718F0D4FE87
-:10A94000059B0390019302ABFF183A000199E06A5E
-:10A9500018F0E2FB3B780600002B0DD0019A0100B5
-:10A96000E06A18F004FC3378074A002BE0D1290094
-:10A970002000FFF76FF8DBE70378042BD8D0034AF9
-:10A98000F5E7C0467F360300A4360300C236030055
-:10A99000F0B587B0039144790500012C09D10191EC
-:10A9A00003A869211BF025FB02900398029B9842A3
-:10A9B00001D107B0F0BD05A90B2718F095FE02AB39
-:10A9C000059EFF1803903A003100E86A18F0A4FBD6
-:10A9D0003B78002B08D10378012B05D0074A019959
-:10A9E0002800FFF737F8E0E704703100E86A18F054
-:10A9F000B5FB0028D9D00470D7E7C0466036030005
-:10AA000010B5084B428B04009A4202D1064AFFF768
-:10AA100021F8A28BE38B618BD21A206B04F088F9AA
-:10AA200010BDC046FFFF0000FC35030010B5084B09
-:10AA3000028B04009A4202D1064AFFF70BF8A28B60
-:10AA4000E38B218BD21A206B04F072F910BDC04643
-:10AA5000FFFF0000E7350300F7B50B7804001A008C
-:10AA60000A3A0E000F2A08D801A9300018F03CFE5F
-:10AA700001992000FEF7DCFFF7BD432B44D1694666
-:10AA800030001BF0A7FA01002000FEF71DFF03783D
-:10AA90000500A22B10D101A91BF09CFA050028008B
-:10AAA0001BF08EFA019B0700834205D0290020008D
-:10AAB000FEF70AFF3D00F2E72B78482B16D128005D
-:10AAC0001BF083FA01002000FEF7FEFE0500206B5C
-:10AAD0001AF06DFA0099280018F0FBFD0028CBD180
-:10AAE000214A31002000FEF7B5FFC5E7492BF7D119
-:10AAF00028001BF06AFA01A918F0F6FD019905007B
-:10AB0000206B1AF03DFAE5E7442BE9D108001BF071
-:10AB10009CFA0028E4D130001BF057FA06001BF025
-:10AB200054FA050001002000FFF796FF28001BF0F3
-:10AB300047FA0378A92B9FD0AA2B0ED101A91BF0AD
-:10AB400049FA019B0500834296D020002900FFF7B7
-:10AB500083FF28001BF034FAF3E7C12BC0D00100BB
-:10AB60002000FFF779FF87E775350300F7B5022668
-:10AB70000D00C16A0400097D314005D0344A290026
-:10AB80002000FEF767FFF7BD0191297808000A3819
-:10AB90000F281DD8280001A918F0A6FDA279E36AA4
-:10ABA000002A03D01A8B01321A8302E0DA8A0132BA
-:10ABB000DA82012601990029E5D06B46DF1C3A00B4
-:10ABC000E06A18F0A9FA3B78002B3CD1214AD6E77D
-:10ABD0001A32914204D128001BF0F7F901A9DBE7F2
-:10ABE0001A33994223D1A379002BC7D1012728001A
-:10ABF000A7711BF02AFA03260028DBD128001BF0DE
-:10AC0000E4F90278E36A0A3A0F2A09D828001A7D83
-:10AC100017431F751BF0D9F901A918F065FDC9E7A5
-:10AC20001A7D280017431F751BF0CFF9F2E72800A3
-:10AC30001BF0CBF901A918F057FDE36A1A7D164302
-:10AC40001E750526B6E70223467003709BE7C046D3
-:10AC5000FD3603000C370300C36A70B51B7804008F
-:10AC60000D00072B04D00C4A0021FEF7F3FE70BD47
-:10AC70001100280018F02DFD002807D00E21206BB0
-:10AC800004F030F8206B1AF03FFBF0E729002000B9
-:10AC9000FEF71AFEF6E7C046E3360300C36A70B556
-:10ACA0001B7804000D00072B06D0022B04D0174A96
-:10ACB0000021FEF7CFFE70BD1100280018F009FD3D
-:10ACC000061E07D00E21206B04F00CF8206B1AF042
-:10ACD00036FBF0E72B78C42B12D128001BF075F956
-:10ACE00001002000FEF7F0FD3100206B1AF0C7F9DB
-:10ACF000206B0E2103F0F6FF206B1AF02FFBDAE732
-:10AD000029002000FEF7E0FDE0E7C046F938030027
-:10AD1000F0B50D0085B004001100280018F0D9FC32
-:10AD2000071E05D00021206B1AF046FA05B0F0BDD1
-:10AD30002B784E2B0BD1206B01211AF03DFA290004
-:10AD40002000FEF7C1FD206B1AF042FAEEE7B32BAC
-:10AD500061D128001BF039F905001BF031F9029090
-:10AD60000378B62B4DD103A91BF034F9039B029055
-:10AD7000984203D09D2102A81BF03BF92B784E2B63
-:10AD800020D103990298266B1BF00EF9411C30006C
-:10AD90001AF012FA29002000FEF796FD206B1AF037
-:10ADA00017FA0127029E039B9E4210D1002FBDD1AE
-:10ADB00031000298246B1BF0F7F8411C20001AF0B8
-:10ADC00012FAB3E729002000FEF77EFDEAE73378A8
-:10ADD000310020000193FEF777FD019B0600002F54
-:10ADE0000BD04E2B05D00F4A29002000FEF732FE73
-:10ADF0009CE7206B1AF0ECF9D5E74E2BD3D10A4A29
-:10AE0000F2E72B7804224E2B00D0052229002000E7
-:10AE100018F075FD8AE729002000FEF755FD012195
-:10AE2000206BCCE78D350300B0350300F0B504008E
-:10AE30000D00002662711100C56206612A0087B00C
-:10AE4000006B03F071FE6279012A01D1EE832E843A
-:10AE5000AE683378542B0AD130001BF0B6F80100ED
-:10AE60002000FEF731FD206B1AF04EFA2AE02B7815
-:10AE7000002B08D131002000FEF726FD0E21206BAB
-:10AE800003F030FFEFE7072B21D130001BF098F8DB
-:10AE900063790500012B07D100230100A371402233
-:10AEA0005F4B200018F09BFC28001BF089F81BF07A
-:10AEB00087F801002000FEF707FD206B19F086FEE1
-:10AEC0000028DBD0206B19F054FE07B0F0BD022B38
-:10AED00017D1012A07D100234732A3713100514B0A
-:10AEE000200018F07CFC30001BF06AF80100200004
-:10AEF000FEF7EAFC2B7D5B07B5D5206B1AF02BF82B
-:10AF0000BCE7033B032B50D830001BF059F805A9D0
-:10AF10001BF060F81BF054F867790390012F09D1FA
-:10AF20000B2202ABD2183900E06A18F0F5F80223C0
-:10AF30000370EF822B78032B20D10021206B1AF0B5
-:10AF40002EF92B78062B27D1206B19F09BFF0121BE
-:10AF50002000FEF7A7FC206B19F094FF206B19F07E
-:10AF600091FF0023059A009303993300200019F004
-:10AF70007AF92B78062B00D075E77FE7042B04D1F4
-:10AF80000021206B1AF018F9DBE7052BD9D100213D
-:10AF9000206B1AF028F9D4E720000121FEF782FC8B
-:10AFA0000121206B1AF06BF8DBE7012A07D1DE21C3
-:10AFB00005AAFF31280018F0AFF80223037005A995
-:10AFC000A86818F091FBF82120004900FEF76AFC00
-:10AFD000F0212000FF31FEF719FDE989206B19F0FF
-:10AFE00030FFFA2120004900FEF710FDA8681AF092
-:10AFF000E7FF1AF0E5FF01002000FEF765FCDE2107
-:10B000002800FF3118F078F80378022B00D135E7DB
-:10B01000DE214288FF31206B19F0EBFD23E7C046AB
-:10B02000873E02007B3E0200F8B5164B0400A833B1
-:10B030001B681600002B24D1056901226B1C0361DB
-:10B040002B0019F096F8BE210700FF31206B19F094
-:10B05000FDFD3100380018F03CFB061E09D1390017
-:10B060002000FEF731FC330032000121206B1AF082
-:10B0700038F90121206B1AF054F92900206B19F0DE
-:10B0800064FEF8BD7C2E0020F0B585B005000E00F2
-:10B090000192FEF719FC03780400A22B03D101A949
-:10B0A0001AF098FF0400EB6A1B78072B00D070E0C1
-:10B0B000337872780A3B1B021343504A934268D19B
-:10B0C0002378472B65D120001AF0BFFF002860D0FD
-:10B0D000DE212800FF31FEF7E5FB0121EA6A936AD1
-:10B0E000928C002A06D1464A21002800FEF7B2FCC5
-:10B0F00005B0F0BD5878084211D059682800FEF715
-:10B10000D1FB019920001AF04FFF02280ADC00232E
-:10B11000286B1A0002211AF0E4F8200036E0013A08
-:10B120000833DEE720001AF04BFF0378492BEED1FD
-:10B1300020001AF045FF1AF043FF0378472BE6D1B1
-:10B1400020001AF03DFF07001AF03AFF0600380011
-:10B150001AF03BFF03A918F0C7FA03990122286BE4
-:10B1600019F0A6FE30001AF070FF0021884203D1CA
-:10B1700030001AF02AFF0100002301222800FFF707
-:10B1800041F920001AF01CFF1AF01AFF1AF018FFFC
-:10B190000400019BA342ABD020001AF011FF019BD9
-:10B1A0000600834224D02378492B21D10378472BF2
-:10B1B0001ED120001AF009FF070030001AF045FFE9
-:10B1C0000024A04203D130001AF0FFFE040003A9BE
-:10B1D000380018F089FA00220399286B19F068FEEC
-:10B1E0002800002301222100FFF70CF93000CDE7F1
-:10B1F00021002800FEF768FBCAE7C046C70200002E
-:10B20000CF350300F0B59BB01500069038220F0033
-:10B210000CA800211E001DF0BBFD069B0BAC5B685B
-:10B220000B97236201235B421193069B26711868DA
-:10B230001AF0C6FE1AF098FE606280001BF02FF82C
-:10B240000022A06200950025069B11001B682000CB
-:10B2500018F05CFA19F077FC2B000390206304953A
-:10B26000626A0792954202D2A268002A41D0002B5E
-:10B270005DD10593059A079B934202D00D9A002A4F
-:10B2800058D00499039819F063FC0025149A0D9B7B
-:10B290000592954200D213E1002B0CD0169B0EA80C
-:10B2A000996818F0BEFC169B0E9A0493DB890B99E3
-:10B2B0000D98FDF763F9039819F052FC18980028CF
-:10B2C00001D017F057FC002406981AF0C8FE159B11
-:10B2D0001B681D69149B159803939C4200D219E1C9
-:10B2E0001AF0FAFF0D99002900D11BE1080001F0C6
-:10B2F000F5F9A16AAA005658002E13D03269002A27
-:10B3000010D117F0AAFB737D3061012231002000BB
-:10B31000042B09D1FEF7BAFB2369049A9A4200D2A2
-:10B320000493012301359BE7FFF780FDF4E7002339
-:10B330001D0095E70599159B8900CB58002B37D048
-:10B340000120998C8C46197D01421BD06446601EF9
-:10B35000C000002C16D00226996A09184D78354293
-:10B3600029D0002A0ED00F00508816780890506817
-:10B370005578099011CF11C2089A0E704A80099A27
-:10B380004D704A600021DE249983FF348C451ADC1D
-:10B3900000218C4535DC5E68002E09D00021B28C7E
-:10B3A00009920A00099881423BDB0020824263D166
-:10B3B000059B01335DE7002A02D1012D00D10A006F
-:10B3C000013C0838C5E7986ACA0082181878012835
-:10B3D00004D15068A04208D10131D7E7157801287F
-:10B3E00003D9002D01D1012010701078022803D05C
-:10B3F000012550782842EFD0988B451C9D835080C2
-:10B40000EAE7986ACA0082181078032807D1012455
-:10B410005078204203D1988B5080001998830131D5
-:10B42000B7E7B06ACD0040190890007803380128CA
-:10B4300012D800240EE09F6AE00038180778042F25
-:10B4400007D1089D6F683D004768BD4201D1428029
-:10B4500001320134A445EEDC0131A3E79C6AC1004E
-:10B4600061180C78042C03D101254C782C4202D0B1
-:10B470004C88A4184C8001308445EFDCD98A92B204
-:10B480005118D982998B52189A8391E7039B022213
-:10B4900021000BA81793FFF7C9FC0D9B0593002B08
-:10B4A00004D1032221000BA8FFF7C0FC0D9B0593DC
-:10B4B000002B2DD1042221000BA8FFF7B7FC27E0B9
-:10B4C000002B00D0EAE6159B0593059AAB009C582B
-:10B4D000002C1DD0637D042BD8D1189B0593002B25
-:10B4E00004D10499139817F02EFB1890002317939A
-:10B4F0000F4B032221000BA81993FEF7C7FA0D9BEF
-:10B500000593002B04D1042221000BA8FEF7BEFAFC
-:10B510000135BBE6A3001858002801D017F0E3FD61
-:10B520000134D7E60A00280017F0A3FA1BB0F0BDDB
-:10B5300018980200F8B5124A0E00124B12499042B8
-:10B540001AD0C4688C4203D0012430602000F8BDBA
-:10B55000406B002812D004689C42F0D10500002402
-:10B5600047680835BF00EF19BD42EFD2310001CD69
-:10B57000FFF7E0FF2418F7E70024E7E70400E5E71A
-:10B580000CB202000CA002007DB60000F7B5050069
-:10B590000C00AB68002B0AD0344AE168914206D017
-:10B5A000E358002B03D00422EB681A60F7BDA06BB0
-:10B5B000002820D06B680430D900062300221943EC
-:10B5C000FDF7DAFA002816D0297C4268EB68286873
-:10B5D000002904D00100002001F0F0F9E6E700287E
-:10B5E00007D02249E5688D4203D021498C4200D022
-:10B5F00000692100F0E72B68002B16D1646B002C4A
-:10B60000D4D01C4B22681A4F9A420BD12600636893
-:10B61000194A08369B189B00F3180193019B346864
-:10B620009E4216D3BC42B4D1C0E72A7C002AE5D1A1
-:10B630000E4AE1689142E1D00D4A9442DED0186989
-:10B64000EA68696801F014FAEB681B68002BD5D032
-:10B65000ACE7BC4201D10436E0E721002800FFF747
-:10B6600095FFEB681B68002BF5D09FE77DB60000C7
-:10B670000CB202000CA00200FFFFFF3FF0B58FB03C
-:10B680000E0005A9019202930700FFF753FF041D66
-:10B69000A40020001AF0F1FD0500002180C017F081
-:10B6A000ABFE22002800103A103000211DF070FB84
-:10B6B000012E05D1029B1B680393042B00D189E066
-:10B6C00007AC0822002120001DF062FBF2220023BB
-:10B6D00009A8FF324260E63AFF3A39008260C4604E
-:10B6E00003740993FFF752FF079804282FD1059898
-:10B6F000029BC468019A3100A04728612800F7F72F
-:10B70000D5F8B84266D1EA220023FF32390009A8F1
-:10B71000089307930B9309950A92FFF737FF079B4E
-:10B72000002B57D00198304336D107AA010019F0F9
-:10B7300029F90400294B9C424CD0200016F05BFFF5
-:10B74000274902002748FCF7ADFE00F0C7FF00289C
-:10B75000D4D0019A324306D106AB0121069701F0FD
-:10B760000FF90500CAE7019B5D00AD190135AD0079
-:10B7700028001AF082FD2A1F0390029980C01DF054
-:10B78000EBFA711C039B019A206801F0F9F805009F
-:10B7900003981AF0A1FDB1E7019B5C00A4190234E3
-:10B7A000A40020001AF069FD22000700079B0299FF
-:10B7B00003600393089B083A436008301DF0CCFAFD
-:10B7C0003A000199300019F0DDF8040038001AF051
-:10B7D00083FDAFE728000FB0F0BDC046A4B3020060
-:10B7E0006339030050AC0200F0B5146889B017004B
-:10B7F000002C0ED1436803AD82686960596B0392D7
-:10B80000AC60EF602C74002905D111492800FFF7C6
-:10B81000BDFE09B0F0BD0F4B0A689A4210D14B68CB
-:10B8200008310E000193019B9C42EED0A300F15819
-:10B830002800FFF7ABFE3B68002BEAD10134F2E7AA
-:10B840002800FFF7A3FE3B68002BE2D1DDE7C046EE
-:10B850000CB202000CA0020010B54A6801491BF0AE
-:10B86000BDFA10BD5D3A0300F0B58BB005000E00C7
-:10B8700014000021082268461DF08AFA00211022D7
-:10B8800006A81DF085FA202307936B4605950893BB
-:10B890002968E023002C02D0042C10D1E623FF33CA
-:10B8A00005A80693FFF772FE0221009F042F0ED118
-:10B8B000220031002869F7F769FA0BB0F0BDFC23CC
-:10B8C00005A85B000693FFF761FE0321EDE7381E34
-:10B8D000F3D002AB002202950396049401F050F8D5
-:10B8E000042CEAD00048E8E7A4B30200F0B5204BEE
-:10B8F0008BB08200D35803AF0C0008220021060051
-:10B90000380001931DF044FA019B05AD6B601423D0
-:10B91000AB600023280021680594EF602B74FFF7CB
-:10B9200035FE0398042805D12169300000F0B6FFE8
-:10B930000BB0F0BD00280AD0210019F01BF8022E30
-:10B94000F6D1F7F7C7F8440001202043F0E7022EB4
-:10B9500001D00020ECE7E2232168FF3328006B6070
-:10B96000FFF714FE3B68002BF3D16400ECE7C04600
-:10B9700054B80200F0B55642564103238BB00C0078
-:10B980000190002117007642082203A81E401DF0F6
-:10B99000FFF90823079303AB0893002305ADF7369F
-:10B9A000FF36216828002B7405940696FFF7EEFDFC
-:10B9B000039B002B09D1002F07D1F733FF332168F8
-:10B9C00028006B60AF60FFF7E1FD039804281AD1EF
-:10B9D0002069F6F76BFF154BC2689A4211D1002F10
-:10B9E00007D02368586819F0A9FF010001981BF0DF
-:10B9F00034F980223A4321690198F6F76FFF0BB0C2
-:10BA0000F0BD3A00F7E7002805D0210018F0B2FF9A
-:10BA100000220100F0E7200016F0EDFD23000200F7
-:10BA2000034901981BF0DAF9E9E7C0466583000095
-:10BA30001239030070B504000D000B491BF00DF91D
-:10BA4000696800222000F6F749FF084920001BF032
-:10BA500004F9A96800222000F6F740FF04492000FD
-:10BA60001BF0FBF870BDC0461B3A030005FC02004A
-:10BA7000683A030010B5C468002C06D14268044936
-:10BA80000448FCF70FFD00F029FEA04710BDC0469A
-:10BA9000243A030050AC0200F0B5154B89B01600F3
-:10BAA0008200D5580C000C220021070068461DF0CA
-:10BAB0006FF9182303A84560836000256B46216851
-:10BAC000C36003940574FFF761FD009B042B06D14E
-:10BAD00032002169380001F081FC09B0F0BD181E68
-:10BAE000FBD06A4629000120029618F04BFFF4E7CC
-:10BAF000CCB60200F0B51700EE228DB0040003931F
-:10BB0000002307A852004260CD3A05ADFF3A0E006F
-:10BB100021688260C560037405936B600794FFF72A
-:10BB200035FD0598002809D1200016F064FD0C4968
-:10BB300002000C48FCF7B6FC00F0D0FD039B042883
-:10BB400006D13A003100206900F01AFF0DB0F0BDB7
-:10BB5000009332003B00696816F056FEF6E7C046D7
-:10BB60004739030050AC0200F0B50D0085B001A9C3
-:10BB700007001600280002AA17F039F900230199DE
-:10BB8000029899422CD13C201AF089FB2A4B019A49
-:10BB900003602A4B04008360294B4760C360294B34
-:10BBA0000361294B4361294B8361294BC361294BB5
-:10BBB0000362294B4362294BC362002A06D0029BD1
-:10BBC0001968096B0163012A18D94563A66303A9A3
-:10BBD0002000FFF7AFFC012813D9214801F0BAFD7E
-:10BBE0009A008258D468002C06D152681D491E481C
-:10BBF000FCF758FC00F072FD0133C2E71B68436399
-:10BC0000E4E7A36B0022181D1849FCF7B5FF051ED9
-:10BC10000ED0032243681A400AD11968144B4968B0
-:10BC2000994205D1031D0121124818F077FD686083
-:10BC3000200005B0F0BDC04618B8020075B900007C
-:10BC40007DB60000F5BA0000EDB8000099BA00001A
-:10BC50008F46020069B800000F480200C547020085
-:10BC6000ED390300C439030050AC02008E0F000010
-:10BC700045020000A0B7020037B50D001C000023EC
-:10BC80001100009301220333280006F015FB012D5B
-:10BC900004D0032D06D0074801F05CFD2068F6F7BC
-:10BCA00005FE3EBD2068F5F775F9A2686168FFF7EB
-:10BCB0005BFFF6E7413A03001FB5064B0A0001930C
-:10BCC0004B6802938B68010001A8039300F002FF08
-:10BCD00005B000BDDCB70200F8B50E00032713491C
-:10BCE000134AB0421CD003003B401BD104688C4275
-:10BCF0001AD1406B002814D003689342F1D105009B
-:10BD000044680C4B0835E418A4002C192868A54297
-:10BD1000E5D23100FFF7E0FF002802D10435F5E756
-:10BD20000120F8BD0020FCE71800FAE718B802006F
-:10BD30000CA00200FFFFFF3FF0B585B005000191A8
-:10BD400008008B0717D10B68134A93420BD10123CC
-:10BD5000029301AB03930024029E039FA6420DD1E0
-:10BD60000E4805B0F0BD0E4A934204D103AA02A9C1
-:10BD700017F03DF8EFE70B4801F0ECFCA300F95891
-:10BD8000094B994206D02800FFF7A6FF002801D1F1
-:10BD90000134E3E70548E4E718B8020084E702004D
-:10BDA0000CA002008B3903000CB202008CE70200E9
-:10BDB00010B5830703D1054B02689A4202D00448AC
-:10BDC00001F0C8FCFFF7B8FF10BDC04618B802006C
-:10BDD00024390300F0B58BB0079310AB10CB009063
-:10BDE00001911B78062A12D8012A08D93F230B702B
-:10BDF0000B0001330193002301990B7001E0002A2D
-:10BE0000F9D101209042804140420BB0F0BD009931
-:10BE1000002929DA019B01995F1C2D230B708021D9
-:10BE200009068C46009B63440093019BFF21099304
-:10BE3000009BC90518000840884222D120234E21CA
-:10BE4000079AF81C1A4013001143009A540212D1A9
-:10BE500049225A403A70462253407970BB70002301
-:10BE6000FB70019BC01AD0E7019F002BDDD0390089
-:10BE700001370B70D9E74124634039707B70B9708A
-:10BE8000EDE7002C00DA06240199013A7D1A551BD2
-:10BE90002022079911430291672940D1002C00D13B
-:10BEA000CEE1002B79D0A64A934200D9D4E0A5492F
-:10BEB00000980EF005F9431E98410023002630300B
-:10BEC00003932033059004939F4B039A0099D05815
-:10BED0000EF0ECF8002808D0049B039AF6189B4B50
-:10BEE0000098D1580EF062FD0090049B5B10049303
-:10BEF000039B04330393182BE6D115330393009A65
-:10BF00008F4B93425DD38F4900980EF0D9F80028EB
-:10BF100051D0002E7CD0FE239B05009351E0002BD6
-:10BF2000C1D1029B662B38D1631CAB4200DBAC1E37
-:10BF3000029B651C049300231E0003930593E343B7
-:10BF4000DB171C40049B652B00D0EEE0651C002332
-:10BF50000693069B9D424CDD00980FF033F87B1C46
-:10BF60000893030030333B70059A069B934205D13A
-:10BF7000002C03D0BB1C08932E237B700FF042F8DB
-:10BF8000011C00980EF044FE71490EF00FFD069B57
-:10BF9000009001330693089FDBE7631DAB4200DB93
-:10BFA000AC1F029B652B00D1AFE0002504930395E5
-:10BFB00005952E00C3E7009865490EF0F7FC0136A1
-:10BFC0000090029B662B03D0672B39D1042E37DCFF
-:10BFD000059B3B70029B672B01D1731EE418631C09
-:10BFE000AB4200DBAC1E002C15D166230137039455
-:10BFF0000493029B662B00D0B0E0012E00DDDDE053
-:10C00000544900980EF05CF8002800D0ACE0D5E070
-:10C010002B2303937FE72E23250030227B70BB1C4C
-:10C02000013E1F00002E76D0002D05D1039501237F
-:10C030005B42059367334DE01A70013D0133EFE732
-:10C040006B1FA3426CDC029A672A66D01300AC1FF8
-:10C0500000250493059572E70023002603932033FF
-:10C0600004933A4B039A0099D0580EF015F8002823
-:10C0700008D0049B039AF618334B0098D1580EF061
-:10C0800095FC0090049B5B100493039B0433039383
-:10C09000182BE6D12E4900980EF012F8002805D092
-:10C0A00000982D490EF082FC01360090029B662B11
-:10C0B00012D1AE4214DAA3190133AB4204DBAC1B3C
-:10C0C000023C631C00D10024002335190393013581
-:10C0D00005966633049332E7029B652B00D0B1E0EE
-:10C0E0006B1FA34200DCAC1F2B2300250393059597
-:10C0F0003A33EFE7231DAB4200DB6C1F029BA642E5
-:10C1000000DBA3E0731CE41ADEE7029B0025049326
-:10C110002B2303934CE7039689E71C00029B97E7C8
-:10C120000025029B059504930CE7049B672B00D028
-:10C130000DE7251E00D00AE701252C0007E7C046C1
-:10C14000FFFF7F3FF8FF7F3F70B8020088B8020012
-:10C15000000020410000A040CDCCCC3D3E490098DD
-:10C160000DF0AEFF002824D030217B1E1A782E2A35
-:10C170004FD010003038092842D901330193019B78
-:10C180001B78302B15D1019A52782E2A45D104996B
-:10C19000662942D001994B70039B0A702D2B3AD12E
-:10C1A000013E002E3BD03B00019A9A423AD3312304
-:10C1B0001370029B672B01D1002C39D1039B002BFC
-:10C1C00019D02022079B0A2113401A00452313434C
-:10C1D0003B70039B30007B700DF018FE0A210DF0C0
-:10C1E000FBFE3031B97030000A210DF0F5FE3C1D28
-:10C1F0003031F970270000233B70099BF81A04E6E0
-:10C20000392A02D001321A70B8E7019A19709342A4
-:10C21000B5D0013BAAE70136C5E70137C3E72B23B9
-:10C220000393C0E75A1E117819701300BCE71F0072
-:10C230007B1E1A78302AFAD02E2ABFD11F00BDE704
-:10C2400001242EE6029B672B00D153E704932B2396
-:10C2500000250393FEE6C0460000A040F8B50700A5
-:10C2600008680C0016F00AFE05006068F6F744FD49
-:10C270000600022F0AD9A068F6F700FC0200310080
-:10C28000280018F020FB19F0FFF9F8BD004AF6E786
-:10C2900040420F00F0B5486887B00F00F6F7EEFB9C
-:10C2A000041E02DA002001F091F8BB68164A0193DF
-:10C2B0009D186B1E9D41010002A81AF019FF049EF3
-:10C2C0002200002130001CF063FD3868EDB2C30786
-:10C2D0000AD433002200290019F0A3F902A90B485F
-:10C2E000F4F700FE07B0F0BD43102000042C00D985
-:10C2F00004200749019F00228F4200D0221AB21861
-:10C3000029001AF0E5FBE9E75AECFFFF6092020012
-:10C31000A6130000F0B50C0087B0012203A96068E5
-:10C32000F6F766FDA3681349039A8B420DD10126E7
-:10C33000049976424C1E01911419049900200D00B5
-:10C34000002D05D119F0BBF90DE014000126F4E72A
-:10C35000094F013DB84208D908481B18581E8341AF
-:10C36000D8B219F04FF907B0F0BD27780002384372
-:10C37000A419E5E7A6130000FFFF3F005AECFFFFFA
-:10C3800070B546007508041C291C281C0EF004FE1C
-:10C3900000280BD11649281C0DF088FE002808D073
-:10C3A0001449154816F022FF00F098F9134801F0DF
-:10C3B0000DF8002C11DA002E12D0FF23DB05E31854
-:10C3C0009C22D20593420BD903F03EFA211C0500B2
-:10C3D000043015F095FA280070BDE30DDB05EFE79A
-:10C3E000201C0EF0EFFD012540000543F3E7C04699
-:10C3F000FFFF7F7F7A3A030024AB0200933A0300E9
-:10C40000F0B50C00002585B0110020001E0000953D
-:10C4100002232A0005F050FF0120AC422BD08442B9
-:10C4200031D13068204226D103230340AB4203D1EF
-:10C430001C4A016891421ED01B4A0240062A06D0BF
-:10C44000002B0DD10268194B92699A4208D103A9B9
-:10C45000F5F7D6F900231A000399F6F77FF80AE0FA
-:10C46000032302001A40022A07D1FF22D2058018B6
-:10C470009843FFF785FF05B0F0BDF6F7FFFA0123FB
-:10C4800040001843F7E703A93068F5F7B9F904004D
-:10C490007068039FF6F7F2FA2B00020039002000C3
-:10C4A000DBE7C046ECB80200070080FF9D1D0000DE
-:10C4B000F8B51F000B4B15005918013909780DF01C
-:10C4C0001BFC00260400B74204D0013003210DF00C
-:10C4D00013FC0600281E01D01CF0AEFC0334A41986
-:10C4E0002018F8BD6A3A0300F0B58DB00A9214AA7C
-:10C4F000147815AA127806000F000792DA0742D5C1
-:10C500005D100023002D01DA2D236D420693139A4E
-:10C51000079B12992020FFF7CBFF3B6805908342D1
-:10C5200004D219F0AAFE059B30603B6000213768F9
-:10C53000059BFB185A1E11708D4240D00A3C09928F
-:10C5400008920B94129928000DF05CFC0B0030331C
-:10C55000092901D90B9B5B18089A541E2370079B6D
-:10C56000002B48D000282DD0A7422BD2099B1B1BA3
-:10C57000032B05D1079B013C2370A74222D20994CB
-:10C5800005000894DEE79A0712D1244A19689142FF
-:10C590000ED1079A02940392139A39000192129ACB
-:10C5A00000920A9A19F004F8040020000DB0F0BDC2
-:10C5B0000023326813700A9A34681360F5E79C1EF2
-:10C5C00030232370139B002B05D018001CF034FC83
-:10C5D000201A87421FD3069B002B04D0BC4202D9ED
-:10C5E000069B013C23703368059A9B181B1B0A9A13
-:10C5F000013B1360D9E7A742E4D20028C0D1E1E7AC
-:10C60000C2540133139AD25C002AF9D1069B04006C
-:10C61000002BE5D1E7E70023F4E7C046ECB80200C1
-:10C620001300144A10B50400934204D101222000E3
-:10C6300000F0D4FE10BD104A934201D10322F6E768
-:10C640000020072CF6D10D4A1A40062A0ED09A0770
-:10C65000F0D11A680A4CA24208D00A4CA24205D076
-:10C66000094CA24202D0094CA242E3D10A000720A1
-:10C670001900DDE784E702008CE70200070080FF75
-:10C68000CC990200609202000CA0020048E7020070
-:10C69000C4600561466187614146C16149460162E6
-:10C6A00051464162594681626946C1627146816064
-:10C6B00000490847BDC600000020C046024B9A68EA
-:10C6C00002609860002070477C2E0020024B9A6820
-:10C6D00012689A607047C0467C2E00200E4A93680C
-:10C6E000002B01D116F08EF8196858609160181C63
-:10C6F000C468056946698769C1698846016A8946CF
-:10C70000416A8A46816A8B46C16A8D4681688E4637
-:10C7100001207047FEE7C0467C2E002070B504F073
-:10C720008DF90F4C0F4B0025A3620F4BE56263633D
-:10C7300023002563A83303210C481D60A56403F082
-:10C740003FFC0B4E0121300003F03AFC3000094A57
-:10C75000094919F075F826606660E56570BDC04648
-:10C760007C2E0020BCA9020004A00200B42E0020F0
-:10C77000C82E0020760F0000860F000070B506243A
-:10C78000134EC3001C437368002205002100181DCE
-:10C79000FCF7F2F9021E18D1F06D002807D0043022
-:10C7A0002100FCF7E9F9002801D0406870BD0022A3
-:10C7B00021000848FCF7E0F9021E06D12A000649CC
-:10C7C0000648FBF76FFEFFF789FF5068EEE7C046AB
-:10C7D0007C2E0020289D0200A63B030070AA0200C8
-:10C7E0000A4B10B5040018685B6898420AD006210D
-:10C7F000E300194304300022FCF7BEF9002801D001
-:10C80000406810BD2000FFF7B9FFFAE77C2E00203A
-:10C81000074B10B5D86D002801D1064810BD043073
-:10C8200000220549FCF7A8F90028F6D04068F5E792
-:10C830007C2E0020F09B0200DE0E00000A00C100EA
-:10C84000062010B5024B0143186818F0F9FF10BD1F
-:10C850007C2E0020062110B5034BC0000143186850
-:10C8600018F0F8FF10BDC0467C2E00200A00C10061
-:10C87000062010B5024B0143586818F0E1FF10BDC7
-:10C880007C2E0020062110B5034BC00001435868E0
-:10C8900018F0E0FF10BDC0467C2E002037B5050023
-:10C8A0000C00062806D10800F6F726FA00280DD05D
-:10C8B0002C483EBDCB071BD54B10042816D80DF0D5
-:10C8C00007FA03154E4E0700002BF1D02648F0E77B
-:10C8D000C0221206934204D18020C00518F0D4FE75
-:10C8E000E7E75B425B0001201843E2E7DB43F9E73F
-:10C8F00002281AD11D4B0B40062B08D08B0714D1F0
-:10C900000A681B4B92699A420FD1486802E0C80836
-:10C9100019F00AF8002806D101A92000F4F752FB0B
-:10C92000019904F079F84300DDE72000F5F7BEFF38
-:10C930004369002B0DD10F4BAD002000ED5815F0D1
-:10C940005AFE2A0003000C490C48FBF7ABFDFFF729
-:10C95000C5FE2100280098470028AAD1EBE708006F
-:10C96000A7E7C04684E702008CE70200070080FFCB
-:10C970009D1D000054B80200323C030050AC020080
-:10C98000F7B50400019116001F00F5F78FFF056948
-:10C99000002D09D1200015F02EFE064902000648A0
-:10C9A000FBF780FDFFF79AFE3B0032000199200063
-:10C9B000A847FEBD4739030050AC0200F8B50E0091
-:10C9C00015001C00930714D113681E4A934202D12C
-:10C9D0006B682360F8BD1C4A934207D1002802D03F
-:10C9E000F5F764FF06006B6848C4F3E7174A934203
-:10C9F00001D12560EEE75A68022117008F431449E0
-:10CA00008F4202D013498A42F3D1002817D1124A2B
-:10CA100093420BD0114A934208D0114A934205D059
-:10CA2000104A934202D0104A934208D10C2019F0C8
-:10CA300024FC0E4B4660036085602060CAE72560D9
-:10CA40006060C7E7A0B7020064B7020018B8020030
-:10CA5000450200001A020000FCE9020038EA020068
-:10CA600074EA0200B0EA0200ECEA020030B9020007
-:10CA7000F8B500231360536006000D001400F5F7AD
-:10CA800015FFF92307005B009D4205D1836A002B47
-:10CA900002D00F4B48C4F8BDFB69002B04D0220024
-:10CAA000290030009847F6E7B86B0028F3D006213C
-:10CAB000ED00294304301A00FCF75EF80028EAD0A4
-:10CAC0004268230039003000FFF778FFE3E7C046F3
-:10CAD000B89C020070B5160004000D00FFF7C8FFF7
-:10CAE0003368002B15D10B4EA3070BD10A4B2268DC
-:10CAF0009A4207D12B00626808493000FBF7D2FC4C
-:10CB0000FFF7ECFD200015F076FD2B000200044934
-:10CB1000F3E770BDA0A7020018B80200BF3B0300F6
-:10CB2000E63B030073B504000D001600F5F7BEFEEA
-:10CB3000C369002B09D004220196009229006A469D
-:10CB400020009847009B002B0AD0200015F053FDD1
-:10CB50002B00020003490448FBF7A4FCFFF7BEFDCD
-:10CB600073BDC046E63B0300A0A7020073B50400F6
-:10CB70000D00F5F79BFE174B426A06009A4226D03D
-:10CB8000002D03D1102019F078FB0500736A002BEB
-:10CB900012D1E6216A46FF312000FFF769FF009BB2
-:10CBA000002B0FD1200015F026FD0B4902000B4889
-:10CBB000FBF778FCFFF792FD29002000984700283A
-:10CBC000E7D076BD29006846FCF742FDF9E7200072
-:10CBD000F7E7C04623260200553B030050AC020095
-:10CBE00037B50400F5F762FE856A002D02D02000FB
-:10CBF000A8473EBDF9216A4649002000FFF738FFEB
-:10CC0000009B002B05D06A462900280017F0BAFEC9
-:10CC1000EFE7200015F0EFFC034902000348FBF7A3
-:10CC200041FCFFF75BFDC046873B030050AC0200B0
-:10CC300030B505008FB003F0A3FE2800F5F736FEEF
-:10CC4000846A002C05D02800A047040020000FB003
-:10CC500030BDF9216A4649002800FFF709FF009B13
-:10CC6000002B16D002A8FFF713FD002807D16A4653
-:10CC7000010017F087FE0400FFF728FDE6E7039B9D
-:10CC800008491868FFF728F80028DFD10398FFF754
-:10CC900025FD280015F0AFFC034902000348FBF70F
-:10CCA00001FCF4E79CAB0200873B030050AC0200A0
-:10CCB000F0B513688FB00793002800D073E004002C
-:10CCC000131D0393FF220B00090A13401140019327
-:10CCD0004B000693069A019B05919B18039A9B00B3
-:10CCE000D2580492039AD3185F68381E09D00020E6
-:10CCF000BB0706D1944B3A689A4202D1380018F02B
-:10CD00009CFD059B1818049B4600002B50D1019BED
-:10CD1000581C83199800009319F0AFFA26000500FB
-:10CD2000002C01D001260460019BB0009A00281855
-:10CD300003991CF011F8019B9B190293029B980028
-:10CD4000059B2818DA00019B9900039B59181CF0D9
-:10CD500003F8029A069B944663440193002F12D075
-:10CD600003243C4000D0A9E0774B3A689A4200D0B7
-:10CD7000A4E0380018F079FD0323060000937368DF
-:10CD80009C4200D27DE0019B029A02999A1A5208B5
-:10CD90002B000798FFF7F4FD0400280019F09CFA17
-:10CDA00020000FB0F0BD130008330393546889E7E7
-:10CDB000049B9B072FD1049B644A1B68934202D0BB
-:10CDC000634A934227D10AAA09A90498F5F7F8FE05
-:10CDD000099B581C019BC01883199800009319F0F7
-:10CDE0004CFA26000500002C01D001260460019BAE
-:10CDF000B0009A00039928181BF0AEFF019B0A9916
-:10CE00009819099B80009A0028181BF0A5FF019B28
-:10CE1000099A9B1890E7019B181D831998000093AD
-:10CE200019F02BFA26000500002C01D00126046021
-:10CE3000019BB0009A00039928181BF08DFF019BFD
-:10CE40000AA99B1904980293FFF790FE029B049095
-:10CE50009C000498FFF7ECFE061E00D16EE7009BD5
-:10CE6000029A934207D8D900280019F024FA050045
-:10CE7000009B5B000093029B2E510133029304340C
-:10CE8000E7E7B368E700D859002815D0042813D085
-:10CE9000009B184205D12F4B02689A4201D115F030
-:10CEA0009EFB019B019A9B00E85002320192B268FE
-:10CEB000EB18D7197A685A60013460E70AAA264944
-:10CEC0003800FFF707FE00210AAA080017F05AFDF4
-:10CED0000021FFF74BFE019B03909E000398FFF794
-:10CEE000A7FE041E00D14EE7019B009A01339A422F
-:10CEF0000BD853000093042B01D204230093009B12
-:10CF00002800990019F0D7F9050003231C4207D126
-:10CF1000104B22689A4203D1200015F060FB0400F8
-:10CF2000E6210AAAFF313800FFF7D4FD0AAA002142
-:10CF300001200C9417F026FD019BAC5102330193A4
-:10CF4000AB1958600836C9E734C202000CA00200D1
-:10CF500048E70200CC9902006B02000070B50C009B
-:10CF600086B0160083071CD10368204A934202D082
-:10CF70001F4A934215D102AA01A9F5F721FE019B90
-:10CF8000A3422CD31BD80023029DA000A34201D1B1
-:10CF900006B070BD9900421A043AAA580133725083
-:10CFA000F4E702A9FFF7E2FD002305000193019BCE
-:10CFB0002800A34206D3FFF73BFE0028E8D022005A
-:10CFC0000C490EE0FFF734FE002808D0019A0A4908
-:10CFD000A31A5B189B00013298510192E7E7019A6E
-:10CFE00006490748FBF75EFAFFF778FB0CA0020042
-:10CFF00048E70200733C0300FFFFFF3F503C030083
-:10D00000C8AC0200F7B5FF240E00090A264015003F
-:10D010000C40830731D10368384A934202D0384A22
-:10D0200093422AD101AA6946F5F7CAFD009833193F
-:10D0300083425BD883009C46002301999A00A34257
-:10D040000FD1B400801B0919C01AAD1819F0ECFCFF
-:10D05000019B28601C190023013601339E4207D131
-:10D06000F7BD6746BF1A043FCF590133AF50E5E71C
-:10D070009A0051426158A950EFE70021FFF776FD71
-:10D08000002307000093009BB34218D3002108003F
-:10D0900019F0CAFC06003800FFF7CAFD011E1BD1BB
-:10D0A000B168A14222D3A3008A00EB181E60AA181F
-:10D0B000091B9D4214D1300019F0D2FCD0E7380092
-:10D0C000FFF7B6FD002811D0009AB31A1B199B0078
-:10D0D000013258510092D6E7300007F07DF8DAE7C8
-:10D0E000F468D01A2058043B1860E2E7009A05491A
-:10D0F0000548FBF7D7F9FFF7F1FAC0460CA002008C
-:10D1000048E70200503C0300C8AC0200F0B591B003
-:10D110001D0006000C001700F5F7C8FB334B9842C2
-:10D1200007D12B003A002100300004F0E3FA11B0DF
-:10D13000F0BD826A2E4B002A08D09C4230D13000CC
-:10D14000904728600028F2D00120F0E79C4227D1C8
-:10D15000F92101AA49003000FFF78AFC019B002B4E
-:10D160000DD1D72101AA49003000FFF7B3FC039489
-:10D1700001AA0021012017F005FC2860E4E704A8BB
-:10D18000FFF786FA002807D101AA010017F0FAFB81
-:10D190002860FFF79BFAD7E7059B2B600220C6E7C4
-:10D1A000002CDED13800F5F781FB1249FEF794FD23
-:10D1B00001AA00280ED010493000FFF759FC019B4E
-:10D1C000002B10D001AA2100200017F0DBFB286003
-:10D1D0002000ACE709493000FFF74AFC019B002B17
-:10D1E00001D00397C4E72F60D8E7C046F4D102000E
-:10D1F000A4B3020090A8020019020000CD020000B2
-:10D2000010B50400FBF794F9002808D00023200093
-:10D210001A001900FFF7B4FB0400200010BD200025
-:10D2200015F0E8FF0028F8D10249034815F0DEFFA9
-:10D23000F2E7C046083C030050AC02007FB5C300D3
-:10D2400006201843054B01900491052001A9029383
-:10D2500003930592FAF72AFB07B000BDA4B30200BE
-:10D260001423F0B58DB000AFFA1805000C00FFF7DD
-:10D27000FFFBBB69002B06D022002C492C48FBF792
-:10D2800011F9FFF72BFA786900284CD1280015F026
-:10D2900049FE0028F0D01423F821FA18280049008C
-:10D2A000FFF7E6FB10227869B918F4F7A9FAB8601D
-:10D2B000200018F03EFB6A463E69B968731C7B602B
-:10D2C000C318FB600E33DB08DB00D31A9D466D46A6
-:10D2D000320028001BF040FD2E23AB557B68200058
-:10D2E000EB18BB6018F02AFB0600200018F021FBA9
-:10D2F00031000200B8681BF02FFDF968280003F028
-:10D30000DBFBC300062018430A4B10223B627B6202
-:10D31000094BBA18BB620123FB620B33F861D118C9
-:10D320000520FAF7C3FABD460DB0F0BD713B03000E
-:10D33000CCA80200A4B302008CE70200F0B5174CA1
-:10D340000F00616895B003912168060008A8049158
-:10D3500062602360FFF79CF9051E06D0039B0998C5
-:10D360006360049B2360FFF7B9F933683A0031002A
-:10D3700005A8019304F06EFC2B002A00019905A872
-:10D38000FDF740FF17F0EFFA0500FFF79FF92800BF
-:10D39000039B6360049B236015B0F0BD7C2E0020CE
-:10D3A00010B5040000F004FD031E054802D0054935
-:10D3B00017F024FB22000449FBF774F8FFF78EF9FD
-:10D3C00034AA0200C43A0300ED3A0300010010B58C
-:10D3D000014817F013FBC046C8AC0200F0B58BB093
-:10D3E00004900F000392202803D191420FD0AF4E3A
-:10D3F000BFE0049B1B2B01D01E2B0DD103993800DD
-:10D40000F5F7EAFA049B002803D01B2BEFD1A84EB6
-:10D41000AFE01B2BFBD1EAE7049B212B3FD1039804
-:10D42000FBF786F8002806D00399380015F0E8FECF
-:10D430000028ECD1DBE70324039B1C4005D1039AB1
-:10D440009C4B126805929A4223D0049B9A4A9B00F7
-:10D4500038009C5815F0CFF80500039815F0CBF86C
-:10D460002B000090220095499548FBF71BF847E1F7
-:10D47000039AA300D3189D682800FBF759F80028E9
-:10D4800000D158E12900380015F0BAFE0028BED1BD
-:10D490000134039B5B680593A342E9D8A7E7012603
-:10D4A000314200D116E1039B4D101E4000D1E7E050
-:10D4B0005C10049B1D2BC8D818000CF013FC1E0038
-:10D4C00028002A002D0045004C004E0050005D0051
-:10D4D00066007B008300B4001E0028002A002D0097
-:10D4E00045004C004E0050005D0066007B0083004C
-:10D4F000CC00D000C6FFD400D80025432E00700019
-:10D500000300734000D5B6E00126064331E06540D4
-:10D51000F4E72C402600F2E7002C02DA6948FFF716
-:10D5200055FF1F2C08DC684B2341AB4204DBC023B2
-:10D530001B062341AB4205DDE917280018F095F8DA
-:10D5400007004BE0A540D9E7002CE7DB1F2C00DDEE
-:10D550001F242541D2E72E19D1E72E1BCFE721004A
-:10D560002800FAF751FC0028E6D1012665436D003A
-:10D570002E4330000BB0F0BD002C00D1DDE02100C7
-:10D58000280015F061FD0600B9E7002C00D1D4E0B9
-:10D5900028000DF037FD051C20000DF033FD011CA7
-:10D5A000281C0DF02BF8032302269843474B064313
-:10D5B000F618DEE7002C00D1BFE02100280015F0AE
-:10D5C00033FDE0E72F00002C2ADA28000DF01AFDC9
-:10D5D0000323022798433D4B0743FF183800F5F714
-:10D5E00065F98369002B00D12FE7039A390004986D
-:10D5F000984756E001231C4206D039003000FAF764
-:10D6000003FC002898D17E43012C00D177E7390034
-:10D6100038006410FAF7F8FB002800D08CE77F434D
-:10D62000002CE7D16BE7002C00D186E0002102201E
-:10D63000F9F720F821000600280015F005FD012764
-:10D6400040003843B0602100280015F0EDFCB840E0
-:10D650000743F7608DE7A54200DAD8E6C7E6A542A2
-:10D6600000DDD4E6C3E6A54200DCD0E6BFE6A54275
-:10D6700000DBCCE6BBE6300018F006F8060078E7E1
-:10D680000323039A1340022B24D1114B1340062B82
-:10D6900020D028000DF0B6FC039A011C0498FBF77B
-:10D6A000E9F8061E00D064E7CFE6C04684E7020032
-:10D6B0008CE702000CA00200CCB60200303B030055
-:10D6C00050AC02001B3B0300FFFFFF3F00008080C7
-:10D6D000070080FF049B1F2B00D07FE70398F5F71E
-:10D6E000E5F883690400002B0CD1636A002B11D18B
-:10D6F000039814F080FF134902001348FAF7D2FE92
-:10D70000FEF7ECFF3A00039904989847061E00D0F4
-:10D710002FE7EAE706A90398FFF728FA040020009C
-:10D72000FFF786FA002800D161E63900F5F754F9D1
-:10D730000028F4D06BE6039587E60449044817F007
-:10D740005DF9C046553B030050AC0200A40D030038
-:10D7500004AD0200010010B5014817F04FF9C046B2
-:10D7600050AC0200F8B504000D0017001E0000299F
-:10D7700008D01868F5F79AF86368834202D0054824
-:10D78000FFF7E8FF33003A002900A068FFF7F8F838
-:10D79000F8BDC046AC3A030001214000014310B57A
-:10D7A000024815F01CFDFEF799FFC046E8AA0200EA
-:10D7B000010010B5014817F021F9C046ACAA0200DB
-:10D7C00010B5034A0349044819F008FB034810BD8B
-:10D7D000733D0300190D030044E80200A4B30200E6
-:10D7E00010B5034A0349044819F0F8FA034810BD7C
-:10D7F0009B3C0300190D030044E80200A4B302009F
-:10D80000F7B50600194D0C00280013F007F9310098
-:10D81000174813F089F8174813F000F9164813F069
-:10D82000FDF8FF239B00E61821787F2901D0A6424E
-:10D8300006D1280013F0F2F8104813F0EFF8F7BD06
-:10D840006278A37850290CD80D48475C0D48405C9D
-:10D85000019300923B0002000B4813F065F804347A
-:10D86000E2E70A4813F060F8F9E7C0466A3F0300B0
-:10D87000973F03009F3F0300283F0300463F0300FC
-:10D88000540C0300030C0300C03F0300E33F0300FC
-:10D89000F0B51D0087B006001A4817000C0013F001
-:10D8A000BDF82900184813F03FF8184813F0B6F8EF
-:10D8B000174813F0B3F8AD006519AC4204D1114814
-:10D8C00013F0ACF807B0F0BD3878A2780490206867
-:10D8D00023780003400E0390E0789B060009029035
-:10D8E00020883178C004400E0190E0789B0E00073C
-:10D8F000000F00901209074813F016F8043401369F
-:10D900000137DAE76A3F0300B73E0300E43E030055
-:10D91000163F0300483F0300F7B50020214A224E7E
-:10D9200012783368111D4900CC5A5F18598801904C
-:10D93000A020C00584466405640D4C431B49A41215
-:10D940000968787807270500BD43F82D1DD001250B
-:10D95000C00885402800A1256746ED0001327851B6
-:10D96000D2B2101D4000C55A1F186D0558886D0DA4
-:10D9700068438012001BE4D00A4C2270019A002AEE
-:10D9800002D00A4A33601160FEBD6046084A5C68F6
-:10D990008450002903D001220B00002101920A00CB
-:10D9A0000C00DEE7312E0020BC2A0020C02A002017
-:10D9B0000C05000010B572B600220F4B18681A60F3
-:10D9C00062B6904210D10D4B0D4A1B680D48934230
-:10D9D00000D010001A7802705A8842805A6842605B
-:10D9E000002219788A4200D310BD510044185918FA
-:10D9F000098901322181F4E7C02A0020BC2A0020D5
-:10DA0000C42A0020F42A0020044B054A1A6000238F
-:10DA1000044A1360044A13707047C046BC2A0020B1
-:10DA20000CBA0200C02A0020312E002010B5782246
-:10DA30000249022000F068FF10BDC04619D900005D
-:10DA4000421E084BFF3A10B504009A4207D8FFF770
-:10DA5000B1FF054B241144801860002010BD012047
-:10DA60004042FBE740410F00C02A0020044B1B68E6
-:10DA7000002B01D1034B1B68588800017047C0463A
-:10DA8000C02A0020BC2A0020F7B53D4A04000D0042
-:10DA90000B00914200D913008022D200D31A0193C7
-:10DAA000FFF788FF0122A24046680092164207D184
-:10DAB0002300A0210327C133FF339B00C9055F501A
-:10DAC000002703789F4206DB002D01D0132B0BD9D2
-:10DAD0002C4B1860F7BD391D490042185278D20806
-:10DAE000A24243D00137EDE7009A191D324342604C
-:10DAF000019A490055050A5A6D0DD20AD2022A43ED
-:10DB00000A525205E400520F4118144301334C707D
-:10DB10000370851C012225E0009A013BDBB296438D
-:10DB200003704660BB42F4DD04335B001B5A0B52AA
-:10DB3000EFE72F00131D5B00195A2E894905490D87
-:10DB4000531E1C1D6400245A6405640D8C4204D9C4
-:10DB5000FC88023F7C81013BF3D205335B001E52FF
-:10DB60000132023503789A42E3DBB1E7002DD3D0CE
-:10DB7000019B5A050B5A520DDB0ADB021343D6E711
-:10DB8000FF030000C02A002070B500210400FFF749
-:10DB90007BFF00210D4B18680578A94200DB70BDA2
-:10DBA0000B1D5B00C3185A78161CD208944201D092
-:10DBB0000131F2E70822524232435A700123A02178
-:10DBC000A340034AC9058B50E9E7C046BC2A0020A0
-:10DBD0000C05000010B50C0017F093FD631E1842F1
-:10DBE00007D00200230003490348FAF75BFCFEF765
-:10DBF00075FD10BD04400300C8AC020010B54A68B2
-:10DC00000249D20019F0EAF810BDC0462C400300CA
-:10DC100070B50B0006001400101E0FD071681800BC
-:10DC2000042A0ED1FFF7D6FF7368012B03D0022B15
-:10DC300005D0006800E0007817F026FD70BD008870
-:10DC4000FAE7FFF7C7FF05002000F4F743FF72680B
-:10DC500003000548012A03D0022A03D02B60EDE718
-:10DC60002B70EBE72B80E9E7A4B30200F7B52D4F4B
-:10DC7000B43701972B4A2C49FC32536C8B4200D8A5
-:10DC8000F7BD0325043B53641A68264B501CAC3384
-:10DC90001E6804008108715C2C4064002141831AD5
-:10DCA000294001300229F4D00326019912010968A4
-:10DCB0001B018A181B499B08002BDBD00F2014681E
-:10DCC000044229D119480068A04225D80D00B83572
-:10DCD0002D68A54220D9241A200900900800AC30F4
-:10DCE0000068A409009D0419207835406D00844621
-:10DCF0002841304001280FD13700AF403D00674632
-:10DD00003D4325700D00FC356C6C094FBC4206D2BA
-:10DD1000201D686400982060013B0432CCE70C00B1
-:10DD2000BC34F8E77C2E00203C2F0020302F002050
-:10DD3000BC2F00200F23994370B506000D00081A70
-:10DD400041210BF0D9FF0F4C02002300B0331860C3
-:10DD500023002100AC331E608301EB1AB4310B6049
-:10DD600023003000B83300211D601BF011F8802320
-:10DD7000FC345B020122A36400235242E364226567
-:10DD8000636570BD7C2E0020A222034952008B5A8D
-:10DD900001338B527047C0467C2E0020A2220349DB
-:10DDA00052008B5A013B8B527047C0467C2E00209C
-:10DDB000A223034A5B00D05A431E9841C0B2704769
-:10DDC0007C2E0020F7B50400032589004318019339
-:10DDD000019B9C4200D1F7BD0F232168194229D134
-:10DDE000184B1A00B43212688A4223D81800B8308F
-:10DDF000006888421ED9891A1A000F093800AC320F
-:10DE00001268890951180A78284040009446024156
-:10DE10002A40012A0ED12E0086403000664630434B
-:10DE200008701800FC30416C074EB14206D20B1D41
-:10DE300043640F60FFF71AFF0434C9E7BC331A606C
-:10DE4000F8E7C0467C2E0020BC2F0020A22210B58F
-:10DE500008485200835A0100013383520300002214
-:10DE6000FC33BC310A60DA64034A27215A64FFF7A5
-:10DE7000A9FF10BD7C2E00203C2F0020F8B5032602
-:10DE80002E4C00252200BC321368AB4213D1022273
-:10DE90001900032794462200B03212689200914282
-:10DEA0002AD323000022FC335A654532FF32A35A9D
-:10DEB000013BA352F8BD23001560214AFC335A648C
-:10DEC0002300B0331B689B009D42D9D22200AC32A4
-:10DED0001268AB08D35C2A00324052001341334031
-:10DEE000032B07D12200FC32536C191D51641D60B5
-:10DEF000FFF7BCFE0135E3E72000AC3000688A087C
-:10DF0000801802780D0016003D406D002E413E4005
-:10DF1000022E09D0032E0BD0012E07D13B00AB40BF
-:10DF20009A430270012301E0002BF7D10131B2E7DF
-:10DF30006346AB409A4302700023F7E77C2E002033
-:10DF40003C2F0020334BF0B51A001900B832B43121
-:10DF500009681268521A1900B0331E680260032360
-:10DF60000022AC310F68140011009C4642608260B0
-:10DF7000C260026142618261B60065468B08FB5C4B
-:10DF80000D406D002B4165462B404568012B33D079
-:10DF9000002B2BD0022B32D001318E420AD06546A5
-:10DFA0008B08FB5C0D406D002B4165462B4001D07A
-:10DFB000012BE2D1012C26D1056901350561856966
-:10DFC000A54200D284618E4201D0012BD5D1C36815
-:10DFD000934200D2C2608E4206D143681B01436067
-:10DFE00083681B018360F0BD0022C6E784680132AC
-:10DFF000013484601C00CFE701354560FAE7013544
-:10E0000045600134C8E7022CD9D145690135456125
-:10E01000D5E7C0467C2E0020F7B50F3003090193E9
-:10E0200002D100242000FEBDA223474A5B00D35A40
-:10E03000002BF6D14733FF33D35A5E425E41002BAB
-:10E0400007D0414BFC33DA6C1B6D9A4201D306F0CA
-:10E0500071F8002430213F273B4A3B4BB032126815
-:10E06000FC339446384A5B6DAC3210689C4505D849
-:10E07000002ED6D106F05EF80136EBE70325C25C30
-:10E080002A4231D1019D0134A5422ED89B00191B93
-:10E090004E1C5A1C012C03D12B4C9708FC3467658D
-:10E0A000B40800190324270037407F00A446023C2F
-:10E0B000BC40077802313C43234F0470AC378B429D
-:10E0C00034D22149204DB431FC350C68E96C330160
-:10E0D0008C46E418019B921B63441201002120002E
-:10E0E000EB641AF055FE9DE700240C252A4206D168
-:10E0F000019D0134A54203D89B000133C7E70024EA
-:10E100000A4206D1019D0134A54203D89B00023387
-:10E11000BDE70024BA4306D1019A0134A24203D8D4
-:10E120009B000333B3E7002401339FE73C68880872
-:10E130002018644602250C406400A5402C00057898
-:10E1400001312C430470BAE77C2E0020A22230B5A6
-:10E15000164B52009A5A002A26D1002824D01A00C1
-:10E16000B4321268801A1A00FC32546D0109800919
-:10E17000A04200D25065AC331800032204688B081B
-:10E18000E3180C00150014406400A5401C78013110
-:10E19000AC431C7004688B08E35C0C001440640002
-:10E1A00023411340022BE9D030BDC0467C2E002015
-:10E1B0000F2203000240002070B5824228D1154C86
-:10E1C00010002100B4310968994221D82000B830EC
-:10E1D000056810009D421BD9AC345B1A24681909EC
-:10E1E0009B09E55C0800032318404000054110002E
-:10E1F0001D40012D0CD14D1C2E00AA08A25C1E4012
-:10E2000076003241681A1A400135022AF4D0000122
-:10E2100070BDC0467C2E0020F0B585B007000D0013
-:10E220000292002807D101002800FFF7F5FE060042
-:10E23000300005B0F0BD002903D1FFF787FF2E00A5
-:10E24000F6E70F2100260140B142F1D153480E00FC
-:10E250000300B4331B68BB42EAD80200B83212682C
-:10E26000BA42E5D9FB1A1A0900920200AC321268D0
-:10E270009B090192D25C0323009C23405B001A415E
-:10E2800003231A40012AD3D14233FF33C35A002B50
-:10E29000CED129000F310909B0308C460168032620
-:10E2A00089000391210014000131039A914212D296
-:10E2B00001988A08825C08003040400002413240E8
-:10E2C000022A02D101340131EFE7002A03D10133E0
-:10E2D000E2186245F7D3644501D13E00A8E76445E2
-:10E2E00021D9009B032663441900009B0800E21813
-:10E2F000AC239C46294B9C44634605001B6884085C
-:10E300001C19330035406D00AB40257801309D432A
-:10E3100025709042F0D1214B8908FC335A6D91420F
-:10E32000DBD25965D9E71B19634523D303250226A0
-:10E330001A49009BAC31E3180191009A62449A4259
-:10E3400009D86346191B090120010A003818002169
-:10E350001AF01EFDC1E70199180009689A088A1889
-:10E360003100284040008140080011780133084303
-:10E370001070E2E7029E002E00D159E7002128002C
-:10E38000FFF74AFE061E00D152E7220139001AF0BB
-:10E39000E3FC3800FFF7DAFE4AE7C0467C2E002097
-:10E3A00010B58CB005A8FFF7CDFD079B0A4C039371
-:10E3B0000093059A069B0949200018F00FFD089B61
-:10E3C000099A01930B9B06490393009320000A9B33
-:10E3D00018F004FD0CB010BD44E802007B400300BF
-:10E3E0009E400300F8B5434E434F3300B4331A68E0
-:10E3F0004249380018F0F2FC00243300B0331B68A7
-:10E400009B00A34223D93F2214422CD13200250085
-:10E41000AC3210680321AA08825C294049000A41F5
-:10E4200003210A4202D10135AB42F3D12A1B7F2AD4
-:10E4300012D992093249380018F0D0FC2C003F2341
-:10E440009C433300B0331B689B00A34204D83800C0
-:10E450002C4918F002FCF8BD2B4B22011A402B4925
-:10E46000380018F0BBFC3200AC321268A308D35C51
-:10E470000322224052001341032213403A32022B5E
-:10E4800031D03032032B2ED03F3A012B2BD1330029
-:10E49000B4331B682201D3581D4954228B4222D029
-:10E4A0001C49083A8B421ED01B49083A8B421AD0AD
-:10E4B0001A490F328B4216D019498B4213D0194991
-:10E4C000123A8B420FD018498B420CD017490532B3
-:10E4D0008B4208D01649043A8B4204D015492632A3
-:10E4E0008B4200D11B3A1449380018F077FC0134F4
-:10E4F00083E7C0467C2E002044E802003C40030035
-:10E5000057400300254F0300F0FF0F007340030046
-:10E510000CA0020048E7020034C20200CC990200BD
-:10E5200060920200F0B20200B4B2020048B00200F1
-:10E53000C0E9020058B1020042000300C37902485A
-:10E54000002B00D1014870478CE7020084E70200ED
-:10E5500010B5F4F7A7FE014810BDC046A4B30200F1
-:10E5600010B50868F4F79EFE004810BDA4B3020081
-:10E5700073B50D00022836D1012601A96868F3F7AA
-:10E580003FF976423400019BC318834212D101A99E
-:10E590002868F3F735F97342734162426241DBB296
-:10E5A000D2B20199F4F7C2FF002820D110491148D6
-:10E5B00016F024FA0278722A01D0772A06D1611C5B
-:10E5C0000ED1723A544254410130DEE7622A01D042
-:10E5D000742A05D1711C03D1743A56425641F3E7AF
-:10E5E0000548FEF7F3FE012676423400CFE776BDFC
-:10E5F000DB030300E8AA0200E340030007224368AC
-:10E6000004481B791340044AD35C002B00D0034814
-:10E610007047C0468CE70200DA00002084E7020061
-:10E6200010B50124037A05499B005A580448224238
-:10E6300000D10448A243CA5010BDC046242B00207C
-:10E640008CE7020084E7020070B5037A064C0500EF
-:10E650009B001859400817F017F801222B7A9B00ED
-:10E6600019590A401A5170BD242B002030B5A2223E
-:10E67000A025D200ED05AA580723CA401100164C68
-:10E680000340E056421EC90700D5421C022A0ADC9C
-:10E69000002082421ADB1149CD5C854201D0C8546A
-:10E6A0000230E25430BD072A09DD0C2A10DC0B4988
-:10E6B0000320CD5C002DF4D10238C854F1E707499E
-:10E6C0000320C95C0029ECD10800EAE70200E8E772
-:10E6D00003200C22E5E7C046E2000020DA0000201B
-:10E6E0001D4B70B559791879FFF7C0FF022805D185
-:10E6F0001A490B689A1C012313430B60184B597974
-:10E700001879FFF7B3FF022805D114494B689A1C0A
-:10E71000012313434B60134C2000FAF79DFB124D6D
-:10E72000A84203D161792079FFF7A0FF0F4C2000A8
-:10E73000FAF792FBA84203D161792079FFF796FF9F
-:10E740000B4C2000FAF788FBA84203D161792079AD
-:10E75000FFF78CFF70BDC046DCA20200242B002016
-:10E760007CA202006CA20200E0B10200B4A202008E
-:10E77000C4A20200072203791340014AD05C70470B
-:10E78000DA0000208022044B52001A600123034A61
-:10E790001360034A1360704700E100E00C8C0040F6
-:10E7A000008000408022054B5200DA67044BFF3A9C
-:10E7B0005A600022034B1A607047C04604E100E033
-:10E7C000008000400C8C004070B5002501261E4BD7
-:10E7D0001E4C1D601E4B18601E4BE650C046FFF7D6
-:10E7E000E1FF1D4B1D4AE660E25002221C4BFF2058
-:10E7F000E5500433E25008339218E250C1238022DE
-:10E800009B001203E250053BFF3BE550C22440222F
-:10E81000144BA400195981430A4380211A510C3426
-:10E820001A5909061202120A0A431A51C022043464
-:10E83000195981430A431A51802212041A60802216
-:10E8400052041A6070BDC046D02F002000800040E6
-:10E850003C2B0020FC0F00004C050000701700004E
-:10E860000405000000E100E070B51F4C1F4D636C13
-:10E87000002B0AD0002363641D4B1B689847A82314
-:10E88000DB00EA5800018018E850A36C002B09D087
-:10E890000023A364164B5B689847164B0001EA58A7
-:10E8A0008018E850E36C002B0AD00023E364104B7F
-:10E8B0009B689847A923DB00EA5800018018E850BC
-:10E8C000236D002B0ED000230B4A2365AB580B4958
-:10E8D0005B18AB500A4A1368063313608022094B59
-:10E8E00012045A6070BDC046FC80004000800040A9
-:10E8F0000C000020440500004C05000070170000CB
-:10E90000D02F0020FCE100E0F7B50191032823D8C7
-:10E91000134B8000C758C223124D9B00EF500123B8
-:10E9200044192364A8230F210F4EDB009C46E358B3
-:10E93000AE59921BD218D3170B409A1801990B4B62
-:10E940001211C150C1239B00EF50634600200132D9
-:10E9500012019619E650FEBD01204042FBE7C04679
-:10E9600044BC0200008000404C0500000C00002068
-:10E9700003280BD8074B8000C158C223064A9B00CE
-:10E98000D150064B064AC250002070470120404239
-:10E99000FBE7C04644BC0200008000400C000020A1
-:10E9A000114A020010B5024B1B68984710BDC046C3
-:10E9B0003C2B002010B50024054AA1008B58002BE9
-:10E9C00002D00020885098470134042CF4D110BDA7
-:10E9D0002C2B0020074A89008B58002B06D1885029
-:10E9E00080211800044A49045160704701204042C8
-:10E9F000FBE7C0462C2B0020FCE100E0F8B50E0040
-:10EA000005001400FFF7CEFE330003272B433B42E3
-:10EA10000BD1BC4209D9A208310028000AF092F8B3
-:10EA20002300BB43ED18F6183C40002C04D0220014
-:10EA30003100280019F0BAFD80220449D2008B5819
-:10EA4000002BFCD0FFF79EFEF8BDC04600E0014061
-:10EA5000F0B5060000248BB0194B1A48E15804F0B9
-:10EA600001F803AFE05104341C2CF5D11423002429
-:10EA7000734301930025AB00F958134816F090FC3E
-:10EA80000135300014F009FE072DF4D1013DAB0033
-:10EA90000D48F95816F084FC300014F0FEFD013DDD
-:10EAA000F5D20134082C03D100F0D4FD0BB0F0BD39
-:10EAB00001231C42DED1019814F0EFFDDAE7C046D5
-:10EAC000B0BC0200ECB402001C00002010B51920FC
-:10EAD000FFF7BEFF004810BDA4B3020070B51500DB
-:10EAE000040015F0FAFF2A000249200015F0B3FFD8
-:10EAF00070BDC046BD4A020070B543790D000024C8
-:10EB0000032B06D9836A074C9200E41AC369D358D1
-:10EB1000E418032115F0D2FF4470241205708470AC
-:10EB200070BDC046FD7F0000F7B500230400617191
-:10EB300083608371E260036101330F00150043615C
-:10EB4000032906D80121836949429A00C0691AF055
-:10EB50001FF90023A3622362AA8BEB8BD218002A31
-:10EB600000D10132384E2000310015F074FF2A8C9C
-:10EB70003100200015F06FFFE3682000197D15F0CB
-:10EB800096FFE3682000997D15F091FFE36820006F
-:10EB9000197E15F08CFFE3682000997E15F087FF41
-:10EBA000042F27D1636A226A31009A1A200015F0D7
-:10EBB00052FF3100EA89200015F04DFF3100AA898B
-:10EBC000200015F048FF0026AB8CB34217DCFF2174
-:10EBD000200015F082FF042F35D1EA8A2B8B0237F3
-:10EBE000D31801930023019A9A422CD0AA8C0021B9
-:10EBF000009223E00221200015F04CFFD9E7AA6A19
-:10EC0000F300D3181A78032A03D19978200015F05D
-:10EC100064FF0136D8E70126A86ACA008218507836
-:10EC200030420AD05088984207D15268D200606BB7
-:10EC300099003A430A500133D5E70131009A8A42DC
-:10EC4000E9DC0222F2E7F7BD954A0200F7B5234B53
-:10EC50000500A8331B680191022B0DD847698F422C
-:10EC60000AD2836A0269CF1B9C1A3B00234304D15A
-:10EC7000AB6A2B61019B6B61F7BD062F01D90F2C8D
-:10EC800018D900941F2C01D91F230093009B002644
-:10EC90009C4203D83E00032F00D9032601212800FF
-:10ECA00015F0F8FE009A730113430370009BBF1B1D
-:10ECB000E41ADAE70A4B3E009F4200D91E00022107
-:10ECC000280015F0E7FE702233091340F03A224382
-:10ECD0001343037046700094E8E7C0467C2E002082
-:10ECE000FF07000070B50D000121040015F073FF4F
-:10ECF0000E2D14D00F2D17D010210D2D10D017214F
-:10ED0000200015F0EAFE0322A36A04210333934393
-:10ED1000A362200015F0D2FE044B036003E0112132
-:10ED2000200015F0DAFE70BD1221F9E7E88F02002D
-:10ED3000F8B5174F05000C0016000F40002A1AD135
-:10ED4000110015F048FF23040FD53221280015F0DB
-:10ED5000C4FE3221280015F0C0FE3221280015F033
-:10ED6000BCFE3221280015F0B8FE3A0035212800FB
-:10ED7000FFF7C2FEF8BD3A004621FFF7BDFE7F2334
-:10ED8000210A99433143C9B2280015F0A6FEF1E7E4
-:10ED9000FF7FFFFFF0B5124B87B003AD40C90138CC
-:10EDA00000930195032303F0B7FA68680D4F1E2402
-:10EDB000B84202D014F062F844B2A8680023B84206
-:10EDC00002D014F05BF843B2706803994371047188
-:10EDD00009F0F2FE70680AF059FA380007B0F0BD89
-:10EDE00080BD0200A4B3020030B5124B8BB003AC5F
-:10EDF00020C9013800930194032303F08DFA616860
-:10EE000006A818F075F9039B089A5900237A009315
-:10EE10006868079B08F06CFA021E05D0064907488F
-:10EE2000F9F740FBFDF75AFC06A90548F2F75AF836
-:10EE30000BB030BD98BD0200F0400300E8AA02000C
-:10EE40006092020030B5114B89B002AC20C9013884
-:10EE500000930194032303F05FFA012205A960687F
-:10EE6000F3F7C6FF029B059A5900237A009368685E
-:10EE7000069B08F04DFA021E05D005490548F9F732
-:10EE800011FBFDF72BFC044809B030BDB0BD0200FA
-:10EE900002410300E8AA0200A4B302000021F8B571
-:10EEA0004768080017F0C0FD08250600B1223B683E
-:10EEB000D2009D508022002092001900985001221B
-:10EEC000FC319A6088605A61104A8868002803D132
-:10EED000002A19D0013AF8E70024A24204D00C4AD3
-:10EEE0009C5863425C41E4B238000AF0CFF9002C30
-:10EEF00005D001216B001943300005F06DF9013593
-:10EF0000782DD3D13000F8BD1400EDE710270000B4
-:10EF1000C404000010B5040001F018FD074B020006
-:10EF20001B690749074817F059FFFFF739FA012C09
-:10EF300001D1FFF757FA044810BDC0467C2E0020CF
-:10EF40001541030044E80200A4B3020010B5F3F732
-:10EF500095FDF5F763F8014810BDC046A4B3020063
-:10EF600010B5FEF71BFF014810BDC046A4B3020058
-:10EF700010B5FEF709FF014810BDC046A4B302005A
-:10EF800010B586B0040005AB04AA03A902A801F0DD
-:10EF900003FE059B029A0193049B064900930648D1
-:10EFA000039B17F01BFF012C01D101F031FE034838
-:10EFB00006B010BD2A41030044E80200A4B30200D9
-:10EFC00010B5084C002805D1A834236801305B0037
-:10EFD000184310BD0868F3F751FDA83420600248BB
-:10EFE000F7E7C0467C2E0020A4B3020001220100F6
-:10EFF00003001140100000290CD10800990709D125
-:10F000001B68054910008B4204D00448181A43427B
-:10F010005841C0B27047C046ECB8020094E7020005
-:10F020000023FA21094A89001360094A1370094A2A
-:10F030001360094A1160094A1370094A111D083208
-:10F04000D3670122CB67074B1A707047442B00200F
-:10F05000322E0020402B002018000020332E0020EC
-:10F060007C2E0020342E002010B5084B084A197859
-:10F07000002907D1916C002902D0FFF7D1FF10BD04
-:10F0800030BFF4E700221A70F9E7C046342E0020A2
-:10F090007C2E0020837F0248002B00D1014870475E
-:10F0A0008CE7020084E702000023A022E02110B5D3
-:10F0B00083770C4BD2050902D1500B48F9F7EAFED1
-:10F0C0000A48F9F7E7FE0A48F9F7E4FE0948F9F7B4
-:10F0D000E1FE0948F9F7DEFE0848F9F7DBFE0848CB
-:10F0E00010BDC0460C050000CCA20200D4A2020054
-:10F0F000E4A20200ECA20200FCA2020074A2020040
-:10F10000A4B30200F8B5164C2368002B07D14820A1
-:10F1100019F0B8FD0500134908F0DCF92560124824
-:10F12000124902680B68D21A0123312A04D96233CA
-:10F1300093429B415B420233002201260C4D2E700C
-:10F140002F78032FFCD101329342F8D10368206855
-:10F150000B6018F064FF430001201843F8BDC0465F
-:10F16000482B002098BE0200D02F00204C2B0020FE
-:10F17000352E002030B50D4C87B02378012B13D1EC
-:10F180000B4B02221D680621002302A818F0D0F8BC
-:10F19000082204A9684619F0DFFD039B029A2800A3
-:10F1A00008F014F90223237007B030BD352E00207B
-:10F1B000482B0020A02010B51049C0054B7F5A1CD9
-:10F1C000002B09D14C8C0E4BA3430E4C03510E4B1C
-:10F1D0004A775200D05A0FE010335B00CB185C889E
-:10F1E000A123DB00C450092AF1D10120FFF7C0FBA5
-:10F1F000FFF7C0FF0120404210BDC0461C000020A8
-:10F20000F01F00000C050000B4F6020073B5041EE8
-:10F2100009D11A4D2B78002B2CD01949194816F01A
-:10F22000BFF82C7073BD184D2B1DDE6FF3F73EFB3E
-:10F23000164B2100984214D0154B2340062B05D0C5
-:10F24000A30712D1134B22689A420ED101A92000C4
-:10F25000F2F7D6FA019B012B0CD1007817F003FBD3
-:10F260000100300016F09CF8DCE70B490B4813F066
-:10F27000BDFFA864FFF7D4FED4E7C046332E0020BC
-:10F2800068E402001C0000207C2E0020C8E402007C
-:10F29000070080FFCC990200DE41030050AC020061
-:10F2A000F7B5A123A021214AC905DB00CA500123DB
-:10F2B000C27F0D3293401E4A8B50C37F01920133AF
-:10F2C000DBB2032B2FD0C3770200030000212233CF
-:10F2D0003632198002339342FBD10424C17F154F8B
-:10F2E0004D000522EB5D7E195343134A7678D318FF
-:10F2F0009B190126A640B44662461B7901345B0087
-:10F30000C3185E8C063516435E840D2CE9D10122AC
-:10F310000D318A40A023A121DB05C9005A50828EFD
-:10F3200001995A50F7BD0023CDE7C046F01F0000F9
-:10F330000C050000724103001C00002070B5394B21
-:10F340008CB01A78022A07D1A0223749D2008A58F5
-:10F35000012A07D003221A70344DAB7F002B03D152
-:10F36000FFF708FF0CB070BD2800FFF799FF304A87
-:10F37000304913680968063313608B4207D30024B1
-:10F380002D4B14601B78012B0FD0022B45D000238E
-:10F390002A8C6B77FF33FF331A42E1D0E1222749F1
-:10F3A000D2000120FFF7B0FADCE7254E331DDB6FFA
-:10F3B000002B04D033000833DB6F002B02D1FFF7A2
-:10F3C0002FFEE4E7FEF7E0FC6846FDF761F9002850
-:10F3D0000CD11C4B1868FDF703FC0400FDF776F90F
-:10F3E000FEF7DCFC2000FFF711FFD0E7FEF7D6FCAC
-:10F3F000019B15491868FCF76FFC0028F2D10198B1
-:10F40000F3F754FA114B984203D11149114817F000
-:10F41000E5FC019B0024B364E4E70F49280015F0E4
-:10F42000BFFFCCE7352E0020007000401C000020FC
-:10F43000402B002018000020322E0020B5F10000E3
-:10F440007C2E0020442B00209CAB020034AA02003A
-:10F45000D608030044E8020068E40200F0B5002486
-:10F4600085B0154D02930AAB1B782E1D0700083599
-:10F470000800210001920393F467EC67FDF776FB27
-:10F480000E4B019A18600E4BF7671A60029A0D4BEB
-:10F49000E8671A700C4B1C70FDF7A2FBFFF7B6FE75
-:10F4A00001220A4B1C600A4B1A70039BA34201D035
-:10F4B000FFF7DAFD05B0F0BD7C2E0020442B0020C4
-:10F4C00018000020332E0020342E0020402B002076
-:10F4D000322E0020F0B50024384B8FB01D1D0833AC
-:10F4E000DC67374BEC6709AD80C9013801950093A3
-:10F4F000052302F011FF6B68099C049307942B7B92
-:10F500002E7A05932B7C20000393FFF76FFD2D4D82
-:10F51000002806D103232340022B09D12C40062CBE
-:10F5200006D007AB002201212748F1F75BFD0790C9
-:10F5300007980540062D05D0830730D1224B02687D
-:10F540009A422CD108A9F2F75BF9089B002B23D033
-:10F55000012B0DD1002E0BD1039B002B08D100787D
-:10F5600017F081F907900799380015F019FF13E09B
-:10F57000079803F05FFB079009AB1B7C002B03D0BF
-:10F580000798F5F739FF0790059B049A00930799B0
-:10F5900033003800FFF762FF0C480FB0F0BDF3F7FF
-:10F5A00085F90B4B9842E7D1002E02D1039B002B2B
-:10F5B000D9D007A90120F7F75DF8DCE77C2E002001
-:10F5C00044BF0200070080FFCC990200A4B30200F0
-:10F5D000C8E4020070B51B4B8AB005AD40C90138C4
-:10F5E00000930195052302F097FE059C20000494EA
-:10F5F000FFF7FCFC002807D103232340022B0AD18C
-:10F60000114B1C40062C06D004AB002201210F48F0
-:10F61000F1F7E8FC049003A90498F2F7F1F82A7CCA
-:10F620002B7B03990092059A03F0EEFA2B7A0100E6
-:10F630000093300000236A68FFF710FF04480AB007
-:10F6400070BDC0466CBF0200070080FFCC9902006D
-:10F65000A4B302000022074B10B51A70064B023209
-:10F660001A70064B064A1B68063B1360FFF7FCFC4A
-:10F6700010BDC046342E0020322E0020180000207D
-:10F68000402B002010B5FFF7E5FF014810BDC04634
-:10F69000A4B3020010B5042901D8042A02D90948EC
-:10F6A000FDF794FE092B01D90748F9E705246143CA
-:10F6B00041188A18137101229A40038C1343038462
-:10F6C00010BDC04608090300EB410300F8B54868C7
-:10F6D0000C000D68F3F7D2F90600A068F3F7CEF935
-:10F6E0000700E068F3F7CAF93A0003003100280088
-:10F6F000FFF7D0FF0048F8BDA4B3020010B50429FD
-:10F7000001D8042A02D90448FDF760FE05235943B5
-:10F7100040188018007910BD0809030070B5104C1E
-:10F72000050021000F48F9F7CBFB21000E48F9F73F
-:10F73000C7FB21000D48F9F7C3FB21000C48F9F77E
-:10F74000BFFB21000B48F9F7BBFB21000A48F9F782
-:10F75000B7FB15F0ABFE01230848AB7770BDC04680
-:10F76000C0B10200CCA20200D4A20200E4A20200B6
-:10F77000ECA20200FCA2020074A20200A4B30200E8
-:10F7800070B50D00F3F7DEF9041C2800F3F7DAF981
-:10F79000211C0BF03DFA051C15F095FE011C281CE0
-:10F7A0000BF004F9211C0AF08FFD03230200022054
-:10F7B0009A43024B1043C01870BDC04600008080C1
-:10F7C00010B515F080FE0323020002209A43024B7D
-:10F7D0001043C01810BDC0460000808010B5074C13
-:10F7E000002802D00868A04203D106F05DFC20008A
-:10F7F00010BDF3F76FF906F077FCF8E7A4B3020049
-:10F8000010B50400F3F7ACFAF3F738F9002803DC7D
-:10F810000021064815F0F2F806F020FC15F034FF40
-:10F82000042201002000F3F7B1FA10BD44A9020040
-:10F8300010B50400082016F020FD024B4460036060
-:10F8400010BDC04680C0020010B5102016F015FD96
-:10F850000400034B08C011F0DAFF200010BDC046C1
-:10F86000ECB8020070B50C00052804D80AF030FA94
-:10F8700006030C04131C0024200070BD8B680E4C82
-:10F88000002BF9D10D4CF7E7081D12F027FC0124DD
-:10F8900040000443F0E7FFF7D7FF211D05000430C7
-:10F8A00012F042F92C00E7E7FFF7CEFF211D05001B
-:10F8B000043012F049F9F5E78CE7020084E7020012
-:10F8C00070B5050083070CD1104B02689A4208D12D
-:10F8D000FFF7BAFF291D0400043012F01AF92000C6
-:10F8E00070BD2800F3F7CAF8C0231B06984206D162
-:10F8F00080200021C00515F0B8FE0400EFE70124C8
-:10F90000C317C018584040000443E8E7ECB80200B1
-:10F9100007B5C30701D540100EBD043001A9F1F7AA
-:10F9200007FA002801D00198F6E70249024815F0CD
-:10F9300065F8C0460442030024AB0200F0B58BB06A
-:10F94000019001200D00170008402BD04B1002221F
-:10F9500003A904A811F093FF04AEFB072BD57B107D
-:10F96000022203A904A811F08AFF04AD019B092B10
-:10F9700001D0162B3FD16B68002B68D0300012F0FD
-:10F9800008FC041C280012F004FC011C201C0AF0D6
-:10F9900035FE032302249843704B0443E4182000EF
-:10F9A0000BB0F0BD03240C4023D16D4B0A689A4282
-:10F9B000F5D10E1DD1E703231F4205D1684A3968EE
-:10F9C000914201D13D1DD1E73B40022B0CD1654B4B
-:10F9D0003B40062B08D0300012F0DBFB3A00011C44
-:10F9E0000198F8F747FF04E03A0029000198FCF776
-:10F9F00017FE0400D3E7019B182B00D98AE0FFF71C
-:10FA000023FF040001980AF063F9444A3E50500D68
-:10FA100013191F72336572444A3E50500D13191F5B
-:10FA200072336500201D2A00310012F025F9B6E777
-:10FA3000201D2A00310012F059F9B0E7201D2A00DC
-:10FA4000310012F086FAAAE76B68002B03D1464911
-:10FA5000464814F0D3FF07A811F0D9FE2B0032005E
-:10FA6000201D07A9F0F7FEFF07A811F0D5FE96E7C5
-:10FA70006B68002BEBD007A811F0C9FE211D2B00ED
-:10FA8000320007A8EEE7201D2A00310012F06FF9BE
-:10FA900085E7201D2A00310012F0E5F97FE7201DDF
-:10FAA0002A003100F0F768FF79E73800FFF730FFF0
-:10FAB000021E02DA2E48FDF789FC019B201D310051
-:10FAC000032B01D0102B02D1F0F7EEFE67E712F006
-:10FAD00072F864E76B68002B03D02B78DB0700D546
-:10FAE00079E7201D2A00310012F0B6FA57E76B685B
-:10FAF000002BACD0FFF7A8FE0700211D04302B001F
-:10FB00003200F0F7AFFF07A9022007970894F6F735
-:10FB1000B1FD6EE72900300011F0D8FF0300019815
-:10FB200000241938042800D939E7124C0AF0D0F81B
-:10FB30000308120B0F00002B00DB30E70E4C2EE702
-:10FB4000002BFBDC2BE7002B00DD28E7F6E7002B82
-:10FB5000F4DA24E7002B00D021E7EFE700008080F3
-:10FB6000ECB80200070080FFA40D030004AD020002
-:10FB70001B3B030084E702008CE70200044B886013
-:10FB80000B60044B08004B600023CB607047C046FD
-:10FB90002C98020067570200044B0B60037A0B712C
-:10FBA000436808008B600023CB607047B0C102003F
-:10FBB00010B504000C2016F060FB034B446003609A
-:10FBC0000223037210BDC046ECC1020010B5043020
-:10FBD00013F02DFC004810BDA4B30200002803D090
-:10FBE000012808D0002005E007224B680448934311
-:10FBF00000D1044870474B68DB085B001843F9E705
-:10FC00008CE7020084E702000B6870B506000D0067
-:10FC1000181D49681400F8F7AFFF002802D04368A8
-:10FC2000002B10D1022E08D1094B022C06D1696895
-:10FC3000084813F0D4FAFCF751FDAB68012C00D151
-:10FC40004360180070BD022CFBD100224260F8E72F
-:10FC5000A4B3020080A9020070B504000D000B7A65
-:10FC6000164A9B0086B0995816F0F7FF14492000F9
-:10FC700016F0F3FF134B02AA02932B7A012613719D
-:10FC80006B68019304930023059302A815F075FD9A
-:10FC9000051E05D10C49200016F0DFFF06B070BD2F
-:10FCA000002E03D10949200016F0D7FF01222900B8
-:10FCB0002000F2F713FE0026E7E7C04628C2020044
-:10FCC0007A420300B0C102007D42030005FC02003D
-:10FCD000F0B513681400012287B00F680D00009280
-:10FCE000D9080223060002F0E7FA022E12D10323FC
-:10FCF0006868034018D101682A4AC968914213D143
-:10FD00002A68904206D0059305A9686815F016FD8B
-:10FD1000061E01D100253EE0381D01223168F8F7AA
-:10FD20002BFF73684360EFE70021FCF71FFF039090
-:10FD30000398FCF77DFF0028ECD00021FCF716FFAC
-:10FD40000500FCF775FF02902800FCF771FF060024
-:10FD50002800FCF76DFF029B002B03D0002E01D082
-:10FD6000002802D01048FDF731FB381D012202990E
-:10FD7000F8F702FF4660DBE7A368EE009E193168E2
-:10FD8000002907D0042905D0381D0122F8F7F4FE18
-:10FD90007368436001356368AB42EDD8034807B030
-:10FDA000F0BDC0461D00010054420300A4B3020090
-:10FDB00030B5002585B001A90400019515F0BEFC01
-:10FDC000A84203D109490A4814F018FE636802A941
-:10FDD000083B63600368029343680393042328C0CD
-:10FDE0000220F6F747FC05B030BDC04631420300A3
-:10FDF00080A90200F7B50C0015001B280DD00023C8
-:10FE00001F2808D1081D00222900F8F7B5FE2C4B49
-:10FE1000002800D12B4B1800FEBD03222B001340FD
-:10FE2000114225D1284922688A4221D1002BF1D1E3
-:10FE3000296891421ED1009301936946200015F074
-:10FE40007DFC01A90700280015F078FC0600002FB2
-:10FE500031D00028DED031683868F2F7BDFD0028C7
-:10FE6000D8D071687868F2F7B7FD0028E5D1D1E7FE
-:10FE7000002BCFD1154B2A689A42CBD16A686368B0
-:10FE8000534007229343C5D1019301A9200015F0E7
-:10FE900055FC061E01D10A4BBDE7281D0022316822
-:10FEA000F8F76AFE0028B5D041687068F2F794FD53
-:10FEB0000028EAD1AEE7024B0028ABD1ABE7C04641
-:10FEC0008CE7020084E7020070C2020034C2020024
-:10FED000F7B50B681C4A04000D00934203D05A6822
-:10FEE0001A4916F07BFF1A49200016F0B6FE0023CF
-:10FEF0000127019301A9280015F020FC061E0CD152
-:10FF00001449200016F0A9FE2B680F4A934203D033
-:10FF10001149200016F0A1FEF7BD002F03D10F49B3
-:10FF2000200016F09AFE012231682000F2F7D6FC7C
-:10FF30000B49200016F091FE012271682000F2F7B3
-:10FF4000CDFC0027D6E7C04634C202005042030071
-:10FF500003FC02001E0703006002030005FC020010
-:10FF6000213A030010B504000C2016F086F9034B6B
-:10FF7000446003600023037210BDC046ECC1020060
-:10FF800010B504000C2016F078F9034B44600360B0
-:10FF90000123037210BDC046ECC1020010B504304D
-:10FFA00000220C00F8F7E8FD002805D121000348E5
-:10FFB00013F015F9FCF792FB406810BD80A9020010
-:10FFC00010B5024B08C013F017FA10BD34C202007E
-:10FFD000F8B50E00070000217068FCF7C7FD0E4C55
-:10FFE0000500022F00D9B4687068F2F761FE00289E
-:10FFF00009D115F0ECFB06002800FCF719FE011EE4
-:020000040001F9
-:1000000003D13000F8BD4010F3E7331D0122180082
-:10001000F8F7B2FD4460EFE7A4B30200F0B50700C3
-:1000200089B000201E000D00019215F0D0FB0E4B90
-:10003000040007609F4203D1042302791343037134
-:10004000019B2B430DD03368AA00B218019905A873
-:100050000394049313F0DEF9681C05AA03A9FFF7C3
-:1000600037FE200009B0F0BD70C2020010B50C00D0
-:10007000002A03D115F0EEFB0A480EE0042A0DD148
-:1000800004300022F8F778FD002805D12100064849
-:1000900013F0A5F8FCF722FB406810BD15F0D0FB6B
-:1000A000EAE7C046A4B3020080A9020010B501002F
-:1000B00083880120A0229840044BD205D050CA88E2
-:1000C000083117F0C7F8024810BDC0460C05000003
-:1000D000A4B30200EFB5070008001500F98802007C
-:1000E00000233868F2F7A2FD03267043002D14D0D8
-:1000F0003F18042D14D101237A7A01A952001A4322
-:1001000001923A7A30009A401A430292BA7A9A409F
-:1001100013430393F6F7AEFA0500280004B0E0BDE0
-:10012000310001AA2800F2F76DFD019B1868F2F773
-:10013000A5FC019B06005868F2F7A0FC019B050096
-:100140009868F2F79BFCFF2E03D8FF2D01D8FF28FB
-:1001500002D90448FDF73AF93D727E72B872024D39
-:10016000DBE7C046BA420300A4B30200F7B51C00A7
-:10017000002300930233080011001A0002F09CF8DB
-:10018000206812F07BFE47B26068F2F777FC041E2D
-:1001900002DC1048FDF71AF90326300060430830EE
-:1001A00016F06BF80C4BA2B2050087807243036017
-:1001B000C4800021083018F0EBFD3B00A022C133C1
-:1001C000FF33D2059B009E500123BB40034928000A
-:1001D0005350FEBDA142030004C302000C05000001
-:1001E000032210B50400C38800215A43083018F0D8
-:1001F000CFFD2000FFF75AFF004810BDA4B3020056
-:100200000523020070B5094C094D20684343094895
-:100210009B189B0018582B682260C0180F231940A8
-:1002200009012860F7F7BCFD70BDC046502B0020C7
-:10023000442A002040C30200A839030000B508008A
-:1002400006292ED809F044FD040A10161B212800A7
-:100250009A18E223DB00D218107800BDC432920055
-:10026000D05C8006800EF8E7C4329200D05AC004F9
-:10027000400EF2E7C4329200D0580003F8E7C432CF
-:1002800092009A1890780009E7E7C43292009A1811
-:10029000D0780007000FE0E7C43292009A18D078B7
-:1002A000F1E7024B024A00201A60D6E70400002062
-:1002B000C9420300A83910B504000800062949D82E
-:1002C00009F006FD040A141F2A343F00E221A21897
-:1002D000C9005218137010BD3F210B401800C432E2
-:1002E0009200135D8B4303431355F4E77F21C4321F
-:1002F000920019401948135B890103400B431353C3
-:10030000E9E77F21C432920019401059144B490388
-:1003100003400B431351DEE70F20C4329200A218B2
-:100320001901937803400B439370D4E70F210B40DE
-:100330001800C4329200A218D3788B430343D370C1
-:10034000C9E70F20C4329200A218D1781B010140E6
-:100350000B43F4E7034B044A1A60BCE73FE0FFFF9E
-:10036000FF1FF0FF04000020E7420300F0B5D2B207
-:1003700085B00E000293072113000B40013BDBB256
-:10038000042B02D9294C2A4D25608A431F02002ADA
-:1003900024D1284B3578C45C274B2409E443E4B2CC
-:1003A0002D1BDB19EDB2039308276319039ADBB207
-:1003B000D35C5A00D2B25BB20192002B33DA1A211D
-:1003C0000320013FFFB2FFF71BFF019B002FF0D17D
-:1003D0000134E4B2002CE7D135701AE0D443174958
-:1003E000E4B2CE5C0825144B1B19DB5D5A00D2B277
-:1003F0005BB20192002B0FDA05210220FFF700FF0C
-:10040000013DEDB2019B002DF0D10134E4B2002C8E
-:10041000E8D1029805B0F0BD31000120FFF7F0FEF1
-:10042000002EE9D0ECE706210420CAE704000020F2
-:10043000D4420300190700005F480300BA4E0300CE
-:100440000022F0B505000F00FF200F248BB008AB91
-:10045000654EDA710100C431890069188B781A0978
-:10046000B25C234012011343CA788B7013071B0F31
-:10047000F35CA243234013431A09B25C23401201E8
-:100480001343CB700138E5D2E223DB00EE5CB30806
-:10049000F31ADBB20493554B1B68002B0BD0E222FE
-:1004A000C4218120D200890000013B00AA186918EC
-:1004B0002818FDF7EDF900244823029403930194D2
-:1004C000009481222B1912019B181B7818000593A8
-:1004D0000723984320D008A92300059A0731280054
-:1004E000FFF744FF0230C4B2023FFFB2002F78D0C2
-:1004F0002B780393013EF6B2002E47D1E2222B194E
-:10050000D2009B181E78B308F31ADBB204930023C1
-:10051000029301930093D4E7354B009A9C469A5C72
-:100520002300C4339B00EB18997809090A43314929
-:100530008A5C019907926246DB78525C1907090FC1
-:100540000A432C491B098A5C2B490692029A8A5C51
-:1005500006991343079A8A182649C95C012389180A
-:10056000FF2A00DC031CC918882309061B06C918CA
-:10057000090F0020FFF744FE039B013BDBB203930E
-:10058000002BB7D10134E4B2013FAEE7049B013B3D
-:10059000DBB20493002B02D1059B002B18D1220063
-:1005A000C4329200535D00999B069B0ECB18DBB2C0
-:1005B0000093535B0199DB045B0ECB18DBB2019314
-:1005C0005359029A1B035B0ED318DBB2029378E7F0
-:1005D00008A92300059A07312800FFF7C7FE040089
-:1005E0008CE70BB0F0BDC046E3430300582A00205F
-:1005F000AF4D0300BB4503005F470300064B1B5C88
-:10060000002B05D0054B185C4843C011C0B27047A1
-:10061000034B185CFBE7C0460B470300844503000F
-:1006200044440300064B1B5C002B05D0054B185CB3
-:100630004843C011C0B27047034B185CFBE7C0468B
-:100640000B470300BF4E030094440300F0B5037A48
-:100650008DB004007F2B00D157E103000700002577
-:100660000933FF330837099301953E787F2E00D078
-:1006700087E000230693019306998B00E318039308
-:100680001A7A481C1B7BC0B206907F2B00D11BE15D
-:100690009F49CE5C8D5C9F49AE4200D0F1E08D5CFD
-:1006A000CB5C0493039B597A019B5918CBB20193FD
-:1006B000049BEB18DBB20793023B1B06DCD4A82794
-:1006C000019B5D1BEBB20593A82F00D0E1E0039BDB
-:1006D000039A5B7A527B5B08520899180291019940
-:1006E00001988A18E221C31AD2B2DBB2C900A2185B
-:1006F000E31852185B18157818782D1AEDB27F227E
-:100700002B006DB293430893EB17E81858400299F9
-:1007100009F062FC2800CBB20299099309F076FB3C
-:10072000059A00251600C3B20A93029B9B18DBB200
-:100730000B93320039002000FFF77EFD0A9B013643
-:100740000B9AC018F6B2C3B2964200D1B6E0099A2D
-:10075000AD18029AEDB2AA420DD8AD1A20216A4610
-:1007600052181278EDB252B2002A00DAA4E0002B3F
-:1007700001D00133DBB2320039002000FFF79AFDCF
-:10078000D7E7012E77D12B003100019A200015F018
-:1007900076F8BA78604BA1789B185B7830000193AB
-:1007A000FB780893FFF72AFF3F23E17803403000EE
-:1007B0000293FFF737FF7F22584B9B5D1A40584B3F
-:1007C00003929A5D0F231A400492564A925D1A4092
-:1007D0000592554A925D1A4006923F22534B9B5D0B
-:1007E00007937B78EB18DBB20A93029B13400293CA
-:1007F0007F23184083019C462A003F21C432920087
-:10080000135D0F268B4302990B431355135B484925
-:100810000B4061460B431353039B10595903454B3F
-:1008200003400B430498190C314000011351084355
-:10083000A21890701B0E0598B34306990343090153
-:100840001E400E43D67081226319079912019A182F
-:100850001170E222D2009B180899019A01355218B2
-:100860001A700A9BEDB29D42C6D1099B0437BB4268
-:1008700000D0FAE6FDE6022E8BD12B00019AFF2173
-:1008800084E72D48AE4201D9C55C09E78D5C835CE5
-:1008900007E7049B019A39009A18D2B22000FFF7AB
-:1008A000CBFC059A050039002000FFF7C5FC079B2B
-:1008B0002D1AEDB2029322E7013B5BE70137FFB24D
-:1008C000AF2F00D000E7D7E6023189006118019B05
-:1008D000497859186368C9B2002B13D1E2238122E9
-:1008E0001648DB001201E318A518001B1A18C432C1
-:1008F0009200125D1E789206D20EB21A1A7001335F
-:100900009D42F3D12000FFF79BFD0DB0F0BDC04626
-:10091000F4430300BB460300AF4E0300E44403006E
-:10092000F342030043430300934303005F4D03007E
-:100930003FE0FFFFFF1FF0FF34450300F0F8FFFF2B
-:10094000014BD8607047C0467C2E0020034B82B01C
-:10095000D86801ABC01A02B07047C0467C2E002098
-:10096000014B18617047C0467C2E002010B54E2107
-:10097000024812F034FCFBF7B1FEC04660AB020047
-:1009800007B5054A01ABD1681269CB1A9A4201D862
-:10099000FFF7ECFF07BDC0467C2E0020074B5B69CC
-:1009A000002B01D1180006E05A68824204D8801A50
-:1009B00004308000C05870471B68F1E77C2E00208F
-:1009C00070B5144D04006B699868DB68834215D3D9
-:1009D0000230C00015F05EFC6B69002803D19868F6
-:1009E0004000FCF7DDFC5A68D96803609B68521828
-:1009F0005B00836000234260C36068616A69D368FA
-:100A00005068591C04339B000138D16040189C5039
-:100A100070BDC0467C2E0020074B4118884204D38D
-:100A2000D8B2002800D1013070475A01D31802789B
-:100A300001305340F2E7C04605150000034B044A5D
-:100A40005A6100229C331A607047C0467C2E0020F9
-:100A5000A4C30200F0B585B001900E00FFF7DCFFE3
-:100A6000144B02905C69002C01D120001EE027008D
-:100A700010373D00E3689B00FB180393039B9D42E6
-:100A800001D32468EFE72868029A037893420FD1D4
-:100A90004378B3420CD102303200019918F04DF97D
-:100AA000002805D1ED1B6068AD10281805B0F0BD19
-:100AB0000435E3E77C2E0020F0B585B0039001916A
-:100AC000FFF7C8FF002861D1314D019B2F009C37F3
-:100AD000DC1C3B68002B18D02E002E4AA036126872
-:100AE00031680292A2188A420FD9020061181800D8
-:100AF00015F0EEFB0290002822D1264B0200196867
-:100B0000386815F0E5FB029B3B602B009C331B68AB
-:100B1000002B20D12600802C00D2802630002F0010
-:100B200015F0B8FB9C37386000280DD1200015F077
-:100B3000B1FB26003860002806D12000FCF730FC0D
-:100B400033681B193360E0E72B00A0331E602B00D5
-:100B50000022A4331A602B00A4331A689C352D6838
-:100B6000A41801990398AD181C60FFF755FF019B6D
-:100B700028701A006B70A81C039918F0EDF8002279
-:100B8000019B2800EB189A70FFF71AFF05B0F0BD23
-:100B90007C2E0020202F0020F7B51D00160000231A
-:100BA000070003600B6033602B60174B00915C699A
-:100BB000002C02D0154B9C4204D133682A68D3180C
-:100BC0002B60F7BD3B6801333B60E268009B9446B5
-:100BD0001B68009A0193634413602200E36810329B
-:100BE0009B00D3189A4207D32000FDF7E1FA2B6847
-:100BF000246818182860DBE702CA30684978033097
-:100C000009183160EEE7C0467C2E0020A4C3020024
-:100C10000C4B70B55C69002C02D00B4B9C4200D190
-:100C200070BD2600E36810369D007519AE4201D3F1
-:100C30002468F0E704CE05490232054816F0CEF8E4
-:100C4000F4E7C0467C2E0020A4C30200FC4E030043
-:100C500044E80200044B054A98331B6804481A60B4
-:100C6000044A9A807047C0467C2E00207800040019
-:100C7000A4B3020004040000084A10B5130098331E
-:100C80001B689979002908D0916C0029F9D00021BE
-:100C900099711B695879FCF7F7FE10BD7C2E002076
-:100CA00013B5084C98342368188814F0EDFC2368B9
-:100CB0000090588814F0E8FC694601900220F5F78E
-:100CC000D9FC16BD7C2E002010B50D4C002803D099
-:100CD0000868F6F7ABFB04000A492000F8F7F0F8C3
-:100CE00060790021FCF7D0FE2000F8F7D3F800224D
-:100CF000054B064898331B681A619A7110BDC046AF
-:100D00006CA20200D0B102007C2E0020A4B302002D
-:100D10001FB50C4B02AC00930194022301F0FCFAC6
-:100D2000029A002A03D0084B98331B685A806268E5
-:100D3000002A03D0044B98331B681A80034804B080
-:100D400010BDC04694D002007C2E0020A4B3020047
-:100D5000F0B5254B89B004AC00930194042301F055
-:100D6000DBFA224F224A3B0098331B6804989A8092
-:100D7000204B0340062B06D0830730D102681E4B60
-:100D800092699A422BD1012303940293002598374C
-:100D90003B681869F8F77EF83B6860681D61F6F7F4
-:100DA00045FB16490600F8F78BF83B68144A9D711D
-:100DB000126802999A60227B9981DA71DD81039A27
-:100DC000012900D112685A6101221E619A71237AA9
-:100DD000002B01D0FFF750FF0A4809B0F0BD03AA6D
-:100DE00002A9F1F7EDFED1E754D002007C2E0020DD
-:100DF00004040000070080FF9D1D0000D0B1020028
-:100E0000D02F0020A4B30200F0B5274B89B004AD69
-:100E100001950093042301F07FFA6B68A868049E93
-:100E20000393F6F703FB214F040098373B681869DA
-:100E3000F8F730F800223B681D491A612000F8F7E6
-:100E40003FF8607980212D7BFCF71EFE002E1CD11F
-:100E50006079FCF799FE039B002B13DB0022134BF8
-:100E6000144998331B6803989A710968DA7141181C
-:100E7000DA605A61023299601C619A71002D01D0CA
-:100E8000FFF7FAFE0C4809B0F0BD31000B4808F03E
-:100E900033FFFCF7D5FD0028DDD06079FCF774FE48
-:100EA0000748FCF793FAC04674D002007C2E00205D
-:100EB000D0B10200D02F0020A4B3020040420F00A6
-:100EC000AB6A030010B5182015F0D7F9064B98331C
-:100ED0001860064B0360064B838000238371036117
-:100EE0004361044810BDC0467C2E002078000400F9
-:100EF00004040000A4B30200F0B56D4C87B02600D6
-:100F000098363368002B40D09A79002A3DD0694D3D
-:100F100099682A68914238D89A79022A0BD11B69BC
-:100F200000215879FCF7B0FD2B6832680A339360D2
-:100F30000123937129E09A79012A26D19A89D989C6
-:100F4000914204D3DD79002D19D00021D98158694F
-:100F5000012A02D0DA8992001058574A904216D1DD
-:100F60001B69002158799834FCF78EFD246853489A
-:100F7000218808F04BFF0123A060A37105E09D715B
-:100F80001869F7F787FF33681D6107B0F0BD05A941
-:100F9000F0F736FC9834236801901B69802158795A
-:100FA0000293059EFCF770FD019B24681F781F23A8
-:100FB000218842481F4008F029FF618808F026FF79
-:100FC0007D1EEDB20390012E5AD9019B5B78232B35
-:100FD0004DD0622B50D1002D4BD0023FFDB26A1E86
-:100FE00053425A415242022E4ED00121022301980F
-:100FF000C05C3A2803D00F27384020710133207994
-:1010000084469E420ED90198C05C3A280AD1581CE9
-:10101000864207D9019F0233385C0F2738409E4231
-:1010200035D86071092D3DD86346043B9A1852B2F9
-:101030006F00234B002900D1224BD85B002A2EDB06
-:101040001041FCF7FDFC1A4B039998331A68537949
-:1010500059430B0017490A3B09680A2B00DA0A2397
-:101060005B189360D3890133D381022361E70022A7
-:10107000B9E72A000625B6E7002101230A00B6E7F2
-:10108000002101230A00BAE733000121B7E70A264D
-:101090007043019E6071F65C3E408019C1E7524288
-:1010A0009040CEE7029B00215879FCF7EDFCCAE79F
-:1010B0007C2E0020D02F0020A4B3020060EA0000A4
-:1010C000D4F60200C6F60200F7B5CC1CA400070057
-:1010D00020000E00019215F0D0F822000500054B0B
-:1010E0004760866003600C3A01990C3017F034FEBB
-:1010F0002800FEBDECD002000021F0B5070087B04B
-:10110000816414F0C3FCFB693C6ABB637B6AFC63CB
-:10111000002B05DA3A00062140321170013306E057
-:10112000002B07D03A00052140321170013B7B6251
-:1011300007B0F0BD002833D0BB6A002B30D1390096
-:10114000043340310B703A6BAE4B786BD3185B00B5
-:101150001B5A013C9C42EBD017D9F96A8A4207D34B
-:101160000831490015F0A7F8FB6A78630833FB6281
-:101170003B6B5A1C3A637A6B5B009C527B6ACDE7EF
-:10118000013B3B637B6A013B7B623B6B9D4A9A1848
-:101190005200125A9442F3D3CAD002230B70C7E70D
-:1011A0003C69631C03D1002240373A70C0E7380025
-:1011B00014F014FC0490002800D129E13B004033D6
-:1011C00005930023059A13703B69752B5AD0622B47
-:1011D00007D17B69722B5CD001240B230022019282
-:1011E00008E0722B51D17B69622B52D0049B012401
-:1011F00001930A23390040310A78002A4ED10B703E
-:10120000002C07D0380014F011FC022C02D1380059
-:1012100014F00CFC3B690293222B01D0272302938C
-:10122000380014F003FC0123029A03933B699342B4
-:101230000BD113007A69934207D1380014F0F6FB02
-:10124000380014F0F3FB0323039300263C69631C6E
-:1012500000D1CEE0039B012B02D10A2C00D1C8E0C3
-:10126000039B9E421DD338003100443015F0D3FF5C
-:101270000121380014F00AFC380014F0AFFB0028FC
-:10128000A2D155E701240A23A8E700240A230194E8
-:10129000B0E7049B022401930B23ABE79A42AFD043
-:1012A00046E7029BA34209D13800190044300136B9
-:1012B00004F0B2FD380014F0B9FBC7E75C2C00D095
-:1012C00091E0380014F0B2FB019B3D69002B06D081
-:1012D00038005C21443004F09FFD2C0071E0622D49
-:1012E00051D030D84E2D77D01AD8222D29D0272D85
-:1012F00027D000260A2DDDD02C00303C0326072CF9
-:10130000E6D87B69303B072B5BD8013E002E58D0D6
-:10131000380014F08BFB3B69E400303B1C19F0E70C
-:101320005C2D0ED00724612D21D0552DE4D13B003A
-:1013300040331B780B2B2ED138005C21443004F055
-:101340006BFD2C0013E0742D1FD007D86E2D1ED01E
-:10135000722D0BD0662DCFD10C2408E0762D18D03D
-:10136000E5D30226782DC7D1002428E00D243B00C8
-:1013700040331B780A2B32D138002100443004F06E
-:101380004BFD002696E70824F1E70924EFE70A243D
-:10139000EDE70B24EBE70826752DE5D1043EE3E7E6
-:1013A000380014F043FB3D692800F7F76DF9002879
-:1013B00000D144E1280011F09FFF24012418013ED0
-:1013C000EED20026631C00D174E70F4B9C42CED9AD
-:1013D0000122059B1A70D4E70C48FCF7E9F9FF2CB1
-:1013E000F6D80B2BF4D13800E1B2443015F0CFFE23
-:1013F000C7E7039B9E4200D335E73B0003224033FF
-:101400001A7030E7FFFFFF7FFFFF1000FA6A03004A
-:101410002000F7F721F9041E386903D15F2801D0B5
-:101420007F2842D93D0007233C0040352B704434CF
-:10143000C1B2200015F0ABFE380014F0F7FA38699D
-:10144000431C1BD1200015F090FE002406007E4FA7
-:10145000A300F958300017F0E5FC00281ED10D3428
-:10146000E4B22C70102C00D062E6784BA8331A68D6
-:101470000D23002A00D102332B7059E6F7F7ECF860
-:10148000002808D138695F2805D07F2803D8F7F7EE
-:10149000EFF80028D6D03B69D9B2CAE7002800DAB5
-:1014A00046E60134222CD3D142E6F7F7E1F80028D2
-:1014B0000FD03E00396940362E2916D109233370EA
-:1014C0003D004435280004F0A7FC380014F0AEFAC3
-:1014D00031E03B692E2B04D17869F7F7C9F8002871
-:1014E000E7D100255A4C02234AE008233370302903
-:1014F000E6D17A6918331343623B0024162BDFD8F8
-:10150000544CDC4001231C40DAE7002C17D10300C7
-:1015100020229343452B12D13C3B33706521280098
-:1015200004F07AFC380014F081FA396902220B00C9
-:101530002B3B9343C6D03869431CE6D1F8E5F7F757
-:101540008BF8002805D039692E290BD10923337077
-:10155000B8E73869F7F78CF80028F4D13B692E2BEF
-:10156000F1D0E5E50B00202293434A2BAAD1EDE709
-:10157000633E9E43F6B272425641A41901350134CE
-:101580002678002E02D03A69B242F1D1380014F028
-:101590004DFA002E02D14037012206E6212E08D155
-:1015A0003B693D2BF7D1380014F040FA4037412217
-:1015B000FBE52E2E12D13C003B6940342E2B02D18C
-:1015C0007B692E2B02D04A232370B1E5380014F03A
-:1015D0002DFA380014F02AFA0C23F5E72A0001341A
-:1015E000267802213300633B8B43DBB2002B0ED104
-:1015F000637839690135994207D1380014F016FA39
-:101600002A00652E03D00234EAE7632EFBD1124B89
-:101610009B5C3A0040321370190004229143422926
-:1016200001D0442B03D1BB6A0133BB6280E543295F
-:1016300002D0452B00D07BE5BB6A013BF5E70122D8
-:10164000059B04001A7092E628D102007C2E00202F
-:10165000B96A030001204000766B0300F7B54568C6
-:101660001600A8681F00019111F0B2FA0400A868E2
-:1016700011F0B4FA11F0ACFA030003205843073418
-:101680000019800014F0F9FD074B040003606B683B
-:101690003200436000238560C36001993B0008303D
-:1016A000F3F780F92000FEBDF4D1020070B505000B
-:1016B00088680C0015F060FC230002000249280035
-:1016C00015F08CFB70BDC046C06B030010B502481E
-:1016D00011F07FFDFBF702F89CAB020010B504008F
-:1016E000082014F0CAFD024B4460036010BDC046E0
-:1016F00030D20200F7B5C56804001E00002D02D1EB
-:101700001D602800FEBD03691830834205D1184BC7
-:10171000994203D01748FCF71DF819602000164FB6
-:1017200011007B680830019363687B6001F0A6FDBF
-:10173000019B05007B60012807D002280CD0002304
-:10174000E36023691B683360DBE723691B68336050
-:10175000002BD6D1E360D4E7A368986811F038FA7B
-:10176000002305308000E36024186368EBE7C0467F
-:10177000A4B30200DE6B03007C2E002013B501AB86
-:10178000FFF7B8FF01280ED0104C02280DD0019BA6
-:10179000A34219D0002B17D001AA01210C4811F047
-:1017A00012FDFAF79BFF019816BD0198F1F77EF83C
-:1017B0000749FAF791FA002801D10198F1E7019859
-:1017C000F6F73CFEA042F8D10020EDE7A4B30200FA
-:1017D0009CAB020010B50B00022808D14A680549ED
-:1017E0001868FFF7CBFF002803D1FFF76FFF8A6867
-:1017F000F5E710BDA4B3020010B500220149FFF7C0
-:10180000BDFF10BDA4B3020013B5114C01AB114ACA
-:101810002100FFF76FFF012803D0022805D0200028
-:1018200016BD0D490D4813F0E9F80198F1F73EF89F
-:101830000B49FAF751FA0028F1D10198F1F736F87F
-:101840000849FAF749FA0028E9D10198FAF746FF62
-:10185000A4B3020008A70200A06B030060AB020063
-:1018600090A802009CAB0200F0B585B00500160000
-:10187000080003AB02AA01A911F0F5FB0398364F4B
-:10188000B84209D0032807D0F1F7F8F8B060002873
-:1018900004D13248FBF79AFD0123B3600198B842A6
-:1018A00029D10024B368A34200DC6C1E0298B84220
-:1018B00025D1B368002B47DD2800002C2ADA6419F3
-:1018C00001D5B368DC17002834DA401901D50120AE
-:1018D0004042B368002B00DA0130B368002B2DDDE5
-:1018E000A04200DA2000013B706058425841C0B26B
-:1018F000346005B0F0BDF1F7C1F80400D6E7F1F7A8
-:10190000BDF8B368002801DBDA0F8018002CD6DBA5
-:10191000002B03DDAC42D6D92C00D4E7002BD2D06B
-:10192000A54200D86C1E002804DA4019D4D5012045
-:101930004042D1E7A842D0D92800CEE7002BD2D030
-:10194000A042D0DD601CCEE7002C01DA0020B6E713
-:1019500000208342E4D1C0E7A4B30200146C03006A
-:10196000F0B5060085B017001B2805D10A9A9742EA
-:1019700009D0002005B0F0BD19281AD01C281AD0B3
-:101980000A9A0A9717001A000B0011000A9A01928E
-:10199000BA4200D901971D000C0000230093009B60
-:1019A000019A934209D10A9BBB4220D0E1D3012086
-:1019B000E0E71A26EAE71D26E8E70295039401CD41
-:1019C00002CCF1F709F8002802D0009B0133E5E7CB
-:1019D0001B2ECED0039B30001A68029B1968FBF7C0
-:1019E000FDFC044BC01A43425841C0B2C2E71A2E54
-:1019F000DDD1BEE78CE70200F0B51E0085B0039094
-:101A000018680D001700F0F751FF736801900293FA
-:101A10000024022F0ED90123B2682900F1F706F93C
-:101A20000400032F06D029000123F2680198F1F782
-:101A3000FDF80500A54202D80848FBF7C7FC039A49
-:101A4000A3000299D058F0F7C7FF002801D1013454
-:101A5000F0E701206400204305B0F0BD2E6C0300C8
-:101A6000002313B5044A046A09050093890C8A58B7
-:101A7000A16B14F0A0F913BD6CD20200F0B587B0D1
-:101A800000931B7804000F0002922A2B05D1826874
-:101A9000525C002A01D0A62A14D11A00213A022A47
-:101AA0002DD8A568E8190378032B5CD104A96668D2
-:101AB00014F04BFAAB19984206D1676004992000E4
-:101AC00014F0A7F907B0F0BD0378032B4BD105A99B
-:101AD00014F03BFA009B1B78212B04D1049B059A40
-:101AE00013430493E6E7222B03D1049B059A53404A
-:101AF000F7E7232BDED1059B049A1340F1E71A0088
-:101B0000243A022A00D986E0A368D8190193037801
-:101B1000032B28D1636804A9039314F016FA060076
-:101B2000019B039A9B189E42C7D0B378B01C75786E
-:101B3000032B18D105A914F008FA0600372D35D16A
-:101B4000059A1F2A0FDC4249049B114199420ADB86
-:101B5000C021090611418B4205DB93400493049A8E
-:101B600053005340DCD500226368029DDB1B0193C8
-:101B7000561CED0969D1019B0135DB09FCD102320C
-:101B800052193900200015F017FB0400009B029A3F
-:101B90001B7831001A330370013014F08EF8701C7A
-:101BA0002018019A290014F088F88BE7392D08D104
-:101BB000059B1F2B01DD1F230593049B059A1341F1
-:101BC000CCE72F2D03D1049B059A9B18C6E7302D37
-:101BD00003D1049B059A9B1AC0E7312D09D10599C1
-:101BE0000498F6F711F90028BDD1059B049A5343D8
-:101BF000B4E7332DB7D00599352D06D10029B2D0E1
-:101C0000049811F011FA0490A9E70029ABD00498C8
-:101C100011F01AFAF7E7272BA5D1A368D819837812
-:101C2000032BA0D14578023014F09EF92F2D01D15D
-:101C3000049042E7302D06D14042430004905840C2
-:101C400000D43AE78FE7C043F2E7320090E7C0469E
-:101C5000FFFFFF3FF0B597B00890C020002560233C
-:101C60000AAC80000F00160025706360A56014F0B8
-:101C700011FB2561E0606561A561E5612762E562B0
-:101C8000A84218D1C449C54811F0B0FA0023060093
-:101C900013930D9814F020FB002E00D1E1E10023F6
-:101CA000BA6B39683000F6F769FC380013F06BFF47
-:101CB0003000FAF713FD3822002E03D00232022E34
-:101CC00000D02A000026B649009692005258200003
-:101CD000B96B330014F06FF8102014F0CEFA102115
-:101CE000040015F0F4F90AADAB682A78002B00D196
-:101CF00094E1002AC6D1EA68013BAB60DB00D3184F
-:101D0000DA78A7499200525802921A689D88120206
-:101D1000120A0592029ADB88527806920F220699DF
-:101D20000A400492002D2DD030220393069B1340CD
-:101D3000102B29D0202B65D0002E00D047E10123A5
-:101D4000069A1A400992099A02992A405300CB1820
-:101D500080215B88490107931B0B1B038B4200D03A
-:101D60004DE13B00079940331B780905090D8B4273
-:101D700000D02BE1002A00D123E13800FFF7BCF9A5
-:101D80000135E0E76368CFE7002D01D0002E35D0A4
-:101D90008022390052014031049BAB4201D8012618
-:101DA000A1E7029B6E009B195B88180B0003904211
-:101DB00013D108781B051B0D984221D121000AA8D8
-:101DC00014F036F8002819D13B0040331B78052B5E
-:101DD00000D03AE17349744856E7049A6B1C934269
-:101DE00006D2039A059900920AA8029A13F0E3FF1B
-:101DF000029B9E1971880AA8FFF732FE002672E73F
-:101E00000135C9E7002E0BD0029A6B009B5A1B0BC1
-:101E1000032B47D10121200015F099F9002303700D
-:101E2000049BAB4242D880200026029B049A0233D6
-:101E30005100C9184001994271D1A368039A9818BA
-:101E400000230493A2686368D318984272D3029B5C
-:101E50001B78052B01D00C2B00D10126029B597851
-:101E600040230B405842434149B25B421E40002987
-:101E700000DA01260025039B0695D0180795049BE0
-:101E80009D425ED1002E02D1079B012B69D006999D
-:101E9000200015F0C0F9029B059A03992000FFF776
-:101EA000EDFDABE7012D00D879E78DE78021029B9E
-:101EB0006E009E19738849011A0B12038A4225D1BC
-:101EC0003A0040321278DBB29A421BD1072A07D17E
-:101ED000B96CF86CFEF7F0FD0100200013F061FF13
-:101EE000002D0AD1029B5B787F2B06D90E9B200028
-:101EF000591C06930E9113F08CFF3800FFF7FCF885
-:101F000001358DE7002D00D149E75DE7039A6B1C91
-:101F100000920599029A0AA813F04DFF6AE71A8801
-:101F2000150B2D03854203D1D2B2062A00D9012612
-:101F3000023380E7049B01210133049313F0E0FE98
-:101F400080E7069A037801320692002B04D0079BA3
-:101F50000133079300230693012113F0D1FE0135CD
-:101F60008DE7A268039B944663441D00049B9E4238
-:101F700000D143E72B78002B07D1A3680122E91A8F
-:101F8000200015F050F90136F0E72800012113F088
-:101F9000B7FE0500F7E7C046456C030034AA02000F
-:101FA0006CD202006D6C030008A90200012D00D163
-:101FB000F5E601232A001A402ED0049A032A0DD0F8
-:101FC00002E721000AA813F033FFD9E60135049B8C
-:101FD000022BEBD10023012D00D1E0E6069A691E09
-:101FE000D20705D5029A9288120B012A00D16908FE
-:101FF000012900D04FE7002B00D1FFE64BE7039A01
-:10200000059900920AA86B1C029A13F0D4FE079956
-:102010000AA8FFF725FD66E61300DFE7002A00D0D7
-:1020200030E63B0040331E78002E00D0CCE66368DB
-:10203000002B00D1C8E62B692000591C13F0E9FEE3
-:10204000A3686B62EB69AB6223E6022B01D10A49FC
-:10205000C1E60A3B09480A49012B00D814E60949A0
-:1020600012E6380013F08FFD089A13AB13CB13C29E
-:10207000089817B0F0BDC0467F6C0300D8AB0200D3
-:10208000B36C0300FD360300F7B50191114904005C
-:102090001700002514F0E1FD7B68AB4204D80E491F
-:1020A000200014F0DAFDF7BD002D03D00B4920000D
-:1020B00014F0D3FD019BAE009A5909492000BE19C6
-:1020C00014F08CFE0122B1682000F0F707FC013506
-:1020D000E2E7C046A20D03006002030005FC020017
-:1020E000E36C0300004870471CD6020000487047AC
-:1020F0000148E80110B5F0F7C1FC80F310880148F1
-:1021000010BDC046A4B30200F0B508C98DB0059358
-:10211000244B06AC013800930194062300F0FCF830
-:10212000E068214E214FB04202D0F5F77FF9070059
-:102130001F4B20690393B04202D0F5F777F9039063
-:102140001C4B60690493B04202D0F5F76FF904901C
-:10215000194D38002900F6F7B3FE29000398F6F769
-:10216000AFFE29000498F6F7ABFE01200523049A80
-:102170000399059D5279497904354042FB5652B284
-:10218000009049B2280007F0D1FA0023A2686168E4
-:10219000280007F051FA2800069907F085FA300068
-:1021A0000DB0F0BD68D70200A4B302008CA20200FB
-:1021B0009CA2020094A20200F0B10200F0B50E68E9
-:1021C00087B0736807000C00002B02D11248FBF7A0
-:1021D000FDF84868F0F752FC010002A814F088FFEF
-:1021E0000025032F03D1A068F0F748FC0500002468
-:1021F000039B0193A34208D9301D290007F07EFB01
-:10220000049B185501930134F2E702A90348EEF745
-:1022100069FE07B0F0BDC0465C6D0300609202002D
-:1022200070B505006B6886B00800002B02D10B4822
-:10223000FBF7CCF8012203A9F0F7DAFD039E340086
-:10224000049AA31B01929A4205D92178281D07F010
-:1022500055FB0134F4E7024806B070BD5C6D030025
-:10226000A4B30200F0B505006B6889B00800140043
-:10227000002B02D10E48FBF7A9F8012202A9F0F7C2
-:10228000B7FD20000024022205A9029FF0F7B0FD4F
-:10229000059E039B0193A34206D9395D281D07F0D3
-:1022A0002DFB30550134F4E7024809B0F0BDC046BB
-:1022B0005C6D0300A4B3020010B51C0002AB1B78D8
-:1022C000002904D0002B02D10E48FBF743FAA242AA
-:1022D00007D1824214D003000B490C48F6F7E2F80C
-:1022E00006E0824206D9121A09490848F6F7DAF8D8
-:1022F000FAF7F4F9844203D2030022000549ECE71F
-:1023000010BDC046706D03007407030050AC02009E
-:10231000996D0300CB6D0300F0B50024170087B062
-:102320000C9D03900491059302940194059B9C429B
-:1023300006D1019B039A934240D22548FBF70AFA43
-:10234000039B9C4213D26B889B05F6D4019B049A95
-:1023500001330193A300D058FF226B88A6001340DD
-:10236000012B24D1F0F7C8FC0D9B985517E00623EC
-:1023700029880022C90019433800F6F7FDFB002820
-:1023800010D16B88DB0506D52A8812491248F6F76A
-:1023900089F8FAF7A3F90D9A6968A300D1500134BE
-:1023A0000835C3E7029B406801330293D4E7022B50
-:1023B00001D1F0F763FB0D9B9851F0E73B68029A5F
-:1023C000DB08934201D90548B8E707B0F0BDC04625
-:1023D000116E0300FA6D030050AC0200326E030070
-:1023E000A3230021024A5B000248D1527047C04635
-:1023F0007C2E0020A4B30200A3230121024A5B002B
-:102400000248D1527047C0467C2E0020A4B302007F
-:10241000A323044A5B00D35A0348002B00D103488E
-:102420007047C0467C2E00208CE7020084E7020043
-:1024300010B501F07FFE014810BDC046A4B30200F4
-:1024400010B50C4C002808D1FC34236D18005A1C20
-:1024500002D0180113F018F910BD0868F0F70EFB50
-:10246000FC34031E044803DA01235B422365F3E7CF
-:102470001B09FBE77C2E0020A4B302000300203BD5
-:102480005E2B00D93F20052320384343014A1068C2
-:10249000C018704768000020044B0B6043684B6015
-:1024A00083680800CB6000238B607047BCE10200AA
-:1024B00070B50500080068430130401008300C007A
-:1024C00013F0DBFE0122044B857103600379447134
-:1024D0009343037170BDC046C8E4020010B5037990
-:1024E000DB0702D50148FBF735F910BD506E03003C
-:1024F00070B50500202013F0C0FE05210B4B040031
-:1025000003600800FFF7D4FF6B68EA68A0602361EE
-:1025100062602A7C2000A276AA689B1863616B7CAB
-:10252000E37613F006FF200070BDC0460CE5020004
-:1025300070B50D000400FFF7D1FF2800F0F79EFAF8
-:102540000100092802D90448FAF740FF200013F0DF
-:1025500052FF024870BDC046EB410300A4B3020025
-:10256000F7B5C3684269040093420BD1037E052B83
-:1025700008D1C37E181E43D0200013F0DAFEA068F5
-:1025800013F047FF012500266B1E0193A768320058
-:102590002900380013F0FBFE3200030001993800D7
-:1025A000013613F001FF052EF0D10135052DEAD1DA
-:1025B00000252A0000230421A068013513F0F4FE51
-:1025C000052DF6D1227E637E9A421AD2207FFFF734
-:1025D00055FF002507000426227E7B5DB21A1341B9
-:1025E000012213400832534304212A00A068013518
-:1025F00013F0DAFE052DEFD1237EA0680133237698
-:10260000FEBD9A42F8D1E36861695A1CE2608A42D1
-:1026100005D120232377A023DB002383ECE7587820
-:102620002077FFF72BFFA17E0500002901D0064B84
-:10263000F3E713F055FE40422076280013F068FEC1
-:1026400001306076D8E7C046FF050000F0B50C0009
-:102650000B6889B0070018000493FFF73FFF656817
-:102660002800F0F723F91E4B984202D01D48FBF7D3
-:1026700071F8072F01D11C48F9E7A068F0F7FEF9BF
-:102680000690E068F0F7FAF907902069F0F7F6F99C
-:1026900005906069F0F7F2F9059B0600002B01DB5D
-:1026A000002802DA1148FAF791FE062F14D0A0692B
-:1026B000F0F7E4F90700E069F0F7E0F9059B039013
-:1026C0000093280002970196079B069A049913F03D
-:1026D000CEFE074809B0F0BD00200700EEE7C04677
-:1026E000C8E402007D6E0300906E0300AA6E030032
-:1026F000A4B3020070B5040008001600F0F7BEF99C
-:1027000005003000F0F7BAF90600002D01DB0028C3
-:1027100002DA0C48FAF75AFE200013F093FEA842A2
-:1027200004DD200013F09CFEB04201DC0648F1E716
-:1027300032002900200013F077FE430001201843E7
-:1027400070BDC046ED6E0300066F0300F8B50D00C6
-:102750000C682000FFF7C2FE6868F0F78FF90600EA
-:10276000A868F0F78BF90700002E01DB002802DAD9
-:102770000F48FAF72BFEE868F0F780F90500092802
-:1027800001D90C48F5E7200013F05CFEB04204DDEF
-:10279000200013F065FEB84201DC0748E9E72B0092
-:1027A0003A003100200013F0FFFD0448F8BDC04698
-:1027B000ED6E0300EB410300066F0300A4B30200BB
-:1027C000F7B50E0025490400019214F007FB019BA8
-:1027D000002B03D12249200014F000FB21492000E6
-:1027E00014F0FCFA0025300013F03AFEA84225DD73
-:1027F0000027300013F026FEB8420CDD39002A0015
-:10280000300013F011FE184B18491A5C200014F028
-:10281000E5FA0137EDE71649200014F0DFFA019BD5
-:10282000002B09D1300013F01BFE0138A84203DD54
-:102830001049200014F0D2FA0135D4E709492000EC
-:1028400014F0CCFA019B002B03D10B49200014F0AB
-:10285000C5FA0A49200014F0C1FAF7BD936F0300CE
-:102860009A6F0300A66F0300A86F030042000300E5
-:1028700055400300A06F0300254F030060020300D2
-:10288000F0B50E00110000228BB01C000092032353
-:102890003000FFF711FD032E00D9D5E0300007F01E
-:1028A00017FA020B919105210800FFF701FE0700BE
-:1028B000380013F0AEFD18E02068644B0340062B8F
-:1028C00007D0830700D07AE0614B02689A4200D0BB
-:1028D00075E007A9EEF794FF079B03900593012B82
-:1028E00006D1007813F0BFFF070038000BB0F0BD31
-:1028F00000231E00039A029303990598511A8842F7
-:1029000015DD11780A2901D03A2908D19E4200DA52
-:102910001E00029B0133029300230132ECE70133D6
-:102920002029FAD03929F8D94A48FAF74FFD002B67
-:1029300005D0029A013202929E4200DA1E000299EC
-:102940003000FFF7B5FD002507002C00039B049322
-:10295000039A049B9B1A059A9A4223DD049B1B78D9
-:102960000A2B01D03A2B0FD1A64207DD210000230C
-:102970002A00380013F018FD0134F5E70024013572
-:10298000049B01330493E3E7202B07D100232100AC
-:102990002A00380013F008FD0134F1E7392BEFD895
-:1029A000303BF4E7029BAB429FDDA6429DDD210058
-:1029B00000232A00380013F0F7FC0134F5E726481D
-:1029C000FAF7C8FE2068F0F759F805006068F0F7DC
-:1029D00055F8029001002800FFF76AFD0700022E5B
-:1029E00000D165E7012207A9A068F0F701FA002DE0
-:1029F0000BDB029B002B08DB0024089B0394049351
-:102A0000029B049A6B43934205D014488DE7039BC5
-:102A100001345B190393029B9C4200D165E70026B9
-:102A2000AE42F4D0039A079B9446049363449A5DA4
-:102A3000131C092A00D909233100DBB22200380017
-:102A400013F0B2FC0136EBE70548B9E7070080FF59
-:102A5000CC990200166F03003F6F0300576F03000D
-:102A6000746F0300F0B585B0019105000021019855
-:102A700007F008FB041E02D02148FAF7A7FC280043
-:102A800013F0E0FC0600280013F0EAFC010030001F
-:102A9000FFF70EFD0700280013F0D4FCA0422CDD48
-:102AA0000026280013F0CEFCB04224DD32002100C5
-:102AB000280013F0B9FC08F0A5FA019907F076FF99
-:102AC0000AF07AF800220F4B08F026FB0E4B00228A
-:102AD0000290039107F09CFA0923002804D0029881
-:102AE000039909F0F9FF030032002100380013F0C8
-:102AF0005BFC0136D5E70134CDE7380005B0F0BD09
-:102B0000C26E03000000E03F00002240F0B587B035
-:102B100004910592070013F0A3FC0400380013F0A1
-:102B200091FC0290049813F09BFC0190A04202D00B
-:102B30001948FAF74BFC01990298FFF7B9FC0025F8
-:102B40000390029B9D4223DA0026019BB3421DDDC8
-:102B500032002900380013F067FC3200040029001D
-:102B6000049813F061FC059B002B0AD02318092B55
-:102B700000DD092332002900039813F015FC01360B
-:102B8000E3E7231ADA43D2171340F3E70135D8E716
-:102B9000039807B0F0BDC046B36F0300F8B504005A
-:102BA00008000D001600EFF781FE164FB84201D065
-:102BB00000200FE0053C042CFAD8200007F07EF836
-:102BC000141403F80B003000EFF7BCFF011C2800C1
-:102BD000FFF748FFF8BD3000EFF7B4FF011CFE20FF
-:102BE000800507F00BFDF1E73000EFF75FFEB8421C
-:102BF000DED1624262413100D2B22800FFF786FF87
-:102C0000E8E7C046C8E40200F7B5070001931420C6
-:102C100008AB0E0015001C7813F02FFB044B476027
-:102C20000360019B8660C56003744474FEBDC046AA
-:102C300048E5020070B505000C2013F01EFB0521CD
-:102C4000044B0400456003600800FFF731FCA060FE
-:102C5000200070BD70E102000139C9B2054B401877
-:102C600080301970044A03781370044AD25C044B14
-:102C70001A707047372E0020382E00208F810300F5
-:102C8000362E00200131C9B2054B40188030197032
-:102C9000044A03781370044AD25C044B1A707047DC
-:102CA000372E0020382E00208F810300362E002082
-:102CB000074B984206D9074B1818074B4118C918FB
-:102CC00008787047054B18184118054BF7E7C046C0
-:102CD000A4920000D07F03005B6DFFFFE46F030050
-:102CE0000083FFFF03002022F0B57F254F265F27DA
-:102CF000803304001A7089B003007F3019780A000D
-:102D00002A406F2A26D90A003A401900013381313E
-:102D10000A709842F2D17F22B64B1A702300643AAF
-:102D2000FF331A70E4320292531CB348DBB20493AF
-:102D30000370E31880331B78B0490B705B2B0ED106
-:102D40009B22029B0A700133DBB20370E254012024
-:102D500009B0F0BD5F2AD8D90A003240D5E72E2B42
-:102D600013D10232D2B20270A21880321278A14876
-:102D70000270A348825C0120024206D1029A0B70C5
-:102D80001218D2B20292A354CEE10220994A1370D3
-:102D90009B4AD25C104000D0A1E0002A15D1964891
-:102DA000203203780A70E31880331A70029B0133D3
-:102DB000DBB202930370782B01D8E254B4E19B2379
-:102DC000029AA354049B0B70C1E716007F2552B2F0
-:102DD000AE430E70002A03DB8A4B8B4A1A60B7E7BA
-:102DE000413B8A4ADBB28A49D25CCB5C1202134374
-:102DF0000393039B002101339BB218000393FFF759
-:102E000057FF0306F5D5012300260127794D2B70C6
-:102E100039000398FFF74CFF7B1CDBB20193282895
-:102E20005FD1002E00D02F702D780135EDB2290032
-:102E30000398FFF73DFF6B1CDBB2292854D17F2696
-:102E4000069306990398FFF733FF069B3040013342
-:102E5000DBB23D284AD10026684B049A1870664BB5
-:102E60001A70644B019A1A70049B0593059B019993
-:102E7000E31880331B7803980793FFF719FF079B2C
-:102E80009842B6D1019B0133DBB20193AB422FD103
-:102E9000002E02D0584B059A1A70049D013FFFB2D4
-:102EA000544B390003981F70FFF702FF534E03067F
-:102EB00000D509E1504B7F211870514B1B5C1A0063
-:102EC0005BB28A433270002B18DA4B4B013DEDB2F6
-:102ED0001D70631980331B789842DFD089E74D4B12
-:102EE00086E70126019F93E71D00A0E70693A8E768
-:102EF000059B01260133DBB20593B7E7307020282C
-:102F00001BD0232825D02E282CD0262832D040288C
-:102F10004ED05E2856D02B285CD03A2800D02EE127
-:102F2000202629002000FFF797FE344A137833400B
-:102F30001370B3D0304B1D78F3E729002000FFF762
-:102F40008BFE0023F356002B00DA52E72A4B1D7844
-:102F5000A4E729002000FFF77FFE402233781342C8
-:102F6000F4D146E729002000FFF776FE33781B07EF
-:102F7000ECD43EE729002000FFF76EFE10223378E4
-:102F800013403370E2D11C4B1B78E1188031097873
-:102F90003170482900D02CE7013B1749DBB20B7098
-:102FA000E31880331B789343432B00D021E7CDE710
-:102FB00029002000FFF750FE0422337813403370BD
-:102FC000C4D116E729002000FFF746FE33789B06A0
-:102FD000BCD40EE7084B013DEDB21D70651980357C
-:102FE0002B78452BB2D010229343492B00D000E719
-:102FF000ACE7C046382E0020372E0020362E0020A9
-:103000008F81030004000020D06F030015820300AD
-:10301000FB810300A59200006B1C924ADBB2137087
-:10302000E31880331B7890490B70452B36D1A81CD0
-:10303000C0B2231880331B788C4E33708C4EF656FA
-:10304000002E02DB874B1D783FE010700B70522B77
-:10305000F8D0532BF6D0442BF4D04C2B08D10335A9
-:10306000EDB21570651980352B78592BEAD0C0E682
-:10307000462B00D0BDE6EB1CDBB21370E3188033A7
-:103080001B780B70552B00D0B3E60435EDB21570EC
-:10309000651980352B784C2BD4D0AAE6492B00D06B
-:1030A000A7E6AB1CDBB21370E31880331B780B7000
-:1030B0004E2B00D09DE60335EDB2157065198035B5
-:1030C0002B78472BBED094E6059D019B03980133D6
-:1030D000DBB20193019A654B11001A70FFF7E8FD0E
-:1030E000019B069A5F4F934220D100257F272E0037
-:1030F00001990398FFF7DCFD03003B403D2B04D012
-:10310000029A0132D2B20292A354019A0132D2B28F
-:10311000010600D4A2E0002E02D0544A0199117099
-:10312000514A1370059B0493049AFDE5504B7F218F
-:103130001B5C4D4E1A005BB28A4338703270002B14
-:1031400008DA0135EDB2631980331B783D70834294
-:10315000BBD04EE63070202816D023281ED02E2853
-:1031600026D026282DD0402848D05E2851D02B28A4
-:1031700058D020263A2864D0252800D14CE73D4B72
-:103180003D4A00201A60E3E529002000FFF77AFDA0
-:103190000023F356002B00DB54E72AE62900200029
-:1031A000FFF770FD40223378134200D04AE720E653
-:1031B00029002000FFF766FD33781B0700D541E7A3
-:1031C00017E629002000FFF75DFD10223378134039
-:1031D000337000D036E73B78E118803109783170E0
-:1031E000482900D005E60133DBB23B70E318803399
-:1031F0001B789343432B00D0FBE523E729002000F5
-:10320000FFF740FD042233781340337000D019E7F4
-:10321000EFE529002000FFF735FD33789B0600D548
-:1032200010E7E6E50135EDB23D70651980352B7884
-:10323000452B00D106E710229343492B00D0D8E557
-:1032400000E729002000FFF71DFD074A13783340EF
-:10325000137000D139E7034B1D78F2E70192012684
-:1032600046E7C046372E0020362E0020382E00209C
-:103270008F81030004000020DA6F0300F0B50368BB
-:1032800099B00700986807910FF0A2FC431E0493C1
-:10329000031D9B00FB1802933B0001220F218000BD
-:1032A00014331B180393FB6806A81A4009180A7008
-:1032B000032293430A930CA8F9F7EAF9031E00D0FE
-:1032C00040E3079A7D68BC68002A00D19DE22A7815
-:1032D0005E2A00D199E207980793F9F791FF04005D
-:1032E0000AE0D64B63600434D54B9A6C002A00D1B7
-:1032F0008AE200229C6C9A64F9F7E8F90D9421E3C4
-:10330000D04BEFE7D04BEDE77F216B785B06DB1707
-:103310003278DB01100052B2084003430136002A24
-:10332000F6DB01225B001343DCE700237F213278C8
-:10333000DB01100052B20840C3180136002AF6DB48
-:10334000DB000622EFE703220336964308CEC9E7E7
-:103350000023C7E700237F213278DB01100052B23F
-:103360000840C3180136002AF6DB9B005B42029A34
-:103370009858002800D027E3B449B5480FF036FF2D
-:10338000ADE700237F213278DB01100052B2084004
-:10339000C3180136002AF6DB029A9B005B4298585C
-:1033A00012F002F9E5E700207F223378C00119000E
-:1033B0005BB2114008180136002BF6DB251DF9F72A
-:1033C0000FFA60603EE000207F223378C0011900D0
-:1033D0005BB2114008180136002BF6DB251DF9F70A
-:1033E000CDF9EEE700217F223378C90118005BB2E6
-:1033F000104041180136002BF6DB206811F0D1FA9D
-:10340000206071E700217F223378C90118005BB288
-:10341000104041180136002BF6DB220001CCF9F7F1
-:1034200059FB61E700207F223378C00119005BB2AD
-:10343000114008180136002BF6DB21000839251F42
-:10344000F8F73AFC2C004FE7251DF9F7E1F9B8E74A
-:10345000251F042221682868EFF798FC2860F1E70F
-:1034600000237F213278DB01100052B20840C318DC
-:103470000136002AF6DB9B005B42029A21689950D4
-:10348000F7E000237F213278DB01100052B20840C0
-:10349000C3180136002AF6DB029A9B005B422168C2
-:1034A0009858251F12F082F8CCE700207F2233784D
-:1034B000C00119005BB2114008180136002BF6DB81
-:1034C0002168251FF9F7BAF9BCE700207F2233787D
-:1034D000C00119005BB2114008180136002BF6DB61
-:1034E0002168251FF9F7C2F9ACE700217F22337864
-:1034F000C90118005BB2104041180136002BF6DB01
-:10350000231F1A682068F9F70DFB083CECE622003F
-:10351000231F083A216812681868EFF737FC0C3C43
-:10352000E2E600237F213278DB01100052B208402E
-:10353000C3180136002AF6DB029A9B00D31A1A68D8
-:10354000002A00D118E700221A60CDE600257F226C
-:103550003378ED0119005BB211404D190136002B93
-:10356000F6DB029BAD005D1B286812F01DF80028F9
-:1035700000D101E70021286812F018F8B4E6002015
-:103580007F223378C00119005BB211400818013660
-:10359000002BF6DBF9F75EF9A6E600207F223378F0
-:1035A000C00119005BB2114008180136002BF6DB90
-:1035B000F9F768F998E6236894E62368A360231F67
-:1035C0001B68636008348FE6231F19682268216036
-:1035D000BAE7221F1368216823602300083B18689C
-:1035E0001060196080E6737832781B021343ED187F
-:1035F000184BEE1878E633787678206836021E434A
-:103600000196EFF779FBEE1C251F2C00002800D156
-:103610006AE6114A019B94466344F61864E63378DF
-:103620007678206836021E430196EFF765FBEE1CA4
-:10363000251F2C00002800D056E6EAE784E70200A8
-:103640007C2E0020A4B302008CE702002F8203002E
-:1036500070AA02000380FFFF0080FFFF33787678B6
-:10366000206836021E430196EE1CEFF745FB00284A
-:10367000CFD1043C38E633787678206836021E4392
-:103680000196EE1CEFF738FB0028C2D0F1E7F121DC
-:103690002668220030004900F9F71CFA2300F021C7
-:1036A00008331A00300049000193F9F713FA00219A
-:1036B000019A080011F066F9AB786A781B0213438F
-:1036C0000A9A0F210C320A920A9AEE1CF318136020
-:1036D000022206ABC9180B780A9D1A43231D134317
-:1036E0006B6000230A9A0B709360A060019CFBE55D
-:1036F00025002368B54A0193083D934209D16360D0
-:10370000A3602A000021032011F03CF9019B2B60EB
-:1037100098E60122019B134005932AD0231F1A68C3
-:103720000592019A5210012A0DD1A84A0C3C1A6048
-:10373000E260226100212200032011F023F9059BA1
-:1037400023600323E3E72A68002106929F4A0320AF
-:103750002A601A602300103B22601A00019311F0C6
-:1037600011F9019B069A0C3C1A60059B2360052306
-:10377000CDE7019B63601800EFF798F8934B20604A
-:10378000A3602A000599032011F0FCF8EFF7B4FAC2
-:1037900000280DD001228D4B06A92B600A9B5B6887
-:1037A00013400E32521813700A9B0C3B0A9349E6E1
-:1037B0006368ACE7737832781B021343844AEB18D2
-:1037C0009B186360EB78083423600F267F2102206A
-:1037D000012506AA2368B6180B4206D1221F1668D7
-:1037E000002B00D191E6183C7EE50A9A013B526815
-:1037F00002426FD0220008C20523636014000A9BB6
-:103800001E680A9B0C3B0A9335007D602B786E1C6A
-:10381000180010385A2800D905E306F063FA62FD53
-:1038200071FD73FD040375FD040386FD94FD99FD90
-:103830009BFDB2FDC4FDD4FDE3FDF3FD03FE15FECB
-:1038400019FE21FE32FE46FE56FE66FE78FE82FE20
-:1038500097FEB0FEBEFE0403040304030403CCFE83
-:10386000CEFE2AFFD5FEDAFEE4FEECFE00FF1FFFCF
-:103870002CFF04030403040338FF69FF63006300A3
-:103880008000AE00BF00DD00DD00CBFFB30004030D
-:103890000403040304030403040304030403E9000E
-:1038A000FB0004030D011C01040325015201370133
-:1038B00073018901380268029602800204039E01A6
-:1038C000A901B401C101CD01EA0104022102CE0225
-:1038D000ED02FE020A9A52682A4032700A9A0C3AA5
-:1038E0000A9279E7737832781B0213430A9AEE1C26
-:1038F0000C320A920A9AF31813602B7806A9403BFF
-:103900005A4253410F22521810785B000A99034320
-:1039100023434B6000230A9913708B60E4E423680F
-:103920002A4A934200D1A4E6DA0707D55B10DBB23E
-:10393000043C012B00D048E70222CEE1F8F7C6FE96
-:1039400023680D930D9B23491868F8F7C5F90028E3
-:1039500000D1AEE27A68002A00D1AAE21378432BA4
-:1039600000D098E2937850781B02D11C0343CB1807
-:103970007B60BB68103BBB609DE400212068F9F7C9
-:10398000F5F83DE52500210020680C35F9F7EEF843
-:10399000844200D156E50023236012E520003378ED
-:1039A00076780C383602BC601E4303680196EE1C24
-:1039B000002B02D12300083B1868F9F711F9002801
-:1039C00002D1103C019B28E660608CE4A4B30200A5
-:1039D0000380FFFF9CAB020001220A9B06A95B68E3
-:1039E00013400E32521813700A9B0C3B0A937BE46F
-:1039F00000207F223378C00119005BB21140081803
-:103A00000136002BF6DB8100641A04342100F2F742
-:103A100031FEF5E400207F223378C00119005BB24B
-:103A2000114008180136002BF6DB8100641A0434BB
-:103A3000210012F0F9FFE3E400207F223378C00177
-:103A400019005BB2114008180136002BF6DB251D6A
-:103A500011F0BDFEB5E42500231F083D1A6821685A
-:103A6000286811F0EDFEEDE400207F223378C001DC
-:103A700019005BB2114008180136002BF6DB8100FB
-:103A8000641A04342100ECF7D7FDB9E400237F2148
-:103A90003278DB01100052B20840C3180136002A08
-:103AA000F6DB251F28682168022B03D1CC4AF4F7E6
-:103AB00009FAD3E4083C0A0001002068F4F702FA8E
-:103AC0009EE400237F213278DB01100052B20840CF
-:103AD000C3180136002AF6DB9A08920052421059A8
-:103AE000032221681340251F002B02D100F074FB34
-:103AF000A8E4012B03D12A6811F0A2FE05E50DF020
-:103B00004DFD9FE400257F213378ED011A005BB263
-:103B10000A4055190136002BF6DB220029002068E7
-:103B2000F9F71CFAAF4B5D19AD006419FFF7DCFB28
-:103B300000257F213378ED011A005BB20A40551948
-:103B40000136002BF6DB220029002068F9F75AFA2B
-:103B5000FF222B0A13401540E5E70322F31C934391
-:103B60000022186811001E1D251D0EF082FF28E49A
-:103B70000322F31C9343251F2268296818681E1D21
-:103B80000EF077FF6AE40322F31C934319795E1D5C
-:103B90008A00A41A0434220018680EF086FF2FE46D
-:103BA0000322F31C934318798021C24349009200F9
-:103BB0005E1DA4180143EEE700207F213378C00189
-:103BC0001A005BB20A4010180136002BF6DBFF2505
-:103BD000FF220100C3096D0011402B405B189B00C0
-:103BE000E41A000A0240231D2068F8F7C9FEFFF717
-:103BF00007FC00217F223378C90118005BB2104016
-:103C000041180136002BF6DBFF22CB09520013408E
-:103C1000CAB29B189B00E41A083C22000020F9F766
-:103C200047F8FFF7EDFB00237F203278DB0111001E
-:103C300052B20140CB180136002AF6DBFF211800F2
-:103C4000FF250840DA096D002A40451C52199200F0
-:103C5000A41A1B0A1940220010F094FEFFF7D0FBB3
-:103C600000217F223378C90118005BB2104041184F
-:103C70000136002BF6DBFF22CB0952001340CAB2FB
-:103C80009B189B00E41A0C3C22000120C7E70F227E
-:103C900006ABD2181378002B00D14DE601210A9B08
-:103CA0005B680B4013700A9B0C3B0A9344E60A9B2B
-:103CB0005B6813420ED003220A9B21685B68934322
-:103CC0001C0059609A600A9B08341E680A9B0C3BD2
-:103CD0000A9399E50A9B0C3B0A930A9B03998B4232
-:103CE000E5D2F8F7F3FC0020BC6019B0F0BD6B78AA
-:103CF000022B03D1043C2068FFF7EFFA002BFAD126
-:103D00000A9B039A934203D237493848FFF736FBA0
-:103D10009868002801D0FFF7E0FA0C3BF1E7231F79
-:103D20000593079B0193231F1868019B002B19D053
-:103D30000021079B07910193019A0BABF9F7E6F974
-:103D40000B9B012812D12E002360F8F7BFFC0F2334
-:103D500006AA9B181A780A9B7E601343BC60FB601E
-:103D60000120C2E70BAB019A2168E7E7002811D1D7
-:103D7000043C002B00D11A4B2360019B002B19D06F
-:103D80001B4918000FF03CFA002813D0F8F79EFCEE
-:103D9000019BD6E5174918000FF032FA002805D02C
-:103DA0000B98F4F74BFB043C2060E6E7F8F78EFC39
-:103DB0000B9BC6E5059CFFF797FA00207F2233781E
-:103DC000C00119005BB2114008180136002BF6DB68
-:103DD000251F2A682168F9F731FAFFF73FFBC04633
-:103DE000A4B30200FFFFFF3F7582030060AB020037
-:103DF00090A802009CAB020000217F223378C90109
-:103E000018005BB2104041180136002BF6DB25008C
-:103E100001CDF9F725FAFFF7D4FA2068251F10F035
-:103E2000CCFDFFF70FFBAF2B05D80120803B5B00DB
-:103E30000343FFF757FABF2B04D8B022D31A9B00D5
-:103E4000FFF795FACF2B04D8C022D31A9B00FFF7B7
-:103E500014FBD62B06D8D03B18002168F8F71EFDBE
-:103E6000FFF7CEFAFA2B08D8251FD73B1800226897
-:103E70002968F9F7B3FAFFF7F1FA454945480FF019
-:103E8000B5F90400F8F722FC049B04339B00FB18EF
-:103E90005C60022029E75E2B0BD1BC680D98231DC6
-:103EA000BB60F4F7CBFA60607B6801337B60FFF79F
-:103EB00002FA0D9B384A93422AD0384A934227D0BF
-:103EC0003B6898680EF08AFE0EF088FE7B68051D40
-:103ED00028005C1B0EF07CFE060028000EF07EFE23
-:103EE00005000EF075FEA41B060028000EF076FEFD
-:103EF00005000EF06DFE019028000EF06FFE01220D
-:103F00000378002B09D1330001990D98F4F736FBA3
-:103F10000F2306AA9B1801211DE059B2002909DBD5
-:103F200019001F255B09294001308C42EBD3641A2C
-:103F3000D218E5E70F21E0251940ED001B012B40C9
-:103F4000457802302B43F0E70A9A52680A401A700B
-:103F50000A9A0C3A0A921A78002AF5D10A9903981B
-:103F60000D9A81420DD3012119700A9B02311B6801
-:103F70007B600A9B5B688B430A9904338A601A60F2
-:103F8000F9E4049B04339B00FB185A6081E7C046A8
-:103F90005B820300ACAA020008A7020018A7020077
-:103FA000F0B5304B8FB007AE0138009304310723D2
-:103FB0000196FEF7B1F90023B0682B4F0393B84286
-:103FC00003D0EEF75BFDC3B2039370691825B842C6
-:103FD00002D00EF053FF45B2B0691924B84202D0A6
-:103FE0000EF04CFF44B23069B8420DD005AA022150
-:103FF000EEF708FE059B18680EF040FF059B45B2E2
-:1040000058680EF03BFF44B201210E00A022AE40E2
-:10401000A140164BD205D75815483E430590D650BF
-:10402000D6588E43D650134A03218550C4502800D9
-:1040300014F08BFD2000032114F087FD079905A8DB
-:1040400005F05AFA0A9B039A089905A805F064FA44
-:104050000799094805F0DAFE084B0130188002483C
-:104060000FB0F0BD20E60200A4B30200140500006A
-:10407000002000400C050000C8320000C02D0020C8
-:1040800010B5F5F743FB034B002800D1024B180095
-:1040900010BDC0468CE7020084E70200F7B50D00B2
-:1040A00014001E00002A07D0F5F730FB002805D1C8
-:1040B0000B230124336064422000FEBD2E002F1923
-:1040C000F5F730FB741C3070BC4213D00A4B1B88D0
-:1040D00000930FF0FAFA0190F5F718FB260000287C
-:1040E000EED10FF0F2FA019BC01A009B8342F3D885
-:1040F000641BE1E73C00FBE7C02D00200F2310B557
-:104100001940012908D00300002909D0022909D14A
-:1041100011F0BAFA030003E0044B002800D1044B6D
-:10412000180010BD11F0CBFAF4E7C0468CE702008E
-:1041300084E7020000B58BB0F9F788FE684612F0FC
-:10414000A6FB054BD968091A8908F9F73BFEF9F770
-:1041500095FE0BB000BDC0467C2E0020002803D089
-:10416000012807D0002004E08B680448002B00D110
-:10417000034870478B685B001843FAE78CE702003E
-:1041800084E70200044B88600B60044B08004B601E
-:104190000023CB607047C0462C980200B368020031
-:1041A00000238168F0B5CA0F094C521852100E193D
-:1041B0009A4201DC0748F0BDC568F11A9C008900ED
-:1041C0002C196D5827682560C46801336750EFE7E4
-:1041D000FFFFFF3FA4B3020070B583680D00416884
-:1041E00004008B4212D3C900C06812F064F86368FF
-:1041F0000A495A00A3686260D21A013352189B0020
-:10420000E0609200C018002114F0C2FDA368E268CB
-:10421000591C9B00A16002489D5070BDFFFFFF3FED
-:10422000A4B30200F8B5070016004C10836812D53D
-:10423000E41810D500240D4D38002900FFF7CCFFFD
-:10424000BB68591E9B00FA68181F8C4207DBA4004C
-:104250002800A650F8BD9C42EDD91C00EBE7D3180E
-:10426000083B1B68013913500300ECE7A4B30200BC
-:1042700070B50025040085601021C06812F01BF89D
-:1042800004232900E0606360102214F081FD0148DE
-:1042900070BDC046A4B3020030B50C0085B0104B11
-:1042A00002AD04310093013802230195FEF734F882
-:1042B00023680C4C996801290FD9D8680A4B029AD7
-:1042C000C91889004118A24200D100222D79074B5C
-:1042D000002D00D1064B12F0FAFA200005B030BDD7
-:1042E0006CE60200A4B30200FFFFFF3F84E7020078
-:1042F0008CE7020070B50C680B00A1680200002971
-:1043000003D11949194810F079FB2068012A27D0F8
-:104310005A680023EEF78AFCE168A26886008B19D0
-:10432000013A1D680436A260121A92008919180019
-:1043300014F01BFD0021A368E0689A001150616829
-:1043400004290BD95B00994208D949088900E06823
-:1043500011F0B1FF6368E0605B086360280070BD26
-:1043600001225242D5E7C0469482030044A90200CC
-:1043700007B5009001910220694612F010FB6946D2
-:1043800001900220FFF7B6FF00480EBDA4B3020063
-:1043900070B50E000D490500002412F05EFCB368F4
-:1043A000A34204D828000A4912F057FC70BD002C23
-:1043B00003D00849280012F050FCF168A300012244
-:1043C00059582800EEF78AFA0134E8E7CF340300A1
-:1043D000DD05030005FC020070B5032604000D0096
-:1043E0000E4029D1174B0A689A4225D183688A6802
-:1043F00099184368994210D904318900C06811F0B6
-:104400005AFFAA68A368E0609B181A1D9B006260AF
-:10441000C0181022310014F0BBFCA368E9689800B2
-:10442000E3681818AB689A0014F096FCAB68A268B1
-:10443000D318A360044870BD2900200012F0B8FA18
-:10444000F8E7C04648E70200A4B302000B4B70B582
-:10445000050003600C000800042900D204206860F5
-:10446000AC60800011F009FF6A68E860121BA400CC
-:1044700092000019002114F08BFC70BD48E7020087
-:104480007FB50D00160012283ED005D8052819D09A
-:1044900007283FD0002434E00300193B042BF9D84F
-:1044A00093070DD1284B12689A4209D1B368009343
-:1044B0008A68F368C968FDF753FA244C002820D1B4
-:1044C000234C1EE0032300241340A34219D11C00F7
-:1044D0001D4A3368934214D18B68B268981812F061
-:1044E00080FA0400AB68E9689A00C06814F034FCF4
-:1044F000A868E36880001818B368F1689A0014F09F
-:104500002BFC200004B070BD11002800FFF764FFF1
-:104510002C00F6E703A91000EEF7EEFA0024A04203
-:10452000EFD0039BA34200DA0394AB68039858438F
-:1045300012F057FAC36804000093AA68039B042191
-:10454000E86811F03AFBDCE748E702008CE702007C
-:1045500084E70200F0B5032704008BB00E001000C2
-:104560000F40002A33D1002F2AD1654B0A689A42A6
-:1045700026D104AAA068FDF777F9002802D1614886
-:10458000F9F716F90599049BA268E0685D1A521ABA
-:104590009B00890041189200C01814F0E6FBA36844
-:1045A000AA00E818E368800018185242390014F095
-:1045B000EFFBA3685D19A560534D28000BB0F0BD5B
-:1045C00007A9022007940896FFF794FEF4E7042A4F
-:1045D0002CD1A068002F1FD1494B0A689A421BD1E9
-:1045E00007AAFDF741F9002806D107AAE168A068EB
-:1045F00011F0F6FA0500E0E7079B0898C01A12F0E0
-:10460000F0F98368E1689A00079B05009B00C918D0
-:10461000C06814F0A1FBD0E700230100320020683D
-:10462000EEF704FBE3688000C558C6E7364D002F5F
-:1046300060D1334B0A689A425CD103AA02A9EEF713
-:10464000BFFA07AA3100A068FDF70EF9002896D03E
-:10465000079B029A08999E180191761AE068002E2D
-:1046600027DDA368F1186368994206D9890011F023
-:1046700022FEA368E0609B196360029A079BA16811
-:104680009B18F21A52180899E0689B00890041189B
-:104690009200C01814F069FB029B03999A00079BD3
-:1046A0009800E368181814F060FBA3689E19A660D0
-:1046B00083E79B000399C018920014F04DFB089902
-:1046C000A268E368521A8900019359180798029B5F
-:1046D0009200C018019B8000181814F046FBA368D4
-:1046E000B200F018E368800052421818390014F044
-:1046F0004FFBDAE702003100200012F0B3F95CE76B
-:10470000A8A40200FB820300A4B3020010B53E2857
-:1047100003D040282ED03C2813D1532924D013D8BD
-:104720004C2921D007D8482950D049291CD04229EA
-:1047300007D1012348E04F2903D3502914D9512927
-:1047400047D02548F8F742FE68293FD006D86429AB
-:104750003FD0662908D06229F3D1EAE76C2903D05B
-:10476000712936D06929ECD101230420002A00D018
-:10477000136010BD512926D010D849290CD006D875
-:104780004229D6D0482918D00129DAD1D1E74C29BD
-:1047900002D0D6D34F29D4D30423E6E76629FBD031
-:1047A00006D86229C5D064290DD05329F4D0C8E7B2
-:1047B0006929F1D003D86829C3D1022304E06C2908
-:1047C000EAD07129BDD108231800CFE701230220C8
-:1047D000CCE701230820C9E7A882030010B55128BF
-:1047E0003DD011D849282ED007D8422803D04828D8
-:1047F00026D0012806D18B5C10E04F284BD017D86B
-:104800004C2820D0002309E0682816D00AD8642854
-:1048100036D066282AD06228F4D18B5601205B005E
-:10482000184314E06C2803D0712811D06928E9D10D
-:104830009200505810F028FF09E05200535EEDE757
-:104840005200535AEAE79200505810F038FF10BD5A
-:10485000D2008A181068516810F007FFF7E7D200FD
-:104860008A181068516810F01BFFF0E703239200CC
-:1048700050589843030002201843084BC018E6E73D
-:10488000D2008A181068516808F0E8F90323020082
-:104890009A431300EFE792005058D8E70000808059
-:1048A000F7B51700156801AA04000E00FFF72EFFE8
-:1048B000402C05D1019B043C5A1EAA185D421540AC
-:1048C0005A213E3C62426241B14289412B183B6011
-:1048D000D2B22B00494212F0D2F804000D004F2E44
-:1048E00008D0532E07D114F0A7FA002201002000AF
-:1048F000ECF72EFBFEBD662E06D10323022498435F
-:10490000154B2043C018F5E7642E06D108F0A6F930
-:104910000323040002209C43F2E75A2E0FD9802281
-:104920000023D20512196B41002B04D1002A02DBAF
-:1049300010F0AAFEDEE7290010F097FEDAE7002962
-:1049400005D1064B984202D810F0B9FED2E72900F3
-:1049500010F0A6FECEE7C04600008080FFFFFF3FBC
-:10496000F0B589B0160005AA02931C6801900F00EB
-:10497000FFF7CCFE019B0500402B06D1059B5A1E7C
-:10498000A2185C423C2314400193029A63191360FD
-:10499000019B3E3B03935A425341DBB20293642F87
-:1049A00012D0662F0BD04F2F2AD12800042D00D90A
-:1049B000042033002200029912F08AF82CE0300023
-:1049C000EEF7C0F80600F0E73000EEF7BBF808F0AD
-:1049D000F3F8029B0690079108AA9B00D318083BA6
-:1049E00022001B680299042012F072F8039B043421
-:1049F0005A1E934108AA9B00D318083B1E68D4E7AF
-:104A0000B3070BD1104B32689A4207D123002A001A
-:104A10000299300010F005FE09B0F0BD3000EEF74D
-:104A20002DF80600042DC0D900215A2F02D9884242
-:104A300000DAFF312A00200014F0AAF9019B3E2B76
-:104A4000B3D12B1FE418B0E7ECB80200F7B50600AD
-:104A50000F0014001D0064280DD0662804D04F28D4
-:104A600013D19400E35105E0940018000F19EEF7FC
-:104A700069F83860F7BD1800EEF764F808F09CF8A4
-:104A8000E4003F1938607960F4E703232B40019379
-:104A900011D10E4B2A689A420DD1019A0100402093
-:104AA000FFF734FE230043430200FB18019928005E
-:104AB00010F0B7FDDEE72800EDF7E0FF220003006D
-:104AC0003900300012F017F8D4E7C046ECB8020005
-:104AD00010B50B790349002B00D1034912F0BDF842
-:104AE00010BDC046156B03000F6B030037B50C00FB
-:104AF000110000221D00009201232000FDF7DCFBC5
-:104B0000002C05D02868EEF7F7F8034B002800D1F9
-:104B1000024B18003EBDC0468CE7020084E702004D
-:104B2000F0B505008BB008680C00ECF753FE04905C
-:104B300004A812F034F800260127049B0390069382
-:104B4000069B197800291AD13000F1F793FD012254
-:104B5000070007A96068EEF74BF9079B089A0593D1
-:104B60009B180193022D1FD9A068EDF787FF00283D
-:104B700017DA089BC01814D52848F8F727FC080056
-:104B8000F3F776FD002806D006A812F01AF8069B67
-:104B90001B78732B00D13800069B3618013306931F
-:104BA000CEE7059B181805900025B54202D33800C2
-:104BB0000BB0F0BD049B01241878F3F759FD0028D1
-:104BC00003D004A811F0FDFF04000598019A031911
-:104BD0009A42D1D3049B1B78732B10D02D19AB00B4
-:104BE0000293049B013C14D3197805AA0398FFF79C
-:104BF00057FE029AA300D31AFB185860F1E7210070
-:104C0000ECF7BEF9059B1C19AB1C9B000594013504
-:104C1000D851049B01330493C7E7C046B582030013
-:104C2000F0B589B0039101921E00ECF7D3FD04901A
-:104C300004A811F0B4FF00250290B54201D309B0D9
-:104C4000F0BD049B18780028F9D0F3F711FD01247A
-:104C5000002803D004A811F0B4FF0400039B019ABC
-:104C60001B199A4202D21B48F8F7B0FB049B1B7831
-:104C7000732B10D02D190E9BAF00DF19049B002C55
-:104C800024D0A20052421978BA5803AB0298FFF719
-:104C900067FE013CF2E70E9B6F1CAD00E858012255
-:104CA00005A9EEF7A5F8069DA54200D925002A0022
-:104CB0000599039814F050F8039B621B58193D00A6
-:104CC000002114F065F8039B1C190394049B013325
-:104CD0000493B2E7B5820300F0B50E0089B00390EB
-:104CE00001CE0F0011F083FF4410210004A812F040
-:104CF000FFF9069D22000021280014F049F8039BCB
-:104D00000096013B2A1929003868FFF789FF04A99A
-:104D10000248ECF7E7F809B0F0BDC0466092020027
-:104D200030B50C0089B005000222606805A9EEF7D5
-:104D30005FF8A068EDF7A2FE002806DA069B039351
-:104D4000C01802D50848F8F741FB0599069AEB1EF2
-:104D50008A18091820000C3000902068FFF760FFC7
-:104D6000024809B030BDC046B5820300A4B30200BA
-:104D7000F0B587B0039205910D9A03990500521A78
-:104D80000CA9097820200C00844339D030293BD06D
-:104D90000CA902910121802401911C4036D0D40F2E
-:104DA000A4186410171B002C37DD2600019B049308
-:104DB000B34200DD04966B68049A0299286898470C
-:104DC000049BF61A002EF1DC039B002B06D01A0080
-:104DD00005996B6828689847039BE418002F0CDD41
-:104DE000E419019EBE4200DD3E00320002992868AF
-:104DF0006B689847BF1B002FF3DC200007B0F0BDA5
-:104E0000074902911021C6E70649FAE701271F402A
-:104E100001D11400C7E71700D6E70024D4E7C04645
-:104E2000D8820300E9820300F0B593B01C0018ABF0
-:104E300020CB05901B780F0016000793CB070BD4EF
-:104E40008B0703D1854B0A689A4205D03800EDF7ED
-:104E500015FE01274000074381231D4209D1079B0E
-:104E6000302B06D11A9B1B9A934200DA1A92002328
-:104E70001B93380010F0E5FB0AAA1300002806DB9C
-:104E8000AB070FD52B231370123B04AA9B18E1B27A
-:104E9000EA0615D5022E0CD130221A704A1C5A701F
-:104EA00002330DE013006A07F1D520221A7019238E
-:104EB000EBE7082E3BD130221A70AA0534D4013317
-:104EC00000220AA81A701B1A2C200693AB06DB17C7
-:104ED00018400EAB0B9310230C931B9B0D92012BD0
-:104EE00001DD40231D43402404ABDA752C400390C0
-:104EF000029123D03B00019200960DAA0CA90BA8A9
-:104F0000F7F7F2FA037807002D2B00D08EE004AA01
-:104F1000D3750D9B1B9A013B01370D93012A00DDD0
-:104F200097E00026340035E00A000E32B7E7102E75
-:104F3000C6D130221A700A001732B0E70AAB0193CB
-:104F400000963B000DAA0CA90BA8F7F7CDFA1B9B06
-:104F500007002600012B1DDD0D9B1B9C9C4200DAE7
-:104F60001C001A9BA3425EDD01261C1B2E4001D0B3
-:104F70002600002401239D432F330793002C09D0E2
-:104F8000103B0093002301941A0035490598FFF760
-:104F9000EFFE04006B0621D5172104ABC9180B786E
-:104FA000002B0AD000230122009301920598FFF7FD
-:104FB000DFFE1A9B2418013B1A93069B002B0DD091
-:104FC000012301930023069A00930AA90598FFF78D
-:104FD000CFFE1A9B069A24189B1A1A931B9B012B2F
-:104FE00001DC1A9B1B931B9B0D9A0193079B3900B5
-:104FF000009305982B00FFF7BBFE2418002E09D064
-:1050000020230093002301961A0015490598FFF705
-:10501000AFFE24180B980EAB984201D011F05CF94A
-:10502000200013B0F0BD00263400A3E71B9B012B2A
-:1050300000DC76E70D9B1B9C9C4200DA1C001723CA
-:1050400004AA9B181B78002B00D00134069BE4189F
-:1050500087E71B9C9C42F8DA1C00F6E7ECB80200DC
-:10506000FB820300F0B50600140000278DB00D0090
-:105070002B78002B15D1A94217D30B78002B00D128
-:1050800048E14B1C049320230025302208210420F2
-:105090000893049B1B78002B11D10693013B0793C7
-:1050A0005FE0252BE7D00135E2E76B1A04931A0085
-:1050B000306873689847049B2900FF18DDE72D2BA3
-:1050C00005D12C3B1D43049B01330493E1E72B2BBB
-:1050D00001D1293BF6E7202B01D10543F3E7212B32
-:1050E00001D10D43EFE7302B2CD110331D43089233
-:1050F000E9E7069A4A43D318303B0693049B0133F1
-:105100000493049B1B781A00303A092AF1D92E2BFC
-:1051100047D1049B5B782A2B18D0049B0A210133CA
-:10512000049300230793049B1B781A00303A092A42
-:1051300017D8079A4A43D318303B0793049B01338F
-:105140000493F0E700230A210693DAE7049B023375
-:105150000493236804340793DB43079ADB171A4050
-:105160000792049B1B786C3B5A425341049AD31814
-:1051700004931B780593002B00D1CBE0642B00D166
-:10518000A1E022D8502B29D00ED8453B022B00D8C5
-:10519000A9E001220499306873689847013709949F
-:1051A00052E001235B427AE7059B622B3CD057D843
-:1051B000582BEED1231D0993069B01950393089B61
-:1051C000029341230093313B7BE0059B712B53D02D
-:1051D0000FD8672B00D886E0702BDAD1231D0993F6
-:1051E000069B01950393089B029361230093513B17
-:1051F00067E0059B752B5AD0782BEFD0732BC8D165
-:10520000231D24680993002C49D0079B013303D147
-:10521000200013F011FE0790069B079A0193089B4C
-:10522000210000932B000BE0231D09932368002B22
-:105230000ED0069B04220193089B384900932B0053
-:105240003000FFF795FD3F180499099C01310EE7E6
-:10525000069B05220193089B314900932B00EFE741
-:10526000231D099323680BA90B70069B0122019350
-:10527000089B00932B00E3E7231D0BA920680993EB
-:1052800010F061FB079B0100013301D10B9B0793D9
-:10529000069B079A0193089B00932B00D0E7069B7F
-:1052A00006220193089B1F4900932B00C8E7231D8A
-:1052B0000993069B01950393089B02936123009336
-:1052C000573B00220AE0231D0993069B012203930A
-:1052D000089B0195029361230093573B216830009E
-:1052E00011F0CAFCAFE7072307349C432300206872
-:1052F00061680833099307F0B1FC079B011C029316
-:10530000069B059A0193089B300000932B0011F037
-:1053100020FD98E738000DB0F0BDC046C6820300FE
-:10532000CB820300D18203000023F0B52F4E93B04F
-:10533000050006A81400336001910127F7F7A8F9CA
-:105340002740031E35D1E2062DD56A68A9681120D1
-:1053500010F00CFC05002E6829000125019A03A815
-:10536000FCF778FCA3082B400022310003A8F5F7D6
-:1053700049FF04000320EEF751FE20000FF0F3FA7E
-:1053800001204042EEF74AFE2C00F7F79FF9002F6C
-:1053900024D029001648F4F7DDF93C000121144817
-:1053A000F4F7D8F91AE0A306D5D528000DF0C7FA0E
-:1053B000D0E701204042EEF731FE002F03D001215B
-:1053C0000B48F4F7C7F90798EDF770FA0949F6F7B3
-:1053D00083FC041E05D03468002FDFD1200013B0F9
-:1053E000F0BD07990448EDF79DFAF5E7542B00202E
-:1053F000FA82030014AC020044E8020010B586B043
-:10540000202102A8802411F062FE64001E480EF0E4
-:1054100037F900231D4803930EF032F9F4F782F9AF
-:105420000128F3D002280BD119480EF029F902A85F
-:1054300011F06FFE01220020164B1A7006B010BD4D
-:10544000032802D100230393E8E7042804D0C1B263
-:1054500002A811F09CFEE1E70F480EF011F9039B42
-:105460000193002B08D10A480EF00AF902A811F0A6
-:1054700050FE80204000E1E71122012102A8FFF741
-:1054800053FF2042C5D0D9E7B4830300683A030034
-:105490009C3F0300EA000020320A030030B587B0C9
-:1054A000202102A8802511F012FE6D0037480EF071
-:1054B000E7F837480EF0E4F80024364902A80394D0
-:1054C0000DF092FB01280AD133480EF0D9F802A85A
-:1054D00011F01FFE2000314B1C7007B030BD0228B8
-:1054E00003D12D480EF0CCF8E0E7032801D12A487B
-:1054F000E0E7042808D128480EF0C2F802A811F00D
-:1055000008FE80204000E8E7052827D124480EF057
-:10551000B7F80394F4F706F96B46C1B2DC1D2170AD
-:105520000329E4D004290AD11B480EF0A9F801216F
-:10553000162202A8FFF7F8FE2842BDD0CDE702A848
-:1055400011F025FE23780D2B03D116480EF098F8A4
-:10555000E0E701212000F4F7FDF8DBE7039B002BD7
-:10556000AAD002A811F001FEF1F7A6FF00280BD087
-:105570000A2102A811F00BFE0B4902A80DF034FB22
-:105580000328B4D00428ECD10021D1E7FC82030029
-:105590004D830300738303009C3F0300EA00002057
-:1055A00078830300A8830300AF83030010B5EDF7F1
-:1055B000C9FA044905F0FAF904F0ACFD0EF06DF8F3
-:1055C000014810BD00007A44A4B3020010B5EDF705
-:1055D00055FA002801DD0EF060F8014810BDC04604
-:1055E000A4B3020010B504000800EDF747FA6410F8
-:1055F0002018034C400020400124204310BDC04629
-:10560000FEFFFF7F10B5EDF739FA002801DD0EF03F
-:1056100040F8014810BDC046A4B3020010B50EF01A
-:1056200054F8034B400018400123184310BDC046F6
-:10563000FEFFFF7F10B50EF044F8034B400018400A
-:105640000123184310BDC046FEFFFF7F054B10B578
-:105650009A6C002A04D00022986C9A64F7F73EF8FE
-:1056600010BDC0467C2E002010B5034B186811F009
-:1056700082FF10F009F810BD5829002010B5034B27
-:10568000186811F07FFF0FF0FFFF10BD58290020B0
-:1056900010B5034B186811F07CFF0FF0F5FF10BD3B
-:1056A000582900201FB500210320F0F7E3FF0A4B23
-:1056B0000400196801A811F051FF01980FF0E4FFF0
-:1056C000A06002980FF0E0FFE06003980FF0DCFFAD
-:1056D0002061200004B010BD5829002010B5EBF760
-:1056E00059FC0023064A99008958814205D00133AC
-:1056F0000C2BF8D10348F7F769FE180010BDC0461F
-:1057000084E80200CF830300094A70B51378002BA8
-:105710000DD1084D2C78E4B2002C08D10133137060
-:105720002B70054B186803685B6898472C7070BD38
-:10573000392E00203A2E00205829002010B5FFF7FE
-:10574000E3FF054B186811F045FF044B8000C35878
-:105750000620DB00184310BD5829002084E8020011
-:1057600010B50800FFF7BAFF0400FFF7CDFF054BA7
-:10577000186811F02FFF044BA04200D0034B180013
-:1057800010BDC046582900208CE7020084E70200C3
-:1057900010B50800FFF7A2FF0400FFF7B5FF0123D3
-:1057A000A340064A064811880B4200D105481188DB
-:1057B000994311800022044B1A7010BDC22D0020A5
-:1057C0008CE7020084E70200432E0020F8B5FFF7C3
-:1057D0009BFF134C13482378002B1FD02078002107
-:1057E000C0B2F0F747FF012600220F4F2378934203
-:1057F00012D915005308FB5C3540AD002B410F2535
-:105800002B400A4D9B005B5906259100DB00411897
-:105810002B438B600132E9E700232370F8BDC046BB
-:10582000432E002004A002003B2E002084E802004A
-:1058300070B543885A1E0A2A1FD801252A009A40AB
-:105840000F490888024392B20E480A8002780F2A54
-:1058500013D802780C4CEA40A25C0678D2B20F2131
-:105860002E420BD00A401B0113430278DBB25208D0
-:10587000A35403780133DBB2037070BD8A43F3E7AE
-:10588000C22D0020432E00203B2E0020F0B5060044
-:1058900087B000AF7B60F960BA60FBF771F8B06861
-:1058A0000DF096F93861B0680DF098F90DF090F9A7
-:1058B000032358433B69C01883001D007B611435E6
-:1058C0002C2B2CD86B460E35ED08ED005B1B9D464E
-:1058D00000236C467B61002326606360BA687B68A6
-:1058E000F9682000EFF75EF8154D00216B68200085
-:1058F000236173686B60FDF7C1FC2369061E6B6052
-:1059000013D1A3681D687B69002B04D0200010F020
-:10591000E3FC002E11D12800BD4607B0F0BD2800E1
-:1059200010F0B8FC041ED6D1CCE73B6903339B00D2
-:10593000E3185D687B69002BE8D12800F6F7CEFEFE
-:105940007C2E00200122030030B5134085B00400F6
-:105950004510002B14D125491D00884210D0244940
-:1059600088420DD0234B1500984209D003230340F1
-:1059700009D1214A0168914205D10FF0C2FE05000C
-:10598000280005B030BD1D4A25002240062A05D05A
-:10599000002B08D11A4B22689A4204D101A9200099
-:1059A000EBF72EFFEBE72000ECF780FF154B98425A
-:1059B00007D1FF23DB05E0180323984305F002FB22
-:1059C000DDE7114B984202D0104B984206D101AA54
-:1059D00069462000EDF7F4F8019DD1E7022201A904
-:1059E00020000CF01FFE0028CAD0F5E7A4B3020087
-:1059F00084E702008CE70200ECB80200070080FF99
-:105A0000CC99020048B002000CA0020048E7020056
-:105A1000F7B506000F0000920193041E00D0446801
-:105A20003800431E984120180430800010F025FCF7
-:105A30000C4B050003600C4B5B684360009B83606C
-:105A4000019BC360002E05D03100A2000831103048
-:105A500013F082F9002F02D00434A400675128000B
-:105A6000FEBDC046C0E902007C2E002070B50600D5
-:105A700010200D00140010F000FC034B4660856000
-:105A80000360C46070BDC04684E9020010B50C001C
-:105A9000ECF70CFF006B00280ED0E30702D503687B
-:105AA000002B09D0A30702D54368002B04D063075D
-:105AB00006D58368002B03D1024903480EF09EFFF0
-:105AC00010BDC046DF830300E8AA0200F0B50F0056
-:105AD0008BB00400012138680392FFF7D7FF06005E
-:105AE000012C22D13B68012118000393FFF7CEFF60
-:105AF00080210700490006A811F0E9FA802400235C
-:105B0000089E6400029305AB2200310003983D68B3
-:105B1000A847431C28D105980B2800D0ACE0029B75
-:105B2000002B34D159480BB0F0BD7868ECF7A6FFD4
-:105B3000030002900133D5D00125337B029C2B4218
-:105B400000D181E00026210006A811F0C0FA0395DB
-:105B5000002C6ED0210006A811F0F9FA011E1ED10A
-:105B60004B494C480EF04AFF002810D0029B1B18EE
-:105B70000293844202D9241A3618C4E7802106A869
-:105B8000490011F0D1FA802406006400BBE7029BB3
-:105B9000414807933B7BDB0775D5404873E0002302
-:105BA0000093220005AB386811F0F0F9059B050061
-:105BB000002B0ED006A8210011F02DFB05980B2814
-:105BC0005AD1079B0293002B33D106A811F0A1FAFA
-:105BD000A8E7844227D8089B30009C46079C634670
-:105BE0009B5D039A59B2002912DA19001F2502227F
-:105BF000A943C0290CD01900103D0132A943E02966
-:105C000006D004329343F03B1A00511E8A410432FD
-:105C10009619A64212D8029B3000013B0293A6427D
-:105C2000DDD31C0094E7211A06A811F0F4FA002D28
-:105C3000D1D11A4806A9EBF755F974E7E443029B62
-:105C4000A419E418060083E7029906A811F050FA97
-:105C5000039B029A0093089905AB386811F096F9F6
-:105C6000059B002B0AD006A811F053FA059B0748A4
-:105C70000B2B00D157E71800F7F78EFD337B079009
-:105C800005482B4289D106A9D5E7C046A4B3020036
-:105C9000FE83030034AA020060920200CC99020045
-:105CA00030B50C0087B0012105002068FFF7EEFE3B
-:105CB000022203A96068EDF79BF8049A022D06D929
-:105CC000A068ECF7DBFE049A824200D902000023B0
-:105CD00003990093206802AB11F058F9029B002B46
-:105CE00005D005480B2B05D01800F7F755FD4300EC
-:105CF0000120184307B030BDA4B30200F0B589B04D
-:105D00000191019B040001211868FFF7BFFE070005
-:105D1000012C18D9019B5B685C10631C13D0210017
-:105D200004A811F0D4F9631C03D0631E002C2FD0FB
-:105D30001C00012104A811F00AFA061E0AD11B4911
-:105D40001B480EF05BFE0124102104A811F0BFF9DE
-:105D50006442E8E70100019803AB012200683D6856
-:105D6000A847431C0ED103980B2809D1059B01932A
-:105D7000012B09D104A811F0CCF90E4809B0F0BDEF
-:105D8000F7F70AFD00280CD1012104A811F043FA0D
-:105D90003B7B0948DB0700D4084804A9EBF7A2F8CD
-:105DA000ECE733780A2BBED1F2E7C046FE8303004E
-:105DB00034AA0200A4B30200CC990200609202004F
-:105DC000F0B51F0004000D00160085B00221FFF79A
-:105DD0005DFE03AB009732002900200011F0D6F8D9
-:105DE000039B002B05D005480B2B05D01800F7F7B7
-:105DF000D3FC43000120184305B0F0BDA4B302005A
-:105E000070B50500140011F062F9024B2560636063
-:105E100070BDC0469770020010B50C007F2906D8EF
-:105E2000012111F094F9002800D0047010BD224B1C
-:105E3000994210D8022111F08AF90028F6D04023A7
-:105E4000A2095B42134303703F2323408024644232
-:105E50001C434470EAE7194B994214D8032111F00E
-:105E600076F90028E2D02023220B5B4213433F2126
-:105E700080220370A30952420B400C40134322437B
-:105E800043708270D2E7042111F061F90028CDD06F
-:105E90001023A20C5B4213433F2103708023220B8B
-:105EA0005B420A401A434270A2090A400C401A435E
-:105EB0001C438270C470B9E7FF070000FFFF0000B9
-:105EC00007B5034B009068460193FFF7CBF807BD79
-:105ED00097700200BFF34F8F024B034ADA60BFF3A3
-:105EE0004F8FFEE700ED00E00400FA05F0B597B033
-:105EF00018220021060010A812F04AFF132110A852
-:105F000012F007FD032110A812F099FD4C4B1B68FD
-:105F1000002B00D10133DBB202934A4A0123002156
-:105F20000BA803F0F9F9484B9E4200D9002672B63F
-:105F3000464B64211C68464B3000079303F066FF14
-:105F4000052510306843201808900A21300003F01E
-:105F50005DFF0A2104F040F810316943611809918E
-:105F600030000A2104F038F810314D4380236419C1
-:105F70000A9400249B010193029B002B5DD0002515
-:105F800000272E1F07AB9B190593032C03D18023F9
-:105F900000249B01019307AB5B592E4A03936300D6
-:105FA000D31804930023190006205843049A1618A6
-:105FB0007678B4466246039EB25C10269446049AF4
-:105FC000105C62460641164202D00120984001430F
-:105FD0000133092BE8D1C9431F4B059A0901194028
-:105FE0001268039B934225D1312F23DC00210BA89B
-:105FF00012F0F0FDFA23159A1199DB0010680142A6
-:106000001BD0013B002BF9D1019B01345B000193B4
-:10601000FA230137E4B25B009F42B6D10435102D5C
-:10602000AED1074B1B68002BA6D0029F013FFBB2ED
-:106030000293A1E7019B1943D9E7FFF74BFFC04645
-:106040005C2B0020F0FF0000E70300006800002048
-:10605000428403000C840300F01F0000F0B5002808
-:106060001BDD0F4C421E276811000020BE09FB0FEC
-:1060700073407B403E097D087340BF087B406B4006
-:10608000DB072B4301251F0040002B401843E9404C
-:10609000ECD18242E8D32760F0BD0248FCE7C0465D
-:1060A000582B002017FCFFFF0023F0B50121A1268B
-:1060B00004241F00094D0A480A4A2B60F6000160BB
-:1060C000576051680029FCD081591B02013C0B43E9
-:1060D000002CF5D12B6001234360F0BD582B00202C
-:1060E00000D00040FCD00040014B18607047C04613
-:1060F000582B0020020010B5014B12CB12C210BD6C
-:10610000602B0020034B1A68034B1A607E225A60F2
-:106110007047C04668000020602B002070B5051E47
-:1061200014DD0B4E0B4C3368002B02D0206812F0AC
-:10613000FAFAFA2120680024074B89008361C462BF
-:106140006943356012F0F7FA200070BD0348FCE7A0
-:10615000682B0020982B00200562010017FCFFFF30
-:10616000F8B5114F06003D68002D0AD1302012F01D
-:1061700089FD040002F06EFD0C4BA5612360E56211
-:106180003C600B4D2B68002B09D1102012F07AFDDA
-:10619000040012F01DFB20002C6012F0F3FA300016
-:1061A000FFF7BCFFF8BDC046982B002030EF02007F
-:1061B000942B0020014B18687047C046682B0020C4
-:1061C00070B50D4C2368002B03D00C4B1B68002BC3
-:1061D00002D10620FFF7C4FF206812F0EAFA02009D
-:1061E0000749C3170D684E685219734120680A6049
-:1061F0004B6012F0E4FA70BD942B0020982B002025
-:106200001801002010B5FFF7DBFF0024054BA200AA
-:10621000D058002802D003681B68984701340A2C24
-:10622000F4D110BD6C2B002010B5FFF7C9FFFA2286
-:10623000034B920018685968002303F04BFF10BD10
-:106240001801002010B5FFF7BBFF024B1868596812
-:1062500010BDC046180100200B4B10B51B68040090
-:10626000002B03D0094B1B68002B02D10620FFF73F
-:1062700077FF0023064A99008858002801D001338F
-:10628000F9E78C5010BDC046942B0020982B0020BD
-:106290006C2B0020002310B5044A99008C588442CE
-:1062A00001D00133F9E70020885010BD6C2B00208D
-:1062B00010B50400002902D00B78002B03D1034B4A
-:1062C0002360200010BD10F0F7FFFAE758EB020042
-:1062D000014B03607047C04658EB020010B50548FB
-:1062E000054C206011F062F8044A0549200012F0C4
-:1062F000C2FC10BD58EB02009C2B002000000020C7
-:10630000AB720200084B73B51C680500002C0AD064
-:106310000100266808310822684612F01DFD0CCDE8
-:1063200031682000884773BDA02B002010B5054CB4
-:106330000121200011F02EF8034A0449200012F038
-:106340009AFC10BDA42B0020000000205173020015
-:106350000388074A10B50120934208D0834202D037
-:106360000020DB0703D41E20FFF7C0FD002010BD76
-:10637000FFFF00000048704716FCFFFF10B5124CED
-:106380000023083482800460416202241422010048
-:106390008371847203638386028136310A78C36015
-:1063A000A243F1342240036143618361C36103620C
-:1063B0000A70020040321370021DD38701334387F5
-:1063C0008387C38710BDC04678EB0200F0B5514FFC
-:1063D00097B03B6806000593002B3FD106AC0B330A
-:1063E0001C222121200001F0B7F80EAD0B231D2245
-:1063F00022210AA801F0B0F80B231B222321280038
-:1064000001F0AAF8082012F03DFC0122059B1100C2
-:10641000049011F0BAFF3A21300011F0BDFE0028BF
-:1064200027D0A38812ADAB80A3795C20AB713A4B27
-:106430001293A3681493237B2B73637B6B73A37BEF
-:10644000AB7312F01FFC04230193363300932A0030
-:10645000049B3100040001F0EDFC3C602F4B2D4CFF
-:106460001868002802D0216811F042F9206817B09E
-:10647000F0BD3221300011F0BFFE00281CD0A388EF
-:1064800012ADAB80A3795C20AB71234B1293A36850
-:106490001493237B2B73637B6B73A37BAB7312F01F
-:1064A000F1FB042301932E3300932A00049B310057
-:1064B000040001F05DFED0E73C21300011F054FEF5
-:1064C000002822D0AB8812ACA380AB79A420A371A2
-:1064D000114B1293AB6814932B7B23736B7B637309
-:1064E000AB7BA37312F0CEFB052305000293013BA7
-:1064F0000193383300932200049B310001F0B8FB74
-:10650000064B3D6044351D60A8E73220FFF7EEFCE6
-:10651000A4E7C046A82B002068EB0200AC2B0020AB
-:10652000F0B56149C56885B08D4254DA0300022296
-:1065300036331B78134059D104698C4264DA020067
-:1065400036321278520768D4426901920200019EE5
-:1065500040328E426FDA010036310978090774D46F
-:10656000002B7DD113780293002B16D00600012753
-:10657000011DCB8F363601339BB2CB87039636781D
-:10658000BC46374000D188E01D2B06D963469E43A8
-:10659000039B1E700023CB87137010F054FF434AF7
-:1065A0000723904276D94249043B8D4272DBC822D0
-:1065B0000133920095426DDC023B8C426ADB013B69
-:1065C000944267DC01980433884263DB01339042D4
-:1065D00060DC00235EE0C822002352009542ABDD60
-:1065E000030036331A7800239207A5D4012306004E
-:1065F0001F00363632785408A7433C0002279C40DF
-:10660000BA432243327097E7C822520094429BDD7E
-:10661000020036321278520796D40600012236362E
-:1066200033789F08BA439700042293431A003A43F1
-:106630003270012388E7C821019E49008E428FDD18
-:1066400001003631097809078AD401000126363164
-:106650000B78DF08BE430827F600BB4333430B70BB
-:106660001378032B00D97DE70133DBB21370012BC4
-:1066700003D10021031DD98774E7042B00D071E7F3
-:10668000020036321178033B0B43137000230430B1
-:10669000C3870B33180005B0F0BD092B00D87CE789
-:1066A000029BCF87013B77E770FEFFFFFF70020080
-:1066B000E0FCFFFFF0B5040087B0C06806F042FAC6
-:1066C00000900191206906F03DFA049005916069FF
-:1066D00006F038FA02000600802000060B180F00B2
-:1066E0000098019906F0EAFE06F0B8FAE062051C8F
-:1066F00006F070FE0390281C06F0BCFC051C0398F5
-:1067000006F05AFA009A019B05F02CFC00900191CA
-:10671000281C06F051FA32003B0005F023FC020071
-:106720000B000098019905F08FFE02000B00049801
-:10673000059906F0C3FE06F091FA0022051C00231D
-:106740003000390003F078FC002806D1A56202234E
-:10675000A2791343A37107B0F0BD0021281C03F0F8
-:10676000A5FC0B4E002811D10A4F281C06F024FA74
-:1067700002000B003000390005F066FE32003B00DD
-:1067800004F0CAFC06F06AFAA062E0E7024FECE708
-:10679000EA2E4454FB21F9BFFB21F93F0048704722
-:1067A00016FCFFFF002310B50400838083710D48A1
-:1067B0002164083020608020C000A061E061206278
-:1067C000E3602000236163616362A362E362236389
-:1067D0006363A363E3636364110010F040FF200070
-:1067E00010BDC046ACEB0200F0B5504F97B03B680F
-:1067F00006000593002B3FD10B331C22212106A854
-:106800000AAC00F0A9FE0EAD0B231D2222212000B0
-:1068100000F0A2FE0B231B222321280000F09CFE87
-:10682000082012F02FFA0122059B1100049011F0AC
-:10683000ACFD1D21300011F0C7FC002825D0A38835
-:1068400012ADAB80A3796020AB71394B1293A36872
-:106850001493237B2B73637B6B73A37BAB7312F05B
-:1068600011FA05230193183300932A00049B310089
-:10687000040001F0B3FB3C602E4B2C4A1B681068EF
-:10688000002B00D0436417B0F0BD3C21300011F064
-:10689000CBFC00281CD0A38812ADAB80A37960206C
-:1068A000AB71234B1293A3681493237B2B73637BED
-:1068B0006B73A37BAB7312F0E5F9052301933733B8
-:1068C00000932A00049B3100040001F0F3FCD2E79E
-:1068D0003C21300011F048FC002822D0AB8812ACDB
-:1068E000A380AB79A420A371114B1293AB681493CE
-:1068F0002B7B23736B7B6373AB7BA37312F0C2F9A7
-:10690000052305000293013B0193383300932200D5
-:10691000049B310001F0ACF9064B1D6044353D602D
-:10692000AAE73320FFF7E2FAA6E7C046AC2B002027
-:1069300068EB0200A82B002030B50425837985B0D0
-:1069400004002B421BD10368DB699847200010F03C
-:10695000C0FEA379A1882B43A371032201236846BB
-:1069600010F0E6FCA0790300AB43A37102231840AA
-:1069700043425841034B4042184005B030BD0248E5
-:10698000FBE7C04614FCFFFF15FCFFFFF0B5040059
-:1069900089B0406C10F011FE071C606C10F000FE16
-:1069A00002222100061C05A810F0A4FE069804F09F
-:1069B00029FB051C079804F025FB041C381C06F075
-:1069C00009FD0390381C06F055FB0190301C06F0C1
-:1069D00001FD0290301C06F04DFB0399071C201CA2
-:1069E00003F0E4FF0199061C281C03F0DFFF011CE3
-:1069F000301C04F00DF9061C059804F003FB391C4B
-:106A000003F0D4FF0299071C281C03F0CFFF039961
-:106A100003F0CCFF011C381C03F056FC0299051C46
-:106A2000201C03F0C3FF019903F0C0FF011C281CC8
-:106A300003F04AFC311C06F049FE0F4903F0B6FF93
-:106A400006F0BAF80D4A0E4B04F082FE06F006F985
-:106A5000011C0C4804F0DCF80021041C03F012FBBC
-:106A6000002804D0201C044903F02EFC041C201C28
-:106A700004F0A8FA09B0F0BD0000B443EA2E445473
-:106A8000FB2119400000B4421FB50122010001A8FA
-:106A900010F030FE029804F0B5FA041C019804F0DE
-:106AA000B1FA211C06F012FE0D4903F07FFF06F03B
-:106AB00083F80C4A0C4B04F04BFE06F0CFF8002193
-:106AC000041C03F0DFFA002804D0201C074903F05F
-:106AD000FBFB041C201C04F075FA04B010BDC0467A
-:106AE00000003443EA2E4454FB2109400000B44323
-:106AF00010B5837904005A070DD49B0701D4FFF722
-:106B00001BFF636C2000002B02D0FFF73FFF10BD7E
-:106B1000FFF7BAFFFBE70148F9E7C04615FCFFFFA6
-:106B200082B0F0B50400EDB064207393729211F05E
-:106B30007FFF052210A8110011F09BFC974911A8B6
-:106B400001F0CEFD002221AB6CA91A605A609A6058
-:106B50000C339942F9D11922002113A812F018F927
-:106B6000A06811F0B0F900260B90FF21A06800F09A
-:106B7000B5FB8B4FA06800F041FB07960996884B48
-:106B80009F4203D0874B9F4200DBFDE0A06811F0DD
-:106B9000E8F9A56884491AA8FFF78AFB78221AA9A0
-:106BA000280000F071FB1AA810F07FFB00267C4F34
-:106BB0000322099B606801331A40099210F0DBFC44
-:106BC0000500606810F0DEFC0022784B05929D42C3
-:106BD00010DB013205922A00C8320BDBAA22042105
-:106BE00092000591954205DC02220592C82D01DD37
-:106BF0000132059200220692984210DB012306938F
-:106C00000300C8330BDBAA2304329B000692984290
-:106C100005DC02230693C82801DD0133069310A882
-:106C200011F01EFC002513ABEB5C012B08D1604971
-:106C30006B00CA185278C95C10A8FF2301F0E2FC6F
-:106C40000135192DEFD16B4618229A5E6B4610A8BC
-:106C50001421595E099B01F0D5FC002F01DB0F2E9A
-:106C600007D90023A068009374301A0010A911F00E
-:106C700007FC01230893089B05995A004C4B9B186D
-:106C80009A1E12788A4226D1013B1B78069A9342BB
-:106C900021D1089A6CAB9B18663BFF3B0A931B788B
-:106CA000012B18D00C23079A216853431D000022A2
-:106CB0000CA810F01FFD21AA2B0094460CAA6344D7
-:106CC00023CA23C301220A9B01361A70079BF6B21E
-:106CD0000133DBB20793089B013308931A2BCAD107
-:106CE000642011F0A5FE079B643F3FB2182B00D82B
-:106CF00045E71A0021A91AA810F05CFF6A461DABEF
-:106D000023CB23C21B6813601A991B9A1C9B206813
-:106D100010F0B7FCE568002D0CD0264912A8FFF74B
-:106D2000C7FA1C231AAA12A9280011F004FA12A803
-:106D300010F0BBFAA06811F014F911A912A8A56807
-:106D400011F086FB00221C4B009212A9019328002F
-:106D5000130000F06FFA12A811F06DFBFA2080000A
-:106D600011F066FEA06811F0FCF80B99A06800F025
-:106D7000B5FA11A811F05FFB10A811F05CFB6DB023
-:106D8000F0BC08BC02B01847002F02D00F2E00D074
-:106D90000EE7A06800F032FA0AE7C0462286030038
-:106DA0008C3C0000D18AFFFF6786030058FDFFFF7F
-:106DB000878603007C860300DC050000F0B587B001
-:106DC00001930EAB1B88060003930D9B0D000093EF
-:106DD000019B02920C9F002B3DD0002F02D1009B03
-:106DE000DB0738D5282011F04DFF0400103010F0DB
-:106DF00095FA029B18202580638011F043FF05005F
-:106E0000009B08220593019B002103600C3004972E
-:106E100011F0BEFF082204A9281D11F09DFF0F4BA1
-:106E200002226B6100230399E3602362636233688B
-:106E30000A43A560A2805B682100300098470028C3
-:106E400007D0200011F08CFA2000282111F00BFF50
-:106E5000034807B0F0BD0348FBE7C046D9770200FE
-:106E600016FCFFFF17FCFFFF30B542600022836075
-:106E70000C4B04000160C260186887B090420DD0CE
-:106E80000592C03202926A46074904AB049122CBB4
-:106E900022C2230003220521FFF790FF200007B044
-:106EA00030BDC046A02B0020216B0100F0B50400CE
-:106EB00085B0637A9C46002B04D1200010F098FE28
-:106EC00005B0F0BDA37A266F01931023019AF35603
-:106ED00000259B1801229A402900F368039202932F
-:106EE000029BAB4231DDB368019A6B439B18726918
-:106EF0005B00E77AD3181A785878E379012F14D118
-:106F00005F1E3F1A10003A005B004343606F821817
-:106F1000D3189B79634500DD6346627B1A4202D039
-:106F20000123AB4019430135DAE7022F05D15F1E7B
-:106F3000BA1A277A013F381AE6E7032FE4D1277AF5
-:106F4000013FBF1A02003800DEE71123C943F356A0
-:106F5000606C994023691940039B194311F03AFE74
-:106F6000A27B072AACD8637B0C495B006373531C7C
-:106F7000DBB290004158A373022A03D8080011F035
-:106F80004CFD96E7064B2000236300236363054B0B
-:106F9000E4622364143011F0CEFB91E7D8EB0200D9
-:106FA000AD6E0100DB7B020010B50400044B0360F2
-:106FB00011F0B9FB200001F063FE200010BDC046B7
-:106FC00030EF020010B504000E4B08330360FFF7EA
-:106FD00061F92000743011F02EFA2000603011F0B9
-:106FE0002AFA2000583010F060F92000503010F0DC
-:106FF0005CF92000044B14306361FFF7D5FF2000DB
-:1070000010BDC046F8EB020044EF0200F8B50025C1
-:107010000400324B858008330360857114301600FC
-:107020000F0001F017FE20002D4BE562636125641F
-:107030005030FFF74DF920005830FFF749F9200094
-:10704000603001F0D9FA20000423F25E336826672D
-:10705000590009B2743011F00CFA3368226FE371F1
-:1070600073680126237210236581A7802561D3569A
-:1070700091685918994204DD300098400133054366
-:10708000F8E711230120D356D1685918994206DD3B
-:1070900002009A402669013332432261F6E7142048
-:1070A00011F0F0FD226900212A430123060002F0BD
-:1070B00033F9FF23220063720133A3810023483296
-:1070C0006664A37320001370A366FFF7C5F801235D
-:1070D000A27920001343A371F8BDC046F8EB02006B
-:1070E00044EF0200F0B5437A85B00400002B04D1D0
-:1070F000200010F07DFD05B0F0BD0122837A110063
-:107100009C461023066F0025F35603926344994072
-:1071100002912900F3680193019BAB422CDDB36817
-:1071200072696B4363445B00E77AD3181A78587826
-:10713000E379012F10D15F1E3F1A10003A005B0067
-:107140004343606F8218D3189B79002B02D0039BB6
-:10715000AB4019430135DFE7022F05D15F1EBA1A94
-:10716000277A013F381AEAE7032FE8D1277A013F4F
-:10717000BF1A02003800E2E71123C943F356606CDE
-:10718000994023691940029B194311F023FD667A47
-:10719000B31EDBB2FC2B14D8FFF70CF80B4B050029
-:1071A000236300230A4863630A4BFF21E4622364DC
-:1071B000704302F02BFE290041432000143011F0EF
-:1071C000BAFA637A012B00D995E791E7F17B0200C7
-:1071D000B6030000DB7B02001FB5012381881A0083
-:1071E000684610F0A5F8012303491A00684610F01C
-:1071F0009FF805B000BDC046FE0300001FB50300A8
-:1072000048331A780400002A0DD000221A70012396
-:1072100081881A00684610F08BF8012304491A008F
-:10722000684610F085F82000743011F019F91FBD80
-:10723000FF03000073B5079C0500002C1CDB060053
-:1072400048363078002802D03078012816D10698C8
-:107250001BB2C0B20090280012B2743011F010F9C5
-:10726000002C07D02B004A331C80002407234C3508
-:107270002C803370200076BD014CFBE7014CF9E710
-:1072800017FCFFFF12FCFFFFF8B50400171E1DDD01
-:10729000060048363378002B02D03378012B17D103
-:1072A0002200E3795632013B1370230000252000B1
-:1072B00054331D80503010F015F823004A331F80DE
-:1072C000022328004C3425803370F8BD0148FCE7C8
-:1072D0000148FAE717FCFFFF12FCFFFFFF2902D865
-:1072E0004172002070470148FCE7C04617FCFFFFD1
-:1072F00013B5040004A800780090200011F07DF977
-:10730000002801D1207516BD0048FCE70EFCFFFFE8
-:1073100013B5040004A800780090200011F055F97E
-:10732000002801D1207516BD0048FCE70EFCFFFFC8
-:107330007FB50D0011000F226A4404001E1E11705B
-:1073400016D0089B002B13DD012329000093FFF7C3
-:10735000DFFF002802D0074804B070BD0090089BF2
-:10736000320029002000FFF7C3FF0028F4D0F2E725
-:107370000148F1E70EFCFFFF17FCFFFF10B504000A
-:1073800086B0006C01F07AFD217BA0228B001851A1
-:1073900000200C4BD20098500B4A14309850636C6C
-:1073A00068465B7CC91849B210F02CFE039B019A19
-:1073B00003211A60207B0130C0B202F023FD21734B
-:1073C00006B010BD007000400405000082B070B52A
-:1073D0000400002588B00C920D93636C9A68AA4251
-:1073E0000ADD197C02A8491949B210F00BFE069B70
-:1073F000039A01351A60F0E75D7C237B02A8ED1843
-:107400006DB2290010F0FEFD039A059B01921A60EF
-:107410000021182202A811F0BBFC02A800222900BA
-:1074200011F07CFA206C002802D0082111F01BFC1E
-:10743000082011F027FC2900060001F0F9FC094B97
-:107440002000E3620023FA212363074B2664A46231
-:10745000E3631030090111F06EF908B070BC08BC8C
-:1074600002B018477D730100AF7F0200F0B5040041
-:107470000E00150085B01F000CAB1B881030019367
-:107480000FF04CFF26806580182011F0FBFB02AE48
-:10749000050033000AAA03CA03C32F602800082787
-:1074A00000213A000C3011F073FC3A003100281D25
-:1074B00011F052FC064B02226B612000002301995F
-:1074C000A5600A43E360A2802362636205B0F0BD59
-:1074D000C57F020070B5040086B010300D0001F0C9
-:1074E000B9FB0023194AA3622261194AE3631668B3
-:1074F0006564237323606360A3609E4220D0154AB5
-:1075000028200492059311F0BDFBC02305006A46B4
-:10751000029304AB03CB03C22300062102222800FE
-:10752000FFF7A4FF336829005B6830009847002804
-:1075300006D0280010F014FF2821280011F093FB3A
-:1075400000232000236406B070BDC04644EF020053
-:10755000A02B0020CD73010030B50024037301235C
-:10756000034D84710560818082734373846030BDF4
-:1075700068EB020070B583790400DB0703D518219E
-:10758000806811F070FBA3799B0703D51821A068D0
-:1075900011F069FBA3795B0708D5A0230021164AE7
-:1075A000DB00D150A068083111F05DFB0826A379FB
-:1075B000334209D0A568002D06D0280010F0ECFF5A
-:1075C0003100280011F04FFBA379DB0605D5A06838
-:1075D000002802D00368DB6898476023A2791A422A
-:1075E00005D0A068002802D003685B689847002394
-:1075F000A360A37170BDC04600700040F7B50126BE
-:10760000037B040033422AD0612385791D4017D1C2
-:10761000FFF7B0FF182011F035FB0E230700E356EB
-:1076200018220093637B2900019311F0B1FB019AAA
-:107630000099380011F072F9A379A7603343A37160
-:107640006023A279A0681A4202D010F0EEFFFEBDBE
-:10765000436940681B681840431E9841F7E701489A
-:10766000F5E7C04616FCFFFF10B50124837941738E
-:107670001C4004D0806811F0E2F9002010BD6022A7
-:10768000134203D0806810F0D7FFF6E70048F5E713
-:1076900016FCFFFF10B5002903DB024B196010F048
-:1076A000FEFF10BDB02B002070B504001E0004AB1F
-:1076B0001D7801F099FA20000E4B40302360FEF750
-:1076C00007FE230001364C33013522001E701D7366
-:1076D0000023E1214E32A3646365138053809381BC
-:1076E000D381013B200063644902FFF7D3FF2000F0
-:1076F00070BDC046E4B50200F7B580277F053D693F
-:107700007C690822113C6C4306002100684611F098
-:1077100023FB104B009A9A4219D000930023019347
-:10772000796930001339694310F092FC019A00998D
-:10773000300010F0A5FC2100300010F089FC7969C0
-:10774000AB08133969432200300010F08BFC01981C
-:10775000FEBDC046FECA0000F0B50D00A9B00D92F6
-:1077600000213022060010A80B9311F011FB280015
-:1077700011F062FB431C0C93102B00D9B6E00B9B5D
-:10778000202B00D9B2E02900300010F0A0FC071E29
-:1077900050D129000C9A10A811F0DEFA0D990B9A1D
-:1077A00014A811F0D9FA80235B051A695F690C925D
-:1077B000113F7A4330005D690B92FFF79DFF302245
-:1077C000002104001CA811F0E3FA290000270C9BFB
-:1077D00013395943300010F03BFC0D9730257D43A1
-:1077E0000B9B0833ED18A74243DA290030221CA86E
-:1077F00011F0B2FA10A91CA811F014FB002828D12E
-:107800003C49300022000E910F9410F039FC6A467A
-:10781000099513AB23CB23C223CB23C223CB23C293
-:107820003000129B1099119A10F038FC01230D932F
-:107830000137D3E70D9910300B9A11F07EFA302101
-:107840000400380011F00FFA002CA2D1200029B05A
-:10785000F0BD6A4609951FAB23CB23C223CB23C2BD
-:1078600023CB23C230001C991D9A1E9B10F016FCDE
-:10787000DEE7E5433023ED1725405D430B9B0835DC
-:107880005D190D9B002B1DD10C9B3021981E02F021
-:1078900033FAA0422CD017490134300022000E9157
-:1078A0000F9410F0EDFB6A46099513AB23CB23C26E
-:1078B00023CB23C223CB23C230001099119A129BF1
-:1078C00010F0ECFB0B99300010F0C2FB80235B053D
-:1078D00059690C230C9A133963434A43023311004C
-:1078E00030000B9A10F0BEFB0024AFE7024CADE76E
-:1078F000024CABE7FECA000017FCFFFF13FCFFFFC2
-:10790000022802D10122014B1A707047442E002038
-:1079100070B5064C05002378002B04D1044801F013
-:1079200043F801232370280070BDC046452E002077
-:107930000179010070B50C000FF0B2FC002810D0E6
-:107940000023144DA40A2B70200010F0FCFB00282B
-:1079500003D00A2011F06CF8F6E72B78002BFCD04E
-:1079600070BD02210C4B0D4A99508021C9000800BE
-:107970005D58002DFCD0A121C9005C501958002988
-:10798000FCD0002199508021C9005A58002AFCD00F
-:10799000E6E7C046442E002000E001400405000058
-:1079A000F8B50C0015001E000FF07AFC002811D06D
-:1079B0000023174F3B7032002900200010F0C1FB5C
-:1079C000002803D00A2011F033F8F4E73B78002BAD
-:1079D000FCD0F8BD01210F480F4B8446195080217F
-:1079E000C9005A58002AFCD080270022FF00964286
-:1079F00007DD910068586050D9590029FCD0013248
-:107A0000F5E7002261465A50DA59002AFCD0E0E737
-:107A1000442E00200405000000E0014008B4024BA1
-:107A20009C46443808BC60474B810200FA21F8B5F7
-:107A30000389C90004005943324810F0A1FCFA211F
-:107A4000890002F059F9304F2081A17A380010F0F6
-:107A500097FC23002600250022894C33A072A03613
-:107A60001A808C35317800232A22286810F086FA93
-:107A7000002801D02548F8BD31781F235B222868F3
-:107A800010F07CFA0028F5D1317820235C22286898
-:107A900010F074FA0028EDD1317801232C222868E7
-:107AA00010F06CFA0028E5D1317801232D222868E6
-:107AB00010F064FA0028DDD1317801232E222868E5
-:107AC00010F05CFA0028D5D1A17A380010F053FCF0
-:107AD0003178C3B20E22286810F050FA0028C9D1BC
-:107AE000FA21238989005943064810F044FC0123F8
-:107AF0000343DBB231782A22286810F03FFA0028CD
-:107B0000B9D0B7E718EC020010EC02000EFCFFFF42
-:107B100008B4024B9C46443808BC60472D7A0100EB
-:107B2000074B10B51A00040008323C33026043646E
-:107B300044300FF061FD20000FF075FC200010BDF7
-:107B400078EC020008B4024B9C46443808BC6047FD
-:107B5000217B010008B4024B9C46443808BC6047B6
-:107B600055810200F0B5042583798BB004002B42C7
-:107B700004D100F0EFFBA3791D43A57120009030E4
-:107B8000FFF73CFD0026B0420FD12300A033197847
-:107B900020000C2307AD00938C302B0001220068DD
-:107BA000FFF7C6FB061E03D02C4E30000BB0F0BD15
-:107BB0000A2304AA9B182A785A706A781A7000223D
-:107BC000985EAA785A70EA781A700022995E03913A
-:107BD0002A795A706A791A7000229F5EAA795A70BF
-:107BE000EA791A7000215A5E04922A7A5A706A7AE7
-:107BF0001A7000215A5E0592AA7A5A70EA7A1F25F5
-:107C00001A7000229B5EA27A9C46039B5043594205
-:107C10005143CB172B407A435B185B11A361C31709
-:107C20002B401818D3171D406423AD18059A5B42EA
-:107C30005343A36764236146049A40115A434B435C
-:107C4000E2676D11221DE06125622000D3670FF00D
-:107C500065FC200044300FF0D7FCA6E70EFCFFFFC8
-:107C600008B4024B9C46443808BC6047657B010061
-:107C7000F7B51E00040008AB1B881500019309AB83
-:107C800000911A8831000AAB1F88FEF777FB2000AD
-:107C90003A0031004430FEF785FD134B20001A00F6
-:107CA0003C336364230008322260009A8C331A60EC
-:107CB000AB8890308380AB79019A83710B4B0321A1
-:107CC0000360AB6883602B7B03736B7B4373AB7B7D
-:107CD00083732300A0331A80FFF7C6FC2000FFF750
-:107CE000A5FE2000FEBDC04678EC020068EB020055
-:107CF000F8B5FA260189B60004007143264810F051
-:107D00003FFB310001F0F8FF244F2081A17A3800B9
-:107D100010F036FB2500A0725835297800232A225E
-:107D2000606C10F02BF9002801D01D48F8BD2978AF
-:107D300010232B22606C10F021F90028F5D129784E
-:107D400001232D22606C10F019F90028EDD129785B
-:107D500001232E22606C10F011F90028E5D1A17AE0
-:107D6000380010F008FB2978C3B20E22606C10F0C6
-:107D700005F90028D9D121890748714310F0FBFA91
-:107D800001230343DBB229782A22606C10F0F6F855
-:107D90000028CBD0C9E7C046E0EC0200D8EC0200D6
-:107DA0000EFCFFFF10B50400034B083303600FF017
-:107DB0003AFB200010BDC04640ED02007FB504250F
-:107DC000837904002B4204D100F0C4FAA3791D4347
-:107DD000A57120004830FFF711FC0025A8420DD105
-:107DE000230058331978062302AE00930122330092
-:107DF000606CFFF79DFA051E03D00D4D280004B0FE
-:107E000070BD022300210420F356A27ADB007156D4
-:107E100030565B425343C000C90051434243A36103
-:107E20002368E16122629B6A20009847E6E7C0462A
-:107E30000EFCFFFFF8B50400150006AA168807AA75
-:107E40000F0012881900FEF799FA0F4B6764083388
-:107E500023602300AA8848339A80AA7920009A7167
-:107E60000A4AA264AA6822652A7B1A736A7B5A733B
-:107E7000AA7B9A730023A371230058331E80FFF757
-:107E800037FF2000F8BDC04640ED020068EB02005D
-:107E900010B50400034B083303600FF0ADFB200066
-:107EA00010BDC046D4ED0200F0B507005C3787B0C6
-:107EB0000400397800231022806C10F05FF803264C
-:107EC000002802D01F4807B0F0BD0F2502ABED1807
-:107ED0000123397808220093A06C2B00FFF728FAC1
-:107EE000184B9842EED02B78334203D0642000F038
-:107EF000BDFAEAE7FA262189134DB600714328003E
-:107F000010F03EFA310001F0F7FE20813978A0230D
-:107F10001122A06C10F032F80028D3D1A36C218973
-:107F20000393714328003F7810F025FA012318438A
-:107F3000C3B210223900039810F020F80028C2D0F4
-:107F4000C0E7C0460EFCFFFF74ED020070B50825C7
-:107F5000837986B004002B4204D100F0FBF9A379A9
-:107F60001D43A57120004C30FFF748FB061E0DD0C5
-:107F700023005C331978062304AD009301222B0003
-:107F8000A06CFFF7D5F9061E03D0134E300006B0E3
-:107F900070BD0E232A786B445A706A7820001A70DC
-:107FA0000022995E64224A43A263AA785A70EA7852
-:107FB0001A700022995E642252425143616329790A
-:107FC00059706979197000215B5E5A432368E26336
-:107FD0001B6A9847DAE7C0460EFCFFFFF8B50400BD
-:107FE000150006AA168807AA0F0012881900FEF7C6
-:107FF000D9FB0D4BA764083323602300AA884C33B8
-:108000009A80AA7920009A71084AE264AA68626597
-:108010002A7B1A736A7B5A73AA7B1E829A73FFF7B4
-:1080200043FF2000F8BDC046D4ED020068EB02001B
-:10803000F7B5FA250189204FAD00040069433800E7
-:1080400010F09EF9290001F057FEA17A20811B480B
-:1080500010F096F92600636CA072009321895836BF
-:10806000337869433800019310F085F907230343FF
-:10807000DBB22022019900980FF080FF002801D088
-:108080000F48FEBD317810232222606C0FF076FF7E
-:108090000028F5D1A17A0948656C377810F06BF9A2
-:1080A00080235B420343DBB22322390028000FF018
-:1080B00065FF0028E5D0E3E708EE020000EE0200CD
-:1080C0000EFCFFFF10B50400034B083303600FF0F4
-:1080D000AAF9200010BDC04678EE0200F0B50425D4
-:1080E000837985B004002B4204D100F033F9A379E1
-:1080F0001D43A57120004830FFF780FA061E0DD001
-:10810000230058331978062302AD0093A8222B00D0
-:10811000606CFFF70DF9061E03D0144E300005B059
-:10812000F0BD1F200023EA5ED31703409B180222F4
-:10813000A95E5B11CA170240521804216F5E5211EA
-:10814000F9170140C91949112B806A80A980A07ACA
-:108150005B424343524242434143E3612368A2618D
-:1081600021629B6A20009847D8E7C0460EFCFFFFBB
-:10817000F8B50400150006AA168807AA0F00128891
-:108180001900FEF7FBF80F4B6764083323602300E8
-:10819000AA8848339A80AA7920009A710A4AA26470
-:1081A000AA6822652A7B1A736A7B5A73AA7B9A7320
-:1081B0000023A371230058331E80FFF739FF2000EE
-:1081C000F8BDC04678EE020068EB0200F7B5FA256C
-:1081D00004000189134EAD006943300010F0D0F85F
-:1081E000290001F089FD2700A36C208100935C37F2
-:1081F0003B7881B269433000019310F0BCF86022F3
-:10820000C3B2019900980FF0B9FE002801D00648CA
-:10821000FEBD397801236222A06C0FF0AFFE00286A
-:10822000F6D0F4E7ACEE02000EFCFFFF10B5040040
-:10823000034B083303600FF0DFF9200010BDC04688
-:10824000D4EE02007FB50825837904002B4204D1C7
-:1082500000F080F8A3791D43A57120004C30FFF792
-:10826000CDF9051E0DD023005C331978062302AE2C
-:108270000093E8223300A06CFFF75AF8051E03D0E4
-:108280000B4D280004B070BD0223F25E96235B42C2
-:108290005A4362630021725E20005343A3630423A8
-:1082A000F25E96235343E36323681B6A9847E8E72B
-:1082B0000EFCFFFFF8B50400150006AA168807AAF1
-:1082C0000F0012881900FEF76DFA0D4BA7640833F2
-:1082D00023602300AA884C339A80AA7920009A71DF
-:1082E000084AE264AA6862652A7B1A736A7B5A7339
-:1082F000AA7B1E829A73FFF769FF2000F8BDC04673
-:10830000D4EE020068EB020010B572B60B4B1C688D
-:10831000002C08D020000FF0A2FF0023E364084BDC
-:108320002000E36310BD62B65C2010F0ABFC5C2261
-:108330000021040010F02CFDEFE7C046D82B0020F0
-:1083400000400020024B1878012318407047C046B7
-:10835000462E0020002310B504499C006258002AD4
-:1083600001D00133F9E76050100010BDBC2B002094
-:1083700010B50024084BA200D058002802D0036892
-:108380005B6898470134062CF4D1044B1B68002B22
-:1083900000D120BF10BDC046BC2B0020D42B002034
-:1083A000F8B5FFF7CFFF00281CD02A4D2C68E36CEE
-:1083B000DA0718D502273B43E364274B1E680423E2
-:1083C000F26C30001343F364636BF3630FF05EFFF2
-:1083D0003000716C00F097FA2868C36C3B4201D002
-:1083E00000F0CBFAF8BD1D4F1D4E3A683168002AE7
-:1083F0001ED129602A68914208D11B0706D52C603E
-:10840000FFF7B6FF3B68002BFAD02B6029688C423F
-:10841000E8D03368994214D1124B4B63124B8B63F3
-:1084200020000FF033FF2968626C4B6C20000DE0D8
-:10843000206DB84203D1606D002800D002002A6090
-:10844000D8E79C42ECD1002210004B6C00F01AFAE5
-:10845000C8E7C046E02B0020B82B0020D42B00201A
-:10846000DC2B0020FC3F0020BF82020070B505001D
-:10847000FFF768FF002803D1280010F0D9FA70BD7B
-:108480000C4B1C68E36CDB0706D5FFF73DFF0A4B7E
-:108490001860002800D00400FDF7C6FE2D18A56462
-:1084A00020000FF0DCFE054920000FF0C6FEFFF7AC
-:1084B00077FFE4E7E02B0020B82B0020B42B00204E
-:1084C00070B5114E3278022A1AD081421AD90C1A8C
-:1084D000072C17D90D00032305432B4012D172B688
-:1084E0000A4DD2005051AA1851608022A4081206E9
-:1084F0001443046032780132327062B6180070BDE5
-:108500000348FCE70348FAE7482E0020E42B00204C
-:1085100013FCFFFF17FCFFFF70B5134C0600237818
-:10852000124D002B0CD1124912482B70FFF7C8FFD7
-:10853000114B984202D11E20FDF7D8FC0123237075
-:1085400000242B78A34209DD0C49E300C918300050
-:108550000FF0BBFE002805D10134F2E71420FDF72F
-:10856000C5FC002070BDC046472E0020482E0020CC
-:1085700000380020E02F002017FCFFFFE42B002034
-:1085800070B5002819D0104B10491C7800239C426C
-:1085900016DDDA005558854210D28A185268824298
-:1085A0000CD9041F2368002B02DC1E20FDF79EFC63
-:1085B000802322681B061343236070BD0133E6E766
-:1085C0001E20FDF793FCF8E7482E0020E42B002046
-:1085D0000268084B406810B5C018C00010180300AE
-:1085E0009A4205D81C688C4202D31800083BF7E772
-:1085F00010BDC046FFFFFF1F014B03607047C04620
-:1086000000EF020030B500684488A1420CDA85888A
-:10861000AA4209DA002907DB002A05DB5443401887
-:1086200000198371002030BD0048FCE717FCFFFFF4
-:10863000F0B5070085B00E001D00002921DD002ADD
-:108640001FDD002B1DD00468638803938B4200DD7F
-:108650000391A3880293934200DD02920023063423
-:108660000193019B029A93420EDA29002000039A9B
-:1086700010F072FB3B68AD195B88E418019B013375
-:10868000EEE7024805B0F0BD0020FBE717FCFFFF56
-:10869000F8B504000D0016001F00002901DB002AB8
-:1086A00002DA0E4B2360F8BD100048430630FFF796
-:1086B00033FF20600EF077FE23685D8023689E8084
-:1086C000002F06D03B00320029002000FFF7B0FF4A
-:1086D000E9E720000FF0C4FEE5E7C04600EF020026
-:1086E000F7B506000D1E03D1234B03603000FEBD1D
-:1086F00000200F000400010001903B78002B1AD0ED
-:108700003022524294469C446246092A11D90A2BCF
-:108710000AD1019B241801330193A14200DA210000
-:10872000002004000137E8E70028FBD001340020D6
-:10873000F8E70120F6E7019A300012B209B2FFF71C
-:10874000A7FF33680A249A1D01235B421800297889
-:108750000029CBD00F00303F092F07D85F1C00D174
-:10876000002363435B18303B0135F0E7591CFBD015
-:10877000137001320300F7E700EF0200F0B50400C8
-:1087800087B004A80E0001921D00FDF7B3FC23681A
-:1087900001995A88914233DA9B889D4230DA1F2E24
-:1087A0002ED9059B00939E422ADC05230022203E01
-:1087B0005E43049B9B1903930021039BAE189B5CB3
-:1087C0000293019BCF1823685888009087420EDAE5
-:1087D0009888B0420BDDDB1910270F4100987043D9
-:1087E0001B1802980740781E87417F429F71013114
-:1087F0000529E6D10132052ADED1002007B0F0BDFF
-:108800000048FBE717FCFFFFF7B504680700638823
-:108810000E1E01931EDD994218DA002306340093E0
-:108820003B68009A9B889A4212DA019BA1199D1B12
-:108830002A00200010F090FA601931000FF002FEBB
-:108840003B685B88E418009B0133E8E70FF008FE03
-:10885000002000E00048FEBD17FCFFFF10B50548F2
-:10886000054C20600EF0A2FD044A0549200010F0DE
-:1088700002FA10BD00EF0200F42B002000000020DF
-:1088800037840200002815D0006041608260C36018
-:10889000046145618661C761444604624C46446296
-:1088A000544684625C46C462644604636E46466312
-:1088B00074468463002A06D0C46B043C043A2568DD
-:1088C0001560B442F9D18C6BA6464E6BB546002BB1
-:1088D00006D0CC6B043C043B1D682560B442F9D142
-:1088E0000C6BA446CC6AA3468C6AA2464C6AA1468D
-:1088F0000C6AA046CF698E694D690C69CB688A689D
-:10890000086849687047006041608260C360046124
-:1089100045618661C761444604624C4644625446E0
-:1089200084625C46C462644604636E464663744671
-:108930008463C46B043C043925680D60B442F9D1EA
-:10894000C769866945690469704700604160826053
-:10895000C360046145618661C761444604624C4658
-:108960004462544684625C46C462644604636C4656
-:1089700044637446846304697047846BA646446B01
-:10898000A546046BA446C46AA346846AA246446A08
-:10899000A146046AA046C769866945690469C36837
-:1089A0008268006841687047014B18607047C04694
-:1089B000F82B002080B2002807D1BFF34F8F034B64
-:1089C000034ADA60BFF34F8FFEE7704700ED00E027
-:1089D0000400FA050120054B10B51A7850401870B4
-:1089E000034B1B68002B00D0984710BD492E002078
-:1089F000FC2B0020F0B5254B85B01B78DBB2009333
-:108A0000002B18D0224E234F33685A425A41D2B21B
-:108A100001923A68002A14D1009C002B0BD021E06F
-:108A200003983B6898472C0019E028003368984762
-:108A300029E0002C05D005B0F0BD002CFBD1009C36
-:108A4000019403A80FF0AEFD009C0500052806D098
-:108A50000028E5D000221100FFF7ACFF0024019BA5
-:108A6000002BE6D10C4B03A91B880B800B4B1D6818
-:108A700028000FF099FD0528DFD00028D5D000226E
-:108A80001100FFF797FF002CECD1D9E74A2E002008
-:108A9000002C0020082C0020C42D00200C2C0020CD
-:108AA000074B10B51B68002B07D09847002803D050
-:108AB00000221100FFF77EFF10BDFFF79BFFFBE7D1
-:108AC000042C002002210C4B0C4A30B59950802117
-:108AD000C9000C005D58002DFCD0A121C9005850E0
-:108AE00019590029FCD0002199508021C9005A58F9
-:108AF000002AFCD030BDC04600E001400405000063
-:108B0000032370B5040098409C4315331840E733A5
-:108B100083408140012022689A438918074B084A04
-:108B200098508020C00005001E58002EFCD0216007
-:108B300059590029FCD00021995070BD00E0014036
-:108B40000405000070B5012580260D4B0D4CF60084
-:108B50001D519D59002DFCD0802592001218ED006A
-:108B6000091A904205D100221A515A59002AFCD004
-:108B700070BD0E5806605E59002EFCD00430F0E740
-:108B800000E001400405000070B504000D0016006F
-:108B90000021102210F0FCF8054B3200236129005F
-:108BA000200000F011FB034B20001C6070BDC0468C
-:108BB000A0860100102C002010B50400016100F017
-:108BC000BDFA014B1C6010BD102C002070B5054D86
-:108BD00004002B68834203D0016900F0AFFA2C60D7
-:108BE00070BDC046102C002010B5040000F006F83F
-:108BF000014B2000236010BD10EF02000C4B70B53C
-:108C00000360002343608360C36003624362836345
-:108C1000962304009B01051DC363280000F010FC8F
-:108C200028002200034900F0A7FC200070BDC046C8
-:108C300020EF02006586020010B50400044B0360BB
-:108C40000FF071FD200000F01BF8200010BDC046A1
-:108C500030EF0200084B10B5083303600023436077
-:108C60008360C360040000F0B3F8044920610FF092
-:108C70006CFE200010BDC04650EF0200ED870200E0
-:108C800010B50400034B083303600FF0BCFD200057
-:108C900010BDC04650EF0200054B10B51B68002BFD
-:108CA00004D119221821034800F0CAFB10BDC046A8
-:108CB000AC2D0020D42F0020030010B50020022B83
-:108CC0000ADD0749033B9B005A585850824204D0A2
-:108CD000136810005B68984710BD01204042FBE715
-:108CE000142C002070B50C001500022810DC0F4B6E
-:108CF0001B68002B01D1FFF7CFFF6619B44205D0E6
-:108D000021780B4800F08AFC0134F7E7280070BD99
-:108D10000338084B8000C058002803D003681B6844
-:108D20009847F4E701204042F1E7C046AC2D00200F
-:108D3000D42F0020142C002010B50C0002280BDCCE
-:108D40000C4B1B68002B01D1FFF7A6FF0A480FF060
-:108D500051FF2070012010BD0338084B8000C0581F
-:108D6000002803D003689B689847F4E7012040423D
-:108D7000F1E7C046AC2D0020D42F0020142C002099
-:108D8000030010B50120022B08DD033B054A9B00C0
-:108D90009858002803D00368DB68984710BD01206D
-:108DA0004042FBE7142C0020030010B50020022BEA
-:108DB00008DD033B05489B001858002803D00368D2
-:108DC0001B69984710BD01204042FBE7142C00208E
-:108DD0000048704764EF020010B502480FF0BEFD76
-:108DE00010BDC04664EF02000848026803210A4330
-:108DF00002600749074A084B9B1A03DD043BC85829
-:108E0000D050FBDC0548804705480047240500405A
-:108E1000648703000000002014010020059C01006D
-:108E200009010000FEE7FEE7FEE7FEE7FEE7FEE7DA
-:108E300070B50E000E4C05002100300000F0D2FE8F
-:108E400028600023E3565A1C01D1002302E0B342FC
-:108E50000CD1A368A02201200649D2002B718850B2
-:108E60006A221B021343044A8B5070BD0C34E8E79E
-:108E700080EF020000700040040500000B4B0C491D
-:108E800010B55A580B4C22405A5002795C581202C5
-:108E900022435A5080200122C0001A601958114202
-:108EA000FCD1A122D200985880B210BD00700040C1
-:108EB00004050000FF00FFFF01704B1C0AD00123D6
-:108EC0008B404360044BC360044B0361044B43611C
-:108ED000044B83607047C046080500500C050050E5
-:108EE0001005005014050050F7B5A223A022DB00A6
-:108EF000D205D358BE220193314B52009958002914
-:108F00003FD0C1218900595800293ADA0024E025D0
-:108F1000C0269C50ED00B6022A4BA700F858002846
-:108F20002CD0294BE35C002B17D0019B0121E3409F
-:108F30000B4227D02300A022C133FF339B00D20570
-:108F40009B589B039B0F032B1CD0204B1B68E340BB
-:108F50000B4217D01E4B1B689847A023DB05FF1858
-:108F60007A5932420AD07A591A490A407A51019AFA
-:108F7000E240D3071FD57A5932437A5101341F2C6E
-:108F8000CAD1F7BD019B0122E3401342E5D1230082
-:108F9000A021C133FF339B00C9055B589B039B0F86
-:108FA000032BDAD10C4B1B68E3401342D5D0084B9E
-:108FB00002211B68D0E78022795992020A43DCE73C
-:108FC000006000401C2D00204B2E0020A02D002012
-:108FD000982D0020FFFFFCFF9C2D002030B50400E1
-:108FE00008004D1C1CD00F4821600260BE220020EA
-:108FF0000D4C5200A0500D4A8D00AB5001220C4B7D
-:109000005A54C122802392001B06A350094B0A4CDC
-:1090100099580C40C02109042143995040221A60FC
-:1090200030BDC046982D0020006000401C2D00205F
-:109030004B2E002000E100E0FFFF00FF70B5A024F0
-:10904000E0250068E4058300ED001B195C591F4E04
-:1090500034405C511E4D01242E68002A26D0A142C6
-:1090600003D181400E432E6006E0022904D18440E2
-:10907000184A11680C4314602A680121C2400A4250
-:1090800004D1144A1268C2400A420ED0A021A22282
-:10909000C905D2008958F132C140FF329858C9073A
-:1090A00011D5C02189020143995070BD012902D117
-:1090B00081408E43D7E70229DED1844005490A6802
-:1090C000A2430A60D8E78021ECE7C046FFFFFCFF1F
-:1090D000A02D00209C2D00200368074A9950074AC4
-:1090E000FC33196A002902D0002018627047013A47
-:1090F000002AF6D10120F9E71C050000A186010035
-:1091000010B50368002A03D08022022092009850F4
-:1091100001221C001A62084AFC34E068002806D0CC
-:109120000020A322E060D2009B580B7010BD013AD2
-:10913000002AF2D10120F9E7A186010010B50B4CFD
-:1091400002680B4BA14205DC0A498160CC2149042D
-:10915000D15010BD084CA14204DC08498160802137
-:10916000C904F5E706498160CD21F9E78FD00300F6
-:1091700024050000A08601007F1A060090D003009D
-:10918000801A060070B504001000A025C026C1306A
-:10919000FF30F600ED05800046510800C130FF3079
-:1091A00080004651A1252068ED004251054A8150BA
-:1091B00019002000FFF7C2FFA02305212268DB0071
-:1091C000D15070BD0C050000F8B50E00150004006C
-:1091D00000F002FC264AF1B21378DBB2012B1DD15C
-:1091E000507888421AD19778E8B2874216D16373D3
-:1091F000204B19000022FC312360657126718A62C0
-:10920000A021C9005A501C4920005A5001325A501E
-:109210002A003100194BFFF7B5FFF8BD184BE8B233
-:109220001F78012F09D15F788F4206D19F7887423E
-:1092300003D102236373134BDBE71778002F04D1AC
-:109240000123137051709070D1E71A78002A04D16D
-:1092500001321A7059709870EBE70B480FF030FB31
-:109260000023FC222360657126719362FFDEC046F5
-:109270006A2E002000300040FC0F0000A086010094
-:109280006E2E002000400040B986030003680022D3
-:109290001900FC3110B58A62A021C9005A50064954
-:1092A0005A5001325A500522042182564156836891
-:1092B000FFF768FF10BDC046FC0F000003680021E7
-:1092C0001A00FC3210B5916001315961074B916869
-:1092D000002905D000240473FFF7D8FF200010BD3B
-:1092E000013B002BF3D10120F9E7C046A186010024
-:1092F000036810B51900FC318A6A0020012A08D1E0
-:10930000044C1C5988625A610238A40701D4012018
-:10931000404210BDC40400000261064A10B542601C
-:10932000054A01738260054A190002600FF02FFCA4
-:1093300010BDC04604050050100500500007005045
-:109340000023134A30B5D35683421DD00123D35690
-:1093500083421BD00223D356834214D10223190027
-:1093600045310C480C4CFF3189000C5001210D0097
-:109370005C00601C8540A140A120084C2943C0002E
-:109380002150FF21D15430BD0023E8E70123E6E757
-:10939000EB00002000600040031F020000F00140CD
-:1093A000A820012110B5124A124B1488C000596040
-:1093B0001C50548810481C509088A922D200985004
-:1093C000802208209200985080200932FF3200034A
-:1093D00098500A4A1078A222D2009850084A108861
-:1093E000084A985000221960FC331A6510BDC04627
-:1093F000D200002000A0004044050000EE00002044
-:10940000D00000204C050000012310B50A4ADC0002
-:1094100014598C4207DD013BDB00D3185A68016800
-:10942000064BCA5010BD0133112BF0D180210268C8
-:10943000024B4905D150F5E7D4EF020024050000A6
-:10944000F8B50F0016000122244BBA400360A02398
-:10945000234CDB05195905000A431A51802219597A
-:1094600012060A430121B1401A511A598A43962122
-:109470001A511A598901520052081A51FFF7C4FFB4
-:10948000002204202B6817495A506C39585001218A
-:10949000996019601900FC31CA6013495A506A601A
-:1094A00014391F325A5011495F5009185A501E5131
-:1094B0007B1C03D0032138000FF047FB731C03D043
-:1094C000032130000FF041FB0122094B29001A60F3
-:1094D000084807320FF040FCF8BDC04600200040AD
-:1094E000140500006C0500001C0500000C050000C0
-:1094F000AC2D0020D42F0020962310B5DB0099421C
-:1095000002DDFFF781FF10BD9E210268014BC902F9
-:10951000D150F8E7240500000168034B002A01D16F
-:10952000CA5070470E22FBE76C050000C1230E4AAB
-:109530009B00D15810B5090603D50C49096A0029CA
-:1095400008D1D3585B0704D5084B0021DB68002BFA
-:1095500001D110BD0121064B18680028F9D0054B38
-:109560001B689847F5E7C04600200040FC200040FB
-:10957000A82D0020A42D0020034B19604368034947
-:109580009B005A507047C046A42D0020A82D0020F3
-:1095900000681F4B30B5C3185C4263415B00002A72
-:1095A0001CD0002911D0012914D0FF20C024DD00D7
-:1095B000A8401849A4000A598243C020A840024389
-:1095C0000A5101229A400A6030BDC1220421920052
-:1095D0008150EAE7C12280219200F9E7002908D0F2
-:1095E0000129F1D1C222802492008450825892082D
-:1095F00006E0C22204219200815082580339D20928
-:109600009143E1D001229A401300034AD367DBE77C
-:1096100000E0FFBF00E100E004E100E003681A00A1
-:10962000FC32106A0128FCD100201062014AC9B244
-:10963000995070471C05000070B51D00A023040060
-:109640001600DB00002D0ED000224068C250082911
-:1096500002D012480FF034F9032E16D8300000F073
-:1096600037FB170510120268D550F0E70223A0223D
-:109670000B48D200002D0DD061680B5002238B5097
-:1096800070BD0423F3E70623F1E706480FF018F94D
-:109690000023ECE721680B500123F0E7CA860300A2
-:1096A00054050000E3860300036810B55A1C0DD072
-:1096B000A0220020164CD20098501000154AA1425A
-:1096C00005DC80218904995001221A5010BD124CEA
-:1096D000A14202DC8021C904F5E7104CA14202DC62
-:1096E00080210905EFE70E4CA14202DC80214905EB
-:1096F000E9E70C4CA14202DC80218905E3E70A4C32
-:10970000A14202DC8021C905DDE780210906DAE7F4
-:109710008FD00300240500001FA107003F420F0067
-:109720007F841E00FF083D00FF117A00F7B500930B
-:1097300008AB1B7805005BB20F00160001930133E4
-:1097400057D1614B1A78022A3ED15978FAB2914228
-:109750003AD19978F2B2914236D1DA786B461B78D9
-:109760009A4231D10123594C037201230022012076
-:109770005B426B603900564B2C60E250E050A023F6
-:10978000C131FF31DB058900C8505249675000994B
-:10979000C131FF318900C850A1210098C900605033
-:1097A0003100C131FF318900CA50A223DB00E650ED
-:1097B000FC3408212800E2601300FFF73DFF464912
-:1097C0002800FFF771FFF7BD444A1378DBB2022B84
-:1097D0000FD15078F9B288420BD19078F1B288421B
-:1097E00007D1D1786A461278914202D12B723C4C53
-:1097F000BBE73A4B1A78002A50D10232F9B21A70FC
-:109800005970F1B2997069460978354CD9702A724D
-:10981000019B0133A9D0012300222D495B4238006E
-:109820002B6002336C6062506350A021C130FF3066
-:10983000C905800042503000C130FF3080004250E6
-:109840000098C130FF30800042500198C130FF3095
-:1098500080004250A221C90067501E4900986650FE
-:109860000439605001981F4960502100FC318A6022
-:10987000CA62A721C9006350103163501A481B49BE
-:1098800060501B481B4960508021042089006050B3
-:10989000F939FF392800FFF7CFFE94E70A4B1A7811
-:1098A000002A0CD102321A70FAB25A70F2B29A70CF
-:1098B0006A461278054CDA7001232B72A8E70E482D
-:1098C0000EF0FEFFA4E7C0466A2E002000300040E4
-:1098D000FC0F00000C05000040420F006E2E00201F
-:1098E0000040004014050000732E002044050000D5
-:1098F000722E002034050000F486030003681A006D
-:10990000FC32D0680028FCD105481950D1680129E3
-:10991000FCD10021D160A322D20098587047C046E4
-:109920001C050000A023F0B5284FDB00FA5885B0D5
-:1099300001920022A024FA50E023254AE405DB002E
-:10994000E658E2507833E15801250291E250A12314
-:109950008022DB00D205E2500420E5500FF05EF9D2
-:10996000A222D200A35803979B0F2B4228D0A358C2
-:1099700013242B4225D00120A023E0220299DB05ED
-:10998000D2009E5078329950A023039A0199DB00AF
-:10999000D15005B0F0BD0F4B0420EF500FF03EF951
-:1099A000A123DB00EF5004200FF038F9A223DB00E5
-:1099B000EB585B00DFD4013C002CECD12000DBE74E
-:1099C0001324A0250127ED05F5E7C046004000401F
-:1099D0000D0600000C050000A023E021134ADB0562
-:1099E000C90010B55A5078315A50114B0022190055
-:1099F000FC31CA600A62A1211E20C9005A500D4ADA
-:109A00000D4C9850CC200D4A40049850A2200C4A8E
-:109A1000C00014500B480C4C145001205050A02290
-:109A20000521D2009950FFF77DFF10BD0C06000004
-:109A3000004000400C0500003841004024050000B3
-:109A400000F00140140500001C400040012310B547
-:109A50000D4C0E49A36480239B00CB670C490D4A33
-:109A6000086D002804D000200865116801311160DC
-:109A700009490B60A923DB001068E358010C9BB275
-:109A80000004184310BDC0460090004004E100E00F
-:109A9000FC900040B02D002000E100E0F8B50F4C34
-:109AA000636C002B0FD000270D4E67643378BB42E8
-:109AB00009D00C4B1D68FFF7C9FF2D1ABD4202DC0F
-:109AC0003770FFF789F9236D002B05D0064A13681C
-:109AD0000133136000232365F8BDC046FC900040AD
-:109AE000742E0020B42D0020B02D002070B51B4D29
-:109AF0002878002831D10121194B1A4A5960506049
-:109B00008020C005016051680029FCD00022164960
-:109B1000A2205A5004240121C000D9601C500838EA
-:109B20001A501248C2261A50C12280209200000307
-:109B300098508020400298500D4AB60090590D4C24
-:109B40000440C020000220439051C02480206400C3
-:109B50008000105110601960297070BD752E0020B2
-:109B600000900040FC000040040500004C0500008F
-:109B700000E100E0FF00FFFF044B10B51B78002B55
-:109B800001D1FFF7B3FFFFF761FF10BD752E002075
-:109B9000104B70B51B780400002B01D1FFF7A6FF16
-:109BA0000D4D0E4E2B78002B02D03368A34210D0FF
-:109BB000FFF74CFF201A0A2803DCFFF747FF0A30A3
-:109BC000040001232B70A823054A3460DB00A4B2F3
-:109BD000D45070BD752E0020742E0020B42D0020AE
-:109BE0000090004010B50400431C07D00FF02FF880
-:109BF0000400431C02D102480EF062FE200010BD9A
-:109C000005870300224910B50B68DBB2012B0FD189
-:109C1000204B1B681B070BD11F4BE0241A68F02355
-:109C200010001840224228D11C4A12681A4227D03C
-:109C30000B68DBB2012B12D1164A126812070ED143
-:109C4000F021154A12680A40402A08D1134A1268C6
-:109C50000A4204D18021C122C905D2008B50802242
-:109C6000A3230021D205DB00D1500D4B99600131B7
-:109C700091609A68002AFCD010BD3028D4D0D7E774
-:109C8000084B094A1A608022084B12021A60CFE77B
-:109C9000E00F00F0E40F00F0E80F00F0EC0F00F030
-:109CA000FC00004004050040DFFF07C0186C0040C6
-:109CB000014B18687047C046B82D002002B47146A9
-:109CC00049084900095649008E4402BC7047C04605
-:109CD00002B4714649084900095C49008E4402BC3F
-:109CE0007047C04603B47146490840004900095E08
-:109CF00049008E4403BC7047002243088B4274D352
-:109D000003098B425FD3030A8B4244D3030B8B427C
-:109D100028D3030C8B420DD3FF22090212BA030C85
-:109D20008B4202D31212090265D0030B8B4219D366
-:109D300000E0090AC30B8B4201D3CB03C01A524186
-:109D4000830B8B4201D38B03C01A5241430B8B42CE
-:109D500001D34B03C01A5241030B8B4201D30B03B7
-:109D6000C01A5241C30A8B4201D3CB02C01A5241DE
-:109D7000830A8B4201D38B02C01A5241430A8B42A1
-:109D800001D34B02C01A5241030A8B4201D30B028A
-:109D9000C01A5241CDD2C3098B4201D3CB01C01AA4
-:109DA000524183098B4201D38B01C01A52414309AE
-:109DB0008B4201D34B01C01A524103098B4201D39C
-:109DC0000B01C01A5241C3088B4201D3CB00C01A09
-:109DD000524183088B4201D38B00C01A5241430881
-:109DE0008B4201D34B00C01A5241411A00D20146A6
-:109DF000524110467047FFE701B5002000F0F0F82F
-:109E000002BDC0460029F7D076E7704703460B43F2
-:109E10007FD4002243088B4274D303098B425FD363
-:109E2000030A8B4244D3030B8B4228D3030C8B428F
-:109E30000DD3FF22090212BA030C8B4202D3121275
-:109E4000090265D0030B8B4219D300E0090AC30B4A
-:109E50008B4201D3CB03C01A5241830B8B4201D3F7
-:109E60008B03C01A5241430B8B4201D34B03C01AE0
-:109E70005241030B8B4201D30B03C01A5241C30A58
-:109E80008B4201D3CB02C01A5241830A8B4201D3C9
-:109E90008B02C01A5241430A8B4201D34B02C01AB3
-:109EA0005241030A8B4201D30B02C01A5241CDD258
-:109EB000C3098B4201D3CB01C01A524183098B42A3
-:109EC00001D38B01C01A524143098B4201D34B018C
-:109ED000C01A524103098B4201D30B01C01A5241EF
-:109EE000C3088B4201D3CB00C01A524183088B4276
-:109EF00001D38B00C01A524143088B4201D34B005F
-:109F0000C01A5241411A00D20146524110467047D0
-:109F10005DE0CA0F00D04942031000D340425340D5
-:109F200000229C4603098B422DD3030A8B4212D395
-:109F3000FC22890112BA030A8B420CD389019211C7
-:109F40008B4208D3890192118B4204D389013AD004
-:109F5000921100E08909C3098B4201D3CB01C01AD9
-:109F6000524183098B4201D38B01C01A52414309EC
-:109F70008B4201D34B01C01A524103098B4201D3DA
-:109F80000B01C01A5241C3088B4201D3CB00C01A47
-:109F9000524183088B4201D38B00C01A5241D9D25F
-:109FA00043088B4201D34B00C01A5241411A00D2E0
-:109FB0000146634652415B10104601D34042002BDC
-:109FC00000D54942704763465B1000D3404201B55B
-:109FD000002000F005F802BD0029F8D016E7704710
-:109FE0007047C0468446101C62468C46191C634666
-:109FF00000E0C0461FB501F04DFF002801D400214C
-:10A00000C8421FBD10B501F0A5FE4042013010BD91
-:10A0100010B501F03FFF002801DB002010BD01203A
-:10A0200010BDC04610B501F035FF002801DD00204D
-:10A0300010BD012010BDC04610B501F0C7FE0028BC
-:10A0400001DC002010BD012010BDC04610B501F09C
-:10A05000BDFE002801DA002010BD012010BDC04661
-:10A060008446081C6146FFE71FB500F04FFC00283E
-:10A0700001D40021C8421FBD10B500F0D1FB404201
-:10A08000013010BD10B500F041FC002801DB0020BC
-:10A0900010BD012010BDC04610B500F037FC0028EF
-:10A0A00001DD002010BD012010BDC04610B500F03C
-:10A0B000DFFB002801DC002010BD012010BDC046E0
-:10A0C00010B500F0D5FB002801DA002010BD0120FA
-:10A0D00010BDC046002B11D1002A0FD1002900D19C
-:10A0E000002802D00021C943081C07B4024802A17D
-:10A0F0004018029003BDC046E9FEFFFF03B4684666
-:10A1000001B5029800F01EF8019B9E4602B00CBCFF
-:10A110007047C0469E2110B5C905041CFFF7D0FF4B
-:10A12000002803D1201C00F04DFF10BD9E21201CF3
-:10A13000C90500F06DFD00F045FF80231B069C461D
-:10A140006044F2E7F0B54F464646D646C0B5040037
-:10A1500082B00D00914698468B422FD82CD04146B4
-:10A16000484602F01DFE29000600200002F018FEFD
-:10A17000331A9C46203B9A4600D576E04B46524621
-:10A1800093401F004B46624693401E00AF4228D8C2
-:10A1900025D05346A41BBD41002B00DA7BE00022F2
-:10A1A000002300920193012352469340019301231F
-:10A1B00062469340009318E08242D0D900220023E7
-:10A1C000009201930A9B002B01D01C605D600098F7
-:10A1D000019902B01CBC90469946A246F0BDA3422C
-:10A1E000D7D900220023009201936346002BE9D0C7
-:10A1F000FB079846414672080A437B0866460EE014
-:10A20000AB4201D1A2420CD8A41A9D4101202419CD
-:10A210006D410021013E24184D41002E06D0AB4275
-:10A22000EED9013E24196D41002EF8D10098019914
-:10A23000534600196941002B23DB2B005246D340C3
-:10A240002A006446E2401C0053461500002B2DDB1B
-:10A2500026005746BE40330026006746BE40320007
-:10A26000801A994100900191ACE7624620239B1A25
-:10A270004A46DA406146130042468A4017001F43AF
-:10A2800080E7624620239B1A2A0066469A402300F4
-:10A29000F3401343D4E76246202300219B1A002297
-:10A2A000009101920122DA40019280E72023624668
-:10A2B00026009B1ADE402F00B0466646B740464651
-:10A2C0003B003343C8E7C046F8B54746CE46430295
-:10A2D0005B0A4400C20F9C464800DD004B02240E7E
-:10A2E0005B0A000E80B5984626009146C90FDB0038
-:10A2F000271A8A4229D0002F15DD00284AD1002BC9
-:10A3000000D095E0ED08FF2C00D188E06B025B0ADD
-:10A31000E6B25B02F605580A3043D20710430CBC84
-:10A3200090469946F8BD002F00D087E0601CC0B26F
-:10A33000012800DCB6E0EE1A720100D5C5E0002E5F
-:10A340003DD1002200260023E3E7002F00DC96E049
-:10A3500000285DD0FF2C60D08022D20413431B2F35
-:10A3600000DDECE02022D21B18009340F8405A1E7A
-:10A3700093410343ED186B017BD50134FF2C00D1D1
-:10A38000B7E0012207262A406B089A4D1D4015436D
-:10A390002E4029E0FF2CB5D08022D20413431B2F7E
-:10A3A00000DDB2E02022D21B19009340F9405A1E72
-:10A3B00093410B43ED1A6B015BD5AD01AE09300043
-:10A3C00002F0D0FC05388640844265DC041B330073
-:10A3D00020200134E340041BA640751EAE413343E8
-:10A3E00007261D0000241E4001224B461A40002E65
-:10A3F00004D00F232B40042B00D004356B0100D474
-:10A4000080E70134E6B2FF2C2FD1FF26002380E73E
-:10A41000002B52D1FF2C00D074E70A00ED08002D6C
-:10A42000F3D08023DB032B435B025B0AFF2670E73C
-:10A43000013F002FBED0FF2CB1D163E7002C47D0E5
-:10A44000FF2869D08024E4047A4225431B2A00DDDA
-:10A45000C5E02C002026D440B21A95406A1E9541D2
-:10A4600025435D1B04008946A5E7AB015B0A50E765
-:10A47000002401224B461A406B07BAD142E7002F55
-:10A480003BD10134E0B201284ADDFF2CBDD00726C4
-:10A49000ED186D082E40A7E70723574D241A3540C5
-:10A4A0001E40A1E7002C1BD1002D6ED1002B00D146
-:10A4B0009AE00A001D003C0024E7013F002F00D174
-:10A4C00058E7FF2C00D04AE7A7E75E1B894676E7EE
-:10A4D000002D1CD10A00FF281FD004001D0011E729
-:10A4E000002D5DD1002B17D180230022DB03FF2636
-:10A4F0000FE70A00FF2600230BE7002C21D1002DD7
-:10A5000066D1FF28E9D11D0087E7012352E77A1CB5
-:10A51000A7D0FA43FF2899D10A001D00FF24F1E6D5
-:10A52000002E21D1002D4FD0002B4CD0ED186B0107
-:10A530009ED5314B07362E4001241D4054E70123A0
-:10A5400018E7FF28DFD08024E4047F4225431B2F37
-:10A550004DDC2026F61B2C00B540FC406A1E9541C0
-:10A560002543ED18040006E7002DCCD0002B00D1C8
-:10A5700053E780216046C903084203D040460842A1
-:10A5800000D11D000121114047E7002B00D1B9E6A1
-:10A59000EA1A500125D507265D1B2E40894623E780
-:10A5A000FF24002B00D1ADE680226046D20310428A
-:10A5B00004D04046104201D11D00894601224B467D
-:10A5C000FF241A409EE62B00DD080A0000249DE6C9
-:10A5D0007A1CC6D0FF43FF28B9D11D001DE7012515
-:10A5E0003FE7151E00D044E70022002391E6012535
-:10A5F000B7E7C046FFFFFF7DFFFFFFFBF8B55746FB
-:10A600004E464546DE464402E0B546008846640AAA
-:10A61000360EC70F002E63D0FF2E24D08023E40017
-:10A62000DB041C43002399469B467F3E434642463B
-:10A630005D02D20F5B006D0A1B0E9046924665D0FC
-:10A64000FF2B55D080220021ED00D2047F3B154323
-:10A65000F61A43464A467B400F2A00D98DE06D48E2
-:10A66000920082589746002C54D108239946063B05
-:10A67000FF269B46DAE70025534602291BD0032913
-:10A6800000D1BFE0012928D030007F30002820DD34
-:10A690006A0704D00F222A40042A00D004352A0178
-:10A6A00003D530005C4A80301540FE2803DCAC0145
-:10A6B000640AC2B201E0FF2200246402D205600AEB
-:10A6C000DB07104318433CBC90469946A246AB4674
-:10A6D000F8BD0122101A1B287CDD00220024ECE7C3
-:10A6E000002C1DD104239946033B00269B469DE781
-:10A6F000FF3E002D20D1022143464A467B400A43BB
-:10A700000F2AD8D84548920082589746002D19D173
-:10A710000121F1E70C239946093BFF269B4685E77B
-:10A72000200002F01FFB7626431F9C400023764248
-:10A73000361A99469B4679E74A4603231A439146BF
-:10A74000032186E7280002F00DFB431F36189D40C9
-:10A75000763600217DE780240023E403FF22ACE766
-:10A7600000258023DB031C4228D01D4226D12B4329
-:10A770005C02640A4346FF229FE762016C01A24229
-:10A7800024D21B210025013E012710006D0052003C
-:10A79000002801DB944201D8121B3D4301390029F6
-:10A7A000F3D11400621E944125436DE7BA46594621
-:10A7B00025005346022900D061E77CE78023DB03B4
-:10A7C0001C436402640A3B00FF2276E7121B1A2135
-:10A7D0000125D9E79E362A00B5402C00C240651EEF
-:10A7E000AC411443620704D00F222240042A00D057
-:10A7F0000434620103D4A401640A00225DE701224B
-:10A8000000245AE78024E4032C436402640AFF22F4
-:10A8100053E7C0465CF00200FFFFFFF79CF0020028
-:10A8200070B542004E024C0045026D0A120EC30F75
-:10A83000760A240EC90FFF2A0FD0FF2C11D0012059
-:10A84000A24200D070BDB542FCD18B420DD0002A8F
-:10A85000F8D12800451EA841F4E70120002DF1D1D0
-:10A86000EBE70120002EEDD1E9E70020EAE7C04642
-:10A8700070B54A004E02450244006D0A240EC30F13
-:10A88000760A120EC90FFF2C15D0FF2A0ED0002C0D
-:10A8900015D1002A01D1002E1CD0002D14D08B42DE
-:10A8A00027D00220013B1840013870BD002EEED0A9
-:10A8B00002204042F9E7002DFAD1FF2A0ED0002AEB
-:10A8C0000ED1002EEDD00BE0012301399943080091
-:10A8D0000130EAE70020002DE7D0E2E7002EE7D1C3
-:10A8E0008B42DED1944205DD0221581E084001381A
-:10A8F000DBE70024A24204DCB542D2D80020B542F6
-:10A90000D3D2581E012398430130CEE730B5420020
-:10A9100044024D02C30F4800640A120E6D0A000E75
-:10A92000C90FFF2A12D0FF280CD0002A12D100280C
-:10A9300019D1002D17D1002C2BD00220013B18403B
-:10A94000013826E0002DF0D0022022E0002CFBD1BF
-:10A95000FF281FD000281FD1002D1DD10220013B50
-:10A960001840013815E0002C0ED08B42E5D10022B2
-:10A97000904204DCAC42E0D80020AC4209D2581E20
-:10A9800001239843013004E0012301399943080071
-:10A99000013030BD002DD7D18B42CED18242E7DDD0
-:10A9A0000221581E08400138F3E7C046F0B54E4674
-:10A9B00057464546DE46E0B543025B0A450083B094
-:10A9C0000F1C99462D0EC60F002D57D0FF2D24D0F9
-:10A9D0008020DB00C0041843002381469A469B4632
-:10A9E0007F3D7C027A00FB0F640A120E984623D04A
-:10A9F000FF2A4BD0E30080240020E4047F3A1C436C
-:10AA0000AD186B1C47460193534677403A000F2B15
-:10AA100048D87D499B00CB589F46002B00D085E04D
-:10AA200008339A46063B9B467C027A00FB0FFF25C3
-:10AA3000640A120E9846DBD1002C00D090E05246FA
-:10AA400001231A4392460120DBE74C465846170083
-:10AA5000022824D0032800D1CFE0002200230128BF
-:10AA60004DD15802D205400AFF071043384303B0C6
-:10AA70003CBC90469946A246AB46F0BD002B5BD14C
-:10AA800004239A46033B00259B46AAE7FF35002C8A
-:10AA900060D1524602231A4392460220B1E7FF22B8
-:10AAA0000023DEE74B461B0C9C464B462604360C27
-:10AAB000180461463300220C6446000C43434E43A5
-:10AAC0005043544380191A0C1218964203D980211E
-:10AAD00049028C4664441B041B0C1004C0188301FB
-:10AAE0005E1EB341800E1843130C1B199B010343D8
-:10AAF0001C00230179D5012362081C401443019AEC
-:10AB00007F32002A4DDD630704D00F232340042B3E
-:10AB100000D00434230103D53C4B019A1C40803201
-:10AB2000FE2ABCDCA3015B0AD2B29AE70C239A4648
-:10AB3000093BFF259B4654E7180002F013F94A46EB
-:10AB4000431F76259A4000236D4291462D1A9A465E
-:10AB50009B4646E7524603231A439246032050E79A
-:10AB6000200002F0FFF8431F2D1A9C40763D002084
-:10AB700047E780230027DB03FF2272E7424666E7B0
-:10AB80004C463200584662E780234A46DB031A42AD
-:10AB900022D01C4220D123435B025B0A4746FF229E
-:10ABA0005FE701239A1A1B2A21DC23000199D34075
-:10ABB0009E318C401A0023005C1EA34113435A07A8
-:10ABC00004D00F221A40042A00D004335A0111D4B1
-:10ABD0009B015B0A002244E780234A46DB031343C0
-:10ABE0005B025B0A3700FF223BE7019587E7002203
-:10ABF000002336E70122002333E78023DB032343CE
-:10AC00005B025B0AFF222CE7DCF00200FFFFFFF78C
-:10AC1000F8B54746CE464400C20F80B54702480209
-:10AC2000400A8446664648007F0A240EF600250046
-:10AC30009046FB00000EC90FB146FF2800D185E009
-:10AC400001267140261A914257D0002E43DD00287C
-:10AC500000D07FE04946002900D1AAE0013E002E45
-:10AC600000D0F7E05B1A5A0100D48BE09B019C09ED
-:10AC7000200002F077F805388440854200DDD3E0FB
-:10AC8000451B230020200135EB40451BAC40621ED4
-:10AC900094412343072400251C40012241460A40D9
-:10ACA000002C04D00F211940042900D0043359018D
-:10ACB00000D480E00135ECB2FF2D00D0A3E0FF24EA
-:10ACC00000235B02E405580AD207204310430CBC62
-:10ACD00090469946F8BD002E74D1601CC0B2012880
-:10ACE00000DCA7E04A469C1A620100D5B6E0002CC1
-:10ACF000BED1002200240023E3E7002E00DC85E023
-:10AD0000002846D0FF2C49D080224846D204104368
-:10AD1000814601221B2E09DC20204C46801B8440EA
-:10AD20004A462000F240441EA04102439B185A01AB
-:10AD300028D50135FF2D00D1A8E001220724944930
-:10AD40001A405B080B4013431C40A6E7002E00D0BE
-:10AD500078E775E7FF2C54D080224946D20411438E
-:10AD6000894601221B2E09DC20214846891B884088
-:10AD70004A460100F240481E81410A439B1A5A018B
-:10AD800000D573E7012241460A40590700D089E700
-:10AD900011E04846002858D1FF2C0CD1DB08002BCD
-:10ADA00000D18CE78020C00303435B025B0AFF24D1
-:10ADB00087E7FF2C25D0DB08FF2DF0D05B025B0A74
-:10ADC000ECB27EE7002C4DD0FF2818D08024E4049C
-:10ADD000724223431B2A00DDC4E01C002025D4401E
-:10ADE000AA1A93405A1E934123434A460500D31A98
-:10ADF000884638E7721CF8D0F243FF28EAD10A00EF
-:10AE00004B46FF25D7E79B015B0A5AE7002E41D14D
-:10AE1000651CE9B2012945DDFF2D00D14FE707246C
-:10AE20004B445B081C4038E707225A4B2D1A23403D
-:10AE3000144032E7002C1DD1002B7AD14B46002B59
-:10AE400000D191E00A000025B5E7013E002E19D19E
-:10AE50004B446CE7FF2C84D1FF25ACE74A4688467B
-:10AE6000D41A05E7002BC5D10A00FF28C8D0050079
-:10AE70004B46A0E7002B49D14B46002B77D00A0068
-:10AE8000FF2598E7FF2C00D043E787E70A00FF245F
-:10AE9000002316E7002C15D1002B57D1FF28E6D14F
-:10AEA0004B467BE7002C20D1002B57D04946002988
-:10AEB00053D04B445A0168D50724364A1C4001251B
-:10AEC0001340EAE6FF28EBD08022D20476421343F7
-:10AED0001B2E53DC2025AD1B1A00AB40F2405C1E3C
-:10AEE000A34113434B44050021E7002BD8D049462A
-:10AEF000002900D152E78021C9030F4200D14DE75C
-:10AF00006046084200D049E74B4647E74846FF25E0
-:10AF1000002800D14FE78022D203174204D06046B8
-:10AF2000104201D14B46884601224146FF250A4086
-:10AF300041E7484600281FD01A1A500120D54A463A
-:10AF40000724D31A1C4088460025A6E6741CC9D0E5
-:10AF5000F643FF28BCD14B4620E799464B460025D7
-:10AF6000DB082BE7012340E700220023A9E680232A
-:10AF70000022DB03FF24A4E600251CE70123B1E740
-:10AF8000002AF1D013000025FCE60025FAE6C046B1
-:10AF9000FFFFFF7DFFFFFFFB42024B024000490025
-:10AFA000520A5B0A090E000EFF2806D00020FF2976
-:10AFB00002D11800431E98417047FE38002AFBD189
-:10AFC000F4E7C04641024200C30F490A120E0020B6
-:10AFD0007E2A0DD99D2A0CD8802000040143952A91
-:10AFE0000ADC9620821AD1404842002B00D108008A
-:10AFF0007047034A9818FBE7963A9140F4E7C04639
-:10B00000FFFFFF7F70B500283DD0C317C5185D4016
-:10B01000C40F280001F0A6FE9E22121A962A07DC11
-:10B02000D2B2082833DD083885406802400A23E0A0
-:10B03000992A0BDD052329001B1AD94003001B3375
-:10B040009D402B005D1EAB4119430D00052801DD1D
-:10B05000431F9D402B000F490B406E0709D00F2660
-:10B060003540042D05D004335D0102D59F220B40ED
-:10B07000121A9B01580AD2B24002D205400AE407D4
-:10B080001043204370BD002400220020F4E7680232
-:10B09000400AF1E7FFFFFFFB70B5041E34D001F05A
-:10B0A00061FE9E22121A962A07DCD2B208282EDDF3
-:10B0B000083884406002400A21E0992A09DD030033
-:10B0C00021001B3399404B1E994105231B1ADC407C
-:10B0D0000C43052801DD431F9C4023000D490B4014
-:10B0E000650709D00F252C40042C05D004335C01E2
-:10B0F00002D59F220B40121A9B01580AD2B240027D
-:10B10000D205400A104370BD00220020F7E760021C
-:10B11000400AF4E7FFFFFFFBF0B54F464646D64630
-:10B120000C000903C0B5490A470F5E0039431F03ED
-:10B13000DB0F9C4665007B0A570F1F436D0DE40F24
-:10B14000760DA146C000B846D200AB1B64457BD04B
-:10B15000002B5FDD002E00D0A4E03E00164300D19E
-:10B1600012E15E1E002E00D09EE1871A4346B842CF
-:10B1700080410125C91A4042091A0B0200D431E16D
-:10B1800049024E0A002E00D16EE1300001F0EAFDC6
-:10B190000300083B1F2B00DD61E120223900D21A99
-:10B1A0009E40D1409F400E439D4200DD51E15D1B1A
-:10B1B0006B1C1F2B00DD7CE12021C91A3D003000F3
-:10B1C0008F408840DD40791E8F413100072228439F
-:10B1D000D940002507433A40002A09D00F233B40BD
-:10B1E000042B05D03B1DBB42BF417F42C9191F0044
-:10B1F0000B0200D426E26A1CC64B55056D0D9A421F
-:10B2000000D106E1C44AFF080A40530752023B43FB
-:10B21000120B8EE0002B00D0B8E06B1C5B055B0DC1
-:10B22000012B00DC30E1871A4346B842B641CB1A05
-:10B2300076429E1B330200D54CE13B003343A1D143
-:10B2400000220024002570E0002B00DCE5E0002E49
-:10B2500000D183E0AF4EB54260D08026360437433C
-:10B26000B846382B00DC3EE1434613431F007A1EEC
-:10B2700097413F1887428041404209180B0200D491
-:10B28000B0E0A44B01359D4200D1C3E0A24A7B0847
-:10B290000A4001210F401F435108D30707221F43D3
-:10B2A0003A4099E79B4EB54238D080263604374362
-:10B2B000B846382B00DDDCE01F2B00DC30E11E003F
-:10B2C0004746203EF740BC46202B04D04026F31AC8
-:10B2D00046469E403243170063467A1E97411F43FD
-:10B2E000CCE0002B00D104E24346134300D159E1E6
-:10B2F0004B07C00818438023C9081B03194208D014
-:10B300004546ED081D4204D14346D008590708437D
-:10B310002900420FC9007F4D1143C0004B07CA08E6
-:10B320007C49C00803438D4268D012036D05120B9F
-:10B330006D0D002112031800130B0A0D12051A439C
-:10B34000764B2D0513402B435B00E4075B0823433A
-:10B3500019001CBC90469946A246F0BD3E0016431B
-:10B3600012D05E1E002E00D000E187188742804177
-:10B3700041444042091801250B0233D5022585E7D7
-:10B3800064463300414610001D00C7E7002D00D081
-:10B39000DAE00C000443F3D05C1C00D19FE15D4C6B
-:10B3A000A64200D12FE1DB43382B00DD66E11F2BE5
-:10B3B00000DD83E120240500E41A0F00DD40D940C0
-:10B3C000A0404346A7405B1A441EA04198462F4325
-:10B3D0003843171ABA42924143465242991A644678
-:10B3E0003500CAE607223A40002A00D0F6E64B07AD
-:10B3F000CA084849FF083B438D4296D119001143C2
-:10B4000000D19EE1802109030A431203120B414D32
-:10B410008FE71500002200238BE7002B00D0C7E048
-:10B420006B1C5F057F0D012F00DCF1E0394DAB4255
-:10B4300000D1B9E085180A00854289414244494259
-:10B4400051180722CF076D082F4349083A401D00C5
-:10B45000C2E607223049ED1A31403A40BCE63E00D0
-:10B460002838864000279FE6380001F07BFC20301A
-:10B470008EE6434613431F007A1E9741C71BB8420E
-:10B4800080414042091A78E60E003B000643134310
-:10B49000002D61D1002E00D0F4E0002B00D11BE183
-:10B4A00064463900100039E71A4FBB427AD03300A6
-:10B4B000FFE630001F3DE840202B03D04021CB1A8F
-:10B4C0009E4037437B1E9F41072207433A4000219D
-:10B4D000002589E7171A4346BA42B641591A7642FF
-:10B4E0008E1B64464EE61F2B00DDADE0202647464E
-:10B4F000F61AB740B9461700B246DF404E463E4303
-:10B5000037005646B240561EB24117434246DA4013
-:10B510008918AEE6FF070000FFFF7FFFFFFF0F80E7
-:10B5200020264746F61AB740B9461700B246DF4014
-:10B530004E463E4337005646B240561EB241174370
-:10B540004246DA40891A99E77F4CA6425BD08024B4
-:10B5500024045B42214327E7002E0CD1002B00D1AD
-:10B56000CBE0644639001000774DD7E6764FBB42FA
-:10B5700018D0330075E6002B14D04B07C0081843D1
-:10B580008023C9081B03194207D0FC081C4204D1C0
-:10B590007907D0080843E14621004C46420FC90014
-:10B5A0001143C000684DB9E61D0000220023C0E62B
-:10B5B000002D5BD10D00054300D1E2E65D1C00D1FA
-:10B5C000B0E0614DAE421FD0DB43382B71DC1F2B46
-:10B5D00000DD96E020250F00ED1AAF40B9460700C8
-:10B5E000AA46DF404D463D432F005546A840D9406E
-:10B5F000451EA84188440743BF18974292415142D3
-:10B60000414435003AE6644635004146100085E67F
-:10B610000B000343002D00D063E6002BF5D043461A
-:10B62000134300D17AE687188742804107224144BC
-:10B63000404209183A400B0200D4D5E6434B01358D
-:10B640001940C9E5380069E61E004746203EF7402C
-:10B65000BC46202B04D04026F31A46469E40324377
-:10B66000170063467A1E97411F4302E6364DAE42ED
-:10B67000CAD080252D045B422943A6E70843411E1A
-:10B680008841A6E6002B00D148E6871A4346B84217
-:10B69000B641CB1A76429E1B33024BD5171A43464E
-:10B6A000BA429241591A5242891A072264463A40D4
-:10B6B00092E501430F00791E8F419DE71C000F00AA
-:10B6C000203CE740202B03D04024E31A9940084354
-:10B6D000411E884138437CE60022002425E6171AE3
-:10B6E0004346BA429241591A5242891A6446350079
-:10B6F00043E541461000144D10E680220024120359
-:10B7000080E61D000F00203DEF40BC46202B03D0FB
-:10B710004025EB1A9940084307006346781E87418D
-:10B720001F4369E7871897429B4141445B42C91810
-:10B730003500A3E53B003343CED0072231003A4029
-:10B7400052E600231A00F4E5FF070000FFFF7FFF29
-:10B75000F0B55746DE464E464546E0B583460700FF
-:10B760000E03480085B092461C00360B400DCD0FED
-:10B77000002800D19DE0954B984239D08023F600F7
-:10B780001B041E43924A7B0F3343994694460300A1
-:10B790006344009300230026FF00029323031B0B46
-:10B7A00098466300E40F52465B0D019400D1B3E06C
-:10B7B00086498B4200D19EE04246D100802212048D
-:10B7C0000A435146490F11438B46814952468C46E4
-:10B7D00000996344CB1A0021D20000932B006340F0
-:10B7E0009A460F2E00D905E17A4BB6009B599F4629
-:10B7F0005B463343994600D0B8E002230826002771
-:10B8000000900293CAE7CB463A0002990195019B4A
-:10B810009A46022927D0032900D180E2012944D089
-:10B820006D49009B8C4663441C00002C38DD530797
-:10B8300000D013E2D2085B46DB0109D55946674BBD
-:10B8400019408B468021C9008C46009B63441C0034
-:10B85000634B9C4207DC5B4664055F075B02174352
-:10B860001B0B620D02E000230027584A00211B0336
-:10B870001C0B0B0D1B05234314055A4A38001340BB
-:10B880001C4353466400DB0764081C43210005B0D9
-:10B890003CBC90469946A246AB46F0BD01225242BE
-:10B8A00001231B1B382B00DCADE100220023002705
-:10B8B000DCE75B46334399465ED0002E00D18AE137
-:10B8C000300001F04FFA03000B3B1C2B00DD7BE145
-:10B8D0001D22D31A5A460100DA4008398E4013005F
-:10B8E0005F46334399468F403F4B00261B1A009317
-:10B8F0000023029352E7414653460B433B499B4684
-:10B900008C46009B634400935B46002B3BD1022393
-:10B9100000221E43022161E7434613439B4637D072
-:10B920004346002B00D162E1404601F01BFA0300C0
-:10B930000B3B1C2B00DD53E102004146083A9140CD
-:10B9400088461D21CB1A5146D9400B0041460B4376
-:10B950009B46534693401A00009B25499C466044F1
-:10B9600003008C4663440093002137E70323B1466C
-:10B9700000900C26029311E7002300930133042664
-:10B98000002702930AE70323C3461E43032125E74A
-:10B9900001331E430022012120E700239A46802321
-:10B9A00000271B03094A61E7802349461B0319420C
-:10B9B00000D1E2E05946194200D0DEE00B431B0300
-:10B9C00017001B0BA246014A50E7C046FF070000C4
-:10B9D00001FCFFFF1CF10200FF030000FFFFFFFE60
-:10B9E000FE070000FFFF0F800DFCFFFF01F8FFFFC7
-:10B9F000F3030000D94500D9CBE000D1C6E03C00FC
-:10BA000048460027009B013B00935B46160E1B0235
-:10BA10001E431302984633041B0C9946310C0191C6
-:10BA2000FEF7F0F94A4642430B04210C0500194386
-:10BA30008A4207D98919013D8E4203D88A4201D929
-:10BA4000851E8919881A0199FEF7DCF909048C46CC
-:10BA50004A46210464464243090C030021438A42BA
-:10BA600004D98919013B8E4200D8F1E02D041D4311
-:10BA7000AB464346891A4246280C12041D0C5B460D
-:10BA8000140C22001B041B0C5A4303946B434443C5
-:10BA9000029568431B19150CEB189C4203D98024AE
-:10BAA0006402A44660441C0C15041B042D0C2018D1
-:10BAB0005D19814277D373D00C1AA24A7D1BAF4225
-:10BAC000BF419446009B7F426344E01B1C008642BA
-:10BAD00000D1DBE00199FEF795F94A4642430B0499
-:10BAE000290C070019438A4207D98919013F8E4260
-:10BAF00003D88A4201D9871E8919881A0199FEF74D
-:10BB000081F909044A46894629044D464243090CF5
-:10BB1000030029438A4207D98919013B8E4203D881
-:10BB20008A4201D9831E89193F04891A3A00039F6A
-:10BB30001A43380013041B0C584381460298150C15
-:10BB40006F43434345434846000C8446DB19634436
-:10BB50009F4203D9802040028446654448461F0C1A
-:10BB600000041B04000C7D191818A94200D284E0BF
-:10BB700000D17FE001231A4357E680234A461B0386
-:10BB800013431B031B0BAA466F4A6FE6BA4200D948
-:10BB900035E74B46DC0758087B081C43FF0734E7B2
-:10BBA0000024AF4289D247444745A4415B466442E2
-:10BBB000A4196418013BA6421ED2A0426DD800D140
-:10BBC000B6E0241A9B4678E703005A46283B9A4081
-:10BBD0000027914688E6584601F0C4F8203072E606
-:10BBE00003005246283B9A4093460022B4E6504652
-:10BBF00001F0B8F820309AE6A642E2D1B845DCD987
-:10BC0000341A9B4659E71F2B65DC504C0099A4461B
-:10BC10005C46614408008C4011008240D940501EAF
-:10BC200082410C4314435A46DA401300620709D09C
-:10BC30000F222240042A05D02200141D944289417B
-:10BC400049425B181A0262D50122002300270DE643
-:10BC50008A4200D80AE7831E891907E70F23134099
-:10BC6000042B00D1E6E5171D9742924153429B44B5
-:10BC7000FA08E0E5002800D1D7E57118531EB1425B
-:10BC800027D3A94215D358D01A0073E7002B00DC44
-:10BC900004E6012300229B44CDE5022347444745A7
-:10BCA00089415B429C46494289190C19E344241A94
-:10BCB00003E743465F0047459B41B8465B429E19F8
-:10BCC000023A8919A94200D054E7404500D051E713
-:10BCD000ABE51A00F6E71F215F4649420C1BE7401F
-:10BCE000202B07D01A49009B8C46634418005B4602
-:10BCF00083401A43501E82413A43072700231740CE
-:10BD000009D00F21002311401400042995D12200ED
-:10BD10005F075B021B0BD20817430022A6E58023B6
-:10BD200059461B030B431B0317001B0B064A9DE5DB
-:10BD3000BD42B2D89B460024BFE68045B9D31A0065
-:10BD4000C3E7C046FF030000FF0700001E04000019
-:10BD50003E040000F0B54F464646D6468446C0B580
-:10BD60008046194E18030F034D00000B5C008246FD
-:10BD70003F0B6D0DC90F9146640DDB0F0120B542DD
-:10BD80000AD0B44203D0A54201D157450CD01CBC07
-:10BD900090469946A246F0BD66463E43F7D1AC4276
-:10BDA000F5D154461443F2D10120C845EFD1994250
-:10BDB00007D0002DEBD163461F433800471EB84122
-:10BDC000E5E70020E3E7C046FF070000F0B54F4677
-:10BDD0004646D6464D00C0B50E03C90F8A462C49CB
-:10BDE0001F035C008046360B6D0D91463F0B640DC2
-:10BDF000DB0F8D421ED08C4216D0002D1ED1304359
-:10BE00008446002C01D13A4323D06246002A1AD03E
-:10BE10009A4529D0514602200139084001381CBCFE
-:10BE200090469946A246F0BD39001143E5D0022064
-:10BE30004042F4E73043FAD1AC420FD0002C0FD18E
-:10BE40003A43E7D00CE00122013B93431800013054
-:10BE5000E5E763460020002BE1D0DBE73A43E6D17B
-:10BE60009A45D7D1A542D5DCA54205DBBE42D1D843
-:10BE700008D00020BE42D2D2504601230138984358
-:10BE80000130CCE7C845C5D80020C845F4D3C6E783
-:10BE9000FF070000F0B54F464646D6464D00C0B5F8
-:10BEA0000E03C90F8A462E491F035C008046360BDD
-:10BEB0006D0D91463F0B640DDB0F8D4218D08C4207
-:10BEC00011D0002D18D130438446002C1ED13A43A6
-:10BED0001CD163460020002B30D05146022001398E
-:10BEE000084001382AE039001143EAD0022025E059
-:10BEF0003043FBD1AC4226D0002C26D13A4324D18A
-:10BF00005146022001390840013817E06246002AF4
-:10BF10000FD09A45E1D1A54205DBBE42DDD819D04C
-:10BF20000020BE420AD25046012301389843013016
-:10BF300004E00122013B9343180001301CBC9046F1
-:10BF40009946A246F0BD3A43D0D19A45C5D1A54203
-:10BF5000C3DCE0E7C845C0D80020C845E3D3EDE71F
-:10BF6000FF070000F0B55746DE464E464546E0B5B1
-:10BF7000834606000F03480087B092461D003F0B22
-:10BF8000400DCC0F002800D16FE0DE4B984238D036
-:10BF90008023FF001B041F43730F3B430193DA4BC5
-:10BFA0000027994600239B46F60081442B03690035
-:10BFB0001B0B52469846490DED0F002900D185E034
-:10BFC000D04B994200D173E04346DA0080231B0432
-:10BFD00013435246CC48520F844613435246002026
-:10BFE0006144D20089442100694000918C460121BE
-:10BFF00049448A460F2F00D990E0C449BF00CF5969
-:10C00000BF465B463B43019300D06AE10223082709
-:10C01000002681469B46C9E732005846019B61468F
-:10C020000091022800D175E0032800D1FEE101282B
-:10C0300000D02CE100230027002600253F032A0D15
-:10C040003F0BB34812053A4302401B051343009AC5
-:10C050005B00D1075B080B433000190007B03CBC04
-:10C0600090469946A246AB46F0BD5B463B430193E2
-:10C0700000D12FE1002F00D1A5E1380000F072FEC1
-:10C0800003000B3B1C2B00DD96E11D22D31A5A4600
-:10C090000100DA405E4608398F4013008E403B4372
-:10C0A00001939C4B00271B1A994600239B467DE772
-:10C0B000414653460B4393498C46E144002B00D044
-:10C0C0001AE102220220174300228CE7134300D119
-:10C0D0000DE14346002B00D181E1404600F042FED5
-:10C0E00002000B3A1C2A00DD72E1010043460839C8
-:10C0F0008B4098461D239A1A5346D3401A00434654
-:10C10000134352468A404946081A82498946814467
-:10C11000002068E77B4B002700268EE7140C1204F2
-:10C12000120C1100370C3604350C794328008C466C
-:10C130002E0060436044834656432100300C804605
-:10C140005846794340440291844506D98846802167
-:10C1500049028C46E044414602913604010C360CFB
-:10C1600000048B4681191E0C1B041B0C0391190043
-:10C1700079438C46280075436544A8465843050C0E
-:10C1800045447743A94203D9802149028C4667443C
-:10C19000290C8C4639000004000C2D042D18614434
-:10C1A000AB4405915946049101990F043F0C080CCA
-:10C1B000390051434243904602008C46090C8B469D
-:10C1C00062437C4344445C44A04503D98021490236
-:10C1D00088464244210C884661460904090C8C4675
-:10C1E00039005943434370437E430F0CF61824042F
-:10C1F000BE19644442448C46B34203D980235B0297
-:10C2000098464044029B61469846049B3704434449
-:10C210009B46AB45AD416B420D0405992D0C8C46F8
-:10C220007F196744FD18A8465D462D19A542A44113
-:10C2300093466442A446C344DC448F42BF419845C0
-:10C240009B4193459241A445A4415B427F421F43D9
-:10C25000360C52426442BF192243BF186246381856
-:10C260004302D20D039913436A020A43501E8241CE
-:10C270006146ED0D2A434E023243D90100D4B3E0AA
-:10C280000126500832400243DE0732435B08224C4D
-:10C290005444002C62DD510709D00F2010400428BF
-:10C2A00005D0101D9042924152429B180200D901C4
-:10C2B00004D580241948E4000340544418488442BB
-:10C2C00000DD27E75E075B02D2081F0B63051643FC
-:10C2D0005B0DB2E6002399460133042700269B46F6
-:10C2E00064E60323019781460C279B465EE6012204
-:10C2F00001201743002276E6032303201F43434611
-:10C3000071E6C046FF07000001FCFFFF5CF1020080
-:10C31000FFFF0F800DFCFFFFFF030000FFFFFFFE8C
-:10C32000FE0700000023802700933F030026434BB5
-:10C3300083E6019B3200A446584670E6AC466EE6A2
-:10C34000802701993F0339422DD03B422BD11F4317
-:10C350003F033F0B00951600384B6EE601252D1B61
-:10C36000382D00DD66E61F2D40DC35481C005044AA
-:10C37000160082408440EE40501E824134431443F4
-:10C38000EB40620709D00F222240042A05D0220088
-:10C39000141D9442804140421B181A023ED50123CD
-:10C3A0000027002649E68027019B3F031F433F03E8
-:10C3B0003F0B0094214B40E603005A46283B9A402D
-:10C3C000002601926DE6584600F0CCFC203057E67E
-:10C3D00003005246283B9A401300002293E6504641
-:10C3E00000F0C0FC20307BE6CA4650E71F201E004C
-:10C3F0004042041BE640202D03D0124C5444A3407D
-:10C400001A43501E8241324307260027164009D0A6
-:10C410000F200023104014000428B9D122005E0729
-:10C420005B021F0BD2081643002306E680273F035A
-:10C430001F433F033F0B1600004BFEE5FF070000C4
-:10C440001E0400003E040000F8B557464E4645461F
-:10C45000DE460C000903E0B5490A460F5F00314390
-:10C460001E03DB0F760A9B46530F3343C84E65000D
-:10C47000C000E40FD2006D0DA24681467F0D9C46A0
-:10C480009046B74200D1B9E05B46012673409B4617
-:10C49000EE1BA34500D183E0002E63DD002F00D00A
-:10C4A000B1E06346134300D123E1731E002B00D09B
-:10C4B000BAE1861A6346B04280410125C91A40425A
-:10C4C000091A0B0200D447E149024B0A9846434639
-:10C4D000002B00D189E1404600F044FC0300083BFA
-:10C4E0001F2B00DD7CE120223000D21A4146D040D3
-:10C4F000994002009E400A439D4200DD6AE15D1BB7
-:10C500006B1C1F2B00DD94E1202110003500C91A9F
-:10C510008E40DA408840DD40711E8E4111000722B6
-:10C520002843002506433240002A09D00F23334018
-:10C53000042B05D0331DB342B641764289191E0043
-:10C540000B0200D43DE26A1C914B55056D0D9A42D9
-:10C5500000D119E18F4AF6080A40570752023743C3
-:10C56000120B9BE0002E00D0C5E06E1C7605760D08
-:10C57000012E00DC48E16746861ACB1BB042BF4162
-:10C580007F42B8461F004346FF1A3B00B8461B02D5
-:10C5900000D55FE137439AD100220024002579E0DD
-:10C5A000002E00DCFAE0002F00D18DE0784B9D4298
-:10C5B00067D0802367461B041F43BC46382E00DC2F
-:10C5C00052E1634613435A1E93411E18864280412E
-:10C5D000404209180B0200D4BEE06D4B01359D426C
-:10C5E00000D1D2E06B4A73080A4001210E401E437D
-:10C5F0005108D30707221E43324095E71E00164319
-:10C6000000D045E740E7624B9D423AD08023674621
-:10C610001B041F43BC46382E00DDEBE01F2E00DC60
-:10C620003AE133006746203BDF403B00202E05D037
-:10C630004027BF1B6646BE40324390464646721EA8
-:10C6400096413343DAE0002B00D114E263461343F2
-:10C6500000D168E180234E07C008C9081B030643C8
-:10C66000194208D06046C008184204D16346010050
-:10C67000D2085E071643F3009946C900720F444D75
-:10C6800011434B46DE08424B4F073743CA089D42D1
-:10C6900000D16EE012036D05120B6D0D0021120327
-:10C6A000130B0A0D12051A433B4B2D0513402B4368
-:10C6B0005B00E4075B082343380019003CBC90464C
-:10C6C0009946A246AB46F8BD6346134311D0731E8C
-:10C6D000002B00D007E18618864280416144404229
-:10C6E000091801250B0237D502257BE73E0061467C
-:10C6F00091463500C5E75C46002D00D0E1E00B0017
-:10C700000343F3D0731C00D1ACE1214B9F4200D115
-:10C710003AE1F343382B00DD6FE11F2B00DD8CE1A4
-:10C7200020250E00ED1AAE40B0460600AA46DE40B7
-:10C73000454635432E005546D940A8406346451E20
-:10C74000A8415B1A9C463043161AB2429241634696
-:10C750005242991A3D00B4E607223240002A00D026
-:10C76000E4E60B4BF6084F073743CA089D4200D05A
-:10C7700090E73B00134300D1A6E180231B031A433B
-:10C780001203120B024D89E715000022002785E7EE
-:10C79000FF070000FFFF7FFFFFFF0F80002E00D08C
-:10C7A000C7E06B1C5E05760D012E00DCF0E0C84D85
-:10C7B000AB4200D1B9E085180A0085428941624444
-:10C7C000494251180722CE076D082E4349083240CE
-:10C7D0001D00A9E6BF49ED1A114007223240A3E629
-:10C7E000320028388240002686E6300000F0BAFA8F
-:10C7F000203073E6634613435A1E9341C61AB04273
-:10C8000080414042091A5CE60E0067460643174322
-:10C81000002D5ED1002E00D0F3E0002F00D11EE1EC
-:10C820005C46614691462CE7A94FBE427BD01E0074
-:10C83000F1E610001F3DE840202B03D04021CB1A29
-:10C840009A401643731E9E41072206433240002140
-:10C85000002583E7161A6346B2428041591A4042C6
-:10C860000B1A98465C4632E61F2E00DDABE020270F
-:10C87000BB1B9A4663465746BB40994613004F463A
-:10C88000F3401F433B005746BA40571EBA4113437B
-:10C890006246F240891898E62027BB1B9A466346F9
-:10C8A0005746BB40994613004F46F3401F433B0099
-:10C8B0005746BA40571EBA4113436246F240891A9E
-:10C8C0009CE7834B9F425FD080252D047342294310
-:10C8D00020E7002E0CD1002F00D1D0E05C4661464D
-:10C8E00091467B4DCDE67A4FBE421CD01E0065E6D8
-:10C8F000002F18D0C0084E0706438020C908000347
-:10C90000014208D06346DC08044204D12100DA4623
-:10C91000D2085E071643F300994601245346C90026
-:10C92000720F11431C406A4DABE61D000022002728
-:10C93000B4E6002D59D10B00034300D1D6E6731C99
-:10C9400000D1B2E0624B9F421ED0F343382B6FDC24
-:10C950001F2B00DD97E020250E00ED1AAE40B046FB
-:10C960000600AA46DE40454635432E005546A840FF
-:10C97000D940451EA8418C440643B61896429241C0
-:10C98000514261443D0025E63D006146914678E60E
-:10C990000B000343002D00D055E6002BF5D0634675
-:10C9A000134300D16DE686188642804161444042BF
-:10C9B000091800220B0200D4D0E6464B013519407D
-:10C9C000B2E5B1465DE633006746203BDF403B0001
-:10C9D000202E05D04027BF1B6646BE4032439046FE
-:10C9E0004646721E96413343EFE5394B9F42CBD00A
-:10C9F00080252D0473422943A8E70843411E88413E
-:10CA0000A2E6002F00D13CE66346861ACF1AB04258
-:10CA10009B415B42FB1A98461B024ED5161A634691
-:10CA2000B2429241591A5242891A5C4600227BE571
-:10CA300001430E00711E8E419FE71D000E00203D38
-:10CA4000EE40B046202B04D04025EB1A9940084315
-:10CA5000814648464346411E8841184374E60022F9
-:10CA6000002417E6161A6346B2429241591A5242FE
-:10CA7000891A3D0025E561469146154D01E6802263
-:10CA80000024120379E61D000E00203DEE40B04662
-:10CA9000202B04D04025EB1A9940084381464E468E
-:10CAA0004346711E8E411E4367E7861896429B419E
-:10CAB00061445B42C9183D008CE547463743CED000
-:10CAC00007224146324049E600273A00E6E5C046E3
-:10CAD000FF070000FFFF7FFF30B5144D0A034B0036
-:10CAE000120B5B0DC90F0024AB4211DD104CA342A9
-:10CAF00010DC8024640322430E4CE41A1F2C0CDD4E
-:10CB00000D48C31ADA4013005C42002900D11C0012
-:10CB1000200030BD094BCC18FAE7094DE040AC4687
-:10CB200063449A4013000343EEE7C046FE0300004F
-:10CB30001D0400003304000013040000FFFFFF7F0A
-:10CB4000EDFBFFFF70B500282DD0C317C5185D4061
-:10CB5000C40F280000F006F9154B1B1A5B055B0D8E
-:10CB60000A2815DD0B38854000222D032D0B0021EE
-:10CB700010002D030A0D2D0B12052A430D4D1B0528
-:10CB80002A4013435B00E4075B082343190070BD90
-:10CB900002002900153291400A000B21081AC540F5
-:10CBA0002D032D0BE3E70024002300250022DEE700
-:10CBB0001E040000FFFF0F804100090E4B1C70B5E2
-:10CBC000DBB24602750AC40F012B14DDE0239B0083
-:10CBD0006D07360BCB1800210A0D280012051C4DDD
-:10CBE00032435B052A405B0813435B00E4075B08A4
-:10CBF0002343190070BD002914D1002D1ED0280038
-:10CC000000F0B0F80A281CDC0B232A001B1ADA40BB
-:10CC1000030015339D400F4B12031B1A5B05160BC7
-:10CC20005B0DD8E7002D06D0320B802636036D074A
-:10CC30001643094BCFE7084B0026CCE7002300261C
-:10CC4000C9E703002A000B3B9A400025E3E7C046F2
-:10CC5000FFFF0F8089030000FF070000F0B54C00C4
-:10CC6000640D0B03621C5B0A460F5205C90F1E437D
-:10CC7000C500520D012A29DD374BE718FE2F1CDCB9
-:10CC8000002F3BDD8001431E98410722F3006D0F0A
-:10CC900003432B431A40002A04D00F221A40042ACF
-:10CCA00000D004338022D2041A4024D00137FAB2D3
-:10CCB000FF2F02D09B01580A01E0FF220020400212
-:10CCC000D205400AC90710430843F0BD3543002C84
-:10CCD00004D1002D0AD100220020F0E7002DECD075
-:10CCE0008020C0033043FF22E9E7002400235B02D9
-:10CCF000580AE2B2E3E7DB083C00F8E73B001733F1
-:10CD0000F3DB80231B0433431E26F61B1F2E14DD8A
-:10CD100002225242D71B1A00FA401700202E04D0DC
-:10CD20000E4A94466444A3401D432B005D1EAB4154
-:10CD300007223B431A400027ADE7094A2800A21802
-:10CD4000954093406C1EA541F04007222B430343BE
-:10CD50001A4000279FE7C04680FCFFFFA2FCFFFFB0
-:10CD600082FCFFFF1C2101231B04984201D3000C0D
-:10CD700010391B0A984201D3000A08391B0998424E
-:10CD800001D30009043902A2105C40187047C04664
-:10CD90000403020201010101000000000000000084
-:10CDA00010B5002903D1FFF7DDFF203002E0081C99
-:10CDB000FFF7D8FF10BDC046F0B5C646714B450021
-:10CDC00000B5041C07006D089D4208DDFF23DB054C
-:10CDD0009D4271DC002800DC9DE06B486FE06B4BEE
-:10CDE0009D4200DD7AE06A4B9D426BDD0126764272
-:10CDF000211C201CFDF7DAFD011C8046FDF7D6FD45
-:10CE00006449051CFDF7D2FD6349FDF75DFA291C55
-:10CE1000FDF7CCFD6149FDF757FA291CFDF7C6FD6A
-:10CE20005F49FDF751FA291CFDF7C0FD5D49FDF78B
-:10CE30004BFA291CFDF7BAFD5B49FDF745FA41465F
-:10CE4000FDF7B4FD59498046281CFDF7AFFD584950
-:10CE5000FDF7DEFE291CFDF7A9FD5649FDF7D8FEBA
-:10CE6000291CFDF7A3FD5449FDF7D2FE291CFDF74F
-:10CE70009DFD5249FDF7CCFE291CFDF797FD011CD5
-:10CE80004046FDF721FA211CFDF790FD731C44D0AC
-:10CE90004B4BB600F158FDF7BBFE211CFDF7B8FE69
-:10CEA000484B011CF058FDF7B3FE002F07DA802332
-:10CEB0001B069C46604402E0011CFDF705FA04BC19
-:10CEC0009046F0BD4049FDF7FFF9FE218905FDF7C9
-:10CED000EDF80300201C002BF1D187E700F008F9E2
-:10CEE0003A4B041C9D421DDC394B9D4239DC011C30
-:10CEF000FDF7EAF9FE218905FDF78AFE8021051C70
-:10CF0000C905201CFDF7E0F9011C281CFDF776FB84
-:10CF10000026041C6CE72F48D1E7011C201CFDF7FC
-:10CF200077FECCE72C4B9D4214DCFF218905FDF7F1
-:10CF30006FFEFF21051C8905201CFDF737FDFE2132
-:10CF40008905FDF7C1F9011C281CFDF757FB0226D6
-:10CF5000041C4DE7011C2148FDF750FB0326041C6F
-:10CF600046E7FE218905FDF753FEFE21051C8905D4
-:10CF7000201CFDF7A9F9011C281CFDF73FFB012629
-:10CF8000041C35E7FFFF7F50DB0FC93FFFFFDF3E8B
-:10CF9000FFFFFF30D769853C59DA4B3D356B883D43
-:10CFA0006E2EBA3D2549123EABAAAA3E21A215BD5E
-:10CFB0006BF16E3D95879D3D388EE33DCDCC4C3E6B
-:10CFC000ACF102009CF10200CAF24971FFFF973FE9
-:10CFD000FFFF2F3FDB0FC9BFFFFF1B40000080BFDB
-:10CFE000F0B5C64643005F081B0E7F3B00B5051C2D
-:10CFF00006001C00162B1CDC8046002B21DB1A4F80
-:10D000001F41074211D01949FDF75EF90021FDF7D4
-:10D010004DF8002809D0002D04DD80231B04234196
-:10D020009846A8444346BB431E00301C04BC9046AF
-:10D03000F0BD0F4B9F42F8D9011CFDF745F9061CC6
-:10D04000F3E70A49FDF740F90021FDF72FF8002822
-:10D05000EBD0002D04DB002FE7D0FE26B605E4E779
-:10D0600080263606E1E7C046FFFF7F00CAF249711D
-:10D07000FFFF7F7F00B51C4A430083B05B089342EB
-:10D0800018DD1A4A934204DD011CFDF7C1FD03B00F
-:10D0900000BD694602F0C6F9032301991840012832
-:10D0A0000CD0022817D0002811D00098012202F0DD
-:10D0B000E1FFECE7002102F093FBE8E70122009892
-:10D0C00002F0D8FF80231B069C466044DFE70098EF
-:10D0D00002F086FBDBE7009802F082FB80231B0650
-:10D0E0009C466044D3E7C046D80F493FFFFF7F7F8F
-:10D0F000400040087047C046F0B5C64643005F0890
-:10D100001B0E7F3B00B5051C06001C00162B1CDC0B
-:10D110008046002B21DB194F1F41074211D01849CF
-:10D12000FDF7D2F80021FCF7C1FF002809D0002D3F
-:10D1300004DA80231B0423419846A8444346BB439A
-:10D140001E00301C04BC9046F0BD0E4B9F42F8D927
-:10D15000011CFDF7B9F8061CF3E70949FDF7B4F81F
-:10D160000021FCF7A3FF0028EBD0002D01DB0026F7
-:10D17000E7E7002FE5D0044EE3E7C046FFFF7F005E
-:10D18000CAF24971FFFF7F7F000080BF70B50C00BD
-:10D19000002121600F49430002005B088B4217DC2D
-:10D1A000002B15D00C4D0021AB4208DC9821C9059D
-:10D1B000FDF7FCFB1921020043005B0849420748C8
-:10D1C000DB150240FC207E3B5B188005236010438A
-:10D1D00070BDC046FFFF7F7FFFFF7F00FFFF7F80A6
-:10D1E00070B5041C0D0003F0A5FA002805D000213D
-:10D1F000201CFCF741FF002801D0201C70BD201C22
-:10D20000290000F083F8041C03F094FA002805D0EC
-:10D210000021201CFCF730FF0028EED003F0A6FA16
-:10D2200022230360E9E7C04643001B0E7F3B10B595
-:10D23000162B05DC002B0EDB094A1A41024203D1F2
-:10D240000860C00FC00710BD030093430B60191C9A
-:10D25000FDF7DEFCF7E7C30FDB070B60F3E7C04623
-:10D26000FFFF7F0010B500F001F810BD30B543009E
-:10D2700059081B0E7F3B83B00200162B1EDC0029D1
-:10D280001AD00100C40F002B1FDB1D4A1A410242B5
-:10D2900012D05208024204D09143802292031A41D4
-:10D2A0001143184BA400E458201CFDF70DF8019021
-:10D2B0000198211CFDF7ACFC03B030BD124B994224
-:10D2C000FAD9011CFDF700F8F6E743020D495B0AA5
-:10D2D000A0004558594219438023490ADB03120D27
-:10D2E000194012051143281CFCF7EEFF019001982C
-:10D2F000291CFDF78DFC40004008E4072043DBE7D4
-:10D30000FFFF7F00BCF10200FFFF7F7F420070B58E
-:10D31000031C0C00050051080FD0274EB1420DD858
-:10D32000264881420ED9120E1219FE2A1CDC002A50
-:10D3300022DD2348D2052840104370BD011CFCF7B4
-:10D34000C3FFFAE79821181CC905FDF72FFB1D4AFA
-:10D35000031C944204DB4200120E0500193AE3E775
-:10D360001949FDF723FBE8E7191C184803F0DCF91D
-:10D370001649FDF71BFBE0E7110016310ADA144AE3
-:10D38000191C944210DD114803F0CEF90F49FDF746
-:10D390000DFBD2E7CC211932D005094A8905154089
-:10D3A0002843FDF703FBC8E7074803F0BDF906492A
-:10D3B000FDF7FCFAC1E7C046FFFF7F7FFFFF7F005C
-:10D3C000FFFF7F80B03CFFFF6042A20DCAF24971AF
-:10D3D00050C3000000B51C4A430083B05B08934271
-:10D3E0001BDD1A4A934204DD011CFDF711FC03B05A
-:10D3F00000BD694602F016F8032301991840012880
-:10D4000010D0022817D0002810D0009802F0E8F9B8
-:10D4100080231B069C466044E9E70022002102F0BD
-:10D4200029FEE4E7009802F0DBF9E0E7009801222A
-:10D4300002F020FEDBE70098012202F01BFE8023B1
-:10D440001B069C466044D2E7D80F493FFFFF7F7F11
-:10D4500000B5104A430083B05B08934214DD0E4AC6
-:10D46000934204DD011CFDF7D3FB03B000BD694608
-:10D4700001F0D8FF022240001040013A121A01992F
-:10D48000009802F071FEF0E70122002102F06CFE2C
-:10D49000EBE7C046DA0F493FFFFF7F7F43001B0EDB
-:10D4A0007F3B162B04DC002B03DB034A1A4190431D
-:10D4B0007047C00FC007FBE7FFFF7F0010B500F00B
-:10D4C00073FC10BDF0B54746CE4680B58DB0040064
-:10D4D0000D0000F025FD294B06001B780F005BB204
-:10D4E0009846013310D022002B002000290003F0C1
-:10D4F0007FFF8146002807D1002200232000290059
-:10D50000FCF786FD002806D1300039000DB00CBCB8
-:10D5100090469946F0BD01230293194B0694079556
-:10D5200003934B460A93434604940595002B15D06C
-:10D530000023002219001000FEF70AF94346089064
-:10D540000991022B0ED103F011F9212303600A9BEC
-:10D550000193002B0CD1089E099FD5E700230024DE
-:10D560000893099402A803F0D7F80028EFD1EAE75E
-:10D5700003F0FCF80A9B01930360ECE7EF00002046
-:10D58000C4F10200F0B58DB0041C00F0A1FD002331
-:10D59000224E051CF356013331D0211C201CFDF70F
-:10D5A000FBFC071E2BD1201CFFF7A2FDFE218905E5
-:10D5B000FCF77CFD002822D001230293184B201C8D
-:10D5C00003930A97FFF7F8FA0690079104900591E4
-:10D5D000144803F0A3F80023F35608900991022B96
-:10D5E00010D002A803F098F800280BD00A9B0193F2
-:10D5F000002B0CD108980999FFF730FB051C281C5B
-:10D600000DB0F0BD03F0B2F821230360EEE703F0A4
-:10D61000ADF80A9B01930360ECE7C046EF000020E1
-:10D62000CCF10200F0F10200F0B58DB0041C00F066
-:10D63000B1FE0023224E051CF356013331D0211CCC
-:10D64000201CFDF7A9FC071E2BD1201CFFF750FD65
-:10D65000FE218905FCF72AFD002822D00123029330
-:10D66000184B201C03930A97FFF7A6FA0690079120
-:10D6700004900591144803F051F80023F3560890E4
-:10D680000991022B10D002A803F046F800280BD015
-:10D690000A9B0193002B0CD108980999FFF7DEFA39
-:10D6A000051C281C0DB0F0BD03F060F821230360B9
-:10D6B000EEE703F05BF80A9B01930360ECE7C046DA
-:10D6C000EF000020D4F10200F0F1020010B500F0EC
-:10D6D000B3FF10BDF0B58BB0041C01F041F800237E
-:10D6E000304E051CF356013336D0201C03F022F8CF
-:10D6F000002831D02C49201CFCF7D8FC071E2ED165
-:10D700002A49201CFCF7BEFC002825D004236D46C6
-:10D710000093274B2F626B60201CFFF74DFA00230C
-:10D720000022AA61EB610023F35628616961A860B9
-:10D73000E960022B31D0280002F0EEFF00282CD047
-:10D740002B6A002B03D003F011F82B6A0360A86941
-:10D75000E969FFF783FA051C281C0BB0F0BD032311
-:10D760006D460093124B201C6B6000232B62FFF769
-:10D7700023FA0023F35628616961A860E960002B51
-:10D7800005D1E0220B4B1206AA61EB61D3E7002022
-:10D790000949A861E961022BCDD102F0E7FF2223FC
-:10D7A0000360CDE7EF0000208071B142B5F1CFC238
-:10D7B000DCF10200FFFFEF470000F07FF0B5C64646
-:10D7C00000B58CB0051C0C1C01F0C4F82D4B061CD8
-:10D7D0001B785BB2984601333DD0211C201CFDF71D
-:10D7E000DBFB002837D1291C281CFDF7D5FB071EC1
-:10D7F00031D10021201CFCF73FFC00282BD0012355
-:10D800000293214B281C03930A97FFF7D5F90600D2
-:10D810000F00201C04960597FFF7CEF943460690AB
-:10D820000791002B1CD00023002219001000FDF7E7
-:10D830008FFF434608900991022B13D102F096FF07
-:10D84000212303600A9B0193002B14D108980999A6
-:10D85000FFF704FA061C301C0CB004BC9046F0BD67
-:10D860000896099702A802F057FF0028E6D00A9B05
-:10D870000193002BEAD002F079FF0A9B0193036029
-:10D88000E4E7C046EF000020E4F1020070B5002597
-:10D890008CB0041C01F0EEF8354B061C5D576B1C78
-:10D8A0000BD0211C201CFDF777FB002805D100219F
-:10D8B000201CFCF7FBFB002802D0301C0CB070BD14
-:10D8C0002C4B0A90201C0393FFF776F906900791E2
-:10D8D00004900591002D1BD1E022274B1206002158
-:10D8E000201C08920993FCF7C7FB002837D00223BD
-:10D8F000029302A802F010FF002817D00A9B0193A0
-:10D90000002B18D108980999FFF7A8F9061CD4E74D
-:10D9100000221A4B0021201C08920993FCF7ACFB53
-:10D9200000280ED002230293022DE2D102F01EFF46
-:10D9300022230360E2E702F019FF0A9B01930360D0
-:10D94000E0E701230293022D0BD102F00FFF212308
-:10D9500003600B4802F0E2FE08900991CEE7012334
-:10D96000029302A802F0D8FE0028F2D1EDE7C046EB
-:10D97000EF000020ECF10200FFFFEFC70000F0FF16
-:10D98000F0F10200F0B54E464546DE465746E0B59A
-:10D9900000268FB0051C0C1C01F0B2F9CB4B804661
-:10D9A0009E579946731C39D0211C201CFDF7F4FAB0
-:10D9B0008246002832D1291C281CFDF7EDFA0021EF
-:10D9C000071E00D071E0281CFCF756FB00282DD064
-:10D9D0000021201CFCF750FB8246002800D19CE06F
-:10D9E00004AB9846012342460493B94B1762536037
-:10D9F000281CFFF7E1F843469860D960201CFFF728
-:10DA0000DBF84346002218615961002341468A61D0
-:10DA1000CB61002E6BD0FE239B05984640460FB08D
-:10DA20003CBC90469946A246AB46F0BD404602F04B
-:10DA300081FE061E00D1A8E000214046FCF71CFB39
-:10DA40000028EBD0281C02F075FE0028E6D0201C30
-:10DA500002F070FE0028E1D004AB98460423424651
-:10DA600004939B4B281C536000231362FFF7A4F818
-:10DA700043469860D960201CFFF79EF84346002279
-:10DA800018615961002341468A61CB614B461B787E
-:10DA90005BB2022B04D0404602F03EFE00282CD19F
-:10DAA00002F064FE2223036027E0201CFCF7E4FA66
-:10DAB0000028B3D004AB9846012342460493844B1C
-:10DAC000281C5360524643461A62FFF775F84346D6
-:10DAD0009860D960201CFFF76FF843460022186158
-:10DAE000596141467B4B8A61CB61022E93D04046FF
-:10DAF00002F012FE002800D197E043461B6A002B7B
-:10DB000004D002F033FE43461B6A03604346986923
-:10DB1000D969FFF7A3F8804680E7201C02F00AFECF
-:10DB2000002800D17AE70021201CFCF7ABFA00287E
-:10DB300000D173E704AB9846012342460493644B3B
-:10DB4000281C5360434652461A62FFF735F8434695
-:10DB50009860D960201CFFF72FF84346186159617F
-:10DB60004B461B785BB2002B64D0002042465A49DA
-:10DB70009061D161022B62D102F0F8FD2123036094
-:10DB800043461B6A002BC1D0BBE7281C02F0D2FD24
-:10DB9000002800D150E7201C02F0CCFD002800D165
-:10DBA0004AE7281CFFF708F800900191201CFFF7B6
-:10DBB00003F84B461B78029003915BB24146404606
-:10DBC0009B46FDF7E9F904AB984600285FD1032393
-:10DBD0004246414604933E4B10625360009A019BBB
-:10DBE0008A60CB60029A039B0A614B61FC21201C76
-:10DBF0008905FCF7DBFE5B46041C002B25D1E022E7
-:10DC00004146364B12068A61CB61281C0021FCF785
-:10DC100039FA002828D1404602F07EFD0028AFD115
-:10DC200002F0A4FD22230360AAE702F09FFD212356
-:10DC3000036062E70022002341468A61CB614046CF
-:10DC400002F06AFD00289BD196E741460022244B52
-:10DC5000281C8A61CB610021FCF714FA002843D10B
-:10DC60005B46022BDCD0D6E7201CFFF7FFFA211C15
-:10DC7000FCF702FA002805D1E0221A4B12064146B1
-:10DC80008A61CB614B461B785BB29B46E8E7012378
-:10DC9000424604930E4B16625360009B019C9360B6
-:10DCA000D460029B039C136154615B46002BC1D07E
-:10DCB0000021081CFCF7A2FCFEF77EFF434698619A
-:10DCC000D9615B46022B00D156E7B8E7EF00002090
-:10DCD000F4F102000000F03F0000F0FFFFFFEF470B
-:10DCE0000000F07FFFFFEFC7201CFFF7BFFA211CE9
-:10DCF000FCF7C2F90028C5D10022014BBFE7C0469E
-:10DD00000000F0FFF0B500258DB0041C01F00EFD01
-:10DD1000234B061C5D576B1C0BD0211C201CFDF7F0
-:10DD20003BF9071E05D10021201CFCF7ABF90028A8
-:10DD300002D1301C0DB0F0BD01230293194B201C01
-:10DD400003930A97FEF738FF00220690079104908C
-:10DD500005910023002D15D010001900FDF7F8FCE7
-:10DD600008900991022D0FD102F000FD21230360DC
-:10DD70000A9B0193002B0DD108980999FEF76EFFBD
-:10DD8000061CD6E70892099302A802F0C5FC0028F9
-:10DD9000EED1E9E702F0EAFC0A9B01930360EBE7AE
-:10DDA000EF000020FCF10200F8B515004746CE4612
-:10DDB0005A001C006B4280B52B434B4F5208DB0FBF
-:10DDC0001343BB421DD84B005B089846464643426E
-:10DDD0000343DB0F89463343BB4212D8434BE3185E
-:10DDE0002B4339D00226A3171E40CB0F1E434346B8
-:10DDF000034310D1022E47D0032E08D13C483D49A1
-:10DE000005E002000B0028002100FDF785F90CBC9D
-:10DE100090469946F8BD13002B4320D0BA4224D037
-:10DE2000B8451CD043469A1A12153C2A2FDC002C08
-:10DE300030DA3C322EDA00200021012E3ED0022EB4
-:10DE400031D0002EE3D02C4A2C4BFEF7FDFA284AA5
-:10DE50002B4BFEF7F9FADAE702F0C6FAD7E74B46A2
-:10DE60002348002B0EDB2749D1E790452BD0022E0B
-:10DE70000AD0032EC2D000200021012EC7D180215C
-:10DE80000906C4E72049C2E719481D49BFE71848F9
-:10DE90001C49D2E72A002300FDF75AFC02F038FCA7
-:10DEA00002F0A2FAC9E7144A144BFEF7CDFA0200B9
-:10DEB0000B000F481249FEF7C7FAA8E78024240692
-:10DEC0000B191900A3E7022E06D0032E09D008482B
-:10DED000012E04D00D499AE70D480E4997E70E49E7
-:10DEE00095E70B480D4992E70000F07F000010C055
-:10DEF000182D4454FB2109C0075C143326A6A13C0D
-:10DF0000FB210940FB21F93FFB21F9BFFB21E93F40
-:10DF1000D221337F7CD90240FB21E9BF7CD902C0EA
-:10DF2000F8B54746CE46674B80B50A000F0019008A
-:10DF300005003940994200D19BE004000100002F08
-:10DF400069DD3F1500D1B4E05F4B12039C4680238E
-:10DF5000120B5B0313435B00CA0F67449B184A0014
-:10DF6000F80703D5D20F5B009B188A0079108C4606
-:10DF7000002180201624894680030D189D4202DC72
-:10DF800029185B1B8144D50F5B00013C5B195200D3
-:10DF90004008002CF1D10020804680202025002759
-:10DFA000000609E08B425CD0D40F5B00013DE31812
-:10DFB00052004008002D16D0C4198B42F2DD2718FC
-:10DFC0000E00002C49DB5B1AA242894149425B1AD0
-:10DFD000121BD40F5B00013D80443100E318520056
-:10DFE0004008002DE8D113434ED143465B08374922
-:10DFF0004A468846494652104244C90702D5802104
-:10E0000009060B4361460F05BD18180029000CBC1A
-:10E0100090469946F8BD7B005B0803433900002B0E
-:10E02000F5D0002F3CD1E30A153A6405002BFAD055
-:10E030008020400303423FD1002700E00F005B0037
-:10E04000791C0342FAD0250020208D40401A290077
-:10E05000D71B2200C2401A4376E7FE43F60F8E1903
-:10E06000B1E79442A0D82718002CF6DB1E0000234D
-:10E07000AEE702003B0028003900FDF773FF2A00DD
-:10E080003B00FDF749F8C2E74346013303D043465E
-:10E0900001335B08ABE7012398460023C144A6E7A0
-:10E0A0003B000200FEF7D0F902000B00FDF750FB29
-:10E0B000ADE713000022BBE70127210020207F42AB
-:10E0C000C6E7C0460000F07F01FCFFFF0000E03F14
-:10E0D000FE22F8B54300041C01005B089205934240
-:10E0E00061D05ADC9B4A934262DC8C2292059342B7
-:10E0F00000DCCEE0FCF75AFC9749051CFCF756FC07
-:10E100009649FCF7E1F8291CFCF750FC9449FCF710
-:10E110007FFD291CFCF74AFC9249FCF7D5F8291C25
-:10E12000FCF744FC9049FCF773FD291CFCF73EFC0E
-:10E130008E49FCF7C9F8291CFCF738FC8C49061CF1
-:10E14000281CFCF733FC8B49FCF762FD291CFCF70B
-:10E150002DFC8949FCF7B8F8291CFCF727FC8749F6
-:10E16000FCF756FD291CFCF721FCFE218905FCF774
-:10E17000ABF8011C301CFCF741FA211CFCF716FC23
-:10E18000011C7F48FCF744FD011C201CFCF740FDEE
-:10E19000011C7C48FCF73CFD04E0FCF739FD011C48
-:10E1A000FCF72CFAF8BD0020002CFBDC7648F9E7E0
-:10E1B000002870DBFE208005FCF72AFDFC21890584
-:10E1C000FCF7F4FB041C01F0B1FA6349061C050BD3
-:10E1D000201CFCF7EBFB6149FCF776F8211CFCF7EF
-:10E1E000E5FB5F49FCF714FD211CFCF7DFFB5D49F3
-:10E1F000FCF76AF8211CFCF7D9FB5B49FCF708FD2A
-:10E20000211CFCF7D3FB5949FCF75EF8211CFCF7F5
-:10E21000CDFB5749071C201CFCF7C8FB5549FCF7F0
-:10E22000F7FC211CFCF7C2FB5349FCF74DF8211CFD
-:10E23000FCF7BCFB5149FCF7EBFC211CFCF7B6FBDF
-:10E24000FE218905FCF740F8011C381CFCF7D6F9C3
-:10E25000311CFCF7ABFB2D03071C291C281CFCF709
-:10E26000A5FB011C201CFCF7D3FC291C041C301C42
-:10E27000FCF72AF8011C201CFCF7C0F9011C381C13
-:10E28000FCF722F8291CFCF71FF8011CFCF71CF80E
-:10E2900088E73E4886E7FE218905FCF715F8FC2152
-:10E2A0008905FCF783FB2C49041CFCF77FFB2B49F9
-:10E2B000FCF70AF8211CFCF779FB2949FCF7A8FCBC
-:10E2C000211CFCF773FB2749FBF7FEFF211CFCF721
-:10E2D0006DFB2549FCF79CFC211CFCF767FB2349DF
-:10E2E000FBF7F2FF211CFCF761FB061C201C01F070
-:10E2F0001DFA1F49051C201CFCF758FB1D49FCF7A3
-:10E3000087FC211CFCF752FB1B49FBF7DDFF211C9E
-:10E31000FCF74CFB1949FCF77BFC211CFCF746FB86
-:10E32000FE218905FBF7D0FF011C301CFCF766F9C4
-:10E33000291CFCF73BFB1249FCF76AFC291CFBF784
-:10E34000C3FF011CFBF7C0FF011C1148FCF760FC78
-:10E3500028E7C046FFFFFF3E08EF1138047F4F3A21
-:10E360004611243DA80A4E3E90B0A63EABAA2A3ED6
-:10E370002EC69D3D6133303F2D57014039D11940A4
-:10E380006821A233DA0FC93FDB0F4940DB0FC93FD9
-:10E39000DA0F4940F0B5FE234646D6464F464400C4
-:10E3A000C0B5051C060064089B059C4200D18AE0AC
-:10E3B0007EDC8F4B9C420EDC8E4B9C4200DD8FE05E
-:10E3C0008D49FBF781FFFE218905FBF76FFE0300F6
-:10E3D000281C002B72D1281CFEF78AFE011CFE208F
-:10E3E0008005FCF715FCFC218905FCF7DFFA834961
-:10E3F000051CFCF7DBFA8249FBF766FF291CFCF7DA
-:10E40000D5FA8049FCF704FC291CFCF7CFFA7E49B9
-:10E41000FBF75AFF291CFCF7C9FA7C49FCF7F8FB0B
-:10E42000291CFCF7C3FA7A49FBF74EFF291CFCF7BD
-:10E43000BDFA78498046281CFCF7B8FA7649FCF703
-:10E44000E7FB291CFCF7B2FA7449FBF73DFF291CD6
-:10E45000FCF7ACFA7249FCF7DBFB291CFCF7A6FAC7
-:10E46000FE218905FBF730FF8146281C01F05EF98B
-:10E470006C4B071C9C4200DC7DE049464046FCF7A3
-:10E48000BDF8391CFCF792FA391CFBF71DFF011C83
-:10E49000FBF71AFF6449FBF717FF011C6348FCF701
-:10E4A000B7FB002E0ADC80231B069C46604405E077
-:10E4B000011CFCF7ADFB011CFCF7A0F81CBC90464E
-:10E4C0009946A246F0BD5949FCF770FA5849041C18
-:10E4D000281CFCF76BFA011C201CFBF7F5FEEDE78E
-:10E4E000011CFCF763FA4549041CFCF75FFA444938
-:10E4F000FBF7EAFE211CFCF759FA4249FCF788FBBE
-:10E50000211CFCF753FA4049FBF7DEFE211CFCF707
-:10E510004DFA3E49FCF77CFB211CFCF747FA3C49CD
-:10E52000FBF7D2FE211CFCF741FA3A49061C201CDD
-:10E53000FCF73CFA3849FCF76BFB211CFCF736FA78
-:10E540003649FBF7C1FE211CFCF730FA3449FCF7D1
-:10E550005FFB211CFCF72AFAFE218905FBF7B4FEBC
-:10E56000011C301CFCF74AF8291CFCF71FFA291C77
-:10E57000FBF7AAFEA2E7011C040BFBF7A5FE494628
-:10E5800082464046FCF73AF8011C5046FCF70EFA6A
-:10E5900024038046211C201CFCF708FA011C281CBF
-:10E5A000FCF736FB391C051C201CFBF78DFE011CFB
-:10E5B000281CFCF723F8011CFBF786FE011C1C48F5
-:10E5C000FCF726FB011C4046FCF722FB211C051C26
-:10E5D000201CFBF779FE011C1648FCF719FB011CF7
-:10E5E000281CFCF715FB011C1248FCF711FB58E72F
-:10E5F000FFFFFF3EFFFFFF31CAF2497108EF1138FC
-:10E60000047F4F3A4611243DA80A4E3E90B0A63EE4
-:10E61000ABAA2A3E2EC69D3D6133303F2D570140A7
-:10E6200039D119409999793F2EBD3B33DB0FC93F52
-:10E630002EBD3BB3DB0F493FF0B54B00C6460C1C6B
-:10E64000FF2100B55B08C9058B4217DC42008046FC
-:10E6500052088A4212DCFE25AD05AC4236D0A51721
-:10E66000AC46022567463D40C70F3D43002A0CD10A
-:10E67000022D3CD0032D05D1304803E0011C201CA5
-:10E68000FBF722FE04BC9046F0BD002B19D08B4254
-:10E690001FD08A4215D0D31ADB153C2B29DC002C65
-:10E6A00029DA3C3327DA0020012D34D0022D2AD07C
-:10E6B000002DE7D02249FBF707FE2249FCF7A8FA14
-:10E6C000E0E74346002B10DB1F48DBE7FEF774FB57
-:10E6D000D8E79A4224D0022D09D0032DCCD00020B7
-:10E6E000012DCFD180200006CCE71848CAE7154895
-:10E6F000C8E71548D8E7211CFBF780FFFEF7F8FCB8
-:10E70000FEF75AFBD0E70E49FBF7DEFD011C0D4872
-:10E71000FCF77EFAB6E780231B069C466044B1E70F
-:10E72000022D05D0032D07D0012D03D00848A9E7FD
-:10E730000848A7E70848A5E70848A3E7DB0F49C052
-:10E740002EBDBB33DB0F4940DB0FC93FDB0FC9BF19
-:10E75000DB0F493FE4CB1640DB0F49BFE4CB16C0CB
-:10E76000F0B5FF22D6464F4646464300C0B5041CCE
-:10E7700001005B08D205934231D8C50F934235D0D2
-:10E78000634A904236DC002800DA88E0614A93420E
-:10E7900035D9614A934200D8A9E06049201CFCF7B2
-:10E7A00005F95F4BAD00E958FBF78EFDFCF70AFC5D
-:10E7B0000500FCF727FC5B49071CFCF7F7F8011C78
-:10E7C000201CFCF725FA58498246381CFCF7EEF865
-:10E7D000071C391C5046FCF71BFA041C13E0FBF71E
-:10E7E00073FD1CBC90469946A246F0BD002DF8D0A2
-:10E7F0000020F6E74D49081CFCF7D8F8F1E74C4A31
-:10E80000934264D90025211C201CFCF7CFF849490C
-:10E81000061CFCF7CBF84849FCF7FAF9311CFCF769
-:10E82000C5F84649FBF750FD311CFCF7BFF84449D9
-:10E83000FCF7EEF9311CFCF7B9F84249FBF744FD4F
-:10E84000311CFCF7B3F8011C201CFCF7E1F9011C9A
-:10E850008046201CFCF7AAF88146002D25D0802098
-:10E860004146C005FCF7D4F9011C4846FBF7C6FE3B
-:10E87000011C381CFCF7CCF95146FCF7C9F9011C06
-:10E88000FE208005FCF7C4F92B007D333CDAD8214B
-:10E890006435ED0528180905FCF788F8A1E72A4A30
-:10E8A000934200D872E700209BE780214046C905CB
-:10E8B000FCF7AEF9011C4846FBF7A0FE211CFCF753
-:10E8C000A7F9011CFE208005FCF7A2F989E717498A
-:10E8D000201CFBF7F9FCFE218905FBF7E7FB00286C
-:10E8E00090D0FE21201C8905FBF7EEFC79E7174B41
-:10E8F000AF00F958201C0124FCF78AF9144B641B63
-:10E900008246FF58651B64E7ED05281869E7C04695
-:10E910001772B1421872B13E9115853F3BAAB83FBC
-:10E9200004F202008071313FD1F71737CAF2497102
-:10E93000FFFF7F314CBB31330EEADD3555B38A38EA
-:10E94000610B363BABAA2A3EB5F1CF420CF2020076
-:10E9500014F20200F8B54B00071C5B0836D0414AA0
-:10E9600044006408944231DC013293422EDC9C4224
-:10E9700032DBC00FC5079C422FD03B4A944231DDA9
-:10E98000E2157F3A3848834256DC7E2618027642EA
-:10E99000013E4000FCD510007E3048DB80207C0228
-:10E9A000640A0004044330007E303BDB80234902CC
-:10E9B000490A1B040B43911BE21A00291BD0640077
-:10E9C000002A01DB09D054000139F5E7381CFBF7B8
-:10E9D000EDFF011CFBF712FEF8BDE80F234B800092
-:10E9E000C058F9E7200233D07E225242013A40005B
-:10E9F0000028FBDCC6E7002A00DA2200002AECD05F
-:10EA000019490B008A4203DC5200013E9A42FBDDA9
-:10EA100033007E3313DA7E235B429E1B32412A434E
-:10EA20001000D9E77E214942891B8B40C3E77E2035
-:10EA30004042801A8440B6E7DE157F3EABE70C4BC0
-:10EA40007F369C4662442A431000F6053043C3E7F4
-:10EA5000934204DD7E22DE157F3E52429EE77E22F7
-:10EA6000524292E7FFFF7F7FFFFF7F001CF2020010
-:10EA7000000080FFF8B5DE4657464E464546030087
-:10EA8000E0B5420044D000284DDB8E4A904251DC74
-:10EA90008D4A0021904206DC9821C905FBF786FFCC
-:10EAA000192103004942DA155B025C0A874B7F3A61
-:10EAB000E01880231B040340FE205218FE2180052D
-:10EAC0005840DD1520438905AD18FCF7A1F8230057
-:10EAD0000F335B02061C5B0A0F2B2FDC0021FBF7B8
-:10EAE000CBFA002800D19EE00020002D15D0280090
-:10EAF000FCF788FA7649041CFBF758FF7549051C9A
-:10EB0000201CFBF753FF011C281CFBF7DDFB04E076
-:10EB1000CC2000210006FBF771FD3CBC90469946D5
-:10EB2000A246AB46F8BD011CFCF772F80021FBF7CA
-:10EB300065FDF2E7011CFBF7C7FBEEE78021C90585
-:10EB4000FBF7C2FB011C301CFBF758FD8046280078
-:10EB5000FCF758FA414681464046FBF727FF5E4BDB
-:10EB6000011C9A468346FBF721FF5C49071CFBF713
-:10EB70001DFF5B49FBF7A8FB391CFBF717FF594941
-:10EB8000FBF7A2FB391CFBF711FF5749FBF79CFB76
-:10EB90005946FBF70BFF55498346381CFBF706FF28
-:10EBA0005349FBF791FB391CFBF700FF5149FBF779
-:10EBB0008BFB391CFBF7FAFE011C5846FBF784FB64
-:10EBC0004D4BA2441C1B5346071C1C43002C65DD07
-:10EBD000FC21301C8905FBF7E9FE311CFBF7E6FE42
-:10EBE000011C041C381CFBF76FFB4146FBF7DEFEE3
-:10EBF000071C002D44D036494846FBF7D7FE35495F
-:10EC0000051C4846FBF7D2FE391CFBF75DFB011CD7
-:10EC1000201CFBF7FDFF311CFBF7FAFF011C281C31
-:10EC2000FBF7F6FF79E73549301CFBF7BFFE011C07
-:10EC3000FC208005FBF7ECFF311C041C301CFBF7AB
-:10EC4000B5FE011C201CFBF7B1FE041C002D20D0DA
-:10EC50002800FCF7D7F91E49051CFBF7A7FE1D4944
-:10EC6000071C281CFBF7A2FE011C201CFBF7D0FF91
-:10EC7000311CFBF7CDFF011C381CFBF7C9FF4CE72B
-:10EC8000011C201CFBF7C4FF011C301CFBF7C0FF5C
-:10EC900043E7211C301CFBF7BBFF3EE7011C301C87
-:10ECA000FBF7B6FF4146FBF781FE041C002DF0D0B8
-:10ECB00007494846FBF77AFE0649051C4846FBF71C
-:10ECC00075FEA4E7FFFF7F7FFFFF7F0020FB4A0068
-:10ECD0008071313FD1F71737305CCFFF9788173EEF
-:10ECE00025333A3E2549923EABAA2A3F4FD01C3EDF
-:10ECF000298E633ECDCCCC3E88C23500ABAAAA3E5D
-:10ED0000F0B557464E464546DE46E0B54F0087B063
-:10ED1000061C0C1C0D007F0811D0814640004308E2
-:10ED20009846FF23DB05984503DD5C4801F00CFDA8
-:10ED300007E09F420CDDFE239B059845F5D1FE20A0
-:10ED4000800507B03CBC90469946A246AB46F0BD54
-:10ED500000239B46002E2DDBFF23DB059F423ED088
-:10ED6000FE239B059F4244D08023DB059D421CD09F
-:10ED7000FC239B059D4248D14B46301C002B7ADA80
-:10ED8000FEF7B6F9FF23DB05984502D04346002B7A
-:10ED900045D15A46424B434413436FD0012AD0D148
-:10EDA00080231B069C466044CBE7311C301CFBF7DC
-:10EDB000FDFDC6E73B4B9F4224DC3B4B9F42CFDD32
-:10EDC0009622FB15D31A3A001A4111009940B94214
-:10EDD000C6D101231A4001339B1A9B46C0E7FE238C
-:10EDE0009B059845ABD040DD201C002DA9DA002002
-:10EDF000A7E7301C002DA4DAFE20311C8005FBF7AC
-:10EE0000FDFB9EE702239B46A6E7301CFEF770F948
-:10EE1000FF23DB0598451CD04346002B19D0FE2369
-:10EE20009B05984515D0F30F013B1A0000935B46F4
-:10EE300013432AD09A23DB059F423BDD1B4B9845A9
-:10EE400000DD07E2002DD2DA1949081CFBF7AEFD00
-:10EE500077E7002D04DA011CFE208005FBF7CEFBCE
-:10EE60004B46002B00DB6CE793E7002DBFDA8023D5
-:10EE70001B06E01865E700F059FC62E7011CFBF790
-:10EE8000C7FE011CFBF7BAFB5BE7311C301CFBF72C
-:10EE9000BFFE011CFBF7B2FB53E7C046F0F10200D6
-:10EEA000000080C0FFFF7F4BFFFF7F3FF7FF7F3FEA
-:10EEB000CAF24971EB4B0022984506DC9721C9053F
-:10EEC000FBF774FD1822804652424346DB157F3B18
-:10EED00099184346FE225B025B0A92051A4390464C
-:10EEE000E14A0291934208DDE04A934200DC6CE281
-:10EEF000DF4B01319C460291E04400239A46FE23F9
-:10EF000000259B059946019543464946181CFBF789
-:10EF10007FFE4646071C494640460396FBF7D4F958
-:10EF2000011CFE208005FBF769FB011C0590381CC5
-:10EF30000497FBF73BFD4246531080229205134392
-:10EF40008022D202944663441A00070B52443F03C6
-:10EF5000111C061C381C9046FBF728FD011C049868
-:10EF6000FBF756FE494682464046FBF751FE011C20
-:10EF70000398FBF74DFE391CFBF718FD011C5046AA
-:10EF8000FBF746FE0599FBF711FD311C8146301C4D
-:10EF9000FBF70CFD8046B749FBF708FDB649FBF7C8
-:10EFA00093F94146FBF702FDB449FBF78DF9414661
-:10EFB000FBF7FCFCB249FBF787F94146FBF7F6FC8F
-:10EFC000B049FBF781F94146FBF7F0FCAE49FBF78E
-:10EFD0007BF9414682464046FBF7E8FC011C50465F
-:10EFE000FBF7E4FC8046311C381CFBF76DF9494601
-:10EFF000FBF7DCFC4146FBF767F9391C8246381CFD
-:10F00000FBF7D4FCA1490390FBF75EF95146FBF7EF
-:10F010005BF9000B0303191C381C9846FBF7C6FC70
-:10F020009A49071C4046FBF7F3FD0399FBF7F0FDF7
-:10F03000011C5046FBF7ECFD311CFBF7B7FC4946C1
-:10F0400082464046FBF7B2FC011C5046FBF73CF9F8
-:10F050008246011C381CFBF737F9000B0303181C10
-:10F060008B499846FBF7A2FC391C061C4046FBF76F
-:10F07000CFFD011C5046FBF7CBFD8649FBF796FC04
-:10F080008549071C4046FBF791FC011C381CFBF727
-:10F090001BF90199FBF718F980460298FBF7B2FFBC
-:10F0A00082464146301CFBF70FF9291CFBF70CF98F
-:10F0B0005146FBF709F9070B3F035146381CFBF794
-:10F0C000A7FD291CFBF7A4FD311CFBF7A1FD011CCA
-:10F0D0004046FBF79DFD81465D46009B013D1D437B
-:10F0E00000D1B4E0FE239B059846250B2D03291C77
-:10F0F000201CFBF78DFD391CFBF758FC211C061C5E
-:10F100004846FBF753FC011C301CFBF7DDF8291CBB
-:10F110008146381CFBF74AFC011C051C8346484607
-:10F12000FBF7D2F84400061C07006408002800DC46
-:10F13000DFE08623DB059C4200DDD2E000D1C1E0A8
-:10F14000FC2300229B0592469C4200DDDEE04946FE
-:10F150005846FBF7B9F8040B24035049201CFBF771
-:10F1600025FC5946061C201CFBF752FD011C484695
-:10F17000FBF74EFD4A49FBF719FC4A49051C201CC8
-:10F18000FBF714FC011C281CFBF79EF8051C011C56
-:10F19000301CFBF799F8311C041CFBF739FD011CEE
-:10F1A000281CFBF735FD211C061C201CFBF7FEFB71
-:10F1B0003D49051CFBF7FAFB3C49FBF729FD291CDF
-:10F1C000FBF7F4FB3A49FBF77FF8291CFBF7EEFB52
-:10F1D0003849FBF71DFD291CFBF7E8FB3649FBF717
-:10F1E00073F8291CFBF7E2FB011C201CFBF710FD48
-:10F1F000051C011C201CFBF7D9FB8021071CC9053D
-:10F20000281CFBF705FD011C381CFBF7F7F9311C26
-:10F21000051C201CFBF7CAFB311CFBF755F8011C31
-:10F22000281CFBF7F5FC211CFBF7F2FC011CFE205F
-:10F230008005FBF7EDFC5346DB051B18DA15002AA9
-:10F2400000DCD4E0181C4146FBF7B0FB79E51B4B12
-:10F2500098464AE71A4B984577DD002D00DDF3E527
-:10F2600000206EE5FFFF7F0071C41C00D6B35D0077
-:10F27000000080FF42F1533E55326C3E05A38B3EA9
-:10F28000ABAAAA3EB76DDB3E9A99193F00004040F9
-:10F290000038763F4F38763FA0C39D360072313F2D
-:10F2A0001872313F8CBEBF354CBB31330EEADD35B1
-:10F2B00055B38A38610B363BABAA2A3E000080BFAB
-:10F2C0000700803F4C494846FAF7FEFF291C82465A
-:10F2D000301CFBF79DFC011C5046FAF7E7FE0028A6
-:10F2E00014D046494046FBF761FB4449FBF75EFBFF
-:10F2F00027E5434B9C4272DC00D021E7291CFBF739
-:10F3000087FC4946FAF7DCFE002868D18022120407
-:10F310001300E4157E3C23419E19F315300076025C
-:10F32000760A16431722DBB236497F3B1941D31ABE
-:10F330001E4188430100B246002F01DA73429A460B
-:10F34000281CFBF765FC834601E7FE218905FBF7D6
-:10F350005FFC2D49071CFBF729FB2C49061C381CB8
-:10F36000FBF724FBFA21051C8905381CFBF71EFB63
-:10F37000011C2748FBF74CFC391CFBF717FB011C51
-:10F38000FC208005FBF744FC391C8246381CFBF747
-:10F390000DFB011C5046FBF709FB1E49FBF706FB62
-:10F3A000011C281CFBF734FC011C051C301CFAF75F
-:10F3B0008BFF070B3F03311C381CFBF729FC011C9A
-:10F3C000281CFBF725FC814686E6134B134D019361
-:10F3D00080239B039A46FF239B05994694E5104999
-:10F3E0004046FBF7E3FA0E49FBF7E0FAA9E4514681
-:10F3F000FDF78CFF27E7C0463CAA3833CAF24971B3
-:10F4000000001643FFFF7F0000AAB83F70A5EC364E
-:10F41000ABAAAA3E3BAAB83FDCCFD13500C0153F0E
-:10F420006042A20DF0B557464E46DE464546E0B571
-:10F43000B04B470089B00C0006007F089F426EDD8C
-:10F44000AD4B9F421ADC0F23AC499F43002800DCE0
-:10F4500071E0FBF7DDFBAA4B061C9F4200D114E1D3
-:10F46000A849FBF7D5FB011C2060301CFBF7D0FB43
-:10F47000A449FBF7CDFB0125606054E0A24B9F42FD
-:10F480006FDDA24B9F4200DDF8E08622524291469A
-:10F49000FB1599444B46DD057D1B281CFBF792FDAF
-:10F4A000FBF7B0FD011C0590281CFBF7B1FB872181
-:10F4B000C905FBF77BFA8046FBF784FDFBF7A2FD4D
-:10F4C000011C0690051C4046FBF7A2FB8721C905DD
-:10F4D000FBF76CFA00210790FAF7CEFD002800D167
-:10F4E00005E10021281CFAF7C7FD434243410133DF
-:10F4F000874A21000192022205A800924A4600F0A4
-:10F5000039FA0500002E0EDA80221206944623688E
-:10F5100045426344236063686344636003E00023FF
-:10F52000002508604B60280009B03CBC9046994615
-:10F53000A246AB46F0BDFAF7C7FE714B061C9F42D0
-:10F5400000D1C1E06F49FAF7BFFE011C2060301CFA
-:10F55000FBF75EFB6B49FAF7B7FE012560606D4271
-:10F56000E1E7FDF7C5FD6B498046FBF71FFAFC217B
-:10F570008905FAF7A9FEFBF725FD0500FBF742FD1B
-:10F580005E498146FBF712FA011C4046FBF740FB3F
-:10F590005C4980464846FBF709FA8246011C404612
-:10F5A0001F2D00DC83E0FBF733FB83465B46FF2225
-:10F5B000DB0DFF151340FB1A082B47DD5649484663
-:10F5C000FBF7F4F98246011C4046FBF721FB83461A
-:10F5D000011C03904046FBF71BFB5146FBF718FB51
-:10F5E00080464E494846FBF7E1F94146FBF710FBE0
-:10F5F000011C82465846FBF70BFBFF22C30D13404C
-:10F60000D846FB1A8346192B20DD45494846FBF7AF
-:10F61000CDF9039B071C011C181C9A46FBF7F8FA4E
-:10F62000011C80465046FBF7F3FA391CFBF7F0FA51
-:10F630003C49071C4846FBF7B9F9391CFBF7E8FAC7
-:10F64000011C82464046FBF7E3FA83465B46594677
-:10F6500023604046FBF7DCFA5146FBF7D9FA6060BD
-:10F66000002E00DB5FE780231B065B4423608023C2
-:10F670001B069C46604460606D4254E7011CFBF72A
-:10F68000C7FA0025606020604DE72349FBF7C0FA08
-:10F690002249051CFBF7BCFA011C2060281CFBF763
-:10F6A000B7FA1E49FBF7B4FA012560603BE7FBF7A8
-:10F6B000AFFAFF233A001C499A436B1E9B005B582C
-:10F6C00083469A42C2D171E71349FAF7FDFD134907
-:10F6D000051CFAF7F9FD011C2060281CFBF798FABD
-:10F6E0000E49FAF7F1FD012560606D421BE7032327
-:10F6F000FEE6C046D80F493FE3CB1640800FC93F16
-:10F70000D00FC93F43443537800F4943FFFF7F7F08
-:10F71000A4F2020084F9223F0044353708A3852E65
-:10F7200000A3852E32318D2424F202002A494300A1
-:10F7300070B50200041C5B088B423BD8002B38D00C
-:10F7400000283EDB2549C6158B420BD880200004DB
-:10F7500020423DD1002300E00B005200591C024220
-:10F76000FAD0F61A802352021B04520A1A437F3E33
-:10F770005300F10700D59300802270101921002654
-:10F7800000255204AC189C4202DCA5181B1BB618BD
-:10F7900001395B0052080029F4D1002B02D001236B
-:10F7A00001369E43FC239B059C4676106644C005AB
-:10F7B000801970BD011CFBF7F9F8211CFAF784FDD4
-:10F7C000F7E7011CFBF724FA011CFAF717FFF0E733
-:10F7D00001235B42C5E7C046FFFF7F7FFFFF7F003D
-:10F7E000F8B54746CE46584B450080B5061C0F1C61
-:10F7F0006D089D4248DCFBF7E5FB002800D19BE04B
-:10F80000311C301CFBF7D2F85049041CFBF7CEF832
-:10F810004F49FAF759FD211CFBF7C8F84D49FBF792
-:10F82000F7F9211CFBF7C2F84B49FAF74DFD211CF3
-:10F83000FBF7BCF84949FBF7EBF9211CFBF7B6F8DD
-:10F840004749FAF741FD211CFBF7B0F88046FC213F
-:10F85000201C8905FBF7AAF84146051C201CFBF774
-:10F86000A5F8391C041C301CFBF7A0F8011C201C57
-:10F87000FBF7CEF9011C281CFBF7CAF9011CFE207E
-:10F880008005FBF7C5F953E0011CFBF78FF82F4902
-:10F89000041CFBF78BF82E49FAF716FD211CFBF729
-:10F8A00085F82C49FBF7B4F9211CFBF77FF82A49AE
-:10F8B000FAF70AFD211CFBF779F82849FBF7A8F9AC
-:10F8C000211CFBF773F82649FAF7FEFC211CFBF715
-:10F8D0006DF8244B80469D42B9DD234B9D422EDCC2
-:10F8E000FF231B069C46FE206544291C8005FBF770
-:10F8F0008FF98146FC21201C8905FBF757F8291C4C
-:10F90000FBF786F94146051C201CFBF74FF8391C14
-:10F91000041C301CFBF74AF8011C201CFBF778F98B
-:10F92000011C281CFBF774F9011C4846FBF770F911
-:10F930000CBC90469946F8BDFE208005F8E70B4BBD
-:10F940000B4D9946D6E7C046FFFFFF314ED747AD76
-:10F95000F6740F317CF29334010DD037610BB63A57
-:10F96000ABAA2A3D9999993E0000483F0000383FD4
-:10F970000000903EF0B54E464546DE465746E0B59F
-:10F98000DDB00B916699039007931800CB4B89006B
-:10F99000CE580723D11E441EC81703405B18D91048
-:10F9A000CB43DB1719404B1CDB00D31A059601949F
-:10F9B000099104930D1B371919D4679A7F19904642
-:10F9C000AB0001379844002620AC08E04346985924
-:10F9D000FBF718FB0135A0510436BD4207D0002DBE
-:10F9E000F4DA00200135A0510436BD42F7D1059B61
-:10F9F000002B00DA24E3059B039901339B00994611
-:10FA0000079B9A00944600920022904648AA93468B
-:10FA1000F4225242614492460F005CAB63449A4424
-:10FA2000019B0026002B0FDB55460026039C454416
-:10FA3000296801CCFAF7BAFF011C301CFAF744FC24
-:10FA4000043D061CBC42F3D15B4642469E50042353
-:10FA50009C46E044C845E3D10CA904228C4652429E
-:10FA600062449446059DAB009C4462468C460892D5
-:10FA7000039A083B634494460A93009B63449A4666
-:10FA80005A46AB000093D658002D26DD8C4BA84675
-:10FA9000EC1847AB99460CAB1D00A4005C44EE216A
-:10FAA000301C8905FAF782FFFBF78CFAFBF7AAFAFC
-:10FAB0008721C905071CFAF779FF011C301CFBF7E9
-:10FAC000A7F8FBF77FFA216801C5381CFAF7FCFBA1
-:10FAD000043C061C4C45E2D14546049F301C3900CD
-:10FAE000FDF714FCF8218905041CFAF75FFFFDF708
-:10FAF00003FB8221C905FAF759FF011C201CFBF703
-:10FB000087F8061CFBF75EFA0400FBF77BFA011C82
-:10FB1000301CFBF77DF8061C002F00DCC4E06A1ED9
-:10FB200092000CAB9B5808201900C01B01416418BF
-:10FB300081405B1A0CA98B500722D21B13419846B7
-:10FB40004346002B29DD0134002D00DCF0E10C9F41
-:10FB50000123002F00D08EE0012D08D099000CAABF
-:10FB600057580133002F00D086E09D42F6D1049B08
-:10FB7000002B0EDD012B00D1FCE0022B09D16B1E06
-:10FB80009B000CAAD25802923F2202990A400CA96B
-:10FB9000CA504346022B00D1D6E00021301CFAF7B0
-:10FBA0006BFA002800D19DE0059B691E8B420FDC9B
-:10FBB0000CAA94460022424B0898EB189B00634421
-:10FBC0001E68043B32438342FAD1002A00D0DCE0B5
-:10FBD000059B0CAA013B9B00D358002B00D0C7E02B
-:10FBE00001220A9B043B596801320029FAD05219BC
-:10FBF0006B1C069293423ADC531B9B000293099BB9
-:10FC000000275B199B009946079B9C4620AB9846B2
-:10FC10006544AD00A844679A4B469446DB1963449B
-:10FC20005868FBF7EFF94346D851019B002B20DBC6
-:10FC30004346DD193B00039C574600269A4600E0E8
-:10FC4000286802CCFAF7B2FE011C301CFAF73CFB24
-:10FC5000043D061CA742F3D15346BA461F00009B41
-:10FC6000FB185B445E60029B04379F42D3D1069D24
-:10FC700006E70026F3E7002180225200D71B0CAADA
-:10FC800057509D420EDD0CA98C4600999B006144A3
-:10FC9000D25808006344FF2100E01A688A1A04C39E
-:10FCA0008342FAD1012762E7049B002B0AD16B1E25
-:10FCB0009B000CAAD3581B12984641E7E8F50200B6
-:10FCC000FFFFFF3FFC218905FAF7FAF9002800D071
-:10FCD00021E100230021301C9846FAF7CDF90028D5
-:10FCE00000D061E74346049F301C7942029403939D
-:10FCF000FDF70CFB8721C905041CFAF7E1F9002880
-:10FD000000D17EE1EE21201C8905FAF74FFEFBF7BA
-:10FD100059F9FBF777F98721C905061CFAF746FE62
-:10FD2000011C201CFAF774FFFBF74CF9009A0CAB8E
-:10FD3000985008376B1C301C9D0001930497FBF70B
-:10FD400041F90CAB58513CE0FE20311C8005FAF71C
-:10FD50005FFF061C002F00D11FE7FE2004998005DD
-:10FD6000FDF7D4FA011C301CFAF752FF061C14E709
-:10FD700001223CE76B1E9B000CAAD25802927F2204
-:10FD800002990A400CA9CA5003E74346049A039318
-:10FD90000CA88B00C358083A029401910492002BDE
-:10FDA0000FD1B1480B0084460CA8634484469B00E5
-:10FDB0006344043B58680139083A0028F9D004929A
-:10FDC0000191FE2004998005FDF7A0FA019B061C15
-:10FDD000002B00DA3AE19B001D005C4604930CAB5B
-:10FDE0005859FBF70FF9311CFAF7E0FDEE2160518D
-:10FDF0008905301CFAF7DAFD043D061C2B1DEED1F7
-:10FE0000A346049B994D5B449846019B01339B4656
-:10FE100000239A4634AB99465B460093059B9B466C
-:10FE20005B460027002B14DB0026914800270024A6
-:10FE300003E0043654450CDC705943469959FAF7EF
-:10FE4000B5FD011C381CFAF73FFA0134071CA34525
-:10FE5000EFDA53464A469B00D75001239C46053BA8
-:10FE6000E2449C46009BE0445345D9D1669B022B5B
-:10FE700062DC002B1EDC13D1049B00204B441D00D0
-:10FE800033AC2968043DFAF71FFAAC42F9D1039B61
-:10FE9000002B03D080231B069C4660440B9B1860FC
-:10FEA0000720029B18405DB03CBC90469946A24694
-:10FEB000AB46F0BD019B0020002B0DDB34AB994617
-:10FEC000019B00209B004B441D0033AE2968043D7C
-:10FED000FAF7FAF9AE42F9D1039B002B00D098E073
-:10FEE0000B9B011C18603498FAF792FE019B002BC3
-:10FEF0000EDD34AB01261D00019CB300E95801362C
-:10FF0000FAF7E2F9B442F8DA039B002B00D08DE057
-:10FF10000B9B5860C4E7022301349846002D00DD96
-:10FF200015E6FE20311C8005FAF772FE061C34E649
-:10FF300000271CE634AB9946669B032BB0D1019B8E
-:10FF4000002B00DC8EE0019A93009B464B465946FD
-:10FF500094465B589846444B454663449E00009344
-:10FF600033AB9A464E443768291C381CFAF7ACF973
-:10FF7000041C011C381CFAF74BFE291CFAF7A4F9E3
-:10FF8000043EB0607460251CB245ECD1019B012B8E
-:10FF900068DD4B465A469E58009B4C469B0098464F
-:10FFA000444400E01C002768311C381CFAF78CF927
-:10FFB000051C011C381CFAF72BFE311CFAF784F9DA
-:10FFC000231F606025602E1C9945EBD1464600201A
-:10FFD00004364E443168043EFAF776F9B442F9D15A
-:10FFE0004B460399349A5B68002924D08021090686
-:10FFF0008C460B996244634460440A604B6088609D
-:020000040002F8
-:100000004EE7201CFAF7DEFF009A0CAB98500195E2
-:10001000D7E680230B9A1B06C3181360011C349883
-:10002000FAF7F6FD019B002B00DD62E780231B063B
-:100030009C4660446CE70B990A604B6088602FE730
-:10004000079B9B00009348AB9B4605E5669B022BF4
-:1000500000DD6FE7002B00DD2CE70020002B00D136
-:1000600015E71DE70020BBE7FFFFFF3FBCF50200DF
-:100070000000C93FF8B54746CE4680B51700334A61
-:100080004300041C0E1C5B08934205DCFAF79AFF40
-:100090000300201C002B46D0211C201CFAF786FCF4
-:1000A000051C011C201CFAF781FC29498046281CEC
-:1000B000FAF77CFC2749FAF7ABFD291CFAF776FC26
-:1000C0002549FAF701F9291CFAF770FC2349FAF7D8
-:1000D0009FFD291CFAF76AFC2149FAF7F5F88146D9
-:1000E000002F24D0FC21301C8905FAF75FFC49461B
-:1000F000071C4046FAF75AFC011C381CFAF788FD29
-:10010000291CFAF753FC311CFAF782FD1549051C2E
-:100110004046FAF74BFC011C281CFAF7D5F8011CE5
-:10012000201CFAF775FD0CBC90469946F8BD011CE1
-:10013000281CFAF73BFC0B49FAF76AFD4146FAF72F
-:1001400035FC211CFAF7C0F8EDE7C046FFFFFF3190
-:10015000D3C92E2F342FD7321BEF3836010D50392B
-:100160008988083CABAA2A3EF0B5DE4657464E4683
-:100170004546E0B58A4B460083B0041C884692464B
-:10018000834676089E4212DCFAF71CFF002828D12D
-:10019000534601331E4300D1F5E05346012B00D1F5
-:1001A000FBE0211C7F48FAF729FA051CB5E07E4BDD
-:1001B0009E4216DD002805DA80231B069C46434438
-:1001C00098466444211C7948FAF722FD4146041CF4
-:1001D0007748FAF71DFD211CFAF776F800239846B8
-:1001E000041C211C201CFAF7E1FB011C071CFAF778
-:1001F000DDFB391C051C201CFAF7D8FB6D49814634
-:10020000281CFAF7D3FB6C49FAF75EF8291CFAF7B9
-:10021000CDFB6A49FAF758F8291CFAF7C7FB684979
-:10022000FAF752F8291CFAF7C1FB6649FAF74CF8BD
-:10023000291CFAF7BBFB6449FAF746F8391CFAF7B0
-:10024000B5FB62490190281CFAF7B0FB6049FAF748
-:100250003BF8291CFAF7AAFB5E49FAF735F8291C86
-:10026000FAF7A4FB5C49FAF72FF8291CFAF79EFB72
-:100270005A49FAF729F8291CFAF798FB5849FAF76E
-:1002800023F8011C0198FAF71FF84946FAF78EFB8C
-:100290004146FAF719F8391CFAF788FB4146FAF794
-:1002A00013F85049051C4846FAF780FB291CFAF759
-:1002B0000BF8011C071C201CFAF706F83A4B051C2A
-:1002C0009E4232DC5346012B27D0011C060B3548D9
-:1002D000FAF794F93603211C8046050B301CFAF717
-:1002E00097FC2D03011C381CFAF792FC291CFAF725
-:1002F0005DFB291C041C301CFAF758FBFE21890504
-:10030000F9F7E2FF011C201CF9F7DEFF4146FAF77E
-:100310004DFB291CF9F7D8FF051C281C03B03CBC79
-:1003200090469946A246AB46F0BD5046FAF76AFEA3
-:10033000291C061C281CFAF739FB311C8046281C96
-:10034000F9F7C2FF011C4046FAF758F9391CFAF7D1
-:100350005FFC011C201CFAF75BFC011CF9F7B4FFE1
-:10036000011C301CFAF754FC5B46041C981702234E
-:100370001840013B181AFAF745FE011C201CFAF739
-:1003800015FB051CC9E7201CFCF7B2FE011CFE2072
-:100390008005FAF733F9051CBFE7251CBDE7C04609
-:1003A000FFFF7F31000080BF3FA12C3FDA0F493FA4
-:1003B000682122338453D9377AC09538B9378139C7
-:1003C00048DEBE3A1F37113CD10D5D3D5FAE9BB795
-:1003D00045F4A338C8261A3A16696B3BA427B33CE8
-:1003E0008988083EABAAAA3EF8B54E465746454610
-:1003F000DE46A04BE0B54E0080468A468946760828
-:100400009E420CDD9C4B9E4200DDA2E000D19DE0AF
-:100410004B46002B00DCE0E0984B994AA1E0994B59
-:100420009E4200DDB3E0984B9E4200DCA1E0012338
-:100430005B429B464246534640465146FBF792FD7F
-:1004400002000B0006000F00FBF78CFD04000D00FE
-:100450008E4A8F4BFBF786FD8E4A8F4BFAF75CFE78
-:1004600022002B00FBF77EFD8C4A8D4BFAF754FEE1
-:1004700022002B00FBF776FD8A4A8B4BFAF74CFEE5
-:1004800022002B00FBF76EFD884A894BFAF744FEE9
-:1004900022002B00FBF766FD864A874BFAF73CFEED
-:1004A00032003B00FBF75EFD844A06000F00844BE0
-:1004B00020002900FBF756FD824A834BFBF7C4FF5F
-:1004C00022002B00FBF74EFD804A814BFBF7BCFF5F
-:1004D00022002B00FBF746FD7E4A7F4BFBF7B4FF63
-:1004E00022002B00FBF73EFD7C4A7D4BFBF7ACFF67
-:1004F00022002B00FBF736FD02000B003000390014
-:10050000FAF70AFE53464246FBF72CFD5B460133E1
-:1005100066D05B46734A744CDB00E418D3181A6843
-:100520005B68FBF791FF42465346FBF78DFF0200E5
-:100530000B0020686168FBF787FF030048460A004C
-:1005400000280EDA802212068A180AE0002800D15C
-:100550005EE74246534640465146FAF7DDFD03004A
-:100560000A00180011003CBC90469946A246AB46D2
-:10057000F8BD5E4A5E4BFAF7CFFD00225D4BF9F7FE
-:100580005BFD002800D152E743465246E9E700F000
-:10059000BFF8594B04000D009E422ADC574B9E4287
-:1005A00050DC02000B00FAF7B7FD0022514BFBF7BD
-:1005B0004BFF802306000F000022DB0520002900EE
-:1005C000FAF7AAFD0B00020039003000FBF7C0F873
-:1005D000002380468A469B462CE7284B484AC0E7C2
-:1005E00002000B0040465146FBF72EFF03000A00B5
-:1005F000B7E7444B9E421ADC0022434BFBF724FF33
-:10060000002206000F00404B20002900FBF7AAFC47
-:100610000022384BFAF780FD0B0002003900300051
-:10062000FBF796F8022380468A469B4602E70B00BA
-:10063000020036490020FBF78BF8032380468A46E8
-:100640009B46F7E600222B4BFBF7FEFE002206003E
-:100650000F00284B20002900FAF75EFD0B00020076
-:1006600039003000FBF774F8012380468A469B4628
-:10067000E0E6C046FFFF0F440000F07F182D445411
-:10068000FB21F93FFFFFDB3FFFFF1F3E11DA22E3B3
-:100690003AAD903FEB0D76244B7BA93F513DD0A066
-:1006A000660DB13F6E204CC5CD45B73FFF8300922C
-:1006B0002449C23F0D5555555555D53F2F6C6A2CD1
-:1006C00044B4A2BF9AFDDE522DDEAD3F6D9A74AFE9
-:1006D000F2B0B33F711623FEC671BC3FC4EB9899CC
-:1006E0009999C93FC88F0200A88F02009C750088A5
-:1006F0003CE4377E0000F03FFFFFF23FFFFFE53FA5
-:10070000FB21F9BFFF7F03400000F83F0000F0BF6E
-:1007100049004B081900704700207047002001492C
-:100720007047C0460000F87F4000C90FC907400865
-:100730000843704743000020024A5B089A42404148
-:100740007047C046FFFF7F7F004870470000C07FB2
-:1007500010B5040004481300002804D00A00022049
-:10076000210002F050F810BD07280200014B186864
-:100770007047C0466C000020084B10B50400002BE9
-:1007800002D0002100E000BF054B1868836A002BEF
-:1007900000D09847200008F059F8C046000000003B
-:1007A00054F60200002310B5040003604360836028
-:1007B00081814366C281036143618361190008221C
-:1007C0005C3008F0E5FA054B24626362044BA362D7
-:1007D000044BE362044B236310BDC046690A020068
-:1007E000910A0200C90A0200FD8D020010B50249FB
-:1007F00008F077FA10BDC046ED0D0200836913B50D
-:100800000400002B28D18364C3640365134B144A8E
-:100810001B6882620193984201D101238361200009
-:1008200000F020F86060200000F01CF8A0602000BC
-:1008300000F018F80022E06004216068FFF7B2FFC2
-:1008400001220921A068FFF7ADFF02221221E06812
-:10085000FFF7A8FF0123A36113BDC04654F60200B1
-:10086000ED070200F8B51C4B07001E68B369002BAA
-:1008700002D13000FFF7C2FF4836B4687368013B0D
-:1008800004D53368002B07D03668F6E70C22A55E46
-:10089000002D0DD06834F2E70421380008F00BFA7F
-:1008A00030600028F0D10C2304003B602000F8BD2C
-:1008B00020000A4B656625606560A560E3602561E0
-:1008C0006561A561082229005C3008F061FA656362
-:1008D000A563A564E564E9E754F602000100FFFFA3
-:1008E00070B500260C4D0D4C641BA410A64209D116
-:1008F000002608F04DFB0A4D0A4C641BA410A642CA
-:1009000005D170BDB300EB5898470136EEE7B30050
-:10091000EB5898470136F2E7F0000020F000002085
-:10092000F0000020100100200FB40B4B13B51C6821
-:10093000002C05D0A369002B02D12000FFF75EFF39
-:1009400005AB049AA1682000019300F0FBFA16BCE5
-:1009500008BC04B01847C0466C00002070B5050004
-:100960000E00002804D08369002B01D1FFF746FF59
-:10097000AB69AC68002B02D12800FFF73FFF244B86
-:100980009C420FD16C68A3891B0702D52369002BF9
-:100990001FD12100280000F017F9002819D00120EC
-:1009A000404270BD1B4B9C4201D1AC68EBE71A4B37
-:1009B0009C42E8D1EC68E6E70136A360002B04DA3C
-:1009C000A2699A4216DC0A2914D023685A1C2260B4
-:1009D0001970A3683178013B0029EDD1A360002B89
-:1009E0000FDA22000A31280000F084F8431CD6D028
-:1009F0000A20D6E72200280000F07CF8431CE8D14A
-:100A0000CDE70A2023685A1C22601870C9E7C04647
-:100A100014F6020034F60200F4F5020010B5034BA0
-:100A200001001868FFF79AFF10BDC0466C00002057
-:100A300010B5034B0100186808F0B2F910BDC046AC
-:100A40006C000020002370B5064C05000800110062
-:100A5000236000F0F1FC431C03D12368002B00D07D
-:100A60002B6070BDDC2F002070B50C000E25495F97
-:100A700000F086FC002803DB636D1B18636570BD06
-:100A8000A389024A1340A381F9E7C046FFEFFFFFA5
-:100A9000F8B51F008B8905000C001600DB0505D595
-:100AA0000E23C95E0022022300F0CCF9A389054A77
-:100AB00028001340A38132000E23E15E3B0000F0CA
-:100AC0006FF8F8BDFFEFFFFF70B50C000E25495F12
-:100AD00000F0B8F9A389421C03D1054A1340A38151
-:100AE00070BD802252011343A3816065F8E7C046C0
-:100AF000FFEFFFFFF8B505000E001400002804D03A
-:100B00008369002B01D1FFF779FE224B9C422DD146
-:100B10006C68A369A360A3891B0731D52369002BE7
-:100B20002ED023682269F7B2981A6369F6B283421D
-:100B300005DC2100280000F059F9002826D1A3681F
-:100B40000130013BA36023685A1C22601F70636957
-:100B5000834204D0A389DB071AD50A2E18D12100BD
-:100B6000280000F043F9002812D00FE00A4B9C4205
-:100B700001D1AC68CDE7094B9C42CAD1EC68C8E70B
-:100B80002100280000F020F80028CAD00126764273
-:100B90003000F8BD14F6020034F60200F4F502004D
-:100BA00070B50500080011000022064C22601A00F2
-:100BB000F8F798F8431C03D12368002B00D02B6072
-:100BC00070BDC046DC2F0020364B70B51D68060096
-:100BD0000C00002D05D0AB69002B02D12800FFF7D7
-:100BE0000DFE314B9C420FD16C680C23E25E93B238
-:100BF00019072DD4D90611D40923012033603733C6
-:100C00001343A381404270BD284B9C4201D1AC6884
-:100C1000EBE7274B9C42E8D1EC68E6E75B0713D58E
-:100C2000616B002908D023004433994202D0300080
-:100C300007F091FB002363632422A3899343A381DC
-:100C400000236360236923600823A2891343A381DF
-:100C50002369002B0BD1A0218022A3898900920057
-:100C60000B40934203D02100300000F027F901230C
-:100C7000A289134011D00023A36063695B42A36182
-:100C8000002023698342BED10C23E25E1306BAD54D
-:100C900040231343A3810138B5E7920700D4636969
-:100CA000A360EDE76C00002014F6020034F60200A9
-:100CB000F4F50200002370B5064C0500080023601F
-:100CC000F7F7FAFF431C03D12368002B00D02B60F9
-:100CD00070BDC046DC2F0020F7B58A8905000C00E6
-:100CE000130760D44B68002B04DC0B6C002B01DC79
-:100CF0000020FEBDE76A002FFAD000232E682B608B
-:100D000080235B01216A1A4034D0606DA3895B07A0
-:100D100006D56368C01A636B002B01D0236CC01A20
-:100D20000200216A00232800E76AB847A189431C12
-:100D300006D12B681D2B30D82B4ADA40D3072CD58F
-:100D40000023636023692360CB0405D5431C02D1D3
-:100D50002B68002B00D16065616B2E600029C7D025
-:100D600023004433994202D0280007F0F4FA00200F
-:100D70006063BEE701232800B847431CC6D12B6837
-:100D8000002BC3D01D2B01D0162B01D12E60AFE755
-:100D90004023A2891343A381ABE740230B430120E7
-:100DA000A3814042A5E70F69002FA1D00B680F6017
-:100DB000DB1B01930023920700D14B69A360019BC9
-:100DC000002B00DC94E7019B3A00216A2800A66A08
-:100DD000B047002803DC4023A2891343DFE7019BCF
-:100DE0003F181B1A0193EAE7010040200B6970B518
-:100DF00005000C00002B01D1002070BD002804D09C
-:100E00008369002B01D1FFF7F9FC0B4B9C4209D100
-:100E10006C680C22A35E002BEED021002800FFF7A7
-:100E20005BFFEAE7054B9C4201D1AC68F1E7044B5C
-:100E30009C42EED1EC68ECE714F6020034F60200B6
-:100E4000F4F5020070B50500080011000022064C00
-:100E500022601A00F7F7A8FF431C03D12368002B78
-:100E600000D02B6070BDC046DC2F002070B50E0096
-:100E70001D000E23C95E96B01400002907DA002376
-:100E80002B60B3891B0611D48023DB000FE06A4678
-:100E900000F08AFA0028F2DBF022019B12021340D4
-:100EA000054A9B185A4253412B60EDE7402300202E
-:100EB000236016B070BDC04600E0FFFFF7B5022604
-:100EC0008B8905000C00334206D023004733236092
-:100ED000236101236361F7BD01AB6A46FFF7C6FFDB
-:100EE00000990700280007F031FA002808D10C22E9
-:100EF000A35E9A05EFD4032293431E43A681E4E741
-:100F00000F4BAB628023A28920601343A381009B17
-:100F100020616361019B002B0DD00E23E15E280050
-:100F200000F054FA002806D00322A38993431A0044
-:100F300001231343A381A0893843A081CBE7C04696
-:100F4000ED070200F0B5A1B003900F0016001D00E0
-:100F5000002805D083690593002B01D1FFF74EFCD3
-:100F60007B4B9F425CD1039B5F68BB891B0763D5AA
-:100F70003B69002B60D0002308AC636120336376AB
-:100F80001033A376079535002B78002B01D0252B45
-:100F90005CD1AB1B05930CD032003900039807F0ED
-:100FA00078FF431C00D1C4E06269059B944663440A
-:100FB00063612B78002B00D1BBE001220023524259
-:100FC000626004A9543252186E1C2360E360A3606F
-:100FD0001370A365317805225E4807F0A3FE751CE7
-:100FE000002835D12268D30604D5532304A95B1801
-:100FF00020211970130704D5532304A95B182B2152
-:10100000197033782A2B2CD0350000210A20E36890
-:101010002A786E1C303A092A64D900292ED026E09D
-:101020004D4B9F4202D1039B9F689EE74B4B9F42D3
-:101030009BD1039BDF6898E739000398FFF7C4FD55
-:10104000002898D00120404221B0F0BD01359BE737
-:10105000404B2268C01A01238340134323602E00B3
-:10106000B8E7079B191D1B680791002B01DB0B9349
-:1010700004E05B42E3600223134323602B782E2BB2
-:101080000AD16B782A2B35D1079B02351A1D1B68B4
-:101090000792002B2BDB0993314E29780322300075
-:1010A00007F040FE002806D04023801B83402268C2
-:1010B000013513432360297806222A486E1C2176C5
-:1010C00007F030FE00283AD0274B002B25D107220D
-:1010D000079B07339343083307936369049A9B186C
-:1010E000636150E7434301219B18350090E70123DA
-:1010F0005B42D0E700230A201A000135636029789B
-:101100006E1C3039092903D9002BC5D00992C3E7D9
-:101110004243012352183500F1E707AB00933A0030
-:10112000124B2100039800E000BF0490049B0133A0
-:10113000D3D1BB895B0600D584E70D9884E707AB64
-:1011400000933A00094B2100039800F011F8ECE7F6
-:1011500014F602002587030034F60200F4F50200BD
-:101160002B8703002F87030000000000938E0200EE
-:10117000F0B589B004920A004332059303900292BD
-:101180000A7E0C000E9B6E2A00D186E01FD8632ACF
-:1011900033D008D8002A00D18CE0582A4DD0250041
-:1011A00042352A7030E0642A01D0692AF7D11968E3
-:1011B00025680A1D280629D508681A60002803DA60
-:1011C0002D23029A404213706B4E0A274FE0732A78
-:1011D00074D008D86F2A1FD0702AE0D12022096865
-:1011E0000A43226003E0752A16D0782AD7D122005C
-:1011F000782145321170614E22E025001A6842358F
-:10120000111D196013682B70012365E008681A60CE
-:101210006906D3D500B2D1E719682568081D1860A2
-:1012200008682E0605D5544E08276F2A1BD00A27BA
-:1012300019E06D06F7D580B2F5E745314E4E0A70DC
-:1012400018682268011D00681960150621D5D307AA
-:1012500002D520231A4322601027002803D120231F
-:1012600022689A4322602300002243331A70636885
-:10127000A360002B58DB04222168914321600028E1
-:1012800054D1029D002B5AD02500337842352B7063
-:1012900055E05506DBD580B2D9E71A680D68101DF8
-:1012A0004969186013682E0601D5196002E06D06C1
-:1012B000FBD519800023029D23614FE01A68111DA0
-:1012C0001960156800216268280007F02BFD0028CE
-:1012D00001D0401B6060636823610023029A137091
-:1012E0003CE023692A0004990398059DA847431C04
-:1012F0003ED023689B0715D4079BE068984239DAF3
-:10130000180037E022000123193204990398059E42
-:10131000B047431C2CD00135E368079A9B1AAB42B7
-:10132000F0DCE9E70025F7E70028ADD0029D3900A1
-:10133000F8F768FD735C013D2B700028F7D1082F8A
-:1013400009D12368DB0706D563682269934202DC72
-:101350003023013D2B70029B5B1B2361059B07AA79
-:1013600000932100049B039807F0A5FD431CB8D10E
-:101370000120404209B0F0BD3687030047870300D3
-:1013800070B50500080011000022064C22601A000A
-:10139000F7F7D2FC431C03D12368002B00D02B604D
-:1013A00070BDC046DC2F0020002370B5064C050040
-:1013B00008001100236007F02CFA431C03D12368B6
-:1013C000002B00D02B6070BDDC2F0020002370B5F7
-:1013D000064C050008002360F7F7D2FC431C03D13C
-:1013E0002368002B00D02B6070BDC046DC2F00208E
-:1013F00070B50C4E0D031C0349005B002D0B490D0D
-:10140000240B5B0DB14208D0064900208B4203D16A
-:1014100014432000441EA04170BD05430120002D4F
-:10142000FAD1F1E7FF07000058220120014B4042AA
-:101430001A607047DC2F002058220120014B4042E7
-:101440001A607047DC2F0020C26810B50300002A24
-:1014500005DD41688068814208DB002010BD002066
-:101460008242FBD059689C68A142F7DD012059688F
-:101470004C00521820435A60F0E783684268C16804
-:101480009B1A5B1810B5581C002900DD581EF8F790
-:10149000BDFCC343DB17184010BD70B50500080044
-:1014A0000021EBF763FB04002000EBF7C1FB011EFA
-:1014B00000D170BD2B1D0122180001F0D7FFF3E70A
-:1014C00010B50400DEF772FF2368036010BD70B52D
-:1014D0000D00FFF7F5FF04002900FFF7DEFF2000F5
-:1014E00070BD70B505000E00DEF760FF040031002E
-:1014F000DFF710F82B682000236070BDF7B50C688B
-:1015000001900E002000002A0AD0DEF7C1FF01255D
-:10151000019B9D4208D3336820001B682360FEBDF9
-:10152000DEF744FF0400F2E7AB00F058844204D138
-:101530002000DFF709F80135EAE70021EBF716FB99
-:1015400007003800EBF774FB011EF4D02000DEF733
-:10155000BFFFF6E710B50022FFF7D0FF10BD30B592
-:101560008468C36865689900AB4201D3002207E034
-:10157000E26801335258002A04D0042A02D0C36022
-:10158000100030BD0431EFE710B50122DFF770F82D
-:1015900010BD10B50022DFF76BF810BD10B5043098
-:1015A000012201F063FF10BDF7B50C000025060015
-:1015B00011001F00009501232A002000F0F77CFE97
-:1015C000AC4207D121002000DFF736F80400266086
-:1015D0002000FEBD29002800DFF72EF829000400B6
-:1015E0003868EBF7C3FA05002800EBF721FB011E72
-:1015F000EDD02000FFF7D2FFF6E70B0010B5010099
-:1016000000221800DFF770F810BD10B50022DFF7D8
-:101610006BF810BD0239814202D30B88002BF9D040
-:101620000231081A4010704770B51D090024954218
-:1016300017D26C000919541B0F22250013400E8885
-:101640003200012D02D04A8812043243DA40013DB3
-:1016500092B2028002310230002DF0D153425A4141
-:10166000A41A200070BDF0B5059C121B9446002200
-:1016700027001400002F11D1059B5D004219491964
-:1016800016006546002D12D163465B00D218002C6F
-:1016900001D014800232101A4010F0BD8E5A9D5AAB
-:1016A000013F761934198452240C0232E2E70B8888
-:1016B000013D1C1934800231240C0236E2E7F7B5F3
-:1016C0000025089C2E0027000193121B002F0BD130
-:1016D0006400031915001F000919002D0FD15200D5
-:1016E0009918FFF797FFFEBD4B5B013F9C46019B9E
-:1016F00066445B5BF61A465336140235E6E70C88FF
-:10170000013DA6193E80023136140237E5E770B577
-:1017100005000C00022900D20224A868002803D08A
-:101720002B689B08A34209D2610004F0C4FD032387
-:101730002A68A40013401C43A8602C6070BD70B5DB
-:1017400005000C2004F099FD01212B780400DB0733
-:10175000DA0F03788B4313430222934303702B6801
-:1017600021689808032382000B40134323606B68B1
-:101770006360AB68002B02D1A360200070BD400005
-:1017800004F07BFDA0602B68A9689A08520007F05E
-:10179000E3FAF2E710B54B00C018D218002901D1C6
-:1017A000080010BD0238023A038814881B1B02D4BB
-:1017B00004D10139F2E701204042F2E70120F0E7CD
-:1017C00010B5041E05D0806804F086FD200004F0EA
-:1017D00083FD10BD70B505000C000221FFF797FFD7
-:1017E0002B780122002C07DA13432B70644200236C
-:1017F0006B60002C03D170BD93432B70F7E76B68CF
-:101800005A1C6A60AA685B009C52240CF1E7002312
-:10181000036043608360704710B5002805D00378EB
-:101820009B0702D4806804F057FD10BD70B50C0012
-:1018300005004968FFF76BFF01212378A868DB07E3
-:10184000DA0F2B788B4313432B706368A1686B60AE
-:1018500063685A0007F080FA70BD10B5002901D105
-:10186000416010BDFFF7B6FFFBE770B50D00040047
-:10187000FFF7CDFF29002000FFF7EFFF70BD70B527
-:10188000012504788160AC43250002242C430470B8
-:1018900094000322056819002A40224302600022B6
-:1018A0004260FFF7DAFF70BDF8B504001F0006AB19
-:1018B0001D7804211600FFF72AFF23780122002D4E
-:1018C0000CD0002F0ADA1343237000237242BB416D
-:1018D000002161601100194305D1F8BD93432370C5
-:1018E00032003B00F4E761681D04481C6060A0689A
-:1018F00049000A52100C190C05432A000B00E9E7B5
-:10190000F7B50E1C01210378F20F8B431343FF221E
-:101910000370D201330C0700134002D100237B6017
-:10192000F7BD9342FAD07F237400240E5B42E51882
-:10193000F4D4002D02D1FFF74DFFF1E721000F2372
-:101940006F39CA171A405218802176021211760A8E
-:10195000090400920E43162D28DC08335D1BEE406F
-:1019600000252C0000993800FFF7D1FE009B7B601A
-:1019700063000193002C04D01A000021B86807F01E
-:1019800007FA002D08D03300AB40BA68610053520B
-:1019900010235D1BEE400134009B64005B009C4201
-:1019A000BED0BA681653360C0234F8E71D40963C98
-:1019B000E217173D1D4013401C192411D2E7F0B562
-:1019C00004000D001E008B18D100090985B00131FB
-:1019D0000293FFF79CFE23780122002E0DD01343C3
-:1019E00023700023280063600A9B9BB20393029B31
-:1019F000984204D3401B05B0F0BD9343F0E7037851
-:101A00001A00303A092A04D9113A192A18D8373B52
-:101A10001A000A9B9A42EDD26368A7689C463E0072
-:101A200001936346002B11D1019B5B00FB18002A38
-:101A300001D01A800233DF1B7F1067600130D6E7C8
-:101A40001A00613A192AD5D8573BE1E73188039B40
-:101A5000594301238A185B4232809C44120C02369F
-:101A6000DFE7F8B5040015001E000127002902D0A9
-:101A7000531EF618023FE9000F3109092000FFF755
-:101A800046FE012223789343237000236360002DD8
-:101A900008D163685900A36859181800FFF7BAFD08
-:101AA0006060F8BD00200F2B08DC3278013D9A40C1
-:101AB000104380B20833F619002DF4D16168103B51
-:101AC0004A1C6260A26849008852E0E70A00416847
-:101AD00070B50500002903D153680800002B14D00D
-:101AE00013782C78DB07E007DB0FC00F181A0CD136
-:101AF000536899420AD30130994203D89268A86882
-:101B0000FFF748FEE30700D5404270BD0120404288
-:101B1000F8E710B50400884201D0FFF787FE0122E4
-:101B200023789343237010BD10B50400884201D080
-:101B3000FFF77CFE01212278D307DB0FCB1A0B4085
-:101B40008A431343237010BD7FB50400884201D03F
-:101B5000FFF76CFE6268002A0BD101212000FFF71D
-:101B6000D6FD0123A268138022786360134323709B
-:101B70007FBD0E26012523786E442B420AD0A16832
-:101B8000AB4323703580330000950800FFF797FDC5
-:101B90006060EDE7511C2000FFF7B9FDA1683580BA
-:101BA0003300009562680800FFF75DFD23786060F0
-:101BB0001D432570DCE7F0B50D00496887B00400CF
-:101BC0001600002901D0002A05D129002000FFF7C6
-:101BD0002DFE07B0F0BDFFF79AFD3300A9686A68D3
-:101BE000A068FFF721FD6060029001202B78DB07E1
-:101BF000D90F237883430B4323700342E9D00E238C
-:101C0000002102AA9B186A68300919800392039A7E
-:101C10008A4201D0814212D1039A8242D9D9A9685D
-:101C20004000405A01250F210E402900B1400139E2
-:101C3000014200D01D80198800290CD1C9E74A0053
-:101C400094466746AA68BA5A002A10D00121039A1E
-:101C500019808242E3D8029AA0680121002A08D0A4
-:101C60000091029A0100FFF7FEFC6060B1E70131CC
-:101C7000CDE701806160ACE773B553680C0049683B
-:101C800006001500994206D308D89268A068FFF7AD
-:101C900081FD002802DA23002C001D0023782A7819
-:101CA00061685340DB0715D401313000FFF72FFD89
-:101CB0006B68B0680093AB686268A168FFF7D3FCFB
-:101CC000012170602378DB07DA0F33788B431343ED
-:101CD000337073BD3000FFF71AFD6B68B068009376
-:101CE000AB686268A168FFF7EAFCE9E7F7B55368FB
-:101CF0000C00496806001500994208D30027994254
-:101D000009D89268A068FFF745FDB84203DA2300BE
-:101D100001272C001D0023782A7861685340DB07D7
-:101D200019D501313000FFF7F2FC6B68B068009301
-:101D3000AB686268A168FFF796FC706023780121A8
-:101D4000DB07DB0F3278002F01D0CB1A0B408A4320
-:101D500013433370F7BD3000FFF7D9FC6B68B068F0
-:101D60000093AB686268A168FFF7A9FCE5E7F0B5EE
-:101D70004B68160052688BB005000C00934201D2EC
-:101D800034000E000121227863680A4201D13278C2
-:101D90001140C9182800FFF7BAFCA3682178039303
-:101DA000636872680193B368347804930B0000266B
-:101DB0006340A868B446DB0702D4CB07DB0F9C4620
-:101DC000C907CB0F1E000293634607005B429BB21C
-:101DD000E40707937342E40F9BB2089363429BB2FC
-:101DE0000693019B0594591ED31A09934B1C14D1D9
-:101DF000019B590063464118002B02D001230B8040
-:101E00000231FFF707FC0122029B68601C402B781F
-:101E100093431C432C700BB0F0BD039B089A1B88A6
-:101E200053409E19099B069A5B188B4206D8049B67
-:101E30001A88069B5A40049B02330493059B013980
-:101E4000D318079A0593334053409BB263443B80B9
-:101E50001B0C059A9C46039B120C02330592360C10
-:101E600002370393C2E7F0B54B68160052688BB097
-:101E700005000C00934201D234000E0001212278AB
-:101E800063680A4201D132781140C9182800FFF76F
-:101E90003EFCA368217802936368A8680093B36846
-:101EA0007268039301233478194200D12340C90793
-:101EB000C90F0E000191594289B2E407079171429E
-:101EC000E40F89B20891614289B2009F069100999E
-:101ED000D21B05940139049009924A1C0ED1009B33
-:101EE00059004118FFF796FB0122019B68602343CC
-:101EF0002C7894431C432C700BB0F0BD029A089FC1
-:101F000012887A409619099A069F5218BC468A424E
-:101F100006D8039A12885740BC46039A02320392AD
-:101F20003700059A360C624405921743079A013927
-:101F30005740BAB29446049A63441380059A1B0C26
-:101F4000120C0592049A02320492029A0232029210
-:101F5000C3E7F0B54B688BB004000E001500002BF2
-:101F600002D05368002B03D1002363600BB0F0BD97
-:101F7000814237D10800FFF7E2FB06000190A5423D
-:101F800000D1050073686A6820009918FFF7BFFB4D
-:101F9000236800219A085200A06806F0F9FEA368A1
-:101FA0000593B3680599079373680693AB6802932A
-:101FB0006B689C46069B5B0004930023049A0232E4
-:101FC00009926246002A3ED163602B7831782278EC
-:101FD0005940012319423CD19A4322700198FFF7DE
-:101FE000EFFBC3E7002301938242CBD11000FFF740
-:101FF000A6FB05000190C5E71388DB190893038849
-:1020000002301F00029B1B887B43089FDF19039B44
-:102010001780013B3F0C03930232039B002BEBD153
-:10202000049BCB18002F03D0099B049A5B188F5296
-:10203000059A02319B1A012252429444029A5B1083
-:1020400002320292BDE7069B079803930A0000271D
-:10205000E3E713432370C1E7F8B54B6807001500A9
-:10206000002B03D001241378234202D000237B608D
-:10207000F8BD5368002B03D12100FFF7ABFBF7E756
-:102080000800FFF75CFB06002800FFF758FB210063
-:1020900005003800FFF79EFB6B68002B11D0AB6882
-:1020A0001B88234204D0320039003800FFF751FF6B
-:1020B000A96823006A680800FFF7B6FA686000287C
-:1020C00006D13000FFF77CFB2800FFF779FBCFE754
-:1020D000320031003000FFF73CFFDDE781684368E4
-:1020E0000200002010B55B00CB18023B9C1CA142F3
-:1020F00004D31378DB0700D5404210BD1C880004D0
-:102100002043F2E7F0B587B0039104921D00002947
-:1021100001D0049A9D18002482682600009242682B
-:10212000019201220292019A002A26D0009A2404E8
-:102130001188049A10369A180C430592072E06DC73
-:10214000009A02320092019A013A0192EBE70127CC
-:102150000278A1B23A4207D0FF228A431100029AC4
-:10216000891889B20A0A0292039AC9B2002A06D0D3
-:102170006A1E94461170934207D107B0F0BD6A1CE5
-:102180009446059A29709445F7D0083E240A65467E
-:10219000D4E7F8B586684368050000205C00341970
-:1021A000023CA31C9E4206D32B78DB0702D580237A
-:1021B0001B06C018F8BD8F21C905F8F7F7FB071CEF
-:1021C0002088F8F71FFF391CF8F77EF8E8E7F0B52C
-:1021D00089B007930EAB1B780F9F06000691140081
-:1021E0000393381E05D00B00023B1E2B03D90020A1
-:1021F000387009B0F0BD7568002D11D13B00002A80
-:1022000009D130230370002301300370C01BF0E7B5
-:102210001A700134013322781800002AF8D1F0E74F
-:102220006D00280004F029F82A00B168029006F039
-:1022300093FD029B04975B190593079B01973A3B1B
-:1022400007930021059D029B023DAB4212D930311C
-:10225000392901D9079BC918019B5D1C1970029B84
-:10226000059A93420ED3039B002B2BD001231EE033
-:102270000195E6E72888090408430699F7F7C2FDA7
-:102280002880E0E71A88002A0DD10233E8E70138F8
-:1022900002781A7001331FE011781878013B107032
-:1022A0005970013223E0039B002BE1D00023049AF4
-:1022B000AA1A032A04D1019A0399951C5170049516
-:1022C000002BD5D0029804F007F8002C07D020008E
-:1022D00006F0B2FD2B0020181D00A042D7D833789D
-:1022E000DB0702D52D232B7001353A006B1E9A4275
-:1022F000D2D30023E81B2B707BE730B5884213D282
-:102300000378303B092B0FD800230A25136013688C
-:1023100004786B43303C1B1901301360814203D0B9
-:102320000378303B092BF2D930BDF7B51E00009081
-:1023300001920025994215D3CC1A089B2F00AB427D
-:1023400001DD27002C00009B32001D190199280097
-:1023500006F0F3FC002805D0BC4202D0089BE4182C
-:10236000F1E700252800FEBDF8B506001020150095
-:102370000F0003F082FF040006608560002F0FD07D
-:1023800029003800EEF748FB6060681C03F075FF19
-:102390002A00E0603900060006F0DEFC00237355D9
-:1023A0002000F8BD10B500230122DEF7E5FE10BDC8
-:1023B000012210B500235242DEF7DEFE10BD0123DC
-:1023C00010B51A00DEF7D8FE10BD012210B51300BB
-:1023D0005242DEF7D1FE10BD10B50A000100022006
-:1023E000DEF788FF10BD10B50A0001000020DEF7FF
-:1023F00081FF10BD10B50A0001000120DEF77AFF51
-:1024000010BDF0B50C0095B004280AD1C868E0F7FB
-:1024100035FB002802D1206815B0F0BD06900028D9
-:1024200002DA01235B4206932068E0F73FFA0500D9
-:102430006068E0F73BFA0790A84202D06068DEF7D8
-:10244000D3FCA068E0F732FA079B834201D0A06872
-:10245000F5E70DA92068DEF7B5FD0EA909906068C3
-:10246000DEF7B0FD0FA90B90A068DEF7ABFD0E9B69
-:102470000D9A0A9000269342CDD80E9B0D9F002BFB
-:102480005BD1002E04D00F9A0A99300006F064FC4C
-:102490000F9B039301230493099D26E0089F7B4231
-:1024A0005F41059BDB1905935F1B002E05D0039B45
-:1024B0003A00F018290006F04FFC039BDF19002EAC
-:1024C00004D0F0190F9A0A9906F046FC0E9A0F9B59
-:1024D0009446FB180393059B0D9A63441D00099BCA
-:1024E0009F18049B7F1B01330493049B069A93421D
-:1024F0000ED0002F0CD00E9B0B9A089301233900AD
-:1025000000932800089BFFF710FF05900028C5D115
-:10251000002E05D0039B3A00F018290006F01CFCA1
-:10252000039BF918002E0CD1049B002B00D172E7FD
-:1025300010A804F0DDFD129E9FE70023049303938F
-:10254000AAE710A90798DEF7CDFC65E7F0B50D0006
-:1025500089B003A907002800DEF734FD0024060037
-:10256000039904A804F0C4FD069B0193039BA342B6
-:1025700007D82800E0F79AF904A9DEF7B3FC09B000
-:10258000F0BD305DB847019B18550134EEE713B537
-:102590000C00012A09D101A9DEF714FD019B20607E
-:1025A000636042230020A36016BD00230B604B60D4
-:1025B000013B8B600120F7E713B5040001A9806897
-:1025C000DEF700FDE3680199020000208B4205D28E
-:1025D000D25C0130520001331043E36016BD07B5F1
-:1025E00001A9DEF7EFFC0199EEF766FAC3000620B9
-:1025F00018430EBD704710B5E0F758F9406803F076
-:102600009DF910BD10B5830702D003F03DF810BD51
-:10261000002803DB012340001843F8E703F04FF8DC
-:10262000F5E7704770B504000D001600E0F73EF9BD
-:10263000C36A181E06D03200290020009847434282
-:102640005841C0B270BD022803D149000138084387
-:1026500070470020FCE7704710B50C00022103F022
-:102660009FFD002802D00470240A447010BDC36985
-:1026700010B50400002B04D0B02109021943FFF764
-:10268000EBFFBD21A369090219432000FFF7E4FF16
-:1026900010BD70B50D000421140003F081FD002869
-:1026A00005D0057084702D0A240A4570C47070BD71
-:1026B00010B5DB0011431943FFF7CEFF10BD10B575
-:1026C000072A09D8D20007290CD80A438C21C9014E
-:1026D0001143FFF7C1FF10BD13004022083BDB0090
-:1026E0001A43F0E7802308391943EEE7436989006C
-:1026F00070B5CC58E021050043680902E41A043C97
-:1027000023055B0D1943FFF7A7FF2B680120022B60
-:1027100007D1E40AE40204D080231B01E4186042DC
-:10272000604170BDF8B51D0043699200D4584368FC
-:102730000600E41A043C6310002D16D10A02D021D1
-:10274000FF27090211433B401943FFF785FF01238F
-:1027500032681D00022A05D1BC4303D00134FF3486
-:10276000654265411D402800F8BD8020802280011F
-:10277000204012021B0502431B0D1A438B01F0215E
-:10278000802009021943C000A31203402403194307
-:10279000A40E21433000FFF77CFFE4E74369F822F1
-:1027A000890070B5CC58F021050043681202E41A84
-:1027B000043C63109BB21A4363025B0D0902194388
-:1027C000FFF767FF2B680120022B07D1A40DA4059A
-:1027D00004D08023DB03E4186042604170BD10B573
-:1027E000022901D104F05EFD10BD10B5040006F011
-:1027F00023FB01002000E0F765FEFF38431E9841EF
-:10280000400010BDFEE77047F0B585B000AFBB607B
-:102810005B009B185C1C78603960FA60A400042B94
-:1028200020D823006A460E33DB08DB00D31A9D460E
-:1028300000266D4628003B68221F08C0B96A06F0D2
-:102840008BFAF9682B000131BA687868EAF798F8D2
-:102850000400002E02D0300003F03EFD2000BD46F3
-:1028600005B0F0BD200003F015FD051ED9D006000F
-:10287000E0E707B5009313000A0081684068FFF79E
-:10288000C3FF0EBD10B5F3F7CFFC43000120184382
-:1028900010BD8023F0B55B0587B01D69E0F7D4FC5F
-:1028A000037805AFFD2B19D1E0F7CEFC03783B7020
-:1028B000E0F7CAFC0400E0F7D3FC00950290029B0D
-:1028C0009C4218D1200002F0B2F801223900200009
-:1028D000ECF794F8E0F722FD07B0F0BDE0F7C0FC9C
-:1028E00003783B70E0F7BCFC0400E0F7ADFC6B4202
-:1028F00002900093E3E7009B2000E61802F097F8AF
-:10290000200002F094F8802335005B051B69009AD3
-:10291000DB09DB01B21A9B1901920393039B34007C
-:102920009D42CCD02B78002B04D080222900019826
-:10293000ECF764F8019B803580330193EEE770B5C6
-:10294000050006F079FA002301001A002800E0F7DC
-:10295000EDFD041E05D0280002F0B7FF2100E0F7CE
-:102960006DFF70BD002210B511001000E0F784FF6C
-:1029700010BD1FB5022201A9E0F73AFA002201A911
-:102980001000E0F779FF05B000BD70B514680129AB
-:1029900027D9102523000178AB4315D1302920D148
-:1029A00046781039831C3143782902D11560181AF2
-:1029B00070BD002C19D16F2902D167391160F6E77B
-:1029C000622910D16039F9E70300082C0FD13029B2
-:1029D000EDD1202243781A4303006F2AE7D1831CEC
-:1029E000E5E7002C01D10A2313600300DFE7022C86
-:1029F000DDD13029DBD1202243781A430300622A3B
-:102A0000D5D1ECE713B504004068EAF711F90028C6
-:102A10000BD0A3680190591CA16001215B000B43FE
-:102A2000022069460093E3F725FE16BDF8B50700BE
-:102A30000C201D000E0003F020FC076004000021A4
-:102A40002868EAF793F860600020012E02D96868D0
-:102A5000E0F714F8A0602000F8BD10B5102003F0D6
-:102A60001EFC0722037893431A00012313430370CB
-:102A700010BD70B50400237808005B07150061687D
-:102A80005B0F052B0BD12368E268D802400DF2F7EB
-:102A9000EDFF23889B0601D5EEF720FE70BD0A00EE
-:102AA000A3682900F2F7B4FFF3E770B50C008021AA
-:102AB0004900214015000A1E01D06A682968FFF705
-:102AC000D8FF0223E2091A409A40E1B2AA18EEF7B1
-:102AD000FBFA70BD70B5038C046B032B03D100238C
-:102AE000C56A9D4205D18B00E25003F065FB0120D1
-:102AF00070BD9E00A659964201D00133F1E7002037
-:102B0000F6E710B50400FFF7B2FD2000FFF7A3FDC4
-:102B100010BD8BB270B505000C0003844262032B1C
-:102B200005D1C36A00219A00006B06F031F9043C1C
-:102B3000614261412800013103F019FB28000021A6
-:102B4000E0F762F970BD70B5060034200D0003F0A7
-:102B500094FB04002022002106F01AF9290020002D
-:102B600003F0F2FAA662E562A80003F086FB206398
-:102B7000200070BD10B50400006B03F0ADFB002118
-:102B8000200003F0E9FA200003F0A6FB10BD10B509
-:102B90004368984710BDF8208023800202785B05C7
-:102BA0001B694D2A01D1C01A70478020C002FAE784
-:102BB00030B5010003687F2500201A78C001140099
-:102BC00052B22C4020430133002AF6DB0B6030BDAB
-:102BD00007B5019001A8FFF7EBFF0EBD0023C35618
-:102BE0000130002BFADB704710B5E2F7D9F8E6F7B1
-:102BF00099FDE2F713F90028F9DB10BD73B5050064
-:102C000001A98068DEF7DEF9EB68019A0400002074
-:102C100093420CD2E418200000F034FB061B310074
-:102C200001222000DEF794F9EB689E19EE6076BD74
-:102C3000836870B55D1C040085604068E0F790F81B
-:102C4000DFF71CFF854201DB0023A3600121A3689D
-:102C500004225B0019436068E0F798F870BD4123D7
-:102C6000012800D0002318007047202304304B6057
-:102C7000423308608B6000207047A0210378020077
-:102C80000020C133FF33C9059B00585001231800B1
-:102C90000138C046C046C046C046C046C046C046D1
-:102CA000C046C046C046C046C046F1D1A220C000C2
-:102CB00008581278D0401840704710B50120E2F74C
-:102CC000BBFD10BD022310B584171C40013B1C1B2B
-:102CD000802342021B04520AC0151A43C3B2963B1A
-:102CE0005918002903DD8A402000504310BD0B0015
-:102CF00000201F33FADB49420A41F5E707B5080017
-:102D00001100002200921300EFF7D6FAE2F758FF05
-:102D10000EBD10B50021E9F729FF10BD3E2307B510
-:102D200000220190694602200093DFF7E9FB0EBD07
-:102D300010B50A0001000C20EAF750FB10BD10B5D9
-:102D4000020036210A20EAF749FB10BD10B5020047
-:102D50002E210A20EAF742FB10BD30B5012485B0D0
-:102D60000B00A04200D04C6869461868E9F7FEFEE7
-:102D700005002800E9F75CFF021E02D1200005B023
-:102D800030BD21000520EAF729FB0400F1E710B56A
-:102D900001000220E9F782FD10BD10B51A23E3F708
-:102DA0003DF910BD10B51923E3F738F910BD10B582
-:102DB0008468C3686168020000208B4204D2991CB9
-:102DC000890001330859D36010BD10B50C680200AA
-:102DD00020000B0008306168EEF70EFE10BD030006
-:102DE00010B50A000830596802F053FF10BD43685F
-:102DF00008300B601060704710B503F06DFA10BD1D
-:102E0000FC30C16002617047002370B504001D00F2
-:102E10007F26AA00A218FF32517C7F2906D10233F7
-:102E20009B0019552000EDF711FC70BD0135EDB286
-:102E30007E2907D102339B001E552000EDF706FCCA
-:102E40000023E6E70029E4D0980020180172917C65
-:102E500001334172D17CDBB28172127DC272D8E73C
-:102E600010B5E5F7F9FF03680620DB00184310BD35
-:102E700010B5EAF7FBFD02F007FC10BD10B5E4F752
-:102E8000D5FA407910BD4368F7B50500980003F006
-:102E9000F4F9002607006968B14205D83B0000221A
-:102EA000A868E9F76DFD0BE0B3000193EB18D86853
-:102EB000E9F7BEFE041E04D1380003F00DFA20002D
-:102EC000FEBDB300F8500136E5E710B5002204005E
-:102ED000A05C8B5C002808D158425841012318405F
-:102EE00010BD98420AD10132F2E7002BF9D1E5F783
-:102EF000D7FB030001205840C0B2EFE70020EFE706
-:102F000070B50500080004F030F9FFF718FD040063
-:102F1000280000F06FFA0121020003002000EAF708
-:102F20000DFA70BD07B5F4216A46FF31E9F7A0FD3F
-:102F30000098431E9841C0B20EBD10B50222E4F7BE
-:102F40000BFE10BD10B50122E4F706FE10BD13B54F
-:102F500013000C000A1D411E002000902068E4F7B9
-:102F600033FE16BD13B513000C000A1D411E0120CF
-:102F700000902068E4F728FE16BD73B50C0005002C
-:102F800001CC1600E4F7CEFE0023691E0093220058
-:102F90003300E4F719FE76BD73B56B46DE1D3200D3
-:102FA0000D00040000F0B8F833780100002B03D0C6
-:102FB0002A00200000F0DBF873BD37B56B46040033
-:102FC000DD1D2A0000F0A8F82A782378002A06D010
-:102FD000012B02D90223037037BD0023FBE7012B2D
-:102FE000FAD90378002BF7D10233F4E770B5050066
-:102FF0000E00100019001C0000F07EF80378002B72
-:1030000004D1B36821002800984770BD012B01D17D
-:10301000F368F7E74288022B04D1336821002800C7
-:103020009847F2E77368F9E710B50C00F6F7D4FF9C
-:10303000002903DA002C05DC080010BD0029FBD0B4
-:10304000002CF9DA0919F7E710B5002806DB00298A
-:1030500001DACB43C018F6F7D9FE10BD0029FADB20
-:10306000401A0130F7E710B544680C6081681160C0
-:10307000C2681A6010BD10B5DFF764FDFAF70EFAEA
-:10308000E9F77EF910BD10B5DFF75CFDFAF734F80B
-:10309000E9F776F910BD10B5DFF754FDF9F7A0FF99
-:1030A000E9F76EF910BDF7B506004068041E13D0AD
-:1030B0000021E3F7DFFA002504007368AB420BD967
-:1030C000AB000193F3189868E9F7B2FD071E05D12C
-:1030D0002000FFF791FE3C002000FEBDAB00E3188E
-:1030E00098600135E9E710B50400806A03F0F4F850
-:1030F000200003F0F1F810BD30B500230400858CEA
-:103100009D4201D8002030BDA06ADA0080184268D4
-:103110008A42F8D00133F3E770B504000E001500C1
-:10312000FFF7EAFF0023002816D1618CA38C8B42A5
-:1031300008D30631C900A06A03F0BDF8638CA06211
-:1031400006336384A38CA06A5A1CDB00C0180023DA
-:10315000A2840360466001332B7070BD10B54368D4
-:10316000002B02D1FFF7C8FF10BD1800F7E7F7B535
-:1031700044680E001700231E08D10023337004E0BA
-:103180000378022B01D101330370F7BD5D68002D78
-:10319000F3D018003900FFF7AFFF2B000028F5D05F
-:1031A0000378023B022BE8D8042535706B46DE1D00
-:1031B000320039002000FFF7AFFF3378002BDFD05B
-:1031C00005706468F2E710B51300C4680022A047D8
-:1031D00010BD002210B51100FFF7F5FF10BD07B5B7
-:1031E000019101AA0121FFF7EEFF0EBD10B5E5F731
-:1031F00059F910BD10B5DFF759FBE5F799F910BD86
-:1032000070B504000D00FFF7F5FF002803D0200083
-:10321000DFF74CFB040029002000E8F75DFD70BDDE
-:103220008368C268934203D25A1C82601878704740
-:1032300001204042FBE7036810B50400002B02D0D8
-:10324000406803F049F8200003F046F810BD10B5BF
-:1032500003785AB2002A0BDA7F2213403F3A1A420F
-:1032600008D13F210130027814008C43802C04D017
-:10327000180010BD93435208F1E79B010A4001304A
-:103280001343F0E73F22013003789343802B00D0B3
-:1032900070470130F8E730B500223F24814201D861
-:1032A000100030BD01390B78A343803B5D1EAB415C
-:1032B000D218F3E730B5020041183F2400208A42BB
-:1032C00000D330BD13780132A343803B5D1EAB4178
-:1032D000C018F4E710B50400E5F7F2F9002800D0B3
-:1032E0002034200010BD10B50400E5F7F5F90028E2
-:1032F00000D0203C200010BD3038092802D92023FE
-:10330000984307387047F0B5070085B00E00006895
-:103310000968FAF753FA3B683568011C041C181C4D
-:103320000293F7F775FC291CF7F768F90021019063
-:10333000201CF6F7A1FE002817D00024002D01DA8A
-:103340008024240600210198F6F796FE002833D049
-:10335000291C0298F7F752F90025002801DA802588
-:103360002D063D60346005B0F0BD01236A460021A2
-:103370009373201CF6F786FE002801D16B469873E4
-:1033800001236A460021D373281CF6F77BFE002830
-:1033900001D16B46D8736B469A7BDB7B9A42D1D0C6
-:1033A000291C201CF6F790FFFE21041C89050198BA
-:1033B000F7F72EFC0190C5E70198F9F79DFE011C77
-:1033C000051C0198F7F724FCFC218905F6F76EFE31
-:1033D0000028C6D0FE21281C8905F6F775FF051CBC
-:1033E000BFE7FF23DB05C918032310B59943E5F7B1
-:1033F00041FA10BD4068704710B5040041600029D3
-:1034000003D181600123236010BDC80002F047FF93
-:10341000A060F7E7CB004160072110B50468826027
-:1034200021401943072301601943017010BD03783F
-:1034300010B504009B0702D4806802F04DFF0722FC
-:10344000236800211A400123226013430222934380
-:1034500061602370A16010BD002310B504000160FD
-:103460004360880002F01BFFA06010BDF0B5036848
-:1034700087B004000E000292002B04D11300DB077A
-:1034800061D5E5F7B9FC31000220E9F707FA4310EE
-:10349000180021680593F6F7B5FC00270391039BFC
-:1034A0000193019B9B000493049AA3689B181D68D9
-:1034B000002D0BD1029AD20745D5002F00D03B003A
-:1034C0006268013262601E60350031E0042D16D161
-:1034D000002F00D11F00019821680130F6F792FCFF
-:1034E000039B01918B42DCD10122029B13422AD023
-:1034F000002F22D063689B1863603E60E4E73100D0
-:103500002800DFF769FA0028E5D0029B9B070FD55A
-:1035100063680198013B6360A768049B01302168E0
-:10352000FE18F6F76FFC8900CB59002B03D13360EE
-:10353000280007B0F0BD0423F9E72000E5F75CFCA4
-:1035400021680598A7E70025F2E7002370B5016818
-:10355000994201D1002513E086689C003419256842
-:103560000133002DF4D0042DF2D04268013A4260BC
-:103570001800F6F747FC89008B59002B02D1236015
-:10358000280070BD0423FAE710B50400806802F03B
-:10359000A3FE002323606360A36010BD704710B5D5
-:1035A0004079EAF7F1FA10BD13B5040008001100E4
-:1035B000002200921300EEF77FFE042002F05DFE71
-:1035C000046016BD70B504000D0000220179402092
-:1035D000F1F79CF8E3682B60A3685843686023798F
-:1035E0000020AB6070BD416870B5C2688C68030094
-:1035F0000020A24207D29C68551C08791219C9689C
-:10360000DD60F1F7EBF870BD73B50E0000251C000E
-:1036100011000223012230000095EEF74DFE2068D4
-:10362000DEF7D8F80078012E03D12900E5F7E8FD90
-:1036300076BD6168E5F7A4FEFAE7F7B51D00002640
-:10364000022307000096080011001A00EEF734FE6E
-:103650000C2002F012FE07602B680400436031006A
-:103660006868E9F783FAA0602000FEBD10B5040089
-:10367000E6F702F82000602105F0F5FA200010BD01
-:1036800010B5040005F0D8FB01002000E6F762F851
-:1036900010BD10B505F0C1F910BDD0B5041E0FD096
-:1036A000F2F7C2FD06000F00F2F7BEFD801BB94124
-:1036B000002905D1844203D9F1F7C8FF30BFF3E7F1
-:1036C000D0BD10B5F6F758FA10BD10B5F2F7ACFD45
-:1036D00010BD10B501242300884202D00278534265
-:1036E00053412340180010BD037842780A3B1B0267
-:1036F000134302300B607047838BC26A01339BB265
-:103700008383118C994200D21384704770B50500F1
-:103710000C00100019002A68049BE4F7FDFDEB6A19
-:10372000A4004360AB6AE05070BD13B5040008000C
-:1037300001A9FFF7D9FF0199206B01F0ADFB13BD83
-:10374000F0B587B005000C0004920593002B03D060
-:1037500008230A7D13430B75049B6383EB6A1B7874
-:10376000002B39D1059B049A2100286B01F089FDBB
-:1037700007B0F0BD926AF300D31803931B78033BA4
-:10378000012B19D8002312E0029BA26ADB00D31898
-:103790001A78042A09D1039A5B685168994204D1C6
-:1037A0005288286B01F025FA0137029B01330293FE
-:1037B000029AA38C9342E7DC0136EA6A938CB34207
-:1037C000D8DC002FCED0059B3A0000932100049B4B
-:1037D000286B01F06BFDCBE700263700EDE773B5F2
-:1037E0001D000B781A320600080093420ED101A981
-:1037F00002F0F0FB019B0400984200D173BD300041
-:103800002100A847200002F0DBFBF3E7002BF5D0F6
-:103810003000A847F2E730B5040085B0080003A9DE
-:1038200002F093FB63790500012B08D1E36A0222C1
-:103830005B7D0399009303002000FFF767FF039B64
-:10384000A06A9900095848232A002000E5F7FCFFE8
-:1038500005B030BD7FB50400080003A9160002F0D2
-:1038600074FB63790500012B06D103000096072243
-:1038700003992000FFF74AFF280002F0A1FB039BF9
-:10388000A16A9B005D580200402320002900E5F753
-:10389000DBFFE88904B070BD70B5040008000D00BE
-:1038A00002F08EFB01002000E6F70EF82900200050
-:1038B000E6F70AF870BD10B50400E6F705F8206BCE
-:1038C00001F012FB10BD10B50400E5F7FDFF206B01
-:1038D00001F041FB10BD70B505001400A14200D1FC
-:1038E00070BD2800E5F7F0FF0100F7E710B5040010
-:1038F000FFF7F1FF0B21206B01F022FC10BDF0B5AA
-:10390000040085B008000F00150002F059FB02F01A
-:103910005CFB03A902F019FB63790600012B08D1B7
-:10392000E36A2A005B7D0399009320003B00FFF7C8
-:10393000EDFE039BA06A9900002309581A0020009D
-:10394000FFF7FEFE300002F03BFB01002000E5F730
-:10395000BBFF062D03D10021206B01F090FB00235B
-:1039600001211A00206B01F0BCFC05B0F0BD70B560
-:1039700004000D001600914205D10E21006BEBF7FB
-:10398000B1F9022113E00B78AE2B14D1006B0E219C
-:10399000EBF7A8F9280002F058FB0028F1D1280025
-:1039A00002F013FB01002000E5F78EFF0321206BDE
-:1039B00001F026FC70BDAF2B0CD1080002F005FB16
-:1039C00001002000E5F780FF02F0FFFA01008642C7
-:1039D000E9D1D6E7E5F778FFD3E770B50D0016001B
-:1039E00004000E21006BEBF77DF932002900200066
-:1039F000FFF7BDFF70BD70B515000400E5F764FF6B
-:103A000002F0E3FA2A0001002000FFF7B0FF70BDCA
-:103A1000F8B50024050016001F00A14202D0E5F70A
-:103A200053FF0134BE4204D1286B210001F0AAFBF0
-:103A3000F8BD31002800E5F747FF0600F1E710B5B3
-:103A400013000A000021FFF7E3FF10BDF8B50500E1
-:103A500016001F00E5F738FF0400B44200D1F8BD9E
-:103A600021002800E5F730FF39000400286B01F041
-:103A700067FBF2E710B50223FFF7E8FF10BD10B5B2
-:103A80000123FFF7E3FF10BD10B50023FFF7DEFFB2
-:103A900010BD10B50400E5F717FF0621206B01F0FB
-:103AA00042FB10BDF7B504000D0017000669019335
-:103AB000731C0361BD4204D13100206B01F045F954
-:103AC000F7BD29002000E5F7FFFE05008742F1D091
-:103AD00032000199206B01F092FAEBE710B5002358
-:103AE000FFF7E0FF10BD10B50123FFF7DBFF10BDAE
-:103AF000F7B50D0004001100280002F055FA290066
-:103B000007002000E5F7E0FE002306000193032FE5
-:103B100003DD236901930133236101230093009B9B
-:103B200001339F421BDC032F18DD2569206B6B1CC2
-:103B30002361290001F046FA0199206B01F005F993
-:103B40000121206B01F047F8206B01F00FFA206B88
-:103B500001F001FA2900206B01F0F7F8F7BD337886
-:103B6000012B33D17078B11C36380B282CD8F6F7DE
-:103B7000AFF83C2B062B2B2B2B2B252723291A2583
-:103B80002000E5F7A1FE009B060002330093BB4234
-:103B900005DA206B01F0CBF9206B01F0FEF929006A
-:103BA000206B01F0CDFA009BBB42B8DA019A0021EC
-:103BB000206B01F024FAB2E71B25E1E71C25DFE7C3
-:103BC0001D25DDE71E25DBE71F25D9E72225992BDB
-:103BD00006D0300002F039FA023D002800D103354A
-:103BE000300002F0EDF90100CAE71925C8E710B569
-:103BF000C36A04005A7DFFF72DFE01002000E5F79F
-:103C000005FF10BD37B50400080001A9256B02F0BF
-:103C100092F9019B226A9B002800995801F01DF936
-:103C200037BD1FB5040023680800002B0BD1002905
-:103C300009D00B78192B06D903AB02AA01A902F00F
-:103C4000F0F9029B23601FBDF7B504000D001700BB
-:103C5000914203D31100E5F737FEF7BD0669731CE7
-:103C600003610B78902B27D1080002F0AEF9010018
-:103C70002000E5F729FE31000190206B01F0D0F91A
-:103C8000002201992000E6F7D7F8280002F098F901
-:103C900005002000FFF730FD3A0029002000FFF763
-:103CA000D3FF206B310001F019FAA38B206B013B8D
-:103CB000A38301F0D9F9D0E7E5F706FE310005004E
-:103CC000206B01F0ADF9206B01F045F9E1E713B588
-:103CD0000400019101A8752102F08BF901990200FD
-:103CE0002000FFF7B1FF13BD7FB50400080003A952
-:103CF000150002F02AF962790600012A05D10300B5
-:103D0000009503992000FFF701FD206B01F0E2F818
-:103D1000039BA26A9B009D58002329001A002000E3
-:103D2000FFF70EFDE989206B01F08BF8300002F0FF
-:103D300047F903780100B82B00D1002120000223AD
-:103D40000022E6F75FFBE88904B070BD10B5C36AD6
-:103D500004005A7DFFF7C8FF01002000E5F756FE7A
-:103D600010BD91429241002310B511401A00E6F7B0
-:103D700049FB10BDF0B50400056985B003936B1CC9
-:103D800003610E00006B2900170001F061F92000AB
-:103D9000FFF7B2FC002F26D10321206B00F01BFFA0
-:103DA00031002000E5F790FD0321206B494200F02F
-:103DB00012FF206B01F088F9206B0E21EAF792FFC9
-:103DC0002900206B00F0C1FF0B9802F0FEF8010003
-:103DD0002000E5F779FDA38B206B013BA38301F065
-:103DE00043F905B0F0BD0A9B3A0000933100039BF4
-:103DF0002000E6F7B5FCDCE7F0B5060087B0080068
-:103E00000D0002F0DDF803900378FD221C007634EB
-:103E100014400CD1722103A802F0EBF80300039ABE
-:103E2000009429003000E6F79BFC07B0F0BD892B19
-:103E30001ED104A902F0CEF87221059005A802F067
-:103E4000D8F8040002F0BCF8049B984203D1009417
-:103E50002300059AE5E7059F200002F0B1F8230052
-:103E60003A000190009429003000FFF783FFDCE75F
-:103E70000022019000921300F5E710B54B234A226F
-:103E8000E6F774FE10BD10B543234222E6F76EFE3E
-:103E900010BDF8B50D000400110028001600FFF752
-:103EA00018FC0021002835D12B78A62B34D128000E
-:103EB00002F08BF8050002F083F802781300573304
-:103EC000DBB2012B15D802F080F807002900200092
-:103ED000E5F7FAFC200032003900FFF7FCFC310066
-:103EE0003800246B02F060F8411C200001F057F903
-:103EF00006E0C12A05D1BE3A29002000FFF7FFFCE9
-:103F0000F8BD29002000E5F7DFFC01002000E5F7FF
-:103F1000DBFC0221206BE9E729002000E5F7D4FC57
-:103F20000121F7E7F8B50D00040011002800160084
-:103F3000FFF7CFFB071E06D000231A001900200050
-:103F4000FFF766FD18E0280002F03FF8050002F0D8
-:103F500037F8027813005733DBB2012B05D802F093
-:103F600034F8330002002900E9E7C12A05D1BB3A41
-:103F700029002000FFF7C3FCF8BD33002A003900F8
-:103F8000DDE770B54D7802310400E5F79DFC2F2D7B
-:103F900004D10321206B01F0C6F870BD206B042111
-:103FA000302DF8D00521F6E770B50D0004001100A2
-:103FB0002800FFF78EFB002100280ED12B78742BF0
-:103FC0000FD1280002F001F801002000E5F77CFC89
-:103FD00001002000E5F778FC0221206B01F0A1F937
-:103FE00070BD29002000E5F76FFC0121F5E7F0B571
-:103FF000060087B00D001400002906D101212160C0
-:10400000306800F0B2FE07B0F0BD00220B780192DC
-:104010007E2B0CD1080001F0D8FF050001F0D0FF85
-:104020002100FFF761FB002DE8D0012301932B78DD
-:10403000002BE3D00A3B0F2B0AD805A92800FFF775
-:1040400053FB019B002B01D1059B23600599D7E70A
-:10405000280002A901F0BEFF019B0500002B02D140
-:104060002100FFF741FB01242F006442029B9F4285
-:1040700023D1200003A901F031FC2F000400029B92
-:104080009F4225D1039801F034FC0100306800F014
-:104090006CFE019B002BB6D0280001F091FF0400BC
-:1040A000029B9C42AFD005A92000FFF71DFB05999C
-:1040B0000400306800F0F0FEF2E705A93800FFF7D1
-:1040C00013FB0700059801F034FC01342418CDE7F8
-:1040D000BD4202D22E232370013404A93800FFF719
-:1040E00003FB05A90700049801F02DFC059A0100C7
-:1040F000200004F031FE059BE418C0E737B504004A
-:104100000D00006B002100F054FE206B0E21EAF739
-:10411000E9FD2000290001AA3030FFF768FF01996E
-:104120002000E5F773FC37BD10B50278012A05D1F0
-:1041300043780F3B58424341180010BD0023032A27
-:10414000FAD101F011FF0300581E8341F4E710B5C6
-:104150000278012A05D143780D3B584243411800AB
-:1041600010BD0023032AFAD101F0FEFE4342434171
-:10417000F5E7F0B5040085B008000E0015000093C7
-:10418000FFF7E5FF002809D0002D03D10099206B2F
-:1041900000F018FF300001F013FF4FE03000FFF790
-:1041A000C3FF002802D0002DF4D0EFE73378192B9D
-:1041B0004ED903A9300001F00DFF33780700362BEC
-:1041C0002ED1002D28D101262369019301332361CB
-:1041D000380001F0F5FE039B98420DD13900009B99
-:1041E0002A002000FFF7C5FF01990600206B00F0B0
-:1041F000ACFD300005B0F0BD32003900019B6A40D3
-:104200002000FFF7B6FF0700E2E73900009B2A0015
-:104210002000FFF7AEFF0700039EB742F5D1E8E7A5
-:10422000372B02D1002DF7D0CDE7382B08D1012252
-:1042300001006A40009B2000FFF79BFF0600D8E7C3
-:10424000442B05D1300001F000FF0028ABD09BE7E4
-:1042500031002000E5F738FB009A06002900206BAA
-:1042600000F0BCFEC5E7F0B504000F00066987B09A
-:104270000293B31C03613100006B751C039200F0C4
-:1042800064FD2900206B00F00DFF002239002000A2
-:10429000E5F7D2FD380001F093FE01F091FE039B9B
-:1042A000834221D102992000E5F70EFBE36A1978D9
-:1042B000062912D1206B01F042F8206B00F04BFE72
-:1042C0003100206B00F07EFE2900206B00F03DFDE8
-:1042D000206B00F0F3FE07B0F0BD0C9B206B9A0042
-:1042E000053200F09AFFEBE70378C22B09D103A94E
-:1042F00001F070FE3300010000222000FFF739FFBB
-:10430000CDE705A901F066FE01F05AFE070001F0B5
-:1043100057FE01002000E5F7D7FA206B012100F0DD
-:10432000AEFE0C9B059A013300933900029B2000DE
-:10433000FFF799FFC4E7F7B5040008000F0001F08C
-:104340003FFE01F042FE25690022AB1C0100236103
-:1043500020002B00FFF70DFF6E1C3900019020009C
-:10436000E5F7B2FA3100206B00F02CFE2900206B3B
-:1043700000F0EBFC0121206B494200F02CFC01997C
-:104380002000E5F7A1FA3100206B00F0DEFCF7BD5C
-:10439000F0B589B00792038B07690493438B7E1CA9
-:1043A0000593C38B07830693BB1C0361838B4683F2
-:1043B000C383040008000D0001F002FE029001F02A
-:1043C000FFFD03902800FFF7C2FE00281ED12369DD
-:1043D0002800019301332361FFF7A6FE002803D1D3
-:1043E0003100206B00F0EEFD0199206B00F0ADFC78
-:1043F00002992000E5F768FA3100206B00F0A5FC77
-:10440000019B012229002000FFF7B3FE049B079ABD
-:104410002383059B6383069BE383039B934203D023
-:1044200019002000E5F750FA3900206B00F08DFCF0
-:1044300009B0F0BDF0B50400256985B06B1C08001B
-:10444000236103910092FFF782FE071E1FD003989D
-:1044500001F0B6FD039001F0B3FD0390039B009AB9
-:1044600093420ED06C2103A801F0C3FD070003980E
-:10447000B8423FD1009B9F4203D039002000E5F7AE
-:1044800023FA2900206B00F060FC05B0F0BD26691E
-:104490000398731C2361FFF747FE33003A00019035
-:1044A00003992000FFF765FE010003902000E5F767
-:1044B0000BFA019B07000390002BE2D10099FFF754
-:1044C00008F9002809D1206B00F080FB00280CD1EE
-:1044D0002900206B00F076FD07E0380001F070FD48
-:1044E0000099FFF7F6F80028EDD03100206B00F0BE
-:1044F0002CFCB3E701F069FD0390FFF728FE019063
-:10450000002807D0039801F05BFD039001F058FDEF
-:104510000390ACE726690398731C2361FFF704FE40
-:1045200033000290019A03992000FFF722FE010058
-:1045300003902000E5F7C8F9029B0390002BA0D15F
-:10454000206B00F043FB002803D12900206B00F012
-:1045500039FD3100206B00F0F8FB88E7F0B589B039
-:1045600003910B7804000D00012B01D07B2B38D177
-:1045700007950025612107A801F03BFD00260700F3
-:104580000798B84238D1039801F01AFD2200039031
-:1045900007783032030001923100012F03D15B789C
-:1045A000206B312B35D0206B00F003FC662103A873
-:1045B00001F01FFD0027039E0290029B9E423CD308
-:1045C0003900206B00F0DEFD290004AA0198FFF7F6
-:1045D0000EFD039D029B9D423FD3206B00F0BBFC70
-:1045E00029E00026782BCED1080001F0EEFC0790E0
-:1045F00001F0E6FC0500BDE70378012B07D1437805
-:104600004A2B04D1013601F0DBFC0790B8E70336F2
-:10461000F9E700F0CEFB0221206B00F012FC39001C
-:10462000206B00F0AFFD019807AA2900FFF7DFFC1F
-:10463000206B00F0B3FB09B0F0BD300001F0C5FC09
-:1046400007A9FFF751F80799206B00F0FAFB30003B
-:1046500001F0B6FC01370600AFE705A9280001F01C
-:10466000B9FC06A9FFF740F806990500206B00F099
-:1046700089FB059B0699AB4205D007A92800FFF7E7
-:1046800033F8050007992000E5F7C0F9A2E7F0B577
-:10469000062514001268CB0006008BB00F00043012
-:1046A0001D43002A29D12900E4F766FA002802D028
-:1046B000436823601FE005AB187407903168180049
-:1046C000059606970894E6F761FF23680193002B8F
-:1046D00011D1F22149008F420DD002AA3000E8F733
-:1046E000C7F9029B002B06D002AA0199012004956C
-:1046F00000F048F920600BB0F0BD6668002E07D1CD
-:1047000002222900E4F738FA0028F4D00023D0E789
-:1047100001222900E4F730FA4660F7E737B51D00BB
-:104720000023009301330400080011001A00EDF784
-:10473000C3FD082001F0A1FD2B68436004603EBD6D
-:1047400037B51C0000230093023305000800110058
-:104750001A00EDF7B1FD0C2001F08FFD23686268AF
-:104760000560826043603EBD30B51400126887B0BA
-:10477000002A0CD101AB0190029103920100013299
-:10478000180004941A74E6F701FF07B030BD806B7F
-:104790000028FAD0CB000621656804301943002DAB
-:1047A00006D10222E4F7E8F90028EED02560ECE714
-:1047B0000122E4F7E1F90028E7D0636843600023B1
-:1047C0002360E2E7F0B58BB003AD04000191170060
-:1047D00000210822280004F0DBFA2C2305A88360BE
-:1047E00001260023216803744660C5600594E6F73E
-:1047F000CDFE039B3000042B07D12069DEF756F86D
-:104800003A00C36A0199206998470BB0F0BDF0B532
-:1048100089B001AE040008220F003000002104F02E
-:10482000B7FAF523002503A85B004360C73BFF3BB5
-:1048300021688360C66005740394E6F7A7FE019BB8
-:104840001800AB4208D0042B08D12069DEF72EF8FF
-:104850003900436A2069984709B0F0BD3200290049
-:10486000280000F08FF8F7E710B5EE24002288B09A
-:10487000640003AB01A90494CD3C03900691FF3C76
-:10488000016818001A74019202920594E6F77EFE00
-:104890000198431E9841C0B208B010BD10B50C007D
-:1048A000DEF704F82100E7F747FA10BD70B50D00F8
-:1048B0000400DDF7FBFF2900E7F70EFA031E00D026
-:1048C0002369180070BDF7B5050001911600FEF7C9
-:1048D000F8FE0700A023A222DB05D2009C5801238A
-:1048E000EC401C40019B9C4210D1FEF7EAFE070001
-:1048F000A023A222DB05D2009B580122EB401340EB
-:104900009C420BD0FEF7DDFEC01BFEBDFEF7D9FEBC
-:10491000C01BB042DED302204042F6E7FEF7D1FED4
-:10492000C01BB042E4D30120F6E7102230B58DB0B1
-:10493000069200220392029201920A320B000500B5
-:10494000009206A907AA08AC05A80594E7F7CCFDD4
-:104950000100280002F081F90598A04201D001F081
-:10496000BBFC0DB030BD002310B51A001900E8F7EC
-:1049700007F810BD07B50022019101AB0121E7F74F
-:10498000FFFF0EBD10B514005268531E9A419300EC
-:104990001018E31A0A00083301002068E7F7F0FF57
-:1049A00010BD07B56A46E8F795F801990098002907
-:1049B00000D10EBDDEF7E6FBFBE7F8B5FEF71AFD0A
-:1049C00000F053FF002506007368AB4200D8F8BD25
-:1049D000B368EF00DC59002C0ED0042C0CD0E40896
-:1049E000200000F0ABFF03785F2B05D0B3682000F8
-:1049F000DF197968E7F722FF0135E5E710B50029EF
-:104A000003D1FEF7E6FBE7F769FEFEF7EFFBFAE7F7
-:104A100001204042704770B50D000400E9F7C2FE66
-:104A200029002000F4F76CF8E9F7ACFE70BD10B572
-:104A30000400E9F7B7FE2000F4F744F8E9F7A2FE16
-:104A400010BD80220300520510690138184043420E
-:104A50005841C0B2704773B514006A46551D0B002B
-:104A60007F2629002200013D32402A70E409F9D155
-:104A70008026491B984701AB591B76428C4204D1D2
-:104A80006A4612795D1B425573BD2A5D3243025559
-:104A90000134F3E70300006A5A790918032A02D89F
-:104AA0001800196270471A6B19621018FAE710B5EE
-:104AB0000C000121FFF7EEFF047010BD0300806AB7
-:104AC0005A790918032A02D81800996270475A6A5D
-:104AD000996280181A6B1018F8E710B50C000121C4
-:104AE000FFF7ECFF047010BD10B52821E9F7F6FFC1
-:104AF00010BD10B52921E9F7F1FF10BD70B5040014
-:104B00001500FFF7EAFF0322A36A0421033393434E
-:104B1000A3622000FFF7D2FF056070BD70B5437936
-:104B20000D000024032B06D9836A033CE41AC369F1
-:104B30009200D358E4180321FFF7C0FF4470240A01
-:104B40000570847070BD10B5382001F0A8FB10BD51
-:104B500010B504008161880001F08FFBE06110BD99
-:104B600010B50400C06901F0B7FB200001F0B4FBF0
-:104B700010BD13B543790400012B18D00021FFF7B5
-:104B800096FF6379032B13D1226AD01C9843A36A42
-:104B900020626062E362C01801F081FBE368206379
-:104BA000D88A1B8BC018800001F079FB606313BDAD
-:104BB000042BFCD1E068636AE26A216B9A18037DDA
-:104BC00000930069636BDFF73FFAF0E78079431EDB
-:104BD0009841C0B270474379012B09D08368C91846
-:104BE000C3688160DA8B914200DDD9830023837131
-:104BF000704770B5012114000500FFF7ECFF0F2C82
-:104C000006D821005039C9B22800FFF766FF70BDF1
-:104C1000220019212800E9F761FFF8E770B51500B7
-:104C200004000121FFF7D7FF2A001A212000E9F72D
-:104C300055FF70BD70B50D0004000121FFF7CBFFDB
-:104C40002A001B212000E9F749FF70BD70B50D0057
-:104C500004000121FFF7BFFF2A001C212000E9F713
-:104C60003DFF70BD012170B5494214000500FFF7FA
-:104C7000B2FF0F2C06D821004039C9B22800FFF737
-:104C80002CFF70BD220022212800E9F727FFF8E75A
-:104C9000012170B5150004004942FFF79CFF2A006E
-:104CA00023212000E9F71AFF70BD70B50D00012126
-:104CB00004004942FFF78FFF2A0024212000E9F772
-:104CC0000DFF70BD70B50D00012104004942FFF7D2
-:104CD00082FF2A0025212000E9F700FF70BD70B592
-:104CE0000D0004000021FFF776FF2A002A21200092
-:104CF000E9F7F4FE70BD70B50D0004000021FFF768
-:104D00006AFF2A002B212000E9F7E8FE70BD70B58C
-:104D100005000498C91A440000021843059B091BAA
-:104D20000600D4B2002B0AD002392800FFF753FF47
-:104D300032000134E1B22800E9F7D0FE70BD28004E
-:104D4000FFF749FF32002100F5E770B504000D00C0
-:104D50000021FFF740FF6379012B05D0032B03D817
-:104D6000A26AE369AD00EA5070BD70B50D00012183
-:104D700004004942FFF72FFF2A0068212000E9F7CD
-:104D8000ADFE70BD70B50D0004000121FFF723FFDB
-:104D90002A0069212000E9F7A1FE70BD012110B5AC
-:104DA00004004942FFF717FF6A212000FFF795FE34
-:104DB00010BDF7B50C0001210500FFF70CFF230023
-:104DC00010333F2B06D821008039C9B22800FFF7E5
-:104DD00084FEF7BD14212800FFF77FFE6B460533E4
-:104DE00019007F20E2B217005E1E0740E411377001
-:104DF000671C012F18D840273A40013416D1002AE9
-:104E000002D1023B18701E002800891B8025FFF785
-:104E100055FE002201AB9C1B6D42A2420CD16A469A
-:104E200012799B1BC254D4E73300DBE7002AEBD096
-:104E30000022023B1A70E6E7B15C2943815401323B
-:104E4000EBE770B50D0004000121FFF7C4FE2A0056
-:104E500016212000E9F742FE70BD70B504000D0078
-:104E60000121FFF7B8FE20001721FFF736FE0322CD
-:104E7000A36A042103339343A3622000FFF71EFEBD
-:104E8000056070BD10B504000121FFF7A4FE1821D4
-:104E90002000FFF722FE10BD70B50D0004000021B8
-:104EA000FFF799FE2A001D212000E9F717FE70BDCB
-:104EB00070B50E00012114005300C91A0500FFF758
-:104EC0008AFE21004C1EA141320028001E31E9F764
-:104ED00005FE70BD10B504000121FFF77CFE202106
-:104EE0002000FFF7FAFD10BD012110B50400494272
-:104EF000FFF771FE21212000FFF7EFFD10BD70B517
-:104F00000D00022104004942FFF765FE2A00262118
-:104F10002000E9F7E3FD70BD032110B5040049420C
-:104F2000FFF759FE27212000FFF7D7FD10BD10B570
-:104F300004000121FFF74FFE30212000FFF7CDFDD7
-:104F400010BD10B504000221FFF745FE31212000FD
-:104F5000FFF7C3FD10BD012110B504004942FFF762
-:104F60003AFE32212000FFF7B8FD10BD10B5040055
-:104F70000021FFF730FE33212000FFF7AEFD10BD0A
-:104F800070B504000D00FFF77DFF2000FFF7EEFF76
-:104F900029002000FFF7B3FF70BD10B50400002109
-:104FA000FFF719FE34212000FFF797FD10BD10B563
-:104FB0000400FFF767FF2000FFF7EFFF2000FFF777
-:104FC000ABFF10BD70B50D0004000021FFF703FE1C
-:104FD0002A0035212000E9F78FFD70BD70B50E0065
-:104FE0000121150049420400FFF7F5FD2A00362192
-:104FF000002E00D137212000E9F77EFD70BD70B58D
-:105000000E000121150049420400FFF7E4FD2A00CB
-:105010003821002E00D139212000E9F76DFD70BD47
-:1050200070B50D0004000221FFF7D5FD2A003D21D7
-:105030002000FFF773FD70BD70B50D000400002166
-:10504000FFF7C9FD2A003F212000FFF767FD70BD73
-:1050500070B50D0004000021FFF7BDFD2A004021BE
-:105060002000FFF75BFD70BD012110B5040049422F
-:10507000FFF7B1FD41212000FFF72FFD10BD70B5F6
-:105080000D002B005A1E934103215B42194004007E
-:10509000FFF7A1FD4721002D00D105392000FFF7C2
-:1050A0001CFD70BD70B50D0004000121FFF793FDDC
-:1050B0002A0043212000FFF731FD70BD042110B507
-:1050C0004942FFF788FD10BD10B504000021FFF72D
-:1050D00082FD44212000FFF700FD10BD70B50400E3
-:1050E0000D00FFF7F1FF20000E21E9F7FBFD29007D
-:1050F0002000FFF72AFE20000221FFF76CFD2000B0
-:105100003E21FFF7EAFC042120004942FFF763FD3E
-:1051100070BD10B504000021FFF75DFD45212000A2
-:10512000FFF7DBFC10BD70B50C0000210500FFF798
-:1051300052FD210030392800C9B2FFF7CEFC70BD06
-:1051400070B505000C00222919D00026232901D1B1
-:105150000136033C012128004942293CFFF73BFD71
-:10516000E1B22800FFF7B9FC002E07D0002128008B
-:10517000FFF731FDD6212800FFF7AFFC70BD0126F7
-:105180001F24E7E770B50D0001210400491BFFF75C
-:1051900022FD2A0050212000E9F7A0FC70BD70B567
-:1051A0000D0001210400491BFFF715FD2A005121C4
-:1051B0002000E9F793FC70BD70B50D0004000121DB
-:1051C000FFF709FD2A0053212000E9F787FC70BD95
-:1051D000022110B504004942FFF7FDFC54212000D4
-:1051E000FFF77BFC10BD70B50D0001210400491BC9
-:1051F000FFF7F1FC2A0056212000E9F76FFC70BD93
-:1052000070B50D0001210400491BFFF7E4FC2A00E2
-:1052100058212000E9F762FC70BDF8B505001700C1
-:1052200003290FD0042910D0002402262800E143CE
-:10523000FFF7D1FCE2199200324328005721E9F729
-:105240004DFCF8BD00242600F0E70124FBE770B513
-:105250000D0004000139FFF7BEFC2A00592120008F
-:10526000E9F73CFC70BD70B5140005000E0089180C
-:10527000FFF7B1FC2202324328005A21E9F72EFC45
-:1052800070BD70B51A430D0004000121002A07D13A
-:10529000FFF7A1FC60212A692000FFF72FFC70BDF9
-:1052A0004942FFF798FC2A696121F5E770B50E00C5
-:1052B00004990400D5B20B430DD10121891AFFF7DF
-:1052C0008AFC622132692000FFF718FC29002000C7
-:1052D000FFF703FC70BDD143FFF77DFC326963210A
-:1052E000F1E707B5019300920B0064220021FFF75C
-:1052F0000EFD07BD13B50124019300920B00662239
-:105300006142FFF704FD13BD012110B549420400BD
-:10531000FFF761FC01235B21A3712000FFF7DDFB98
-:1053200010BD70B505000C004942FFF754FC280081
-:105330000221FFF7C3FB5C234470037070BD10B5FE
-:1053400004000021FFF747FC0423E2682000117DE0
-:105350000B4313755D21FFF7C0FB10BD012110B594
-:1053600004004942FFF737FC0423E2682000117D66
-:105370000B4313755E21FFF7B0FB10BD10B5042180
-:10538000FFF729FC10BD032110B54942FFF723FCAC
-:1053900010BD10B5EBF7DAFA43000120184310BD39
-:1053A000F0B585B0039008000D0001F04BF805241E
-:1053B000042803DC280001F045F80400280001F06F
-:1053C0004FF80527042803DC280001F049F80700FE
-:1053D000039B0193002302930093009BA34212DBE3
-:1053E000E343DB171C4005236343039A0433D318BC
-:1053F0000022042C2BDC1A705A709A70DA701A7121
-:1054000001340533F5E70026BE420ADBFB430021E9
-:10541000DB173B40052B13D0019AD21811710133D1
-:10542000F8E732000099280000F0FEFF019B029A85
-:105430009B191871012383401A4302920136E3E756
-:10544000009B01330093019B05330193C5E7039B48
-:10545000029A1A8405B0F0BD73B5060008000D006D
-:10546000002403F0E9FC230001002200280000943E
-:10547000EDF7CAFB012301000093300023009622C0
-:10548000E9F7ECFF73BD70B5040008001600DDF706
-:10549000F5FA05003000DDF7F1FA290002002000DE
-:1054A000EAF72CF943000120184370BDA021042322
-:1054B0000320C9051A00C132FF3292000133505057
-:1054C000112BF7D17047802010B5C005F0F7C6FD4D
-:1054D000FE23FE2140029B05400A18438905F5F78B
-:1054E00097FB10BD70B50D00DDF7C8FA0400280069
-:1054F000DDF7C4FA844202DD0020E7F767FF001BF6
-:105500000130F0F7ABFD001900F0BEF870BDF8B542
-:10551000070008680C00DDF7B1FA0600012F09D179
-:10552000002804DDF0F79AFD00F0AEF8F8BD002089
-:10553000E7F74CFF6068DDF7A1FA851B022F06D163
-:105540008642F4DA2800F0F789FD8019ECE7A068BC
-:10555000DDF794FA041E0ADD281801382100F4F75B
-:1055600055FC0028E3DDF0F779FD6043EDE7002806
-:10557000DDD028180130F1E710B5DDF77FFA04001F
-:105580001E2801DC002802D10020E7F71FFF802041
-:10559000C005F0F763FD20220123121B5B42D340BC
-:1055A000184000F08CF810BD4068704741607047AB
-:1055B000F0B51C0087B00EAB1B780F0005930FAB46
-:1055C0001B7804920393A36806000D9A18010C99A6
-:1055D000039BE6F76DFF3B680500834203D200F0B2
-:1055E0004CFE30603D603568039B201D00930195A3
-:1055F000059B0D9A0C99FCF7EAFD049B18602800A6
-:1056000007B0F0BDF8B50E0017000500EAF71CF969
-:1056100004003B00320029000430FCF722FA20008D
-:10562000F8BDF8B50F0015001E0004000021180099
-:1056300003F0AEFB33002A003900201DFCF762FDA9
-:10564000F8BD01220300104005D013410AD4180010
-:10565000431E9841704799680029FBD01B791000C0
-:105660001342F7D001204042F4E7D3B50F00060003
-:10567000EAF7EAF801230400009332003B0004300B
-:10568000FCF712F92000D6BD43001A0010B54240C5
-:1056900002D40120184310BDC117FFF7E6FFFAE757
-:1056A000D3B50F000600EAF7CFF8002304000093FB
-:1056B00032003B000430FCF7F7F82000D6BD10B5EF
-:1056C000830F03D140000133184310BD0021FFF7C1
-:1056D000E7FFFAE7F0B585B004000E00170003936A
-:1056E000EAF7B2F8039B0500009332003B00216803
-:1056F0000430FCF764F9236818182060280005B00E
-:10570000F0BD10B5C30701D5401010BD0430FCF743
-:10571000E5FCFAE710B50430FCF73BFD10BD10B511
-:105720000122EAF771FA10BD10B50222EAF76CFA0D
-:1057300010BD10B50022EAF767FA10BD0B6870B50E
-:105740008668DC00B34201D3002208E0C26801335E
-:1057500012191568002D04D0042D02D00B60100022
-:1057600070BD0834EEE7010010B50C318068FFF71A
-:10577000E5FF002800D0006810BD1FB5010004003F
-:105780000C318068FFF7DAFF00280DD02279012A5A
-:105790000CD0022A0CD0026802A9029243680220AF
-:1057A00001930393E0F766FF04B010BD0068FBE7C8
-:1057B0004068F9E710B50C7A0023012C05D11F28A9
-:1057C00003D14968EAF716FB0300180010BD70B555
-:1057D0000500102000F051FD04002900EAF7F0FB5D
-:1057E000200070BD70B505008068FFF7F0FF2B68E2
-:1057F000416803606B680400DA0807230B4001214D
-:10580000D200134343602A79D207D30F02798A4327
-:105810001A4302239A4302712B79D2B29B080B40A0
-:1058200003318A439B0013430371AB68E968DA00D4
-:10583000C06803F091FA200070BD4068C00870474E
-:1058400070B51500040001220430E3F795F94560B6
-:10585000200070BD022213B50400009001911000D9
-:105860006946EAF7D1F9200016BD043070470128D7
-:1058700003D1CB885B00184370470020FCE770B56C
-:1058800000221E2B02D91A001E3AD2B2E225841839
-:10589000ED0064192478551CEDB27F2C12D0E2265D
-:1058A00064188518F600E4B2AD192C700132D2B23A
-:1058B000934209D0E2268518F600AD192D78FF2D08
-:1058C000F4D0ECE72A00E1E770BD10B5040003F066
-:1058D000B3FA01002000EBF7EFF810BD70B505003A
-:1058E00003300C0000F0C9FC2060457020680230D5
-:1058F00070BDF8B54578871C040029003800EBF727
-:10590000A9F8061E0CD129003800EBF785F86519B7
-:105910002070AE702000EBF753F806003000F8BDA1
-:10592000200000F0D9FCF9E710B5EBF737F8007864
-:1059300010BD10B5EBF732F8407810BD10B5EBF79D
-:105940002DF8023010BD10B50C00EBF727F84378A6
-:105950000230236010BDF0B50400170082680D000E
-:10596000561821008BB003937B00F0185B190C31A3
-:105970009B0002910193052814D895002A0005A8E0
-:1059800003F0EAF905AB5819019A039903F0E4F919
-:10599000606805AB3A003100E6F7F2FF0400200032
-:1059A0000BB0F0BD800000F068FC0600A36802990F
-:1059B0009A0003F0D1F9A368019A9800039930186E
-:1059C00003F0CAF9A3683A00E91860683300E6F703
-:1059D000D7FF0400300000F07FFCE0E702690123FC
-:1059E000272A21D0222A1FD0752A04D011000F3374
-:1059F0009943622912D141690123272914D0222910
-:105A000012D0722A0AD1002362290DD180690123A4
-:105A1000272809D022384342434105E00023622A67
-:105A200002D14269722AF1D018007047026910B59C
-:105A300004000A2A22D1C3690133C361012323620E
-:105A4000636960682361A3696361A36898476369B8
-:105A5000A0610D2B07D1033B6361984203D16068BD
-:105A6000A3689847A061A369013306D163695A1CF2
-:105A700003D00A2B01D00A23A36110BD036A092AAF
-:105A800002D10733023A93430133D8E7F8B5040053
-:105A90000E00002501272069431C01D12800F8BD14
-:105AA0000A2809D1002E02D0A36A002BF6D02000CC
-:105AB000FFF7BCFF3D00EEE7E2F7C2FD002803D090
-:105AC0002000FFF7B3FFE6E72369232B08D120006E
-:105AD000FFF7ACFF23695A1CDDD00A2BF7D1DAE7B8
-:105AE0005C2BDBD163690A2BD8D12000FFF79EFF26
-:105AF000E6E77FB50600542001910292039300F07F
-:105B0000BCFB030001AD40C3040007CD07C3022264
-:105B100000250123524222620C32E262E3612363D8
-:105B20006562A562142000F0A8FB606320002021BC
-:105B3000443001F0CCFA636B20001D80A5616561E3
-:105B40002561FFF773FF2000FFF770FF2000FFF7CC
-:105B50006DFF2000EBF7D0FAE36B012B03D023009D
-:105B6000052240331A70200004B070BD1FB5040038
-:105B700001A8E2F74DFD0199029A039B2000FFF76F
-:105B8000B8FF04B010BD10B5041E0CD0E368406827
-:105B900098472000443001F0BCFA606B00F09CFB99
-:105BA000200000F099FB10BD10B50022EBF7E6FDD8
-:105BB000002801D1EBF78AFD10BD4A43F8B5070074
-:105BC0001E0014000025B54200D1F8BD22003900A6
-:105BD000069803F0C1F8069B01351B190693F2E7FE
-:105BE000F7B50F0000215368080014680193966808
-:105BF00000F01AFF0500002E11DA019B9C4201DA29
-:105C00002800FEBDA300F9582800EEF7E5FAA41914
-:105C1000F3E7A300F9582800EEF7DEFAA419019B78
-:105C20009C42F6DBECE770B5049E040015001B28CF
-:105C300013D10022B5420ED11A000B001100320020
-:105C4000AE4200D92A00180003F077F81B2C10D1BF
-:105C500044426041C2B2100070BD192805D01C2812
-:105C600005D032002E001500E6E71A24E7E71D24D0
-:105C7000E5E700229042EEDB01320028EBD1AE4294
-:105C800002D0AE424041E5E71A3C601E8441E2B2D8
-:105C9000E1E7F8B517000400002589004618B44272
-:105CA00003D101206D002843F8BD390001CCDCF799
-:105CB00093FE431E98412D18F1E710B57F2440183C
-:105CC0001440431E1C708024091A6442581800288E
-:105CD00000DC10BD2000D209013B10431870F5E72D
-:105CE00030B5010003687F2500201A78C001140038
-:105CF00052B22C4020180133002AF6DB0B6030BD75
-:105D000013B5421C019202780C000300082A11D836
-:105D10001000F3F7DDFF07110F0509090F0F0B0046
-:105D200005330193019816BD0333FAE701A8FFF785
-:105D3000D7FFF7E7192A01D80233F2E701A8FFF7E6
-:105D4000CFFF01A8FFF7CCFF002CEBD0019B181868
-:105D50000190E7E770B50400160008000021A36970
-:105D60004D1CDB091BD1023101F0F1F9082303704E
-:105D700029000130A269FFF7A0FF6569A369AB4262
-:105D800006D30835A900E06900F095FA6561E06185
-:105D9000A369E269591C9B00A1619E5070BD290056
-:105DA000DEE710B50C00022101F0D1F9230A0A3315
-:105DB0000370447010BDF8B51E00037804000D0098
-:105DC0001700002B0DD1416883688B420ED3183128
-:105DD000C9000122C06800F07BFA002802D101232B
-:105DE0002370F8BD6368E06018336360A268E368FD
-:105DF000511CD2009B18A16019682D022A0A0D0EB1
-:105E00002D0615431D603A789E80DA70069ADA8076
-:105E1000E7E710B50C00052101F099F903230370A1
-:105E2000431C05301C70013324128342FAD110BD8B
-:105E3000F0B5046A89B02300403303931D7807004E
-:105E40000E00072D0BD1A16CE06CEAF735FE0100C6
-:105E50003000FFF7A6FF2000EBF74EF94DE0082DCC
-:105E60000DD100222300A16CE06CDCF777FB02006F
-:105E7000C3070ED541103000FFF7CBFFEBE7092D2C
-:105E80000CD1009401220023A16CE06CDCF7E2FB52
-:105E9000020031003800FFF75DFFDCE72B000A3B12
-:105EA000012B40D8A16C04A801F011F9A26CE16C9F
-:105EB00004A801F0F0F82000EBF71EF9039B1B7813
-:105EC0009D42F3D00A3B0020012B17D90599069873
-:105ED0000A2915D8EAF7F0FD041E14D00A3D032163
-:105EE000300001F034F96B1E9D4144700435240AE2
-:105EF0000570847004A801F00CF9012009B0F0BD10
-:105F0000EAF7A8FDE8E7069805990A2D08D12200CE
-:105F1000DBF71EF8020031003800FFF71BFFE9E74E
-:105F2000DBF72EF8F6E70221300001F010F901232B
-:105F3000457003708FE713B50130019001A80C0084
-:105F4000FFF7CEFE2060019816BD002310B50B6050
-:105F5000C2185278DC00A2400C68013322430A6068
-:105F6000042BF5D1053010BD07B501A9FFF7EDFFF2
-:105F700001980EBD37B5150002780C00032A07D131
-:105F8000FFF7F2FF012340001843206018003EBDD8
-:105F90000023082AFAD101A9FFF7CDFF019B9B003E
-:105FA0005B5923600123F1E770B50D000024A8427E
-:105FB00001D3200070BD01210134FFF7A1FEF6E7F7
-:105FC00010B50121FFF79CFE10BD10B50021FFF7B1
-:105FD00097FE10BD13B50130019001A80C00FFF72A
-:105FE0007FFE01A8FFF77CFE019B181820601800B7
-:105FF00016BD13B5040000680378002B02D10130F0
-:10600000206016BD192B03D80121FFF779FEF8E7B0
-:106010001A318B42F8D101A9FFF7DCFF206001980B
-:10602000EFE737B51C00431C0193037801A81A3B26
-:106030000B601500FFF754FE286001A8FFF750FE23
-:10604000019B1818206018003EBD07B501A9FFF795
-:10605000C1FF019B181A43425841C0B20EBD10B592
-:106060008068002800D110BD446800F035F9200098
-:10607000F7E7136870B5002B0DD14568AC1CA40080
-:1060800024589D4207D09E00A659B14204D1023344
-:106090009B001B58136070BD0133F2E74B6810B5CD
-:1060A00002339B000A005958EBF7EEFF10BD8168E0
-:1060B000030010B5081E08D001220139996049007B
-:1060C000114358680332DCF761FE10BD7FB51D0037
-:1060D0000024012306000094080011001A00ECF7C8
-:1060E000EBF8F82102AAFF312868E6F7C1FC029B11
-:1060F000A34208D02100200002AAFEF743FC0400BE
-:10610000200004B070BD0C2000F0B7F806602B68CA
-:10611000040043602868DCF723FEDCF7AFFCA060D6
-:10612000EEE7802307B55B051A6E082100925B6ECF
-:1061300068460193DAF724FF0EBD10B5EFF3108027
-:1061400072B6FFF7A1FA10BD10B504000161880016
-:1061500000F093F8606110BD10B50400002902D072
-:10616000C06800F0B9F8606900F0B6F810BD70B50D
-:1061700004000D0001290AD10121036949429A0056
-:10618000406902F005FE00232560636070BD0229AE
-:10619000F9D1406800F071F86368E060A360F2E74D
-:1061A00010B5046842680023022C01D1C3689B1813
-:1061B00089184160180010BD0368012B03DC426898
-:1061C00043698900CA50704742684B1E9B18494278
-:1061D00019404160704770B50C001500FFF7E0FFF3
-:1061E0000419002803D170BD05702D0A0130A042AA
-:1061F000FAD1F8E770B50D000400DCF757FB290071
-:10620000036A04222000984770BD70B50D00160087
-:106210000400DCF74BFB3200036A2900200098479A
-:1062200070BD70B50D000400DCF740FB2900036A67
-:1062300000222000984770BD70B50D000400DCF707
-:1062400035FB2A00836921001F20984770BD00B5E7
-:1062500089B001A8E7F776FE0120039B5B00184395
-:1062600009B000BD00B589B001A8E7F76BFE0120B9
-:10627000029B5B00184309B000BD10B5002104006B
-:10628000E7F7CAFE002804D1002C02D02000E7F76F
-:1062900087F810BD10B50021E7F7BEFE10BD10B5A0
-:1062A0000400FFF7EAFF002804D1002C02D02000F0
-:1062B000E7F776F810BD10B501220C00E7F7ACFF48
-:1062C000002804D1002C02D02000E7F769F810BDA7
-:1062D00010B5E7F7A1FF10BD10B5E7F737FF10BD08
-:1062E00004230122591A03008A40411D18781040E6
-:1062F00003D101338B42F9D170470120FCE710B57F
-:10630000012803D14868DCF72BFD10BD0020FCE715
-:1063100010B504210400FFF7E3FF03000420002B65
-:1063200006D103212000FFF7DBFF431E9841023016
-:1063300010BD002210B50369027642690400C360F3
-:1063400093420ED21878A37E2077002B02D005232B
-:10635000637605E0ECF792F8FFF7DAFF013060763C
-:1063600010BD202303771B3BF2E705235A43511846
-:10637000182903D100790007C00F70470722CB0806
-:10638000C01840791140084101231840F5E783798E
-:106390005A43511804224B08C018C0798900114093
-:1063A00008410F231840704710B584796243511893
-:1063B00004228C002240F0241441934049084118E3
-:1063C000C87904402343CB7110BDF7B506000C001B
-:1063D0001F000192BC420DDA019D089B9D4207DA25
-:1063E0002A00002321003000FFF7DEFF0135F4E72B
-:1063F0000134EFE7F7BD0B01194382794379534329
-:1064000001335B10C318984202D0C1710130FAE722
-:10641000704710B58379427900215A4301325210F6
-:10642000073002F0B5FC10BD10B50379DB0706D5C7
-:10643000FFF79BFF030009205843C0B210BDFFF7D0
-:10644000A6FFFBE702790523D20700D48379180061
-:10645000704710B5FFF7F6FF43000120184310BD49
-:1064600002790523D20700D4437918007047F0B5AC
-:1064700093B00493189B0392DC43199AE4172340CA
-:106480000593D343DB171A401A9B0D905E42039B82
-:10649000029109929E4200DA1E00F343DB171E4070
-:1064A000029B0D989C79039BE7181A9BFF1AFFF734
-:1064B000C9FF039B059A9D18BD4200DD3D0006956E
-:1064C000854200DD0690029B0D985D79FFF7C8FFBD
-:1064D0001A9B1A9ADB43DB171A401B9B0A92DB4379
-:1064E0001B9ADB171A400B921A9A059B9446634439
-:1064F0000793A34200DD0794099A1B9B94466344CB
-:106500000893AB4200DD0895069B9E421ADA1B9B5E
-:106510005C42049B9C4200DA1C00E343049ADB17B4
-:1065200094461C40049B1B9AED18099BAD1A6344CA
-:106530009D4200DD1D000595854200DD0590059B0F
-:106540009C4209DB089B0B9A00930A99079B0298CF
-:10655000FFF73BFF13B0F0BD039B1A9A93422FDC69
-:10656000069B5D1E731E0E9301235B4209931B9ACB
-:10657000049B934229DC059B013B0F93631E109300
-:1065800001235B4211931A9B039AEB189B1A0C93FD
-:106590000E9BAB4225D00F9F109BBB421AD03A00F6
-:1065A00029000D98FFF740FF04991B9A0300521A27
-:1065B000D2190C990298FFF7F7FE119BFF18EBE731
-:1065C000069B35000E930123D0E7059B0F94109393
-:1065D0000123D7E7099A099B9446ED180C9B634465
-:1065E000D5E71A9B039A0A999D1A1B9B049AAE1928
-:1065F0009F1A069B3C19ED18059B0B9AFF180298F1
-:1066000033000097FFF7E1FE089B3A0000930A99D8
-:106610002B000298FFF7D9FE089B22000093290067
-:10662000079B0298FFF7D1FE0094079B0B9A31005D
-:106630008DE7F0B50B6887B048680D000493DCF770
-:106640001DFA0590A868DCF719FA0700E868DCF77E
-:1066500015FA04002869DCF711FAE343C543DB1798
-:10666000ED171C40054029002000EBF721FF002317
-:1066700006000393029301000195049800943B00E7
-:10668000059AFFF7F4FE300007B0F0BD10B5FFF734
-:10669000E7FE43000120184310BDF7B50600FFF7E1
-:1066A000D1FE00903000FFF7DBFE010007000098EC
-:1066B000EBF7FEFE00240190BC4212DA0025009B9D
-:1066C0009D420CDA290022003000FFF7ADFE2900C0
-:1066D000030022000198FFF767FE0135EFE7013460
-:1066E000EAE70198FEBD10B5FFF7D7FF10BDF7B57B
-:1066F0000600FFF7A7FE00903000FFF7B1FE019003
-:1067000001000098EBF7D4FE00240700019B9C4297
-:1067100013DA0025009B9D420DDA2900220030008B
-:10672000FFF782FE092329001B1A22003800FFF719
-:106730003BFE0135EEE70134E8E73800FEBD10B559
-:10674000FFF7D5FF10BDF0B585B0170004000E00AF
-:10675000FFF778FE0100EBF7ABFE05002000FFF726
-:1067600071FE002301900393029300903B002000F0
-:1067700032002900FFF77BFE280005B0F0BD10B500
-:1067800004000800DCF77AF9002201002000FFF77E
-:10679000DAFF10BD10B504000800DCF76FF9002225
-:1067A00041422000FFF7CFFF10BD10B504000800E4
-:1067B000DCF764F9002102002000FFF7C4FF10BDE0
-:1067C00010B504000800DCF759F90021424220000E
-:1067D000FFF7B9FF10BDF7B507000800EBF74EFE55
-:1067E00004240600042300251B1B0193735D012272
-:1067F000234113400832534301992A0038000135E0
-:10680000FFF7D2FD052DF1D1013CEBD2F7BD13B559
-:10681000040001A94068DAF7F3FFA2680199002398
-:106820008A4207D2815CE068FFF7D5FFA368013395
-:10683000A360E368180016BD73B504000E000020C5
-:10684000042A0FD101A96068DAF7DAFF00230500F6
-:10685000320001992068DCF7E9F9295CA068FFF7AC
-:10686000BAFFA06876BD052170B505000800EBF7FA
-:106870001FFE04002900FFF7AEFF200070BD10B519
-:10688000140008001100E2F765FF200010BD04604D
-:1068900045608660C7604146016149464161514695
-:1068A00081615946C161614601626946416268463B
-:1068B0007047816810B5C3688C6802000020A3424D
-:1068C00004D2C968980001334058D36010BDF0B5B8
-:1068D00085B001900E0000920293EAF751F8019BF7
-:1068E000B34201D305B0F0BD019B3768043B03936D
-:1068F000009B002B04D039001800FEF73BF807007E
-:106900003500039B1C1DA5420AD9009B2168002B62
-:106910001AD13A001920E6F761FD029B984211D086
-:10692000043DAC421BD2009B002B12D12A683900D7
-:106930001920E6F753FD029B9842F1D023682A689C
-:1069400022602B600394DCE70098FEF713F8010047
-:10695000DFE729680098FEF70DF80200E7E72368F3
-:106960003268039F22603360341B019BA410EB1A32
-:10697000013C08379B10A34209DA2900029B009AC8
-:106980000198FFF7A4FF35002E000197A7E7380014
-:10699000029B009A3100FFF79AFF019FF4E710B5C0
-:1069A0000C6802000B00E068A168EBF725F810BD49
-:1069B00070B5040008000021E6F7D8F805002800AB
-:1069C000E6F736F901002000002900D170BDEDF78F
-:1069D00003FCF4E710B50A008168C068FFF759F9B5
-:1069E00010BD70B505001020FFF747FC040029001A
-:1069F000EDF72CFD200070BD73B50D0000241100D3
-:106A00001E000094012322002800EBF755FCA5424C
-:106A100003D12800FFF7E5FF76BD2000FFF7E1FF77
-:106A20003168FFF7C5FFF7E770B50D000400FFF709
-:106A3000D8FF002D03D00023A400A34200D170BDD5
-:106A4000E958C268D1500433F7E710B5C1688068CF
-:106A5000FFF7EAFF10BD83680B60C36813607047DF
-:106A60008160704770B50023150004000A0081683A
-:106A70000068DCF7DBF8E3688000C55070BDF7B54F
-:106A80001C000125002A02D1431EE418023D002209
-:106A90000023002906D000230027E356DE0F002341
-:106AA0007242BB4100210DE0160E00961E020196B7
-:106AB000267817023E433200009F019E64193E4330
-:106AC000330001318142EFD11000190003B0F0BD55
-:106AD00013B514000193130001AA002908D1020084
-:106AE00001A9200002F038F913BD815C197001334F
-:106AF0000138FAD2F8E770B50C00512826D010D82A
-:106B0000482820D004D8012814D0422812D070BDC3
-:106B10004C2803D0502801D04928F8D192001351B5
-:106B2000F5E768280FD007D864281BD0662813D053
-:106B30006228ECD1A354EAE76C28EFD0712805D085
-:106B40006928E4D1EAE752001353E0E7D200A21823
-:106B50001360DB175360DAE718009500F4F752FA78
-:106B60002851D4E7D20018008C18F5F7EBFF20600D
-:106B70006160CCE710B50B7901215B001943E6F7A2
-:106B80002DFC10BD10B50023012806D00B79012182
-:106B90005B001943E5F782FE0300180010BD026890
-:106BA00013783E2B05D83C2B05D2212B07D0402350
-:106BB00003E0402BFBD101320260180070473E23F6
-:106BC000F9E7F7B505000668741C20780194E1F731
-:106BD0004FFDA71B030001340028F6D139002868B7
-:106BE0000A22DBF7BBFC019B40102B60FEBD73B596
-:106BF000DAF7F0FD00906846FFF7D1FF00240600A9
-:106C0000009B1878002803D164000130204376BD32
-:106C1000E1F72EFD0125002803D06846FFF7D1FFDC
-:106C20000500009B1978732904D16419009B013376
-:106C30000093E5E701AA3000EDF768FD019B5A1EBD
-:106C40005B42013DF2D314191C400419F9E710B559
-:106C500008001100E2F78CFD10BD70B505000800BA
-:106C60000E0002F0E9F8041E04D002006B68310047
-:106C700028689847200070BDF0B58DB0049314AB20
-:106C80001B78070003930F23080004A95B18002159
-:106C9000139E19708A4223D088421DDA2D22404269
-:106CA0001A700F25129B0A3B05930499F3F7AAF873
-:106CB0000A0084463032092901D9059A5218102356
-:106CC00008A94C1904A9C9184A55002D10D06346CB
-:106CD000013D002BE9D10BE0B2072ED52B221A7013
-:106CE0000028DED130221F2408ABDA7304ABE4188D
-:106CF0000F21402504ABC91835400B78002D20D05A
-:106D00000025AB420BD00122039B01920093380077
-:106D10003300EEF72DF80500159B013B15930CABE6
-:106D20001A1B159B21000193039B3800009333002D
-:106D3000EEF71EF828180DB0F0BD7207D0D520224E
-:106D4000CDE7002BEBD008AA9442E8D9013C237090
-:106D5000E5E7F0B51F008DB012AB1B7802900393EE
-:106D6000081C2B23B90702D47B07DB0F5B010193BF
-:106D7000149B04AC0093210013002022E5F72AF8AD
-:106D80000600FB0507D5431C1F2B04D825222254DF
-:106D900000221E00E254402521003D4012D0002375
-:106DA00022781D002F2A0DD801220093019202980B
-:106DB000EDF7DEFF09210500139B013E013B139314
-:106DC00002ABC918139B32000193039B02980093F6
-:106DD0003B00EDF7CDFF28180DB0F0BD0EB403B5A4
-:106DE00003AA02CA0192EEF73DF902B008BC03B053
-:106DF0001847802340109B05C018C0234910401A33
-:106E000080001B064008C01801231843704713B5C3
-:106E1000040008001100002213000092EBF74CFA66
-:106E20006368984716BD37B51C0000230500009322
-:106E30000133080011001A00EBF73EFA6B68206876
-:106E400098473EBD37B51C00002305000093023370
-:106E5000080011001A00EBF72FFA03CC6B68984773
-:106E60003EBD37B51C000023050000930333080026
-:106E700011001A00EBF720FA07CC6B6898473EBD6B
-:106E8000F0B51D0000230F000600012485B000931B
-:106E90004368110038001A00EBF70EFAB3681C4380
-:106EA000002F05D1A047F168EDF728F905B0F0BD36
-:106EB0002868012F03D1EEF745FDA047F3E7022F25
-:106EC00009D1EEF73FFD07006868EEF73BFD0100D2
-:106ED0003800A047E7E7032F0ED1EEF733FD070098
-:106EE0006868EEF72FFD0290A868EEF72BFD029977
-:106EF00002003800A047D6E7EEF724FD07006868D7
-:106F0000EEF720FD0290A868EEF71CFD0390E868FC
-:106F1000EEF718FD039A030002993800A047C2E774
-:106F2000F0B50D001700040001798288C90787B009
-:106F3000C90F1E005208C388009128003900EBF7E2
-:106F4000BBF92379DB070CD5AA00B218390003A8D6
-:106F5000FCF760FAA36803AA31002800984707B03D
-:106F6000F0BDA368310028009847F8E710B5FBF79B
-:106F700035FEFBF72DFE10BD10B58068FBF72EFE29
-:106F8000FBF72CFE0430FFF7F1FF10BDF0B585B024
-:106F90001D000AAB1B7817000393039A0368029045
-:106FA00000911B6B920719D55B68002401932C603C
-:106FB000002F10D02B003A0000990298019EB04794
-:106FC000002808D0431C0BD12B680B2B03D1002CBD
-:106FD00001D000232B60200005B0F0BD1B68E4E762
-:106FE0000122039B134205D1009B3F1A1B180093FB
-:106FF0002418DDE70400EEE710B50022EEF766FD89
-:1070000010BD30B50C0087B00500012203A96068EF
-:10701000DBF7EEFE032D12D1A068DBF75BFD00214C
-:10702000049B5A1A01930492824200D90200039BE6
-:10703000206859180223EEF7C3FE07B030BD042DB7
-:107040000BD1A068DBF746FD0500E068DBF742FDE9
-:107050000499A942E4D92900E2E701200021404235
-:10706000DEE770B5050043680120C9182B680600EB
-:1070700099420FD92B7B0340002083420AD107237A
-:10708000103199430831A8680C00FFF714F9A86083
-:1070900030002C6070BD70B50E00110004001500AA
-:1070A000FFF7DFFF002807D1237BDB070ED56368DE
-:1070B0002568AB420AD2ED1AA368626831009818BD
-:1070C0002A0001F052FE63685D19656070BD10B55D
-:1070D0000400002900D10131002321606360080011
-:1070E000FFF7CBF80122237BA0609343237310BDED
-:1070F00070B50D0004000131FFF7E9FF656070BD58
-:1071000000238260027B43600133134301600373F9
-:107110007047037B10B50400DB0702D48068FFF7DB
-:10712000DBF80023A36010BD027B70B500230400D0
-:107130000D00D20709D403688068C918FFF7BBF8AF
-:107140002168A060431849192160180070BD70B50E
-:1071500004000D00FFF785FF031E04D06168A368DB
-:107160005B1849196160180070BD0368426810B56A
-:107170000400934205D00023A26861685354A068BC
-:1071800010BD0121FFF7D0FF0028F4D1F8E710B5BA
-:107190000C000121FFF7DBFF002800D0047010BDB8
-:1071A00070B5050008000C0001F046FE2100020049
-:1071B0002800FFF770FF70BDF8B54668040017009F
-:1071C00035008E4200D90D00002F0FD0390020006D
-:1071D000FFF747FF00280BD0A0687B194119721BED
-:1071E000C01801F0C2FD6368DF196760A06840192C
-:1071F000F8BD10B514000122FFF7DEFF002800D013
-:10720000047010BD10B514000122FFF7D5FF00284F
-:1072100000D0047010BD43688B4202D2002343604B
-:1072200070475B1AFBE770B5040015006268080040
-:107230008A4203D949198A4201D8606070BDA368A7
-:10724000121A521B5918181801F08FFD63685D1B44
-:107250006560F3E77FB40C1C03265643351CA0235E
-:107260000C21DB0305331B025A180833011CEFF312
-:10727000108640B472B608E01960064200D1116071
-:10728000760807D10134013D05D08026C046116043
-:107290002078F1E7FBE7116040BC86F310887FBCE3
-:1072A0000020704710B5EEF715FE10B50400006819
-:1072B00000F086F8200010BD70B5060008000D0033
-:1072C00001F0BAFD04000530F1F726F9306000F056
-:1072D0006AF8336829005C803068621C043001F071
-:1072E0003BFD70BD70B50B68040000680D0098424E
-:1072F00005D000F065F82868206000F057F82000FD
-:1073000070BD0022914207DB03680222985E0022D2
-:10731000884201DD5B181A7910007047002310B510
-:1073200003600400EEF78EFFA060E160200010BD56
-:1073300070B50180428004001D00EEF783FFA0605D
-:10734000E160002D02D02000EEF7DCFF200070BDD0
-:1073500010B50400006800F033F8200010BDF8B547
-:10736000D443E4171440050020000C301F000E0029
-:10737000F1F7D2F8286000F016F82B681C722B6821
-:107380005F60002E05D0286822000930310001F02E
-:10739000E3FCF8BD002310B504000A001900FFF754
-:1073A000DEFF200010BD03230380704710B50400EA
-:1073B000EEF7CEFF002802D123880233238010BDD0
-:1073C00010B50400EEF7C4FF002805D12388023B66
-:1073D0009BB2012B01D0238010BD2000F1F7D0F823
-:1073E000FAE770477047036870B5040001811B6AB3
-:1073F0009847236805005B69200098472081280092
-:1074000070BD00897047036870B5040081721B6A03
-:10741000984723680500DB6920009847A072280080
-:1074200070BD807A70477047704710B50400102116
-:1074300001F019FC200010BD10B50400442101F03A
-:1074400012FC200010BDC3680169426949435B43D7
-:1074500052435B18981870477FB50400FFF7F3FF9D
-:107460002500902306001B04313598422AD9638FEA
-:10747000002B07D1013308221B216846FFF758FF74
-:107480000123638790239B049E4219D9A38F002B6D
-:1074900007D1013309221B216846FFF749FF012369
-:1074A000A3878023DB049E420AD9E38F002B07D1F8
-:1074B00001330A221B216846FFF73AFF0123E387C5
-:1074C00000232B702B78042B0ED801332B70200057
-:1074D000EFF726F802000B280BD1628601231B214F
-:1074E0006846FFF725FF15E00023E387A38763873E
-:1074F000EDE72300A18E303381420CD11A78042AA3
-:1075000001D801321A70A28E618E914202D01B788E
-:10751000042BE2D87FBDA0860022F3E730B504003B
-:10752000036A8BB0009302AD416A8269C369280087
-:1075300000F06EFF23000C3307CD07C30222A379AE
-:1075400020009343A371FFF787FF0123A1881A004E
-:1075500006A8FFF7EDFE00200BB030BD70B50500AA
-:107560000B680C0008005B6A98472B000C3407CCB2
-:1075700007C3280070BD10B5040003685B6A984714
-:10758000E06810BD10B5040003685B6A9847206985
-:1075900010BD10B5040003685B6A9847606910BDB0
-:1075A00010B5040003685B6A9847A3799B0702D46F
-:1075B0002000EFF77FF8A06A10BD10B50400036843
-:1075C0005B6A9847A3799B0702D42000EFF772F813
-:1075D000E06A10BD408E7047036870B504000181F9
-:1075E0001B699847236805009B6920009847208104
-:1075F000280070BD00897047704710B5040048210D
-:1076000001F031FB200010BD30B50400436BC268AF
-:1076100001699A1A83698BB05A43836B92125B1A81
-:10762000C16942634B439B128363C16B406902ADE6
-:10763000091A206A41438912E16300912800216CF4
-:1076400000F0E6FE2300283307CD07C30123A188FD
-:107650001A0006A8FFF76CFE00200BB030BD002317
-:1076600010B58371643303810368040081801B6952
-:1076700098470222A37993431A0001231343A3716D
-:1076800010BD84B030B5069303000491059204AC9C
-:107690000C3326CC26C326CC26C322681A600223CC
-:1076A00082791343837130BC08BC04B018470300CF
-:1076B00030B50C3134C934C334C934C30A681A60D4
-:1076C00030BD022380791840704704238079184028
-:1076D000704780220023D2008261C26102620222CE
-:1076E000C36003614361436283799343837170474D
-:1076F0004164704773B50C00050016000B68080064
-:10770000DB699847E36B280001960093626BA36BDB
-:10771000216C00F03EFE280076BD70B505000B68B8
-:107720000C000800DB6998472B00283407CC07C3FE
-:10773000280070BDF0B587B0010003A8FFF7EDFF8A
-:107740000398F5F7FFF9040004980D00F5F7FAF92E
-:10775000060005980F00F5F7F5F922000090019159
-:107760002B0020002900F4F7FDFB320004000D007F
-:107770003B0030003900F4F7F5FB02000B0020005D
-:107780002900F3F7C9FC009A019B04000D001000CA
-:107790001900F4F7E7FB02000B0020002900F3F7C3
-:1077A000BBFCF5F78FFEF5F797F907B0F0BD10B504
-:1077B00004000368DB699847A06A10BD10B5040097
-:1077C0000368DB699847E06A10BD10B504000368E0
-:1077D000DB699847206B10BD82B030B5050085B0DD
-:1077E000089202A80822099301F0B6FA039B029CB2
-:1077F0005A10AD18DB0701D52B681C590AA90822BD
-:10780000684601F0A9FA089A099B2800A04705B02C
-:1078100030BC08BC02B01847F8B50A6803680E000F
-:107820000700981AF3F7EEFB72687B68051C981A3C
-:10783000F3F7E8FBB368041CB868C01AF3F7E2FB7F
-:10784000291C061C281CF3F7B1F8211C051C201C60
-:10785000F3F7ACF8011C281CF2F736FD311C041CB0
-:10786000301CF3F7A3F8011C201CF2F72DFDF8BD26
-:10787000F0B585B0019002910392FFF7CDFF01278B
-:10788000041C061C039B9F4217DA0C217943029BC0
-:1078900001985918FFF7C0FF051C011C201CF2F7C6
-:1078A00005FC002800D02C1C291C301CF2F7EAFB38
-:1078B000002800D02E1C0137E4E7211C301CF3F710
-:1078C000A7F905B0F0BDF0B58BB009938023DB00BC
-:1078D0000024C36003614361002305000C27079166
-:1078E000089204604460846084610293119B9C420E
-:1078F00065DB00270023109C0593019700973E1C31
-:10790000059B119A934270DA210007A8FFF784FFC4
-:10791000F6F7F8F9011C03900298F2F76FFEFE21CA
-:107920008905F3F775F90490301CF3F74BFB06005B
-:107930000498F3F747FB864200DA06003000F3F7BD
-:1079400061FB2368079A061C981AF3F75BFB0399FF
-:10795000F2F754FE400004994008F3F727F8011CA1
-:107960000098F2F7B1FC089B00900693069A6368B2
-:10797000981AF3F747FB0399F2F740FE4000049989
-:107980004008F3F713F8011C0198F2F79DFCA36877
-:10799000019009980C34181AF3F734FB0399F2F7A5
-:1079A0002DFE400004994008F3F700F8011C381C34
-:1079B000F2F78AFC059B071C01330593A0E7390009
-:1079C0006143109B07A85918FFF726FFF6F79AF9AD
-:1079D000F3F7F8FAF3F716FB0299061CF2F766FBC9
-:1079E000002800D00296013480E70099081CF2F7C5
-:1079F000DDFF0199041C081CF2F7D8FF011C201CB4
-:107A0000F2F762FC391C041C381CF2F7CFFF011C92
-:107A1000201CF2F759FCF6F775F9041C011C0098BC
-:107A2000F2F7ECFD311CF2F7C1FFFE218905F2F7F8
-:107A30004BFC8921C905F2F7B9FFF3F7C3FA211C02
-:107A4000E8600198F2F7DAFD311CF2F7AFFFFE2192
-:107A50008905F2F739FC8921C905F2F7A7FFF3F789
-:107A6000B1FA211C2861381CF2F7C8FD311CF2F76D
-:107A70009DFFFE218905F2F727FC8921C905F2F750
-:107A800095FFF3F79FFA079B68612B60089B0298AC
-:107A900000936B60099BAB60F3F794FAA861280030
-:107AA0000BB0F0BDF0B50025040017000B002E0050
-:107AB00028002A0091B00791BA4208DA1968013209
-:107AC00040185968761899680C336D18F4E7390036
-:107AD000F2F79CF9390020603000F2F797F939008D
-:107AE00060602800F2F792F93A00A0600799200040
-:107AF000FFF7BEFE00260DAB0A900596069603938F
-:107B0000C8235B420493C8235B420293C8235B42B1
-:107B100001932200039B23CA23C32268049B94463B
-:107B2000039A6344136062681D009446029B039AA3
-:107B300063445360A26808939446019B039A63448C
-:107B4000936007993A0003980993FFF791FE0A9909
-:107B50000B90F2F797FA002805D0089B099E059331
-:107B60000B9B06950A93019BC83301931A00C82307
-:107B70005B009A42CDD1029BC83302939342C5D198
-:107B8000049B029AC83304939342BCD12368069A9B
-:107B9000934206D16368059A934202D1A368B34227
-:107BA00005D0069BA6602360059B6360A8E72000C4
-:107BB00011B0F0BD70B504000D00160086B003A82A
-:107BC000FFF770FF2000019600950399049A059B2A
-:107BD000FFF779FE200006B070BD4A6810B553105B
-:107BE000C0180B68D20701D50268D358984710BD5A
-:107BF00010B50021406C00F0EDFF10BD10B5040081
-:107C0000EFF7E0F92000782101F02DF8200010BDF9
-:107C100010B50400EFF7C8F92000302101F023F877
-:107C2000200010BD70B50500040074350121280046
-:107C3000F0F7EAFD2200563213780133DBB21370FD
-:107C4000E17901318B4222D1002326001370226D8D
-:107C500054360221525E33882021934205DA2000F7
-:107C600019B25030FFF74DFB0100E27900232800E4
-:107C7000F0F784FD226D33880221525E934207DDC6
-:107C80002300002248331A702000EFF7A5FA70BDD8
-:107C900001333380FBE770B505000600826D5C356B
-:107CA0000221525E2B88040074362021934204DAAC
-:107CB00019B25830FFF725FB0100002330001A00ED
-:107CC000F0F75CFDA26D2B880221525E934207DD26
-:107CD0002300002248331A702000EFF77DFA70BDB0
-:107CE00001332B80FBE773B50400060025007436D2
-:107CF0003000643500F0B4FB0023EA5E210000236D
-:107D000060310093300000F0BBFB002804D1230059
-:107D10006C331B78002B0AD16622A256002A06D0AB
-:107D20002B886C349B182B800123237073BD230098
-:107D3000002248331A702000EFF74EFAF6E7F0B54C
-:107D400006000021050004006636006E715640886A
-:107D500064350023EA5E4B1D1B1A200085B06C3091
-:107D600003909A4210DC0378002B0DD01C3D2B7839
-:107D7000062B02D1083000F073FB002320002B708B
-:107D8000EFF72AFA05B0F0BD27007437002A04DDAA
-:107D9000494209B23800F0F737FD0023EA5E2100BE
-:107DA000002360310093380000F06AFB0023F35693
-:107DB000002B05D12200483213702000EFF70CFA97
-:107DC0000123039A137000232A88F3569B182B80F3
-:107DD000D8E770B5050048352B780400002B31D06A
-:107DE000EEF7E8F922004C3213881818230080B20D
-:107DF00010804A331B88834224D8002313802B78B9
-:107E0000022B02D12000FFF70DFF2B78032B02D1AC
-:107E10002000FFF740FF2B78042B02D12000FFF752
-:107E200062FF2B78052B02D02B78062B02D1200085
-:107E3000FFF785FF2B78072B04D1002320002B7040
-:107E4000EFF7CAF970BD1FB5036F827A9B68040013
-:107E500001339A4208D18188012302226846FFF744
-:107E600067FA0023A3721FBDEFF73CF92000FFF76C
-:107E7000B0FFA37A0133F5E710B583790400DB077F
-:107E800004D5027B022A02D1FFF7DDFF10BD837A01
-:107E9000016F0133DBB2837289688B4201D1002309
-:107EA0008372002A02D12000EFF71CF9237B012BFB
-:107EB00005D1637300232000A373EEF7F7FF2000C2
-:107EC000FFF787FFE2E7407A7047F0B5837987B024
-:107ED00004000D00DB0703D5002903D007B0F0BD77
-:107EE0000029FBD01023216F01278A68CB569818F0
-:107EF0000022984204DD3E009E4001333243F8E701
-:107F00001123C868CB56012700211818984204DDB8
-:107F10003E009E4001333143F8E70A43002D09D06B
-:107F20000123002101A8F1F7F7F90123A2791343F6
-:107F3000A371D3E72B00290001A8F1F7EDF929007F
-:107F400001A800F012FE0122A3799343F0E710B5D7
-:107F50000121FFF7BAFF10BD10B50021FFF7B5FFF3
-:107F600010BD10B5743000F07BFA10BD10B50400E0
-:107F7000F0F70AFE00232000237510BD1FB503ACE7
-:107F8000637000232270009322000233EFF7C0F9E0
-:107F900004B010BD1FB50F2401236C4400932300CF
-:107FA000EFF7C6F9002800D1207804B010BD4A6868
-:107FB00010B55310C0180B68D20701D50268D3580A
-:107FC000984710BD82B030B5050085B0089202A870
-:107FD0000822099300F0C0FE039B029C5A10AD18C2
-:107FE000DB0701D52B681C590AA90822684600F056
-:107FF000B3FE089A099B2800A04705B030BC08BC16
-:1080000002B0184770B504000D001822002100F0DE
-:10801000BFFE2900200000F093FC200070BD036823
-:10802000426880689B1810B518180321F1F7EEFE1E
-:108030004B2800DA4B20A9235B00984200DD180092
-:10804000181A0821FF23FF315843F1F7DFFE10BD56
-:1080500013B50C0001A8EFF75BFC210001A8EFF7B6
-:1080600069FC13BD73B50D0014001E0001A8EFF7E5
-:108070004FFC33002A00210001A8EFF791FC73BDEB
-:10808000802307B55B05009101921A695B69694617
-:10809000133B5A430223FFF7E5FF07BD84B010B539
-:1080A0000492802203910593520513695169526924
-:1080B0001139133A5A434B430F99CB1AD21803A9DB
-:1080C0000C23FFF7CFFF10BC08BC04B01847802377
-:1080D0005B05F7B51A695B690191113B5A43009240
-:1080E000EFF70AFB0600041E23D0302000F0CAFD83
-:1080F000302200210400002500F04AFE30273B001A
-:108100006B4300990831C918B5420BDA3A002000D8
-:1081100000F022FE2100019800F084FE002808D023
-:108120000135ECE7B54204D12000302100F09BFD81
-:1081300000242000FEBD10B509680431EFF70CFBE8
-:1081400010BD29DF704728DF704710B503685B6AF0
-:10815000984710BD10B50400EFF7E2FC2000A42101
-:1081600000F081FD200010BD10B5C9B20D22FFF74F
-:1081700011FFC7384342584110BD10B503685B6A10
-:10818000984710BD10B50400EFF70CFE20005C21ED
-:1081900000F069FD200010BD10B5C9B20D22FFF737
-:1081A000F9FE5A384342584110BD10B50368DB69E7
-:1081B000984710BD10B50400EFF76AFE200060215B
-:1081C00000F051FD200010BD10B5C9B20722FFF725
-:1081D000E1FEC4384342584110BD10B503685B6AE4
-:1081E000984710BD10B50400EFF76CFF20005C212C
-:1081F00000F039FD200010BD10B5C9B20F22FFF705
-:10820000C9FE33384342584110BD10B50368DB69DD
-:10821000984710BD10B50400F0F708F82000602161
-:1082200000F021FD200010BD10B5C9B24F22FFF7AC
-:10823000B1FE40384342584110BD72B60B6801652B
-:10824000002B05D143658365086062B67047130053
-:108250005A6D002AFBD1586583654265F5E7036DC9
-:10826000002B0FD072B6826D436D002A0BD0536580
-:10827000436D002B01D0826D9A65002343658365B1
-:10828000036562B67047026D1360F1E770B50500D3
-:10829000EFF30884C36B006C1C1B6B6C1B1A9C42B5
-:1082A0000CD91F2320349C43002801D0F0F768F933
-:1082B0002000F0F731F928640019686470BD10B52A
-:1082C000F0F756F8F0F76CF8FAE7F0B58208830794
-:1082D00003D1031E02D11800F0BD0132541C72B646
-:1082E000802621C93606854225D90368002B02DB8A
-:1082F0009B00C018F7E75B005B08990041180F6806
-:10830000002F08DA8D4206D931007F007F08DB1983
-:1083100019430160F1E7A342EAD302329A4203D241
-:1083200092008218954209D803685B005B080360DD
-:1083300062B6031DCFE762B60023CCE7191B80238A
-:108340001B06043A0B4313600460F1E710B5080004
-:10835000F0F7E2F810BD10B50800F0F711F910BD04
-:1083600010B5838804009B0703D51821806800F0AE
-:108370007AFC200010BD10B5F0F72AF9406810BD56
-:1083800010B5F0F725F9006810BD01704270436028
-:10839000704782B0F0B505920200069308AB1B78D7
-:1083A00005ACE0CCE0C2002B1ED04A78002A05D0F4
-:1083B000069A52424260079A524282604A68022AF2
-:1083C00016D0032A1AD0012A04D102684168524209
-:1083D00001604260012B17D0022B05D143685B423C
-:1083E000436083685B428360F0BC08BC02B01847FE
-:1083F00002685242026042685242EAE742680168FB
-:10840000524202604160E5E7426803680260E7E7C4
-:1084100082B037B50400180007930B7806920193D9
-:10842000089B009303002000FFF7B3FF20003EBC31
-:1084300008BC02B0184710B504000068FEF7C0FF82
-:10844000200010BD10B50A00002100F0A1FC10BDF5
-:1084500010B5040008682060FEF7A8FF200010BDDA
-:1084600010B500684388818806305943FFF7EAFF5A
-:1084700010BD10B504000023F0F70AF9200010BD6C
-:10848000F0B587B003910CA9097807000491016841
-:108490000020029149888C468A426BDA02998988C9
-:1084A0008B4267DA039C266874880194141900943F
-:1084B00084425FDDB5885C19059484425ADD8242AE
-:1084C00005DA0098604509DD6046009006E06046E8
-:1084D000801A0090040001988442F6DC002B2FDA09
-:1084E000059C8C4200DD0C00B01D0026D1175542C2
-:1084F0002940B34202DA019D6E425E43029D761826
-:1085000086190635111C002A00DA0021002209B262
-:10851000934201DD62465A43049B51186D18002BAB
-:108520001DD000221000A24224DA002300998B42C1
-:108530000BDAF15C002901D0E95401300133F5E791
-:10854000CC1AAC42D0DD2C00CEE7039B01321B6875
-:1085500001935B88F6183B685B88ED18E3E7049BA2
-:108560000193019BA34207DBE043009BC01720401F
-:108570004343180007B0F0BD31002800009A00F016
-:10858000EBFB039B1B6802935B88F6183B685B88D8
-:10859000ED18019B0133E3E710B5040000F024FB64
-:1085A000200010BD51DF704761DF7047F8B506004D
-:1085B0000F0004001518AC4200D1F8BDBB1B195DBB
-:1085C0002000F0F79DFA0134F5E7F0B585B01C0006
-:1085D0000AAB0500039116001F78F0F7F7FA0123A4
-:1085E0005F400097230032000399280000F07DFAD5
-:1085F000201A441EA04105B0F0BDF0B585B01C00A6
-:108600000AAB0500039116001F78F0F7DFFA01238B
-:108610005F400097230032000399280000F023FAFE
-:10862000201A441EA04105B0F0BD836980681B6814
-:108630001840431E9841704710B5043000F0FFF910
-:1086400010BD704710B50400402100F00CFB200065
-:1086500010BD10B500F045F810BD10B500F046F89B
-:1086600010BD704718234A1C5A4359438218926818
-:10867000431810B5DB68002A03D1002B00D09847BF
-:1086800010BD002BFCD01031411818009047F7E7BF
-:1086900010B50400402100F0E6FA200010BD70B5CE
-:1086A0000D0004000430F0F727FFE56370BD10B53E
-:1086B000043000F0ACFA10BD70B50C0003001100DE
-:1086C0000430221E0AD0182215004D435D19EC60BB
-:1086D0004C1C62439B1800229A600132F0F758FF4D
-:1086E00070BD10B5043000F085FA10BD10B50C0057
-:1086F0000430F0F793FF200010BD10B5040043686C
-:108700004269991800F077F8E36A002B04D1A36955
-:10871000002B00D0984710BDA0690028FBD0210095
-:108720001C319847F7E710B5040000F06CF80023FF
-:10873000A361E36210BD70B50D00040000F063F8A2
-:108740006561206900F064F94119200000F053F8D8
-:1087500070BDC36A010010B58069002B03D10028E9
-:1087600000D0804710BD0028FCD01C319847F9E7A5
-:1087700010B50400F0F760FA2000302100F073FA21
-:10878000200010BD036810B50400002B05D1C0689F
-:1087900000F03EF901236060236010BD10B50400B5
-:1087A0000068002804D0E06800F032F96368C01A5D
-:1087B00010BD10B58468FFF7F1FF201810BD10B58B
-:1087C0000400C06800F024F900236060A36010BDBD
-:1087D000002310B50360436083600400F0F7F8FAEB
-:1087E000E0602000FFF7EBFF200010BD10B503682C
-:1087F0009B68984710BD10B50A000300011D006971
-:1088000000F0CEF810BD10B5011D006900F0E4F8CD
-:1088100010BD10B5022804D8802300209B014B60B6
-:1088200010BDF7F7A3FF0923036001204042F7E7DB
-:1088300010B50120F7F7A0FF7047704710B5FFF79C
-:10884000FCFFFFF7F9FFDAF7BDFB10BD10B50028FC
-:1088500001D000F001F8FEE710B59AB0032102A89C
-:1088600000F06EF8022108A800F06AF801210EA8B5
-:1088700000F066F8102114A800F062F89624059B19
-:10888000039A20001A60099A0C9B1A600F9A129B97
-:108890001A60159A179B01921A6000F0C9F8069B9E
-:1088A000039A20001A60099A0B9B1A600F9A119B79
-:1088B00001921A60159A189B1A6000F0B9F8DEE769
-:1088C0000FB4012010B5F7F757FF70B50D00040085
-:1088D0001600F0F7F1FA6B1C07D00021200000F021
-:1088E000B4F83100200000F0AAF870BD70B54368FC
-:1088F00004000D00002A0AD0C26813602000012184
-:1089000000F0A3F82900200000F099F870BD02697A
-:10891000F3E710B50322FFF7D8FF10BD10B5FFF73E
-:10892000D4FF10BD70B50D0004001600F0F7C4FAB6
-:108930006B1C04D0320000212000FFF7D7FF70BD70
-:1089400010B50022FFF7EEFF10BD70B504000D005A
-:1089500003681B68984763681D6070BD036870B545
-:10896000DB680400984763685A682368002A02D1CC
-:108970009B68984770BD5B681568984763682D1AB7
-:108980005A68002D07DC916859601B68002BEAD0FB
-:1089900050689847E7E7236810681B699847E9E73C
-:1089A00070B50D0072B64B60002346680A607468AB
-:1089B000002C09D1002B0DD1036875601B691000D4
-:1089C0009847AC6062B670BD2168511AF2D423009A
-:1089D000A468EDE79D60F4E710B572B6426853688D
-:1089E0008B420DD19B6853600268002B03D19368C2
-:1089F000984762B610BD126918689047F9E71300EE
-:108A0000002BF6D09A688A42F9D18A689A60F0E71A
-:108A100010B503685B68984710BD70B50400F1F7A6
-:108A2000ABF80500F1F7A8F8401BA042FAD370BDDF
-:108A3000FA2310B59B005843FFF7EFFF10BD10B5A8
-:108A4000007840B200F081F810BD002902D0012961
-:108A500000D070470023A022C356D205C133FF3394
-:108A60009B009950F5E7F7B50192B1221E0003680B
-:108A70004910D20099508021012289005A501900D2
-:108A800000240500FC31CC601A60771E019BA742D0
-:108A90000BDCD91901222800F0F732FB002819D08D
-:108AA0002800F0F7F3FB3E0010E01919002228001F
-:108AB000F0F726FB00280BD02800F0F719FC060081
-:108AC0002800F0F7E3FB002E00DB26003000FEBD9F
-:108AD0000134DAE7089B002BF8D02B68FC339A6846
-:108AE000002AFCD000229A60F0E7F8B51700B12206
-:108AF0001C000368D2004910995080220025920082
-:108B00009D50012206009A60A54209DB069B002BBE
-:108B100004D03000F0F7D2FB002813D120000EE083
-:108B2000795D3000F0F7D8FA002809D03000F0F76E
-:108B3000ADFB3000F0F7DCFB002800DB2800F8BDBF
-:108B40000135E1E701204042F9E7A0238000DB0581
-:108B5000C018E02310B50C24DB00C2588900A243E2
-:108B6000C250C2581143C15010BDF8B505000E00E7
-:108B7000002401273B00A3402A691A4203D060B2B7
-:108B80003100FFF7E2FF01341F2CF3D1F8BD30B5FF
-:108B9000002902D001290FD030BD01220C001300A2
-:108BA0008B4005691D4203D005688B00EB181C60E3
-:108BB00001311F29F3D1EFE700230A009A4004692D
-:108BC000144203D004689A00A218116001331F2BCD
-:108BD000F3D1E1E70B00426810B514680169634006
-:108BE00019406140116010BD10B5407840B2F0F7F7
-:108BF000A7FB10BD03681A00FC32D1680129FCD123
-:108C00000021D160A322D2009858C0B270470368F7
-:108C1000FC33D868013843425841704782B0019014
-:108C2000C046C046C046C046C046C046C046C04614
-:108C3000C046C046C046C046C046C046019B013B38
-:108C40000193002BECD102B07047704770470023AE
-:108C5000CB565A1C01D1180002E0834201D148686A
-:108C600070470C31F3E710B500F001F810BD10B5F6
-:108C7000EFF786FC10BD0B0010B501001800F7F7E8
-:108C800067FD10BD10B5041E00D101342000EFF7C0
-:108C900043FC002807D1F1F70BF8002801D100F0C0
-:108CA00003F88047F2E710BD10B50620F7F7C0FEC5
-:108CB0000120FFF7CBFD70B568254A1E55430E0015
-:108CC00029007431FFF742FB041E08D000212A005E
-:108CD000016046600C30A060683200F059F8200056
-:108CE00070BDF7B504000700002601914834002C40
-:108CF00001D13000FEBD6368A5680093009B013B75
-:108D0000009301D52468F2E7AB89012B08D90E2224
-:108D1000AB5E013304D029003800019B984706431D
-:108D20006835EBE7C9B28218904201D10020704744
-:108D300003788B42FBD00130F6E730B50024A24225
-:108D400001D1002005E0035D651C0C5DA34201D04C
-:108D5000181B30BD2C00F2E7002310B59A4200D159
-:108D600010BDCC5CC4540133F8E710B5884202D979
-:108D70008B18984203D3002307E08B5C8354013A9D
-:108D8000FBD210BDCC5CC45401339A42FAD1F8E74F
-:108D900003001218934200D1704719700133F9E7AC
-:108DA00070B504000D001F2904D9162303600120AB
-:108DB000404270BD436C002B04D08A009B181A6897
-:108DC000002A08D1200000F015F82A000100200038
-:108DD000F7F738FEEDE70020012AEAD0511C03D155
-:108DE000162301302360E4E7002428001C6090472C
-:108DF0002000DEE710B5F8F717FB10BD10B50E2305
-:108E0000C95EF7F757FF10BDC9B20378002B04D035
-:108E10008B4200D170470130F7E74B42594149423C
-:108E20000840F7E702780B78002A03D001300131BF
-:108E30009A42F7D0D01A70470023C25C0133002A4F
-:108E4000FBD1581E7047002330B59A420AD0013A30
-:108E5000C45CCD5CAC4204D1934202D00133002CFF
-:108E6000F6D1631B180030BD936810B5013B9360C9
-:108E7000002B04DA9469A34207DB0A2905D01368A2
-:108E8000581C10601970080010BDF7F733FE010080
-:108E9000F9E7F8B506000F001400D518AC4201D16F
-:108EA000002007E021783A003000FFF7DDFF0134B1
-:108EB000431CF3D1F8BDF7B5150001938A680B691F
-:108EC00000900C00934200DA130022002B60433222
-:108ED0001278002A01D001332B6023689B0602D54B
-:108EE0002B6802332B60062723681F4027D02300FE
-:108EF00043331B785A1E93412268920630D42200D5
-:108F0000019943320098089EB047431C25D00623A0
-:108F100020682A68E16803400025042B03D18D1ADC
-:108F2000EB43DB171D40A3682269934201DD9B1AC6
-:108F3000ED180027BD4220D1002010E00137E36882
-:108F40002A689B1ABB42D2DD220001231932019903
-:108F50000098089EB047431CF0D101204042FEBD5E
-:108F60003020E1184331087021005A1C453109783E
-:108F7000A218433202331170C1E7220001231A32D2
-:108F800001990098089EB047431CE6D00137D1E70D
-:108F9000F8B5C046F8BC08BC9E467047F8B5C04658
-:108FA000F8BC08BC9E4670474FBB610567ACDD3F0F
-:108FB000182D4454FB21E93F9BF681D20B73EF3F00
-:108FC000182D4454FB21F93FE2652F227F2B7A3C78
-:108FD000075C143326A6813CBDCBF07A8807703C31
-:108FE000075C143326A6913CF08F0200C1010000FB
-:108FF00018B802000100000081010000000000001C
-:109000000000000000000000000000000000000060
-:109010000000000000000000000000000000000050
-:1090200000000000000000000000000018B802006E
-:10903000A2020000C50200005D0200000000000066
-:109040009101000000000000FD020000D9010000B5
-:10905000C10100000000000000000000000000004E
-:10906000000000000000000018B8020067020000C5
-:1090700000000000000000000000000000000000F0
-:109080000000000000000000000000002326020095
-:109090004914020000000000000000000000000071
-:1090A0000000000018B8020044020000DD030000C8
-:1090B000A915020000000000C5050000A50700007A
-:1090C0000000000000000000550300000000000048
-:1090D0000000000000000000000000007C91020081
-:1090E00018B80200B2020000DD030000A91502005A
-:1090F00000000000C5050000A507000000000000FA
-:109100000000000055030000000000000000000007
-:1091100000000000000000007C91020074EA0200E0
-:10912000B504000038EA02004905000038EA0200F0
-:10913000C1140200ECEA02000200FFFF5515020014
-:10914000ECEA02000200FFFF6105000074EA020081
-:10915000D104000074EA02009315020074EA0200D0
-:109160008915020074EA02007103000074EA02002B
-:109170000B16020074EA0200FB15020034C2020062
-:1091800097000000120000008C910200F60F000012
-:109190001C9102002E0C0000249102003E050000EC
-:1091A0002C910200761100004C9102004E1100003B
-:1091B000349102005611000040910200AE120000EE
-:1091C00054910200B61200005C910200CE12000021
-:1091D00064910200161300006C9102001E1300003F
-:1091E00074910200D61400001C9202002E1500009B
-:1091F00024920200461600002C9202004E16000037
-:1092000034920200DE1600003C920200FE160000BE
-:1092100044920200F60E0000A8E0020038EA0200C4
-:10922000A105000074EA02007105000074EA020062
-:10923000E314020074EA02001505000074EA02005B
-:10924000CF140200ECEA02000200FFFFED04000070
-:10925000609202000000000000000000000000001A
-:1092600018B8020013020000211700000D160000BC
-:1092700000000000000000009D1D00000000000034
-:1092800099150000CD0D0000000000008F250200A0
-:1092900000000000000000009C92020034C20200A6
-:1092A000B700000016000000AC920200E6110000BA
-:1092B0007493020056150000E89302009612000015
-:1092C0008C9302005E150000F49302004613000028
-:1092D000C0930200D6150000189402006E1500001D
-:1092E00000940200EE150000249402009E1100007C
-:1092F000689302002616000030940200D613000086
-:10930000D0930200761500000C94020006120000B3
-:109310008093020036150000DC9302000E1100005D
-:109320005C930200BE130000C89302000617000001
-:109330003C94020006130000B0930200BE1200002D
-:1093400098930200C6120000A093020026130000AA
-:10935000B8930200F6120000A8930200ECEA0200A3
-:1093600004000400F1130000ECEA02000400030012
-:10937000A9120000ECEA020004000400A523020088
-:10938000ECEA02000300FFFF01250000ECEA020006
-:1093900004000400BF23020038EA0200591500004F
-:1093A00038EA02006915000038EA02008915000059
-:1093B00038EA02004915000038EA02007915000079
-:1093C00074EA02009110000038EA0200B5140000AF
-:1093D000ECEA020002000200E7230200ECEA0200CD
-:1093E0000600040003240200ECEA0200040004006A
-:1093F000B1230200ECEA020004000400CB230200C7
-:10940000ECEA020002000300F1230000ECEA020093
-:1094100002000200F5230200ECEA02000200030051
-:10942000B5220000ECEA020004000300451200002F
-:10943000ECEA020002000200D923020038EA02002E
-:10944000C514000038EA0200F525020005000000FE
-:109450000500000003000000090000000D040000EA
-:109460002203030018B802000D02000000000000F3
-:10947000000000007328020000000000000000004F
-:1094800000000000000000000000000000000000DC
-:1094900000000000000000000000000000000000CC
-:1094A00034C202001701000022000000B094020044
-:1094B000860F0000BE0000006E020000C8E402003B
-:1094C000FE0400001C0000209605000014BC0200F1
-:1094D0009E05000020BC0200C605000044E9020011
-:1094E0006E0600005C990200A6060000D4BD0200D2
-:1094F0006E0B000064000020EE0B00005400002002
-:10950000C6000000D4950200CE000000E4950200E1
-:10951000D6000000DC950200DE000000C8950200C5
-:10952000E6000000EC950200A60100006CA202001B
-:10953000AE010000B4A20200B6010000C4A2020005
-:10954000BE010000CCA20200C6010000D4A20200AD
-:10955000CE010000DCA20200D6010000E4A202005D
-:10956000DE010000ECA20200E6010000F4A202000D
-:10957000EE010000FCA20200F601000074A202004D
-:10958000FE0100007CA202000602000084A202008C
-:109590000E0200008CA202001602000094A202003B
-:1095A0001E0200009CA2020026020000A4A20200EB
-:1095B0002E020000ACA2020036020000BCA2020093
-:1095C00058B10200A0940200ECEA02000000010081
-:1095D00029320000FCE90200A1310000FCE9020090
-:1095E0008528020038EA0200B1310000FCE90200DF
-:1095F000F1310000FCE902005D3B0000FCE90200E3
-:109600001D3A000038EA0200D93E0000FCE90200E1
-:1096100055380000ECEA02000100FFFF6D3B00003E
-:1096200034C202007F0000000F00000048960200D4
-:10963000FCE90200A139000038EA0200F93E00000E
-:10964000FCE9020061390000860F0000560D0000A1
-:109650004E0F00000C960200C60000000C9602009F
-:109660005E0D0000149602006E050000F4950200E5
-:1096700076050000FC950200660D00003896020099
-:109680006E0D0000C0960200760D000004960200E8
-:109690007E0D000030960200860D0000C896020084
-:1096A0008E0D000040960200CE0D00000500000067
-:1096B000D60D000001000000DE0D000003000000D8
-:1096C000FCE902006529020038EA02007329020061
-:1096D00058B102002096020092010000990100009A
-:1096E00058B10200E896020034C2020047000000B0
-:1096F00008000000F8960200860F000056160000D1
-:10970000CE0C00009C9702002E17000078970200F4
-:109710008E12000044970200CE1400008C970200C5
-:1097200096100000A6130000BE110000389702003A
-:10973000F61400006C970200ECEA02000000010041
-:10974000193F000018D5020002000000AE0C000016
-:1097500058970200D89602000CA0020003000000F7
-:10976000030000001300000005000000ECEA020006
-:1097700002000200393F00000CA0020003000000BC
-:10978000070000000900000001000000CC99020061
-:109790000000000008000000D74F0300CC99020031
-:1097A000000000000500000081040300FCE9020045
-:1097B0000D40000034C2020017000000020000004B
-:1097C000C4970200860F0000FE0000004E0F00004C
-:1097D000AC97020058B10200B497020018B802001A
-:1097E00034020000000000002D2A020000000000EA
-:1097F0000000000000000000000000000000000069
-:1098000023260200052A02000000000000000000DC
-:109810000000000000000000132B0200032B0200D8
-:1098200089470000D52A0200D142000018B8020082
-:1098300067020000000000000000000000000000BF
-:109840000000000000000000000000000000000018
-:10985000232602008F2B0200000000000000000001
-:10986000000000000000000058B1020070980200E3
-:1098700034C20200170000000200000080980200BD
-:10988000860F00002610000026100000B4B202006F
-:1098900018B80200CC00000000000000000000002A
-:1098A00000000000000000000000000000000000B8
-:1098B00000000000000000000000000000000000A8
-:1098C0000000000000000000CC98020034C202003A
-:1098D0004700000008000000DC9802007606000047
-:1098E0004C9902007E060000549902008606000092
-:1098F0001C9902008E06000024990200CE0500008B
-:1099000034990200D60500003C990200DE050000F3
-:1099100044990200960600002C99020038EA0200E1
-:109920008948000038EA02002148000038EA0200B5
-:109930007548000038EA02003948000038EA0200A1
-:109940004D48000038EA02006148000038EA020091
-:109950000549000038EA0200FD4700009098020027
-:109960000000000000000000954C0000854C000045
-:109970008D4C000058B102007C99020034C20200F4
-:1099800047000000080000008C990200860F0000CC
-:1099900016170000CE00000054E80200B6150000C3
-:1099A0004CE80200BE1500005CE8020086160000CC
-:1099B00074E802008E1600007CE8020076160000B3
-:1099C00064E802007E1600006CE8020018B802008D
-:1099D000C002000065510000E50F0000000000001B
-:1099E0002D5100009D1D0000000000002D530000BF
-:1099F00011510000000000008F250200000000004F
-:109A000000000000089A020034C20200B700000003
-:109A100016000000189A0200E6110000749302007C
-:109A200056150000E8930200961200008C93020085
-:109A30005E150000F493020046130000C09302007C
-:109A4000D6150000189402006E1500000094020064
-:109A5000EE150000249402009E110000689302009D
-:109A60002616000030940200D6130000D0930200A6
-:109A7000761500000C94020006120000809302008C
-:109A800036150000DC9302000E1100005C9302000A
-:109A9000BE130000C8930200061700003C940200A9
-:109AA00006130000B0930200BE120000989302005B
-:109AB000C6120000A093020026130000B893020013
-:109AC000F6120000A893020018B802006702000016
-:109AD0000000000000000000000000000000000086
-:109AE000000000000000000000000000232602002B
-:109AF000312C020000000000000000000000000007
-:109B00000000000074EA020065550000860F0000A6
-:109B10006E0C0000960B0000509B02001E07000018
-:109B2000449B0200060D0000589B0200760C0000CA
-:109B3000AC9B020034C202002F00000005000000B0
-:109B40000C9B0200ECEA02000100FFFF895B0000B1
-:109B5000FCE9020059590000FCE902004D540000E4
-:109B600034C202000F00000001000000709B0200E0
-:109B70008E0C0000049B02006CA20200B4A2020042
-:109B8000C4A202009001030100000000A500010032
-:109B900001000000E2000300A4B302008F010300F3
-:109BA000A4B3020058B10200349B020018B80200AE
-:109BB0008E01000000000000FD2C020000000000EB
-:109BC0005F2C0200E15B00000000000099550000DE
-:109BD00000000000000000006B2C020000000000EC
-:109BE00000000000609B020074EA0200B55C000007
-:109BF000ECEA02000400FFFF895E000038EA020080
-:109C00009964000038EA0200AD63000038EA0200FF
-:109C1000FD5E000038EA02002D5F000038EA020015
-:109C20001D2D020038EA02005D5F000038EA0200E4
-:109C3000795F0000ECEA020000000100E56400002A
-:109C400074EA0200312D0200ECEA02000400030075
-:109C500049630000FCE90200715E000074EA020042
-:109C60002163000038EA02008F2D020038EA02006A
-:109C70003F2D020038EA020005260200ECEA02004D
-:109C800000000100FD63000038EA0200132D02000D
-:109C900038EA0200612D0000FCE902007D5E000050
-:109CA000ECEA02000300FFFF9B2D0200ECEA020039
-:109CB0000300FFFFA52D020038EA020059640000EE
-:109CC00038EA02004D2D020038EA0200F960000077
-:109CD000ECEA02000400030075640000ECEA0200F4
-:109CE0000100FFFF8D61000038EA020041620000C0
-:109CF000ECEA0200020002006D620000B0EA02001D
-:109D00008D630000ECEA02000300FFFFE562000043
-:109D1000ECEA0200020002005B2D020058B10200D2
-:109D2000249D020034C20200D70200005A00000045
-:109D3000349D0200860F000076100000DE0E000049
-:109D4000F09B0200460F0000B4A30200AE0F00001B
-:109D5000FC9B02006610000094E702009E100000C9
-:109D60006092020086100000F0B202003E11000076
-:109D700034C20200A6110000DC970200DE110000D0
-:109D80002CB30200EE11000048B0020026120000C1
-:109D9000A4900200A6120000ECB802009E1300007E
-:109DA00048E70200DE13000078A302008E140000D2
-:109DB0000CB20200161500002C9002004E15000097
-:109DC00054D5020096150000E09002004E050000F8
-:109DD000A8A4020006160000CC9902003E1600005E
-:109DE000DCB70200B61600000CA00200BE16000090
-:109DF00018B802003E170000A8A60200C610000016
-:109E000064B70200F6150000A0B702000E0E0000B5
-:109E1000E88F0200E60F0000049C0200061000001C
-:109E20000C9C0200B60B0000149C020056100000AF
-:109E30001C9C0200AE100000249C0200BE1000001A
-:109E40002C9C02005E110000349C02007E11000078
-:109E5000409C0200AE110000C0A30200B611000039
-:109E6000CCA302004E120000489C02009E15000088
-:109E7000FC9C020056120000549C02005E1200007E
-:109E80005C9C020066120000649C02009E000000C0
-:109E900000B202007E1200006C9C020086120000DC
-:109EA000749C0200A60000007C9C0200EE120000E0
-:109EB00054B702000E1300005CB702003613000016
-:109EC000889C020096130000909C0200AE130000D4
-:109ED000989C0200EE130000A09C02002E140000CB
-:109EE000AC9C02007E140000B89C02009614000096
-:109EF000C09C0200AE140000C89C0200E6140000E2
-:109F0000D09C0200EE140000DC9C02003E15000014
-:109F1000E89C020066150000F09C0200CE150000CF
-:109F2000049D020036160000109D0200FE0D000088
-:109F3000DCA70200E60D000028A70200EE0D0000DD
-:109F400064A70200F60D0000A0A70200060E0000A4
-:109F500018A80200160E000054A802001E0E0000F1
-:109F600090A80200260E0000CCA802002E0E0000D1
-:109F700008A90200360E000044A90200460E0000A7
-:109F8000BCA902003E0E000080A902004E0E000097
-:109F9000F8A90200560E000034AA02005E0E00006E
-:109FA00070AA02006E0E0000ACAA0200760E00003D
-:109FB000E8AA0200860E000024AB02008E0E00000C
-:109FC00060AB0200960E00009CAB02009E0E0000EB
-:109FD000D8AB0200A60E000014AC0200AE0E0000CA
-:109FE00050AC0200B60E00008CAC0200BE0E0000A9
-:109FF000C8AC0200C60E000004AD02009E140000B2
-:10A0000094BB02000CA002000000000018B802007F
-:10A01000D6020000C16500002568000000000000B5
-:10A0200019660000B166000000000000B167000082
-:10A03000A565000000000000000000000000000016
-:10A04000000000005CA0020074EA0200DF2D0200A4
-:10A05000ECEA020004000400CB2D020034C202002E
-:10A0600017000000020000006CA002000E110000AA
-:10A0700048A002009612000050A0020038EA020038
-:10A08000612E020038EA02008172000074EA0200C8
-:10A090000172000034C20200670000000C000000E2
-:10A0A000C4A0020034C20200670000000C000000DF
-:10A0B00024A1020034C202006F0000000D00000065
-:10A0C00084A102003601000034A302002E0100002A
-:10A0D00014A30200460100002CA302003E01000070
-:10A0E0000CA302004E01000024A302005601000050
-:10A0F0001CA302004E0200000700000056020000F0
-:10A10000030000005E020000010000003E020000AB
-:10A1100084A00200460200008CA00200960100000C
-:10A120007CA002003601000034A302002E010000D2
-:10A1300014A30200460100002CA302004E010000FF
-:10A1400024A30200560100001CA302005E010000CF
-:10A15000ECA102004E0200000700000056020000C1
-:10A16000030000005E020000010000003E0200004B
-:10A1700084A00200460200008CA0020096010000AC
-:10A180007CA002003601000034A302002E01000072
-:10A1900014A30200460100002CA302003E010000AF
-:10A1A0000CA302004E01000024A30200560100008F
-:10A1B0001CA302006601000004A302004E0200007E
-:10A1C0000700000056020000030000005E020000CD
-:10A1D000010000003E02000084A0020046020000D0
-:10A1E0008CA00200960100007CA0020038EA020068
-:10A1F000712E020018B802002300000000000000C9
-:10A20000000000000000000000000000000000004E
-:10A21000000000000000000000000000000000003E
-:10A2200000000000000000000000000094A00200F8
-:10A2300018B802002200000000000000000000002A
-:10A24000000000000000000000000000000000000E
-:10A2500000000000000000000000000000000000FE
-:10A260000000000000000000A4A002003CA30200C7
-:10A2700000030100F4A102000A06040030A202005B
-:10A280000B1A050030A202000C14010030A20200DB
-:10A290000D17010030A202000E16010030A20200CC
-:10A2A0000F15010030A202001010010030A20200C0
-:10A2B000130009003CA302000102010030A20200C9
-:10A2C000141E09003CA3020002010100F4A10200D7
-:10A2D00003040400F4A102000405040030A20200FB
-:10A2E0000511050030A20200060C040030A2020095
-:10A2F000070B040030A202000812010030A2020085
-:10A30000090A040038EA0200CD73000038EA0200AE
-:10A310004D73000038EA02004972000074EA02003E
-:10A32000A973000074EA02008173000074EA02005D
-:10A33000BD72000074EA0200A171000018B80200AA
-:10A3400024000000000000000000000000000000E9
-:10A3500000000000000000000000000000000000FD
-:10A3600000000000000000000000000000000000ED
-:10A3700000000000B4A0020018B802007B02000038
-:10A3800000000000617400000000000000000000F8
-:10A390000000000000000000000000002326020072
-:10A3A000872E0200000000000000000000000000F6
-:10A3B00000000000ECEA020002000500AD78000099
-:10A3C000ECEA0200020003003B2F0200ECEA02006C
-:10A3D00002000300452F020034C202002F000000DB
-:10A3E00005000000E8A30200860F00000E0D00002B
-:10A3F000160D000044A40200260D000050A4020027
-:10A400001E0D000038A402004E0D0000A0A40200A2
-:10A41000E100020240000000A70102024800000023
-:10A42000A601020280000000A501020280000000D7
-:10A43000A801010200000000ECEA02000300FFFF97
-:10A440004F2F0200ECEA02000300FFFF7B2F020007
-:10A45000ECEA02000300FFFF652F020018B80200BB
-:10A460006702000000000000000000000000000083
-:10A4700000000000000000000000000000000000DC
-:10A4800023260200D97C000000000000000000002C
-:10A49000000000000000000058B10200D8A3020034
-:10A4A00038EA0200257D000018B80200A90000006B
-:10A4B000717E0000000000000000000000000000AD
-:10A4C000000000000000000000000000000000008C
-:10A4D000000000000000000000000000000000007C
-:10A4E0000000000038EA02003D81000038EA020066
-:10A4F0001D81000074EA0200D180000038EA0200E9
-:10A50000FD80000038EA02009730020074EA020081
-:10A51000A580000038EA02009D81000038EA0200B0
-:10A52000E57E000038EA0200BD81000038EA020042
-:10A53000857F000038EA02008730020074EA0200DA
-:10A540007980000038EA02004180000038EA020009
-:10A550004D7F000038EA0200A17F000038EA0200C7
-:10A560002D7F000074EA020011800000ECEA020076
-:10A57000020002004182000038EA0200D97F000098
-:10A5800074EA0200DD81000038EA0200097F000061
-:10A5900038EA02007D81000038EA020009820000EA
-:10A5A00038EA02005D81000038EA020077300200DC
-:10A5B00058B10200B8A5020034C20200E700000052
-:10A5C0001C000000C8A50200860F0000E613000072
-:10A5D000F609000056F8ADC0C6140000DA0FC9C075
-:10A5E000DE15000098A50200E614000080A5020018
-:10A5F000C611000024A50200B61300006CA50200DD
-:10A600000611000014A50200AE15000090A502007E
-:10A610005E160000A0A50200EE0F0000E4A40200F8
-:10A620002E100000ECA4020046100000FCA4020062
-:10A630004E100000F4A40200B610000004A50200B1
-:10A64000FE1000000CA50200D61100002CA502008F
-:10A65000F611000034A50200FE1100003CA5020026
-:10A660000E12000044A502006E13000064A5020053
-:10A670003614000078A50200DE1200004CA502008E
-:10A68000E612000054A50200FE1200005CA50200C4
-:10A69000AE160000A8A502000E15000088A5020055
-:10A6A000361100001CA5020018B80200E7020000E5
-:10A6B00000000000CD82000000000000000000004B
-:10A6C000000000000000000000000000232602003F
-:10A6D000A7300200000000000000000000000000A1
-:10A6E00000000000ECEA02000200FFFFB58300005A
-:10A6F00034C202000F0000000100000000A70200A9
-:10A700004E0F0000E4A6020090A802000000000026
-:10A710000000000004A0020034AA020000000000B3
-:10A720000000000004A0020018B80200BC010000F4
-:10A73000C9830000658300000000000000000000E5
-:10A740000000000051840000000000000000000034
-:10A7500000000000000000000000000054A80200FB
-:10A760000000000018B80200BD010000C98300000D
-:10A7700065830000000000000000000000000000F1
-:10A7800051840000000000000000000000000000F4
-:10A79000000000000000000054A8020000000000BB
-:10A7A00018B80200BE010000C983000065830000E4
-:10A7B00000000000000000000000000051840000C4
-:10A7C0000000000000000000000000000000000089
-:10A7D0000000000054A802000000000018B80200A9
-:10A7E000BF010000C9830000658300000000000075
-:10A7F0000000000000000000518400000000000084
-:10A800000000000000000000000000000000000048
-:10A8100000000000F0A6020018B80200C00100000D
-:10A82000C9830000658300000000000000000000F4
-:10A830000000000051840000000000000000000043
-:10A8400000000000000000000000000054A802000A
-:10A850000000000018B80200C2010000C983000017
-:10A860006583000000000000000000000000000000
-:10A870005184000000000000000000000000000003
-:10A880000000000000000000DCA702000000000043
-:10A8900018B80200C3010000C983000065830000EE
-:10A8A00000000000000000000000000051840000D3
-:10A8B0000000000000000000000000000000000098
-:10A8C00000000000DCA702000000000018B8020031
-:10A8D000C4010000C983000065830000000000007F
-:10A8E0000000000000000000518400000000000093
-:10A8F0000000000000000000000000000000000058
-:10A9000054A802000000000018B80200C5010000B1
-:10A91000C983000065830000000000000000000003
-:10A920000000000051840000000000000000000052
-:10A93000000000000000000000000000D8AB020092
-:10A940000000000018B80200C6010000C983000022
-:10A95000658300000000000000000000000000000F
-:10A960005184000000000000000000000000000012
-:10A970000000000000000000F8A902000000000034
-:10A9800018B80200C7010000C983000065830000F9
-:10A9900000000000000000000000000051840000E2
-:10A9A00000000000000000000000000000000000A7
-:10A9B00000000000F8A902000000000018B8020022
-:10A9C000C8010000C983000065830000000000008A
-:10A9D00000000000000000005184000000000000A2
-:10A9E0000000000000000000000000000000000067
-:10A9F000DCA702000000000018B80200C901000036
-:10AA0000C983000065830000000000000000000012
-:10AA10000000000051840000000000000000000061
-:10AA200000000000000000000000000054A8020028
-:10AA30000000000018B80200CA010000C98300002D
-:10AA4000658300000000000000000000000000001E
-:10AA50005184000000000000000000000000000021
-:10AA6000000000000000000054A8020000000000E8
-:10AA700018B80200CB010000C98300006583000004
-:10AA800000000000000000000000000051840000F1
-:10AA900000000000000000000000000000000000B6
-:10AAA0000000000054A802000000000018B80200D6
-:10AAB000CD010000C9830000658300000000000094
-:10AAC00000000000000000005184000000000000B1
-:10AAD0000000000000000000000000000000000076
-:10AAE00060AB02000000000018B80200CE010000B8
-:10AAF000C983000065830000000000000000000022
-:10AB00000000000051840000000000000000000070
-:10AB100000000000000000000000000054A8020037
-:10AB20000000000018B80200D0010000C983000036
-:10AB3000658300000000000000000000000000002D
-:10AB40005184000000000000000000000000000030
-:10AB5000000000000000000028A702000000000024
-:10AB600018B80200D1010000C9830000658300000D
-:10AB70000000000000000000000000005184000000
-:10AB800000000000000000000000000000000000C5
-:10AB90000000000054A802000000000018B80200E5
-:10ABA000D2010000C983000065830000000000009E
-:10ABB00000000000000000005184000000000000C0
-:10ABC0000000000000000000000000000000000085
-:10ABD00054A802000000000018B80200D3010000D1
-:10ABE000C983000065830000000000000000000031
-:10ABF0000000000051840000000000000000000080
-:10AC000000000000000000000000000054A8020046
-:10AC10000000000018B80200D4010000C983000041
-:10AC2000658300000000000000000000000000003C
-:10AC3000518400000000000000000000000000003F
-:10AC40000000000000000000DCA70200000000007F
-:10AC500018B80200D5010000C98300006583000018
-:10AC6000000000000000000000000000518400000F
-:10AC700000000000000000000000000000000000D4
-:10AC80000000000054A802000000000018B80200F4
-:10AC9000D6010000C98300006583000000000000A9
-:10ACA00000000000000000005184000000000000CF
-:10ACB0000000000000000000000000000000000094
-:10ACC000C8AC02000000000018B80200D701000064
-:10ACD000C983000065830000000000000000000040
-:10ACE000000000005184000000000000000000008F
-:10ACF00000000000000000000000000054A8020056
-:10AD00000000000018B80200D8010000C98300004C
-:10AD1000658300000000000000000000000000004B
-:10AD2000518400000000000000000000000000004E
-:10AD3000000000000000000028A702000000000042
-:10AD4000C09502006A0E0300C89502009B0E030026
-:10AD5000E4950200000F0300DC9502007E0F030063
-:10AD6000EC950200C30F030044E90200F70F030053
-:10AD70002CE902004E10030034E9020086100300A3
-:10AD80003CE90200BE10030014BC02004C11030099
-:10AD900020BC02009811030034BC0200E41103003F
-:10ADA0003CBC0200261203002CBC0200A1120300CE
-:10ADB0004C990200051303005C9902003D13030047
-:10ADC00054990200E01303001C9902006C14030064
-:10ADD0002499020001150300349902006415030050
-:10ADE0003C9902001016030044990200BC160300AF
-:10ADF0002C990200681703001C0000209D17030017
-:10AE0000DCBF0200BB170300C4BF020068180300C8
-:10AE100094BF0200011903009CBF02002C1903001B
-:10AE2000D0BF0200BD190300B4BF0200461A0300E0
-:10AE3000ACBF0200681A0300A4BF02008C1A030012
-:10AE4000BCBF0200DA1A03006CA20200351B03002B
-:10AE5000B4A20200641B0300C4A20200931B0300FF
-:10AE6000CCA20200C21B0300D4A20200F11B03000B
-:10AE7000DCA20200201C0300E4A202004F1C03001D
-:10AE8000ECA202007E1C0300F4A20200AD1C030031
-:10AE9000FCA20200DC1C030074A202000B1D0300D4
-:10AEA0007CA202003B1D030084A202006B1D030074
-:10AEB0008CA202009B1D030094A20200CB1D030084
-:10AEC0009CA20200FB1D0300A4A202002B1E030093
-:10AED000ACA202005B1E0300BCA202008B1E03009A
-:10AEE00034A30200BB1E030014A30200191F0300B9
-:10AEF0002CA30200631F03000CA30200B91F030070
-:10AF000004A302002D200300D4BD02008B20030007
-:10AF1000DCBD020029210300E8BD0200742103000A
-:10AF2000C8BD0200CA210300C8E402000C220300CD
-:10AF300004E50200002303008CE402002A2303003E
-:10AF400084E40200552303009CE40200E423030090
-:10AF5000B0E402006F240300B8E40200C024030040
-:10AF6000C0E4020013250300A8E4020059250300F1
-:10AF700070E40200A325030078E40200D625030054
-:10AF800094E402008B2603006400002016270300CF
-:10AF900060E602005B27030058E60200F02703008A
-:10AFA00028EB02005828030040EB0200A928030008
-:10AFB00034EB0200EC2803004CEB02006C29030088
-:10AFC00054000020B829030098D70200192A030072
-:10AFD000B0D70200CC2A0300A4D70200142B030030
-:10AFE000B8D702003C2B0300E4D00200092C030078
-:10AFF000CCD00200582C0300ACD00200C72C0300B8
-:10B00000B8D00200672D0300A4D00200F82D030081
-:10B01000D8D00200512E0300C4D002007B2E0300C2
-:10B02000D4970200BB2E0300A4B90200D62E030061
-:10B030009CB902005A2F0300D4BC0200A62F0300C3
-:10B04000CCBC0200DF2F030018B802003D02000054
-:10B050009D870000FD870000000000003D87000084
-:10B06000E3330200000000000000000000000000C8
-:10B0700000000000000000000000000000000000D0
-:10B0800000000000CF0000001900000090B0020096
-:10B09000760F000028B90200761000001C9D020007
-:10B0A000AE0C000038BE02002610000068980200B6
-:10B0B000C616000050BC02000E17000010E8020087
-:10B0C000E6130000B0A5020056160000E09602004C
-:10B0D0003612000004E10200BE000000C09502002C
-:10B0E000F6060000E4D00200EE000000A4B9020061
-:10B0F000FE000000D497020006010000D4BC02004C
-:10B100001E0C0000FCC20200360C000078C00200D9
-:10B110009E0C0000E0D50200560D0000D096020003
-:10B120006E0C0000A49B02000E0D000098A402000B
-:10B130001617000074990200F60C00008CD602006D
-:10B14000AE00000050BC0200B600000010E8020093
-:10B15000961600007499020018B8020087020000D9
-:10B16000258A000000000000000000000000000030
-:10B1700000000000598A00000000000000000000EC
-:10B1800000000000000000000000000000000000BF
-:10B1900000000000060000000000000000000000A9
-:10B1A00000000000000000002D0000009D3502009E
-:10B1B000250000009D350200260000009D3502009C
-:10B1C0009F000000758E00002F000000758E0000AB
-:10B1D000DE000000758E00008D0100009D3502002C
-:10B1E000300000009D350200D4000000758E000084
-:10B1F0007D010000758E0000280000009F350200D0
-:10B20000ECEA020000000100058F000018B80200FF
-:10B210009102000000000000A935020000000000BB
-:10B22000000000000000000000000000000000001E
-:10B23000000000000000000000000000000000000E
-:10B24000000000000000000074EA02009591000078
-:10B2500074EA02002991000018B802006702000099
-:10B2600000000000000000000000000000000000DE
-:10B270000000000000000000000000002326020083
-:10B28000E7350200000000000000000000000000A0
-:10B290000000000034C2020017000000020000009D
-:10B2A000A4B202001610000048B20200CE11000045
-:10B2B00050B2020018B802000402000035940000E9
-:10B2C0000936020000000000ED90000045920000E9
-:10B2D00000000000C1940000159100000000000073
-:10B2E000C5350200000000000000000094B202001A
-:10B2F00018B80200100200003594000065950000A7
-:10B3000000000000ED9000004592000000000000E9
-:10B31000C19400001591000000000000C535020036
-:10B32000000000000000000094B2020018B8020003
-:10B330003B020000000000003B360200000000005D
-:10B3400000000000000000000000000000000000FD
-:10B3500023260200C9950000000000000000000044
-:10B36000000000000000000018B8020067020000A2
-:10B3700000000000000000000000000000000000CD
-:10B380000000000000000000000000002326020072
-:10B39000FD9500000000000000000000000000001B
-:10B3A00000000000A8B3020018B80200CC010000A1
-:10B3B000699600000000000000000000472602001F
-:10B3C000000000000000000000000000000000007D
-:10B3D000000000000000000000000000000000006D
-:10B3E00000000000C8E402000951815FC8E40200C7
-:10B3F00001047D44C8E4020001C45542C8E40200CF
-:10B40000011C5311C8E4020009671404C8E40200D7
-:10B4100001845447C8E40200094150CCC8E402004A
-:10B4200001109571C8E4020001447C41C8E40200A7
-:10B4300001600307C8E4020009FB93BFC8E40200EF
-:10B4400001AAAAAAC8E4020001601000C8E4020030
-:10B4500001421000C8E4020001841000C8E40200A8
-:10B4600001081100C8E4020001001300C8E4020052
-:10B4700001007000C8E402000100100CC8E40200E2
-:10B4800001001084C8E4020001001042C8E4020078
-:10B4900001001021C8E4020001009001C8E402008C
-:10B4A00001001C00C8E4020009400155C8E4020084
-:10B4B00001317E47C8E4020001444545C8E402006A
-:10B4C00001802802C8E4020001E67807C8E402000F
-:10B4D000017F03E5C8E4020009BFFE5FC8E4020083
-:10B4E000014308A7C8E40200014081E8C8E4020063
-:10B4F00001EA7F47C8E4020001403902C8E40200C3
-:10B5000001C47DA7C8E40200010A2022C8E40200A9
-:10B5100001849073C8E402000184D173C8E402007E
-:10B52000095ECABDC8E4020009511115C8E4020051
-:10B53000097E9DE7C8E4020001B57E42C8E402002E
-:10B5400001A5BCF5C8E402000118FFAFC8E4020081
-:10B5500009400117C8E4020009117CCAC8E40200CE
-:10B5600001AE7EE7C8E40200010080E8C8E4020002
-:10B5700001632B07C8E40200093FC6F8C8E40200D3
-:10B5800001C02907C8E4020009E41315C8E4020059
-:10B59000010A1045C8E4020001841047C8E4020013
-:10B5A00001C46D47C8E4020001C07D05C8E4020083
-:10B5B000096194F4C8E402000180A80FC8E4020005
-:10B5C00001FB3BE7C8E4020001EE9362C8E402001D
-:10B5D00009C411F7C8E402000100A2220000000023
-:10B5E00000000000799600006D360200D738020096
-:10B5F000D738020069A50000EF3B0200D7380200EF
-:10B6000025A000003F3A020039980000D738020018
-:10B610002DAA000001AA000059AC0000C7380200A2
-:10B62000A93F0200299800005D45020091A9000091
-:10B6300005A9000029B00000354402009143020032
-:10B6400039A10000F93D0200CF3C0200D7380200CA
-:10B65000374302001738020017380200E73A0200A9
-:10B66000DD3A0200933A0200F13A02007D9A0000AE
-:10B67000893A02007F3A0200753A0200D19900002F
-:10B68000D1990000D1990000833F0200ED380200FB
-:10B6900089B00000253F0200933E020011AD00007A
-:10B6A000633D0200B73802002B3702003F3A020028
-:10B6B000F7390200DB3902003F3A020099380200F4
-:10B6C0004D3D02009DAC0000053C02000000000062
-:10B6D000000000000000000000000000000000006A
-:10B6E000D9010000FA010000000000000000000085
-:10B6F000000000000000000000000000000000004A
-:10B700000000000000000000000000000000000039
-:10B710000000000000000000000000000000000029
-:10B720000000000000000000000000000000000019
-:10B73000ED010000E6010000E1010000EB01000066
-:10B74000E301000000000000DE0100000000000036
-:10B750000100000074EA02009D48020074EA020041
-:10B76000B1BD000018B8020018020000000000007F
-:10B770001D47020000000000000000000000000063
-:10B7800000000000000000000000000000000000B9
-:10B7900000000000000000000000000000000000A9
-:10B7A00018B80200BE020000000000001D470200A1
-:10B7B0000000000000000000000000000000000089
-:10B7C0000000000000000000000000000000000079
-:10B7D00000000000000000000000000018B8020097
-:10B7E000C702000035BA0000414702000000000017
-:10B7F0000000000000000000E9B7000000000000A9
-:10B800000000000000000000000000000000000038
-:10B81000000000000000000018B80200D70200007D
-:10B8200059B8000079BC000075BA00004726020034
-:10B830000000000069470200000000000000000056
-:10B8400000000000000000000000000000000000F8
-:10B8500000000000DA010000EC010000E701000038
-:10B8600000000000000000000000000001000000D7
-:10B870001FB14F0A9595E62477CC2B3217B7D138F4
-:10B880000AD7233CCDCCCC3DAEC59D74CA1B0E5A05
-:10B8900020BCBE4C00401C460000C84200002041B5
-:10B8A000ECEA0200040003005DC20000ECEA0200C2
-:10B8B0000600040015C3000064B70200ACB8020023
-:10B8C00034C202001700000002000000D0B80200DD
-:10B8D00016120000B8B80200A6160000E0B8020078
-:10B8E000ECEA02000600040095C2000018B802004D
-:10B8F000540200002B49020001C4000000000000B7
-:10B9000065F800003DF900000000000000000000A4
-:10B910000000000000000000000000000000000027
-:10B9200000000000C0B8020058B10200C82E00207C
-:10B9300018B80200450200000000000000000000EE
-:10B9400065D70000000000000000000000000000BB
-:10B9500000000000000000000000000000000000E7
-:10B96000000000000000000000000000FCE90200F0
-:10B97000E1D7000034C202001F00000003000000F5
-:10B9800084B90200860F0000EE0000004E0F000098
-:10B990006CB90200F60000009CB90200FCE902004C
-:10B9A000C1D7000058B1020074B902000CA0020017
-:10B9B00008000000F4B30200FCB30200ECB3020084
-:10B9C00014B402000CB402001CB4020024B402003F
-:10B9D00004B402000CA002000C00000054B40200E9
-:10B9E0005CB4020064B402006CB4020074B40200DF
-:10B9F0007CB4020084B402008CB4020094B402004F
-:10BA00009CB4020044B402004CB402000100E20401
-:10BA10000000000000FC000000000000000000002A
-:10BA20000000000000000000000000000000000016
-:10BA300000000000000000000000000054BA0200F6
-:10BA40000200000054BA02000400000054BA0200D0
-:10BA50000100000018B802007E020000FDDB0000BB
-:10BA600000000000000000000000000000000000D6
-:10BA70000000000011DC00000000000000000000D9
-:10BA800000000000000000000000000000000000B6
-:10BA900019360000C1360000000000000000000060
-:10BAA000ECEA02000800040061E5000018B802009A
-:10BAB0009A010000000000000000000000000000EB
-:10BAC0000000000000000000000000000000000076
-:10BAD00000000000000000000000000090BA02001A
-:10BAE00000000000F0BA020038EA020051E5000050
-:10BAF00034C202004F0000000900000000BB020039
-:10BB0000CE100000E8BA0200960C000048BB02000C
-:10BB1000060F000044940200160F0000A0BA0200B5
-:10BB2000E60C000050BB0200AE06000028EB02004D
-:10BB3000CE0B000034EB0200C60B000040EB02000D
-:10BB4000B60600004CEB020038EA02001135000096
-:10BB500038EA02003DE5000018B802009B01000031
-:10BB600000000000000000000000000000000000D5
-:10BB700000000000000000000000000000000000C5
-:10BB80000000000000000000A0BB02000000000058
-:10BB9000F0BA0200ECEA02000200020071E50000C7
-:10BBA00019360000C136000000000000010000004E
-:10BBB00018B80200B1000000000000000000000002
-:10BBC0000000000000000000000000000000000075
-:10BBD0000000000000000000000000000000000065
-:10BBE0000000000000000000ECBB020034C20200B4
-:10BBF0001F00000003000000FCBB0200A6050000BF
-:10BC000034BC0200AE0500003CBC0200B6050000DA
-:10BC10002CBC0200B0BB0200DCA20200000000004D
-:10BC2000B0BB02007CA202000100000038EA020062
-:10BC300049E6000038EA0200FDE5000038EA0200AB
-:10BC400021E60000000001000000020000000400E6
-:10BC500058B1020058BC020034C202001F000000AC
-:10BC60000300000068BC0200860F0000C61600003A
-:10BC700076140000E89B02007E0E000070C20200F5
-:10BC8000FCE90200CDEA000034C202001F000000FF
-:10BC90000300000098BC0200860F000006010000AF
-:10BCA0004E0F000080BC02000E010000CCBC020060
-:10BCB00000000000398EE33D398E633E398EE33E4D
-:10BCC000ABAA2A3F721C473F0000803FFCE90200FC
-:10BCD000CDEA000058B1020088BC0200E94A020027
-:10BCE000F34A0200DF4C0200F74C0200F34B020063
-:10BCF0001D4C0200354C02004D4C0200654C020008
-:10BD0000914C0200AB4C0200C54C020018B8020076
-:10BD1000D300000000000000000000000000000050
-:10BD20000000000000000000000000000000000013
-:10BD30000000000000000000000000000000000003
-:10BD40000000000050BD020038EA02009DEE000035
-:10BD500034C20200270000000400000060BD0200A1
-:10BD6000760B0000C8BD02007E15000048BD020031
-:10BD7000AE060000DCBD0200B6060000E8BD020011
-:10BD8000DB000200A0860100DC000300A4B3020077
-:10BD9000DD000300A4B30200D70002010000000090
-:10BDA000D800020100000000DA00010000000000DD
-:10BDB000D700020100000000D900030100000000CC
-:10BDC000DA00010000000000ECEA02000300FFFFBF
-:10BDD00095ED00000CBD0200DC290020ECEA020019
-:10BDE0000300FFFFE9ED0000ECEA02000300FFFFA3
-:10BDF00045EE0000FCE9020071EF0000FCE90200E2
-:10BE000061EF000038EA02004DEF0000ECEA0200AA
-:10BE10000000010015EF0000ECEA02000000010044
-:10BE2000C1EF0000ECEA02000000010081EF000019
-:10BE3000FCE902009353020058B1020040BE020028
-:10BE400034C202004F0000000900000050BE020092
-:10BE5000860F0000AE0C0000F610000044940200B3
-:10BE6000A614000018BE0200261400000CBE02003A
-:10BE70000615000024BE0200E615000030BE0200D8
-:10BE80006E120000F4BD020076120000FCBD02003C
-:10BE90004E13000004BE0200050000000500000073
-:10BEA00003000000090000000D040000A841030089
-:10BEB00018B802009C000000000000000000000014
-:10BEC0000000000000000000000000000000000072
-:10BED0000000000000000000000000000000000062
-:10BEE0000000000000000000ECBE020034C20200AE
-:10BEF0004F00000009000000FCBE0200A602000086
-:10BF00009CBF02009E020000D0BF02000605000098
-:10BF1000DCBF02000E050000C4BF02002E0C0000B2
-:10BF200094BF02006E050000B4BF02007605000059
-:10BF3000ACBF02007E050000A4BF02002615000071
-:10BF4000BCBF02004E00030100000000A20002007E
-:10BF5000900100008501010200000000A50001021F
-:10BF600001000000A600010200000000AA00030179
-:10BF700000000000A200020096000000A5000102DF
-:10BF8000010000005900010200000000A6000102AB
-:10BF90000000000038EA020085F60000B0EA020066
-:10BFA0008754020038EA020095F0000038EA0200E7
-:10BFB000A9F0000038EA02001DF7000038EA02008C
-:10BFC00005F10000ECEA02000300FFFFD5F50000D8
-:10BFD000ECEA020008000400CDF60000ECEA0200E2
-:10BFE0000300FFFFD5F40000ECEA020000000100AE
-:10BFF000DDF7000038EA020001F80000FCE9020069
-:10C00000C1F7000074EA0200E554020074EA02007D
-:10C0100081F70000ECEA0200020003000F55020065
-:10C0200034C20200470000000800000038C00200CF
-:10C0300038EA020079550200860F0000360C000035
-:10C040003E0C000030C00200460C0000E8BF0200B9
-:10C050004E0C000014C00200560C000004C0020088
-:10C060005E0C0000F4BF0200360C0000FCBF0200B2
-:10C07000660C00000CC0020058B1020020C0020093
-:10C0800018B80200010000000000000000000000DD
-:10C0900000000000000000000000000000000000A0
-:10C0A0000000000000000000000000000000000090
-:10C0B00000000000000000000000000038EA02005C
-:10C0C000CDFB000038EA0200E5570200ECEA02006E
-:10C0D00004000300D1FF000064B70200CCC00200DE
-:10C0E000ECEA0200040003003357020038EA0200C1
-:10C0F00065FF000038EA020081FF000034C2020040
-:10C10000770000000E0000000CC102002E0C0000A1
-:10C11000BCC002003E050000C4C002001E120000A8
-:10C12000D8C0020046120000E0C002002E1300003A
-:10C13000ECC002005E130000F4C00200D614000040
-:10C140007CC10200DE14000088C10200A6150000B8
-:10C1500090C10200FE1600009CC1020026170000DC
-:10C16000A8C102002E0F0000B8E00200C60F0000B8
-:10C17000C0E00200FE0E0000B0E00200ECEA0200A7
-:10C18000040003002957020038EA0200B1FD000054
-:10C19000ECEA0200040003001F570200ECEA020070
-:10C1A0000300FFFFD1FC000038EA0200B1FB0000F1
-:10C1B00018B8020067020000000000000000000044
-:10C1C000000000000000000000000000000000006F
-:10C1D00000000000232602007B5702000000000040
-:10C1E00000000000000000000000000018B802007D
-:10C1F0002802000059FC00000000000000000000C0
-:10C2000000000000B5570200000000000000000020
-:10C2100099FB00000000000000000000000000008A
-:10C220000000000000000000804203008B42030079
-:10C230009542030018B8020027020000D1FE00005A
-:10C240001D00010000000000DDFB0000F5FD000006
-:10C25000000000006D0001007DFB000000000000F8
-:10C26000000000000000000000000000FCC0020010
-:10C2700018B80200CF010000D1FE00001D0001002F
-:10C2800000000000DDFB0000F5FD000000000000E4
-:10C290006D0001007DFB00000000000000000000B8
-:10C2A0000000000034C20200FCC0020038EA0200B4
-:10C2B000AD00010038EA0200E101010034C20200D1
-:10C2C0001700000002000000DCC2020034C20200BD
-:10C2D0001700000002000000ECC202002E0C00005B
-:10C2E000B4C2020006050000ACC20200860F0000C6
-:10C2F0001E0C0000260C000004C3020058B102000E
-:10C30000CCC2020018B80200840100000000000046
-:10C310006D010100000000006F58020000000000E5
-:10C3200000000000D5000100000000000000000037
-:10C33000000000000000000000000000BCC202007D
-:10C34000A2000000A7000000A70000007F0000007E
-:10C3500080000000E20000003C0000003C00000003
-:10C360000000000000000000E10000003C000000B0
-:10C370003B0000000000000000000000C8000000BA
-:10C380000000000000000000360000003700000040
-:10C39000C7000000000000000000000036000000A0
-:10C3A0003600000000000000000000000A0000004D
-:10C3B000E8020000F64E0300F94E0300034F0300AD
-:10C3C000074F03000B4F03000F4F0300154F0300EF
-:10C3D0001B4F0300234F0300274F03004A4F030066
-:10C3E000554F0300604F03006D4F03007A4F030069
-:10C3F000864F0300924F03009D4F0300A74F030099
-:10C40000AF4F0300B64F0300BE4F0300CC4F0300F5
-:10C41000D54F0300E04F0300E84F0300F04F030047
-:10C42000FF4F030007500300155003001C5003008A
-:10C4300026500300345003003B50030046500300D5
-:10C440005B500300765003008950030098500300AE
-:10C45000A8500300B6500300C5500300D950030094
-:10C46000FA5003001B51030028510300315103000F
-:10C470003E510300475103004F5103005451030044
-:10C480005F5103006C510300735103007A510300A4
-:10C4900081510300885103008F510300965103001E
-:10C4A0009D510300A4510300AB510300B25103009E
-:10C4B000BA510300C2510300CA510300D251030014
-:10C4C000DA510300E2510300EA510300F251030084
-:10C4D000FA51030005520300105203001A520300E0
-:10C4E000265203003052030040520300485203001A
-:10C4F0005052030058520300615203006A52030075
-:10C50000715203007D5203008952030096520300CA
-:10C51000A4520300AF520300BC520300C8520300F0
-:10C52000CF520300D7520300E5520300ED5203003F
-:10C53000F3520300FB520300065303000E530300A3
-:10C5400017530300235303002B53030036530300F8
-:10C550003C5303004253030047530300515303006D
-:10C560005A530300635303006C53030075530300D5
-:10C570007E53030087530300905303009953030035
-:10C58000A2530300AC530300B6530300C05303008F
-:10C59000CB530300D5530300E0530300EA530300D9
-:10C5A000F5530300FF5303000A540300155403001E
-:10C5B00025540300325403003C5403004C54030040
-:10C5C00055540300645403006D5403007354030076
-:10C5D0008454030093540300A3540300AF54030096
-:10C5E000B6540300BF540300C8540300D1540300E1
-:10C5F000DF540300E6540300EE540300F954030033
-:10C6000005550300135503001B5503002355030074
-:10C610002D550300355503004055030048550300D0
-:10C6200055550300625503007455030085550300FA
-:10C6300098550300A2550300A9550300B255030005
-:10C64000BA550300C3550300CB550300D255030070
-:10C65000D9550300E0550300E7550300EF550300EB
-:10C66000F655030004560300165603001B5603003C
-:10C670002156030029560300325603004356030097
-:10C680004E560300595603006656030074560300C5
-:10C69000825603009A560300AA560300B2560300BE
-:10C6A000BA560300C2560300CF560300E1560300FA
-:10C6B000EE560300FC5603000B570300105703000F
-:10C6C000175703001E570300265703003057030077
-:10C6D0003C570300475703004C57030051570300D2
-:10C6E000565703005E570300705703007A57030044
-:10C6F0008457030094570300A0570300B457030066
-:10C70000C9570300D7570300DD570300E457030060
-:10C71000EC570300F3570300F7570300FD570300DE
-:10C72000065803000D58030013580300195803005E
-:10C73000215803002D5803003858030040580300C7
-:10C74000465803004D58030059580300655803002C
-:10C750006B580300735803007B580300855803008F
-:10C760009058030098580300A0580300AC580300E9
-:10C77000BA580300C4580300CB580300D75803002D
-:10C78000E1580300E8580300EE580300FB5803008B
-:10C7900006590300105903001C59030025590300D2
-:10C7A000305903003C590300465903004A5903001D
-:10C7B0004F590300565903005D59030062590300A5
-:10C7C000675903006E590300755903007B59030034
-:10C7D00081590300875903008D59030091590300C3
-:10C7E000985903009D590300A2590300A959030059
-:10C7F000B0590300B5590300BC590300C2590300E6
-:10C80000C8590300CC590300D1590300D75903007C
-:10C81000DF590300E7590300EE590300F5590300FF
-:10C82000FC590300015A0300085A03000F5A030081
-:10C83000145A03001B5A0300225A0300295A03000A
-:10C840002E5A0300355A03003C5A0300435A030092
-:10C850004A5A0300505A0300565A03005C5A030018
-:10C86000625A0300685A03006C5A0300715A0300AD
-:10C87000795A0300805A0300875A03008C5A030038
-:10C88000915A0300985A03009D5A0300A45A0300CA
-:10C89000AB5A0300B15A0300B75A0300BD5A030054
-:10C8A000C35A0300C95A0300CF5A0300D55A0300E4
-:10C8B000D95A0300E05A0300E55A0300EC5A03007A
-:10C8C000F15A0300F85A0300FE5A0300045B030008
-:10C8D0000A5B0300105B0300165B03001C5B030094
-:10C8E000225B0300295B03002D5B0300325B030026
-:10C8F000385B0300405B0300475B03004E5B0300B3
-:10C90000555B03005A5B0300605B0300665B03003A
-:10C910006C5B0300725B0300785B03007C5B0300CD
-:10C92000815B0300885B03008F5B0300965B030061
-:10C930009B5B0300A25B0300A95B0300AE5B0300EB
-:10C94000B55B0300BB5B0300C15B0300C75B030077
-:10C95000CD5B0300D15B0300D85B0300DE5B03000B
-:10C96000E45B0300EA5B0300F95B0300005C030087
-:10C97000075C0300125C0300195C0300225C0300E7
-:10C98000295C0300305C0300355C03003A5C030063
-:10C99000405C03004A5C0300555C0300605C0300DC
-:10C9A000665C03006D5C03007B5C0300815C03003C
-:10C9B000885C03008F5C0300965C03009D5C0300B1
-:10C9C000AE5C0300B95C0300C45C0300CC5C0300F4
-:10C9D000D55C0300E35C0300EA5C0300F65C030043
-:10C9E000005D0300095D0300135D03001B5D030090
-:10C9F000285D0300355D03003E5D0300495D0300D3
-:10CA0000505D0300555D03005D5D03006B5D030039
-:10CA1000755D0300805D03008A5D0300945D030083
-:10CA20009E5D0300A75D0300B25D0300BC5D0300D3
-:10CA3000C65D0300CD5D0300DA5D0300E35D030026
-:10CA4000E95D0300F55D0300FC5D0300055E030086
-:10CA50000D5E0300155E03001D5E0300295E0300EA
-:10CA6000315E03003A5E0300475E0300575E030039
-:10CA70005E5E0300685E03007D5E03008C5E030063
-:10CA8000955E03009D5E0300A75E0300AF5E03009A
-:10CA9000BB5E0300C55E0300CD5E0300DC5E0300E9
-:10CAA000E95E0300F65E0300085F0300195F030000
-:10CAB0002A5F03003A5F0300455F0300505F0300F5
-:10CAC0005C5F03006C5F03007A5F03008D5F03000F
-:10CAD0009A5F0300A55F0300B95F0300C75F03000F
-:10CAE000D55F0300E15F0300EC5F03000260030019
-:10CAF0000C6003001A6003002A6003003960030021
-:10CB00004960030057600300646003007060030025
-:10CB10007F6003008C600300A0600300AA60030034
-:10CB2000B5600300C7600300D2600300DE6003004D
-:10CB3000ED600300FB600300076103001061030068
-:10CB40001B610300246103003261030040610300A4
-:10CB50004961030054610300616103006C610300DB
-:10CB600077610300806103008A6103009361030021
-:10CB70009E610300AB610300B6610300C061030066
-:10CB8000CB610300D6610300E5610300F661030099
-:10CB900001620300106203001E62030028620300AA
-:10CBA0003262030042620300486203004F620300E6
-:10CBB000556203005D620300636203006A62030062
-:10CBC000736203007A6203008262030089620300D9
-:10CBD000956203009B620300A2620300AA62030045
-:10CBE000B0620300B5620300BC620300CB620300C5
-:10CBF000D6620300DB620300E7620300F262030017
-:10CC0000FE62030006630300116303001C6303005C
-:10CC10002363030029630300376303003F630300BA
-:10CC2000496303004F630300556303005F63030020
-:10CC3000676303007263030078630300806303008B
-:10CC4000886303009063030097630300A1630300FC
-:10CC5000AB630300B2630300BE630300CB63030056
-:10CC6000DF630300E5630300EF630300FD6303007C
-:10CC700007640300106403001964030026640300C2
-:10CC80002C64030037640300436403004A64030018
-:10CC900051640300586403005E640300676403008A
-:10CCA0006E640300776403007E64030086640300FF
-:10CCB0008E640300956403009E640300A664030071
-:10CCC000B3640300BE640300CA640300D5640300B8
-:10CCD000DA640300E6640300EC640300F664030016
-:10CCE000006503000A650300116503001D6503006C
-:10CCF0002B650300316503003665030047650300BB
-:10CD00004F650300586503005E6503006D65030011
-:10CD1000836503008D65030097650300A465030028
-:10CD2000B0650300BB650300C3650300D065030065
-:10CD3000DA650300E2650300EC650300F9650300B2
-:10CD400004660300116603001B66030023660300EC
-:10CD50002A660300356603003C660300476603004D
-:10CD60004D660300546603005C66030064660300BE
-:10CD70006A6603007166030079660300806603003B
-:10CD8000866603008D660300966603009F660300B7
-:10CD9000A5660300AD660300B3660300B966030031
-:10CDA000C2660300C8660300CF660300D5660300B1
-:10CDB000DB660300E3660300EB660300F266030034
-:10CDC000FE66030009670300146703001A67030087
-:10CDD000216703002A670300346703003A670300F2
-:10CDE000416703004867030050670300566703006C
-:10CDF000636703006A6703007067030079670300D5
-:10CE00007F6703008667030092670300986703004B
-:10CE10009F670300AB670300B0670300BB670300B5
-:10CE2000C1670300CB670300D1670300D967030024
-:10CE3000EB670300F2670300FE6703000868030066
-:10CE400010680300176803002A68030033680300B2
-:10CE50003D680300446803004E68030059680300FE
-:10CE6000616803006A680300726803007B6803005E
-:10CE7000846803008B6803009268030098680300CD
-:10CE80009E680300A8680300B5680300BB68030040
-:10CE9000C6680300D1680300D8680300E168030096
-:10CEA000E9680300F0680300FC68030009690300F7
-:10CEB000186903001F690300256903002C6903003A
-:10CEC000346903003B6903004369030049690300B7
-:10CED0004F690300576903006E6903008C69030002
-:10CEE0009269030098690300A4690300AC69030018
-:10CEF000B8690300C5690300D0690300DB6903005A
-:10CF0000E2690300F2690300FD690300056A03009A
-:10CF10000D6A0300146A0300236A03002A6A0300EF
-:10CF2000316A0300396A0300456A03004E6A030050
-:10CF30005C6A0300656A03006D6A0300776A030098
-:10CF40007F6A0300876A0300906A03009F6A0300F8
-:10CF5000A56A0300FCE90200C50E010034C202000C
-:10CF6000EF0000001D0000006CCF0200860F0000E3
-:10CF7000F60600004E0F000054CF0200C60000006D
-:10CF8000C4D0020026070000CCD002002E0700000B
-:10CF9000A4D002001E070000B8D002000E07000057
-:10CFA000ACD00200960B0000D8D002006E07000043
-:10CFB000D4D902007607000004DA0200BE070000A0
-:10CFC00080DD0200A6070000C0DC02009E07000012
-:10CFD00010DB0200D6070000F8DF02008607000021
-:10CFE00088DA02005E07000064D8020056070000DD
-:10CFF000F8D70200E607000058E002007E070000B4
-:10D0000054DA0200C607000088DE0200CE070000E6
-:10D01000B4DE020046070000D0D702006607000019
-:10D020002CD902004E070000C0D70200DE07000026
-:10D0300034E0020096070000F4DA02008E070000D8
-:10D04000D8DA0200B607000060DD0200AE0700007B
-:10D0500040DD0200DE00030100000000E2000300EA
-:10D060006CA20200A500010001000000A600010062
-:10D0700000000000DF00020100000000E0000200EC
-:10D08000FFFFFFFFE20003006CA20200A500010009
-:10D0900001000000E700020200000000E6000202BA
-:10D0A00000000000FCE90200A10C0100ECEA020013
-:10D0B0000100FFFF090E0100ECEA02000100FFFF82
-:10D0C000510D0100FCE90200550C0100ECEA0200E0
-:10D0D0000100FFFF110D0100ECEA02000000010059
-:10D0E000C90C010058B102005CCF020018B8020060
-:10D0F0001A02000000000000000000005759020062
-:10D10000000000000000000000000000000000001F
-:10D11000000000000000000000000000000000000F
-:10D1200000000000000000000F6B0300D13403007A
-:10D13000156B03001A6B0300246B0300286B0300BC
-:10D140002B6B0300326B030041390300386B030083
-:10D1500054870300416B0300456B03004A6B0300D7
-:10D160004F6B0300566B0300220D0300576A030048
-:10D1700078360300476B0300420D0300865003001E
-:10D18000195003005E6B0300DA360300656B030081
-:10D19000230D03006B5703008E820300696B0300AD
-:10D1A000260D03001C0D030032640300706B0300A6
-:10D1B00038EA02000918010034C202001F00000012
-:10D1C00003000000C8D10200CE100000B0D1020060
-:10D1D000760D0000E0D102006E160000E8D10200DA
-:10D1E00074EA0200A95B0200ECEA020004000400F9
-:10D1F000D517010018B8020047020000AD16010063
-:10D2000000000000000000004726020000000000AF
-:10D21000000000000000000023260200F9170100B2
-:10D22000000000000000000000000000B8D1020073
-:10D2300018B80200470200000000000000000000D3
-:10D240005D160100472602000000000000000000FB
-:10D2500000000000000000000000000000000000CE
-:10D26000000000000000000000000000BCF8020008
-:10D27000C0F802000CF80200E6F80200D4F902003F
-:10D280007AF8020094FA020026F8020094F90200EB
-:10D290009AF7020008F80200BCF9020092FB0200B3
-:10D2A000AAF9020052F9020034F90200FEF8020065
-:10D2B00078F902002CF7020004F9020052FB020088
-:10D2C000D6F80200C4FA02006AFB020040FA02002B
-:10D2D00064FA02005EF9020068F902008EF90200A9
-:10D2E000E8F6020084F90200F0F70200FAF9020001
-:10D2F00074F802007AFB0200E2F60200C2F90200B2
-:10D300001AF7020044FA0200AEF802009EF9020089
-:10D310006EF7020078F7020062F702005AF7020087
-:10D32000B6FA0200AEFA0200BEFA02002AFA0200C1
-:10D330000CFA020012FA020070FA020038F8020039
-:10D340009EF702008CFB020000000000DAF90200E8
-:10D35000C4F802006AF8020070F8020018F802002F
-:10D3600022F8020012F80200F8F80200F8FA0200AF
-:10D3700012FB02001AFB020022FB020004FB020067
-:10D38000FEFA02000CFB0200A0FA020028FB0200D9
-:10D390003AFB020042FB020048FB02002EFB0200A7
-:10D3A00034FB02004EFB020000FA0200CEF902003C
-:10D3B000E8F9020080F8020096F8020092F80200F4
-:10D3C0008CF8020086F802009AFA020080F7020048
-:10D3D000CAF80200B0F90200B6F9020058F90200DA
-:10D3E0003EF9020044F902004AF902002CF9020059
-:10D3F0008AF9020098F9020020F9020050F80200B0
-:10D4000026F7020026F9020056F802005CF8020036
-:10D4100072F9020034F70200F6F702001CF902006C
-:10D4200012F90200CEFA0200E4FA0200DAFA02006F
-:10D43000D4FA0200ECFA0200F0FA020062F80200EC
-:10D4400074FB02005EFB020064FB020030FA020083
-:10D4500036FA020054FA02005AFA02006AFA02008E
-:10D460007EF90200CCF70200EAF70200E0F70200C2
-:10D47000E6F70200C8F9020020F702004AFA0200AB
-:10D48000A8F80200B4F802006AF7020074F702007C
-:10D49000A4F902003AF7020054F7020076FA0200FB
-:10D4A0007CFA020082FA020088FA02008EFA020078
-:10D4B000A6FA020006FA020018FA02001EFA02009A
-:10D4C00024FA0200E2F902009CF80200A2F802002D
-:10D4D0002CF8020032F802004AF802003EF802007E
-:10D4E00044F80200AAF70200EEF60200F4F6020089
-:10D4F00002F70200FCF6020008F702000EF7020035
-:10D5000014F70200C6F70200B2F70200BEF70200ED
-:10D5100080FB020086FB020018B80200D602000061
-:10D520009D6002000000000000000000196600007D
-:10D53000B166000073600200B1670000A5650000DD
-:10D5400000000000000000000000000000000000DB
-:10D550000000000018B80200A9020000000000004E
-:10D56000CD6002000000000000000000000000008C
-:10D57000000000000000000023260200AF6002004F
-:10D58000000000000000000000000000000000009B
-:10D5900034C202002F00000005000000A0D50200E8
-:10D5A000860F00009E0C00002E150000D8D502004A
-:10D5B000EE0C0000C8D50200FE0C0000D0D5020021
-:10D5C000A60C00006CD60200FCE902009D370000AA
-:10D5D00038EA0200E537000038EA0200E9350000C9
-:10D5E00058B1020090D5020096010000970100009A
-:10D5F00098010000990100009E010000CC990200F2
-:10D600000000000017000000446D0300CC990200E8
-:10D610000000000008000000D74F030018D50200EA
-:10D62000050000004CD602000CD602003CD60200D9
-:10D630005CD60200FCD50200E8D50200CC990200BD
-:10D640000000000005000000E76C0300CC99020018
-:10D650000000000008000000D74F0300CC99020032
-:10D660000000000056000000ED6C0300FCE9020021
-:10D67000E5200100FCE902003B61020038EA0200FB
-:10D68000F5200100FCE90200ED20010058B1020084
-:10D6900094D6020034C20200570000000A000000C5
-:10D6A000A4D60200860F0000F60C0000E61600006B
-:10D6B000F4D60200C6000000D4950200DE06000089
-:10D6C00084D602006E11000074D602008E11000094
-:10D6D0007CD602000E1400004CBA0200FE130000BB
-:10D6E0003CBA02000614000044BA02009E16000074
-:10D6F000A0B80200FCE902002361020018B8020091
-:10D700007C0100000000000000000000000000009C
-:10D710000000000000000000000000000000000009
-:10D7200000000000000000000000000000000000F9
-:10D730000000000038D7020034C2020027000000B9
-:10D740000400000048D70200760B000098D70200C2
-:10D75000B6060000B0D70200AE060000A4D7020053
-:10D76000160C0000B8D702006F01020040420F0003
-:10D7700070010200080000007E01020000000000AD
-:10D780007F010302A4B3020080010302A4B30200DC
-:10D7900081010302A4B30200ECEA02000300FFFFD0
-:10D7A00009210100ECEA020004000300BD21010090
-:10D7B00074EA020021220100B0EA020065220100A1
-:10D7C0000CA0020002000000860800001E0A0000F3
-:10D7D0000CA0020008000000E60800003E0B00005C
-:10D7E000C60900006E0900003E0B00009E08000004
-:10D7F0003E0B0000960A00000CA002001900000079
-:10D80000060900003E090000D60900005609000084
-:10D81000660A0000560A00004E0900003E0900009A
-:10D82000D609000056090000CE0A0000C60A000012
-:10D830004E0900003E0900003609000016080000ED
-:10D84000660A0000F60900006609000006080000EC
-:10D85000FE0700003E080000660A0000CE0A000035
-:10D86000C60A00000CA0020030000000D60800002C
-:10D87000F6090000CE0A0000EE070000F6070000DF
-:10D88000EE070000CE0A0000F6090000D6080000EE
-:10D89000F6090000CE0A0000EE070000F6070000BF
-:10D8A000EE070000CE0A0000F6090000660A00003C
-:10D8B000EE070000DE080000660900006E090000A7
-:10D8C000660900009E0800000E080000D60800004F
-:10D8D000F6090000CE0A0000EE070000F60700007F
-:10D8E000EE070000CE0A0000F6090000CE0A000094
-:10D8F0004E0800008E090000660A00009E0A000023
-:10D90000EE070000DE0800006E090000D6080000E7
-:10D91000F6090000CE0A0000F6090000CE0A000059
-:10D92000660A0000F6090000660900000CA002006B
-:10D93000280000001E0800004E0800001609000024
-:10D9400066080000360800003E0B00002E080000AC
-:10D950004E080000160900006608000036080000A6
-:10D960003E0B000036080000160A00006E09000099
-:10D97000F6090000660A0000F60900006E090000C2
-:10D98000F60900006E080000160900006609000094
-:10D990009E080000760800003E0B00008E08000084
-:10D9A00016090000660900009E08000076080000C5
-:10D9B0003E0B000096080000160A00006E090000E9
-:10D9C000F6090000660A0000F60900006E09000072
-:10D9D000F60900000CA002000A000000460B00003F
-:10D9E000CE0A0000CE0A0000CE0A00005E0A000047
-:10D9F000560B0000660A0000660A0000660A000076
-:10DA0000EE0900000CA00200120000009E090000B8
-:10DA10006E090000F6090000260900000E0A000049
-:10DA2000260900000E0A00002E0900003E09000031
-:10DA3000660900006E090000F60900009E0800005B
-:10DA4000660900002E0A00006E080000B6090000FA
-:10DA5000560900000CA002000B000000EE080000B8
-:10DA60004E0900003E09000056090000860900002A
-:10DA7000BE090000CE0900003E0900004E0900006A
-:10DA800056080000EE0800000CA002001200000082
-:10DA9000D60800009E0800006E0900003E09000044
-:10DAA000AE0A00003E090000AE0A00006E0A000047
-:10DAB000CE0A00009E0800009E080000CE0A00006A
-:10DAC0003E0900008E0A00003E0900008E0A000098
-:10DAD000660A00006E0900000CA0020005000000AC
-:10DAE000160B0000660A0000F60900006609000037
-:10DAF0009E0800000CA00200050000001E090000A6
-:10DB000066090000F6090000660A0000CE0A00005F
-:10DB10000CA002006A0000007E0A0000D60A000085
-:10DB2000C60800007E0900006E080000AE09000073
-:10DB3000A6080000760800004E080000AE080000AD
-:10DB400066090000BE090000A60800006E0800007B
-:10DB5000B60800006E0900006E0A0000D60A000038
-:10DB60006E0900006E0A0000A608000066090000A9
-:10DB700066080000AE080000660800007609000094
-:10DB80006E0A0000DE0A00006E0900006E0A000046
-:10DB9000A60800006E09000066080000A609000043
-:10DBA0006E09000066090000A60800006608000073
-:10DBB000AE080000C60900006E080000AE080000B4
-:10DBC0006E0900006E0A0000A60800006609000049
-:10DBD000A608000066080000BE08000066080000F5
-:10DBE000AE08000066080000860A0000D60A0000A1
-:10DBF00096080000860A0000D60A00004E080000C1
-:10DC0000AE0800006E09000066080000160A000059
-:10DC10006E090000F60900006E0A00007608000098
-:10DC20004E080000860A0000D60A00004E080000D8
-:10DC30006E0A0000160A00006E090000A608000027
-:10DC4000660800006E0A00006E090000F609000078
-:10DC50006E0A000096080000860A0000D60A00003E
-:10DC600096080000860A0000D60A00004E08000050
-:10DC70004E080000AE0800006E09000066080000B3
-:10DC80006E0A0000D60A00006E0A00009608000026
-:10DC90008E080000F60700004E0800006E0A000023
-:10DCA000D60A00004E080000160A00006E090000A7
-:10DCB000F60900006E0A000076080000AE080000B9
-:10DCC0000CA002001E000000060A0000F609000079
-:10DCD000660A0000CE0A0000CE0A0000660A0000B4
-:10DCE000F6090000660900009E0800009E0800007A
-:10DCF00066090000F60900004E0A0000C60900008F
-:10DD0000EE0900003E0A0000F6090000660A000065
-:10DD1000CE0A0000CE0A0000660A0000F6090000E4
-:10DD2000660900009E0800009E08000066090000C9
-:10DD3000F6090000E6090000460900005E0900003F
-:10DD40000CA0020006000000160B00006E09000087
-:10DD50009E080000060B00008E0800002E0900003F
-:10DD60000CA0020006000000FE0A000016090000D8
-:10DD7000F6090000260B0000260A00002E0B00000A
-:10DD80000CA0020040000000FE080000F6090000A0
-:10DD9000CE0A000016090000F6090000F60A00008D
-:10DDA00016090000F6090000F6080000F609000058
-:10DDB000CE0A000016090000F6090000F60A00006D
-:10DDC00016090000F6090000F608000066090000C8
-:10DDD000CE0A0000A6090000660A0000F60A00004C
-:10DDE000A6090000660A0000F608000066090000A7
-:10DDF000CE0A0000A6090000660A0000F60A00002C
-:10DE0000A6090000660A00005E08000096090000EE
-:10DE1000CE0A0000A6090000660A0000F60A00000B
-:10DE2000A6090000660A00005E08000096090000CE
-:10DE3000CE0A0000A6090000660A0000F60A0000EB
-:10DE4000A6090000660A0000F6080000F6090000B6
-:10DE5000CE0A000016090000F6090000F60A0000CC
-:10DE600016090000F6090000F6080000F609000097
-:10DE7000CE0A000016090000F6090000F60A0000AC
-:10DE800016090000F60900000CA0020009000000BD
-:10DE900006090000EE0A00006E0A0000CE0A00002B
-:10DEA000E60A0000CE0A00003E0B00004E0800000B
-:10DEB000F60800000CA002004F000000AE090000B0
-:10DEC000660800003E0B00004E0800004E080000EF
-:10DED000F60700004E0800000E0B00003E0B00008D
-:10DEE00066090000660900003E0B0000660800009D
-:10DEF000160900003E0B00009E0800009E0800006E
-:10DF00003E0B000066090000460A00003E090000C2
-:10DF1000160800003E0B0000EE070000EE070000B0
-:10DF2000D60A0000EE070000760A00003E0B000053
-:10DF3000F6090000F60900003E0B00009E080000F4
-:10DF4000660800003E0B00004E0800004E0800006E
-:10DF50003E0B000016090000DE090000BE090000AB
-:10DF6000660800003E0B00004E0800004E0800004E
-:10DF7000F60700004E0800007E0800003E0B00007F
-:10DF8000CE0A0000CE0A00003E0B00006609000029
-:10DF9000A60800003E0B0000EE070000EE070000A0
-:10DFA0003E0B0000EE070000460800001E0B0000BC
-:10DFB0008E0A00002E080000EE070000D60A0000BE
-:10DFC000EE0700002E0A00002E080000EE070000F9
-:10DFD000D60A0000EE070000660900003E0B0000B4
-:10DFE000A6080000660900003E0B0000A60800001D
-:10DFF000C60900005E0B00000CA002000D0000002E
-:10E00000FE080000660900002E0A0000CE0A00008B
-:10E01000BE090000F6090000AE0A0000EE0700008D
-:10E02000260A0000660A0000260B00004E080000C9
-:10E03000360900000CA0020007000000FE090000E5
-:10E040004E0B0000860900004E0B0000D6090000B0
-:10E050004E0B0000CE0800000CA0020012000000D1
-:10E060000E090000B60A0000A60A0000C60A000059
-:10E07000560900002E0B0000260A0000C60A000008
-:10E0800056090000B60A00002E08000036090000FC
-:10E0900026080000A60A0000BE0A0000360A00009A
-:10E0A000A60A0000360B000074EA02003962020082
-:10E0B00074EA02002362020074EA0200F5610200C1
-:10E0C000B0EA02000B620200FCE902003124010008
-:10E0D000FCE90200E1230100FCE90200F923010050
-:10E0E000FCE9020011240100FCE902006562020063
-:10E0F000FCE902004F620200ECEA020000000100AD
-:10E100004124010058B102000CE1020034C20200B7
-:10E1100047000000080000001CE10200860F00001C
-:10E1200036120000EE100000C8E002006611000088
-:10E13000D0E0020086110000D8E00200D6120000F4
-:10E14000E0E002001E140000F0E0020016140000DF
-:10E15000E8E0020066160000F8E00200ECEA0200C7
-:10E160000C0008004D26010074EA02003125010070
-:10E1700018B80200B000000000000000000000001D
-:10E1800000000000FF62020000000000000000002C
-:10E19000396802009924010000000000000000001E
-:10E1A00000000000000000000000000034C2020077
-:10E1B000770200004E000000F8E1020018B80200EB
-:10E1C00067020000000000000000000000000000E6
-:10E1D000000000000000000000000000000000003F
-:10E1E000232602000F68020000000000000000006B
-:10E1F00000000000000000007E02000004E50200B4
-:10E20000860200008CE40200A602000084E4020002
-:10E210009E0200009CE40200AE020000B0E4020096
-:10E22000B6020000B8E40200BE020000C0E4020032
-:10E23000C6020000A8E402003E05000070E40200EF
-:10E240004605000078E402008E02000094E402001B
-:10E250009602000068E10200D60200005CE10200C4
-:10E26000DE020000ECB40200E6020000F4B402009A
-:10E27000EE020000E4B40200FE02000064B50200F9
-:10E28000F60200004CB5020006030000A4B4020030
-:10E290000E030000E4B30200160300002CB40200D9
-:10E2A0001E0300008CB502002603000054B50200D6
-:10E2B0002E030000CCB402003603000004B50200B7
-:10E2C0003E030000D4B502004603000024B502005E
-:10E2D0004E03000054B40200560300005CB4020078
-:10E2E0005E03000064B40200660300006CB4020028
-:10E2F0006E03000074B40200760300007CB40200D8
-:10E300007E03000084B40200860300008CB4020087
-:10E310008E03000094B40200960300009CB4020037
-:10E320009E03000044B40200A60300004CB40200A7
-:10E33000AE030000F4B30200B6030000FCB3020019
-:10E34000BE030000ECB30200C603000014B40200D8
-:10E35000CE0300000CB40200D60300001CB402007F
-:10E36000DE03000024B40200E603000004B402004F
-:10E37000EE030000B4B50200F6030000ACB50200E5
-:10E38000FE0300003CB4020006040000B4B4020026
-:10E390000E040000BCB402001604000074B50200B4
-:10E3A0001E0400007CB50200260400003CB50200FB
-:10E3B0002E040000ACB40200360400000CB50200CC
-:10E3C0003E04000014B50200460400001CB5020023
-:10E3D0004E04000034B5020056040000CCB5020023
-:10E3E0005E0400002CB50200660400009CB502002B
-:10E3F000DE040000D4B90200D6040000ACB902006B
-:10E400006E040000BCB502007604000044B50200B2
-:10E410007E040000C4B4020086040000FCB40200C4
-:10E420008E040000A4B502009604000034B402007B
-:10E430009E04000084B50200A6040000D4B40200CB
-:10E44000AE04000094B50200B6040000DCB4020083
-:10E45000BE0400005CB50200C6040000C4B50200A2
-:10E46000CE0400006CB50200C8E402000100000008
-:10E4700038EA0200E7660200ECEA02000A00050042
-:10E4800033660200B0EA0200F526010038EA020015
-:10E490008D66020038EA02003F670200ECEA0200E3
-:10E4A000080004004D27010074EA0200C167020061
-:10E4B00074EA02007F67020074EA020095670200B6
-:10E4C00074EA0200AB67020018B802004C000000BA
-:10E4D000C1270100812801000000000000000000A9
-:10E4E0009D2B010000000000000000000000000063
-:10E4F000000000000000000000000000000000001C
-:10E50000ACE1020038EA02005364020018B80200CD
-:10E510006702000000000000000000000000000092
-:10E5200000000000000000000000000000000000EB
-:10E530002326020061250100000000000000000009
-:10E54000000000000000000018B80200AC0000004D
-:10E5500000000000000000000000000000000000BB
-:10E56000000000000000000000000000F124010095
-:10E57000000000000000000000000000000000009B
-:10E580000000000018B802006C010000000000004C
-:10E59000000000000000000000000000000000007B
-:10E5A000000000000000000000000000000000006B
-:10E5B00000000000C0E5020000000000D0E50200FD
-:10E5C0009D4001007F680200000000000000000084
-:10E5D00034C202004700000008000000E0E502002D
-:10E5E000760B000060E60200B60B000058E6020061
-:10E5F000AE06000028EB0200C60B000040EB020054
-:10E60000CE0B000034EB0200B60600004CEB02001B
-:10E61000D60B000003000000DE0B00000500000028
-:10E620006F01020080250000700102000800000058
-:10E6300071010300A4B30200720102000100000096
-:10E6400073010302A4B3020074010302A4B3020025
-:10E6500075010302A4B3020038EA02008140010000
-:10E66000ECEA02000300FFFFA13F01006A0203027F
-:10E67000A4B30200A80201020000000074EA020034
-:10E68000D941010038EA02007142010038EA020073
-:10E690004B6A020074EA0200D569020074EA0200C3
-:10E6A000D9430100ECEA0200040004009F69020063
-:10E6B000B0EA02002542010034C202005F000000FF
-:10E6C0000B000000C8E60200161000007CE6020005
-:10E6D0002E0C000084E602003E0500008CE60200DD
-:10E6E0000E11000094E60200CE1100009CE602002C
-:10E6F00096120000A4E602009E120000B0E602009E
-:10E70000D614000020E702002E1500002CE70200BE
-:10E710004615000034E70200C61500003CE7020081
-:10E72000ECEA020002000200F542010074EA020075
-:10E730007143010038EA0200A1410100ECEA020045
-:10E740000300FFFF9942010018B8020073020000A5
-:10E7500091430100F9690200000000005D410100E1
-:10E760008144010000000000554501008541010081
-:10E770000000000000000000000000000000000099
-:10E78000B8E6020094E702000000000094E70200EF
-:10E790000100000018B802000C020000D14A01007C
-:10E7A000ED4A010000000000856B0200756B02005D
-:10E7B0000000000000000000000000000000000059
-:10E7C0000000000000000000000000000000000049
-:10E7D00034C202003700000006000000E0E702003B
-:10E7E000860F00000E170000A610000018E80200B7
-:10E7F000B61400002CE80200BE14000020E802005D
-:10E80000EE16000038E80200F616000038E80200B4
-:10E8100058B10200D0E7020038EA0200EF6B0200B4
-:10E82000ECEA02000600FFFF214D0100ECEA0200C5
-:10E830000200FFFFD94C0100ECEA020004000300D3
-:10E84000214B0100000000004F6C020038EA02007A
-:10E85000CD55010038EA0200AD55010038EA02004A
-:10E860000556010074EA0200E555010074EA020051
-:10E87000F36D0200FCE902001D560100FCE90200F4
-:10E880003556010000000000C1000000C200000079
-:10E89000C3000000C4000000C5000000C600000066
-:10E8A000C7000000C8000000C9000000CA00000046
-:10E8B000CB00000034C20200470000000800000046
-:10E8C000E4E8020038EA0200A556010074EA0200FA
-:10E8D0006157010074EA02009157010038EA020012
-:10E8E000CD570100CE0500002CE90200D60500003E
-:10E8F00034E90200DE0500003CE90200E605000004
-:10E90000C4E80200EE05000024E90200F60500005C
-:10E91000CCE80200FE050000D4E802000606000074
-:10E92000DCE8020038EA02003D57010038EA020044
-:10E930006956010038EA02007D56010038EA0200FB
-:10E940009156010048E9020018B80200B700000023
-:10E9500000000000000000000000000000000000B7
-:10E9600000000000000000000000000000000000A7
-:10E970000000000000000000000000000000000097
-:10E98000B4E8020018B802004502000000000000D0
-:10E9900000000000816E0200472602000000000017
-:10E9A0000000000000000000000000000000000067
-:10E9B0000000000000000000000000000000000057
-:10E9C00018B802004502000000000000000000002E
-:10E9D0008D580100472602000000000000000000E2
-:10E9E0000000000000000000000000000000000027
-:10E9F00000000000000000000000000018B8020045
-:10EA00004502000000000000000000000F6E020040
-:10EA10004726020000000000000000000000000087
-:10EA200000000000000000000000000000000000E6
-:10EA3000000000000000000018B8020045020000BD
-:10EA40000000000000000000276E020047260200C0
-:10EA500000000000000000000000000000000000B6
-:10EA600000000000000000000000000000000000A6
-:10EA70000000000018B8020045020000000000007D
-:10EA800000000000456E0200472602000000000062
-:10EA90000000000000000000000000000000000076
-:10EAA0000000000000000000000000000000000066
-:10EAB00018B802004502000000000000000000003D
-:10EAC000636E020047260200000000000000000004
-:10EAD0000000000000000000000000000000000036
-:10EAE00000000000000000000000000018B8020054
-:10EAF000450200000000000000000000216F02003D
-:10EB00004726020000000000000000000000000096
-:10EB100000000000000000000000000000000000F5
-:10EB20000000000000000000ECEA02000200020009
-:10EB3000F96F0200ECEA020004000300A15C01008E
-:10EB4000ECEA020002000200FD5C0100ECEA0200B7
-:10EB50000400040003700200FFFF0000000000003A
-:10EB60000000000000000000E3730200E5730200F3
-:10EB7000297402002B740200000000000000000055
-:10EB8000E3730200E5730200277402003974020087
-:10EB9000E77302000374020007740200237402008A
-:10EBA00075630100756301001D750200000000001F
-:10EBB00000000000E3730200E5730200F975020033
-:10EBC000FB7502009D670100D9750200F575020012
-:10EBD0009D67010009760200010000001700000097
-:10EBE00046000000A30000005F010000D602000004
-:10EBF000C4050000A00B00000000000000000000A1
-:10EC0000797E0200E5730200C56F0100FD7B020002
-:10EC100020EC02000300000038EC020008000000B5
-:10EC200002000000000000000400000001000000DD
-:10EC30000800000002000000C409000000000000FD
-:10EC400088130000080000001027000010000000DA
-:10EC5000204E000018000000803801002000000055
-:10EC6000007102002800000000E2040030000000F3
-:10EC700000881300380000000000000000000000C1
-:10EC8000E37302004B810200217B010055810200E9
-:10EC9000E773020003740200077402002374020089
-:10ECA0002D7A0100657B01001D750200BCFFFFFF8E
-:10ECB00000000000E37302001D7A0100457B0100A3
-:10ECC000557B0100117B0100D9750200F57502002A
-:10ECD000617C010009760200E8EC020003000000FC
-:10ECE00000ED02000800000002000000000000002B
-:10ECF0000400000001000000080000000200000005
-:10ED0000E204000000000000C40900000800000048
-:10ED100088130000100000001027000018000000F9
-:10ED2000204E000020000000803801002800000074
-:10ED3000007102003000000000C40900380000002B
-:10ED40000000000000000000E37302007B8102006D
-:10ED5000A57D010085810200E773020003740200B3
-:10ED60000774020023740200F17C0100BD7D0100E4
-:10ED70001D7502007CED02000B000000D430000085
-:10ED800000000000A86100002000000050C3000047
-:10ED900040000000A086010060000000400D03005C
-:10EDA00080000000801A06008800000000350C007A
-:10EDB00090000000006A1800B000000000D430008D
-:10EDC000D000000000A86100F00000000050C30067
-:10EDD000F80000000000000000000000E3730200E3
-:10EDE000AB810200917E0100B5810200A97E010085
-:10EDF000D9750200F57502004D7F01000976020009
-:10EE000010EE02000400000030EE020009000000D5
-:10EE100002000000000000000400000010000000DC
-:10EE2000080000002000000010000000300000007A
-:10EE30006902000080000000E8020000900000006D
-:10EE4000C40900007000000088130000600000008A
-:10EE50001027000050000000204E0000400000007D
-:10EE6000409C000030000000A0860100200000004F
-:10EE700040420F00100000000000000000000000F1
-:10EE8000E3730200DB810200C5800100E58102001E
-:10EE9000E773020003740200077402002374020087
-:10EEA00031800100DD8001001D750200B4EE02001A
-:10EEB00004000000102700000C000000204E00009D
-:10EEC0000800000050C3000004000000A0860100FC
-:10EED000000000000000000000000000E3730200DA
-:10EEE0000B8202002D82010015820200CD810100FB
-:10EEF000D9750200F575020045820100097602000D
-:10EF0000FFFF010001000000000000000000000001
-:10EF10004386020045860200000000000000000059
-:10EF200063860200918602000000000000000000DD
-:10EF3000A96F0100117C0200FB86020000000000A6
-:10EF400000000000398C0100718702005387020025
-:10EF500000000000000000000000000000000000B1
-:10EF6000318802006CEF0200142D0020ED9A0100A0
-:10EF7000799B01004B8C02004D8C0200919B01009B
-:10EF800001000000007000400400000002000000CA
-:10EF90000070004008000000030000000070004006
-:10EFA000100000000400000000700040200000007D
-:10EFB0000500000000700040400000000600000056
-:10EFC0000070004080000000FF000000FFFFFFFF16
-:10EFD00000000000B004000000F004006009000020
-:10EFE00000D00900C012000000B01300802500000E
-:10EFF000005027004038000000003B00004B00009C
-:10F0000000A04E008070000000F07500127A000031
-:10F01000000080000096000000509D0000E100000C
-:10F0200000F0EB00002C010000903A0100C201004A
-:10F0300000E0D7010084030000B0AF0390D00300CC
-:10F04000000000040008070000705F0700100E00B9
-:10F05000A4DFBE0E40420F00000000107AA701009E
-:10F06000B6A60100DAA6010078A60100DAA6010022
-:10F0700056A70100DAA6010078A60100B6A6010095
-:10F08000B6A6010056A7010078A60100ACA70100B2
-:10F09000ACA70100ACA7010062A70100B6A6010061
-:10F0A000B6A60100DAA6010076A60100DAA60100E4
-:10F0B00056A70100DAA6010076A60100B6A6010057
-:10F0C000B6A6010056A7010076A60100ACA7010074
-:10F0D000ACA70100ACA7010060A70100A4AA010031
-:10F0E0004EAA01004EAA01007CAB01004AAA010011
-:10F0F0004AAA010072AB01007CAB01004AAA0100E0
-:10F1000072AB01004AAA01007CAB010080AB010098
-:10F1100080AB010080AB010088AB0100F4B90100B5
-:10F1200066B80100AAB801000EB80100AAB8010033
-:10F130009AB90100AAB801000EB8010066B8010032
-:10F1400066B801009AB901000EB8010006B80100C6
-:10F1500006B8010006B80100A8B901001CC10100F1
-:10F160001EC001001EC001003CC3010018C0010008
-:10F1700018C0010024C301003CC3010018C00100F5
-:10F1800024C3010018C001003CC3010032C30100C8
-:10F1900032C3010032C3010040C301003863ED3EB9
-:10F1A000DA0F493F5E987B3FDA0FC93F6937AC31D0
-:10F1B00068212233B40F14336821A2330000004BBE
-:10F1C000000000CB737172740000000061636F7304
-:10F1D000660000006173696E660000006578706605
-:10F1E00000000000666D6F64660000006C6F67666B
-:10F1F00000000000706F7766000000007371727489
-:10F20000660000000000003F000000BF8071313F39
-:10F21000807131BFD1F71737D1F717B70000000061
-:10F2200000000080000FC93F000F494000CB96400E
-:10F23000000FC9400053FB4000CB164100ED2F41A9
-:10F24000000F49410031624100537B41003A8A413D
-:10F2500000CB9641005CA34100EDAF41007EBC4174
-:10F26000000FC94100A0D5410031E24100C2EE418A
-:10F270000053FB4100F20342003A0A42008310426D
-:10F2800000CB164200141D42005C234200A5294217
-:10F2900000ED2F4200363642007E3C4200C742421B
-:10F2A000000F4942A2000000F900000083000000A6
-:10F2B0006E0000004E000000440000001500000039
-:10F2C00029000000FC00000027000000570000009B
-:10F2D000D1000000F500000034000000DD00000057
-:10F2E000C0000000DB00000062000000950000008C
-:10F2F000990000003C000000430000009000000066
-:10F3000041000000FE00000051000000630000000A
-:10F31000AB000000DE000000BB000000C5000000E4
-:10F3200061000000B7000000240000006E00000033
-:10F330003A000000420000004D000000D200000032
-:10F34000E000000006000000490000002E00000060
-:10F35000EA00000009000000D10000009200000057
-:10F360001C000000FE0000001D000000EB0000007B
-:10F370001C000000B100000029000000A7000000F0
-:10F380003E000000E80000008200000035000000A0
-:10F39000F50000002E000000BB000000440000004B
-:10F3A00084000000E90000009C00000070000000E4
-:10F3B00026000000B40000005F0000007E00000096
-:10F3C000410000003900000091000000D60000005C
-:10F3D00039000000830000005300000039000000E5
-:10F3E000F40000009C000000840000005F000000AA
-:10F3F0008B000000BD000000F900000028000000A4
-:10F400003B0000001F000000F80000009700000013
-:10F41000FF000000DE000000050000009800000072
-:10F420000F000000EF0000002F000000110000009E
-:10F430008B0000005A0000000A0000006D00000070
-:10F440001F0000006D000000360000007E0000007C
-:10F45000CF00000027000000CB00000009000000E2
-:10F46000B70000004F000000460000003F00000011
-:10F47000660000009E0000005F000000EA0000003F
-:10F480002D0000007500000027000000BA000000F9
-:10F49000C7000000EB000000E5000000F1000000E4
-:10F4A0007B0000003D000000070000003900000064
-:10F4B000F70000008A0000005200000092000000E7
-:10F4C000EA0000006B000000FB0000005F0000008D
-:10F4D000B10000001F0000008D0000005D00000072
-:10F4E000080000005600000003000000300000008B
-:10F4F00046000000FC0000007B0000006B000000E4
-:10F50000AB000000F0000000CF000000BC000000D5
-:10F51000200000009A000000F40000003600000007
-:10F520001D000000A9000000E300000091000000A1
-:10F53000610000005E000000E60000001B0000000B
-:10F540000800000065000000990000008500000030
-:10F550005F00000014000000A00000006800000030
-:10F56000400000008D000000FF000000D8000000F7
-:10F57000800000004D000000730000002700000024
-:10F580003100000006000000060000001500000029
-:10F5900056000000CA00000073000000A800000030
-:10F5A000C900000060000000E20000007B000000D5
-:10F5B000C00000008C0000006B0000000000C93F8C
-:10F5C0000000F0390000DA370000A2330000842E7A
-:10F5D0000000502B0000C2270000D0220000C41FF2
-:10F5E0000000C61B000044170400000007000000D4
-:10F5F0000900000000000000000000000000000002
-:10F6000000000000000000000000000000000000FA
-:10F6100000000000000000000000000000000000EA
-:10F6200000000000000000000000000000000000DA
-:10F6300000000000000000000000000000000000CA
-:10F6400000000000000000000000000000000000BA
-:10F65000000000007000002000686E0200786F0259
-:10F66000008871020060C0020070C1020080C30205
-:10F67000000002000400060008000A000C0011004F
-:10F6800017001D0025002F003B00490061007F008E
-:10F69000A700DF00250185010902B3029703C70413
-:10F6A0005B0671089D0CDF124B1C6D2A913F575F62
-:10F6B000FF8E7BD6000002000200040007000D0050
-:10F6C000190031006100E108E907EE0E4D0DDA0B7B
-:10F6D0002F0BF70961080000180E8E0C00008F0A2E
-:10F6E0006809233124203A101D317D2011109F33E9
-:10F6F000A0204810A013A120A220A320A2223210F3
-:10F700007A20A12231107A20A3627A20A430A41298
-:10F71000A720A520A5624D107A2025312620832020
-:10F7200083122F103010656212100710122313106D
-:10F730007A206A306A6248107A208A1C0710081002
-:10F7400009100A100B100C100E100F100D102A20AB
-:10F750002B202C208B1236208C202C234610993005
-:10F7600047102B2344108C30451087112920296223
-:10F770008A208830883291202A2342108B3043100F
-:10F78000581C4E104F10501051105310541055105B
-:10F79000561058105710591052100921141035A541
-:10F7A000151007109E30491078209E6342109F303C
-:10F7B0004310A7A51D10972022101C20A630A823B7
-:10F7C00020107C20A630A612A720A8207E19361073
-:10F7D000381040103E103F10411022107F20802032
-:10F7E000802223108130812126107F2226102210B2
-:10F7F0001F3121207E206B18132014201520162085
-:10F8000017200320352002200A21161002623D2015
-:10F810003E203E12352003203C244C1068202D3021
-:10F8200004103D323C2007221810972099623420A2
-:10F830009B309A6249107A2034627A209A309C2256
-:10F8400048109D309D33342048109B12A7209C20E7
-:10F8500064626820653067316420481068310710A1
-:10F860004A1074631A10491078203A6233203B30F2
-:10F870003B210410213122203B100522062052306A
-:10F8800052125320542056123620062055624D1035
-:10F8900056205432552053625820562097339820D2
-:10F8A0004810981220202120851227202820276226
-:10F8B0008620852086132F1030103D100061013006
-:10F8C00001323920391204104F20591509200A201D
-:10F8D0000B200D200C2015271D10972022103320FF
-:10F8E00049107820743003A81710071042104030D8
-:10F8F00043103F30491078203F625A107A2010227E
-:10F900001F106920132620107A20491078206C30AF
-:10F9100074306D2419107A20491078206C326D20D3
-:10F92000632207106530663363204810606342101D
-:10F93000662043100F241E105D2021105F205D12F1
-:10F9400068205E205E62612068305F1331106020A5
-:10F9500066200E22211067205C120E200F201AA4B0
-:10F960002410483049107A201BA424104830491034
-:10F970007C206931071048101122251069207D1262
-:10F980001E201F201E2226107D20613262201C3185
-:10F990001D2027100821281062124A100C1028621E
-:10F9A000872089308962321085200D2229105A3033
-:10F9B0005A627A205B305B621E107A200B222A107A
-:10F9C00033302431252082208212371039105062C2
-:10F9D00004200410043351204B103813041050201D
-:10F9E0006B20962249107A305118072008205920A0
-:10F9F0005C2010201120122005202022311021200F
-:10FA00004F126B20502092123220312031627A2026
-:10FA10003230322249109330931294209520942250
-:10FA200049107A3095627A2096303033922048100F
-:10FA300078127920502079640410051018200610DF
-:10FA400018324F2026318520842084143110331041
-:10FA5000351034107A121A2019207B2420101C2013
-:10FA60001A107A2019621C207B307C121B201C206B
-:10FA700033337A2048108C628D208E308D122020F6
-:10FA80007A208E12A7208F208F62481090309033FA
-:10FA90008D204810063357204810571220207A2016
-:10FAA00047220710453091132D202E202F202E2382
-:10FAB0004410302045102D2342109F3043102F2238
-:10FAC0004A10071016242B10491078206E206E1251
-:10FAD0006F20732071627A20653070241B107130A2
-:10FAE000491078206F637220743073307232702046
-:10FAF00073231C1049107820403341204810456280
-:10FB000049107A20442332100710453046624D10C8
-:10FB10007A2041134220432044204263071045309D
-:10FB200046304322311047304833492048104C2298
-:10FB3000321007104D624D107A2049134A204B2095
-:10FB40004C204A6207104D304B2231104E304E612E
-:10FB5000071014252C107A20491078207430766212
-:10FB60007A20773077621210212017242D1075200B
-:10FB700049107820753176204810223123203C101E
-:10FB8000A912AA203320AA221E107A2036222E1073
-:10FB9000A9300C2136207A65726F2073746570006D
-:10FBA00072616E67652825642C202564002C202551
-:10FBB0006429002766726F7A656E73657427206802
-:10FBC0006173206E6F20737563682061747472694D
-:10FBD0006275746500706F702066726F6D20616E63
-:10FBE00020656D707479207365740066726F7A6534
-:10FBF0006E0073657428290066726F7A656E73658E
-:10FC00007428007B002C200063616E277420636FD2
-:10FC10006E766572742027257127206F626A65638E
-:10FC20007420746F20257120696D706C696369742C
-:10FC30006C790062797465732076616C7565206FEC
-:10FC40007574206F662072616E67650077726F6EE3
-:10FC500067206E756D626572206F662061726775D0
-:10FC60006D656E7473006F6E6C7920736C6963657B
-:10FC700073207769746820737465703D3120286142
-:10FC80006B61204E6F6E65292061726520737570FF
-:10FC9000706F7274656400696E636F6D706C65740B
-:10FCA0006520666F726D617400666F726D6174209D
-:10FCB000726571756972657320612064696374008F
-:10FCC000696E636F6D706C65746520666F726D61CF
-:10FCD00074206B6579006E6F7420656E6F75676850
-:10FCE00020617267756D656E747320666F72206631
-:10FCF0006F726D617420737472696E67002525637D
-:10FD000020726571756972657320696E74206F72F7
-:10FD1000206368617200696E746567657220726540
-:10FD200071756972656400756E737570706F727449
-:10FD3000656420666F726D617420636861726163CF
-:10FD4000746572202725632720283078257829209C
-:10FD5000617420696E646578202564006E6F74207C
-:10FD6000616C6C20617267756D656E747320636F72
-:10FD70006E76657274656420647572696E6720734F
-:10FD80007472696E6720666F726D617474696E67F4
-:10FD90000073696E676C6520277D2720656E636F31
-:10FDA000756E746572656420696E20666F726D6130
-:10FDB0007420737472696E670062616420636F6E91
-:10FDC00076657273696F6E207370656369666965C5
-:10FDD0007200756E6D61746368656420277B2720EF
-:10FDE000696E20666F726D6174006578706563740A
-:10FDF000656420273A2720616674657220666F72F9
-:10FE00006D61742073706563696669657200636112
-:10FE10006E2774207377697463682066726F6D2033
-:10FE20006175746F6D61746963206669656C6420C7
-:10FE30006E756D626572696E6720746F206D616E9C
-:10FE400075616C206669656C6420737065636966B2
-:10FE500069636174696F6E007475706C6520696E9A
-:10FE6000646578206F7574206F662072616E6765B7
-:10FE70000061747472696275746573206E6F7420AA
-:10FE8000737570706F727465642079657400636156
-:10FE90006E2774207377697463682066726F6D20B3
-:10FEA0006D616E75616C206669656C642073706548
-:10FEB00063696669636174696F6E20746F20617530
-:10FEC000746F6D61746963206669656C64206E751A
-:10FED0006D626572696E67003C3E3D5E0062636400
-:10FEE0006545664667476E6F7378582500696E767C
-:10FEF000616C696420666F726D61742073706563F4
-:10FF00006966696572007369676E206E6F7420613F
-:10FF10006C6C6F77656420696E20737472696E67AC
-:10FF200020666F726D6174207370656369666965C0
-:10FF300072007369676E206E6F7420616C6C6F77EE
-:10FF40006564207769746820696E746567657220DE
-:10FF5000666F726D6174207370656369666965723E
-:10FF60002027632700756E6B6E6F776E20666F7249
-:10FF70006D617420636F6465202725632720666F99
-:10FF800072206F626A656374206F66207479706591
-:10FF9000202725732700756E6B6E6F776E20666F56
-:10FFA000726D617420636F64652027256327206666
-:10FFB0006F72206F626A656374206F662074797057
-:10FFC000652027666C6F61742700273D2720616CD0
-:10FFD00069676E6D656E74206E6F7420616C6C6FF6
-:10FFE00077656420696E20737472696E6720666F2E
-:10FFF000726D6174207370656369666965720075FE
-:020000040003F7
-:100000006E6B6E6F776E20666F726D617420636FBA
-:100010006465202725632720666F72206F626A65FA
-:100020006374206F6620747970652027737472275B
-:1000300000656D70747920736570617261746F72A0
-:10004000005C2563005C5C005C6E005C72005C74AC
-:10005000005C78253032780073746172742F656E9D
-:100060006420696E6469636573007375627374728A
-:10007000696E67206E6F7420666F756E64006A6FBC
-:10008000696E20657870656374732061206C697394
-:1000900074206F66207374722F6279746573206F99
-:1000A000626A6563747320636F6E73697374656EDF
-:1000B0007420776974682073656C66206F626A6566
-:1000C000637400252E2A73007273706C6974284E55
-:1000D0006F6E652C6E290020090A0D0B0C00636FF2
-:1000E0006D706C65782076616C756573206E6F74C9
-:1000F00020737570706F7274656400696E76616CE0
-:1001000069642073796E74617820666F72206E75F1
-:100110006D62657200696E742829206172672032F1
-:10012000206D757374206265203E3D203220616E23
-:1001300064203C3D20333600696E76616C69642032
-:1001400073796E74617820666F7220696E7465676A
-:100150006572207769746820626173652025640088
-:100160006F626A6563742077697468206275666679
-:1001700065722070726F746F636F6C207265717539
-:100180006972656400257120696E64696365732016
-:100190006D75737420626520696E7465676572732E
-:1001A0002C206E6F7420257300257120696E6465A4
-:1001B00078206F7574206F662072616E6765006FBE
-:1001C000626A6563742027257327206973206E6F28
-:1001D000742061207475706C65206F72206C697377
-:1001E0007400726571756573746564206C656E6703
-:1001F000746820256420627574206F626A65637478
-:1002000020686173206C656E6774682025640063E4
-:10021000616E277420636F6E76657274202573207B
-:10022000746F20666C6F61740063616E2774206365
-:100230006F6E7665727420257320746F20696E74FA
-:10024000006F626A656374206F6620747970652040
-:100250002725732720686173206E6F206C656E28D8
-:10026000290054726163656261636B20286D6F734E
-:100270007420726563656E742063616C6C206C61C0
-:100280007374293A0A00202046696C652022257182
-:10029000222C206C696E65202564002C20696E205C
-:1002A00025710A003C25713E0027257327206F62C7
-:1002B0006A65637420646F6573206E6F7420737554
-:1002C00070706F7274206974656D2064656C6574FC
-:1002D000696F6E0027257327206F626A656374203B
-:1002E0006973206E6F7420737562736372697074C2
-:1002F00061626C650027257327206F626A656374ED
-:1003000020646F6573206E6F7420737570706F72E8
-:1003100074206974656D2061737369676E6D656EB5
-:10032000740000000402020402000002040404003D
-:1003300002020004040301000001030303000101A1
-:10034000020303040201010301040301000300008E
-:1003500004010102000003024D656D6F7279457260
-:10036000726F723A206C6578657220636F756C6489
-:10037000206E6F7420616C6C6F63617465206D65B5
-:100380006D6F7279006C696E65202575200025718E
-:1003900020006D61696E2E707900736F6674207233
-:1003A00065626F6F740D0A006E6F206D6F7265204D
-:1003B00073746F7261676520737061636500492FA4
-:1003C0004F206F7065726174696F6E206F6E20636D
-:1003D0006C6F7365642066696C650066696C652086
-:1003E0006E6F7420666F756E640001000100E2ECB0
-:1003F000F0F4F8FC0004617267756D656E7473202B
-:100400006D757374206265206B6579776F726473A4
-:1004100000756E6B6E6F776E20617267756D656EBD
-:100420007420272571270076616C7565206F7574BF
-:10043000206F662072616E676520666F7220617240
-:1004400067756D656E742027257127007265636579
-:1004500069766564207061636B6574206973206ED2
-:100460006F74206120737472696E670072616469D1
-:100470006F206973206E6F7420656E61626C6564B5
-:1004800000332E342E30002B2D786B63642E636F77
-:100490006D2F333533B32D2B0A7CC0207C0A7CB4FE
-:1004A000205C302F89207C0A7CB2202F83205C893D
-:1004B000207C0A7C8820596F7527726520666C79CC
-:1004C000696E672192204D6963726F507974686F0D
-:1004D0006E2120202F7C88207C0A7C8C20486F771E
-:1004E0003FA6205C205C87207C0A7C8C202FB320D8
-:1004F0007C0A7C8A2030B5207C0A7C89202F7C5C99
-:10050000B4207C0A7C8A207CB5207C0A7C852D84E2
-:100510005F2F5F5C9E5F962D7C0A7CC0207C0A2B3F
-:10052000C02D2B0A00006571016E650263730363C1
-:1005300063046D6905706C067673077663086869F5
-:10054000096C730A67650B6C740C67740D6C6563DA
-:10055000616E206F6E6C7920686176652075702001
-:10056000746F203420706172616D657465727320E0
-:10057000746F205468756D6220617373656D626C71
-:100580007900706172616D6574657273206D757349
-:10059000742062652072656769737465727320697F
-:1005A0006E2073657175656E636520723020746F9F
-:1005B0002072330027257327206578706563747374
-:1005C00020616E2061646472657373206F662074AD
-:1005D000686520666F726D205B612C20625D00751E
-:1005E0006E737570706F72746564205468756D6297
-:1005F00020696E737472756374696F6E202725733A
-:1006000027207769746820256420617267756D659D
-:100610006E7473006272616E6368206E6F7420691D
-:100620006E2072616E67650004656F72086C736C92
-:100630000C6C73721061737214616463187362637B
-:100640001C726F7220747374246E656728636D70FA
-:100650002C636D6E306F7272346D756C38626963C5
-:100660003C6D766E272573272065787065637473FB
-:1006700020616E20696E7465676572002725732797
-:1006800020696E7465676572203078257820646F04
-:100690006573206E6F742066697420696E206D61C9
-:1006A000736B2030782578002725732720657870B4
-:1006B000656374732061206C6162656C006C6162BB
-:1006C000656C2027257127206E6F7420646566692C
-:1006D0006E656400272573272065787065637473E1
-:1006E000206174206D6F7374207225640027257358
-:1006F000272065787065637473206120726567696F
-:10070000737465720027257327206578706563749C
-:1007100073207B72302C2072312C202E2E2E7D00E7
-:100720000072300001723100027232000372330035
-:100730000472340005723500067236000772370005
-:1007400008723800097239000A7231300B72313187
-:100750000C7231320D7231330E7231340F72313509
-:100760000A736C000B6670000D7370000E6C7200E3
-:100770000F70630066756E6374696F6E2074616BD1
-:10078000657320256420706F736974696F6E616C86
-:1007900020617267756D656E7473206275742025B3
-:1007A00064207765726520676976656E0066756E90
-:1007B0006374696F6E20676F74206D756C746970F7
-:1007C0006C652076616C75657320666F722061724E
-:1007D00067756D656E74202725712700756E6578C5
-:1007E000706563746564206B6579776F72642061EE
-:1007F0007267756D656E7420272571270066756EAA
-:100800006374696F6E206D697373696E67207265BA
-:1008100071756972656420706F736974696F6E6158
-:100820006C20617267756D656E74202325640066A7
-:10083000756E6374696F6E206D697373696E67207E
-:100840007265717569726564206B6579776F726422
-:1008500020617267756D656E7420272571270066AB
-:10086000756E6374696F6E206D697373696E67204E
-:100870006B6579776F72642D6F6E6C79206172672A
-:10088000756D656E7400737472696E6720696E644D
-:1008900069636573206D75737420626520696E7479
-:1008A00065676572732C206E6F74202573007374F6
-:1008B00072696E6720696E646578206F7574206F49
-:1008C000662072616E6765005C7525303478005C67
-:1008D000552530387800416C6C6F636174696F6EB8
-:1008E00020696E20696E746572727570742068611B
-:1008F0006E646C6572006E6F7420616E2041756469
-:10090000696F4672616D6500696E646578206F7508
-:1009100074206F6620626F756E64730063616E6E23
-:100920006F742064656C65746520656C656D656EBB
-:100930007473206F6620417564696F4672616D65DE
-:100940000063616E6E6F74207365742072657475D8
-:10095000726E5F70696E20776974686F757420704D
-:10096000696E0063616E277420736574206174740E
-:100970007269627574650063687228292061726704
-:10098000206E6F7420696E2072616E676528307802
-:100990003131303030302900617267206973206155
-:1009A0006E20656D7074792073657175656E636511
-:1009B000006F72642829206578706563746564200F
-:1009C00061206368617261637465722C2062757462
-:1009D00020737472696E67206F66206C656E677431
-:1009E0006820256420666F756E6400332D61726720
-:1009F00020706F772829206E6F7420737570706F68
-:100A000072746564006D75737420757365206B6511
-:100A100079776F726420617267756D656E74206698
-:100A20006F72206B65792066756E6374696F6E00F6
-:100A30002C004F4B0050686F6E656D657320746FAE
-:100A40006F206C6F6E6700496C6C6567616C20701D
-:100A5000697463680050686F6E656D65206E6F74B1
-:100A600020756E64657273746F6F6400496E707583
-:100A7000742070686F6E656D657300494E54455201
-:100A80004E414C204552524F523A20496C6C65679A
-:100A9000616C2070686F6E656D6520696E64657845
-:100AA00000496E7365727420427265616474680DEA
-:100AB0000050726F6365737365642070686F6E6554
-:100AC0006D6573000000000000A4A4A4A4A4A48485
-:100AD00084A4A48484848484848444444444444C0E
-:100AE0004C4C484C404040404040444444444840C2
-:100AF0004C440000B4B4B49494944E4E4E4E4E4EBA
-:100B00004E4E4E4E4E4E4B4B4B4B4B4B4B4B4B4B23
-:100B10004B4B80C1C180C1C1C1C1000000000000B9
-:100B20000000000000000000000000001010101085
-:100B3000080C080440242020240000242020242025
-:100B4000200020000000000000000000000004045D
-:100B50000400000000000000000004040400000085
-:100B60000000000012121208080808080B060C0A00
-:100B700005050B0A0A0A09080709070608060707F8
-:100B80000702050202020202020606070606020822
-:100B900003011E0D0C0C0C0E0906010205010106D5
-:100BA0000102060102080202040202060104060113
-:100BB00004C7FF00121212080B090B0E0F0B100CCA
-:100BC00006060E0C0E0C0B08080B0A09080808088C
-:100BD00008030502020202020206060806060209CE
-:100BE0000402010E0F0F0F0E0E080202070201078A
-:100BF00002020702020802020602020702040701BB
-:100C0000040505202E3F2C2D4949454141414155C0
-:100C1000414945554F524C575957524C57594D4ED3
-:100C20004E4451535346542F2F5A5A5644432A4A3E
-:100C30002A2A2A45414F414F55422A2A442A2A4707
-:100C40002A2A472A2A502A2A542A2A4B2A2A4B2A55
-:100C50002A5555552A2A2A2A2A5948484541484F93
-:100C600048585852584858585858482A2A2A2A2A20
-:100C70002A58582A2A482A4848582A482A48482A96
-:100C80002A2A2A2A5959595757572A2A2A2A2A2AB0
-:100C90002A2A2A582A2A2A2A2A2A2A2A2A2A2A5858
-:100CA0002A2A4C4D4E2A313233343536373865785E
-:100CB00070656374696E6720612070696E00696E8B
-:100CC00076616C696420706572696F6400696E7624
-:100CD000616C69642070756C6C0076616C75652060
-:100CE0006D757374206265206265747765656E202A
-:100CF0003020616E6420313032330076616C75656E
-:100D0000206D7573742062652030206F7220310071
-:100D1000696D706F727420000A2573007768696CC2
-:100D20006500666F72007472790063616E6E6F7435
-:100D300020706572666F726D2072656C6174697681
-:100D40006520696D706F7274006E6F206D6F6475D1
-:100D50006C65206E616D65642027257127005F5FDB
-:100D6000696E69745F5F2E707900476C697463689F
-:100D700065733A2025640D0A007465787420746FD9
-:100D80006F206C6F6E6700636F756C64206E6F749C
-:100D900020706172736520696E70757400736C6980
-:100DA000636528006469766973696F6E20627920D3
-:100DB0007A65726F006D61746820646F6D61696E31
-:100DC000206572726F72000A000B0C0D0E0F00008E
-:100DD0000000000000000003030303030000000004
-:100DE00000000000000000000000000000000301FF
-:100DF000010101010101010101010101010145455B
-:100E0000454545454545454501010101010101595A
-:100E10005959595959191919191919191919191902
-:100E20001919191919191919190101010101016972
-:100E300069696969692929292929292929292929E2
-:100E400029292929292929292901010101004D6977
-:100E500063726F426974416363656C65726F6D653F
-:100E600074657220747970650A0055736566756CD7
-:100E700020737475666620746F20636F6E74726F72
-:100E80006C20746865206D6963726F3A62697420C2
-:100E900068617264776172652E0A00507574206D06
-:100EA0006963726F3A62697420696E2070616E695D
-:100EB000632829206D6F646520616E642064697306
-:100EC000706C617920616E20756E68617070792038
-:100ED000666163652E0A507265737320726573656F
-:100EE0007420627574746F6E20746F2065786974F5
-:100EF0002070616E69632829206D6F64652E0A0079
-:100F0000507574206D6963726F3A62697420746FF2
-:100F100020736C6565702874696D652920666F7231
-:100F200020736F6D65206D696C6C697365636F6E9E
-:100F30006473202831207365636F6E64203D203117
-:100F4000303030206D7329206F662074696D652EF6
-:100F50000A736C65657028323030302920676976F5
-:100F60006573206D6963726F3A6269742061203223
-:100F7000207365636F6E64206E61702E0A00526587
-:100F80007475726E2072756E6E696E675F74696DCE
-:100F900065282920696E206D696C6C697365636FC3
-:100FA0006E64732073696E6365206D6963726F3A56
-:100FB0006269742773206C61737420726573657441
-:100FC0002E0A0052657475726E206D6963726F3AF5
-:100FD00062697427732074656D70657261747572CF
-:100FE0006520696E20646567726565732043656C72
-:100FF000636975732E0A00446574656374206D69B6
-:1010000063726F3A6269742773206D6F76656D65E0
-:101010006E7420696E2033442E0A4974206D656118
-:1010200073757265732074696C7420285820616E22
-:101030006420592920616E642075702D646F776E6D
-:1010400020285A29206D6F74696F6E2E0A00526530
-:101050007475726E206D6963726F3A62697427737A
-:101060002074696C7420285820616363656C657214
-:101070006174696F6E2920696E206D696C6C692DD1
-:101080006727732E0A0052657475726E206D69634E
-:10109000726F3A62697427732074696C74202859DE
-:1010A00020616363656C65726174696F6E29206984
-:1010B0006E206D696C6C692D6727732E0A0052656E
-:1010C0007475726E206D6963726F3A62697427730A
-:1010D0002075702D646F776E206D6F74696F6E2050
-:1010E000285A20616363656C65726174696F6E294B
-:1010F00020696E206D696C6C692D6727732E0A5A02
-:10110000206973206120706F736974697665206E41
-:10111000756D626572207768656E206D6F76696E99
-:10112000672075702E204D6F76696E6720646F772B
-:101130006E2C205A2069732061206E656761746986
-:101140007665206E756D6265722E0A006D69637238
-:101150006F3A62697427732027412720627574747F
-:101160006F6E2E205768656E20627574746F6E20E6
-:101170006973207072657373656420646F776E2C79
-:101180002069735F707265737365642829206973C1
-:1011900020547275652E0A006D6963726F3A626938
-:1011A0007427732027422720627574746F6E2E2077
-:1011B0005768656E20627574746F6E206973207055
-:1011C00072657373656420646F776E2C2069735F3A
-:1011D0007072657373656428292069732054727571
-:1011E000652E0A0049662074686520627574746F04
-:1011F0006E206973207072657373656420646F7705
-:101200006E2C2069735F7072657373656428292082
-:10121000697320547275652C20656C736520466176
-:101220006C73652E0A00557365207761735F707269
-:101230006573736564282920746F206C6561726E14
-:101240002069662074686520627574746F6E2077FB
-:10125000617320707265737365642073696E636572
-:1012600020746865206C6173742074696D650A77F9
-:1012700061735F7072657373656428292077617389
-:101280002063616C6C65642E2052657475726E7398
-:101290002054727565206F722046616C73652E0A4A
-:1012A00000557365206765745F707265737365734D
-:1012B000282920746F206765742074686520727512
-:1012C0006E6E696E6720746F74616C206F66206249
-:1012D0007574746F6E20707265737365732C206102
-:1012E0006E6420616C736F0A726573657420746834
-:1012F000697320636F756E74657220746F207A65F0
-:10130000726F2E0A004769766573206120636F6DE6
-:10131000706173732068656164696E6720626574CB
-:101320007765656E20302D333630207769746820FC
-:1013300030206173206E6F7274682E0A00557365D9
-:10134000206D6963726F3A626974277320636F6DF1
-:101350007061737320746F206465746563742074A6
-:10136000686520646972656374696F6E20697420B2
-:1013700069732068656164696E6720696E2E0A541E
-:10138000686520636F6D706173732063616E2064A4
-:101390006574656374206D61676E6574696320664A
-:1013A00069656C64732E0A497420757365732074C3
-:1013B00068652045617274682773206D61676E658A
-:1013C000746963206669656C6420746F2064657459
-:1013D00065637420646972656374696F6E2E0A00B8
-:1013E0004966206D6963726F3A626974277320637E
-:1013F0006F6D706173732069735F63616C69627292
-:1014000061746564282920616E642061646A757363
-:1014100074656420666F72206163637572616379BD
-:101420002C2072657475726E20547275652E0A498F
-:101430006620636F6D70617373206861736E2774CB
-:10144000206265656E2061646A75737465642066E8
-:101450006F722061636375726163792C20726574A9
-:1014600075726E2046616C73652E0A004966206DA8
-:101470006963726F3A62697420697320636F6E6684
-:10148000757365642C2063616C6962726174652890
-:10149000292074686520636F6D7061737320746FA9
-:1014A0002061646A757374207468652069747320A0
-:1014B00061636375726163792E0A49742077696C80
-:1014C0006C2061736B20796F7520746F20726F745C
-:1014D000617465207468652064657669636520744D
-:1014E0006F2064726177206120636972636C65208C
-:1014F0006F6E2074686520646973706C61792E0A60
-:10150000005265736574206D6963726F3A62697425
-:10151000277320636F6D70617373207573696E67D5
-:1015200020636C6561725F63616C6962726174698A
-:101530006F6E282920636F6D6D616E642E0A52757F
-:101540006E2063616C696272617465282920746F12
-:1015500020696D70726F7665206163637572616377
-:10156000792E0A0052657475726E206D61676E6522
-:10157000746963206669656C64206465746563746E
-:10158000656420616C6F6E67206D6963726F3A628B
-:1015900069742773205820617869732E0A55737512
-:1015A000616C6C792C2074686520636F6D70617359
-:1015B000732072657475726E73207468652065613E
-:1015C0007274682773206D61676E65746963206645
-:1015D00069656C6420696E206D6963726F2D546556
-:1015E000736C6120756E6974732E0A556E6C657329
-:1015F000732E2E2E61207374726F6E67206D61677B
-:101600006E6574206973206E6561726279210A00CB
-:1016100052657475726E206D61676E6574696320C2
-:101620006669656C642064657465637465642061D3
-:101630006C6F6E67206D6963726F3A6269742773AD
-:10164000205920617869732E0A557375616C6C7925
-:101650002C2074686520636F6D70617373207265F0
-:101660007475726E73207468652065617274682782
-:1016700073206D61676E65746963206669656C646B
-:1016800020696E206D6963726F2D5465736C6120E3
-:10169000756E6974732E0A556E6C6573732E2E2EDB
-:1016A00061207374726F6E67206D61676E65742060
-:1016B0006973206E6561726279210A0052657475E2
-:1016C000726E206D61676E65746963206669656C12
-:1016D0006420646574656374656420616C6F6E6713
-:1016E000206D6963726F3A6269742773205A2061B2
-:1016F0007869732E0A557375616C6C792C20746847
-:101700006520636F6D706173732072657475726E9E
-:1017100073207468652065617274682773206D6139
-:10172000676E65746963206669656C6420696E2004
-:101730006D6963726F2D5465736C6120756E697489
-:10174000732E0A556E6C6573732E2E2E6120737482
-:10175000726F6E67206D61676E6574206973206EAD
-:101760006561726279210A0052657475726E207328
-:101770007472656E677468206F66206D61676E6550
-:10178000746963206669656C642061726F756E644C
-:10179000206D6963726F3A6269742E0A006D696325
-:1017A000726F3A626974277320357835204C45444E
-:1017B00020646973706C61792E0A0055736520731B
-:1017C000686F7728782920746F207072696E742092
-:1017D00074686520737472696E67206F7220696D1A
-:1017E000616765732027782720746F2074686520EF
-:1017F000646973706C61792E205472792073686FFC
-:1018000077282748692127292E0A55736520736890
-:101810006F7728732C20692920746F2073686F7785
-:1018200020737472696E67202773272C206F6E6592
-:101830002063686172616374657220617420612045
-:1018400074696D65207769746820612064656C61D6
-:1018500079206F660A276927206D696C6C6973654A
-:10186000636F6E64732E0A00557365207363726F25
-:101870006C6C28732920746F207363726F6C6C20FA
-:1018800074686520737472696E67202773272061FE
-:1018900063726F73732074686520646973706C6120
-:1018A000792E0A557365207363726F6C6C28732CE4
-:1018B00020692920746F207363726F6C6C207374BD
-:1018C00072696E672027732720776974682061200A
-:1018D00064656C6179206F6620276927206D696CCB
-:1018E0006C697365636F6E64732061667465720AF8
-:1018F00065616368206368617261637465722E0A52
-:101900000055736520636C656172282920746F200F
-:10191000636C656172206D6963726F3A62697427E6
-:101920007320646973706C61792E0A0055736520A9
-:101930006765745F706978656C28782C2079292038
-:10194000746F2072657475726E20746865206469A6
-:1019500073706C61792773206272696768746E6551
-:101960007373206174204C454420706978656C2045
-:1019700028782C79292E0A4272696768746E65731B
-:10198000732063616E2062652066726F6D20302067
-:10199000284C4544206973206F66662920746F20A7
-:1019A0003920286D6178696D756D204C4544206241
-:1019B00072696768746E657373292E0A00557365C2
-:1019C000207365745F706978656C28782C20792C99
-:1019D00020622920746F2073657420746865206408
-:1019E0006973706C6179206174204C454420706982
-:1019F00078656C2028782C792920746F20627269B0
-:101A00006768746E657373202762270A7768696355
-:101A1000682063616E20626520736574206265745E
-:101A20007765656E203020286F66662920746F20E8
-:101A300039202866756C6C206272696768746E65FF
-:101A40007373292E0A00557365206F6E2829207440
-:101A50006F207475726E206F6E20746865206469E3
-:101A600073706C61792E0A00557365206F66662865
-:101A70002920746F207475726E206F6666207468FA
-:101A80006520646973706C61792E0A005573652056
-:101A900069735F6F6E282920746F20717565727984
-:101AA00020696620746865206D6963726F3A6269A7
-:101AB00074277320646973706C6179206973206F77
-:101AC0006E20285472756529206F72206F6666201B
-:101AD0002846616C7365292E0A005573652072656E
-:101AE00061645F6C696768745F6C6576656C2829F2
-:101AF00020746F206765742074686520616D626969
-:101B0000656E74206C69676874206C6576656C2CF2
-:101B1000206265747765656E203020286461726B81
-:101B20002920616E64203235352028627269676829
-:101B300074292E0A006D6963726F3A6269742773A3
-:101B40002070696E2030206F6E2074686520676F8A
-:101B50006C64206564676520636F6E6E6563746F87
-:101B6000722E0A006D6963726F3A6269742773207E
-:101B700070696E2031206F6E2074686520676F6C0D
-:101B800064206564676520636F6E6E6563746F7251
-:101B90002E0A006D6963726F3A6269742773207050
-:101BA000696E2032206F6E2074686520676F6C64E8
-:101BB000206564676520636F6E6E6563746F722E57
-:101BC0000A006D6963726F3A6269742773207069E5
-:101BD0006E2033206F6E2074686520676F6C642000
-:101BE0006564676520636F6E6E6563746F722E0A3D
-:101BF000006D6963726F3A62697427732070696E51
-:101C00002034206F6E2074686520676F6C642065D7
-:101C100064676520636F6E6E6563746F722E0A0071
-:101C20006D6963726F3A62697427732070696E2000
-:101C300035206F6E2074686520676F6C6420656462
-:101C4000676520636F6E6E6563746F722E0A006D38
-:101C50006963726F3A62697427732070696E203607
-:101C6000206F6E2074686520676F6C642065646700
-:101C70006520636F6E6E6563746F722E0A006D6906
-:101C800063726F3A62697427732070696E2037201F
-:101C90006F6E2074686520676F6C6420656467658B
-:101CA00020636F6E6E6563746F722E0A006D6963D8
-:101CB000726F3A62697427732070696E2038206FE2
-:101CC0006E2074686520676F6C64206564676520AA
-:101CD000636F6E6E6563746F722E0A006D69637256
-:101CE0006F3A62697427732070696E2039206F6EB5
-:101CF0002074686520676F6C642065646765206385
-:101D00006F6E6E6563746F722E0A006D6963726F19
-:101D10003A62697427732070696E203130206F6ECB
-:101D20002074686520676F6C642065646765206354
-:101D30006F6E6E6563746F722E0A006D6963726FE9
-:101D40003A62697427732070696E203131206F6E9A
-:101D50002074686520676F6C642065646765206324
-:101D60006F6E6E6563746F722E0A006D6963726FB9
-:101D70003A62697427732070696E203132206F6E69
-:101D80002074686520676F6C6420656467652063F4
-:101D90006F6E6E6563746F722E0A006D6963726F89
-:101DA0003A62697427732070696E203133206F6E38
-:101DB0002074686520676F6C6420656467652063C4
-:101DC0006F6E6E6563746F722E0A006D6963726F59
-:101DD0003A62697427732070696E203134206F6E07
-:101DE0002074686520676F6C642065646765206394
-:101DF0006F6E6E6563746F722E0A006D6963726F29
-:101E00003A62697427732070696E203135206F6ED5
-:101E10002074686520676F6C642065646765206363
-:101E20006F6E6E6563746F722E0A006D6963726FF8
-:101E30003A62697427732070696E203136206F6EA4
-:101E40002074686520676F6C642065646765206333
-:101E50006F6E6E6563746F722E0A006D6963726FC8
-:101E60003A62697427732070696E203139206F6E71
-:101E70002074686520676F6C642065646765206303
-:101E80006F6E6E6563746F722E0A006D6963726F98
-:101E90003A62697427732070696E203230206F6E49
-:101EA0002074686520676F6C6420656467652063D3
-:101EB0006F6E6E6563746F722E0A006D6963726F68
-:101EC0003A6269742C2077726974655F6469676926
-:101ED00074616C2863686F6963652920746F20746E
-:101EE00068652070696E2E20596F7520686176656F
-:101EF0002074776F202763686F6963652720766198
-:101F00006C7565732C0A3020286C6F29206F722045
-:101F10003120286869292E0A006D6963726F3A6260
-:101F200069742C20726561645F6469676974616CAF
-:101F300028292076616C75652066726F6D20746843
-:101F4000652070696E206173206569746865722010
-:101F50003020286C6F29206F722031202868692971
-:101F60002E0A006D6963726F3A6269742C20777271
-:101F70006974655F616E616C6F672876616C756509
-:101F80002920746F207468652070696E2E20596F47
-:101F9000752063616E2075736520616E79207661AE
-:101FA0006C7565206265747765656E0A3020616EB8
-:101FB0006420313032332E0A006D6963726F3A62E9
-:101FC00069742C20726561645F616E616C6F672853
-:101FD000292076616C75652066726F6D2074686566
-:101FE0002070696E2E20576F772C20616E616C6FA8
-:101FF0006720686173206C6F7473206F6620766150
-:102000006C7565730A2830202D2036353533352917
-:102010002E204469676974616C20686173206F6E5B
-:102020006C79203020616E6420312E0A00496620D0
-:1020300070696E2069735F746F75636865642829C1
-:10204000206F6E206D6963726F3A6269742C207222
-:10205000657475726E20547275652E204966206E07
-:102060006F7468696E6720697320746F756368693F
-:102070006E67207468652070696E2C0A72657475CD
-:10208000726E2046616C73652E0A00436F6D6D752C
-:102090006E69636174652077697468206F6E65206E
-:1020A0006F72206D6F7265206E616D65642064656E
-:1020B000766963657320636F6E6E65637465642013
-:1020C000746F206D6963726F3A6269742E20456186
-:1020D0006368206E616D65640A6465766963652076
-:1020E00068617320616E2027616464726573732771
-:1020F0002C20636F6D6D756E6963617465732075F7
-:1021000073696E67204932432C20616E6420636FCF
-:102110006E6E6563747320746F2074686520492F38
-:102120004F2070696E732E0A0055736520726561C9
-:102130006428616464726573732C206E2920746F47
-:10214000207265616420276E272062797465732090
-:1021500066726F6D207468652064657669636520BA
-:102160007769746820746869732061646472657348
-:10217000732E0A005573652077726974652861644F
-:1021800064726573732C20627566666572292074AB
-:102190006F20777269746520746F207468652027DA
-:1021A00062756666657227206F66207468652064B4
-:1021B000657669636520617420746869732027619E
-:1021C000646472657373272E0A0055736520696E07
-:1021D0006974286672657175656E63792C20736306
-:1021E0006C2C207364612920746F207365742074D3
-:1021F000686520627573206672657175656E6379B6
-:1022000020616E642070696E732E0A0043726561EE
-:10221000746520616E6420757365206275696C74E5
-:102220002D696E20494D4147455320746F207368D6
-:102230006F77206F6E2074686520646973706C61BD
-:10224000792E205573653A0A496D616765280A2021
-:10225000202730393039303A270A202027393939B8
-:1022600039393A270A20202739393939393A270AA2
-:1022700020202730393939303A270A2020273030BA
-:102280003930303A27290A2E2E2E746F206D616B5B
-:10229000652061206E65772035783520686561722C
-:1022A0007420696D6167652E204E756D626572736D
-:1022B00020676F2066726F6D203020286F66662958
-:1022C00020746F203920286272696768746573749E
-:1022D000292E204E6F74650A74686520636F6C6FD9
-:1022E0006E20273A2720746F207365742074686508
-:1022F00020656E64206F66206120726F772E0A0061
-:1023000052657475726E20746865207769647468AC
-:10231000206F662074686520696D61676520696E4D
-:1023200020706978656C732E0A0052657475726E40
-:102330002074686520686569676874206F6620741A
-:10234000686520696D61676520696E2070697865D0
-:102350006C732E0A00557365206765745F70697829
-:10236000656C28782C20792920746F20726574752B
-:10237000726E2074686520696D61676527732062DD
-:1023800072696768746E657373206174204C45448C
-:1023900020706978656C2028782C79292E0A427281
-:1023A000696768746E6573732063616E206265206F
-:1023B00066726F6D203020284C4544206973206F71
-:1023C00066662920746F203920286D6178696D75E3
-:1023D0006D204C4544206272696768746E65737342
-:1023E000292E0A00557365207365745F70697865DE
-:1023F0006C28782C20792C20622920746F2073653A
-:102400007420746865204C454420706978656C20A0
-:1024100028782C792920696E2074686520696D619F
-:10242000676520746F206272696768746E65737384
-:102430000A2762272077686963682063616E2062DB
-:102440006520736574206265747765656E20302041
-:10245000286F66662920746F2039202866756C6C99
-:10246000206272696768746E657373292E0A00555D
-:1024700073652073686966745F6C65667428692982
-:1024800020746F206D616B65206120636F7079200F
-:102490006F662074686520696D6167652062757478
-:1024A000206D6F7665642027692720706978656CD8
-:1024B0007320746F20746865206C6566742E0A0042
-:1024C0005573652073686966745F726967687428FC
-:1024D000692920746F206D616B65206120636F70C6
-:1024E00079206F662074686520696D616765206278
-:1024F0007574206D6F766564202769272070697870
-:10250000656C7320746F0A746865207269676874FB
-:102510002E0A005573652073686966745F757028AC
-:10252000692920746F206D616B65206120636F7075
-:1025300079206F662074686520696D616765206227
-:102540007574206D6F76656420276927207069781F
-:10255000656C732075702E0A005573652073686969
-:1025600066745F646F776E28692920746F206D61CF
-:102570006B65206120636F7079206F6620746865D9
-:1025800020696D61676520627574206D6F76656482
-:102590002027692720706978656C7320646F776ED7
-:1025A0002E0A0055736520636F7079282920746F97
-:1025B000206D616B652061206E65772065786163B1
-:1025C0007420636F7079206F662074686520696D70
-:1025D0006167652E0A005573652063726F702878F5
-:1025E000312C2079312C2078322C2079322920741A
-:1025F0006F206D616B652061206375742D6F75743C
-:1026000020636F7079206F662074686520696D6142
-:10261000676520776865726520636F6F7264696EA5
-:102620006174650A2878312C793129206973207406
-:10263000686520746F70206C65667420636F726EBD
-:102640006572206F6620746865206375742D6F75E0
-:1026500074206172656120616E6420636F6F7264C3
-:10266000696E617465202878322C7932292069736B
-:10267000207468650A626F74746F6D207269676890
-:102680007420636F726E65722E0A0055736520693F
-:102690006E76657274282920746F206D616B6520D9
-:1026A00061206E6567617469766520636F7079205B
-:1026B0006F662074686520696D6167652E205768B4
-:1026C000657265206120706978656C207761732080
-:1026D000627269676874206F720A6F6E20696E207B
-:1026E000746865206F726967696E616C2C2069740B
-:1026F0002069732064696D206F72206F666620699F
-:102700006E20746865206E65676174697665206304
-:102710006F70792E0A00436F6D6D756E6963617419
-:1027200065207769746820612073657269616C2027
-:1027300064657669636520636F6E6E656374656456
-:1027400020746F206D6963726F3A62697427732019
-:10275000492F4F2070696E732E0A005573652069EA
-:102760006E6974282920746F207365742075702039
-:10277000636F6D6D756E69636174696F6E2E205540
-:1027800073652070696E73203020285458292061A9
-:102790006E6420312028525829207769746820619E
-:1027A00020626175640A72617465206F6620393633
-:1027B00030302E0A4F7665727269646520746865E0
-:1027C0002064656661756C747320666F7220276281
-:1027D00061756472617465272C2027706172697459
-:1027E000792720616E64202770696E73272E0A0096
-:1027F00049662074686572652061726520696E6340
-:102800006F6D696E6720636861726163746572736E
-:102810002077616974696E6720746F206265207229
-:102820006561642C20616E7928292077696C6C20A1
-:1028300072657475726E20547275652E0A4F7468D5
-:102840006572776973652C2072657475726E73207A
-:1028500046616C73652E0A0055736520726561646C
-:10286000282920746F207265616420636861726139
-:1028700063746572732E0A557365207265616428EE
-:102880006E2920746F20726561642C206174206D44
-:102890006F73742C20276E27206279746573206F04
-:1028A0006620646174612E0A00557365207265614B
-:1028B000646C696E65282920746F207265616420DC
-:1028C00061206C696E65207468617420656E647344
-:1028D00020776974682061206E65776C696E652069
-:1028E0006368617261637465722E0A0055736520B6
-:1028F00072656164696E746F286275662920746FF1
-:10290000207265616420627974657320696E746FEA
-:102910002074686520627566666572202762756638
-:10292000272E0A5573652072656164696E746F287D
-:10293000627566662C206E2920746F207265616452
-:102940002C206174206D6F73742C20276E27206EED
-:10295000756D626572206F66206279746573206997
-:102960006E746F2027627566272E0A0055736520E6
-:102970007772697465286275662920746F20777292
-:102980006974652074686520627974657320696E66
-:102990002062756666657220276275662720746FEF
-:1029A0002074686520636F6E6E656374656420646F
-:1029B00065766963652E0A00436F6D6D756E696398
-:1029C000617465207573696E672061207365726933
-:1029D000616C207065726970686572616C20696EE7
-:1029E00074657266616365202853504929206465C7
-:1029F0007669636520636F6E6E65637465642074C9
-:102A00006F0A6D6963726F3A626974277320492F88
-:102A10004F2070696E732E0A0055736520696E69C8
-:102A200074282920746F2073657420757020636F7B
-:102A30006D6D756E69636174696F6E2E204F76657A
-:102A40007272696465207468652064656661756C7E
-:102A5000747320666F722062617564726174652C94
-:102A6000206D6F64652C0A53434C4B2C204D4F5303
-:102A70004920616E64204D49534F2E2054686520D3
-:102A800064656661756C7420636F6E6E65637469EE
-:102A90006F6E73206172652070696E313320666FCE
-:102AA000722053434C4B2C2070696E313520666F79
-:102AB000720A4D4F534920616E642070696E313443
-:102AC00020666F72204D49534F2E0A0055736520C2
-:102AD0007772697465286275662920746F20777231
-:102AE00069746520627974657320696E2062756609
-:102AF00066657220276275662720746F207468658A
-:102B000020636F6E6E6563746564206465766963C7
-:102B1000652E0A005573652072656164286E292050
-:102B2000746F207265616420276E27206279746556
-:102B300073206F6620646174612E0A0055736520EE
-:102B400077726974655F72656164696E746F286F0E
-:102B500075742C20696E2920746F207772697465F2
-:102B60002074686520276F75742720627566666516
-:102B70007220746F2074686520636F6E6E65637475
-:102B80006564206465766963650A616E64207265B8
-:102B9000616420616E7920726573706F6E73652059
-:102BA000696E746F207468652027696E27206275CE
-:102BB000666665722E20546865206C656E67746861
-:102BC000206F662074686520627566666572732082
-:102BD00073686F756C640A62652074686520736140
-:102BE0006D652E2054686520627566666572732077
-:102BF00063616E206265207468652073616D652075
-:102C00006F626A6563742E0A00506C756720696E86
-:102C1000206120737065616B65722077697468202C
-:102C200063726F636F64696C6520636C6970732095
-:102C3000616E64206D616B65206D6963726F3A62CD
-:102C4000697420676F20626C65657020616E642016
-:102C5000626C6F6F702E0A00557365207365745F28
-:102C600074656D706F286E756D6265722C20627070
-:102C70006D2920746F206D616B6520612062656134
-:102C800074206C617374206120276E756D626572AB
-:102C900027206F66207469636B73206C6F6E6720EA
-:102CA000616E640A706C61796564206174202762CA
-:102CB000706D2720626561747320706572206D6984
-:102CC0006E7574652E0A00557365207069746368AB
-:102CD00028667265712C206C656E67746829207493
-:102CE0006F206D616B65206D6963726F3A62697404
-:102CF00020706C61792061206E6F74652061742092
-:102D0000276672657127206672657175656E6379D5
-:102D100020666F720A276C656E67746827206D697C
-:102D20006C6C697365636F6E64732E20452E672E1D
-:102D3000207069746368283434302C20313030308E
-:102D4000292077696C6C20706C617920636F6E63E9
-:102D50006572742027412720666F722031207365C9
-:102D6000636F6E642E0A0055736520706C6179285C
-:102D70006D757369632920746F206D616B65206DBB
-:102D80006963726F3A62697420706C617920276D93
-:102D90007573696327206C697374206F66206E6F8A
-:102DA0007465732E20547279206F75742074686571
-:102DB0000A6275696C7420696E206D757369632091
-:102DC000746F2073656520686F7720697420776F52
-:102DD000726B732E20452E672E206D757369632EDE
-:102DE000706C6179286D757369632E50554E434838
-:102DF0004C494E45292E0A00557365206765745F5E
-:102E000074656D706F282920746F207265747572F7
-:102E10006E20746865206E756D626572206F662025
-:102E20007469636B7320696E206120626561742030
-:102E3000616E64206E756D626572206F66206265DA
-:102E40006174730A706572206D696E7574652E0AFF
-:102E50000055736520746F2073746F702829207477
-:102E60006865206D75736963207468617420697387
-:102E700020706C6179696E672E0A0049662074685B
-:102E8000696E677320676F2077726F6E672C207290
-:102E900065736574282920746865206D757369638E
-:102EA00020746F206974732064656661756C74208A
-:102EB00073657474696E67732E0A005365653A20F2
-:102EC000687474703A2F2F786B63642E636F6D2F64
-:102ED0003335332F0A00546865205A656E206F66BB
-:102EE00020507974686F6E20646566696E65732022
-:102EF0007768617420697420697320746F2062653B
-:102F000020507974686F6E69632E20497420776F42
-:102F1000756C646E277420666974206F6E20746807
-:102F200069730A64657669636520736F2077652726
-:102F30007665207772697474656E2061205A656EBB
-:102F4000206F66204D6963726F507974686F6E20D0
-:102F5000696E73746561642E0A005573652061752E
-:102F600074686F7273282920746F207265766561AA
-:102F70006C20746865206E616D6573206F662074C7
-:102F800068652070656F706C652077686F2063726C
-:102F90006561746564207468697320736F66747703
-:102FA0006172652E0A00416C6C20796F75206E6528
-:102FB00065642E20557365206C6F76652E626164A2
-:102FC00061626F6F6D282920746F20726570656172
-:102FD0007420746865206566666563742E0A00480F
-:102FE000656172206D7920736F756C2073706561F7
-:102FF0006B3A0A546865207665727920696E73743D
-:10300000616E74207468617420492073617720793F
-:103010006F752C206469640A4D792068656172744B
-:1030200020666C7920746F20796F757220736572D9
-:10303000766963652E0A0057656C636F6D65207451
-:103040006F204D6963726F507974686F6E206F6E78
-:1030500020746865206D6963726F3A626974210A31
-:103060000A54727920746865736520636F6D6D61B1
-:103070006E64733A0A2020646973706C61792E73F0
-:1030800063726F6C6C282748656C6C6F27290A2067
-:103090002072756E6E696E675F74696D6528290AA6
-:1030A0002020736C6565702831303030290A20206B
-:1030B000627574746F6E5F612E69735F7072657391
-:1030C00073656428290A5768617420646F207468E6
-:1030D00065736520636F6D6D616E647320646F3F0F
-:1030E0002043616E20796F7520696D70726F76650F
-:1030F000207468656D3F2048494E543A20757365C9
-:103100002074686520757020616E6420646F776E2E
-:103110000A6172726F77206B65797320746F206714
-:10312000657420796F757220636F6D6D616E6420B8
-:10313000686973746F72792E20507265737320748E
-:10314000686520544142206B657920746F20617559
-:10315000746F2D636F6D706C6574650A756E66694A
-:103160006E697368656420776F7264732028736F6B
-:103170002027646927206265636F6D65732027646B
-:103180006973706C61792720616674657220796F4C
-:103190007520707265737320544142292E20546843
-:1031A0006573650A747269636B7320736176652059
-:1031B00061206C6F74206F6620747970696E67206F
-:1031C000616E64206C6F6F6B20636F6F6C210A0AF5
-:1031D0004578706C6F72653A0A547970652027687B
-:1031E000656C7028736F6D657468696E6729272038
-:1031F000746F2066696E64206F75742061626F75EC
-:10320000742069742E2054797065202764697228AF
-:10321000736F6D657468696E67292720746F2073FA
-:10322000656520776861740A69742063616E206443
-:103230006F2E205479706520276469722829272011
-:10324000746F207365652077686174207374756688
-:103250006620697320617661696C61626C652E20FD
-:10326000466F7220676F6F646E6573732073616B56
-:10327000652C0A646F6E2774207479706520276945
-:103280006D706F72742074686973272E0A0A436F19
-:103290006E74726F6C20636F6D6D616E64733A0A49
-:1032A00020204354524C2D43202020202020202039
-:1032B0002D2D2073746F7020612072756E6E696E93
-:1032C000672070726F6772616D0A20204354524C00
-:1032D0002D4420202020202020202D2D206F6E2006
-:1032E0006120626C616E6B206C696E652C20646F6E
-:1032F000206120736F6674207265736574206F6639
-:1033000020746865206D6963726F3A6269740A207F
-:10331000204354524C2D4520202020202020202DB9
-:103320002D20656E746572207061737465206D6FF9
-:1033300064652C207475726E696E67206F666620F6
-:103340006175746F2D696E64656E740A0A466F72DA
-:103350002061206C697374206F6620617661696CEE
-:1033600061626C65206D6F64756C65732C20747977
-:1033700070652068656C7028276D6F64756C657367
-:1033800027290A0A466F72206D6F726520696E6682
-:103390006F726D6174696F6E2061626F7574205019
-:1033A0007974686F6E2C2076697369743A2068743A
-:1033B00074703A2F2F707974686F6E2E6F72672F4A
-:1033C0000A546F2066696E64206F75742061626FA5
-:1033D0007574204D6963726F507974686F6E2C201C
-:1033E00076697369743A20687474703A2F2F6D6926
-:1033F00063726F707974686F6E2E6F72672F0A50E8
-:103400007974686F6E2F6D6963726F3A62697420A8
-:10341000646F63756D656E746174696F6E20697336
-:1034200020686572653A2068747470733A2F2F6D46
-:103430006963726F6269742D6D6963726F707974FC
-:10344000686F6E2E72656164746865646F63732E55
-:10345000696F2F0A003C6D6F64756C6520272573BA
-:10346000273E0050696E20256420696E202571205A
-:103470006D6F646500506C757320616E79206D6F9F
-:1034800064756C6573206F6E207468652066696C66
-:103490006573797374656D0A006F626A6563742081
-:1034A00000206973206F6620747970652025730A87
-:1034B00000202D2D20006279746561727261792877
-:1034C000620061727261792827256327002C205BD6
-:1034D000004E6F6E65002020202020202020000854
-:1034E00008080808080808000506070409080A046F
-:1034F000031213141615170F0D0E111063616E27AA
-:10350000742061737369676E20746F206C697465D1
-:1035100072616C0063616E27742061737369676EFA
-:1035200020746F2065787072657373696F6E0069BF
-:103530006C6C6567616C2065787072657373696F18
-:103540006E20666F72206175676D656E74656420AC
-:1035500061737369676E6D656E74006D756C746907
-:10356000706C65202A7820696E2061737369676EBC
-:103570006D656E740063616E27742064656C65749C
-:10358000652065787072657373696F6E0065787019
-:10359000656374696E67206B65793A76616C7565F1
-:1035A00020666F722064696374696F6E617279005E
-:1035B000657870656374696E67206A7573742061DD
-:1035C0002076616C756520666F7220736574007378
-:1035D0007570657228292063616E27742066696E94
-:1035E000642073656C660027627265616B27206FCB
-:1035F000757473696465206C6F6F700027636F6EFC
-:1036000074696E756527206F757473696465206CC5
-:103610006F6F7000696E76616C6964206D696372AA
-:103620006F707974686F6E206465636F7261746F18
-:1036300072006E6F6E2D64656661756C74206172C8
-:1036400067756D656E7420666F6C6C6F7773206440
-:10365000656661756C7420617267756D656E740066
-:103660006964656E74696669657220726564656611
-:10367000696E656420617320676C6F62616C0063C2
-:10368000616E2774206465636C617265206E6F6E75
-:103690006C6F63616C20696E206F75746572206356
-:1036A0006F6465006E6F2062696E64696E67206684
-:1036B0006F72206E6F6E6C6F63616C20666F756EDB
-:1036C00064006964656E7469666965722072656418
-:1036D0006566696E6564206173206E6F6E6C6F63E2
-:1036E000616C002772657475726E27206F75747334
-:1036F0006964652066756E6374696F6E00696E76C5
-:10370000616C69642073796E746178006E616D65B7
-:103710002072657573656420666F722061726775CB
-:103720006D656E7400696E6C696E6520617373659A
-:103730006D626C6572206D75737420626520612006
-:1037400066756E6374696F6E00756E6B6E6F776E03
-:1037500020747970650072657475726E20616E6E8A
-:103760006F746174696F6E206D757374206265206B
-:10377000616E206964656E7469666965720065785A
-:1037800070656374696E6720616E20617373656D27
-:10379000626C657220696E737472756374696F6EA2
-:1037A00000276C6162656C272072657175697265AE
-:1037B00073203120617267756D656E74006C616293
-:1037C000656C207265646566696E65640027616C6E
-:1037D00069676E2720726571756972657320312083
-:1037E000617267756D656E7400276461746127206E
-:1037F0007265717569726573206174206C6561739F
-:1038000074203220617267756D656E747300276471
-:103810006174612720726571756972657320696EC4
-:10382000746567657220617267756D656E7473008B
-:103830002A78206D757374206265206173736967DF
-:103840006E6D656E74207461726765740063616E7D
-:1038500027742068617665206D756C7469706C657D
-:10386000202A780063616E27742068617665206D78
-:10387000756C7469706C65202A2A78004C48532056
-:103880006F66206B6579776F726420617267206D57
-:1038900075737420626520616E206964006E6F6EBE
-:1038A0002D6B6579776F7264206172672061667431
-:1038B0006572202A2F2A2A006E6F6E2D6B6579772C
-:1038C0006F726420617267206166746572206B6537
-:1038D00079776F7264206172670064656661756CE8
-:1038E0007420276578636570743A27206D7573744A
-:1038F000206265206C61737400277969656C6427A8
-:10390000206F7574736964652066756E6374696F82
-:103910006E003C2573206F626A65637420617420B9
-:1039200025703E006973737562636C617373282937
-:10393000206172672031206D75737420626520618B
-:1039400020636C6173730027257327206F626A659B
-:103950006374206973206E6F742063616C6C6162A4
-:103960006C65005F5F696E69745F5F28292073680A
-:103970006F756C642072657475726E204E6F6E6523
-:103980002C206E6F7420272573270069737375626E
-:10399000636C6173732829206172672032206D7512
-:1039A0007374206265206120636C617373206F7291
-:1039B0002061207475706C65206F6620636C617384
-:1039C00073657300747970652027257127206973EA
-:1039D000206E6F7420616E20616363657074616234
-:1039E0006C6520626173652074797065006D756C1B
-:1039F0007469706C652062617365732068617665B7
-:103A000020696E7374616E6365206C61792D6F75CA
-:103A10007420636F6E666C696374003C73757065C7
-:103A2000723A200063616E6E6F7420637265617418
-:103A300065202725712720696E7374616E63657335
-:103A400000747970652074616B65732031206F722A
-:103A5000203320617267756D656E7473003C636C12
-:103A600061737320272571273E00000101020202C5
-:103A70000203030303030303030463616E2774203B
-:103A8000636F6E7665727420696E6620746F20694C
-:103A90006E740063616E277420636F6E7665727456
-:103AA000204E614E20746F20696E740061726775DC
-:103AB0006D656E74206861732077726F6E67207415
-:103AC000797065006D656D6F727920616C6C6F63E4
-:103AD0006174696F6E206661696C65642C2068652D
-:103AE0006170206973206C6F636B6564006D656D38
-:103AF0006F727920616C6C6F636174696F6E2066A0
-:103B000061696C65642C20616C6C6F636174696EB3
-:103B100067202575206279746573006E656761742E
-:103B200069766520736869667420636F756E7400CA
-:103B3000756E737570706F727465642074797065DA
-:103B40007320666F722025713A20272573272C2059
-:103B5000272573270027257327206F626A65637402
-:103B6000206973206E6F74206974657261626C6580
-:103B70000063616E6E6F7420696D706F7274206E79
-:103B8000616D652025710027257327206F626A65A6
-:103B90006374206973206E6F7420616E2069746590
-:103BA0007261746F72006E616D6520272571272028
-:103BB0006973206E6F7420646566696E6564007455
-:103BC000797065206F626A656374202725712720EC
-:103BD000686173206E6F20617474726962757465B8
-:103BE00020272571270027257327206F626A6563C8
-:103BF0007420686173206E6F2061747472696275DD
-:103C00007465202725712700657863657074696F76
-:103C10006E73206D757374206465726976652066B5
-:103C2000726F6D2042617365457863657074696F6A
-:103C30006E00756E737570706F7274656420747940
-:103C4000706520666F722025713A20272573270042
-:103C50006E656564206D6F7265207468616E2025E5
-:103C6000642076616C75657320746F20756E706169
-:103C7000636B00746F6F206D616E792076616C7577
-:103C8000657320746F20756E7061636B2028657892
-:103C90007065637465642025642900546865205A42
-:103CA000656E206F66204D6963726F507974686F1E
-:103CB0006E2C206279204E6963686F6C61732048B6
-:103CC0002E20546F6C6C65727665790A0A436F64B6
-:103CD000652C0A4861636B2069742C0A4C65737308
-:103CE000206973206D6F72652C0A4B6565702069C1
-:103CF000742073696D706C652C0A536D616C6C2057
-:103D000069732062656175746966756C2C0A0A4274
-:103D1000652062726176652120427265616B207454
-:103D200068696E677321204C6561726E20616E64F4
-:103D300020686176652066756E210A457870726527
-:103D4000737320796F757273656C66207769746818
-:103D5000204D6963726F507974686F6E2E0A0A483D
-:103D600061707079206861636B696E6721203A2DFC
-:103D7000290A004D6963726F507974686F6E206F05
-:103D80006E20746865206D6963726F3A6269742091
-:103D900069732062726F7567687420746F20796F21
-:103DA000752062793A0A44616D69656E20502E2053
-:103DB00047656F7267652C204D61726B2053686197
-:103DC0006E6E6F6E2C205261646F6D697220446F4D
-:103DD00070696572616C736B692C204D61747468D5
-:103DE000657720456C73652C0A4361726F6C2057B0
-:103DF000696C6C696E672C20546F6D2056696E6516
-:103E0000722C20416C616E204A61636B736F6E2C63
-:103E1000204E69636B20436F67686C616E2C204A8B
-:103E20006F7365706820486169672C0A416C65781A
-:103E3000204368616E2C20416E6472656120477278
-:103E4000616E64692C205061756C204567616E2C31
-:103E50002050696F7472204B617370727A796B2C89
-:103E600020416E64726577204D756C686F6C6C6173
-:103E70006E642C0A4D61747420576865656C6572B8
-:103E80002C204A6F6520476C616E63792C2041625B
-:103E90006269652042726F6F6B7320616E64204EA1
-:103EA0006963686F6C617320482E20546F6C6C6579
-:103EB000727665792E0A0046696E616C20646174C1
-:103EC0006120666F7220737065656368206F75741A
-:103ED0007075742E202569206672616D65733A0DC8
-:103EE0000A0D0A0020666C61677320616D706C3189
-:103EF00020667265713120616D706C32206672656A
-:103F0000713220616D706C33206672657133207080
-:103F1000697463680D002D2D2D2D2D2D2D2D2D2D2A
-:103F20002D2D2D2D2D2D2D2D2D2D2D2D2D2D2D2DC1
-:103F30002D2D2D2D2D2D2D2D2D2D2D2D2D2D2D2DB1
-:103F40002D2D2D2D2D2D0D00253569202535692090
-:103F500025356920253569202535692025356920D5
-:103F6000253569202535690D0A003D3D3D3D3D3D26
-:103F70003D3D3D3D3D3D3D3D3D3D3D3D3D3D3D3D71
-:103F80003D3D3D3D3D3D3D3D3D3D3D3D3D3D3D3D61
-:103F90003D3D3D3D3D0D0025733A0D0A0D0A0020C3
-:103FA0006964782020202070686F6E656D65202020
-:103FB0006C656E67746820207374726573730D008E
-:103FC0002025336920202020202025632563202000
-:103FD0002020202025336920202020202020256932
-:103FE0000D0A00202533692020202020203F3F207B
-:103FF000202020202025336920202020202020255B
-:10400000690D0A0061646472657373202530387825
-:10401000206973206E6F7420616C69676E6564201F
-:10402000746F202564206279746573003C25752DBA
-:10403000626974206D656D6F72793E004743206D33
-:10404000656D6F7279206C61796F75743B20667253
-:104050006F6D2025703A000A202020202020202883
-:104060002575206C696E657320616C6C20667265C5
-:104070006529000A253035783A200047433A2074F4
-:104080006F74616C3A2025752C20757365643A2035
-:1040900025752C20667265653A2025750A00204E2C
-:1040A0006F2E206F6620312D626C6F636B733A2028
-:1040B00025752C20322D626C6F636B733A20257549
-:1040C0002C206D617820626C6B20737A3A20257504
-:1040D0002C206D6178206672656520737A3A202500
-:1040E000750A00696C6C6567616C206D6F646500B2
-:1040F0004932432072656164206572726F722025B7
-:104100006400493243207772697465206572726F6A
-:104110007220256400737461636B3A202575206FEB
-:104120007574206F662025750A0071737472207093
-:104130006F6F6C3A206E5F706F6F6C3D25752C2031
-:104140006E5F717374723D25752C206E5F7374728F
-:104150005F646174615F62797465733D25752C20BD
-:104160006E5F746F74616C5F62797465733D257501
-:104170000A00000004020204020000020404040019
-:104180000202000404030100000103030300010113
-:104190000203030402010103010403010003000000
-:1041A00004010102000003020000040202040200F4
-:1041B00000020404040002020004040301000001E0
-:1041C00003030300010102030304020101030104CC
-:1041D00003010003000004010102000003026E6FEE
-:1041E0007420616E20696D6167650062726967683D
-:1041F000746E657373206F7574206F6620626F75BF
-:104200006E6473006F766572666C6F7720636F6E95
-:1042100076657274696E67206C6F6E6720696E7464
-:1042200020746F206D616368696E6520776F7264BA
-:1042300000706F706974656D28293A206469637431
-:10424000696F6E61727920697320656D7074790091
-:104250002571280064696374207570646174652039
-:1042600073657175656E6365206861732077726F21
-:104270006E67206C656E67746800285B005D2900BE
-:10428000646963745F6974656D7300646963745F06
-:104290006B65797300646963745F76616C756573CF
-:1042A00000696E76616C6964206E756D626572205E
-:1042B0006F6620706978656C7300696E76616C69F1
-:1042C0006420636F6C6F7572005265616420657263
-:1042D000726F72004F75742D6F662D62756666651C
-:1042E000722072656164005772697465206572722C
-:1042F0006F720000000000000D0D0E0F0F0F0F0F6A
-:104300000C0D0C0F0F0D0D0D0E0D0C0D0D0D0C09E0
-:104310000900000000000000000B0B0B0B00000167
-:104320000B00020E0F0F0F0F0D020400020400011C
-:104330000400010400000000000000000C00000068
-:10434000000F0F00000000000A0B0D0E0D0C0C0BEF
-:10435000090B0B0C0C0C08080C080A08080A0309C6
-:104360000600000000000000000305030400000038
-:10437000050A020E0D0C0D0C0800010000010000E2
-:104380000100000100000000000000000A00000A17
-:1043900000000000000000000807080801010001FB
-:1043A00000070501000601000700050100080000E4
-:1043B00003000000000000000000010000000000F9
-:1043C000010E0109010001000000000000000000D2
-:1043D00000000000000000000000000007000005D1
-:1043E0000013100001020202030304040506080979
-:1043F0000B0D0F00001F1F1F1F020202020202020C
-:1044000002020505020A020805050B0A090808A0B0
-:104410000808171F121212121E1E14141414171754
-:104420001A1A1D1D0202020202021A1D1B1A1D1B6E
-:104430001A1D1B1A1D1B171D17171D17171D1717E0
-:104440001D17171700131313130A0E12181A161438
-:1044500010140E120E1212100C0E0A120E0A08067A
-:1044600006060611060606060E10090A080A0606C2
-:1044700006050600121A141A120C0606060606068F
-:10448000060606060606060606060606060A0A06C4
-:1044900006062C1300434343435448423E282C1E37
-:1044A000242C4830241E32241C4418321E18522E4C
-:1044B00036563643494F1A4249253342282F4F4F2B
-:1044C000424F6E0048261E2A1E221A1A1A424242E3
-:1044D0006E6E6E5454541A1A1A4242426D566D54FE
-:1044E00054547F7F005B5B5B5B6E5D5B5859575834
-:1044F00052595D3E52583E6E505D5A3C6E5A6E5156
-:104500007965795B636A51795D525D674C5D65657C
-:10451000796579005A5858585852515151797979DA
-:10452000706E6E5E5E5E5151517979796565705E2F
-:104530005E5E080100020202020404040404040492
-:104540000404040404040303040403030303030135
-:104550000203020103030303010103030302020335
-:104560000203000005050505040402000202000321
-:10457000020004020003020002020002030003031F
-:104580000003B0A000000000000A0E13181B17154E
-:1045900010140E120E1212100D0F0B120E0B090634
-:1045A00006060000000000000000000000000000FF
-:1045B00000000000131B151B120D0000000000007E
-:1045C00000000000000000000000000000010102E7
-:1045D000020303040405050606070700010203049D
-:1045E00005060708090A0B0C0D0E0F00010304064F
-:1045F00007090A0C0D0F1012131516000204060805
-:104600000A0C0E10121416181A1C1E000205070AB6
-:104610000C0F111416191B1E202325000306090C6C
-:104620000F1215181B1E2124272A2D0003070A0E1E
-:104630001115181C1F23262A2D313400FCF8F4F024
-:10464000ECE8E4E0DCD8D4D0CCC8C400FCF9F5F246
-:10465000EEEBE7E4E0DDD9D6D2CFCB00FDFAF7F4FC
-:10466000F1EEEBE8E5E2DFDCD9D6D300FDFBF8F6AE
-:10467000F3F1EEECE9E7E4E2DFDDDA00FEFCFAF864
-:10468000F6F4F2F0EEECEAE8E6E4E200FEFDFBFA16
-:10469000F8F7F5F4F2F1EFEEECEBE900FFFEFDFCCC
-:1046A000FBFAF9F8F7F6F5F4F3F2F100FFFFFEFE7E
-:1046B000FDFDFCFCFBFBFAFAF9F9F800020202022C
-:1046C00004040404040404040404040404030204AD
-:1046D00004020202020201010101010101010101C2
-:1046E00001020202010001000100050505050504A3
-:1046F00004020001020001020001020001020002A6
-:10470000020001030002030002A0A000000000005C
-:104710000101010101010101010101010101010189
-:104720000101010101010101010000000000000080
-:104730000000000000000000000000010101010174
-:104740000000000000000000000000000000000069
-:1047500000000000000000000000000000000090C9
-:104760009090909090909090909090909090909049
-:104770009090909090909090909090909090909039
-:104780009090909090909090909090909090909029
-:104790009090909090909090909090909090909019
-:1047A0009090909090909090909090909090909009
-:1047B00090909090909090909090909090909090F9
-:1047C00090909090909090909090909090909090E9
-:1047D00090909090909090909090909090909070F9
-:1047E00070707070707070707070707070707070C9
-:1047F00070707070707070707070707070707070B9
-:1048000070707070707070707070707070707070A8
-:104810007070707070707070707070707070707098
-:104820007070707070707070707070707070707088
-:104830007070707070707070707070707070707078
-:104840007070707070707070707070707070707068
-:104850007070707070707070707070707070703890
-:10486000846B19C66318867398C6B11CCA318CC78D
-:104870003188C23098463118C6350CCA310CC62171
-:1048800010246912C23114C471084A2249AB6AA8C3
-:10489000AC495132D55288936C94221554D2259646
-:1048A000D450A5462108856B18C46310CE6B188CB4
-:1048B00071198C63350CC63399CC6CB54EA29946F0
-:1048C000212882952EE3309CC5309CA2B19C673193
-:1048D0008866592C5318846750CAE30AACAB30ACD5
-:1048E00062308C63109462B18C8228963398D6B56E
-:1048F0004C6229A54AB59CC63114D6389C4BB48667
-:104900006518AE671CA66319962319841308A6526E
-:10491000ACCA22896EAB198C6234C46219866318E2
-:10492000C42358D6A35042544AAD4A25116B64891A
-:104930004A63398A23312AEAA2A944C512CD4234F6
-:104940008C62188C63114866319D44331D46319C3E
-:10495000C6B10CCD3288C47318867308D663580765
-:1049600081E0F03C0787903C7C0FC7C0C0F07C1E04
-:10497000078080001C7870F1C71FC00CFE1C1F1F31
-:104980000E0A7AC071F2838F030F0F0C0079F86161
-:10499000E0430F83E718F9C113DAE9638F0F8383CC
-:1049A00087C31F3C70F0E1E1E387B8710E20E38D0F
-:1049B00048781C938730E1C1C1E478218383C387A1
-:1049C0000639E5C387070E1C1C70F4719C603632F3
-:1049D000C31E3CF38F0E3C70E3C78F0F0F0E3C7865
-:1049E000F0E38706F0E307C199870F18787070FC31
-:1049F000F310B18C8C317C70E1863C646CB0E1E3E7
-:104A00000F238F0F1E3E383C387B8F070E3CF41768
-:104A10001E3C78F29E7249E32536385839E2DE3C76
-:104A20007878E1C761E1E1B0F0F0C3C70E38C0F0BB
-:104A3000CE73731834B0E1C78E1C3CF838F0E1C176
-:104A40008B868F1C7870F078ACB18F3931DB386190
-:104A5000C30E0E387873171E391E3864E1F1C14E4B
-:104A60000F40A202C58F81A1FC120864E03C22E045
-:104A700045078E0C3290F01F2049E0F80C60F017CB
-:104A80001A41AAA4D08D12821E1E03F83E030C7395
-:104A9000807044260324E13E044E041CC109CC9ED0
-:104AA000902107904364C00FC6909CC15B03E21D38
-:104AB00081E05E1D0384B82C0F80B183E030411E7D
-:104AC00043898350FC242E1383F17C4C2CC90D8325
-:104AD000B0B582E4E8069C07A0991D073E828F705E
-:104AE000307440CA10E4E80F92143F06F8848843FB
-:104AF000810A343941C6E31C4703B0B8130AC264C3
-:104B0000F818F960B3C0652060A68CC381203026F8
-:104B10001E1C38D301B02640F40BC3421F85322639
-:104B20006040C9CB01EC112840FA0434E0704C8C91
-:104B30001D07690316C80423E8C69A0B1A03E0761A
-:104B40000605CF1EBC5831716600F83F04FC0C749A
-:104B5000278A8071C23A2606C01F050F9840AE0111
-:104B60007FC007FF000EFE0003DF8003EF801BF114
-:104B7000C200E7E018FCE021FC803CFC400E7E0017
-:104B80003F3E000FFE001FFF003EF007FC007E10BE
-:104B90003FFF003F380E7C01870CFCC7003E040F2E
-:104BA0003E1F0F0F1F0F028387CF03870F3FC007E2
-:104BB0009E603FC003FE003FE077E1C0FEE0C3E03F
-:104BC00001DFF80307007E70007C3818FE0C1E78A9
-:104BD0001C7C3E0E1F1E1E3E007F8307DB87830763
-:104BE000C7071071FF003FE201E0C1C3E1007FC0D1
-:104BF00005F020F8F070FE7879F8023F0C8F030F73
-:104C00009FE0C1C78703C3C3B0E1E1C1E3E071F036
-:104C100000FC707C0C3E380E1C70C3C70381C1C7FA
-:104C2000E7000FC7871909EFC433E0C1FCF870F043
-:104C300078F8F061C7001FF8017CF8F078703C7CD0
-:104C4000CE0E2183CF08078F08C1878F80C7E3006E
-:104C500007F8E0EF0039F7800EF8E1E3F8219FC094
-:104C6000FF03F807C01FF8C404FCC4C1BC87F00FE1
-:104C7000C07F05E025ECC03E8447F08E03F803FBBF
-:104C8000C019F8079C0C17F807E01FA1FC0FFC01E6
-:104C9000F03F00FE03F01F00FD00FF880DF901FF4B
-:104CA000007007C03E42F30DC47F80FC07F05EC079
-:104CB0003F00783F81FF01F801C3E80CE4648FE412
-:104CC0000FF007F0C21F007FC06F807E03F807F06F
-:104CD0003FC0780F8207FE227770027603FE00FE47
-:104CE00067007CC7F18EC63BE03F84F319D8039977
-:104CF000FC09B80FF8009D2461F90D00FD03F01FB9
-:104D0000903F01F81FD00FF83701F807F00FC03FB0
-:104D100000FE03F80FC03F00FA03F00F80FF01B858
-:104D200007F001FC01BC80131E007FE1407FA07FE3
-:104D3000B0003FC01FC0380FF01F80FF01FC03F11F
-:104D40007E01FE01F0FF007FC01D07F00FC07E0650
-:104D5000E007E00FF806C1FE01FC03E00F00FC00D5
-:104D60000000000000000000000000000000000043
-:104D7000000000000000000000000000000000F142
-:104D8000E2D3BB7C95010203030072000200000025
-:104D90000000000000000000000000000000000013
-:104DA00000001B00001900000000000000000000CF
-:104DB0000000101010101010202020202020303073
-:104DC00030303030304040404040404050505050F3
-:104DD0005050505060606060606060606060606013
-:104DE00070707070707070707070707070707070C3
-:104DF00070707070707070707070707070707060C3
-:104E000060606060606060606060605050505050F2
-:104E100050505040404040404040303030303030C2
-:104E20003020202020202010101010101000000032
-:104E30000000F0F0F0F0F0F0E0E0E0E0E0E0D0D0F2
-:104E4000D0D0D0D0D0C0C0C0C0C0C0C0B0B0B0B052
-:104E5000B0B0B0B0A0A0A0A0A0A0A0A0A0A0A0A012
-:104E60009090909090909090909090909090909042
-:104E7000909090909090909090909090909090A022
-:104E8000A0A0A0A0A0A0A0A0A0A0A0B0B0B0B0B0D2
-:104E9000B0B0B0C0C0C0C0C0C0C0D0D0D0D0D0D0E2
-:104EA000D0E0E0E0E0E0E0F0F0F0F0F0F000000052
-:104EB00000E0E6ECF3F900060C06181A17171700C5
-:104EC000000000005449433F282C1F252D49312460
-:104ED0001E33251D4518321E18532E36560000006D
-:104EE000000000000000000000000000000000487A
-:104EF000271F2B1E220000000005000051282573EB
-:104F0000290A008F012A00FA015F008A012F006C34
-:104F10000325236F007B032523780058057B3A2364
-:104F2000627D00AF010A0073206D6178696D756D57
-:104F300020726563757273696F6E20646570746842
-:104F400020657863656564656400BD083C6D6F64C9
-:104F5000756C653E0080083C6C616D6264613E006A
-:104F6000D40A3C6C697374636F6D703E00CC0A3C6C
-:104F700064696374636F6D703E0054093C736574BB
-:104F8000636F6D703E0034093C67656E65787072C2
-:104F90003E0052083C737472696E673E00E3073C42
-:104FA000737464696E3E00B7057574662D3800949D
-:104FB0000468656C70007305696E70757400E00BB1
-:104FC000636F6C6C656374696F6E73001206737443
-:104FD0007275637400C0086D6963726F62697400F2
-:104FE0001005726573657400EA05736C6565700081
-:104FF000C80C72756E6E696E675F74696D6500D0FE
-:105000000570616E696300E90B74656D70657261AE
-:105010007475726500A30474686973006307617531
-:1050200074686F727300F10B616E746967726176F8
-:105030006974790055046C6F7665002C08626164B0
-:1050400061626F6F6D00CD124D6963726F4269745A
-:105050004469676974616C50696E0007184D696333
-:10506000726F426974416E616C6F674469676974FD
-:10507000616C50696E0052104D6963726F426974C1
-:10508000546F75636850696E00920C726561645F5D
-:105090006469676974616C00FD0D77726974655F9E
-:1050A0006469676974616C00620B726561645F6159
-:1050B0006E616C6F67002D0C77726974655F616E4D
-:1050C000616C6F670008117365745F616E616C6F6E
-:1050D000675F706572696F6400EE1E7365745F616F
-:1050E0006E616C6F675F706572696F645F6D696335
-:1050F000726F7365636F6E6473007A1E6765745FA9
-:10510000616E616C6F675F706572696F645F6D6916
-:1051100063726F7365636F6E647300040A69735F13
-:10512000746F7563686564007906756E7573656480
-:1051300000C80A617564696F5F706C617900F3067D
-:10514000627574746F6E008005746F7563680020FB
-:1051500002337600AF086765745F6D6F646500E6C3
-:105160000A4D6963726F426974494F0002047069A5
-:105170006E3000030470696E3100010470696E3294
-:1051800000010470696E3300060470696E34000714
-:105190000470696E3500040470696E360005047091
-:1051A000696E37000A0470696E38000B0470696E0E
-:1051B0003900530570696E313000520570696E31E7
-:1051C0003100510570696E313200500570696E31E1
-:1051D0003300570570696E313400560570696E31C1
-:1051E0003500550570696E3136005A0570696E31AB
-:1051F0003900300570696E32300049086765745FA8
-:1052000070756C6C00DD087365745F70756C6C0094
-:10521000BA0750554C4C5F555000AD0950554C4C99
-:105220005F444F574E001E074E4F5F50554C4C0089
-:10523000870D4D6963726F426974496D61676500DE
-:105240006205496D616765004205696D61676500CA
-:105250002305776964746800FA066865696768748D
-:1052600000B706696E7665727400CA0466696C6C74
-:1052700000B0097365745F706978656C00A4096794
-:1052800065745F706978656C00A10A7368696674FB
-:105290005F6C65667400BA0B73686966745F7269E7
-:1052A00067687400DF0873686966745F757000482A
-:1052B0000A73686966745F646F776E00E2096D6FE8
-:1052C0006E6F737061636500F604626C6974000F41
-:1052D00005484541525400CF0B48454152545F5355
-:1052E0004D414C4C00150548415050590093035313
-:1052F0004144009B05534D494C4500A608434F4E81
-:105300004655534544002605414E475259000B0669
-:1053100041534C454550008809535552505249530A
-:10532000454400C60553494C4C590030084641429B
-:10533000554C4F55530005034D4548000A03594548
-:10534000530004024E4F006E07434C4F434B313223
-:1053500000DC06434C4F434B3100DF06434C4F43C8
-:105360004B3200DE06434C4F434B3300D906434CCF
-:105370004F434B3400D806434C4F434B3500DB06BC
-:10538000434C4F434B3600DA06434C4F434B3700F8
-:10539000D506434C4F434B3800D406434C4F434B48
-:1053A00039006C07434C4F434B3130006D07434C81
-:1053B0004F434B313100ED074152524F575F4E0082
-:1053C000C8084152524F575F4E4500E607415252BE
-:1053D0004F575F4500B5084152524F575F53450044
-:1053E000F0074152524F575F5300A7084152524FA6
-:1053F000575F535700F4074152524F575F5700DA37
-:10540000084152524F575F4E5700EB0854524941E2
-:105410004E474C45008F0D545249414E474C455F15
-:105420004C45465400510A4348455353424F41525C
-:105430004400A1074449414D4F4E4400610D444989
-:10544000414D4F4E445F534D414C4C0084065351E7
-:105450005541524500840C5351554152455F534DBF
-:10546000414C4C00EB06524142424954005E03431A
-:105470004F5700AB0E4D555349435F43524F544372
-:10548000484554005F0C4D555349435F51554156B3
-:105490004552006C0D4D555349435F51554156459A
-:1054A00052530033095049544348464F524B00E28F
-:1054B00004584D41530055065041434D414E00B4F0
-:1054C00006544152474554004506545348495254E6
-:1054D00000270B524F4C4C4552534B415445003C16
-:1054E000044455434B00A105484F55534500C80897
-:1054F000544F52544F495345005609425554544550
-:1055000052464C5900E90B535449434B46494755C1
-:10551000524500C20547484F535400980553574F12
-:105520005244007D074749524146464500480553CD
-:105530004B554C4C00C908554D4252454C4C41000E
-:105540009705534E414B4500F10A414C4C5F415287
-:10555000524F575300C00A414C4C5F434C4F434B92
-:1055600053005A0F4D6963726F42697444697370D6
-:105570006C617900910E7365745F6272696768741B
-:105580006E657373009E107365745F646973706CED
-:1055900061795F6D6F6465001F07646973706C618A
-:1055A0007900860473686F770028067363726F6CE6
-:1055B0006C00500564656C617900B806737472699B
-:1055C00064650085057374617274008E0477616987
-:1055D000740039046C6F6F7000E004636F707900C1
-:1055E0000B0463726F7000B505736C696365009896
-:1055F000047465787400F60B536C69636564496DD7
-:1056000061676500BD0F5363726F6C6C696E6753A1
-:105610007472696E670064026F6E008A036F66665B
-:1056200000610569735F6F6E00C106466163616466
-:105630006500160E4D6963726F4269744275747429
-:105640006F6E00ED08627574746F6E5F6100EE0836
-:10565000627574746F6E5F6200E60A69735F7072E0
-:10566000657373656400F90B7761735F70726573BE
-:1056700073656400FD0B6765745F707265737365B5
-:1056800073005B154D6963726F42697441636365B2
-:105690006C65726F6D65746572001E0D6163636584
-:1056A0006C65726F6D657465720034056765745F53
-:1056B000780035056765745F790036056765745F46
-:1056C0007A00F40A6765745F76616C75657300D45F
-:1056D0000F63757272656E745F676573747572655A
-:1056E00000070A69735F6765737475726500D80B8C
-:1056F0007761735F6765737475726500180C676511
-:10570000745F676573747572657300A002757000CD
-:105710003704646F776E00DE046C65667400E5051F
-:10572000726967687400210766616365207570009F
-:1057300036096661636520646F776E00B60866722D
-:10574000656566616C6C00310233670094023667F0
-:10575000005A0238670031057368616B6500100FED
-:105760004D6963726F426974436F6D70617373004A
-:105770005507636F6D70617373002D076865616411
-:10578000696E6700230D69735F63616C69627261A2
-:1057900074656400020963616C696272617465001A
-:1057A0004911636C6561725F63616C6962726174F7
-:1057B000696F6E00F4126765745F6669656C645F9B
-:1057C000737472656E67746800B80B4D6963726FAD
-:1057D000426974493243005D0369326300B7047261
-:1057E000656164009805777269746500B604616448
-:1057F000647200CB016E00740362756600F206727B
-:10580000657065617400E504667265710053037329
-:10581000646100F90373636C0004056D757369635B
-:1058200000A1096672657175656E6379007B086415
-:1058300075726174696F6E008305706974636800C6
-:10584000F20370696E002104706C6179009B09732A
-:1058500065745F74656D706F008F096765745F7440
-:10586000656D706F00DA0362706D004305746963E3
-:105870006B73009F054241444459009D0742415FBC
-:1058800044494E4700FC084249525448444159009B
-:10589000C805424C554553005905434841534500FE
-:1058A000FC0944414441444144554D00480B454E98
-:1058B0005445525441494E455200420746554E45C3
-:1058C00052414C00D30446554E4B00AA094A554D4F
-:1058D000505F444F574E00FD074A554D505F55509D
-:1058E000003D044E59414E006B034F444500970A5A
-:1058F000504F5745525F444F574E000108504F5785
-:1059000045525F5550003A075052454C55444500AA
-:10591000EB0950554E43484C494E4500B10650598D
-:1059200054484F4E00C70852494E47544F4E450009
-:10593000640957415741574157414100170757459F
-:105940004444494E4700C401610067026123002CB2
-:105950000461233A31002E0461233A330076026158
-:1059600032007002613400BB0461343A3100B90482
-:1059700061343A33000F03613A31000C03613A326B
-:10598000000A03613A34000B03613A3500C7016233
-:1059900000DE0462323A3100940262330093026204
-:1059A0003400D80462343A3100DB0462343A320005
-:1059B0009202623500D90462353A31000C03623A32
-:1059C00031000F03623A3200C6016300A50263236F
-:1059D00000700363233500BB056323353A3100B8FB
-:1059E000056323353A32006E0463233A31006704BD
-:1059F00063233A3800FC0463323A3200B502633361
-:105A0000007C0463333A33007B0463333A3400B2DE
-:105A100002633400F90463343A3100FB0463343A1E
-:105A20003300FC0463343A3400B302633500780475
-:105A300063353A31007B0463353A32007A046335CA
-:105A40003A33007D0463353A34000D03633A310084
-:105A50000E03633A32000F03633A33000803633ADC
-:105A600034000403633A3800C1016400C2026423B5
-:105A700000FF056423353A32000A0464233A3200F9
-:105A80000B0464233A3300D202643300D502643439
-:105A9000001E0464343A3100D4026435001F0464EB
-:105AA000353A31001C0464353A32000A03643A3155
-:105AB000000903643A32000803643A33000F0364B8
-:105AC0003A34000E03643A35000D03643A3600039D
-:105AD00003643A3800C0016500BA0465333A330004
-:105AE000F4026534003F0465343A3100F50265354F
-:105AF000003F0465363A33000B03653A3100080372
-:105B0000653A32000903653A33000E03653A340002
-:105B10000F03653A35000C03653A36000203653A17
-:105B20003800E00465623A3800C30166000102668D
-:105B30002300350366233500FD056623353A320020
-:105B40004B0466233A3100480466233A320042048B
-:105B500066233A380011026632000803663A3100C3
-:105B60000B03663A32000A03663A33000D03663AC5
-:105B700034000103663A3800C2016700210267233E
-:105B800000EA0467233A3100E80467233A3300FA55
-:105B90000467333A310036026734007D0467343AD3
-:105BA00031007E0467343A32003702673500FC0466
-:105BB00067353A31000903673A31000A03673A3220
-:105BC000000B03673A33000103673A3800D70172CC
-:105BD00000CB0472343A32001C03723A31001F03C6
-:105BE000723A32001E03723A3300320C4D6963720E
-:105BF0006F426974554152540077047561727400A4
-:105C00001F04696E697400F50862617564726174DD
-:105C100065004904626974730042067061726974B8
-:105C200079009D0473746F7000410470696E730095
-:105C30008902747800CF027278001303616E7900D4
-:105C4000760772656164616C6C00F9087265616465
-:105C50006C696E65004B0872656164696E746F00F3
-:105C60006A034F444400DD044556454E004A0B4D3F
-:105C70006963726F42697453504900CF037370694E
-:105C80000026046D6F646500720473636C6B001D05
-:105C9000046D6F7369009D046D69736F00890E77E1
-:105CA000726974655F72656164696E746F0069081A
-:105CB0006E656F706978656C0069084E656F506934
-:105CC00078656C007C05636C65617200BE0672616C
-:105CD0006E646F6D00660B67657472616E646269F5
-:105CE00074730092047365656400A30972616E6445
-:105CF00072616E676500AF0772616E64696E7400F1
-:105D00002E0663686F696365000107756E69666FCB
-:105D1000726D005305617564696F00AE0A41756468
-:105D2000696F4672616D6500270A72657475726EDF
-:105D30005F70696E00B806736F7572636500560810
-:105D4000636F707966726F6D00A2046E616D65009D
-:105D500079026F7300B705756E616D65000B0B6D91
-:105D60006963726F707974686F6E009B07737973E3
-:105D70006E616D650062086E6F64656E616D6500D1
-:105D8000EC0772656C6561736500BF0776657273B9
-:105D9000696F6E001A074279746573494F001E06D9
-:105DA00054657874494F00F7087772697461626CC2
-:105DB000650098076C6973746469720060076D61AF
-:105DC0006368696E6500200473697A6500040A6976
-:105DD000735F706C6179696E67006D0673706565DD
-:105DE000636800AE0373617900940970726F6E6F1F
-:105DF000756E636500B60473696E6700310674687A
-:105E0000726F6174006E056D6F7574680062057362
-:105E10007065656400D40564656275670043097444
-:105E200072616E736C61746500D405726164696F30
-:105E3000004F06636F6E66696700BF0A73656E6424
-:105E40005F627974657300880D7265636569766554
-:105E50005F627974657300B90473656E64004E0700
-:105E600072656365697665006B1272656365697654
-:105E7000655F62797465735F696E746F00020C729E
-:105E80006563656976655F66756C6C0059066C655F
-:105E90006E67746800940571756575650026076303
-:105EA00068616E6E656C00DA05706F77657200A8C8
-:105EB00009646174615F7261746500730761646491
-:105EC0007265737300BA0567726F7570007B0C5250
-:105ED0004154455F3235304B42495400DB0A524150
-:105EE00054455F314D42495400580A524154455F70
-:105EF000324D424954002D0F41726974686D6574CA
-:105F000069634572726F7200970E417373657274A4
-:105F1000696F6E4572726F7200210E4174747269FE
-:105F2000627574654572726F7200070D4261736528
-:105F3000457863657074696F6E009108454F4645FA
-:105F400072726F7200F008456C6C6970736973004F
-:105F5000F209457863657074696F6E00160D4765C8
-:105F60006E657261746F724578697400200B496DBB
-:105F7000706F72744572726F72005C10496E646566
-:105F80006E746174696F6E4572726F7200830A4934
-:105F90006E6465784572726F7200EA084B657945E8
-:105FA00072726F7200AF114B6579626F61726449F2
-:105FB0006E7465727275707400FF0B4C6F6F6B7549
-:105FC000704572726F7200DC0B4D656D6F727945B2
-:105FD00072726F7200BA094E616D654572726F72AE
-:105FE0000017084E6F6E655479706500C6134E6FCA
-:105FF00074496D706C656D656E7465644572726F21
-:106000007200A1074F534572726F7200F00B4F720E
-:1060100064657265644469637400810D4F766572CE
-:10602000666C6F774572726F7200610C52756E7498
-:10603000696D654572726F7200EA0D53746F704935
-:106040007465726174696F6E00940B53796E74613C
-:10605000784572726F7200200A53797374656D45CA
-:10606000786974002509547970654572726F720001
-:10607000220C556E69636F64654572726F7200968B
-:106080000A56616C75654572726F7200B6115A6579
-:10609000726F4469766973696F6E4572726F7200D0
-:1060A000C4075F5F6164645F5F002B085F5F626FBE
-:1060B0006F6C5F5F00420F5F5F6275696C645F6366
-:1060C0006C6173735F5F00A7085F5F63616C6C5FF7
-:1060D0005F002B095F5F636C6173735F5F00C60CC9
-:1060E0005F5F636F6E7461696E735F5F00FD0B5F6E
-:1060F0005F64656C6974656D5F5F006D095F5F6506
-:106100006E7465725F5F0071065F5F65715F5F004F
-:1061100045085F5F657869745F5F00A7065F5F672A
-:10612000655F5F00400B5F5F676574617474725FE9
-:106130005F00260B5F5F6765746974656D5F5F0064
-:10614000B6065F5F67745F5F00F7085F5F68617343
-:10615000685F5F00380A5F5F696D706F72745F5FC0
-:10616000005F085F5F696E69745F5F00CF085F5F03
-:10617000697465725F5F00CC065F5F6C655F5F008E
-:10618000E2075F5F6C656E5F5F005D065F5F6C746A
-:106190005F5F008E085F5F6D61696E5F5F00FF0A81
-:1061A0005F5F6D6F64756C655F5F00E2085F5F6ED7
-:1061B000616D655F5F0079075F5F6E65775F5F00A8
-:1061C00002085F5F6E6578745F5F00C8085F5F708C
-:1061D0006174685F5F006B0C5F5F7175616C6E610D
-:1061E0006D655F5F00010E5F5F7265706C5F70725E
-:1061F000696E745F5F0010085F5F726570725F5F49
-:1062000000610C5F5F72657665727365645F5F0045
-:10621000320B5F5F7365746974656D5F5F00D007F3
-:106220005F5F7374725F5F0021075F5F7375625F0A
-:106230005F004F0D5F5F74726163656261636B5FE6
-:106240005F009503616273001B0461636F73004418
-:106250000361646400A805616C69676E00440361B2
-:106260006C6C009104616E645F006B066170706518
-:106270006E6400C20461726773007C0561727261B2
-:10628000790050046173696E00430961736D5F7436
-:1062900068756D62006503617372001F046174614B
-:1062A0006E00CD056174616E3200E00362696E00BC
-:1062B000CB02626C00EB04626F6F6C00970C626F34
-:1062C000756E645F6D6574686F6400F70862756968
-:1062D0006C74696E7300DF0262780076096279740B
-:1062E00065617272617900220862797465636F6416
-:1062F00065006109627974656F72646572005C059E
-:106300006279746573004D0863616C6373697A65C3
-:10631000000D0863616C6C61626C65000604636566
-:10632000696C00DC0363687200B40B636C617373A7
-:106330006D6574686F64003305636C6F736500741A
-:1063400007636C6F73757265005003636C7A003B72
-:1063500003636D70009B07636F6C6C65637400C0B2
-:1063600005636F6E7374003308636F7079736967C8
-:106370006E007A03636F7300A605636F756E740019
-:10638000E805637073696400E9056370736965000B
-:1063900015046461746100CE0764656661756C7490
-:1063A00000020764656772656573003F0464696392
-:1063B00074002D09646963745F7669657700720AF9
-:1063C000646966666572656E6365009C11646966E2
-:1063D000666572656E63655F75706461746500FA09
-:1063E0000364697200910764697361626C650004FB
-:1063F0000B64697361626C655F697271000F076499
-:1064000069736361726400B8066469766D6F6400D5
-:106410000406656E61626C6500910A656E61626C6E
-:10642000655F697271000A03656E64001B08656E22
-:10643000647377697468007109656E756D65726162
-:106440007465009B046576616C001E046578656365
-:106450000085046578697400C80365787000630678
-:10646000657874656E640093046661627300250646
-:1064700066696C74657200010466696E64003505B6
-:10648000666C6F6174007D05666C6F6F7200E50469
-:10649000666D6F64002606666F726D6174001C0580
-:1064A000667265787000350A66726F6D5F62797426
-:1064B000657300370866726F6D6B65797300ED095F
-:1064C00066726F7A656E73657400270866756E6311
-:1064D00074696F6E006102676300960967656E6597
-:1064E0007261746F7200330367657400C00767657B
-:1064F0007461747472009D07676C6F62616C7300E5
-:106500008C076861736174747200B70468617368A2
-:1065100000AD09686561705F6C6F636B00560B6856
-:106520006561705F756E6C6F636B00700368657892
-:10653000002802696400170E696D706C656D656EE8
-:10654000746174696F6E007B05696E646578001212
-:1065500006696E73657274001603696E7400280C08
-:10656000696E74657273656374696F6E0006136992
-:106570006E74657273656374696F6E5F7570646164
-:10658000746500EB076973616C70686100A8076946
-:1065900073646967697400F70A69736469736A6F81
-:1065A000696E74009A096973656E61626C65640056
-:1065B000A608697366696E697465003E056973694A
-:1065C0006E6600B60A6973696E7374616E63650006
-:1065D000FC0769736C6F776572009E0569736E6165
-:1065E0006E005B076973737061636500B50A697358
-:1065F000737562636C61737300B908697373756254
-:1066000073657400FC0A69737375706572736574E1
-:1066100000DD076973757070657200E30569746564
-:106620006D73008F04697465720047086974657240
-:1066300061746F7200A7046A6F696E00F6086B627E
-:10664000645F696E74720032036B65790001046BDC
-:106650006579730043056C6162656C0040056C648C
-:10666000657870005F036C6472005D046C64726234
-:1066700000E2056C647265780057046C647268000F
-:1066800062036C656E0027046C6973740089066C84
-:106690006974746C65003B066C6F63616C730021F8
-:1066A000036C6F6700C6056C6F77657200B6036C8C
-:1066B000736C00A8036C737200E5066C73747269E6
-:1066C0007000B9036D61700035046D61746800B1CC
-:1066D000036D61780020036D656D0007056D656DC4
-:1066E00031360041056D656D33320018046D656DFE
-:1066F000380052096D656D5F616C6C6F6300CB088B
-:106700006D656D5F6672656500D1086D656D5F6969
-:106710006E666F00AF036D696E0025046D6F646671
-:1067200000BF066D6F64756C6500EC076D6F647576
-:106730006C657300F1036D6F760065046D6F7674A0
-:106740000066046D6F76770052056D6F7677740082
-:1067500089036D7273001E0A6E616D6564747570D5
-:106760006C650042046E65787400B4036E6F70004F
-:1067700090066F626A65637400FD036F637400D1F5
-:10678000046F70656E0087096F70745F6C65766565
-:106790006C001C036F726400BC047061636B001FAB
-:1067A000097061636B5F696E746F001C0270690031
-:1067B0003A08706C6174666F726D002A03706F70B6
-:1067C00000BF07706F706974656D002D03706F777F
-:1067D0000054057072696E74001C0F7072696E74DB
-:1067E0005F657863657074696F6E00BB0470757364
-:1067F0006800B009717374725F696E666F00870715
-:1068000072616469616E73001A0572616E6765007A
-:10681000E80472626974005F10726561645F6C699C
-:106820006768745F6C6576656C00630672656D6F92
-:1068300076650049077265706C61636500D004720B
-:106840006570720025077265766572736500A10830
-:10685000726576657273656400D2057266696E64EE
-:1068600000E90672696E64657800E705726F756EFF
-:106870006400A5067273706C6974003B06727374D1
-:10688000726970001A047363616E00CD04736469E9
-:106890007600230373657000270373657400D407C3
-:1068A00073657461747472006C0A736574646566F0
-:1068B00061756C7400B10373696E000B08736C65CD
-:1068C00065705F6D73001308736C6565705F757339
-:1068D00000BF04736F7274005E06736F7274656438
-:1068E00000B70573706C69740021047371727400D1
-:1068F0009709737461636B5F75736500740A7374D1
-:10690000617274737769746800620C73746174697E
-:10691000636D6574686F640057047374657000502C
-:10692000037374720032047374726200AD05737481
-:106930007265780038047374726800290573747284
-:106940006970002103737562002E0373756D00C4B6
-:1069500005737570657200CE1473796D6D65747210
-:1069600069635F646966666572656E636500601B76
-:1069700073796D6D65747269635F6469666665726B
-:10698000656E63655F75706461746500BC037379DF
-:106990007300FE0374616E00F209746872657368B7
-:1069A0006F6C6400B3057468726F77009D09746939
-:1069B000636B735F61646400B10A7469636B735FD6
-:1069C000646966660042087469636B735F6D730087
-:1069D0005A087469636B735F757300F00474696DB2
-:1069E0006500890D74696D655F70756C73655F75A1
-:1069F0007300D808746F5F6279746573005B057407
-:106A000072756E6300FD057475706C65009D04748D
-:106A100079706500150C75636F6C6C656374696FD4
-:106A20006E73008B047564697600E30475696E7497
-:106A300000F605756E696F6E000409756E697175F3
-:106A4000655F6964000706756E7061636B000E0B0D
-:106A5000756E7061636B5F66726F6D00B406757002
-:106A6000646174650027057570706572004707756D
-:106A700073747275637400E5057574696D65004E15
-:106A80000576616C7565007D0676616C75657300D1
-:106A90006E0C76657273696F6E5F696E666F009DCE
-:106AA0000377666900E6037A697000696E76616C47
-:106AB00069642070697463680028295B5D7B7D2CA4
-:106AC0003A3B407E3C653D633C653D3E653D633EF3
-:106AD000653D2A653D632A653D2B653D2D653D6518
-:106AE0003E26653D7C653D2F653D632F653D2565F3
-:106AF0003D5E653D3D653D212E00756E69636F64A9
-:106B000065206E616D652065736361706573004615
-:106B1000616C73650054727565005F5F64656275D2
-:106B2000675F5F00616E640061730061737365721B
-:106B30007400627265616B00636F6E74696E756577
-:106B40000064656C00656C696600656C7365006562
-:106B500078636570740066696E616C6C79006C6155
-:106B60006D626461006E6F740072657475726E00A0
-:106B70007969656C640042434445464748494B4C3B
-:106B80003D363E3758383F3957315032592F4E3005
-:106B90004F5A3A543B553351345235533C564D407D
-:106BA00067656E657261746F722069676E6F72657A
-:106BB000642047656E657261746F72457869740010
-:106BC0003C67656E657261746F72206F626A65639F
-:106BD0007420272571272061742025703E00636191
-:106BE0006E27742073656E64206E6F6E2D4E6F6E0F
-:106BF000652076616C756520746F2061206A7573FD
-:106C0000742D737461727465642067656E6572615A
-:106C1000746F7200736C69636520737465702063B0
-:106C2000616E6E6F74206265207A65726F006F62AC
-:106C30006A656374206E6F7420696E207365717568
-:106C4000656E63650070617273657220636F756C49
-:106C500064206E6F7420616C6C6F63617465206575
-:106C60006E6F756768206D656D6F727900756E6502
-:106C70007870656374656420696E64656E74007510
-:106C80006E696E64656E7420646F6573206E6F74D8
-:106C9000206D6174636820616E79206F7574657210
-:106CA00020696E64656E746174696F6E206C6576C0
-:106CB000656C0063616E6E6F74206D697820627917
-:106CC00074657320616E64206E6F6E627974657393
-:106CD000206C69746572616C730003000000000031
-:106CE00000000025713D00312E302E30006D6963AB
-:106CF000726F3A6269742076312E302E302B6534F3
-:106D00003131333337206F6E20323031382D303906
-:106D10002D32313B204D6963726F507974686F6E0C
-:106D20002076312E392E322D33342D6764363431AE
-:106D30003534633733206F6E20323031372D3039A0
-:106D40002D3031006D6963726F3A62697420776922
-:106D50007468206E52463531383232005350492023
-:106D60006E6F7420696E697469616C697365640023
-:106D700066756E6374696F6E20646F6573206E6FE5
-:106D8000742074616B65206B6579776F7264206124
-:106D90007267756D656E74730066756E6374696F86
-:106DA0006E206D697373696E67202564207265714A
-:106DB000756972656420706F736974696F6E616C58
-:106DC00020617267756D656E74730066756E6374AD
-:106DD000696F6E20657870656374656420617420E6
-:106DE0006D6F737420256420617267756D656E74B4
-:106DF000732C20676F74202564002725712720617C
-:106E00007267756D656E74207265717569726564FF
-:106E100000657874726120706F736974696F6E6158
-:106E20006C20617267756D656E7473206769766535
-:106E30006E006578747261206B6579776F7264207B
-:106E4000617267756D656E747320676976656E0033
-:106E5000696D6167652063616E6E6F742062652085
-:106E60006D6F646966696564202874727920636F48
-:106E70007079696E6720666972737429006578702D
-:106E8000656374696E6720616E20696D6167650076
-:106E90006D757374207370656369667920626F74B1
-:106EA00068206F6666736574730073697A65206322
-:106EB000616E6E6F74206265206E656761746976BD
-:106EC00065006272696768746E657373206D756CB6
-:106ED0007469706C696572206D757374206E6F745F
-:106EE000206265206E6567617469766500696E640D
-:106EF00065782063616E6E6F74206265206E6567D1
-:106F0000617469766500696E64657820746F6F20BE
-:106F10006C6172676500756E657870656374656431
-:106F20002063686172616374657220696E20496DC7
-:106F300061676520646566696E6974696F6E004992
-:106F40006D6167652873292074616B65732061200A
-:106F5000737472696E6700696D616765206461743E
-:106F60006120697320696E636F7272656374207348
-:106F7000697A6500496D61676528292074616B65D0
-:106F800073203020746F203320617267756D656ED9
-:106F9000747300496D61676528000A202020200075
-:106FA000270A20202020270030313233343536376D
-:106FB000383900696D61676573206D75737420627F
-:106FC00065207468652073616D652073697A65005A
-:106FD00045727220333636383300457272203336AC
-:106FE000383934005DC12028412E293D45483459A7
-:106FF0002EA0284129203D41C82028415245292062
-:107000003D4141D220284152294F3D4158D228418B
-:107010005229233D454834D2205E28415329233D3F
-:10702000455934D328412957413D41D82841572952
-:107030003D414FB5203A28414E59293D4548344EEF
-:1070400049D92841295E2B233D4559B5233A28418A
-:107050004C4C59293D554C49D92028414C29233DB8
-:1070600055CC28414741494E293D41584745483470
-:10707000CE233A28414729453D4948CA2841295E3F
-:10708000253D45D92841295E2B3A233D41C5203A6B
-:107090002841295E2B203D4559B4202841525229D0
-:1070A0003D4158D228415252293D414534D2205EBB
-:1070B00028415229203D414135D2284152293D41A4
-:1070C0004135D228414952293D454834D2284149C9
-:1070D000293D4559B4284159293D4559B5284155BF
-:1070E000293D414FB4233A28414C29203D55CC231A
-:1070F0003A28414C5329203D554CDA28414C4B2924
-:107100003D414F34CB28414C295E3D414FCC203A84
-:107110002841424C45293D4559344255CC284142ED
-:107120004C45293D41584255CC284129564F3D45B3
-:1071300059B428414E47292B3D4559344ECA284160
-:1071400054415249293D4148544141345249D9287A
-:107150004129544F4D3D41C52841295454493D4191
-:10716000C52028415429203D4145D4202841295497
-:107170003D41C82841293D41C55DC2202842292002
-:107180003D424959B420284245295E233D4249C821
-:10719000284245494E47293D4249593449484ED82D
-:1071A0002028424F544829203D424F573454C8208C
-:1071B0002842555329233D42494834DA2842524552
-:1071C000414B293D4252455935CB284255494C291E
-:1071D0003D42494834CC2842293DC25DC320284362
-:1071E00029203D534959B420284348295E3DCB5EB0
-:1071F00045284348293DCB284348412952233D4B4C
-:107200004548B5284348293D43C8205328434929C8
-:10721000233D534159B428434929413D53C828438C
-:1072200049294F3D53C828434929454E3D53C82855
-:1072300043495459293D5349485449D92843292B96
-:107240003DD328434B293DCB28434F4D4D4F444F11
-:107250005245293D4B4141344D4148444F48D22885
-:10726000434F4D293D4B4148CD2843554954293D75
-:107270004B4948D42843524541293D4B5249594531
-:10728000D92843293DCB5DC420284429203D4449C9
-:1072900059B4202844522E29203D444141344B54B6
-:1072A00045D2233A2844454429203D444948C42E28
-:1072B00045284429203DC4233A5E45284429203DE1
-:1072C000D420284445295E233D4449C82028444F02
-:1072D00029203D4455D72028444F4553293D44415A
-:1072E00048DA28444F4E4529203D44414835CE28B0
-:1072F000444F494E47293D4455573449484ED820BC
-:1073000028444F57293D4441D72328445529413D1E
-:107310004A55D723284455295E233D4A41D828445D
-:10732000293DC45DC520284529203D49594959B406
-:10733000233A28452920BD273A5E28452920BD202B
-:107340003A284529203D49D92328454429203DC4D0
-:10735000233A2845294420BD2845562945523D4514
-:107360004834D62845295E253D4959B42845524917
-:1073700029233D4959345249D928455249293D4587
-:1073800048345249C8233A28455229233D45D2283A
-:107390004552524F52293D454834524F48D2284514
-:1073A00052415345293D494852455935D328455204
-:1073B00029233D4548D2284552293D45D22028451C
-:1073C00056454E293D4959564548CE233A28452928
-:1073D00057BD40284557293D55D7284557293D5980
-:1073E00055D72845294F3D49D9233A2628455329C1
-:1073F000203D4948DA233A2845295320BD233A281D
-:10740000454C5929203D4C49D9233A28454D454EF4
-:1074100054293D4D45484ED4284546554C293D46B6
-:107420005548CC284545293D4959B4284541524E37
-:10743000293D455235CE2028454152295E3D4552D1
-:10744000B528454144293D4548C4233A28454129AA
-:10745000203D495941D82845412953553D4548B516
-:10746000284541293D4959B52845494748293D45C1
-:1074700059B4284549293D4959B420284559452939
-:107480003D4159B4284559293D49D9284555293DFB
-:10749000595557B528455155414C293D4959344B0B
-:1074A0005755CC2845293D45C85DC620284629208A
-:1074B0003D454834C62846554C293D465548CC28BC
-:1074C000465249454E44293D46524548354EC4280A
-:1074D000464154484552293D46414134444845D2ED
-:1074E00028462946BD2846293DC65DC7202847298C
-:1074F000203D4A4959B428474956293D474948350E
-:10750000D620284729495E3DC728474529543D478D
-:107510004548B553552847474553293D474A4548AF
-:1075200034D3284747293DC72042232847293DC750
-:107530002847292B3DCA284752454154293D4752E7
-:10754000455934D428474F4E29453D47414F35CE04
-:107550002328474829BD2028474E293DCE284729C2
-:107560003DC75DC820284829203D45593443C820DF
-:1075700028484156293D2F48414536D620284845C0
-:107580005245293D2F484959D22028484F55522964
-:107590003D41573545D228484F57293D2F4841D7BF
-:1075A000284829233D2FC8284829BD5DC9202849DE
-:1075B0004E293D4948CE20284929203D4159B4282B
-:1075C0004929203D41D928494E29443D415935CECC
-:1075D00053454D2849293D49D920414E5428492930
-:1075E0003D41D928494552293D495945D2233A526E
-:1075F0002849454429203D4959C428494544292062
-:107600003D415935C42849454E293D49594548CE43
-:1076100028494529543D41593445C8284927293D21
-:107620004159B5203A2849295E253D4159B5203AAE
-:1076300028494529203D4159B4284929253D49D9A2
-:10764000284945293D4959B4202849444541293D07
-:1076500041594449593541C82849295E2B3A233DAF
-:1076600049C828495229233D4159D228495A292538
-:107670003D4159DA28495329253D4159DA495E28C7
-:1076800049295E233D49C82B5E2849295E2B3D418F
-:10769000D9233A5E2849295E2B3D49C82849295EED
-:1076A0002B3D41D9284952293D45D22849474829EF
-:1076B0003D4159B428494C44293D4159354CC420D9
-:1076C0002849474E293D494847CE2849474E292059
-:1076D0003D415934CE2849474E295E3D415934CE6B
-:1076E0002849474E29253D415934CE284943524F18
-:1076F000293D4159344B524FC82849515545293DE0
-:10770000495934CB2849293D49C85DCA20284A290E
-:10771000203D4A4559B4284A293DCA5DCB20284B13
-:1077200029203D4B4559B420284B294EBD284B29D3
-:107730003DCB5DCC20284C29203D454834CC284CFD
-:107740004F2943233D4C4FD74C284C29BD233A5E4B
-:10775000284C29253D55CC284C454144293D4C49D0
-:1077600059C420284C41554748293D4C414534C611
-:10777000284C293DCC5DCD20284D29203D4548345D
-:10778000CD20284D522E29203D4D49483453544593
-:10779000D220284D532E293D4D494835DA20284D19
-:1077A00052532E29203D4D494834534958DA284D2B
-:1077B0004F56293D4D555734D6284D414348494EE3
-:1077C000293D4D41485348495935CE4D284D29BD95
-:1077D000284D293DCD5DCE20284E29203D454834F9
-:1077E000CE45284E47292B3D4ECA284E4729523DAB
-:1077F0004E58C7284E4729233D4E58C7284E474C60
-:1078000029253D4E584755CC284E47293D4ED8286E
-:107810004E4B293D4E58CB20284E4F5729203D4EE8
-:107820004157B44E284E29BD284E4F4E29453D4E56
-:10783000414834CE284E293DCE5DCF20284F292007
-:107840003D4F4834D7284F4629203D4148D620286F
-:107850004F4829203D4F57B5284F524F554748298B
-:107860003D4552344FD7233A284F5229203D45D227
-:10787000233A284F525329203D4552DA284F5229A6
-:107880003D414FD220284F4E45293D574148CE23F8
-:10789000284F4E4529203D574148CE284F57293D76
-:1078A0004FD720284F564552293D4F57355645D280
-:1078B0005052284F29563D5557B4284F56293D411F
-:1078C0004834D6284F295E253D4F57B5284F295EAD
-:1078D000454E3D4FD7284F295E49233D4F57B52888
-:1078E0004F4C29443D4F5734CC284F5547485429D5
-:1078F0003D414F35D4284F554748293D414835C66D
-:1079000020284F55293D41D748284F552953233D1D
-:107910004157B4284F5553293D4158D3284F55520C
-:10792000293D4F48D2284F554C44293D554835C430
-:10793000284F55295E4C3D4148B5284F5550293DAB
-:10794000555735D0284F55293D41D7284F59293D06
-:107950004FD9284F494E47293D4F573449484ED8B3
-:10796000284F49293D4F59B5284F4F52293D4F487F
-:1079700035D2284F4F4B293D554835CB46284F4FE0
-:1079800044293D555735C44C284F4F44293D414863
-:1079900035C44D284F4F44293D555735C4284F4FC6
-:1079A00044293D554835C446284F4F54293D554834
-:1079B00035D4284F4F293D5557B5284F27293D4FDE
-:1079C000C8284F29453D4FD7284F29203D4FD7285C
-:1079D0004F41293D4F57B420284F4E4C59293D4F18
-:1079E00057344E4C49D920284F4E4345293D5741E5
-:1079F00048344ED3284F4E2754293D4F57344ED448
-:107A000043284F294E3D41C1284F294E473D41CF84
-:107A1000203A5E284F294E3D41C849284F4E293D06
-:107A200055CE233A284F4E293D55CE235E284F4E42
-:107A3000293D55CE284F2953543D4FD7284F46292D
-:107A40005E3D414F34C6284F54484552293D414878
-:107A500035444845D252284F29423D5241C15E52D9
-:107A6000284F293A233D4F57B5284F535329203DDE
-:107A7000414F35D3233A5E284F4D293D4148CD280B
-:107A80004F293D41C15DD020285029203D50495902
-:107A9000B4285048293DC62850454F504C293D50E8
-:107AA0004959355055CC28504F57293D504157B46E
-:107AB0002850555429203D505548D428502950BDB0
-:107AC00028502953BD2850294EBD2850524F462ECC
-:107AD000293D50524F48464548345345D2285029F5
-:107AE0003DD05DD120285129203D4B595557B42810
-:107AF00051554152293D4B574F4835D228515529B0
-:107B00003D4BD72851293DCB5DD220285229203D1D
-:107B1000414135D220285245295E233D5249D9287A
-:107B2000522952BD2852293DD25DD3202853292005
-:107B30003D454834D3285348293D53C82328534949
-:107B40004F4E293D5A4855CE28534F4D45293D5358
-:107B50004148CD232853555229233D5A4845D22820
-:107B600053555229233D534845D2232853552923A1
-:107B70003D5A4855D7232853535529233D5348553B
-:107B8000D72328534544293D5AC423285329233D4C
-:107B9000DA2853414944293D534548C45E28534996
-:107BA0004F4E293D534855CE28532953BD2E2853B7
-:107BB00029203DDA233A2E45285329203DDA233A5D
-:107BC0005E23285329203DD355285329203DD32017
-:107BD0003A23285329203DDA2323285329203DDA4C
-:107BE0002028534348293D53CB285329432BBD23F9
-:107BF00028534D293D5A55CD2328534E29273D5A08
-:107C000055CD2853544C45293D5355CC2853293D37
-:107C1000D35DD420285429203D544959B4202854F8
-:107C200048452920233D444849D92028544845291E
-:107C3000203D444841D828544F29203D5455D82050
-:107C40002854484154293D44484145D420285448AB
-:107C5000495329203D44484948D320285448455990
-:107C6000293D444845D920285448455245293D449A
-:107C7000484548D22854484552293D444845D228D1
-:107C80005448454952293D44484548D22028544843
-:107C9000414E29203D44484145CE20285448454D79
-:107CA00029203D44484145CE285448455345292084
-:107CB0003D44484959DA20285448454E293D444816
-:107CC0004548CE285448524F554748293D544852BC
-:107CD0005557B42854484F5345293D44484F48DA36
-:107CE0002854484F55474829203D44484FD72854E9
-:107CF0004F444159293D5455584445D928544F4D76
-:107D00004F2952524F573D54554D4141B528544F7C
-:107D10002954414C3D544F57B520285448555329B8
-:107D20003D4448414834D3285448293D54C8233A57
-:107D300028544544293D544958C4532854492923BB
-:107D40004E3D43C8285449294F3D53C8285449291A
-:107D5000413D53C8285449454E293D534855CE28E6
-:107D600054555229233D434845D228545529413D75
-:107D7000434855D7202854574F293D5455D72628D6
-:107D80005429454E20BD2854293DD45DD520285581
-:107D900029203D595557B42028554E29493D59555C
-:107DA00057CE2028554E293D4148CE202855504FCA
-:107DB0004E293D415850414FCE4028555229233D30
-:107DC000554834D228555229233D59554834D22894
-:107DD0005552293D45D22855295E203D41C8285598
-:107DE000295E5E3D4148B5285559293D4159B52088
-:107DF0004728552923BD4728552925BD47285529FA
-:107E0000233DD7234E2855293D5955D7402855297C
-:107E10003D55D72855293D5955D75DD62028562997
-:107E2000203D564959B42856494557293D5659557C
-:107E300057B52856293DD65DD720285729203D44DF
-:107E400041483442554C5955D72028574552452969
-:107E50003D5745D22857412953483D5741C12857DE
-:107E6000412953543D5745D928574129533D57413E
-:107E7000C828574129543D5741C1285748455245C4
-:107E8000293D57484548D22857484154293D57482D
-:107E90004148D42857484F4C293D2F484F57CC28AC
-:107EA00057484F293D2F4855D7285748293D57C88F
-:107EB0002857415229233D574548D2285741522936
-:107EC0003D57414FD228574F52295E3D5745D22842
-:107ED0005752293DD228574F4D29413D575548CD3E
-:107EE00028574F4D29453D574948CD2857454129E9
-:107EF000523D5745C82857414E54293D57414135B9
-:107F00004ED4414E5328574552293D45D228572932
-:107F10003DD75DD820285829203D4548344BD220F4
-:107F20002858293DDA2858293D4BD35DD9202859B6
-:107F300029203D574159B428594F554E47293D599D
-:107F400041484ED82028594F5552293D594F48D2C3
-:107F50002028594F55293D5955D72028594553298F
-:107F60003D594548D3202859293DD9462859293D0E
-:107F700041D9505328594348293D4159CB233A5EB2
-:107F80002859293D49D9233A5E285929493D49D9DB
-:107F9000203A285929203D41D9203A285929233D02
-:107FA00041D9203A2859295E2B3A233D49C8203A25
-:107FB0002859295E233D41D92859293D49C85DDA10
-:107FC00020285A29203D5A4959B4285A293DDAEA2D
-:107FD000284129BD2821293DAE282229203D2D41B7
-:107FE00048354E4B574F5754AD2822293D4B574FDC
-:107FF000573454AD2823293D204E4148344D424545
-:10800000D22824293D20444141344C45D2282529F9
-:108010003D20504552534548344ED42826293D2012
-:1080200041454EC4282729BD282A293D20414534F1
-:1080300053544552494853CB282B293D20504C419D
-:108040004834D3282C293DAC20282D29203DAD28AB
-:108050002D29BD282E293D20504F594ED4282F2997
-:108060003D20534C41453453C82830293D205A49BE
-:108070005934524FD72028315354293D4645523464
-:1080800053D4202831305448293D544548344E5467
-:10809000C82831293D2057414834CE2028324E444B
-:1080A000293D534548344B554EC42832293D205470
-:1080B0005557B42028335244293D5448455234C4BE
-:1080C0002833293D205448524959B42834293D20A9
-:1080D000464F4834D22028355448293D4649483433
-:1080E0004654C82835293D2046415934D6202836E3
-:1080F0003429203D534948344B5354495920464F65
-:1081000048D22836293D20534948344BD3283729B3
-:108110003D20534548345655CE2028385448293DF3
-:1081200045593454C82838293D20455934D4283974
-:10813000293D204E415934CE283A293DAE283B29CD
-:108140003DAE283C293D204C45483453204448410D
-:1081500045CE283D293D204959344B57554CDA2806
-:108160003E293D2047524559345445522044484108
-:1081700045CE283F293DBF2840293D20414536D4E2
-:10818000285E293D204B414534524958D45DC100F9
-:1081900000000000000000000000000000000000DF
-:1081A00000000000000000000000000000000000CF
-:1081B0000202020202028200000202020202020322
-:1081C0000303030303030303030202020202020286
-:1081D000C0A8B0ACC0A0B8A0C0BCA0ACA8ACC0A0A7
-:1081E000A0ACB4A4C0A8A8B0C0BC0000000200208D
-:1081F000209B20C0B920CDA34C8A8E0095F7A239D0
-:10820000C5067EC726374E91F155A1FE24452DA700
-:1082100036532E47DA7D7E7E7F80818282828484FF
-:108220008484848587878888898A8B8B8C8C8C6CE6
-:108230006F63616C207661726961626C6520726542
-:10824000666572656E636564206265666F7265203F
-:1082500061737369676E6D656E7400627974652011
-:10826000636F6465206E6F7420696D706C656D65F9
-:108270006E746564004E6F20616374697665206575
-:108280007863657074696F6E20746F2072657261B7
-:1082900069736500706F702066726F6D20656D7018
-:1082A0007479206C697374006261642074797065FC
-:1082B000636F64650062756666657220746F6F2017
-:1082C000736D616C6C00747275650066616C7365CA
-:1082D00000286E756C6C2900202020202020202092
-:1082E000202020202020202000303030303030303E
-:1082F0003030303030303030300004004D6963723F
-:108300006F507974686F6E2076312E392E322D338E
-:10831000342D67643634313534633733206F6E2043
-:10832000323031372D30392D30313B206D69637259
-:108330006F3A6269742076312E302E30207769745E
-:1083400068206E524635313832320D0A0054797049
-:1083500065202268656C7028292220666F72206D66
-:108360006F726520696E666F726D6174696F6E2ED3
-:108370000D0A003E3E3E20000D0A706173746520B8
-:108380006D6F64653B204374726C2D4320746F20C5
-:1083900063616E63656C2C204374726C2D44207491
-:1083A0006F2066696E6973680D0A3D3D3D20002EA1
-:1083B0002E2E2000726177205245504C3B204354B2
-:1083C000524C2D4220746F20657869740D0A006943
-:1083D0006E76616C6964206765737475726500738D
-:1083E000747265616D206F7065726174696F6E2063
-:1083F0006E6F7420737570706F72746564006F7542
-:1084000074206F66206D656D6F7279000000040244
-:108410000204020000020404040002020004040337
-:108420000100000103030300010102030304020130
-:108430000103010403010003000004010102000024
-:1084400003021B1B000E11000000000008080800BA
-:10845000080A4A4000000A5FEA5FEA0ED92ED36E8E
-:1084600019324489330C924C924D080800000004E4
-:10847000880808040804848488000A448A400004A8
-:108480008EC480000000048800000EC000000000C0
-:10849000080001224488100C9252524C048C8484AF
-:1084A0008E1C824C901E1EC244924C06CA525FE241
-:1084B0001FF01EC13E02448ED12E1FE24488100ED2
-:1084C000D12ED12E0ED12EC4880008000800000441
-:1084D0008004880244880482000EC00EC008048212
-:1084E00044880ED126C0040ED135B36C0C925ED2F6
-:1084F000521C925C925C0ED010100E1C9252525C78
-:108500001ED01C901E1ED01C90100ED013712E1267
-:10851000525ED2521C8808081C1FE242524C125470
-:10852000981492101010101E113B75B1311139358D
-:10853000B3710C9252524C1C925C90100C92524CA3
-:10854000861C925C92510ED00C825C1FE484848461
-:10855000125252524C1131312A44113135BB711231
-:10856000524C9252112A4484841EC488101E0EC894
-:1085700008080E10080482410EC242424E048A408E
-:108580000000000000001F0804800000000ED2520E
-:108590004F10101C925C000ED0100E02424ED24EB4
-:1085A0000C925C900E06C81C88080ED24EC24C106D
-:1085B000101C92520800080808024002424C101495
-:1085C0009814920808080806001B75B131001C9227
-:1085D0005252000C92524C001C925C90000ED24EF3
-:1085E000C2000ED010100006C8049808080EC80774
-:1085F000001252524F0011312A4400113135BB0094
-:10860000124C8C9200112A4498001EC4881E06C485
-:108610008C8486080808080818080C881800000CC4
-:108620008360302C3235352C302C3235352C300AE5
-:10863000302C3235352C302C3235352C300A302C5C
-:10864000302C302C302C300A3235352C302C302C5C
-:10865000302C3235350A302C3235352C3235352C2C
-:108660003235352C300A0054494C5420544F2046A2
-:10867000494C4C2053435245454E2000636F6D706A
-:1086800061737343616C0000000100020003000489
-:1086900000000101010201030104010002010202C4
-:1086A00002030204020003010302030303040300A4
-:1086B0000401040204030404044E6F20617661691E
-:1086C0006C61626C6520493243004F6E6C792038D2
-:1086D000626974732053504920737570706F72749F
-:1086E00065640053504920666F726D617420657235
-:1086F000726F72004E6F20617661696C61626C65A9
-:10870000205350490070696E6D6170206E6F742047
-:10871000666F756E6420666F72207065726970682E
-:108720006572616C00232D302B2000686C4C006555
-:10873000666745464700303132333435363738398D
-:1087400041424344454600303132333435363738C0
-:10875000396162636465660000000000AC79FC7FEB
-:108760000100000000000000320A0300373003005F
-:10877000114A0200114A0200114A0200E8030000F7
-:10878000B0BE020000000000000000000000000079
-:1087900000000000000000000000000000000100D8
-:1087A00000000000000000000000000000000000C9
-:1087B0000000000000000000FCD6020000000000E5
-:1087C000000000000000000084E502004784030070
-:1087D000700000200000000014F6020034F60200D1
-:1087E000F4F502000000000000000000000000009E
-:1087F0000000000000000000000000000000000079
-:108800000000000000000000000000000000000068
-:108810000000000000000000000000000000000058
-:108820000000000000000000000000000000000048
-:1088300000000000204EFFFF0000000001010101C8
-:10884000010101010101050505050505050501FFFA
-:1088500000000401E90000004D310000DD4C000083
-:10886000FD97000005610100DD6201002D6301003C
-:088870005D880100C100000059
-:020000041000EA
-:1010C0007CB0EE17FFFFFFFF0A0000000000E30006
-:0C10D000FFFFFFFFED6C030000000000BC
-:0400000500018DE980
-:00000001FF
-"""
-
-
 if __name__ == '__main__':  # pragma: no cover
     main(sys.argv[1:])
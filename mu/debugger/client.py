@@ -22,6 +22,7 @@ import time
 import logging
 import os.path
 from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from mu.logs import Payload
 
 
 logger = logging.getLogger(__name__)
@@ -144,7 +145,7 @@ class CommandBufferHandler(QObject):
                     remainder = b''
                 for command in commands:
                     command = command.decode('utf-8')
-                    logger.debug(command)
+                    logger.debug(Payload(command))
                     self.on_command.emit(command)
             else:
                 # If recv() returns None, the socket is closed.
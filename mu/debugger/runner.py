@@ -28,6 +28,7 @@ from enum import Enum
 from queue import Queue
 from threading import Thread
 from mu.debugger.utils import is_breakpoint_line
+from mu.logs import Payload
 
 
 logger = logging.getLogger(__name__)
@@ -80,7 +81,7 @@ def command_buffer(debugger):
             for command in commands:
                 command = command.decode('utf-8')
                 command_data = json.loads(command)
-                logging.debug(command_data)
+                logging.debug(Payload(command_data))
                 debugger.commands.put(command_data)
         else:
             # If recv() returns None, the socket is closed.
@@ -119,7 +120,7 @@ class Debugger(bdb.Bdb):
         """
         try:
             dumped = json.dumps((event, data)).encode('utf-8')
-            logging.debug(dumped)
+            logging.debug(Payload(dumped))
             self.client.sendall(dumped + Debugger.ETX)
         except OSError as e:
             logger.debug('Debugger client error.')
@@ -0,0 +1,301 @@
+"""
+Reads and writes the files edited in Mu, working out (and keeping) their
+encoding and newline convention, and tells when they've changed.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import codecs
+import hashlib
+import mmap
+import re
+import logging
+import tempfile
+import locale
+import shutil
+
+
+NEWLINE = "\n"
+
+#
+# We write all files as UTF-8 unless they arrived with a PEP 263 encoding
+# cookie, in which case we honour that encoding.
+#
+ENCODING = "utf-8"
+ENCODING_COOKIE_RE = re.compile(
+    "^[ \t\v]*#.*?coding[:=][ \t]*([-_.a-zA-Z0-9]+)")
+#
+# Files larger than this (in bytes) are memory mapped rather than read.
+#
+MMAP_THRESHOLD = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def write_and_flush(fileobj, content):
+    """
+    Write content to the fileobj then flush and fsync to ensure the data is,
+    in fact, written.
+
+    This is especially necessary for USB-attached devices
+    """
+    fileobj.write(content)
+    fileobj.flush()
+    #
+    # Theoretically this shouldn't work; fsync takes a file descriptor,
+    # not a file object. However, there's obviously some under-the-cover
+    # mechanism which converts one to the other (at least on Windows)
+    #
+    os.fsync(fileobj)
+
+
+def save_and_encode(text, filepath, newline=os.linesep, atomic=False):
+    """
+    Detect the presence of an encoding cookie and use that encoding; if
+    none is present, do not add one and use the Mu default encoding.
+    If the codec is invalid, log a warning and fall back to the default.
+
+    If atomic is True, the file is replaced atomically (see write_atomically)
+    where the file system allows it, so it's never left half written.
+    """
+    match = ENCODING_COOKIE_RE.match(text)
+    if match:
+        encoding = match.group(1)
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            logger.warning("Invalid codec in encoding cookie: %s", encoding)
+            encoding = ENCODING
+    else:
+        encoding = ENCODING
+
+    content = newline.join(text.splitlines())
+    if atomic and write_atomically(content.encode(encoding), filepath):
+        return
+    with open(filepath, "w", encoding=encoding, newline='') as f:
+        write_and_flush(f, content)
+
+
+def write_atomically(data, filepath):
+    """
+    Write the bytes to a temporary file in the same directory as the
+    referenced file and then rename it over the file. (If the file is a
+    symlink, its target is replaced.)
+
+    Returns a boolean indication of success. If the temporary file can't be
+    created or renamed (e.g. the directory isn't writable or, on Windows, the
+    file is in use) nothing is changed and False is returned, so the caller
+    can write the file in place instead.
+    """
+    target = os.path.realpath(filepath)
+    directory, filename = os.path.split(target)
+    try:
+        fd, temp_path = tempfile.mkstemp(prefix='.{}.'.format(filename),
+                                         suffix='.tmp', dir=directory)
+    except OSError as ex:
+        logger.warning('Cannot write {} atomically: {}'.format(target, ex))
+        return False
+    replaced = False
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write_and_flush(f, data)
+        if os.path.exists(target):
+            shutil.copymode(target, temp_path)
+        os.replace(temp_path, target)
+        replaced = True
+    except OSError as ex:
+        logger.warning('Cannot write {} atomically: {}'.format(target, ex))
+    finally:
+        if not replaced:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    return replaced
+
+
+def sniff_encoding_from_line(line):
+    """Determine the encoding of a file from the bytes of its first line:
+
+    * If there is a BOM, return the appropriate encoding
+    * If there is a PEP 263 encoding cookie, return the appropriate encoding
+    * Otherwise return None for read_and_decode to attempt several defaults
+    """
+    boms = [
+        (codecs.BOM_UTF8, "utf-8-sig"),
+        (codecs.BOM_UTF16_BE, "utf-16"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+    ]
+    #
+    # Try for a BOM
+    #
+    for bom, encoding in boms:
+        if line.startswith(bom):
+            return encoding
+
+    #
+    # Look for a PEP 263 encoding cookie
+    #
+    default_encoding = locale.getpreferredencoding()
+    try:
+        uline = line.decode(default_encoding)
+    except UnicodeDecodeError:
+        #
+        # Can't even decode the line in order to match the cookie
+        #
+        pass
+    else:
+        match = ENCODING_COOKIE_RE.match(uline)
+        if match:
+            return match.group(1)
+
+    #
+    # Fall back to the locale default
+    #
+    return None
+
+
+def sniff_encoding(filepath):
+    """Determine the encoding of a file (see sniff_encoding_from_line).
+    """
+    with open(filepath, "rb") as f:
+        line = f.readline()
+    return sniff_encoding_from_line(line)
+
+
+def majority_newline(crlf_count, lf_count):
+    """Given the number of Windows (U+000D U+000A) and Posix (lone U+000A)
+    line endings in some text, return the convention that predominates.
+    """
+    #
+    # If no lines are present, default to the platform newline
+    # If there's a tie, use the platform default
+    #
+    conventions_found = [
+        (0, 1, os.linesep),
+        (crlf_count, "\r\n" == os.linesep, "\r\n"),
+        (lf_count, "\n" == os.linesep, "\n"),
+    ]
+    majority_convention = max(conventions_found)
+    return majority_convention[-1]
+
+
+def sniff_newline_convention(text):
+    """Determine which line-ending convention predominates in the text.
+
+    Windows usually has U+000D U+000A
+    Posix usually has U+000A
+    But editors can produce either convention from either platform. And
+    a file which has been copied and edited around might even have both!
+    """
+    crlf_count = text.count("\r\n")
+    return majority_newline(crlf_count, text.count("\n") - crlf_count)
+
+
+def read_and_decode(filepath):
+    """
+    Read the contents of a file, returning a tuple of the decoded text (with
+    Mu's internal newlines) and the file's predominant newline convention.
+
+    The file is only read once. Files larger than MMAP_THRESHOLD bytes are
+    memory mapped and decoded straight from the mapping, so no intermediate
+    copy of their bytes is made.
+    """
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _decode(data)
+        return _decode(f.read())
+
+
+def _decode(data):
+    """
+    Decode the referenced bytes (or buffer) read from a file (see
+    read_and_decode).
+    """
+    end_of_line = data.find(b"\n") + 1
+    sniffed_encoding = sniff_encoding_from_line(data[:end_of_line or None])
+    #
+    # If sniff_encoding has found enough clues to indicate an encoding,
+    # use that. Otherwise try a series of defaults before giving up.
+    #
+    if sniffed_encoding:
+        logger.debug("Detected encoding %s", sniffed_encoding)
+        candidate_encodings = [sniffed_encoding]
+    else:
+        candidate_encodings = [ENCODING, locale.getpreferredencoding()]
+
+    for encoding in candidate_encodings:
+        logger.debug("Trying to decode with %s", encoding)
+        try:
+            text = str(data, encoding)
+            logger.info("Decoded with %s", encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise UnicodeDecodeError(encoding, b"", 0, 0, "Unable to decode")
+
+    #
+    # Sniff and convert newlines here so that, by the time
+    # the text reaches the editor it is ready to use. Then
+    # convert everything to the Mu internal newline character.
+    # (Counting and replacing with str methods is far quicker than
+    # regular expressions, and there's no copy if there's nothing to
+    # replace.)
+    #
+    crlf_count = text.count("\r\n")
+    newline = majority_newline(crlf_count, text.count("\n") - crlf_count)
+    logger.debug("Detected newline %r", newline)
+    if crlf_count:
+        text = text.replace("\r\n", NEWLINE)
+    return text, newline
+
+
+def file_identity(path):
+    """
+    Return a key that identifies the file at the referenced path, such that
+    different paths to the same file (e.g. via symlinks) have the same key.
+    Returns None if the file cannot be found.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def file_signature(path):
+    """
+    Return a key that changes whenever the file at the referenced path is
+    modified (its modification time and size). Returns None if the file
+    cannot be found.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def content_hash(text):
+    """
+    Return a hash of the referenced text, ignoring the newline convention,
+    so Mu can tell if saving it would change what's on disk.
+    """
+    content = NEWLINE.join(text.splitlines())
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
@@ -0,0 +1,184 @@
+"""
+Makes sure only one copy of Mu runs for each user.
+
+The first copy of Mu to start listens on a local socket (a Unix domain socket
+or a Windows named pipe). When Mu is started again, for example by
+double-clicking a file associated with Mu, it hands the paths of the files it
+was asked to open to the running copy and exits, rather than paying the full
+cost of starting up and opening a second window. If it wasn't asked to open
+any files, it still hands over the (empty) list of paths, so the running copy
+comes to the front as if Mu had been started again.
+
+Only QtCore and QtNetwork are needed, so this module is cheap to import.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import json
+import getpass
+import logging
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+
+logger = logging.getLogger(__name__)
+
+
+#: How long (in milliseconds) to wait for the running copy of Mu to respond.
+TIMEOUT = 500
+#: How long (in milliseconds) to wait before deciding an existing socket was
+#: left behind by a copy of Mu that crashed, rather than one that's busy.
+STALE_TIMEOUT = 3000
+
+
+def server_name():
+    """
+    Return the name of the local socket used by the current user's copy of
+    Mu.
+    """
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ''
+    return 'mu-editor-{}'.format(user)
+
+
+def forward_paths(paths, name=None):
+    """
+    Try to hand the referenced paths to a copy of Mu that's already running.
+    Relative paths are resolved here, since the running copy may have a
+    different working directory. If there are no paths, the running copy is
+    just brought to the front.
+
+    Returns a boolean indication of success. If False, there's no copy of Mu
+    running (or it isn't responding) so this one should start as usual.
+    """
+    try:
+        paths = [os.path.abspath(p) for p in paths]
+    except Exception as ex:
+        logger.error('Could not get paths for {}: {}'.format(paths, ex))
+        return False
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(TIMEOUT):
+        return False
+    message = json.dumps({'paths': paths}).encode('utf-8') + b'\n'
+    socket.write(message)
+    sent = socket.waitForBytesWritten(TIMEOUT)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(TIMEOUT)
+    return sent
+
+
+def is_stale(name):
+    """
+    Returns a boolean indication that the local socket with the referenced
+    name was left behind by a copy of Mu that crashed: there's no socket, or
+    nothing is listening on it.
+
+    A copy of Mu that's running but too busy to respond in time is given
+    longer to do so than forward_paths allows. If it still doesn't respond,
+    the socket isn't stale, since removing it would cut off a running copy.
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(name)
+    if socket.waitForConnected(STALE_TIMEOUT):
+        socket.disconnectFromServer()
+        return False
+    return socket.error() in (QLocalSocket.ServerNotFoundError,
+                              QLocalSocket.ConnectionRefusedError)
+
+
+class InstanceServer(QObject):
+    """
+    Listens for paths forwarded by later copies of Mu (see forward_paths) and
+    emits them via the paths_received signal. An empty list means another
+    copy was started without any files to open.
+    """
+
+    #: Emitted with the list of paths sent by another copy of Mu.
+    paths_received = pyqtSignal(list)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.on_connection)
+        self.buffers = {}
+
+    def listen(self):
+        """
+        Start listening. Returns a boolean indication of success.
+
+        An existing socket is only removed if it's stale (see is_stale). If
+        another copy of Mu is using it (forward_paths may have given up on a
+        busy copy) this copy doesn't listen.
+        """
+        if not self.server.listen(self.name):
+            if not is_stale(self.name):
+                logger.warning('Another copy of Mu is listening on {}.'.format(
+                               self.name))
+                return False
+            QLocalServer.removeServer(self.name)
+            if not self.server.listen(self.name):
+                logger.warning('Could not listen for other copies of Mu: '
+                               '{}'.format(self.server.errorString()))
+                return False
+        logger.info('Listening for other copies of Mu on {}'.format(
+            self.server.fullServerName()))
+        return True
+
+    def on_connection(self):
+        """
+        Handle new connections from other copies of Mu.
+        """
+        socket = self.server.nextPendingConnection()
+        while socket:
+            self.buffers[socket] = b''
+            socket.readyRead.connect(lambda s=socket: self.on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self.close(s))
+            # The message may have arrived before the connection was seen.
+            self.on_ready_read(socket)
+            socket = self.server.nextPendingConnection()
+
+    def on_ready_read(self, socket):
+        """
+        Read from the socket until a complete message has arrived.
+        """
+        if socket not in self.buffers:
+            return
+        self.buffers[socket] += bytes(socket.readAll())
+        if self.buffers[socket].endswith(b'\n'):
+            message = self.buffers.pop(socket)
+            try:
+                paths = json.loads(message.decode('utf-8'))['paths']
+            except (ValueError, KeyError, TypeError) as ex:
+                logger.error('Bad message from another copy of Mu: '
+                             '{}'.format(ex))
+            else:
+                logger.info('Paths from another copy of Mu: {}'.format(paths))
+                self.paths_received.emit(paths)
+            socket.disconnectFromServer()
+
+    def close(self, socket):
+        """
+        Tidy up after the referenced socket has disconnected.
+        """
+        self.on_ready_read(socket)
+        self.buffers.pop(socket, None)
+        socket.deleteLater()
@@ -17,10 +17,14 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import QSize, QTimer
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import (QVBoxLayout, QListWidget, QLabel, QListWidgetItem,
                              QDialog, QDialogButtonBox, QPlainTextEdit,
-                             QTabWidget, QWidget, QCheckBox, QLineEdit)
+                             QTabWidget, QWidget, QCheckBox, QLineEdit,
+                             QHBoxLayout, QComboBox)
+from mu.logs import LogFile
+from mu.workers import LogSearcher
 from mu.resources import load_icon
 
 
@@ -99,20 +103,145 @@ class ModeSelector(QDialog):
 class LogWidget(QWidget):
     """
     Used to display Mu's logs.
+
+    Only the end of the log file is shown at first. Earlier parts are loaded
+    when scrolling to the top, new lines are shown as they're logged and the
+    whole file can be filtered by level and text.
     """
 
-    def setup(self, log):
+    #: How often (in milliseconds) to check for new lines in the log.
+    FOLLOW_INTERVAL = 1000
+    #: How long (in milliseconds) to wait for typing to stop before filtering.
+    FILTER_DELAY = 300
+    #: The levels that can be filtered by.
+    LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+    def setup(self, log_path):
         widget_layout = QVBoxLayout()
         self.setLayout(widget_layout)
         label = QLabel(_('When reporting a bug, copy and paste the content of '
                          'the following log file.'))
         label.setWordWrap(True)
         widget_layout.addWidget(label)
+        filter_layout = QHBoxLayout()
+        self.level = QComboBox()
+        self.level.addItem(_('All levels'), '')
+        for level in self.LEVELS:
+            self.level.addItem(level, level)
+        self.level.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.level)
+        self.filter_text = QLineEdit()
+        self.filter_text.setPlaceholderText(_('Filter'))
+        filter_layout.addWidget(self.filter_text)
+        widget_layout.addLayout(filter_layout)
         self.log_text_area = QPlainTextEdit()
         self.log_text_area.setReadOnly(True)
         self.log_text_area.setLineWrapMode(QPlainTextEdit.NoWrap)
-        self.log_text_area.setPlainText(log)
         widget_layout.addWidget(self.log_text_area)
+        self.log_file = LogFile(log_path)
+        self.filtered = False
+        self.searcher = LogSearcher()
+        self.searcher.found.connect(self.show_filtered)
+        self.show_tail()
+        scroll_bar = self.log_text_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.on_scroll)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_text.textChanged.connect(
+            lambda: self.filter_timer.start(self.FILTER_DELAY))
+        self.follow_timer = QTimer(self)
+        self.follow_timer.timeout.connect(self.follow)
+        self.follow_timer.start(self.FOLLOW_INTERVAL)
+
+    def scroll_to_end(self):
+        scroll_bar = self.log_text_area.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def show_tail(self):
+        """
+        Show the end of the log file.
+        """
+        scroll_bar = self.log_text_area.verticalScrollBar()
+        # Don't load earlier chunks while passing the top of the new text.
+        scroll_bar.blockSignals(True)
+        self.log_text_area.setPlainText(self.log_file.tail())
+        self.scroll_to_end()
+        scroll_bar.blockSignals(False)
+
+    def on_scroll(self, value):
+        """
+        Load the earlier part of the log when scrolled to the top.
+        """
+        scroll_bar = self.log_text_area.verticalScrollBar()
+        if not self.filtered and value == scroll_bar.minimum():
+            self.load_earlier()
+
+    def load_earlier(self):
+        """
+        Insert the chunk of the log before the part being shown, keeping the
+        lines currently on screen in place.
+        """
+        text = self.log_file.earlier()
+        if not text:
+            return
+        scroll_bar = self.log_text_area.verticalScrollBar()
+        blocks = self.log_text_area.blockCount()
+        cursor = QTextCursor(self.log_text_area.document())
+        cursor.movePosition(QTextCursor.Start)
+        cursor.insertText(text)
+        added = self.log_text_area.blockCount() - blocks
+        scroll_bar.setValue(scroll_bar.value() + added)
+
+    def follow(self):
+        """
+        Append any lines logged since the log was last read. If the end of the
+        log was on screen, it stays on screen.
+        """
+        if self.filtered:
+            return
+        text = self.log_file.newer()
+        if text is None:
+            self.show_tail()
+        elif text:
+            scroll_bar = self.log_text_area.verticalScrollBar()
+            at_end = scroll_bar.value() == scroll_bar.maximum()
+            cursor = QTextCursor(self.log_text_area.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+            if at_end:
+                self.scroll_to_end()
+
+    def apply_filter(self):
+        """
+        Start searching the whole log for the records matching the level and
+        text being filtered by (see show_filtered), or show the end of the log
+        if there's nothing to filter by.
+        """
+        self.filter_timer.stop()
+        text = self.filter_text.text()
+        level = self.level.currentData()
+        self.filtered = bool(text or level)
+        if self.filtered:
+            self.searcher.search(self.log_file, text, level)
+        else:
+            self.searcher.cancel()
+            self.show_tail()
+
+    def show_filtered(self, records):
+        """
+        Show the records found by filtering the log.
+        """
+        self.log_text_area.setPlainText(records)
+        self.scroll_to_end()
+
+    def stop(self):
+        """
+        Stop following the log.
+        """
+        self.follow_timer.stop()
+        self.filter_timer.stop()
+        self.searcher.cancel()
 
 
 class EnvironmentVariablesWidget(QWidget):
@@ -161,6 +290,26 @@ class MicrobitSettingsWidget(QWidget):
         widget_layout.addStretch()
 
 
+class CheckerSettingsWidget(QWidget):
+    """
+    Used for configuring how code is checked:
+
+    * Check as you type flag.
+    """
+
+    def setup(self, check_as_you_type):
+        widget_layout = QVBoxLayout()
+        self.setLayout(widget_layout)
+        self.check_as_you_type = QCheckBox(_('Check code as you type?'))
+        self.check_as_you_type.setChecked(check_as_you_type)
+        widget_layout.addWidget(self.check_as_you_type)
+        label = QLabel(_('Problems are shown shortly after you stop typing, '
+                         'rather than when you click the "Check" button.'))
+        label.setWordWrap(True)
+        widget_layout.addWidget(label)
+        widget_layout.addStretch()
+
+
 class AdminDialog(QDialog):
     """
     Displays administrative related information and settings (logs, environment
@@ -170,7 +319,7 @@ class AdminDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-    def setup(self, log, settings):
+    def setup(self, log_path, settings):
         self.setMinimumSize(600, 400)
         self.setWindowTitle(_('Mu Administration'))
         widget_layout = QVBoxLayout()
@@ -182,7 +331,8 @@ class AdminDialog(QDialog):
         widget_layout.addWidget(button_box)
         # Tabs
         self.log_widget = LogWidget()
-        self.log_widget.setup(log)
+        self.log_widget.setup(log_path)
+        self.finished.connect(self.log_widget.stop)
         self.tabs.addTab(self.log_widget, _("Current Log"))
         self.envar_widget = EnvironmentVariablesWidget()
         self.envar_widget.setup(settings.get('envars', ''))
@@ -192,6 +342,9 @@ class AdminDialog(QDialog):
         self.microbit_widget.setup(settings.get('minify', False),
                                    settings.get('microbit_runtime', ''))
         self.tabs.addTab(self.microbit_widget, _('BBC micro:bit Settings'))
+        self.checker_widget = CheckerSettingsWidget()
+        self.checker_widget.setup(settings.get('check_as_you_type', False))
+        self.tabs.addTab(self.checker_widget, _('Code Checker'))
 
     def settings(self):
         """
@@ -203,6 +356,8 @@ class AdminDialog(QDialog):
             'envars': self.envar_widget.text_area.toPlainText(),
             'minify': self.microbit_widget.minify.isChecked(),
             'microbit_runtime': self.microbit_widget.runtime_path.text(),
+            'check_as_you_type':
+                self.checker_widget.check_as_you_type.isChecked(),
         }
 
 
@@ -212,13 +367,15 @@ class FindReplaceDialog(QDialog):
 
     * A term to find,
     * An optional value to replace the search term,
-    * A flag to indicate if the user wishes to replace all.
+    * A flag to indicate if the user wishes to replace all,
+    * Options for how to find the term and where (see options).
     """
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-    def setup(self, find=None, replace=None, replace_flag=False):
+    def setup(self, find=None, replace=None, replace_flag=False,
+              options=None):
         self.setMinimumSize(600, 200)
         self.setWindowTitle(_('Find / Replace'))
         widget_layout = QVBoxLayout()
@@ -239,6 +396,23 @@ class FindReplaceDialog(QDialog):
         self.replace_all_flag = QCheckBox(_('Replace all?'))
         self.replace_all_flag.setChecked(replace_flag)
         widget_layout.addWidget(self.replace_all_flag)
+        # How to find the term, and where.
+        options = options or {}
+        self.regex_flag = QCheckBox(_('Regular expression?'))
+        self.regex_flag.setChecked(options.get('regex', False))
+        widget_layout.addWidget(self.regex_flag)
+        self.case_sensitive_flag = QCheckBox(_('Match case?'))
+        self.case_sensitive_flag.setChecked(options.get('case_sensitive',
+                                                        True))
+        widget_layout.addWidget(self.case_sensitive_flag)
+        self.whole_word_flag = QCheckBox(_('Whole words only?'))
+        self.whole_word_flag.setChecked(options.get('whole_word', False))
+        widget_layout.addWidget(self.whole_word_flag)
+        self.all_files_flag = QCheckBox(_('Search all files? (The open tabs '
+                                          'and the scripts in the workspace '
+                                          'directory.)'))
+        self.all_files_flag.setChecked(options.get('all_files', False))
+        widget_layout.addWidget(self.all_files_flag)
         button_box = QDialogButtonBox(QDialogButtonBox.Ok |
                                       QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -262,3 +436,16 @@ class FindReplaceDialog(QDialog):
         Return the value of the global replace flag.
         """
         return self.replace_all_flag.isChecked()
+
+    def options(self):
+        """
+        Return a dictionary of the options for finding the term: whether it's
+        a regular expression, case sensitive or only matches whole words, and
+        whether to search all the files.
+        """
+        return {
+            'regex': self.regex_flag.isChecked(),
+            'case_sensitive': self.case_sensitive_flag.isChecked(),
+            'whole_word': self.whole_word_flag.isChecked(),
+            'all_files': self.all_files_flag.isChecked(),
+        }
@@ -23,18 +23,39 @@ import logging
 import os.path
 from collections import defaultdict
 from PyQt5.Qsci import QsciScintilla, QsciLexerPython, QsciAPIs
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from mu.interface.themes import Font, DayTheme
 from mu.logic import NEWLINE
+from mu.search import find_next
 
 
 # Regular Expression for valid individual code 'words'
 RE_VALID_WORD = re.compile('^[A-Za-z0-9_-]*$')
+# Regular Expression for the words whose occurrences are indexed.
+RE_WORD = re.compile(r'\w+')
 
 
 logger = logging.getLogger(__name__)
 
 
+#: Files with more characters or lines than these are edited in large file
+#: mode (see EditorPane).
+LARGE_FILE_SIZE = 1024 * 1024
+LARGE_FILE_LINES = 20000
+#: The (approximate) number of characters of a large file added to the editor
+#: at a time.
+LOAD_CHUNK_SIZE = 256 * 1024
+#: The number of lines above and below those on screen in which the matches
+#: for the selected word are highlighted.
+HIGHLIGHT_MARGIN = 20
+
+
+# Prepared APIs for autocomplete and call tips shared by all the editor panes,
+# keyed by the API definitions (which depend upon the mode) and the symbols
+# defined in the workspace.
+_PREPARED_APIS = {}
+
+
 class PythonLexer(QsciLexerPython):
     """
     A Python specific "lexer" that's used to identify keywords of the Python
@@ -58,9 +79,112 @@ class PythonLexer(QsciLexerPython):
         return ' '.join(kws)
 
 
+class PlainLexer(PythonLexer):
+    """
+    Used for large files. Text is shown in the theme's default font and
+    colours but isn't lexed (styled), which is slow for large files.
+    """
+
+    def lexer(self):
+        """
+        Use Scintilla's "null" lexer, which does nothing.
+        """
+        return 'null'
+
+
+def is_large(text):
+    """
+    Returns a boolean indication if the text is large enough to be edited in
+    large file mode.
+    """
+    return len(text) > LARGE_FILE_SIZE or text.count('\n') > LARGE_FILE_LINES
+
+
+def get_prepared_api(api_definitions, symbols=()):
+    """
+    Return a QsciAPIs instance prepared with the referenced API definitions
+    and the entries for the symbols defined in the workspace (see
+    mu.workers.SymbolIndex).
+
+    Preparing the APIs tokenises every definition, so it's done once for each
+    distinct list of definitions and the result is shared by every tab. The
+    QsciAPIs instance belongs to a lexer of its own so it outlives the tabs
+    that use it. When the symbols change, the APIs prepared with the old
+    symbols are forgotten.
+    """
+    key = (tuple(api_definitions), tuple(symbols))
+    if key not in _PREPARED_APIS:
+        for old_key in list(_PREPARED_APIS):
+            if old_key[1] != key[1]:
+                del _PREPARED_APIS[old_key]
+        lexer = PythonLexer()
+        api = QsciAPIs(lexer)
+        for entry in key[0] + key[1]:
+            api.add(entry)
+        api.prepare()
+        _PREPARED_APIS[key] = (lexer, api)
+    return _PREPARED_APIS[key][1]
+
+
+class WordIndex:
+    """
+    Where each word (see RE_WORD) occurs on each line of an editor's text, so
+    the matches for the selected word can be found without searching the
+    text.
+
+    The editor reports where its text changes (see EditorPane.on_modified),
+    and the words on a line that's changed are only found again when next
+    needed.
+    """
+
+    def __init__(self, line_text, lines=1):
+        self.line_text = line_text  # Returns the text of the given line.
+        self.lines = [None] * lines  # Word: columns, or None if not indexed.
+
+    def reset(self, lines):
+        """
+        Forget the words on every line, since the text has changed without
+        being reported (the number of lines it now has is given).
+        """
+        self.lines = [None] * lines
+
+    def changed(self, line, lines_added):
+        """
+        The text of the referenced line has changed, and lines were added
+        after it (or removed, if lines_added is negative).
+        """
+        if lines_added > 0:
+            self.lines[line + 1:line + 1] = [None] * lines_added
+        elif lines_added < 0:
+            del self.lines[line + 1:line + 1 - lines_added]
+        self.lines[line] = None
+
+    def occurrences(self, word, line):
+        """
+        Return the columns at which the word occurs on the referenced line.
+        """
+        words = self.lines[line]
+        if words is None:
+            words = {}
+            for match in RE_WORD.finditer(self.line_text(line)):
+                words.setdefault(match.group(), []).append(match.start())
+            self.lines[line] = words
+        return words.get(word, [])
+
+
 class EditorPane(QsciScintilla):
     """
     Represents the text editor.
+
+    Only the matches for the selected word on (or near) the lines on screen
+    are highlighted, and they're found using an index of the words on each
+    line (see WordIndex), so selecting a word costs the same however long the
+    file.
+
+    Large files (see is_large) are edited in large file mode: the text isn't
+    lexed, autocomplete only suggests from the API (not every word in the
+    file) and the text is added to the editor a chunk at a time, so Mu stays
+    responsive while it's loading.
     """
 
     # Signal fired when a script or hex is droped on this editor
@@ -70,7 +194,19 @@ class EditorPane(QsciScintilla):
         super().__init__()
         self.setUtf8(True)
         self.path = path
-        self.setText(text)
+        self.large = is_large(text)
+        self._loading = None  # The text of a large file being loaded.
+        self._loaded = 0  # How much of it has been added to the editor.
+        self._read_only = False  # Once loaded.
+        self._load_timer = QTimer(self)
+        self._load_timer.timeout.connect(self.load_next_chunk)
+        self.word_index = WordIndex(self.text, self.lines())
+        self.SCN_MODIFIED.connect(self.on_modified)
+        if self.large:
+            self._loading = text
+            self.load_next_chunk()
+        else:
+            self.setText(text)
         self.newline = newline
         self.check_indicators = {  # IDs are arbitrary
             'error': {'id': 19, 'markers': {}},
@@ -81,12 +217,17 @@ class EditorPane(QsciScintilla):
         }
         self.DEBUG_INDICATOR = 22  # Arbitrary
         self.BREAKPOINT_MARKER = 23  # Arbitrary
+        self.CHECK_MARKER = 24  # Arbitrary, tracks lines with annotations.
+        self.check_handles = {}  # Line: handle of its CHECK_MARKER.
         self.previous_selection = {
             'line_start': 0, 'col_start': 0, 'line_end': 0, 'col_end': 0
         }
-        self.lexer = PythonLexer()
+        self.lexer = PlainLexer() if self.large else PythonLexer()
         self.api = None
+        self.api_definitions = []
+        self.api_lexer = None
         self.has_annotations = False
+        self.check_results = None  # The key and results of the last check.
         self.setModified(False)
         self.breakpoint_handles = set()
         self.configure()
@@ -151,6 +292,7 @@ class EditorPane(QsciScintilla):
         # Markers and indicators
         self.setMarginSensitivity(0, True)
         self.markerDefine(self.Circle, self.BREAKPOINT_MARKER)
+        self.markerDefine(self.Invisible, self.CHECK_MARKER)
         self.setMarginSensitivity(1, True)
         self.setIndicatorDrawUnder(True)
         for type_ in self.check_indicators:
@@ -162,6 +304,111 @@ class EditorPane(QsciScintilla):
         self.indicatorDefine(self.FullBoxIndicator, self.DEBUG_INDICATOR)
         self.setAnnotationDisplay(self.AnnotationBoxed)
         self.selectionChanged.connect(self.selection_change_listener)
+        self.verticalScrollBar().valueChanged.connect(
+            self.refresh_visible_matches)
+
+    def load_next_chunk(self):
+        """
+        Add the next chunk of the large file being loaded to the editor. The
+        rest is added when Qt's event loop is next idle. Returns a boolean
+        indication if there's more to load.
+        """
+        if self._loading is None:
+            return False
+        end = self._loading.find('\n', self._loaded + LOAD_CHUNK_SIZE) + 1
+        if not end:
+            end = len(self._loading)
+        # Loading isn't an edit to be undone or saved.
+        blocked = self.blockSignals(True)
+        self.SendScintilla(QsciScintilla.SCI_SETUNDOCOLLECTION, False)
+        super().setReadOnly(False)
+        self.append(self._loading[self._loaded:end])
+        super().setReadOnly(True)
+        self.SendScintilla(QsciScintilla.SCI_SETUNDOCOLLECTION, True)
+        self.setModified(False)
+        self.blockSignals(blocked)
+        # The change wasn't reported to the word index (signals were blocked).
+        self.word_index.reset(self.lines())
+        self._loaded = end
+        if end < len(self._loading):
+            self._load_timer.start(0)
+            return True
+        self._finish_loading()
+        return False
+
+    def finish_loading(self):
+        """
+        Add the rest of the large file being loaded to the editor, now.
+        """
+        while self.load_next_chunk():
+            pass
+
+    def _finish_loading(self):
+        self._loading = None
+        self._load_timer.stop()
+        super().setReadOnly(self._read_only)
+
+    @property
+    def loading(self):
+        """
+        Returns a boolean indication if a large file is still being added to
+        the editor.
+        """
+        return self._loading is not None
+
+    def text(self, *args):
+        """
+        Return the text in the editor (or the referenced line or range). While
+        a large file is loading, the whole of its text is returned.
+        """
+        if self._loading is not None and not args:
+            return self._loading
+        return super().text(*args)
+
+    def setText(self, text):
+        """
+        Replace the text in the editor, abandoning any text still loading.
+        The editor switches in (or out) of large file mode if the new text
+        is (or isn't) large, for example when a file is reloaded.
+        """
+        if self._loading is not None:
+            self._finish_loading()
+        self.set_large(is_large(text))
+        super().setText(text)
+
+    def set_large(self, large):
+        """
+        Switch large file mode on or off, changing the lexer (and so the
+        styling and folding) and the source of autocomplete suggestions.
+        """
+        if large == self.large:
+            return
+        self.large = large
+        self.lexer = PlainLexer() if large else PythonLexer()
+        if self.api:
+            self.lexer.setAPIs(self.api)
+        self.set_theme(self.theme)
+
+    def setReadOnly(self, read_only):
+        """
+        Large files are read only while loading, after which the editor is
+        made read only (or not) as requested.
+        """
+        self._read_only = read_only
+        if self._loading is None:
+            super().setReadOnly(read_only)
+
+    def on_modified(self, position, modification_type, text, length,
+                    lines_added, *args):
+        """
+        Handles Scintilla's notification that the document has been modified,
+        so the word index is kept up to date with text that's been inserted
+        or deleted.
+        """
+        text_changed = self.SC_MOD_INSERTTEXT | self.SC_MOD_DELETETEXT
+        if modification_type & text_changed:
+            line = self.SendScintilla(self.SCI_LINEFROMPOSITION, position)
+            self.word_index.changed(line, lines_added)
 
     def connect_margin(self, func):
         """
@@ -174,6 +421,7 @@ class EditorPane(QsciScintilla):
         Connect the theme to a lexer and return the lexer for the editor to
         apply to the script text.
         """
+        self.theme = theme
         theme.apply_to(self.lexer)
         self.lexer.setDefaultPaper(theme.Paper)
         self.setCaretForegroundColor(theme.Caret)
@@ -189,7 +437,11 @@ class EditorPane(QsciScintilla):
         self.setMarkerBackgroundColor(theme.BreakpointMarker,
                                       self.BREAKPOINT_MARKER)
         self.setAutoCompletionThreshold(2)
-        self.setAutoCompletionSource(QsciScintilla.AcsAll)
+        if self.large:
+            # Collecting every word in the document is too slow.
+            self.setAutoCompletionSource(QsciScintilla.AcsAPIs)
+        else:
+            self.setAutoCompletionSource(QsciScintilla.AcsAll)
         self.setLexer(self.lexer)
         self.setMarginsBackgroundColor(theme.Margin)
         self.setMarginsForegroundColor(theme.Caret)
@@ -198,14 +450,16 @@ class EditorPane(QsciScintilla):
         self.setUnmatchedBraceBackgroundColor(theme.UnmatchedBraceBackground)
         self.setUnmatchedBraceForegroundColor(theme.UnmatchedBraceForeground)
 
-    def set_api(self, api_definitions):
+    def set_api(self, api_definitions, symbols=()):
         """
-        Sets the API entries for tooltips, calltips and the like.
+        Sets the API entries for tooltips, calltips and the like, along with
+        the entries for the symbols defined in the workspace.
         """
-        self.api = QsciAPIs(self.lexer)
-        for entry in api_definitions:
-            self.api.add(entry)
-        self.api.prepare()
+        self.api_definitions = api_definitions
+        self.api = get_prepared_api(api_definitions, symbols)
+        # Keep the APIs alive, even once they're no longer cached.
+        self.api_lexer = self.api.parent()
+        self.lexer.setAPIs(self.api)
 
     @property
     def label(self):
@@ -247,6 +501,8 @@ class EditorPane(QsciScintilla):
                     line_no, 0, line_no, 999999,
                     self.check_indicators[indicator]['id'])
             self.check_indicators[indicator]['markers'] = {}
+        self.markerDeleteAll(self.CHECK_MARKER)
+        self.check_handles = {}
 
     def reset_search_indicators(self):
         """
@@ -268,18 +524,97 @@ class EditorPane(QsciScintilla):
         indicator = self.check_indicators[annotation_type]
         for line_no, messages in feedback.items():
             indicator['markers'][line_no] = messages
-            for message in messages:
-                col = message.get('column', 0)
-                if col:
-                    col_start = col - 1
-                    col_end = col + 1
-                    self.fillIndicatorRange(line_no, col_start, line_no,
-                                            col_end, indicator['id'])
+            self.fill_check_indicators(line_no, messages, indicator['id'])
         if feedback:
             # Ensure the first line with a problem is visible.
             first_problem_line = sorted(feedback.keys())[0]
             self.ensureLineVisible(first_problem_line)
 
+    def fill_check_indicators(self, line_no, messages, indicator_id):
+        """
+        Mark the columns of the line where the check found the problems
+        described by the messages.
+        """
+        for message in messages:
+            col = message.get('column', 0)
+            if col:
+                col_start = col - 1
+                col_end = col + 1
+                self.fillIndicatorRange(line_no, col_start, line_no,
+                                        col_end, indicator_id)
+
+    def update_annotations(self, feedback):
+        """
+        Given the feedback of each type (e.g. 'error' and 'style') from
+        checking all the code, update the indicators and annotations of only
+        the lines where the feedback has changed, rather than resetting them
+        all.
+
+        Lines with annotations move as lines above them are added or removed,
+        so they're found (via their CHECK_MARKER) before being compared with
+        the feedback.
+        """
+        # Where the annotated lines are now. If lines with annotations were
+        # merged together, the merged line is redone from scratch.
+        moved = {}
+        handles = {}
+        changed = set()
+        for line_no, handle in self.check_handles.items():
+            now = self.markerLine(handle)
+            if now < 0 or now in handles:
+                self.markerDeleteHandle(handle)
+                changed.add(now)
+                continue
+            moved[line_no] = now
+            handles[now] = handle
+        changed.discard(-1)
+        for indicator in self.check_indicators.values():
+            indicator['markers'] = {
+                moved[line_no]: messages if moved[line_no] == line_no else [
+                    dict(m, line_no=moved[line_no]) for m in messages]
+                for line_no, messages in indicator['markers'].items()
+                if line_no in moved}
+        # The lines where the feedback has changed.
+        for annotation_type, indicator in self.check_indicators.items():
+            new = feedback.get(annotation_type, {})
+            old = indicator['markers']
+            changed.update(line_no for line_no in set(old) | set(new)
+                           if old.get(line_no) != new.get(line_no))
+        for line_no in changed:
+            for annotation_type, indicator in self.check_indicators.items():
+                self.clearIndicatorRange(line_no, 0, line_no, 999999,
+                                         indicator['id'])
+                messages = feedback.get(annotation_type, {}).get(line_no)
+                if messages:
+                    indicator['markers'][line_no] = messages
+                    self.fill_check_indicators(line_no, messages,
+                                               indicator['id'])
+                else:
+                    indicator['markers'].pop(line_no, None)
+            text = self.annotation_text(line_no)
+            if text:
+                self.annotate(line_no, text, self.annotationDisplay())
+                if line_no not in handles:
+                    handles[line_no] = self.markerAdd(line_no,
+                                                      self.CHECK_MARKER)
+            else:
+                self.clearAnnotations(line_no)
+                handle = handles.pop(line_no, None)
+                if handle is not None:
+                    self.markerDeleteHandle(handle)
+        self.check_handles = handles
+
+    def annotation_text(self, line_no):
+        """
+        Return the text with which to annotate the line, from the messages of
+        each type about it.
+        """
+        messages = []
+        for indicator in self.check_indicators.values():
+            for m in indicator['markers'].get(line_no, []):
+                messages.append('\u2191 ' + m['message'])
+        return '\n'.join(messages).strip()
+
     def debugger_at_line(self, line):
         """
         Set the line to be highlighted with the DEBUG_INDICATOR.
@@ -319,6 +654,9 @@ class EditorPane(QsciScintilla):
             text = '\n'.join(messages).strip()
             if text:
                 self.annotate(line, text, self.annotationDisplay())
+                if line not in self.check_handles:
+                    self.check_handles[line] = self.markerAdd(
+                        line, self.CHECK_MARKER)
 
     def find_next_match(self, text, from_line=-1, from_col=-1,
                         case_sensitive=True, wrap_around=True):
@@ -340,6 +678,36 @@ class EditorPane(QsciScintilla):
             show=False,      # Unfolds found text
             posix=False)     # More POSIX compatible RegEx
 
+    def replace_matches(self, matches):
+        """
+        Replace the matches (see mu.search.find_matches) with their
+        replacements as a single edit, so it's undone in one go.
+        """
+        self.beginUndoAction()
+        # From the last, so the earlier matches stay where they were found.
+        for match in reversed(matches):
+            start = self.positionFromLineIndex(match['line'], match['column'])
+            end = self.positionFromLineIndex(match['end_line'],
+                                             match['end_column'])
+            replacement = match['replacement'].encode('utf-8')
+            self.SendScintilla(self.SCI_SETTARGETRANGE, start, end)
+            self.SendScintilla(self.SCI_REPLACETARGET, len(replacement),
+                               replacement)
+        self.endUndoAction()
+
+    def select_next_match(self, pattern, replacement=None):
+        """
+        Select the next match for the compiled pattern after the cursor,
+        wrapping round to the start of the text, and return it (see
+        mu.search.find_next), or None if there isn't one.
+        """
+        line, column = self.getCursorPosition()
+        match = find_next(pattern, self.text(), line, column, replacement)
+        if match:
+            self.setSelection(match['line'], match['column'],
+                              match['end_line'], match['end_column'])
+        return match
+
     def range_from_positions(self, start_position, end_position):
         """Given a start-end pair, such as are provided by a regex match,
         return the corresponding Scintilla line-offset pairs which are
@@ -412,9 +780,7 @@ class EditorPane(QsciScintilla):
         # to the current theme.
         #
         indicators = self.search_indicators['selection']
-        text = self.text()
-        for match in re.finditer(selected_text, text):
-            range = self.range_from_positions(*match.span())
+        for range in self.visible_matches(selected_text):
             #
             # Don't highlight the text we've selected
             #
@@ -429,6 +795,44 @@ class EditorPane(QsciScintilla):
             self.fillIndicatorRange(line_start, col_start, line_end,
                                     col_end, indicators['id'])
 
+    def visible_matches(self, word):
+        """
+        Yield the ranges (see range_from_positions) of the matches for the
+        word on the lines currently on screen, or within HIGHLIGHT_MARGIN
+        lines of them.
+
+        Words are found with the word index. Anything else (e.g. "foo-bar")
+        is searched for in the text of each line.
+        """
+        # Folded or wrapped lines mean lines on screen (display lines) aren't
+        # the same as lines in the document.
+        first_visible = self.firstVisibleLine()
+        on_screen = self.SendScintilla(QsciScintilla.SCI_LINESONSCREEN)
+        first = self.SendScintilla(QsciScintilla.SCI_DOCLINEFROMVISIBLE,
+                                   first_visible)
+        last = self.SendScintilla(QsciScintilla.SCI_DOCLINEFROMVISIBLE,
+                                  first_visible + on_screen)
+        start = max(first - HIGHLIGHT_MARGIN, 0)
+        end = min(last + HIGHLIGHT_MARGIN, self.lines() - 1)
+        indexed = RE_WORD.fullmatch(word) is not None
+        pattern = re.compile(re.escape(word))
+        for line in range(start, end + 1):
+            if indexed:
+                for col in self.word_index.occurrences(word, line):
+                    yield line, col, line, col + len(word)
+            else:
+                for match in pattern.finditer(self.text(line)):
+                    yield line, match.start(), line, match.end()
+
+    def refresh_visible_matches(self):
+        """
+        Highlight the matches for the selected word that have scrolled onto
+        (or near) the screen.
+        """
+        if self.hasSelectedText():
+            self.reset_search_indicators()
+            self.highlight_selected_matches()
+
     def selection_change_listener(self):
         """
         Runs every time the text selection changes. This could get triggered
@@ -29,14 +29,14 @@ from PyQt5.QtGui import QKeySequence, QStandardItemModel
 from PyQt5.QtSerialPort import QSerialPort
 from mu import __version__
 from mu.interface.dialogs import ModeSelector, AdminDialog, FindReplaceDialog
-from mu.interface.themes import (DayTheme, NightTheme, ContrastTheme,
-                                 DEFAULT_FONT_SIZE)
+from mu.interface.themes import get_theme, DEFAULT_FONT_SIZE
 from mu.interface.panes import (DebugInspector, DebugInspectorItem,
                                 PythonProcessPane, JupyterREPLPane,
                                 MicroPythonREPLPane, FileSystemPane,
-                                PlotterPane)
+                                PlotterPane, SearchResultsPane, OutlinePane)
 from mu.interface.editor import EditorPane
 from mu.resources import load_icon, load_pixmap
+from mu.search import compile_pattern, find_matches, replacer
 
 
 logger = logging.getLogger(__name__)
@@ -168,6 +168,7 @@ class FileTabs(QTabWidget):
             window.update_title(current_tab.label)
         else:
             window.update_title(None)
+        window.tab_changed.emit(current_tab)
 
 
 class Window(QMainWindow):
@@ -182,6 +183,10 @@ class Window(QMainWindow):
     serial = None
     repl = None
     plotter = None
+    search_results = None
+    outline = None
+    loaded_theme = None  # The theme of the application's stylesheet.
+    symbols = ()  # API entries for the symbols defined in the workspace.
 
     _zoom_in = pyqtSignal(int)
     _zoom_out = pyqtSignal(int)
@@ -190,6 +195,9 @@ class Window(QMainWindow):
     data_received = pyqtSignal(bytes)
     open_file = pyqtSignal(str)
     load_theme = pyqtSignal(str)
+    code_changed = pyqtSignal(object)
+    tab_changed = pyqtSignal(object)
+    open_match = pyqtSignal(str, int, int, int, int)
     previous_folder = None
 
     def zoom_in(self):
@@ -265,14 +273,19 @@ class Window(QMainWindow):
         logger.debug('Getting micro:bit path: {}'.format(path))
         return path
 
-    def add_tab(self, path, text, api, newline):
+    def add_tab(self, path, text, api, newline, index=None, focus=True):
         """
-        Adds a tab with the referenced path and text to the editor.
+        Adds a tab with the referenced path and text to the editor. The tab is
+        added after the others unless an index is given, and only becomes the
+        current tab if focus is True.
         """
         new_tab = EditorPane(path, text, newline)
         new_tab.connect_margin(self.breakpoint_toggle)
-        new_tab_index = self.tabs.addTab(new_tab, new_tab.label)
-        new_tab.set_api(api)
+        if index is None:
+            new_tab_index = self.tabs.addTab(new_tab, new_tab.label)
+        else:
+            new_tab_index = self.tabs.insertTab(index, new_tab, new_tab.label)
+        new_tab.set_api(api, self.symbols)
 
         @new_tab.modificationChanged.connect
         def on_modified():
@@ -285,10 +298,17 @@ class Window(QMainWindow):
             # Bubble the signal up
             self.open_file.emit(file)
 
-        self.tabs.setCurrentIndex(new_tab_index)
+        @new_tab.textChanged.connect
+        def on_text_changed():
+            self.code_changed.emit(new_tab)
+
+        if focus:
+            self.tabs.setCurrentIndex(new_tab_index)
         self.connect_zoom(new_tab)
-        self.set_theme(self.theme)
-        new_tab.setFocus()
+        # Only the new tab needs theming (see set_theme).
+        new_tab.set_theme(get_theme(self.theme))
+        if focus:
+            new_tab.setFocus()
         if self.read_only_tabs:
             new_tab.setReadOnly(self.read_only_tabs)
         return new_tab
@@ -550,6 +570,95 @@ class Window(QMainWindow):
         self.addDockWidget(Qt.RightDockWidgetArea, self.inspector)
         self.connect_zoom(self.debug_inspector)
 
+    def add_search_results(self):
+        """
+        Display the pane listing the matches found when searching all the
+        files, emptied of those from any previous search.
+        """
+        if self.search_results:
+            self.search_pane.clear()
+            self.search_results.show()
+            return self.search_pane
+        self.search_pane = SearchResultsPane()
+
+        @self.search_pane.open_match.connect
+        def on_open_match(*match):
+            # Bubble the signal up
+            self.open_match.emit(*match)
+
+        self.search_results = QDockWidget(_('Search Results'))
+        self.search_results.setWidget(self.search_pane)
+        self.search_results.setFeatures(QDockWidget.DockWidgetMovable |
+                                        QDockWidget.DockWidgetClosable)
+        self.search_results.setAllowedAreas(Qt.BottomDockWidgetArea |
+                                            Qt.LeftDockWidgetArea |
+                                            Qt.RightDockWidgetArea)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.search_results)
+        self.connect_zoom(self.search_pane)
+        return self.search_pane
+
+    def add_search_matches(self, path, matches):
+        """
+        List the matches found in the file at the referenced path in the
+        search results pane.
+        """
+        if self.search_results:
+            self.search_pane.add_matches(path, matches)
+
+    def add_outline(self):
+        """
+        Display the pane outlining the code in the current tab.
+        """
+        self.outline_pane = OutlinePane()
+        self.outline_pane.open_line.connect(self.show_line)
+        self.outline = QDockWidget(_('Outline'))
+        self.outline.setWidget(self.outline_pane)
+        self.outline.setFeatures(QDockWidget.DockWidgetMovable)
+        self.outline.setAllowedAreas(Qt.BottomDockWidgetArea |
+                                     Qt.LeftDockWidgetArea |
+                                     Qt.RightDockWidgetArea)
+        self.addDockWidget(Qt.LeftDockWidgetArea, self.outline)
+        self.connect_zoom(self.outline_pane)
+
+    def set_outline(self, outline):
+        """
+        Show the outline (see mu.outline.outline_tree) of the code in the
+        current tab in the outline pane.
+        """
+        if self.outline:
+            self.outline_pane.set_outline(outline)
+
+    def remove_outline(self):
+        """
+        Removes the outline pane from the application.
+        """
+        if self.outline:
+            self.outline_pane = None
+            self.outline.setParent(None)
+            self.outline.deleteLater()
+            self.outline = None
+
+    def show_line(self, line, column):
+        """
+        Move the cursor in the current tab to the referenced line and column,
+        scrolling it into view.
+        """
+        tab = self.current_tab
+        if tab:
+            tab.setCursorPosition(line, column)
+            tab.ensureLineVisible(line)
+            tab.setFocus()
+
+    def remove_search_results(self):
+        """
+        Removes the search results pane from the application.
+        """
+        if self.search_results:
+            self.search_pane = None
+            self.search_results.setParent(None)
+            self.search_results.deleteLater()
+            self.search_results = None
+
     def update_debug_inspector(self, locals_dict):
         """
         Given the contents of a dict representation of the locals in the
@@ -658,15 +767,17 @@ class Window(QMainWindow):
         Sets the theme for the REPL and editor tabs.
         """
         self.theme = theme
-        self.load_theme.emit(theme)
+        if theme != self.loaded_theme:
+            # Restyling the whole application is slow, so only do it if the
+            # theme has changed.
+            self.loaded_theme = theme
+            self.load_theme.emit(theme)
+        new_theme = get_theme(theme)
         if theme == 'contrast':
-            new_theme = ContrastTheme
             new_icon = 'theme_day'
         elif theme == 'night':
-            new_theme = NightTheme
             new_icon = 'theme_contrast'
         else:
-            new_theme = DayTheme
             new_icon = 'theme'
         for widget in self.widgets:
             widget.set_theme(new_theme)
@@ -676,14 +787,14 @@ class Window(QMainWindow):
         if hasattr(self, 'plotter') and self.plotter:
             self.plotter_pane.set_theme(theme)
 
-    def show_admin(self, log, settings):
+    def show_admin(self, log_path, settings):
         """
-        Display the administrative dialog with referenced content of the log
-        and settings. Return a dictionary of the settings that may have been
-        changed by the admin dialog.
+        Display the administrative dialog with the log file at the referenced
+        path and settings. Return a dictionary of the settings that may have
+        been changed by the admin dialog.
         """
         admin_box = AdminDialog(self)
-        admin_box.setup(log, settings)
+        admin_box.setup(log_path, settings)
         admin_box.exec()
         return admin_box.settings()
 
@@ -751,6 +862,17 @@ class Window(QMainWindow):
             title += ' - ' + filename
         self.setWindowTitle(title)
 
+    def bring_to_front(self):
+        """
+        Restores the window, if minimised, and raises it above other windows
+        with the focus.
+        """
+        self.setWindowState((self.windowState() & ~Qt.WindowMinimized) |
+                            Qt.WindowActive)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
     def autosize_window(self):
         """
         Makes the editor 80% of the width*height of the screen and centres it.
@@ -841,7 +963,16 @@ class Window(QMainWindow):
         # Update the autocomplete / tooltip APIs for each tab to the new mode.
         api = mode.api()
         for widget in self.widgets:
-            widget.set_api(api)
+            widget.set_api(api, self.symbols)
+
+    def set_symbols(self, symbols):
+        """
+        Offer the API entries for the symbols defined in the workspace for
+        autocomplete and call tips in every tab, along with the mode's API.
+        """
+        self.symbols = symbols
+        for widget in self.widgets:
+            widget.set_api(widget.api_definitions, symbols)
 
     def set_usb_checker(self, duration, callback):
         """
@@ -900,53 +1031,55 @@ class Window(QMainWindow):
         self.find_replace_shortcut = QShortcut(QKeySequence(shortcut), self)
         self.find_replace_shortcut.activated.connect(handler)
 
-    def show_find_replace(self, find, replace, global_replace):
+    def show_find_replace(self, find, replace, global_replace, options):
         """
         Display the find/replace dialog. If the dialog's OK button was clicked
-        return a tuple containing the find term, replace term and global
-        replace flag.
+        return a tuple containing the find term, replace term, global
+        replace flag and find options (see FindReplaceDialog.options).
         """
         finder = FindReplaceDialog(self)
-        finder.setup(find, replace, global_replace)
+        finder.setup(find, replace, global_replace, options)
         if finder.exec():
-            return (finder.find(), finder.replace(), finder.replace_flag())
+            return (finder.find(), finder.replace(), finder.replace_flag(),
+                    finder.options())
 
-    def replace_text(self, target_text, replace, global_replace):
+    def replace_text(self, target_text, replace, global_replace, options):
         """
         Given target_text, replace the first instance after the cursor with
         "replace". If global_replace is true, replace all instances of
-        "target". Returns the number of times replacement has occurred.
+        "target" with a single edit (so it's undone in one go). Returns the
+        number of times replacement has occurred.
+
+        The options (see FindReplaceDialog.options) say whether the target
+        is a regular expression, case sensitive and only matches whole words.
         """
         if not self.current_tab:
             return 0
+        pattern = compile_pattern(target_text, options['regex'],
+                                  options['case_sensitive'],
+                                  options['whole_word'])
+        replacement = replacer(replace, options['regex'])
         if global_replace:
-            counter = 0
-            found = self.current_tab.findFirst(target_text, True, True,
-                                               False, False, line=0, index=0)
-            if found:
-                counter += 1
-                self.current_tab.replace(replace)
-                while self.current_tab.findNext():
-                    self.current_tab.replace(replace)
-                    counter += 1
-            return counter
+            matches = find_matches(pattern, self.current_tab.text(),
+                                   replacement)
         else:
-            found = self.current_tab.findFirst(target_text, True, True, False,
-                                               True)
-            if found:
-                self.current_tab.replace(replace)
-                return 1
-            else:
-                return 0
+            match = self.current_tab.select_next_match(pattern, replacement)
+            matches = [match] if match else []
+        if matches:
+            self.current_tab.replace_matches(matches)
+        return len(matches)
 
-    def highlight_text(self, target_text):
+    def highlight_text(self, target_text, options):
         """
         Highlight the first match from the current position of the cursor in
-        the current tab for the target_text. Returns True if there's a match.
+        the current tab for the target_text (with the options, see
+        replace_text). Returns True if there's a match.
         """
         if self.current_tab:
-            return self.current_tab.findFirst(target_text, True, True, False,
-                                              True)
+            pattern = compile_pattern(target_text, options['regex'],
+                                      options['case_sensitive'],
+                                      options['whole_word'])
+            return self.current_tab.select_next_match(pattern) is not None
         else:
             return False
 
@@ -958,6 +1091,23 @@ class Window(QMainWindow):
         self.toggle_comments_shortcut = QShortcut(QKeySequence(shortcut), self)
         self.toggle_comments_shortcut.activated.connect(handler)
 
+    def connect_toggle_outline(self, handler, shortcut):
+        """
+        Create a keyboard shortcut and associate it with a handler for showing
+        or hiding the outline pane.
+        """
+        self.toggle_outline_shortcut = QShortcut(QKeySequence(shortcut), self)
+        self.toggle_outline_shortcut.activated.connect(handler)
+
+    def connect_go_to_definition(self, handler, shortcut):
+        """
+        Create a keyboard shortcut and associate it with a handler for going
+        to the definition of the name at the cursor.
+        """
+        self.go_to_definition_shortcut = QShortcut(QKeySequence(shortcut),
+                                                   self)
+        self.go_to_definition_shortcut.activated.connect(handler)
+
     def toggle_comments(self):
         """
         Toggle comments on/off for all selected line in the currently active
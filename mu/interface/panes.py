@@ -30,12 +30,13 @@ from PyQt5.QtCore import (Qt, QProcess, QProcessEnvironment, pyqtSignal,
 from collections import deque
 from PyQt5.QtWidgets import (QMessageBox, QTextEdit, QFrame, QListWidget,
                              QGridLayout, QLabel, QMenu, QApplication,
-                             QTreeView)
+                             QTreeView, QTreeWidget, QTreeWidgetItem)
 from PyQt5.QtGui import (QKeySequence, QTextCursor, QCursor, QPainter,
                          QDesktopServices, QStandardItem)
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
 from mu.interface.themes import Font
 from mu.interface.themes import DEFAULT_FONT_SIZE
+from mu.workspace import workspace_index
 
 
 logger = logging.getLogger(__name__)
@@ -372,6 +373,7 @@ class LocalFileList(MuFileList):
         super().__init__()
         self.home = home
         self.setDragDropMode(QListWidget.DragDrop)
+        self.setSortingEnabled(True)
 
     def dropEvent(self, event):
         source = event.source()
@@ -472,6 +474,10 @@ class FileSystemPane(QFrame):
         self.microbit_fs.set_message.connect(self.show_message)
         self.local_fs.disable.connect(self.disable)
         self.local_fs.set_message.connect(self.show_message)
+        self.index = workspace_index(home)
+        for name in self.index.files():
+            self.local_fs.addItem(name)
+        self.index.changed.connect(self.on_local_changed)
 
     def disable(self):
         """
@@ -512,16 +518,25 @@ class FileSystemPane(QFrame):
         further interactions to take place.
         """
         self.microbit_fs.clear()
-        self.local_fs.clear()
         for f in microbit_files:
             self.microbit_fs.addItem(f)
-        local_files = [f for f in os.listdir(self.home)
-                       if os.path.isfile(os.path.join(self.home, f))]
-        local_files.sort()
-        for f in local_files:
-            self.local_fs.addItem(f)
+        # The local files are kept up to date by the workspace index (see
+        # on_local_changed). This only lists them again if the directory
+        # can't be watched.
+        self.index.files()
         self.enable()
 
+    def on_local_changed(self, added, removed):
+        """
+        Update the list of files on the local machine with the names of the
+        files added to and removed from the directory.
+        """
+        for name in removed:
+            for item in self.local_fs.findItems(name, Qt.MatchExactly):
+                self.local_fs.takeItem(self.local_fs.row(item))
+        for name in added:
+            self.local_fs.addItem(name)
+
     def on_ls_fail(self):
         """
         Fired when listing files fails.
@@ -1057,6 +1072,158 @@ class DebugInspector(QTreeView):
         pass
 
 
+class SearchResultsPane(QTreeWidget):
+    """
+    Lists the matches found when searching all the files, under the file in
+    which each was found. Activating a match (e.g. by double clicking it)
+    asks for it to be shown.
+    """
+
+    open_match = pyqtSignal(str, int, int, int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.itemActivated.connect(self.on_activated)
+
+    def add_matches(self, path, matches):
+        """
+        List the matches (see mu.search.find_matches) found in the file at
+        the referenced path.
+        """
+        label = '{} ({})'.format(os.path.basename(path), len(matches))
+        file_item = QTreeWidgetItem(self, [label])
+        file_item.setToolTip(0, path)
+        items = []
+        for match in matches:
+            item = QTreeWidgetItem(['{}: {}'.format(match['line'] + 1,
+                                                    match['text'].strip())])
+            item.setData(0, Qt.UserRole, [
+                path, match['line'], match['column'], match['end_line'],
+                match['end_column']])
+            items.append(item)
+        file_item.addChildren(items)
+        file_item.setExpanded(True)
+
+    def on_activated(self, item, column):
+        """
+        Ask for the activated match to be shown.
+        """
+        match = item.data(0, Qt.UserRole)
+        if match:
+            self.open_match.emit(*match)
+
+    def set_font_size(self, new_size=DEFAULT_FONT_SIZE):
+        """
+        Sets the font size for all the textual elements in this pane.
+        """
+        stylesheet = ("QWidget{font-size: " + str(new_size) +
+                      "pt; font-family: Monospace;}")
+        self.setStyleSheet(stylesheet)
+
+    def zoomIn(self, delta=2):
+        """
+        Zoom in (increase) the size of the font by delta amount difference in
+        point size upto 34 points.
+        """
+        old_size = self.font().pointSize()
+        new_size = min(old_size + delta, 34)
+        self.set_font_size(new_size)
+
+    def zoomOut(self, delta=2):
+        """
+        Zoom out (decrease) the size of the font by delta amount difference in
+        point size down to 4 points.
+        """
+        old_size = self.font().pointSize()
+        new_size = max(old_size - delta, 4)
+        self.set_font_size(new_size)
+
+    def set_theme(self, theme):
+        pass
+
+
+class OutlinePane(QTreeWidget):
+    """
+    Lists the classes, functions and top-level assignments in the code in the
+    current tab (see mu.outline). Activating one (e.g. by double clicking
+    it) asks for the line it's on to be shown.
+    """
+
+    open_line = pyqtSignal(int, int)
+    #: How each kind of item is labelled.
+    labels = {
+        'class': 'class {}',
+        'function': 'def {}',
+        'variable': '{}',
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.itemActivated.connect(self.on_activated)
+        self.outline = None
+
+    def set_outline(self, outline):
+        """
+        List the items in the outline (see mu.outline.outline_tree), nested
+        in the classes they're in. Nothing is changed if it's the outline
+        already listed, and the list stays scrolled to where it was.
+        """
+        if outline == self.outline:
+            return
+        self.outline = outline
+        scrolled = self.verticalScrollBar().value()
+        self.clear()
+        parents = [self.invisibleRootItem()]
+        for entry in outline:
+            del parents[entry['depth'] + 1:]
+            label = self.labels[entry['kind']].format(entry['name'])
+            item = QTreeWidgetItem(parents[-1], [label])
+            item.setData(0, Qt.UserRole, [entry['line'], entry['column']])
+            item.setToolTip(0, _('Line {}').format(entry['line'] + 1))
+            parents.append(item)
+        self.expandAll()
+        self.verticalScrollBar().setValue(scrolled)
+
+    def on_activated(self, item, column):
+        """
+        Ask for the line of the activated item to be shown.
+        """
+        self.open_line.emit(*item.data(0, Qt.UserRole))
+
+    def set_font_size(self, new_size=DEFAULT_FONT_SIZE):
+        """
+        Sets the font size for all the textual elements in this pane.
+        """
+        stylesheet = ("QWidget{font-size: " + str(new_size) +
+                      "pt; font-family: Monospace;}")
+        self.setStyleSheet(stylesheet)
+
+    def zoomIn(self, delta=2):
+        """
+        Zoom in (increase) the size of the font by delta amount difference in
+        point size upto 34 points.
+        """
+        old_size = self.font().pointSize()
+        new_size = min(old_size + delta, 34)
+        self.set_font_size(new_size)
+
+    def zoomOut(self, delta=2):
+        """
+        Zoom out (decrease) the size of the font by delta amount difference in
+        point size down to 4 points.
+        """
+        old_size = self.font().pointSize()
+        new_size = max(old_size - delta, 4)
+        self.set_font_size(new_size)
+
+    def set_theme(self, theme):
+        pass
+
+
 class PlotterPane(QChartView):
     """
     This plotter widget makes viewing sensor data easy!
@@ -121,19 +121,35 @@ class Theme:
     Defines a font and other theme specific related information.
     """
 
+    @classmethod
+    def styles(cls):
+        """
+        Return the default font of the theme and a list of the name, colour,
+        paper and font of each of its styles.
+
+        These are worked out once per theme and shared by the lexers of all
+        the tabs, rather than loaded again for each tab.
+        """
+        if '_styles' not in cls.__dict__:
+            styles = [(name, QColor(font.color), QColor(font.paper),
+                       font.load())
+                      for name, font in cls.__dict__.items()
+                      if isinstance(font, Font)]
+            cls._styles = (Font().load(), styles)
+        return cls._styles
+
     @classmethod
     def apply_to(cls, lexer):
+        default_font, styles = cls.styles()
         # Apply a font for all styles
-        lexer.setFont(Font().load())
+        lexer.setFont(default_font)
 
-        for name, font in cls.__dict__.items():
-            if not isinstance(font, Font):
-                continue
+        for name, color, paper, font in styles:
             style_num = getattr(lexer, name)
-            lexer.setColor(QColor(font.color), style_num)
+            lexer.setColor(color, style_num)
             lexer.setEolFill(True, style_num)
-            lexer.setPaper(QColor(font.paper), style_num)
-            lexer.setFont(font.load(), style_num)
+            lexer.setPaper(paper, style_num)
+            lexer.setFont(font, style_num)
 
 
 class DayTheme(Theme):
@@ -236,3 +252,15 @@ class ContrastTheme(Theme):
     UnmatchedBraceBackground = QColor('#666')
     UnmatchedBraceForeground = QColor('black')
     BreakpointMarker = QColor('lightGrey')
+
+
+def get_theme(name):
+    """
+    Return the theme with the referenced name ("day", "night" or "contrast"),
+    defaulting to the day theme.
+    """
+    if name == 'contrast':
+        return ContrastTheme
+    if name == 'night':
+        return NightTheme
+    return DayTheme
@@ -19,22 +19,33 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import os
 import sys
-import codecs
-import io
 import re
 import json
 import logging
-import tempfile
 import platform
 import webbrowser
 import random
 import locale
 import shutil
+import bisect
+from collections import OrderedDict
 import appdirs
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QMessageBox
-from pyflakes.api import check
-from pycodestyle import StyleGuide, Checker
 from mu.resources import path
+from mu.modes.registry import ModeRegistry
+from mu.profiler import PROFILER
+from mu.logs import Payload
+from mu.watcher import FileWatcher
+from mu import checker
+from mu import search
+from mu.workspace import workspace_index
+from mu.files import (NEWLINE, ENCODING, sniff_newline_convention,
+                      read_and_decode, file_identity, file_signature,
+                      content_hash)
+from mu.workers import (ModuleIndex, FileReader, FileChangedError, FileWriter,
+                        CodeChecker, CheckResults, FileSearcher, SymbolIndex,
+                        Outliner)
 from mu.debugger.utils import is_breakpoint_line
 from mu import __version__
 
@@ -49,21 +60,14 @@ DATA_DIR = appdirs.user_data_dir(appname='mu', appauthor='python')
 LOG_DIR = appdirs.user_log_dir(appname='mu', appauthor='python')
 # The path to the log file for the application.
 LOG_FILE = os.path.join(LOG_DIR, 'mu.log')
-# Regex to match pycodestyle (PEP8) output.
-STYLE_REGEX = re.compile(r'.*:(\d+):(\d+):\s+(.*)')
-# Regex to match flake8 output.
-FLAKE_REGEX = re.compile(r'.*:(\d+):\s+(.*)')
-# Regex to match false positive flake errors if microbit.* is expanded.
-EXPAND_FALSE_POSITIVE = re.compile(r"^'microbit\.(\w+)' imported but unused$")
-# The text to which "from microbit import \*" should be expanded.
-EXPANDED_IMPORT = ("from microbit import pin15, pin2, pin0, pin1, "
-                   " pin3, pin6, pin4, i2c, pin5, pin7, pin8, Image, "
-                   "pin9, pin14, pin16, reset, pin19, temperature, "
-                   "sleep, pin20, button_a, button_b, running_time, "
-                   "accelerometer, display, uart, spi, panic, pin13, "
-                   "pin12, pin11, pin10, compass")
 # Port number for debugger.
 DEBUGGER_PORT = 31415
+# How long (in milliseconds) to wait after the code stops changing before
+# checking it, when checking as you type.
+LIVE_CHECK_DELAY = 100
+# How long (in milliseconds) to wait after the code stops changing before
+# outlining it, when the outline pane is shown.
+OUTLINE_DELAY = 300
 MOTD = [  # Candidate phrases for the message of the day (MOTD).
     _('Hello, World!'),
     _("This editor is free software written in Python. You can modify it, "
@@ -129,166 +133,9 @@ MOTD = [  # Candidate phrases for the message of the day (MOTD).
     _("Wisest are they that know they know nothing."),
 ]
 
-NEWLINE = "\n"
-
-#
-# We write all files as UTF-8 unless they arrived with a PEP 263 encoding
-# cookie, in which case we honour that encoding.
-#
-ENCODING = "utf-8"
-ENCODING_COOKIE_RE = re.compile(
-    "^[ \t\v]*#.*?coding[:=][ \t]*([-_.a-zA-Z0-9]+)")
-
 logger = logging.getLogger(__name__)
 
 
-def write_and_flush(fileobj, content):
-    """
-    Write content to the fileobj then flush and fsync to ensure the data is,
-    in fact, written.
-
-    This is especially necessary for USB-attached devices
-    """
-    fileobj.write(content)
-    fileobj.flush()
-    #
-    # Theoretically this shouldn't work; fsync takes a file descriptor,
-    # not a file object. However, there's obviously some under-the-cover
-    # mechanism which converts one to the other (at least on Windows)
-    #
-    os.fsync(fileobj)
-
-
-def save_and_encode(text, filepath, newline=os.linesep):
-    """
-    Detect the presence of an encoding cookie and use that encoding; if
-    none is present, do not add one and use the Mu default encoding.
-    If the codec is invalid, log a warning and fall back to the default.
-    """
-    match = ENCODING_COOKIE_RE.match(text)
-    if match:
-        encoding = match.group(1)
-        try:
-            codecs.lookup(encoding)
-        except LookupError:
-            logger.warning("Invalid codec in encoding cookie: %s", encoding)
-            encoding = ENCODING
-    else:
-        encoding = ENCODING
-
-    with open(filepath, "w", encoding=encoding, newline='') as f:
-        write_and_flush(f, newline.join(text.splitlines()))
-
-
-def sniff_encoding(filepath):
-    """Determine the encoding of a file:
-
-    * If there is a BOM, return the appropriate encoding
-    * If there is a PEP 263 encoding cookie, return the appropriate encoding
-    * Otherwise return None for read_and_decode to attempt several defaults
-    """
-    boms = [
-        (codecs.BOM_UTF8, "utf-8-sig"),
-        (codecs.BOM_UTF16_BE, "utf-16"),
-        (codecs.BOM_UTF16_LE, "utf-16"),
-    ]
-    #
-    # Try for a BOM
-    #
-    with open(filepath, "rb") as f:
-        line = f.readline()
-    for bom, encoding in boms:
-        if line.startswith(bom):
-            return encoding
-
-    #
-    # Look for a PEP 263 encoding cookie
-    #
-    default_encoding = locale.getpreferredencoding()
-    try:
-        uline = line.decode(default_encoding)
-    except UnicodeDecodeError:
-        #
-        # Can't even decode the line in order to match the cookie
-        #
-        pass
-    else:
-        match = ENCODING_COOKIE_RE.match(uline)
-        if match:
-            return match.group(1)
-
-    #
-    # Fall back to the locale default
-    #
-    return None
-
-
-def sniff_newline_convention(text):
-    """Determine which line-ending convention predominates in the text.
-
-    Windows usually has U+000D U+000A
-    Posix usually has U+000A
-    But editors can produce either convention from either platform. And
-    a file which has been copied and edited around might even have both!
-    """
-    candidates = [
-        ("\r\n", "\r\n"),
-        # Match \n at the start of the string
-        # or \n preceded by any character other than \r
-        ("\n", "^\n|[^\r]\n")
-    ]
-    #
-    # If no lines are present, default to the platform newline
-    # If there's a tie, use the platform default
-    #
-    conventions_found = [(0, 1, os.linesep)]
-    for candidate, pattern in candidates:
-        instances = re.findall(pattern, text)
-        convention = (len(instances), candidate == os.linesep, candidate)
-        conventions_found.append(convention)
-    majority_convention = max(conventions_found)
-    return majority_convention[-1]
-
-
-def read_and_decode(filepath):
-    """
-    Read the contents of a file,
-    """
-    sniffed_encoding = sniff_encoding(filepath)
-    #
-    # If sniff_encoding has found enough clues to indicate an encoding,
-    # use that. Otherwise try a series of defaults before giving up.
-    #
-    if sniffed_encoding:
-        logger.debug("Detected encoding %s", sniffed_encoding)
-        candidate_encodings = [sniffed_encoding]
-    else:
-        candidate_encodings = [ENCODING, locale.getpreferredencoding()]
-
-    with open(filepath, "rb") as f:
-        btext = f.read()
-    for encoding in candidate_encodings:
-        logger.debug("Trying to decode with %s", encoding)
-        try:
-            text = btext.decode(encoding)
-            logger.info("Decoded with %s", encoding)
-            break
-        except UnicodeDecodeError:
-            continue
-    else:
-        raise UnicodeDecodeError(encoding, btext, 0, 0, "Unable to decode")
-
-    #
-    # Sniff and convert newlines here so that, by the time
-    # the text reaches the editor it is ready to use. Then
-    # convert everything to the Mu internal newline character
-    #
-    newline = sniff_newline_convention(text)
-    logger.debug("Detected newline %r", newline)
-    text = re.sub("\r\n", NEWLINE, text)
-    return text, newline
-
-
 def get_admin_file_path(filename):
     """
     Given an admin related filename, this function will attempt to get the
@@ -361,155 +208,6 @@ def extract_envars(raw):
     return result
 
 
-def check_flake(filename, code, builtins=None):
-    """
-    Given a filename and some code to be checked, uses the PyFlakesmodule to
-    return a dictionary describing issues of code quality per line. See:
-
-    https://github.com/PyCQA/pyflakes
-
-    If a list symbols is passed in as "builtins" these are assumed to be
-    additional builtins available when run by Mu.
-    """
-    import_all = "from microbit import *" in code
-    if import_all:
-        # Massage code so "from microbit import *" is expanded so the symbols
-        # are known to flake.
-        code = code.replace("from microbit import *", EXPANDED_IMPORT)
-    reporter = MuFlakeCodeReporter()
-    check(code, filename, reporter)
-    if builtins:
-        builtins_regex = re.compile(r"^undefined name '(" +
-                                    '|'.join(builtins) + r")'")
-    feedback = {}
-    for log in reporter.log:
-        if import_all:
-            # Guard to stop unwanted "microbit.* imported but unused" messages.
-            message = log['message']
-            if EXPAND_FALSE_POSITIVE.match(message):
-                continue
-        if builtins:
-            if builtins_regex.match(log['message']):
-                continue
-        if log['line_no'] not in feedback:
-            feedback[log['line_no']] = []
-        feedback[log['line_no']].append(log)
-    return feedback
-
-
-def check_pycodestyle(code):
-    """
-    Given some code, uses the PyCodeStyle module (was PEP8) to return a list
-    of items describing issues of coding style. See:
-
-    https://pycodestyle.readthedocs.io/en/latest/intro.html
-    """
-    # PyCodeStyle reads input from files, so make a temporary file containing
-    # the code.
-    code_fd, code_filename = tempfile.mkstemp()
-    os.close(code_fd)
-    save_and_encode(code, code_filename)
-    # Configure which PEP8 rules to ignore.
-    ignore = ('E121', 'E123', 'E126', 'E226', 'E302', 'E305', 'E24', 'E704',
-              'W291', 'W292', 'W293', 'W391', 'W503', )
-    style = StyleGuide(parse_argv=False, config_file=False)
-    style.options.ignore = ignore
-    checker = Checker(code_filename, options=style.options)
-    # Re-route stdout to a temporary buffer to be parsed below.
-    temp_out = io.StringIO()
-    sys.stdout = temp_out
-    # Check the code.
-    checker.check_all()
-    # Put stdout back and read the content of the buffer. Remove the temporary
-    # file created at the start.
-    sys.stdout = sys.__stdout__
-    temp_out.seek(0)
-    results = temp_out.read()
-    temp_out.close()
-    os.remove(code_filename)
-    # Parse the output from the tool into a dictionary of structured data.
-    style_feedback = {}
-    for result in results.split('\n'):
-        matcher = STYLE_REGEX.match(result)
-        if matcher:
-            line_no, col, msg = matcher.groups()
-            line_no = int(line_no) - 1
-            code, description = msg.split(' ', 1)
-            if code == 'E303':
-                description += _(' above this line')
-            if line_no not in style_feedback:
-                style_feedback[line_no] = []
-            style_feedback[line_no].append({
-                'line_no': line_no,
-                'column': int(col) - 1,
-                'message': description.capitalize(),
-                'code': code,
-            })
-    return style_feedback
-
-
-class MuFlakeCodeReporter:
-    """
-    The class instantiates a reporter that creates structured data about
-    code quality for Mu. Used by the PyFlakes module.
-    """
-
-    def __init__(self):
-        """
-        Set up the reporter object to be used to report PyFlake's results.
-        """
-        self.log = []
-
-    def unexpectedError(self, filename, message):
-        """
-        Called if an unexpected error occured while trying to process the file
-        called filename. The message parameter contains a description of the
-        problem.
-        """
-        self.log.append({
-            'line_no': 0,
-            'filename': filename,
-            'message': str(message)
-        })
-
-    def syntaxError(self, filename, message, line_no, column, source):
-        """
-        Records a syntax error in the file called filename.
-
-        The message argument contains an explanation of the syntax error,
-        line_no indicates the line where the syntax error occurred, column
-        indicates the column on which the error occurred and source is the
-        source code containing the syntax error.
-        """
-        msg = _('Syntax error. Python cannot understand this line. Check for '
-                'missing characters!')
-        self.log.append({
-            'message': msg,
-            'line_no': int(line_no) - 1,  # Zero based counting in Mu.
-            'column': column - 1,
-            'source': source
-        })
-
-    def flake(self, message):
-        """
-        PyFlakes found something wrong with the code.
-        """
-        matcher = FLAKE_REGEX.match(str(message))
-        if matcher:
-            line_no, msg = matcher.groups()
-            self.log.append({
-                'line_no': int(line_no) - 1,  # Zero based counting in Mu.
-                'column': 0,
-                'message': msg,
-            })
-        else:
-            self.log.append({
-                'line_no': 0,
-                'column': 0,
-                'message': str(message),
-            })
-
-
 class REPL:
     """
     Read, Evaluate, Print, Loop.
@@ -531,6 +229,10 @@ class REPL:
         logger.info('Created new REPL object with port: {}'.format(self.port))
 
 
+# Cache module names for filename shadow checking later.
+MODULE_NAMES = ModuleIndex(os.path.join(DATA_DIR, 'module_names.json'))
+
+
 class Editor:
     """
     Application logic for the editor itself.
@@ -543,7 +245,7 @@ class Editor:
         self.fs = None
         self.theme = 'day'
         self.mode = 'python'
-        self.modes = {}  # See set_modes.
+        self.modes = ModeRegistry(self, view)  # See setup.
         self.envars = []  # See restore session and show_admin
         self.minify = False
         self.microbit_runtime = ''
@@ -551,7 +253,60 @@ class Editor:
         self.find = ''
         self.replace = ''
         self.global_replace = False
+        self.find_options = {
+            'regex': False,
+            'case_sensitive': True,
+            'whole_word': False,
+            'all_files': False,
+        }
         self.selecting_mode = False  # Flag to stop auto-detection of modes.
+        self._file_reader = None  # Reads files when restoring the session.
+        self._restore_order = {}  # Session position of files being restored.
+        self._restore_ids = set()  # Identities of files being restored.
+        self._restored = []  # Session positions of files already restored.
+        self._restore_index = 0  # Tab index of the first restored file.
+        self._restore_focus = None  # The file to show first.
+        self._restore_held = []  # Files held back until it arrives.
+        self._restored_callbacks = []  # Called once they've all arrived.
+        self._file_writer = FileWriter()  # Saves files in the background.
+        self._persisted = {}  # Content hash and signature of files on disk.
+        self._external_changes = set()  # Files changed by other programs.
+        self._file_writer.saved.connect(self._on_file_saved)
+        self._file_writer.failed.connect(self._on_save_failed)
+        self._file_watcher = FileWatcher()  # Notices changes to open files.
+        self._file_watcher.file_changed.connect(self._on_file_changed)
+        self._code_checker = CodeChecker()  # Checks code in the background.
+        self._code_checker.checked.connect(self._on_code_checked)
+        self._code_checker.finished.connect(self._on_check_finished)
+        self._checking = None  # The tab whose code is being checked.
+        self._check_key = None  # The key of the code being checked.
+        self._check_feedback = {}  # The results of the check so far.
+        self._check_problems = False  # Whether the check found problems.
+        self._check_results = CheckResults(os.path.join(
+            DATA_DIR, 'check_results.json'))
+        self.check_as_you_type = False  # See restore session and show_admin
+        self._live_check = False  # Whether the check is as you type.
+        self._live_check_timer = QTimer()
+        self._live_check_timer.setSingleShot(True)
+        self._live_check_timer.setInterval(LIVE_CHECK_DELAY)
+        self._live_check_timer.timeout.connect(self.live_check)
+        view.code_changed.connect(self._on_code_changed)
+        self._file_searcher = FileSearcher()  # Searches all the files.
+        self._file_searcher.found.connect(self._on_found)
+        self._file_searcher.replaced.connect(self._on_replaced)
+        self._file_searcher.finished.connect(self._on_search_finished)
+        self._search_tabs = {}  # Path: tab and the text searched in it.
+        view.open_match.connect(self.show_match)
+        self._symbol_index = SymbolIndex(os.path.join(
+            DATA_DIR, 'symbols.json'))  # Symbols defined in the workspace.
+        self._symbol_index.changed.connect(self._on_symbols_changed)
+        self._outliner = Outliner()  # Outlines code in the background.
+        self._outliner.outlined.connect(self._on_outlined)
+        self._outline_timer = QTimer()
+        self._outline_timer.setSingleShot(True)
+        self._outline_timer.setInterval(OUTLINE_DELAY)
+        self._outline_timer.timeout.connect(self.update_outline)
+        view.tab_changed.connect(self._on_tab_changed)
         if not os.path.exists(DATA_DIR):
             logger.debug('Creating directory: {}'.format(DATA_DIR))
             os.makedirs(DATA_DIR)
@@ -600,6 +355,8 @@ class Editor:
         if not os.path.exists(music_path):
             logger.debug('Creating directory: {}'.format(music_path))
             os.makedirs(music_path)
+        # Find the names of modules users mustn't shadow when saving files.
+        MODULE_NAMES.refresh_in_background()
         # Start the timer to poll every second for an attached or removed
         # USB device.
         self._view.set_usb_checker(1, self.check_usb)
@@ -612,7 +369,8 @@ class Editor:
         ignored).
         """
         settings_path = get_session_path()
-        self.change_mode(self.mode)
+        with PROFILER.phase('change_mode ({})'.format(self.mode)):
+            self.change_mode(self.mode)
         with open(settings_path) as f:
             try:
                 old_session = json.load(f)
@@ -636,13 +394,14 @@ class Editor:
                     self.select_mode(None)
                 if 'paths' in old_session:
                     old_paths = self._abspath(old_session['paths'])
-                    launch_paths = self._abspath(paths) if paths else set()
-                    for old_path in old_paths:
-                        # if the os passed in a file, defer loading it now
-                        if old_path in launch_paths:
-                            continue
-                        self.direct_load(old_path)
-                    logger.info('Loaded files.')
+                    launch_paths = self._abspath(paths) if paths else []
+                    # If the os passed in a file, defer loading it now.
+                    old_paths = [p for p in old_paths
+                                 if p not in launch_paths]
+                    with PROFILER.phase('restore files'):
+                        self._restore_files(
+                            old_paths, old_session.get('current_path'),
+                            focus=not launch_paths)
                 if 'envars' in old_session:
                     self.envars = old_session['envars']
                     logger.info('User defined environment variables: '
@@ -651,6 +410,10 @@ class Editor:
                     self.minify = old_session['minify']
                     logger.info('Minify scripts on micro:bit? '
                                 '{}'.format(self.minify))
+                if 'check_as_you_type' in old_session:
+                    self.check_as_you_type = old_session['check_as_you_type']
+                    logger.info('Check code as you type? '
+                                '{}'.format(self.check_as_you_type))
                 if 'microbit_runtime' in old_session:
                     self.microbit_runtime = old_session['microbit_runtime']
                     if self.microbit_runtime:
@@ -664,17 +427,186 @@ class Editor:
         # handle os passed file last,
         # so it will not be focused over by another tab
         if paths and len(paths) > 0:
-            self.load_cli(paths)
-        if not self._view.tab_count:
-            py = _('# Write your code here :-)') + NEWLINE
-            tab = self._view.add_tab(None, py, self.modes[self.mode].api(),
-                                     NEWLINE)
-            tab.setCursorPosition(len(py.split(NEWLINE)), 0)
-            logger.info('Starting with blank file.')
-        self.change_mode(self.mode)
-        self._view.set_theme(self.theme)
+            with PROFILER.phase('load {}'.format(', '.join(paths))):
+                self.load_cli(paths)
+        if not (self._view.tab_count or self._restore_order):
+            self._add_blank_tab()
+        with PROFILER.phase('change_mode ({})'.format(self.mode)):
+            self.change_mode(self.mode)
+        with PROFILER.phase('set_theme ({})'.format(self.theme)):
+            self._view.set_theme(self.theme)
+        self.index_workspace()
         self.show_status_message(random.choice(MOTD), 10)
 
+    def _restore_files(self, paths, current_path=None, focus=True):
+        """
+        Reopen the files with the referenced absolute paths, from the
+        previous session, in that order.
+
+        Python files are read and decoded in the background and their tabs
+        appear as their content arrives. The file at current_path (or the last
+        file, if current_path isn't one of them) is shown before the others
+        and, if focus is True, becomes the current tab. Missing files and
+        files that are already open are ignored.
+        """
+        open_ids = set()
+        for widget in self._view.widgets:
+            if widget.path:
+                open_ids.add(file_identity(widget.path))
+        to_read = []
+        for old_path in paths:
+            file_id = file_identity(old_path)
+            if file_id is None:
+                logger.info('The file {} does not exist.'.format(old_path))
+            elif file_id in open_ids or file_id in self._restore_ids:
+                logger.info('Script already open: {}'.format(old_path))
+            elif old_path.lower().endswith('.py'):
+                self._restore_ids.add(file_id)
+                self._restore_order[old_path] = len(self._restore_order)
+                to_read.append(old_path)
+            else:
+                self.direct_load(old_path)
+        if not to_read:
+            return
+        self._restore_index = self._view.tab_count
+        if current_path not in to_read:
+            current_path = to_read[-1]
+        self._restore_focus = (current_path, focus)
+        self._file_reader = FileReader(self._on_file_restored)
+        self._file_reader.read(current_path)
+        for old_path in to_read:
+            if old_path != current_path:
+                self._file_reader.read(old_path)
+        logger.info('Restoring {} files.'.format(len(to_read)))
+
+    def _on_file_restored(self, path, result):
+        """
+        Handle the result of reading a file from the previous session (see
+        FileReader). Files that arrive before the file to be shown first are
+        held back until it arrives.
+        """
+        focus_path, focus = self._restore_focus
+        if path != focus_path and focus_path in self._restore_order:
+            self._restore_held.append((path, result))
+            return
+        with PROFILER.phase('restore {}'.format(path)):
+            self._add_restored_tab(path, result, focus and path == focus_path)
+        held, self._restore_held = self._restore_held, []
+        for held_path, held_result in held:
+            with PROFILER.phase('restore {}'.format(held_path)):
+                self._add_restored_tab(held_path, held_result, False)
+        if not self._restore_order:
+            logger.info('Loaded files.')
+            self._file_reader.pool.shutdown(wait=False)
+            self._file_reader = None
+            self._restore_ids = set()
+            self._restored = []
+            if not self._view.tab_count:
+                self._add_blank_tab()
+            callbacks, self._restored_callbacks = self._restored_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def when_restored(self, callback):
+        """
+        Call the callback once the files from the previous session have been
+        restored (see _restore_files), or straight away if they have been.
+        """
+        if self._restore_order:
+            self._restored_callbacks.append(callback)
+        else:
+            callback()
+
+    def _add_restored_tab(self, path, result, focus):
+        """
+        Add a tab for a file from the previous session at the same position,
+        relative to the other restored files, as it had in that session.
+        """
+        position = self._restore_order.pop(path)
+        if isinstance(result, Exception):
+            # Let the usual loading code report the problem to the user.
+            logger.warning('Could not restore {}: {}'.format(path, result))
+            self.direct_load(path)
+            return
+        text, newline = result
+        index = bisect.bisect(self._restored, position)
+        bisect.insort(self._restored, position)
+        self._view.add_tab(path, text, self.modes[self.mode].api(), newline,
+                           index=self._restore_index + index, focus=focus)
+        self._record_persisted(path, text)
+
+    def _record_persisted(self, path, text):
+        """
+        Remember the text of the file at the referenced path, as it is on
+        disk, and the file's signature (see file_signature).
+        """
+        self._persisted[path] = (content_hash(text), file_signature(path))
+        self._external_changes.discard(path)
+        self._file_watcher.watch(path)
+
+    def _on_file_changed(self, path):
+        """
+        Handle a change, by another program, to the file at the referenced
+        path.
+
+        If the tab for the file has no unsaved changes it's reloaded.
+        Otherwise the user is told, and the tab isn't autosaved (see
+        autosave) so neither version is lost.
+        """
+        tab = None
+        for widget in self._view.widgets:
+            if widget.path == path:
+                tab = widget
+        if tab is None:
+            # The tab has been closed.
+            self._file_watcher.unwatch(path)
+            return
+        signature = file_signature(path)
+        persisted = self._persisted.get(path)
+        if signature is None or path in self._file_writer.pending:
+            return  # Removed (for now), or about to be saved by Mu.
+        saved = [self._file_writer.written.get(path)]
+        if persisted:
+            saved.append(persisted[1])
+        if signature in saved:
+            return  # Saved by Mu.
+        try:
+            text, newline = read_and_decode(path)
+        except Exception as ex:
+            logger.warning('Could not read changed file {}: {}'.format(
+                path, ex))
+            return
+        if persisted and persisted[0] == content_hash(text):
+            self._record_persisted(path, text)  # Only touched.
+            return
+        name = os.path.basename(path)
+        if tab.isModified():
+            logger.info('{} changed by another program.'.format(path))
+            self._external_changes.add(path)
+            self.show_status_message(_('{} was changed by another program. '
+                                       'Save it to keep your '
+                                       'changes.').format(name))
+            return
+        logger.info('Reloading {}: changed by another program.'.format(path))
+        line, index = tab.getCursorPosition()
+        tab.setText(text)
+        tab.newline = newline
+        tab.setCursorPosition(min(line, tab.lines() - 1), index)
+        tab.setModified(False)
+        self._record_persisted(path, text)
+        self.show_status_message(_('Reloaded {}: it was changed by another '
+                                   'program.').format(name))
+
+    def _add_blank_tab(self):
+        """
+        Add a tab containing an unsaved, almost empty, Python script.
+        """
+        py = _('# Write your code here :-)') + NEWLINE
+        tab = self._view.add_tab(None, py, self.modes[self.mode].api(),
+                                 NEWLINE)
+        tab.setCursorPosition(len(py.split(NEWLINE)), 0)
+        logger.info('Starting with blank file.')
+
     def toggle_theme(self):
         """
         Switches between themes (night, day or high-contrast).
@@ -717,6 +649,9 @@ class Editor:
             logger.info('The file {} does not exist.'.format(path))
             return
         # see if file is open first
+        if file_identity(path) in self._restore_ids:
+            logger.info('Script is being restored from the last session.')
+            return
         for widget in self._view.widgets:
             if widget.path is None:  # this widget is an unsaved buffer
                 continue
@@ -740,12 +675,15 @@ class Editor:
                     return
                 name = path
             else:
-                # Delegate the open operation to the Mu modes. Leave the name
-                # as None, thus forcing the user to work out what to name the
-                # recovered script.
-                for mode_name, mode in self.modes.items():
+                # Delegate the open operation to the Mu modes that handle
+                # this type of file. Leave the name as None, thus forcing the
+                # user to work out what to name the recovered script.
+                extension = os.path.splitext(path)[1][1:].lower()
+                for mode_name, spec in self.modes.specs.items():
+                    if extension not in spec.file_extensions:
+                        continue
                     try:
-                        text = mode.open_file(path)
+                        text = self.modes[mode_name].open_file(path)
                     except Exception as exc:
                         # No worries, log it and try the next mode
                         logger.warning('Error when mode {} try to open the '
@@ -779,9 +717,11 @@ class Editor:
                 if self._view.show_confirmation(
                         message, info, icon='Question') == QMessageBox.Ok:
                     self.change_mode(file_mode)
-            logger.debug(text)
+            logger.debug(Payload(text))
             self._view.add_tab(
                 name, text, self.modes[self.mode].api(), newline)
+            if name:
+                self._record_persisted(name, text)
 
     def load(self):
         """
@@ -790,9 +730,8 @@ class Editor:
         """
         # Get all supported extensions from the different modes
         extensions = ['py']
-        for mode_name, mode in self.modes.items():
-            if mode.file_extensions:
-                extensions += mode.file_extensions
+        for spec in self.modes.specs.values():
+            extensions += spec.file_extensions
         extensions = set([e.lower() for e in extensions])
         extensions = '*.{} *.{}'.format(' *.'.join(extensions),
                                         ' *.'.join(extensions).upper())
@@ -823,45 +762,88 @@ class Editor:
     def _abspath(self, paths):
         """
         Safely convert an arrary of paths to their absolute forms and remove
-        duplicate items.
+        duplicate items (keeping the order of the paths).
         """
-        result = set()
+        result = []
         for p in paths:
             try:
-                result.add(os.path.abspath(p))
+                abspath = os.path.abspath(p)
             except Exception as ex:
                 logger.error('Could not get path for {}: {}'.format(p, ex))
-        return result
+            else:
+                result.append(abspath)
+        return list(OrderedDict.fromkeys(result))
 
-    def save_tab_to_file(self, tab):
+    def save_tab_to_file(self, tab, autosave=False):
         """
-        Given a tab, will attempt to save the script in the tab to the path
-        associated with the tab. If there's a problem this will be logged and
-        reported and the tab status will continue to show as Modified.
+        Given a tab, will queue the script in the tab to be saved to the path
+        associated with the tab, in the background. Once saved, the tab is
+        marked as unmodified (see _on_file_saved). If there's a problem this
+        will be logged and reported and the tab status will continue to show
+        as Modified (see _on_save_failed).
+
+        If autosave is True, the file isn't saved if another program has
+        changed it since Mu loaded it.
         """
         logger.info('Saving script to: {}'.format(tab.path))
-        logger.debug(tab.text())
-        try:
-            save_and_encode(tab.text(), tab.path, tab.newline)
-        except OSError as e:
-            logger.error(e)
-            error_message = _('Could not save file (disk problem)')
-            information = _("Error saving file to disk. Ensure you have "
-                            "permission to write the file and "
-                            "sufficient disk space.")
-        except UnicodeEncodeError:
+        logger.debug(Payload(tab.text()))
+        expected = None
+        if autosave and tab.path in self._persisted:
+            expected = self._persisted[tab.path][1]
+        self._file_writer.save(tab.path, tab.text(), tab.newline, expected)
+
+    def save_tab_now(self, tab):
+        """
+        Save the script in the tab to its file and wait until it's written,
+        e.g. so it can be run. As with save_tab_to_file the save goes through
+        the file writer, so Mu's own save isn't mistaken for a change made by
+        another program. Return True if the file was saved.
+        """
+        self.save_tab_to_file(tab)
+        self._file_writer.wait()
+        return not tab.isModified()
+
+    def _on_file_saved(self, path, text):
+        """
+        Mark the tab for the referenced path as unmodified, unless it has
+        been changed since the text was queued to be saved.
+        """
+        for tab in self._view.widgets:
+            if tab.path == path and tab.text() == text:
+                tab.setModified(False)
+        self._record_persisted(path, text)
+        if path.lower().endswith('.py'):
+            self._symbol_index.update([path])
+        self.show_status_message(_("Saved file: {}").format(path))
+
+    def _on_save_failed(self, path, error):
+        """
+        Log and report a problem saving the file at the referenced path.
+
+        Files changed by another program are no longer autosaved (until they
+        are saved by the user or reloaded), so the change isn't lost.
+        """
+        if isinstance(error, FileChangedError):
+            logger.warning('Not autosaving {}: changed by another '
+                           'program.'.format(path))
+            self._external_changes.add(path)
+            self.show_status_message(_('Not saving {}: it was changed by '
+                                       'another program.').format(
+                                           os.path.basename(path)))
+            return
+        if isinstance(error, UnicodeEncodeError):
             error_message = _("Could not save file (encoding problem)")
-            logger.exception(error_message)
+            logger.error(error_message, exc_info=error)
             information = _("Unable to convert all the characters. If you "
                             "have an encoding line at the top of the file, "
                             "remove it and try again.")
         else:
-            error_message = information = None
-        if error_message:
-            self._view.show_message(error_message, information)
-        else:
-            tab.setModified(False)
-            self.show_status_message(_("Saved file: {}").format(tab.path))
+            logger.error(error)
+            error_message = _('Could not save file (disk problem)')
+            information = _("Error saving file to disk. Ensure you have "
+                            "permission to write the file and "
+                            "sufficient disk space.")
+        self._view.show_message(error_message, information)
 
     def check_for_shadow_module(self, path):
         """
@@ -942,41 +924,176 @@ class Editor:
         """
         Uses PyFlakes and PyCodeStyle to gather information about potential
         problems with the code in the current tab.
+
+        The code is checked in the background (see CodeChecker) and the tab
+        annotated as the results arrive. Changing the code before the check
+        is finished cancels it. If the code hasn't changed since it was last
+        checked, the results of that check are used instead.
         """
         tab = self._view.current_tab
         if tab is None:
             # There is no active text editor so abort.
             return
+        if self._checking is tab:
+            # Toggling the check off while it's happening.
+            self._stop_checking()
+        else:
+            self._cancel_check()
         tab.has_annotations = not tab.has_annotations
         if tab.has_annotations:
             logger.info('Checking code.')
             self._view.reset_annotations()
             filename = tab.path if tab.path else _('untitled')
             builtins = self.modes[self.mode].builtins
-            flake = check_flake(filename, tab.text(), builtins)
-            if flake:
-                logger.info(flake)
-                self._view.annotate_code(flake, 'error')
-            pep8 = check_pycodestyle(tab.text())
-            if pep8:
-                logger.info(pep8)
-                self._view.annotate_code(pep8, 'style')
-            self._view.show_annotations()
-            tab.has_annotations = bool(flake or pep8)
-            if not tab.has_annotations:
-                # No problems detected, so confirm this with a friendly
-                # message.
-                ok_messages = [
-                    _('Good job! No problems found.'),
-                    _('Hurrah! Checker turned up no problems.'),
-                    _('Nice one! Zero problems detected.'),
-                    _('Well done! No problems here.'),
-                    _('Awesome! Zero problems found.'),
-                ]
-                self.show_status_message(random.choice(ok_messages))
+            text = tab.text()
+            key = checker.check_key(text, builtins)
+            self._checking = tab
+            self._live_check = False
+            self._check_key = key
+            self._check_feedback = {}
+            self._check_problems = False
+            results = self._cached_check_results(tab, key)
+            if results is not None:
+                logger.info('Code unchanged since it was last checked.')
+                for annotation_type in CodeChecker.parts:
+                    self._on_code_checked(annotation_type,
+                                          results[annotation_type])
+                self._on_check_finished()
+            else:
+                tab.textChanged.connect(self._cancel_check)
+                self._code_checker.check(filename, text, builtins)
         else:
             self._view.reset_annotations()
 
+    def _cached_check_results(self, tab, key):
+        """
+        Return the results of a previous check of the code in the tab, or
+        None if the code (as identified by the key) hasn't been checked.
+        """
+        if tab.check_results and tab.check_results[0] == key:
+            return tab.check_results[1]
+        if tab.path:
+            return self._check_results.get(tab.path, key)
+        return None
+
+    def _stop_checking(self):
+        """
+        Stop checking the code in a tab, if it's being checked. Returns the
+        tab.
+        """
+        tab, self._checking = self._checking, None
+        self._live_check = False
+        self._code_checker.cancel()
+        if tab is not None:
+            try:
+                tab.textChanged.disconnect(self._cancel_check)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected, or the tab has been closed.
+        return tab
+
+    def _cancel_check(self):
+        """
+        The code being checked has changed (or its tab was closed), so the
+        rest of the check is pointless.
+        """
+        tab = self._stop_checking()
+        if tab is not None:
+            tab.has_annotations = self._check_problems
+
+    def _on_code_checked(self, annotation_type, feedback):
+        """
+        Annotate the tab being checked with the feedback from (part of) the
+        check.
+        """
+        tab = self._checking
+        if tab not in self._view.widgets:
+            # The tab was closed.
+            self._cancel_check()
+            return
+        self._check_feedback[annotation_type] = feedback
+        if self._live_check:
+            # The tab is updated all at once when the check is finished.
+            self._check_problems = self._check_problems or bool(feedback)
+            return
+        if feedback:
+            logger.info(feedback)
+            self._check_problems = True
+            # The user may have switched to another tab since the check
+            # started, so annotate the checked tab directly.
+            tab.annotate_code(feedback, annotation_type)
+            tab.show_annotations()
+
+    def _on_check_finished(self):
+        """
+        The check is complete, so confirm with a friendly message if no
+        problems were found. When checking as you type, the tab's
+        annotations are updated instead.
+        """
+        live = self._live_check
+        tab = self._stop_checking()
+        if tab is None:
+            return
+        if live:
+            tab.update_annotations(self._check_feedback)
+            tab.has_annotations = self._check_problems
+            return
+        tab.check_results = (self._check_key, self._check_feedback)
+        if tab.path:
+            self._check_results.put(tab.path, self._check_key,
+                                    self._check_feedback)
+        tab.has_annotations = self._check_problems
+        if not self._check_problems:
+            # No problems detected, so confirm this with a friendly
+            # message.
+            ok_messages = [
+                _('Good job! No problems found.'),
+                _('Hurrah! Checker turned up no problems.'),
+                _('Nice one! Zero problems detected.'),
+                _('Well done! No problems here.'),
+                _('Awesome! Zero problems found.'),
+            ]
+            self.show_status_message(random.choice(ok_messages))
+
+    def _on_code_changed(self, tab):
+        """
+        The code in the tab has changed, so if checking as you type, check it
+        once it stops changing. The same goes for outlining it, if the
+        outline pane is shown.
+        """
+        if tab is not self._view.current_tab:
+            return
+        if self._view.outline:
+            self._outline_timer.start()
+        if not self.check_as_you_type:
+            return
+        if self._live_check and self._checking is tab:
+            # The code being checked is out of date.
+            self._stop_checking()
+        self._live_check_timer.start()
+
+    def live_check(self):
+        """
+        Check the code in the current tab as it's being typed, updating the
+        annotations of only the lines where the feedback changes.
+
+        Only the top-level statements changed since the tab was last checked
+        as you type are checked again (see mu.checker.IncrementalCheck).
+        Large files aren't checked as you type.
+        """
+        tab = self._view.current_tab
+        if tab is None or tab.large:
+            return
+        self._cancel_check()
+        filename = tab.path if tab.path else _('untitled')
+        builtins = self.modes[self.mode].builtins
+        self._checking = tab
+        self._live_check = True
+        self._check_key = None
+        self._check_feedback = {}
+        self._check_problems = False
+        self._code_checker.check(filename, tab.text(), builtins,
+                                 document=id(tab))
+
     def show_help(self):
         """
         Display browser based help about Mu.
@@ -1010,6 +1127,11 @@ class Editor:
         for widget in self._view.widgets:
             if widget.path:
                 paths.append(os.path.abspath(widget.path))
+        # Remember files from the last session that haven't arrived yet.
+        paths.extend(p for p in self._restore_order if p not in paths)
+        current_path = None
+        if self._view.current_tab and self._view.current_tab.path:
+            current_path = os.path.abspath(self._view.current_tab.path)
         if self.modes[self.mode].is_debugger:
             # If quitting while debugging, make sure everything is cleaned
             # up.
@@ -1018,15 +1140,22 @@ class Editor:
             'theme': self.theme,
             'mode': self.mode,
             'paths': paths,
+            'current_path': current_path,
             'envars': self.envars,
             'minify': self.minify,
             'microbit_runtime': self.microbit_runtime,
+            'check_as_you_type': self.check_as_you_type,
         }
         session_path = get_session_path()
         with open(session_path, 'w') as out:
             logger.debug('Session: {}'.format(session))
             logger.debug('Saving session to: {}'.format(session_path))
             json.dump(session, out, indent=2)
+        # Make sure files queued to be saved are written.
+        self._file_writer.wait()
+        self._code_checker.stop()
+        self._check_results.save()
+        self._symbol_index.save()
         logger.info('Quitting.\n\n')
         sys.exit(0)
 
@@ -1043,21 +1172,22 @@ class Editor:
             'envars': envars,
             'minify': self.minify,
             'microbit_runtime': self.microbit_runtime,
+            'check_as_you_type': self.check_as_you_type,
         }
-        with open(LOG_FILE, 'r', encoding='utf8') as logfile:
-            new_settings = self._view.show_admin(logfile.read(), settings)
-            self.envars = extract_envars(new_settings['envars'])
-            self.minify = new_settings['minify']
-            runtime = new_settings['microbit_runtime'].strip()
-            if runtime and not os.path.isfile(runtime):
-                self.microbit_runtime = ''
-                message = _('Could not find MicroPython runtime.')
-                information = _("The micro:bit runtime you specified ('{}') "
-                                "does not exist. "
-                                "Please try again.").format(runtime)
-                self._view.show_message(message, information)
-            else:
-                self.microbit_runtime = runtime
+        new_settings = self._view.show_admin(LOG_FILE, settings)
+        self.envars = extract_envars(new_settings['envars'])
+        self.minify = new_settings['minify']
+        self.check_as_you_type = new_settings['check_as_you_type']
+        runtime = new_settings['microbit_runtime'].strip()
+        if runtime and not os.path.isfile(runtime):
+            self.microbit_runtime = ''
+            message = _('Could not find MicroPython runtime.')
+            information = _("The micro:bit runtime you specified ('{}') "
+                            "does not exist. "
+                            "Please try again.").format(runtime)
+            self._view.show_message(message, information)
+        else:
+            self.microbit_runtime = runtime
 
     def select_mode(self, event=None):
         """
@@ -1068,11 +1198,12 @@ class Editor:
         logger.info('Showing available modes: {}'.format(
             list(self.modes.keys())))
         self.selecting_mode = True  # Flag to stop auto-detection of modes.
-        new_mode = self._view.select_mode(self.modes, self.mode)
+        new_mode = self._view.select_mode(self.modes.specs, self.mode)
         self.selecting_mode = False
         if new_mode and new_mode != self.mode:
             logger.info('New mode selected: {}'.format(new_mode))
             self.change_mode(new_mode)
+            self.index_workspace()
 
     def change_mode(self, mode):
         """
@@ -1128,14 +1259,27 @@ class Editor:
     def autosave(self):
         """
         Cycles through each tab and, if changed, saves it to the filesystem.
+
+        Tabs whose content is the same as the file on disk (e.g. after an
+        undo) aren't written, and neither are files changed by another
+        program since Mu loaded them.
         """
         if self._view.modified:
             # Something has changed, so save it!
             for tab in self._view.widgets:
-                if tab.path and tab.isModified():
-                    self.save_tab_to_file(tab)
-                    logger.info('Autosave detected and saved '
-                                'changes in {}.'.format(tab.path))
+                if not (tab.path and tab.isModified()):
+                    continue
+                if tab.path in self._external_changes:
+                    continue
+                persisted = self._persisted.get(tab.path)
+                if persisted and persisted[0] == content_hash(tab.text()):
+                    tab.setModified(False)
+                    logger.info('Autosave skipped unchanged '
+                                '{}.'.format(tab.path))
+                    continue
+                self.save_tab_to_file(tab, autosave=True)
+                logger.info('Autosave detected and saved '
+                            'changes in {}.'.format(tab.path))
 
     def check_usb(self):
         """
@@ -1147,10 +1291,10 @@ class Editor:
         devices = []
         device_types = set()
         # Detect connected devices.
-        for name, mode in self.modes.items():
-            if hasattr(mode, 'find_device'):
-                # The mode can detect an attached device.
-                port, serial = mode.find_device(with_logging=False)
+        for name, spec in self.modes.specs.items():
+            if spec.detects_device:
+                # The spec knows the mode's boards, so the mode isn't loaded.
+                port, serial = spec.find_device()
                 if port:
                     devices.append((name, port))
                     device_types.add(name)
@@ -1166,7 +1310,7 @@ class Editor:
             if device not in self.connected_devices:
                 self.connected_devices.add(device)
                 mode_name = device[0]
-                device_name = self.modes[mode_name].name
+                device_name = self.modes.specs[mode_name].name
                 msg = _('Detected new {} device.').format(device_name)
                 self.show_status_message(msg)
                 # Only ask to switch mode if a single device type is connected
@@ -1266,16 +1410,41 @@ class Editor:
         Otherwise, check there's something to find, warn if there isn't.
 
         If there is, find (and, optionally, replace) then confirm outcome with
-        a status message.
+        a status message. If the user asked to search all the files, they're
+        searched in the background instead (see find_in_files).
         """
         result = self._view.show_find_replace(self.find, self.replace,
-                                              self.global_replace)
+                                              self.global_replace,
+                                              self.find_options)
         if result:
-            self.find, self.replace, self.global_replace = result
+            (self.find, self.replace, self.global_replace,
+             self.find_options) = result
             if self.find:
-                if self.replace:
+                try:
+                    pattern = self._find_pattern()
+                except re.error as ex:
+                    message = _('Could not search for "{}".').format(
+                        self.find)
+                    information = _('It is not a valid regular expression: '
+                                    '{}').format(ex)
+                    self._view.show_message(message, information)
+                    return
+                if self.replace and self.find_options['regex']:
+                    try:
+                        search.check_replacement(pattern, self.replace)
+                    except re.error as ex:
+                        message = _('Could not replace with "{}".').format(
+                            self.replace)
+                        information = _('It is not a valid replacement: '
+                                        '{}').format(ex)
+                        self._view.show_message(message, information)
+                        return
+                if self.find_options['all_files']:
+                    self.find_in_files()
+                elif self.replace:
                     replaced = self._view.replace_text(self.find, self.replace,
-                                                       self.global_replace)
+                                                       self.global_replace,
+                                                       self.find_options)
                     if replaced == 1:
                         msg = _('Replaced "{}" with "{}".')
                         self.show_status_message(msg.format(self.find,
@@ -1289,7 +1458,8 @@ class Editor:
                         msg = _('Could not find "{}".')
                         self.show_status_message(msg.format(self.find))
                 else:
-                    matched = self._view.highlight_text(self.find)
+                    matched = self._view.highlight_text(self.find,
+                                                        self.find_options)
                     if matched:
                         msg = _('Highlighting matches for "{}".')
                     else:
@@ -1301,6 +1471,186 @@ class Editor:
                                 "in the find box.")
                 self._view.show_message(message, information)
 
+    def _find_pattern(self):
+        """
+        Return the compiled pattern for the find term, with the find options.
+        """
+        return search.compile_pattern(self.find,
+                                      self.find_options['regex'],
+                                      self.find_options['case_sensitive'],
+                                      self.find_options['whole_word'])
+
+    def find_in_files(self):
+        """
+        Find the matches for the find term in the open tabs and the Python
+        scripts in the current mode's workspace directory, in the background
+        (see FileSearcher). The matches are listed in the search results
+        pane as they're found.
+
+        If there's a replacement, all the matches are replaced. Each open tab
+        is changed with a single edit (so it can be undone), and the other
+        files are saved.
+        """
+        pattern = self._find_pattern()
+        replacement = None
+        if self.replace:
+            replacement = search.replacer(self.replace,
+                                          self.find_options['regex'])
+        self._search_tabs = {}
+        for tab in self._view.widgets:
+            if tab.path:
+                path = os.path.abspath(tab.path)
+                self._search_tabs[path] = (tab, tab.text())
+        buffers = {path: text for path, (tab, text)
+                   in self._search_tabs.items()}
+        directory = self.modes[self.mode].workspace_dir()
+        paths = []
+        for name in workspace_index(directory).files():
+            path = os.path.join(os.path.abspath(directory), name)
+            if name.lower().endswith('.py') and path not in buffers:
+                paths.append(path)
+        self._view.add_search_results()
+        self._file_searcher.search(pattern, buffers, paths, replacement)
+
+    def _on_found(self, path, matches):
+        """
+        List the matches found in the file at the referenced path. If
+        they're in an open tab and are to be replaced, replace them (unless
+        the tab has changed since it was searched).
+        """
+        self._view.add_search_matches(path, matches)
+        if path not in self._search_tabs or 'replacement' not in matches[0]:
+            return
+        tab, text = self._search_tabs[path]
+        if tab in self._view.widgets and tab.text() == text:
+            tab.replace_matches(matches)
+        else:
+            logger.warning('Not replacing in {}: it has changed.'.format(
+                path))
+
+    def _on_replaced(self, path, text, newline, signature):
+        """
+        Save the text of a file that's had its matches replaced, unless it's
+        since been changed by another program.
+        """
+        self._file_writer.save(path, text, newline, signature)
+
+    def _on_search_finished(self, total, files):
+        """
+        Report how many matches were found (or replaced) in how many files.
+        """
+        if not total:
+            msg = _('Could not find "{}".').format(self.find)
+        elif self.replace:
+            msg = _('Replaced {} matches of "{}" with "{}" in {} files.')
+            msg = msg.format(total, self.find, self.replace, files)
+        else:
+            msg = _('Found {} matches of "{}" in {} files.')
+            msg = msg.format(total, self.find, files)
+        self.show_status_message(msg)
+        self._search_tabs = {}
+
+    def show_match(self, path, line, column, end_line, end_column):
+        """
+        Show the referenced match (from the search results), opening the
+        file it's in if need be.
+        """
+        tab = self.get_tab(path)
+        if tab:
+            tab.setSelection(line, column, end_line, end_column)
+            tab.ensureLineVisible(line)
+
+    def index_workspace(self):
+        """
+        Index the symbols defined in the Python scripts in the current mode's
+        workspace directory and open tabs, in the background (see
+        SymbolIndex). Those of other scripts (e.g. in the workspace of the
+        previous mode) are forgotten.
+        """
+        directory = os.path.abspath(self.modes[self.mode].workspace_dir())
+        paths = [os.path.join(directory, name)
+                 for name in workspace_index(directory).files()
+                 if name.lower().endswith('.py')]
+        paths += [tab.path for tab in self._view.widgets
+                  if tab.path and tab.path.lower().endswith('.py')]
+        self._symbol_index.update(paths, forget_others=True)
+
+    def _on_symbols_changed(self):
+        """
+        Offer the symbols defined in the workspace for autocomplete and call
+        tips in every tab.
+        """
+        self._view.set_symbols(self._symbol_index.api())
+
+    def go_to_definition(self):
+        """
+        Show the definition of the module, class or function named at the
+        cursor in the current tab, opening the file it's in if need be.
+        Definitions in the current tab's file are preferred.
+        """
+        tab = self._view.current_tab
+        if not tab:
+            return
+        line, index = tab.getCursorPosition()
+        name = tab.wordAtLineIndex(line, index)
+        if not name:
+            return
+        definitions = self._symbol_index.definitions(name)
+        if not definitions:
+            msg = _('Could not find the definition of "{}".')
+            self.show_status_message(msg.format(name))
+            return
+        current_path = os.path.abspath(tab.path) if tab.path else None
+        path, symbol = definitions[0]
+        for definition in definitions:
+            if definition[0] == current_path:
+                path, symbol = definition
+                break
+        line, column = symbol['line'], symbol['column']
+        end_column = column
+        if symbol['kind'] != 'module':
+            end_column += len(name)  # Select the name.
+        self.show_match(path, line, column, line, end_column)
+
+    def toggle_outline(self):
+        """
+        Show or hide the pane outlining the code in the current tab.
+        """
+        if self._view.outline:
+            self._outline_timer.stop()
+            self._view.remove_outline()
+        else:
+            self._view.add_outline()
+            self.update_outline()
+
+    def update_outline(self):
+        """
+        Outline the code in the current tab in the background (see
+        Outliner), if the outline pane is shown.
+        """
+        if not self._view.outline:
+            return
+        tab = self._view.current_tab
+        if tab is None:
+            self._view.set_outline([])
+        else:
+            self._outliner.outline(id(tab), tab.text())
+
+    def _on_outlined(self, document, items):
+        """
+        Show the outline, if it's of the code in the current tab.
+        """
+        tab = self._view.current_tab
+        if tab is not None and id(tab) == document:
+            self._view.set_outline(items)
+
+    def _on_tab_changed(self, tab):
+        """
+        Outline the code in the newly current tab.
+        """
+        self._outline_timer.stop()
+        self.update_outline()
+
     def toggle_comments(self):
         """
         Ensure all highlighted lines are toggled between comments/uncommented.
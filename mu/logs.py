@@ -0,0 +1,311 @@
+"""
+Helpers to keep Mu's logging cheap for the code doing the logging.
+
+* Records are written to the log file by a background thread (see
+  queue_handler), so slow disks don't hold up the GUI.
+* Large payloads, such as the content of a script, are truncated (see
+  Payload).
+* Noisy call sites are rate limited (see RateLimitFilter).
+* The level of each part of Mu can be set in the settings file (see
+  configure_levels).
+* Large log files can be shown a piece at a time (see LogFile).
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import re
+import json
+import mmap
+import time
+import queue
+import atexit
+import logging
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The maximum number of characters of a payload that are logged.
+PAYLOAD_LIMIT = 1000
+#: The key in settings.json for the levels of parts of Mu.
+LEVELS_SETTING = 'log_levels'
+#: The number of bytes of the log read at a time by LogFile.
+CHUNK_SIZE = 64 * 1024
+#: The maximum number of matching records returned by LogFile.search.
+SEARCH_LIMIT = 5000
+#: Matches the start of a record written with Mu's log format, capturing the
+#: level. Other lines (e.g. tracebacks) belong to the record above them.
+RECORD_START = re.compile(rb'\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d+ - .*? '
+                          rb'(DEBUG|INFO|WARNING|ERROR|CRITICAL): ')
+#: The numeric values of the levels captured by RECORD_START.
+LEVELS = {name.encode('ascii'): logging.getLevelName(name)
+          for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+
+class Payload:
+    """
+    Wraps a (possibly large) value to be logged, so that only the start of it
+    is written to the log. The value is only converted to a string if the
+    record is actually logged.
+
+    For example: logger.debug(Payload(tab.text()))
+    """
+
+    def __init__(self, value, limit=PAYLOAD_LIMIT):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        text = str(self.value)
+        if len(text) <= self.limit:
+            return text
+        return '{}... [{} more characters]'.format(text[:self.limit],
+                                                   len(text) - self.limit)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Stops any one line of code from logging more than rate records below the
+    WARNING level within per seconds. The number of records dropped is
+    noted on the next record logged from that line.
+    """
+
+    def __init__(self, rate=20, per=10.0):
+        super().__init__()
+        self.rate = rate
+        self.per = per
+        self.windows = {}  # (pathname, lineno) -> [start, count, dropped]
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        window = self.windows.get(key)
+        if window is None or now - window[0] >= self.per:
+            dropped = window[2] if window else 0
+            self.windows[key] = [now, 1, 0]
+            if dropped:
+                record.msg = '{} [{} similar messages dropped]'.format(
+                    record.getMessage(), dropped)
+                record.args = None
+            return True
+        if window[1] < self.rate:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+def queue_handler(*handlers):
+    """
+    Return a handler that passes records, via a queue, to a background
+    thread which hands them to the referenced handlers. Records waiting in
+    the queue are written when Python exits.
+    """
+    log_queue = queue.Queue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    handler = QueueHandler(log_queue)
+    handler.addFilter(RateLimitFilter())
+    return handler
+
+
+def configure_levels(levels):
+    """
+    Set the levels of the loggers for parts of Mu from a dictionary (found in
+    settings.json) such as:
+
+        {"mu.debugger": "INFO", "mu.modes.microbit": "WARNING"}
+    """
+    if not isinstance(levels, dict):
+        logger.error('Log levels should be a dictionary: {}'.format(levels))
+        return
+    for name, level in levels.items():
+        try:
+            logging.getLogger(name).setLevel(str(level).upper())
+        except ValueError:
+            logger.error('Unknown log level for {}: {}'.format(name, level))
+
+
+def load_levels(settings_path):
+    """
+    Return the levels for parts of Mu (see configure_levels) found in the
+    referenced settings file, or an empty dictionary if there are none.
+    """
+    try:
+        with open(settings_path) as f:
+            settings = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(settings, dict):
+        return {}
+    return settings.get(LEVELS_SETTING, {})
+
+
+class LogFile:
+    """
+    Reads pieces of a (possibly very large) log file via a memory map, so the
+    whole file is never read into memory.
+
+    The tail of the file is read first. Earlier chunks are read on demand
+    (see earlier) and lines added since the file was last read are picked up
+    with newer. The start and end attributes are the offsets (in bytes) of
+    the part of the file read so far.
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.start = 0
+        self.end = 0
+
+    def size(self):
+        """
+        Return the current size of the file, or zero if it doesn't exist.
+        """
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def _read(self, start, end):
+        """
+        Return the bytes between the referenced offsets.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                end = min(end, os.fstat(f.fileno()).st_size)
+                if end <= start:
+                    return b''  # Empty files can't be mapped.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[start:end]
+        except (OSError, ValueError) as ex:
+            logger.error('Could not read log {}: {}'.format(self.path, ex))
+            return b''
+
+    @staticmethod
+    def _decode(data):
+        return data.decode('utf-8', errors='replace')
+
+    def _chunk_before(self, end):
+        """
+        Return the offset of the start of the first complete line in the
+        chunk before the referenced offset, along with the chunk's bytes.
+        """
+        start = max(0, end - self.chunk_size)
+        data = self._read(start, end)
+        if start:
+            # A newline ending the chunk doesn't start a line in it.
+            newline = data.find(b'\n', 0, len(data) - 1)
+            # A line longer than a chunk is shown in pieces.
+            if newline != -1:
+                data = data[newline + 1:]
+                start += newline + 1
+        return start, data
+
+    def tail(self):
+        """
+        Return the complete lines in the last chunk of the file.
+        """
+        start, data = self._chunk_before(self.size())
+        # The last line may still be being written.
+        data = data[:data.rfind(b'\n') + 1]
+        self.start = start
+        self.end = start + len(data)
+        return self._decode(data)
+
+    def earlier(self):
+        """
+        Return the chunk before the start of the part of the file read so
+        far, or an empty string if the start of the file has been read.
+        """
+        if self.start <= 0:
+            return ''
+        self.start, data = self._chunk_before(self.start)
+        return self._decode(data)
+
+    def newer(self):
+        """
+        Return the complete lines added to the file since it was last read.
+
+        Returns None if the file is now smaller than the part already read
+        (it has been rotated), in which case the tail should be read again.
+        """
+        size = self.size()
+        if size < self.end:
+            return None
+        data = self._read(self.end, size)
+        data = data[:data.rfind(b'\n') + 1]
+        self.end += len(data)
+        return self._decode(data)
+
+    def search(self, text='', level=None, limit=SEARCH_LIMIT,
+               cancelled=None):
+        """
+        Return the last limit records in the whole file which contain the
+        referenced text (ignoring case) and are logged at or above the
+        referenced level (e.g. 'WARNING').
+
+        The file is read a line at a time from the memory map, so only the
+        matching records are held in memory (and decoded). If cancelled is
+        given, it's called at the start of each record and the search stops
+        (returning None) if it returns True.
+        """
+        text = text.lower()
+        # Bytes only change case for ASCII, so other text is matched after
+        # decoding.
+        try:
+            needle = text.encode('ascii')
+        except UnicodeEncodeError:
+            needle = None
+        minimum = logging.getLevelName(level) if level else logging.NOTSET
+        matches = deque(maxlen=limit)
+        record = []
+        wanted = not level  # Lines before the first record.
+
+        def finish():
+            if not (record and wanted):
+                return
+            data = b''.join(record)
+            if needle is not None:
+                found = needle in data.lower()
+            else:
+                found = text in self._decode(data).lower()
+            if found:
+                matches.append(data)
+
+        try:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ''
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line in iter(mm.readline, b''):
+                        start = RECORD_START.match(line)
+                        if start:
+                            if cancelled and cancelled():
+                                return None
+                            finish()
+                            record = []
+                            wanted = LEVELS[start.group(1)] >= minimum
+                        record.append(line)
+        except (OSError, ValueError) as ex:
+            logger.error('Could not search log {}: {}'.format(self.path, ex))
+        finish()
+        return self._decode(b''.join(matches))
@@ -1,8 +1,3 @@
-from .python3 import PythonMode
-from .adafruit import AdafruitMode
-from .microbit import MicrobitMode
-from .debugger import DebugMode
-from .pygamezero import PyGameZeroMode
+from .registry import ModeSpec, ModeRegistry, BUILTIN_MODES
 
-__all__ = ['PythonMode', 'AdafruitMode', 'MicrobitMode', 'DebugMode',
-           'PyGameZeroMode', ]
+__all__ = ['ModeSpec', 'ModeRegistry', 'BUILTIN_MODES', ]
@@ -20,7 +20,8 @@ import os
 import ctypes
 from subprocess import check_output
 from mu.modes.base import MicroPythonMode
-from mu.modes.api import ADAFRUIT_APIS, SHARED_APIS
+from mu.modes.devices import ADAFRUIT_BOARDS
+from mu.modes.api import get_api
 from mu.interface.panes import CHARTS
 
 
@@ -35,24 +36,7 @@ class AdafruitMode(MicroPythonMode):
     save_timeout = 0  #: Don't autosave on Adafruit boards. Casues a restart.
     connected = True  #: is the Adafruit board connected.
     force_interrupt = False  #: NO keyboard interrupt on serial connection.
-    valid_boards = [
-        (0x239A, 0x8015),  # Adafruit Feather M0 CircuitPython
-        (0x239A, 0x8023),  # Adafruit Feather M0 Express CircuitPython
-        (0x239A, 0x801B),  # Adafruit Feather M0 Express CircuitPython
-        (0x239A, 0x8014),  # Adafruit Metro M0 CircuitPython
-        (0x239A, 0x8019),  # Adafruit CircuitPlayground Express CircuitPython
-        (0x239A, 0x801D),  # Adafruit Gemma M0
-        (0x239A, 0x801F),  # Adafruit Trinket M0
-        (0x239A, 0x8012),  # Adafruit ItsyBitsy M0
-        (0x239A, 0x8021),  # Adafruit Metro M4
-        (0x239A, 0x8025),  # Adafruit Feather RadioFruit
-        (0x239A, 0x8026),  # Adafruit Feather M4
-        (0x239A, 0x8028),  # Adafruit pIRKey M0
-        (0x239A, 0x802A),  # Adafruit Feather 52840
-        (0x239A, 0x802C),  # Adafruit Itsy M4
-        (0x239A, 0x802E),  # Adafruit CRICKit M0
-        (0x239A, 0xD1ED),  # Adafruit HalloWing M0
-    ]
+    valid_boards = ADAFRUIT_BOARDS
     # Modules built into CircuitPython which mustn't be used as file names
     # for source code.
     module_names = {'storage', 'os', 'touchio', 'microcontroller', 'bitbangio',
@@ -164,4 +148,4 @@ class AdafruitMode(MicroPythonMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + ADAFRUIT_APIS
+        return get_api('shared') + get_api('adafruit')
@@ -1,9 +1,56 @@
-from .adafruit import ADAFRUIT_APIS
-from .microbit import MICROBIT_APIS
-from .python3 import PYTHON3_APIS
-from .pi import PI_APIS
-from .shared import SHARED_APIS
-from .pygamezero import PYGAMEZERO_APIS
-
-__all__ = ['ADAFRUIT_APIS', 'MICROBIT_APIS', 'PYTHON3_APIS', 'PI_APIS',
-           'SHARED_APIS', 'PYGAMEZERO_APIS', ]
+"""
+Contains the definitions of the APIs used by the modes for autocomplete and
+call tips.
+
+Each catalogue of definitions is a JSON file in this package containing a
+list of strings that conform to Scintilla's API description DSL (see
+utils/mkapi.py for how they're made). A catalogue is only read, and its
+definitions translated into the user's language, the first time a mode asks
+for it.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import json
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The directory containing the catalogues.
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+#: The names of the catalogues that come with Mu.
+CATALOGUES = ('adafruit', 'microbit', 'python3', 'pi', 'shared',
+              'pygamezero', )
+# Translated definitions of the catalogues that have been loaded.
+_LOADED = {}
+
+
+def get_api(name):
+    """
+    Return the list of translated API definitions in the named catalogue
+    (e.g. 'shared' or 'python3').
+    """
+    if name not in _LOADED:
+        logger.debug('Loading {} API definitions.'.format(name))
+        api_path = os.path.join(API_DIR, '{}.json'.format(name))
+        with open(api_path, encoding='utf-8') as api_file:
+            _LOADED[name] = [_(entry) for entry in json.load(api_file)]
+    return _LOADED[name]
+
+
+__all__ = ['CATALOGUES', 'get_api', ]
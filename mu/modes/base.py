@@ -22,34 +22,15 @@ import os.path
 import csv
 import time
 import logging
-import pkgutil
-from PyQt5.QtSerialPort import QSerialPortInfo
 from PyQt5.QtCore import QObject
-from mu.logic import HOME_DIRECTORY, WORKSPACE_NAME, get_settings_path
+from mu.logic import (HOME_DIRECTORY, WORKSPACE_NAME, MODULE_NAMES,
+                      get_settings_path)
+from mu.modes.devices import BOARD_IDS, find_device, port_path
 
 
 logger = logging.getLogger(__name__)
 
 
-# List of supported board USB IDs.  Each board is a tuple of unique USB vendor
-# ID, USB product ID.
-BOARD_IDS = set([
-    (0x0D28, 0x0204),  # micro:bit USB VID, PID
-    (0x239A, 0x800B),  # Adafruit Feather M0 CDC only USB VID, PID
-    (0x239A, 0x8016),  # Adafruit Feather M0 CDC + MSC USB VID, PID
-    (0x239A, 0x8014),  # metro m0 PID
-    (0x239A, 0x8019),  # circuitplayground m0 PID
-    (0x239A, 0x8015),  # circuitplayground m0 PID prototype
-    (0x239A, 0x801B),  # feather m0 express PID
-])
-
-
-# Cache module names for filename shadow checking later.
-MODULE_NAMES = set([name for _, name, _ in pkgutil.iter_modules()])
-MODULE_NAMES.add('sys')
-MODULE_NAMES.add('builtins')
-
-
 def get_default_workspace():
     """
     Return the location on the filesystem for opening and closing files.
@@ -201,41 +182,14 @@ class MicroPythonMode(BaseMode):
 
     def find_device(self, with_logging=True):
         """
-        Returns the port and serial number for the first MicroPython-ish device
-        found connected to the host computer. If no device is found, returns
-        the tuple (None, None).
+        Returns the port and serial number for the first of the mode's valid
+        boards found connected to the host computer. If no device is found,
+        returns the tuple (None, None).
         """
-        available_ports = QSerialPortInfo.availablePorts()
-        for port in available_ports:
-            pid = port.productIdentifier()
-            vid = port.vendorIdentifier()
-            # Look for the port VID & PID in the list of know board IDs
-            if (vid, pid) in self.valid_boards:
-                port_name = port.portName()
-                serial_number = port.serialNumber()
-                if with_logging:
-                    logger.info('Found device on port: {}'.format(port_name))
-                    logger.info('Serial number: {}'.format(serial_number))
-                return (self.port_path(port_name), serial_number)
-        if with_logging:
-            logger.warning('Could not find device.')
-            logger.debug('Available ports:')
-            logger.debug(['PID:{} VID:{} PORT:{}'.format(p.productIdentifier(),
-                                                         p.vendorIdentifier(),
-                                                         p.portName())
-                         for p in available_ports])
-        return (None, None)
+        return find_device(self.valid_boards, with_logging)
 
     def port_path(self, port_name):
-        if os.name == 'posix':
-            # If we're on Linux or OSX reference the port is like this...
-            return "/dev/{}".format(port_name)
-        elif os.name == 'nt':
-            # On Windows simply return the port (e.g. COM0).
-            return port_name
-        else:
-            # No idea how to deal with other OS's so fail.
-            raise NotImplementedError('OS "{}" not supported.'.format(os.name))
+        return port_path(port_name)
 
     def toggle_repl(self, event):
         """
@@ -19,9 +19,10 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import logging
 import os.path
 from mu.modes.base import BaseMode
-from mu.logic import DEBUGGER_PORT, write_and_flush
+from mu.logic import DEBUGGER_PORT
 from mu.debugger.client import Debugger
 from mu.debugger.utils import is_breakpoint_line
+from mu.logs import Payload
 
 
 logger = logging.getLogger(__name__)
@@ -104,13 +105,11 @@ class DebugMode(BaseMode):
             self.editor.save()
         if tab.path:
             # If needed, save the script.
-            if tab.isModified():
-                with open(tab.path, 'w', newline='') as f:
-                    logger.info('Saving script to: {}'.format(tab.path))
-                    logger.debug(tab.text())
-                    write_and_flush(f, tab.text())
-                    tab.setModified(False)
-            logger.debug(tab.text())
+            if tab.isModified() and not self.editor.save_tab_now(tab):
+                logger.debug('Could not save the script.')
+                self.stop()
+                return
+            logger.debug(Payload(tab.text()))
             self.set_buttons(modes=False)
             envars = self.editor.envars
             self.runner = self.view.add_python3_runner(tab.path,
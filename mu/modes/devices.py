@@ -0,0 +1,108 @@
+"""
+The USB boards Mu recognises, and how to find them attached to a serial port.
+
+This is kept apart from the modes so Mu can check for attached devices (see
+mu.modes.registry.ModeSpec) without importing or instantiating the modes.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import logging
+from PyQt5.QtSerialPort import QSerialPortInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+# List of supported board USB IDs.  Each board is a tuple of unique USB vendor
+# ID, USB product ID.
+BOARD_IDS = set([
+    (0x0D28, 0x0204),  # micro:bit USB VID, PID
+    (0x239A, 0x800B),  # Adafruit Feather M0 CDC only USB VID, PID
+    (0x239A, 0x8016),  # Adafruit Feather M0 CDC + MSC USB VID, PID
+    (0x239A, 0x8014),  # metro m0 PID
+    (0x239A, 0x8019),  # circuitplayground m0 PID
+    (0x239A, 0x8015),  # circuitplayground m0 PID prototype
+    (0x239A, 0x801B),  # feather m0 express PID
+])
+
+#: The boards used in micro:bit mode.
+MICROBIT_BOARDS = [
+    (0x0D28, 0x0204),  # micro:bit USB VID, PID
+]
+
+#: The boards used in Adafruit mode.
+ADAFRUIT_BOARDS = [
+    (0x239A, 0x8015),  # Adafruit Feather M0 CircuitPython
+    (0x239A, 0x8023),  # Adafruit Feather M0 Express CircuitPython
+    (0x239A, 0x801B),  # Adafruit Feather M0 Express CircuitPython
+    (0x239A, 0x8014),  # Adafruit Metro M0 CircuitPython
+    (0x239A, 0x8019),  # Adafruit CircuitPlayground Express CircuitPython
+    (0x239A, 0x801D),  # Adafruit Gemma M0
+    (0x239A, 0x801F),  # Adafruit Trinket M0
+    (0x239A, 0x8012),  # Adafruit ItsyBitsy M0
+    (0x239A, 0x8021),  # Adafruit Metro M4
+    (0x239A, 0x8025),  # Adafruit Feather RadioFruit
+    (0x239A, 0x8026),  # Adafruit Feather M4
+    (0x239A, 0x8028),  # Adafruit pIRKey M0
+    (0x239A, 0x802A),  # Adafruit Feather 52840
+    (0x239A, 0x802C),  # Adafruit Itsy M4
+    (0x239A, 0x802E),  # Adafruit CRICKit M0
+    (0x239A, 0xD1ED),  # Adafruit HalloWing M0
+]
+
+
+def find_device(valid_boards, with_logging=True):
+    """
+    Returns the port and serial number for the first of the valid boards
+    (VID, PID pairs) found connected to the host computer. If no device is
+    found, returns the tuple (None, None).
+    """
+    available_ports = QSerialPortInfo.availablePorts()
+    for port in available_ports:
+        pid = port.productIdentifier()
+        vid = port.vendorIdentifier()
+        # Look for the port VID & PID in the list of know board IDs
+        if (vid, pid) in valid_boards:
+            port_name = port.portName()
+            serial_number = port.serialNumber()
+            if with_logging:
+                logger.info('Found device on port: {}'.format(port_name))
+                logger.info('Serial number: {}'.format(serial_number))
+            return (port_path(port_name), serial_number)
+    if with_logging:
+        logger.warning('Could not find device.')
+        logger.debug('Available ports:')
+        logger.debug(['PID:{} VID:{} PORT:{}'.format(p.productIdentifier(),
+                                                     p.vendorIdentifier(),
+                                                     p.portName())
+                     for p in available_ports])
+    return (None, None)
+
+
+def port_path(port_name):
+    """
+    Returns the path of the serial port with the referenced name.
+    """
+    if os.name == 'posix':
+        # If we're on Linux or OSX reference the port is like this...
+        return "/dev/{}".format(port_name)
+    elif os.name == 'nt':
+        # On Windows simply return the port (e.g. COM0).
+        return port_name
+    else:
+        # No idea how to deal with other OS's so fail.
+        raise NotImplementedError('OS "{}" not supported.'.format(os.name))
@@ -25,8 +25,10 @@ import semver
 from tokenize import TokenError
 from mu.logic import HOME_DIRECTORY
 from mu.contrib import uflash, microfs
-from mu.modes.api import MICROBIT_APIS, SHARED_APIS
+from mu.modes.api import get_api
 from mu.modes.base import MicroPythonMode
+from mu.modes.devices import MICROBIT_BOARDS
+from mu.logs import Payload
 from mu.interface.panes import CHARTS
 from PyQt5.QtCore import QObject, QThread, pyqtSignal, QTimer
 
@@ -173,9 +175,7 @@ class MicrobitMode(MicroPythonMode):
     flash_timer = None
     file_extensions = ['hex']
 
-    valid_boards = [
-        (0x0D28, 0x0204),  # micro:bit USB VID, PID
-    ]
+    valid_boards = MICROBIT_BOARDS
 
     valid_serial_numbers = [9900, 9901]  # Serial numbers of supported boards.
 
@@ -224,7 +224,7 @@ class MicrobitMode(MicroPythonMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + MICROBIT_APIS
+        return get_api('shared') + get_api('microbit')
 
     def flash(self):
         """
@@ -247,7 +247,7 @@ class MicrobitMode(MicroPythonMode):
         # Check the script's contents.
         python_script = tab.text().encode('utf-8')
         logger.debug('Python script:')
-        logger.debug(python_script)
+        logger.debug(Payload(python_script))
         # Check minification status.
         minify = False
         if uflash.get_minifier():
@@ -272,7 +272,7 @@ class MicrobitMode(MicroPythonMode):
                 percent = saved / orginal * 100
                 logger.debug('Script minified, {} bytes ({:.2f}%) saved:'
                              .format(saved, percent))
-                logger.debug(mangled)
+                logger.debug(Payload(mangled))
                 python_script = mangled
                 if len(python_script) >= 8192:
                     information = _("Our minifier tried but your "
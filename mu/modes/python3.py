@@ -20,9 +20,9 @@ import sys
 import os
 import logging
 from mu.modes.base import BaseMode
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS
-from mu.logic import write_and_flush
+from mu.modes.api import get_api
 from mu.resources import load_icon
+from mu.logs import Payload
 from mu.interface.panes import CHARTS
 from qtconsole.manager import QtKernelManager
 from qtconsole.client import QtKernelClient
@@ -145,7 +145,7 @@ class PythonMode(BaseMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + PYTHON3_APIS + PI_APIS
+        return get_api('shared') + get_api('python3') + get_api('pi')
 
     def run_toggle(self, event):
         """
@@ -182,13 +182,11 @@ class PythonMode(BaseMode):
             self.editor.save()
         if tab.path:
             # If needed, save the script.
-            if tab.isModified():
-                with open(tab.path, 'w', newline='') as f:
-                    logger.info('Saving script to: {}'.format(tab.path))
-                    logger.debug(tab.text())
-                    write_and_flush(f, tab.text())
-                    tab.setModified(False)
-            logger.debug(tab.text())
+            if tab.isModified() and not self.editor.save_tab_now(tab):
+                logger.debug('Could not save the script.')
+                self.stop_script()
+                return
+            logger.debug(Payload(tab.text()))
             envars = self.editor.envars
             self.runner = self.view.add_python3_runner(tab.path,
                                                        self.workspace_dir(),
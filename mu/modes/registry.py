@@ -0,0 +1,243 @@
+"""
+A registry of the modes available in Mu.
+
+Modes are described by cheap ModeSpec objects so Mu can tell which modes
+open which files, or detect devices, without importing the code that
+implements them. A mode is only imported when it's first used, listed in the
+mode selector or one of its devices is attached, and only instantiated when
+it's first used.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import logging
+import importlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from importlib.util import find_spec
+from mu.modes.devices import MICROBIT_BOARDS, ADAFRUIT_BOARDS, find_device
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The entry point group third party packages use to add modes to Mu.
+ENTRY_POINT_GROUP = 'mu.modes'
+
+
+class ModeSpec:
+    """
+    Describes a mode without importing it.
+
+    The target is either the location of the mode's class as a string of the
+    form "package.module:ClassName" or the class itself. Unless they're
+    given, the name, description and icon are read from the mode's class
+    (importing it) when first needed, which is only when the user selects a
+    mode or one of its devices is attached. The is_debugger, file_extensions
+    and valid_boards mirror the attributes of the same name on the mode's
+    class, since they're needed before the mode is used. The valid_boards are
+    the USB boards (VID, PID pairs) the mode works with, so attached devices
+    are found (see find_device) without importing the mode. If requires names
+    a module, the mode is only available if that module is installed.
+    """
+
+    def __init__(self, key, target, name=None, description=None, icon=None,
+                 is_debugger=False, file_extensions=None,
+                 valid_boards=None, requires=None):
+        self.key = key
+        self.target = target
+        self._name = name
+        self._description = description
+        self._icon = icon
+        self.is_debugger = is_debugger
+        self.file_extensions = file_extensions or []
+        self.valid_boards = valid_boards or []
+        self.requires = requires
+
+    @classmethod
+    def from_class(cls, key, mode_class):
+        """
+        Create a spec from a mode's class (which has already been imported).
+        """
+        return cls(key, mode_class, is_debugger=mode_class.is_debugger,
+                   file_extensions=mode_class.file_extensions,
+                   valid_boards=getattr(mode_class, 'valid_boards', None))
+
+    @property
+    def detects_device(self):
+        """
+        Returns a boolean indication if the mode works with USB boards.
+        """
+        return bool(self.valid_boards)
+
+    def find_device(self):
+        """
+        Returns the port and serial number for the first of the mode's boards
+        found connected to the host computer, or (None, None), without
+        importing the mode.
+        """
+        return find_device(self.valid_boards, with_logging=False)
+
+    @property
+    def name(self):
+        """
+        The mode's name, read from its class unless it was given.
+        """
+        if self._name is None:
+            self._name = self.load().name
+        return self._name
+
+    @property
+    def description(self):
+        """
+        The mode's description, read from its class unless it was given.
+        """
+        if self._description is None:
+            self._description = self.load().description
+        return self._description
+
+    @property
+    def icon(self):
+        """
+        The mode's icon, read from its class unless it was given.
+        """
+        if self._icon is None:
+            self._icon = self.load().icon
+        return self._icon
+
+    def is_available(self):
+        """
+        Returns a boolean indication if the mode's dependencies are installed
+        (without importing them).
+        """
+        if self.requires:
+            return find_spec(self.requires) is not None
+        return True
+
+    def load(self):
+        """
+        Return the mode's class, importing it if required.
+        """
+        if not isinstance(self.target, str):
+            return self.target
+        module_name, class_name = self.target.split(':')
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
+
+
+#: The modes that come with Mu.
+BUILTIN_MODES = [
+    ModeSpec('python', 'mu.modes.python3:PythonMode'),
+    ModeSpec('adafruit', 'mu.modes.adafruit:AdafruitMode',
+             valid_boards=ADAFRUIT_BOARDS),
+    ModeSpec('microbit', 'mu.modes.microbit:MicrobitMode',
+             file_extensions=['hex'], valid_boards=MICROBIT_BOARDS),
+    ModeSpec('debugger', 'mu.modes.debugger:DebugMode', is_debugger=True),
+    ModeSpec('pygamezero', 'mu.modes.pygamezero:PyGameZeroMode',
+             requires='pgzero'),
+]
+
+
+def iter_entry_points(group):
+    """
+    Yield the entry points registered by installed packages for the
+    referenced group.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # pragma: no cover
+        # Python < 3.8
+        from pkg_resources import iter_entry_points as entry_points_for
+        yield from entry_points_for(group)
+        return
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        yield from eps.select(group=group)
+    else:  # pragma: no cover
+        # Python < 3.10
+        yield from eps.get(group, [])
+
+
+class ModeRegistry(Mapping):
+    """
+    A mapping of mode names to instances of the modes.
+
+    Modes are imported and instantiated the first time they're looked up.
+    Cheap information about every available mode, whether it has been loaded
+    or not, is found in the specs attribute.
+    """
+
+    def __init__(self, editor, view, specs=None):
+        self.editor = editor
+        self.view = view
+        self.specs = OrderedDict()
+        self._modes = {}
+        for spec in specs or []:
+            self.register(spec)
+
+    def register(self, spec):
+        """
+        Make the mode described by the referenced ModeSpec available, so long
+        as its dependencies are installed and the name isn't already taken.
+        """
+        if spec.key in self.specs:
+            logger.warning('Mode {} already registered.'.format(spec.key))
+        elif not spec.is_available():
+            logger.info('Mode {} unavailable: {} is not installed.'.format(
+                spec.key, spec.requires))
+        else:
+            self.specs[spec.key] = spec
+
+    def load_entry_points(self, group=ENTRY_POINT_GROUP):
+        """
+        Register third party modes advertised via entry points. Each entry
+        point should reference a ModeSpec (so the mode itself is only imported
+        when needed) or, more simply, the mode's class.
+        """
+        for entry_point in iter_entry_points(group):
+            try:
+                target = entry_point.load()
+                if isinstance(target, ModeSpec):
+                    spec = target
+                else:
+                    spec = ModeSpec.from_class(entry_point.name, target)
+            except Exception as ex:
+                logger.error('Could not load mode from entry point '
+                             '{}: {}'.format(entry_point.name, ex))
+            else:
+                self.register(spec)
+
+    def is_loaded(self, key):
+        """
+        Returns a boolean indication if the referenced mode has been imported
+        and instantiated.
+        """
+        return key in self._modes
+
+    def __getitem__(self, key):
+        if key not in self._modes:
+            spec = self.specs[key]
+            logger.info('Loading {} mode.'.format(key))
+            self._modes[key] = spec.load()(self.editor, self.view)
+        return self._modes[key]
+
+    def __contains__(self, key):
+        return key in self.specs
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self):
+        return len(self.specs)
@@ -0,0 +1,298 @@
+"""
+Outlines Python code: the classes, functions and top-level assignments in
+it, for the outline pane (see mu.workers.Outliner).
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import ast
+import keyword
+import functools
+import tokenize
+from mu.symbols import FUNCTION_NODES, find_name
+
+
+# Tokens that don't start (or say anything about) a statement.
+IGNORED_TOKENS = {tokenize.NL, tokenize.COMMENT, tokenize.INDENT,
+                  tokenize.DEDENT, tokenize.NEWLINE, tokenize.ENDMARKER}
+
+
+def tolerant_tokens(lines, start=0):
+    """
+    Generate the tokens in the lines of code from the referenced (zero based)
+    line on, with their rows counted from the first line.
+
+    If a line can't be tokenized (e.g. it starts a string or bracket that's
+    never closed, or it's badly indented), None is generated and tokenizing
+    carries on from the next line (or the badly indented line itself) as if
+    it were the start of the code, so as much of it as possible is outlined.
+    """
+    while start < len(lines):
+        readline = functools.partial(next, iter(lines[start:]), '')
+        try:
+            for token in tokenize.generate_tokens(readline):
+                if start:
+                    token = token._replace(
+                        start=(token.start[0] + start, token.start[1]),
+                        end=(token.end[0] + start, token.end[1]))
+                yield token
+            return
+        except (tokenize.TokenError, SyntaxError) as ex:
+            if isinstance(ex, SyntaxError):
+                row = ex.lineno or 0
+            else:
+                row = ex.args[1][0]
+            if isinstance(ex, IndentationError):
+                row -= 1
+            start = max(start + row, start + 1)
+            yield None
+
+
+def top_level_starts(lines, start=0):
+    """
+    Generate the (zero based) line on which each top-level statement starts,
+    from the referenced line (which must be the start of one, or of the
+    code). Decorators belong to the statement they decorate.
+    """
+    depth = 0
+    new_line = True
+    decorated = False
+    for token in tolerant_tokens(lines, start):
+        if token is None:  # Tokenizing started again.
+            depth = 0
+            new_line = True
+        elif token.type == tokenize.INDENT:
+            depth += 1
+        elif token.type == tokenize.DEDENT:
+            depth -= 1
+        elif token.type == tokenize.NEWLINE:
+            new_line = True
+        elif token.type not in IGNORED_TOKENS and new_line:
+            new_line = False
+            if depth == 0:
+                if not decorated:
+                    yield token.start[0] - 1
+                decorated = token.string == '@'
+
+
+def char_column(line, offset):
+    """
+    Return the column of the character at the referenced (UTF-8) byte offset
+    in the line, as given by ast.
+    """
+    return len(line.encode('utf-8')[:offset].decode('utf-8', 'replace'))
+
+
+def assigned_names(target):
+    """
+    Return the ast.Name nodes of the names bound by an assignment to the
+    referenced target (which may unpack a tuple or list).
+    """
+    if isinstance(target, ast.Name):
+        return [target]
+    if isinstance(target, ast.Starred):
+        return assigned_names(target.value)
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for element in target.elts
+                for name in assigned_names(element)]
+    return []
+
+
+def outline_tree(tree, lines):
+    """
+    Return the outline of the parsed code: a list of the classes and
+    functions defined at its top level or in its classes, and the names
+    assigned at its top level.
+
+    Each item in the outline is a dict with its name, kind ("class",
+    "function" or "variable"), the (zero based) line and column of its name
+    and its depth (how many classes it's in).
+    """
+    items = []
+
+    def visit(body, depth):
+        for node in body:
+            if isinstance(node, FUNCTION_NODES + (ast.ClassDef, )):
+                line, column = find_name(lines, node)
+                kind = 'function'
+                if isinstance(node, ast.ClassDef):
+                    kind = 'class'
+                items.append({'name': node.name, 'kind': kind,
+                              'line': line, 'column': column,
+                              'depth': depth})
+                if kind == 'class':
+                    visit(node.body, depth + 1)
+            elif depth == 0 and isinstance(node, (ast.Assign,
+                                                  ast.AnnAssign)):
+                if isinstance(node, ast.Assign):
+                    targets = node.targets
+                else:
+                    targets = [node.target]
+                for target in targets:
+                    for name in assigned_names(target):
+                        line = name.lineno - 1
+                        column = char_column(lines[line], name.col_offset)
+                        items.append({'name': name.id, 'kind': 'variable',
+                                      'line': line, 'column': column,
+                                      'depth': 0})
+
+    visit(tree.body, 0)
+    return items
+
+
+def outline_tokens(tokens):
+    """
+    Return the outline (see outline_tree) of code that can't be parsed,
+    given its tokens (see tolerant_tokens).
+
+    Each line that starts with "def" or "class" is a definition, nested in
+    the classes before it that are indented less. Each line that starts with
+    names at the start of the line followed by "=" or ":" is a top-level
+    assignment.
+    """
+    rows = []  # The tokens that start on each line.
+    for token in tokens:
+        if token is None or token.type in IGNORED_TOKENS:
+            continue
+        if rows and rows[-1][0].start[0] == token.start[0]:
+            rows[-1].append(token)
+        else:
+            rows.append([token])
+    items = []
+    scopes = []  # The column and kind of the enclosing definitions.
+    for row in rows:
+        first = row[0]
+        line, column = first.start[0] - 1, first.start[1]
+        while scopes and scopes[-1][0] >= column:
+            scopes.pop()
+        words = [token.string for token in row]
+        if words[0] == 'async':
+            words = words[1:]
+            row = row[1:]
+        if len(words) > 1 and words[0] in ('def', 'class') and \
+                row[1].type == tokenize.NAME:
+            kind = 'function' if words[0] == 'def' else 'class'
+            if all(scope_kind == 'class' for _, scope_kind in scopes):
+                items.append({'name': words[1], 'kind': kind,
+                              'line': row[1].start[0] - 1,
+                              'column': row[1].start[1],
+                              'depth': len(scopes)})
+            scopes.append((column, kind))
+        elif column == 0 and first.type == tokenize.NAME:
+            # Names separated by commas, followed by "=" or ":".
+            targets = []
+            for index, token in enumerate(row):
+                if index % 2 == 0:
+                    if (token.type != tokenize.NAME or
+                            keyword.iskeyword(token.string)):
+                        break
+                    targets.append(token)
+                elif token.string in ('=', ':'):
+                    items.extend({'name': target.string, 'kind': 'variable',
+                                  'line': line, 'column': target.start[1],
+                                  'depth': 0} for target in targets)
+                    break
+                elif token.string != ',':
+                    break
+    return items
+
+
+def outline_block(lines):
+    """
+    Return the outline (see outline_tree) of the lines of code, falling back
+    to an outline from its tokens (see outline_tokens) if it can't be parsed.
+    """
+    tokens = list(tolerant_tokens(lines))
+    # Code that can't be tokenized can't be parsed, so don't try (parsing
+    # holds the GIL, so the less of it the better).
+    if all(token is not None and token.type != tokenize.ERRORTOKEN
+           for token in tokens):
+        try:
+            return outline_tree(ast.parse(''.join(lines)), lines)
+        except (SyntaxError, ValueError):
+            pass
+    return outline_tokens(tokens)
+
+
+class IncrementalOutline:
+    """
+    Outlines code as it's being edited, tokenizing and parsing again only the
+    top-level statements changed since it was last outlined.
+
+    The code is split into blocks, each a top-level statement (see
+    top_level_starts), and the outline of each block is kept. When the code
+    changes, the blocks before the first changed line (other than the one
+    that ends just before it, which the change might continue) and the
+    blocks after the last changed line are reused, moved to where they now
+    start. Tokenizing starts again from the first changed block and stops
+    once it reaches the start of a block that's unchanged. Only the blocks in
+    between are outlined again (see outline_block), so an edit to a long
+    script costs about as much as outlining the statement that was edited.
+    """
+
+    def __init__(self):
+        self.lines = []  # The lines of the code last outlined.
+        self.blocks = []  # The start, end and outline of each block.
+
+    def outline(self, code):
+        """
+        Return the outline of the code (see outline_tree).
+        """
+        lines = code.splitlines(True)
+        old = self.lines
+        limit = min(len(lines), len(old))
+        prefix = 0
+        while prefix < limit and lines[prefix] == old[prefix]:
+            prefix += 1
+        if prefix == len(lines) == len(old) and self.blocks:
+            return self.items()
+        suffix = 0
+        while (suffix < limit - prefix and
+               lines[-1 - suffix] == old[-1 - suffix]):
+            suffix += 1
+        offset = len(lines) - len(old)
+        keep = 0
+        while keep < len(self.blocks) and self.blocks[keep][1] < prefix:
+            keep += 1
+        start = self.blocks[keep][0] if keep < len(self.blocks) else 0
+        old_starts = {self.blocks[index][0]: index
+                      for index in range(keep, len(self.blocks))}
+        unchanged = len(lines) - suffix  # Lines from here on are as before.
+        starts = [start]
+        tail = []
+        for line in top_level_starts(lines, start):
+            if line <= start:
+                continue
+            if line >= unchanged and line - offset in old_starts:
+                tail = [[block_start + offset, end + offset, outline]
+                        for block_start, end, outline
+                        in self.blocks[old_starts[line - offset]:]]
+                break
+            starts.append(line)
+        ends = starts[1:] + [tail[0][0] if tail else len(lines)]
+        blocks = self.blocks[:keep]
+        for block_start, end in zip(starts, ends):
+            blocks.append([block_start, end,
+                           outline_block(lines[block_start:end])])
+        self.lines = lines
+        self.blocks = blocks + tail
+        return self.items()
+
+    def items(self):
+        """
+        Return the outline of the code last outlined.
+        """
+        return [dict(item, line=item['line'] + start)
+                for start, _, outline in self.blocks for item in outline]
@@ -0,0 +1,176 @@
+"""
+Measures how long each phase of Mu's startup takes.
+
+Profiling is switched on with the --profile-startup command line flag or by
+setting the MU_PROFILE_STARTUP environment variable. When switched off the
+phases are not timed and nothing is written.
+
+Since this module only depends upon the standard library it's imported by
+mu.app before Qt and the rest of Mu, so the time taken to import them is
+included in the report.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import platform
+from contextlib import contextmanager
+from mu import __version__
+
+
+logger = logging.getLogger(__name__)
+
+
+#: Command line flag to switch on startup profiling.
+PROFILE_FLAG = '--profile-startup'
+#: Environment variable to switch on startup profiling.
+PROFILE_ENVAR = 'MU_PROFILE_STARTUP'
+#: Name of the JSON report written to the log directory.
+REPORT_JSON = 'startup_profile.json'
+#: Name of the human readable summary written to the log directory.
+REPORT_TEXT = 'startup_profile.txt'
+
+
+class StartupProfiler:
+    """
+    Records the wall clock and CPU time taken by (possibly nested) named
+    phases of startup.
+
+    CPU time is for the whole process, so includes work done by other threads
+    during a phase.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = []
+        self._depth = 0
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        self.start_modules = len(sys.modules)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager to time the phase of startup with the referenced name.
+        Phases started within another phase are nested within it.
+        """
+        if not self.enabled:
+            yield
+            return
+        record = {'name': name, 'depth': self._depth}
+        self.phases.append(record)
+        self._depth += 1
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record['wall_ms'] = (time.perf_counter() - wall) * 1000
+            record['cpu_ms'] = (time.process_time() - cpu) * 1000
+            self._depth -= 1
+
+    def imports_done(self):
+        """
+        Record the time taken to import Mu's modules, since this module was
+        imported.
+        """
+        if self.enabled:
+            self.phases.append({
+                'name': 'imports',
+                'depth': 0,
+                'wall_ms': (time.perf_counter() - self.start_wall) * 1000,
+                'cpu_ms': (time.process_time() - self.start_cpu) * 1000,
+                'modules': len(sys.modules) - self.start_modules,
+            })
+
+    def report(self):
+        """
+        Return a dictionary describing the phases recorded so far and the
+        total time taken since profiling started.
+        """
+        return {
+            'version': __version__,
+            'python': sys.version,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'total_wall_ms': (time.perf_counter() - self.start_wall) * 1000,
+            'total_cpu_ms': (time.process_time() - self.start_cpu) * 1000,
+            'phases': self.phases,
+        }
+
+    @staticmethod
+    def summary(report):
+        """
+        Return a human readable summary of the referenced report.
+        """
+        lines = [
+            'Mu {} startup profile ({})'.format(report['version'],
+                                                report['timestamp']),
+            report['platform'],
+            '',
+            '{:<56}{:>10}{:>10}'.format('Phase', 'Wall ms', 'CPU ms'),
+        ]
+        for phase in report['phases']:
+            name = '  ' * phase['depth'] + phase['name']
+            if 'modules' in phase:
+                name += ' ({} modules)'.format(phase['modules'])
+            if len(name) > 54:
+                name = name[:51] + '...'
+            lines.append('{:<56}{:>10.1f}{:>10.1f}'.format(
+                name, phase['wall_ms'], phase['cpu_ms']))
+        lines.append('{:<56}{:>10.1f}{:>10.1f}'.format(
+            'Total', report['total_wall_ms'], report['total_cpu_ms']))
+        return '\n'.join(lines) + '\n'
+
+    def finish(self, log_dir):
+        """
+        Write the report as JSON and the human readable summary into the
+        referenced directory and stop recording. Returns the path to the
+        summary.
+        """
+        if not self.enabled:
+            return None
+        self.enabled = False
+        report = self.report()
+        json_path = os.path.join(log_dir, REPORT_JSON)
+        text_path = os.path.join(log_dir, REPORT_TEXT)
+        summary = self.summary(report)
+        try:
+            with open(json_path, 'w') as f:
+                json.dump(report, f, indent=2)
+            with open(text_path, 'w') as f:
+                f.write(summary)
+        except OSError as ex:
+            logger.error('Could not write startup profile: {}'.format(ex))
+            return None
+        logger.info('Startup profile:\n{}'.format(summary))
+        return text_path
+
+
+def is_enabled(argv=None, environ=None):
+    """
+    Returns a boolean indication if startup profiling has been asked for on
+    the command line or via the environment.
+    """
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    return PROFILE_FLAG in argv or bool(environ.get(PROFILE_ENVAR))
+
+
+#: The profiler for this run of Mu.
+PROFILER = StartupProfiler(enabled=is_enabled())
@@ -17,38 +17,65 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from pkg_resources import resource_filename, resource_string
+import os
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import QDir
+try:
+    from importlib.resources import files
+except ImportError:  # pragma: no cover
+    # Python < 3.9
+    files = None
+
+
+#: The directory containing Mu's resources. (Found via importlib.resources
+#: since importing pkg_resources is slow.)
+if files:
+    RESOURCE_DIR = str(files(__name__))
+else:  # pragma: no cover
+    RESOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Icons, pixmaps and stylesheets are cached since the same few are used
+# over and over again (e.g. whenever the mode changes).
+_ICONS = {}
+_PIXMAPS = {}
+_STYLESHEETS = {}
 
 
 # The following lines add the images and css directories to the search path.
-QDir.addSearchPath('images', resource_filename(__name__, 'images'))
-QDir.addSearchPath('css', resource_filename(__name__, 'css'))
+QDir.addSearchPath('images', os.path.join(RESOURCE_DIR, 'images'))
+QDir.addSearchPath('css', os.path.join(RESOURCE_DIR, 'css'))
 
 
 def path(name, resource_dir="images/"):
     """Return the filename for the referenced image."""
-    return resource_filename(__name__, resource_dir + name)
+    return os.path.join(RESOURCE_DIR, resource_dir + name)
 
 
 def load_icon(name):
     """Load an icon from the resources directory."""
-    return QIcon(path(name))
+    if name not in _ICONS:
+        _ICONS[name] = QIcon(path(name))
+    return _ICONS[name]
 
 
 def load_pixmap(name):
     """Load a pixmap from the resources directory."""
-    return QPixmap(path(name))
+    if name not in _PIXMAPS:
+        _PIXMAPS[name] = QPixmap(path(name))
+    return _PIXMAPS[name]
 
 
 def load_stylesheet(name):
     """Load a CSS stylesheet from the resources directory."""
-    return resource_string(__name__, "css/" + name).decode('utf8')
+    if name not in _STYLESHEETS:
+        with open(path(name, "css/"), encoding='utf8') as f:
+            _STYLESHEETS[name] = f.read()
+    return _STYLESHEETS[name]
 
 
 def load_font_data(name):
     """
     Load the (binary) content of a font as bytes
     """
-    return resource_string(__name__, "fonts/" + name)
+    with open(path(name, "fonts/"), "rb") as f:
+        return f.read()
@@ -0,0 +1,149 @@
+"""
+Finds and replaces text in code, for searching the open tabs and the files in
+the workspace (see mu.workers.FileSearcher).
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import re
+
+
+def compile_pattern(find, regex=False, case_sensitive=True,
+                    whole_word=False):
+    """
+    Return the compiled regular expression that matches the text to find.
+
+    Unless regex is True the text is matched literally. If whole_word is
+    True, only matches that start and end on a word boundary are found.
+    Raises re.error if the regular expression is invalid.
+    """
+    expression = find if regex else re.escape(find)
+    if whole_word:
+        expression = r'\b(?:{})\b'.format(expression)
+    flags = re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    return re.compile(expression, flags)
+
+
+def replacer(replace, regex=False):
+    """
+    Return a function that, given a match, returns the text with which to
+    replace it. If regex is True, the replacement may refer to the match's
+    groups (e.g. "\\1" or "\\g<name>"), otherwise it's used literally.
+    """
+    if regex:
+        return lambda match: match.expand(replace)
+    return lambda match: replace
+
+
+def check_replacement(pattern, replace):
+    """
+    Raise re.error if the replacement can't be used for the matches of the
+    compiled pattern (see replacer), e.g. if it refers to a group the pattern
+    doesn't have or ends with a backslash.
+    """
+    try:
+        # The template is parsed even though nothing matches.
+        pattern.sub(replace, '')
+    except IndexError as ex:  # An unknown group name.
+        raise re.error(str(ex))
+
+
+def describe_match(match, text, line, replacement=None):
+    """
+    Return a dict describing the match for a pattern in the text, which
+    starts on the referenced (zero based) line (see find_matches).
+    """
+    start, end = match.span()
+    line_start = text.rfind('\n', 0, start) + 1
+    end_line = line + text.count('\n', start, end)
+    end_line_start = text.rfind('\n', 0, end) + 1
+    line_end = text.find('\n', start)
+    if line_end < 0:
+        line_end = len(text)
+    result = {
+        'line': line,
+        'column': start - line_start,
+        'end_line': end_line,
+        'end_column': end - end_line_start,
+        'text': text[line_start:line_end],
+    }
+    if replacement:
+        result['replacement'] = replacement(match)
+    return result
+
+
+def find_matches(pattern, text, replacement=None):
+    """
+    Return a list of the matches for the compiled pattern in the text.
+
+    Each match is a dict with the (zero based) line and column at which it
+    starts and ends, and the text of the line on which it starts. If a
+    replacement function (see replacer) is given, each also contains the text
+    with which to replace it. Empty matches are ignored.
+    """
+    matches = []
+    line = 0
+    position = 0  # Where the line is known to be up to.
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        if start == end:
+            continue
+        line += text.count('\n', position, start)
+        result = describe_match(match, text, line, replacement)
+        matches.append(result)
+        line = result['end_line']
+        position = end
+    return matches
+
+
+def find_next(pattern, text, line, column, replacement=None):
+    """
+    Return the first match (see find_matches) for the compiled pattern in the
+    text that starts at or after the referenced (zero based) line and column,
+    wrapping round to the start of the text, or None if there isn't one.
+    """
+    position = 0
+    for _ in range(line):
+        position = text.find('\n', position) + 1
+        if not position:
+            position = len(text)
+            break
+    position = min(position + column, len(text))
+    for start in (position, 0):
+        for match in pattern.finditer(text, start):
+            if match.start() < match.end():
+                return describe_match(match, text,
+                                      text.count('\n', 0, match.start()),
+                                      replacement)
+    return None
+
+
+def replace_matches(pattern, text, replacement):
+    """
+    Return a tuple of the text with all the pattern's (non-empty) matches
+    replaced (see replacer), and the number of replacements made.
+    """
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        if match.start() == match.end():
+            return ''
+        count += 1
+        return replacement(match)
+
+    return pattern.sub(replace, text), count
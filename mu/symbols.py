@@ -0,0 +1,176 @@
+"""
+Finds the modules, classes and functions defined in Python code, for
+autocomplete, call tips and going to definitions (see mu.workers.SymbolIndex).
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import re
+import ast
+
+
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def module_name(path):
+    """
+    Return the name with which the Python file at the referenced path is
+    imported.
+    """
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def format_default(node):
+    """
+    Return how the default value of an argument is shown in a signature:
+    its value if it's a literal, otherwise "...".
+    """
+    try:
+        return repr(ast.literal_eval(node))
+    except (ValueError, TypeError, RecursionError):
+        # Not a literal, unhashable (e.g. {[]: 1}) or too deeply nested.
+        return '...'
+
+
+def format_signature(arguments, method=False):
+    """
+    Return the signature, e.g. "(a, /, b=1, *args, **kwargs)", of a function
+    with the referenced ast.arguments. If method is True the first argument
+    (usually self or cls) is left out.
+    """
+    # Positional only arguments (before "/") are new in Python 3.8.
+    posonly = list(getattr(arguments, 'posonlyargs', []))
+    args = posonly + list(arguments.args)
+    defaults = [None] * (len(args) - len(arguments.defaults))
+    defaults += arguments.defaults
+    if method and args:
+        args, defaults = args[1:], defaults[1:]
+        posonly = posonly[1:]
+    parts = []
+    for arg, default in zip(args, defaults):
+        if default is None:
+            parts.append(arg.arg)
+        else:
+            parts.append('{}={}'.format(arg.arg, format_default(default)))
+    if posonly:
+        parts.insert(len(posonly), '/')
+    if arguments.vararg:
+        parts.append('*' + arguments.vararg.arg)
+    elif arguments.kwonlyargs:
+        parts.append('*')
+    for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+        if default is None:
+            parts.append(arg.arg)
+        else:
+            parts.append('{}={}'.format(arg.arg, format_default(default)))
+    if arguments.kwarg:
+        parts.append('**' + arguments.kwarg.arg)
+    return '({})'.format(', '.join(parts))
+
+
+def is_staticmethod(node):
+    """
+    Returns a boolean indication if the referenced function definition is
+    decorated with staticmethod, so has no self (or cls) argument.
+    """
+    for decorator in node.decorator_list:
+        # A name, or an attribute such as builtins.staticmethod.
+        name = getattr(decorator, 'id', getattr(decorator, 'attr', None))
+        if name == 'staticmethod':
+            return True
+    return False
+
+
+def find_name(lines, node):
+    """
+    Return the (zero based) line and column of the name in the referenced
+    class or function definition, which follows any decorators.
+    """
+    keyword = 'class' if isinstance(node, ast.ClassDef) else 'def'
+    definition = re.compile(r'\b{}\s+({})\b'.format(keyword, node.name))
+    for line in range(node.lineno - 1, len(lines)):
+        match = definition.search(lines[line])
+        if match:
+            return line, match.start(1)
+    return node.lineno - 1, node.col_offset
+
+
+def find_symbols(code, module):
+    """
+    Return a list of the symbols defined in the code of the named module:
+    the module itself, and the classes and functions defined at its top
+    level or in its classes (including methods).
+
+    Each symbol is a dict with its (dotted) name, its kind ("module",
+    "class" or "function"), the (zero based) line and column of its name,
+    its signature (for classes, that of __init__) and its docstring. Raises
+    SyntaxError (or ValueError) if the code can't be parsed.
+    """
+    tree = ast.parse(code)
+    lines = code.splitlines()
+    symbols = [{
+        'name': module,
+        'kind': 'module',
+        'line': 0,
+        'column': 0,
+        'signature': None,
+        'doc': ast.get_docstring(tree) or '',
+    }]
+
+    def visit(body, prefix, in_class):
+        for node in body:
+            if isinstance(node, FUNCTION_NODES):
+                kind = 'function'
+                # Methods are called without self or (for classmethods)
+                # cls, but static methods have neither.
+                method = in_class and not is_staticmethod(node)
+                signature = format_signature(node.args, method)
+            elif isinstance(node, ast.ClassDef):
+                kind = 'class'
+                signature = '()'
+                for item in node.body:
+                    if (isinstance(item, FUNCTION_NODES) and
+                            item.name == '__init__'):
+                        signature = format_signature(item.args, True)
+            else:
+                continue
+            line, column = find_name(lines, node)
+            name = '{}.{}'.format(prefix, node.name)
+            symbols.append({
+                'name': name,
+                'kind': kind,
+                'line': line,
+                'column': column,
+                'signature': signature,
+                'doc': ast.get_docstring(node) or '',
+            })
+            if kind == 'class':
+                visit(node.body, name, True)
+
+    visit(tree.body, module, False)
+    return symbols
+
+
+def api_entry(symbol):
+    """
+    Return the entry for the referenced symbol in the API definitions used
+    for autocomplete and call tips (in the same format as those in
+    mu.modes.api).
+    """
+    entry = symbol['name'] + (symbol['signature'] or '')
+    if symbol['doc']:
+        entry += ' \n' + symbol['doc']
+    return entry
@@ -0,0 +1,130 @@
+"""
+Watches files for changes made by other programs.
+
+The operating system tells Qt when a watched file changes (via inotify on
+Linux, kqueue on macOS and change notifications on Windows), so nothing
+polls the disk.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import signal
+import logging
+from PyQt5.QtCore import (QObject, QCoreApplication, QFileSystemWatcher,
+                          QTimer, pyqtSignal)
+
+
+logger = logging.getLogger(__name__)
+
+
+#: How long (in milliseconds) a file must be left alone after changing before
+#: the change is reported.
+DEBOUNCE = 200
+
+
+class FileWatcher(QObject):
+    """
+    Emits the file_changed signal with the path of a watched file when it's
+    changed (or removed), or of a watched directory when files are added to
+    or removed from it.
+
+    Programs often change a file in several steps (e.g. truncating and then
+    writing it), so a change is only reported once the file has been left
+    alone for the debounce interval. Files replaced by renaming another file
+    over them (as many editors, and Mu, do when saving) are watched again.
+    """
+
+    file_changed = pyqtSignal(str)
+
+    def __init__(self, debounce=DEBOUNCE, parent=None):
+        super().__init__(parent)
+        self.paths = set()  # The paths to watch, even if replaced.
+        self.changed = set()  # Paths changed since the timer was started.
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+        self.watcher.directoryChanged.connect(self.on_file_changed)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(debounce)
+        self.timer.timeout.connect(self.report_changes)
+
+    def watch(self, path):
+        """
+        Start watching the file (or directory) at the referenced path. Returns
+        a boolean indication of success.
+        """
+        self.paths.add(path)
+        if path in self.watcher.files() + self.watcher.directories():
+            return True
+        if not self.watcher.addPath(path):
+            logger.warning('Could not watch {}'.format(path))
+            return False
+        return True
+
+    def unwatch(self, path):
+        """
+        Stop watching the file (or directory) at the referenced path.
+        """
+        self.paths.discard(path)
+        self.changed.discard(path)
+        if path in self.watcher.files() + self.watcher.directories():
+            self.watcher.removePath(path)
+
+    def on_file_changed(self, path):
+        """
+        Note the change and (re)start the debounce timer.
+        """
+        self.changed.add(path)
+        self.timer.start()
+
+    def report_changes(self):
+        """
+        Emit file_changed for each file changed while the timer was running.
+        """
+        changed, self.changed = self.changed, set()
+        for path in sorted(changed):
+            if path not in self.paths:
+                continue
+            if os.path.exists(path):
+                self.watch(path)
+            self.file_changed.emit(path)
+
+
+def watch_file(path, func, *args, **kwargs):
+    """
+    Call the provided function with *args and **kwargs each time the file at
+    the referenced path is changed, until interrupted with Ctrl-C.
+
+    For use from the command line (e.g. by "uflash --watch"), where there's
+    no Qt event loop already running.
+    """
+    app = QCoreApplication.instance() or QCoreApplication([])
+    watcher = FileWatcher()
+    if not watcher.watch(path):
+        raise IOError('Could not watch "{}"'.format(path))
+    watcher.file_changed.connect(lambda changed: func(*args, **kwargs))
+    # Python only handles Ctrl-C when its code runs, so the event loop must
+    # give it the chance every so often.
+    previous = signal.signal(signal.SIGINT, lambda signum, frame: app.quit())
+    wake = QTimer()
+    wake.timeout.connect(lambda: None)
+    wake.start(250)
+    try:
+        app.exec_()
+    finally:
+        wake.stop()
+        watcher.unwatch(path)
+        signal.signal(signal.SIGINT, previous)
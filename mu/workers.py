@@ -0,0 +1,1049 @@
+"""
+Does Mu's slower work in background threads (or processes), so the editor
+never waits for it: reading and writing files, checking code, searching and
+indexing the workspace, and outlining code. The results are handed back to
+the thread that asked for them with Qt signals.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import sys
+import json
+import logging
+import pkgutil
+import threading
+import queue
+import pickle
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from mu import search
+from mu import symbols
+from mu import outline
+from mu.files import read_and_decode, save_and_encode, file_signature
+
+
+logger = logging.getLogger(__name__)
+
+
+class ModuleIndex:
+    """
+    The names of the modules that can be imported from the Python path, used
+    to warn users who save a file that shadows one of them.
+
+    Walking every directory on sys.path is slow (especially on network
+    mounted home directories or with a big site-packages), so the names are
+    cached in a JSON file alongside the sys.path entries and their
+    modification times when they were found. The cache is checked, and if
+    necessary rebuilt, in a background thread via refresh_in_background.
+    Checking for a name is a set lookup, or (until the cached or scanned
+    names are ready) a search of the path for that name alone.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.names = set(sys.builtin_module_names) | {'sys', 'builtins'}
+        self.ready = False  # True once names are cached or scanned.
+        self._thread = None
+
+    def __contains__(self, name):
+        if name in self.names:
+            return True
+        if self.ready:
+            return False
+        # The path hasn't been scanned yet, and waiting for the scan would
+        # freeze the editor, so ask the import system about this one name.
+        try:
+            return find_spec(name) is not None
+        except (ImportError, ValueError):
+            return False
+
+    @staticmethod
+    def path_signature():
+        """
+        Return a list of the entries on sys.path with the modification time
+        of each (or None if the entry doesn't exist). If any of these change,
+        the cached names are stale.
+        """
+        signature = []
+        for entry in sys.path:
+            try:
+                mtime = os.stat(entry or os.curdir).st_mtime
+            except OSError:
+                mtime = None
+            signature.append([entry, mtime])
+        return signature
+
+    def scan(self):
+        """
+        Return the set of names of all the modules that can be imported.
+        """
+        names = {name for _, name, _ in pkgutil.iter_modules()}
+        return names | set(sys.builtin_module_names) | {'sys', 'builtins'}
+
+    def refresh(self):
+        """
+        Use the cached names immediately and, if they're out of date, scan
+        the path and update the cache.
+        """
+        signature = self.path_signature()
+        cache = {}
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            logger.info('No module name cache found.')
+        except (OSError, ValueError):
+            logger.error('Could not read module name cache {}.'.format(
+                         self.cache_path))
+        if cache.get('names'):
+            self.names = self.names | set(cache['names'])
+            self.ready = True
+        if cache.get('path') == signature:
+            return
+        logger.info('Scanning Python path for module names.')
+        names = self.scan()
+        self.names = names
+        self.ready = True
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump({'path': signature, 'names': sorted(names)}, f)
+        except OSError:
+            logger.error('Could not write module name cache {}.'.format(
+                         self.cache_path))
+
+    def refresh_in_background(self):
+        """
+        Refresh the names in a daemon thread, so as not to hold up startup.
+        """
+        self._thread = threading.Thread(target=self.refresh, daemon=True)
+        self._thread.start()
+
+
+class FileReader(QObject):
+    """
+    Reads and decodes files in a pool of background threads.
+
+    The result for each file, either a tuple of its text and newline
+    convention or the exception raised while reading it, is passed to the
+    callback along with the file's path. This happens on the thread that
+    created the reader (usually the GUI thread) when Qt's event loop gets
+    round to it, or when collect is called.
+    """
+
+    #: Emitted (from a background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+    #: The maximum number of files read at the same time.
+    max_workers = 4
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.results = queue.Queue()
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.result_ready.connect(self.collect)
+
+    def read(self, path):
+        """
+        Queue the file at the referenced path to be read. Files are read in
+        the order they're queued.
+        """
+        self.pool.submit(self._read, path)
+
+    def _read(self, path):
+        """
+        Read the file (in a background thread).
+        """
+        try:
+            result = read_and_decode(path)
+        except Exception as ex:
+            result = ex
+        self.results.put((path, result))
+        self.result_ready.emit()
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Pass the results that have arrived so far to the callback.
+        """
+        while True:
+            try:
+                path, result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            self.callback(path, result)
+
+    def wait(self):
+        """
+        Block until all the queued files have been read and then pass their
+        results to the callback.
+        """
+        self.pool.shutdown(wait=True)
+        self.collect()
+
+
+class FileChangedError(Exception):
+    """
+    A file has been changed by another program since Mu last loaded or saved
+    it.
+    """
+
+
+class FileWriter(QObject):
+    """
+    Saves files in a background thread, so slow file systems (such as USB
+    attached devices or network drives) don't make the editor stutter.
+
+    Saves are queued for each path. If a file is saved again before the
+    previous save was written, only the latest content is written. Files are
+    replaced atomically where possible (see mu.files.write_atomically).
+
+    Once a file is saved the saved signal is emitted with the path and the
+    text written. If it cannot be saved the failed signal is emitted with the
+    path and the exception. As with FileReader, these are emitted on the
+    thread that created the writer (usually the GUI thread) when Qt's event
+    loop gets round to it, or when collect is called.
+    """
+
+    saved = pyqtSignal(str, str)
+    failed = pyqtSignal(str, object)
+    #: Emitted (from the background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.pending = {}  # The latest content to be written for each path.
+        self.written = {}  # The signature of each file after writing it.
+        self.lock = threading.Lock()
+        self.paths = queue.Queue()
+        self.results = queue.Queue()
+        self._thread = None
+        self.result_ready.connect(self.collect)
+
+    def save(self, path, text, newline, expected=None):
+        """
+        Queue the text to be saved to the referenced path with the given
+        newline convention.
+
+        If expected is given, it's the file's signature (see file_signature)
+        when Mu last loaded it. If the file has since been changed, other than
+        by this writer, it isn't written and FileChangedError is reported.
+        """
+        with self.lock:
+            queued = path in self.pending
+            self.pending[path] = (text, newline, expected)
+        if not queued:
+            self.paths.put(path)
+        if not (self._thread and self._thread.is_alive()):
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """
+        Write queued files (in the background thread).
+        """
+        while True:
+            path = self.paths.get()
+            try:
+                self._write(path)
+            finally:
+                self.paths.task_done()
+
+    def _write(self, path):
+        """
+        Write the latest content for the referenced path.
+        """
+        with self.lock:
+            text, newline, expected = self.pending.pop(path)
+        signature = file_signature(path)
+        try:
+            if expected and signature not in (expected,
+                                              self.written.get(path)):
+                raise FileChangedError(path)
+            save_and_encode(text, path, newline, atomic=True)
+        except Exception as ex:
+            self.results.put((self.failed, path, ex))
+        else:
+            self.written[path] = file_signature(path)
+            self.results.put((self.saved, path, text))
+        self.result_ready.emit()
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Emit the saved or failed signals for the files written so far.
+        """
+        while True:
+            try:
+                signal, path, result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            signal.emit(path, result)
+
+    def wait(self):
+        """
+        Block until everything queued has been written and then emit the
+        signals for them.
+        """
+        self.paths.join()
+        self.collect()
+
+
+class CodeChecker(QObject):
+    """
+    Checks code for problems in a worker process (see mu.checker.serve), so
+    checking long scripts doesn't freeze the editor.
+
+    The worker is started when code is first checked. The checked signal is
+    emitted with the type of annotation ('error' or 'style') and the feedback
+    for each part of the check as it arrives, and then finished is emitted. As
+    with FileReader, these are emitted on the thread that created the checker
+    (usually the GUI thread) when Qt's event loop gets round to it, or when
+    collect is called.
+
+    Only one check happens at a time: starting another, or cancelling, means
+    the results of the previous check are thrown away.
+    """
+
+    checked = pyqtSignal(str, dict)
+    finished = pyqtSignal()
+    #: Emitted (from a background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+    #: The parts of a check, in the order the worker sends them.
+    parts = ('error', 'style')
+
+    def __init__(self):
+        super().__init__()
+        self.job = None  # The number of the current check.
+        self.jobs = 0  # The number of checks started.
+        self.process = None
+        self.results = queue.Queue()
+        self.result_ready.connect(self.collect)
+
+    def start(self):
+        """
+        Start the worker process, and a thread to wait for its results.
+        """
+        # The worker runs mu.checker rather than Mu itself (as spawning a
+        # multiprocessing.Process would), so it doesn't import Qt and the
+        # rest of Mu, and it doesn't inherit Qt's threads.
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        flags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)  # Windows only.
+        self.process = subprocess.Popen([sys.executable, '-m', 'mu.checker'],
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, cwd=root,
+                                        creationflags=flags)
+        logger.info('Started code checker (pid {}).'.format(self.process.pid))
+        thread = threading.Thread(target=self._receive,
+                                  args=(self.process, ), daemon=True)
+        thread.start()
+
+    def _receive(self, process):
+        """
+        Pass on the results from the worker process (in the background
+        thread) until it stops.
+
+        If it dies, the parts of the current check that never arrived are
+        passed on with empty feedback, so finished is still emitted.
+        """
+        latest, arrived = None, set()  # The latest job, and its parts.
+        while True:
+            try:
+                result = pickle.load(process.stdout)
+            except (EOFError, pickle.UnpicklingError):
+                logger.error('The code checker stopped unexpectedly '
+                             '(exit code {}).'.format(process.wait()))
+                job = self.job
+                if job is not None:
+                    for part in self.parts:
+                        if not (job == latest and part in arrived):
+                            self.results.put((job, part, {}))
+                    self.result_ready.emit()
+                return
+            if result is None:
+                return
+            if result[0] != latest:
+                latest, arrived = result[0], set()
+            arrived.add(result[1])
+            self.results.put(result)
+            self.result_ready.emit()
+
+    def _send(self, request):
+        """
+        Send a request (see mu.checker.serve) to the worker process.
+        """
+        pickle.dump(request, self.process.stdin)
+        self.process.stdin.flush()
+
+    def check(self, filename, code, builtins=None, document=None):
+        """
+        Check the code (see mu.checker.check_flake for the arguments), in
+        place of any check already happening.
+
+        If a document is given (any value identifying where the code is
+        being edited) it's checked incrementally, using what the worker
+        knows about the last version of the document it checked (see
+        mu.checker.IncrementalCheck).
+        """
+        if not (self.process and self.process.poll() is None):
+            self.start()
+        self.jobs += 1
+        self.job = self.jobs
+        self._send((self.job, filename, code, builtins, document))
+
+    def cancel(self):
+        """
+        Throw away the results of the current check, if there is one.
+        """
+        self.job = None
+
+    def stop(self):
+        """
+        Stop the worker process.
+        """
+        self.cancel()
+        if self.process and self.process.poll() is None:
+            try:
+                self._send(None)
+                self.process.wait(1)
+            except (OSError, subprocess.TimeoutExpired):
+                logger.warning('Could not stop the code checker.')
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Emit the checked signal for the results of the current check that
+        have arrived so far, and finished once they all have.
+        """
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            self._emit(*result)
+
+    def wait(self, timeout=None):
+        """
+        Block until the current check is finished (or for at most timeout
+        seconds), emitting the signals for its results.
+        """
+        try:
+            while self.job is not None:
+                self._emit(*self.results.get(timeout=timeout))
+        except queue.Empty:
+            logger.warning('Timed out waiting for the code checker.')
+
+    def _emit(self, job, annotation_type, feedback):
+        """
+        Emit the signals for a result from the worker.
+        """
+        if job != self.job:
+            return  # From a cancelled check.
+        self.checked.emit(annotation_type, feedback)
+        if annotation_type == self.parts[-1]:
+            self.job = None
+            self.finished.emit()
+
+
+class CheckResults:
+    """
+    The results of checking the code in recently checked files, so checking
+    a file whose code hasn't changed (even after restarting Mu) costs
+    nothing.
+
+    The results for each path are kept with the key of the code that was
+    checked (see mu.checker.check_key). Only the results for the most
+    recently checked files are kept. They're read from a JSON file when first
+    needed, and written back by save.
+    """
+
+    #: The number of files for which results are kept.
+    size = 50
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.results = None  # Path: [key, results], until loaded.
+        self.changed = False
+
+    def load(self):
+        """
+        Read the cached results, if they haven't been already.
+        """
+        if self.results is not None:
+            return
+        self.results = OrderedDict()
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.error('Could not read check results cache {}.'.format(
+                         self.cache_path))
+            return
+        for file_path, (key, results) in cache:
+            # JSON object keys are strings, but line numbers are ints.
+            self.results[file_path] = [key, {
+                annotation_type: {int(line_no): messages
+                                  for line_no, messages in feedback.items()}
+                for annotation_type, feedback in results.items()}]
+
+    def get(self, path, key):
+        """
+        Return the results of checking the file at the referenced path, or
+        None if its code (as identified by the key) hasn't been checked.
+        """
+        self.load()
+        cached = self.results.get(path)
+        if cached is None or cached[0] != key:
+            return None
+        self.results.move_to_end(path)
+        return cached[1]
+
+    def put(self, path, key, results):
+        """
+        Remember the results of checking the file at the referenced path.
+        """
+        self.load()
+        self.results[path] = [key, results]
+        self.results.move_to_end(path)
+        while len(self.results) > self.size:
+            self.results.popitem(last=False)
+        self.changed = True
+
+    def save(self):
+        """
+        Write the results to the cache file, if they've changed.
+        """
+        if not self.changed:
+            return
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump(list(self.results.items()), f)
+        except OSError:
+            logger.error('Could not write check results cache {}.'.format(
+                         self.cache_path))
+        else:
+            self.changed = False
+
+
+class FileSearcher(QObject):
+    """
+    Finds (and optionally replaces) the matches for a pattern in the open
+    tabs and the files in a workspace directory, in a background thread, so
+    searching lots of files doesn't freeze the editor.
+
+    The matches in each file are reported with the found signal as soon as
+    they're found (see mu.search.find_matches). When replacing, the new text
+    of each file that isn't open in a tab is reported with the replaced
+    signal, along with its newline convention and signature (see
+    file_signature) so it can be saved, unless it's since been changed.
+    Once every file has been searched (or searching fails) the finished
+    signal is emitted with the number of matches and the number of files in
+    which they were found. As with FileWriter, these are emitted on the
+    thread that created the searcher when Qt's event loop gets round to it,
+    or when collect is called.
+
+    The text of each file read is kept with its signature, so the next search
+    only reads the files that have changed.
+    """
+
+    found = pyqtSignal(str, list)
+    replaced = pyqtSignal(str, str, str, object)
+    finished = pyqtSignal(int, int)
+    #: Emitted (from the background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.job = 0  # The current search. Results from others are ignored.
+        self.texts = {}  # Path: signature, text and newline convention.
+        self.results = queue.Queue()
+        self._thread = None
+        self.result_ready.connect(self.collect)
+
+    def search(self, pattern, buffers, paths, replacement=None):
+        """
+        Search the buffers (the text in each open tab, keyed by path) and
+        then the files at the referenced paths for the compiled pattern, in
+        place of any search already happening. If a replacement function is
+        given (see mu.search.replacer) the matches are to be replaced.
+        """
+        self.job += 1
+        self._thread = threading.Thread(
+            target=self._run, args=(self.job, pattern, buffers, paths,
+                                    replacement), daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """
+        Stop the current search. Anything it's yet to report is ignored.
+        """
+        self.job += 1
+
+    def _run(self, job, pattern, buffers, paths, replacement):
+        """
+        Search the buffers and files (in the background thread).
+        """
+        total = files = 0
+        try:
+            sources = list(buffers.items()) + [(file_path, None)
+                                               for file_path in paths]
+            for file_path, text in sources:
+                if job != self.job:
+                    return
+                signature = newline = None
+                if text is None:
+                    signature, text, newline = self._read(file_path)
+                    if text is None:
+                        continue
+                matches = search.find_matches(pattern, text, replacement)
+                if not matches:
+                    continue
+                total += len(matches)
+                files += 1
+                self._put(job, self.found, file_path, matches)
+                if replacement and file_path not in buffers:
+                    new_text, _ = search.replace_matches(pattern, text,
+                                                         replacement)
+                    self._put(job, self.replaced, file_path, new_text, newline,
+                              signature)
+        except Exception:
+            # Report what was found so far, rather than leaving the search
+            # unfinished.
+            logger.exception('Could not finish searching.')
+        self._put(job, self.finished, total, files)
+
+    def _read(self, path):
+        """
+        Return the signature, text and newline convention of the file at the
+        referenced path, reading it only if it's changed since it was last
+        read. The text is None if the file can't be read or isn't text.
+        """
+        signature = file_signature(path)
+        cached = self.texts.get(path)
+        if cached and cached[0] == signature:
+            return cached
+        try:
+            text, newline = read_and_decode(path)
+        except (OSError, UnicodeDecodeError) as ex:
+            logger.warning('Could not search {}: {}'.format(path, ex))
+            text = newline = None
+        if text and '\0' in text:
+            text = None  # A binary file.
+        self.texts[path] = (signature, text, newline)
+        return self.texts[path]
+
+    def _put(self, job, signal, *args):
+        """
+        Queue the signal to be emitted with the arguments (from the
+        background thread).
+        """
+        self.results.put((job, signal, args))
+        self.result_ready.emit()
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Emit the signals for the results of the current search found so far.
+        """
+        while True:
+            try:
+                job, signal, args = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if job == self.job:
+                signal.emit(*args)
+
+    def wait(self):
+        """
+        Block until the current search is finished and then emit the signals
+        for its results.
+        """
+        if self._thread:
+            self._thread.join()
+        self.collect()
+
+
+class LogSearcher(QObject):
+    """
+    Searches a log file (see mu.logs.LogFile.search) in a background thread,
+    so filtering a large log doesn't freeze the log viewer.
+
+    The found signal is emitted with the matching records once the search is
+    finished. As with FileWriter, this is emitted on the thread that created
+    the searcher when Qt's event loop gets round to it, or when collect is
+    called. Starting another search, or cancelling, stops the current search.
+    """
+
+    found = pyqtSignal(str)
+    #: Emitted (from the background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.job = 0  # The current search. Results from others are ignored.
+        self.results = queue.Queue()
+        self._thread = None
+        self.result_ready.connect(self.collect)
+
+    def search(self, log_file, text='', level=None):
+        """
+        Search the log file for the records containing the text at or above
+        the level, in place of any search already happening.
+        """
+        self.job += 1
+        self._thread = threading.Thread(
+            target=self._run, args=(self.job, log_file, text, level),
+            daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """
+        Stop the current search. Its result is ignored.
+        """
+        self.job += 1
+
+    def _run(self, job, log_file, text, level):
+        """
+        Search the log file (in the background thread).
+        """
+        records = log_file.search(text, level,
+                                  cancelled=lambda: job != self.job)
+        if records is not None:
+            self.results.put((job, records))
+            self.result_ready.emit()
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Emit the found signal for the current search, if it's finished.
+        """
+        while True:
+            try:
+                job, records = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if job == self.job:
+                self.found.emit(records)
+
+    def wait(self):
+        """
+        Block until the current search is finished and then emit the found
+        signal.
+        """
+        if self._thread:
+            self._thread.join()
+        self.collect()
+
+
+class SymbolIndex(QObject):
+    """
+    The modules, classes and functions defined in Python files (see
+    mu.symbols.find_symbols), offered for autocomplete and call tips in every
+    tab, and used to go to their definitions.
+
+    Files are read and parsed in a background thread, and only if they've
+    changed since they were last parsed. The symbols are kept (with the
+    signature of each file, see file_signature) in a JSON file, written by
+    save, so after restarting Mu only the files changed in the meantime are
+    parsed. The cached symbols are read in the background thread too. If a
+    file can't be parsed (e.g. it's being edited) the symbols found before
+    are kept. When the workspace changes, the symbols of files no longer in
+    use are forgotten (see update).
+
+    When the symbols change the changed signal is emitted. As with
+    FileWriter, this is emitted on the thread that created the index when
+    Qt's event loop gets round to it, or when collect is called.
+    """
+
+    changed = pyqtSignal()
+    #: Emitted (from the background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+
+    def __init__(self, cache_path):
+        super().__init__()
+        self.cache_path = cache_path
+        self.files = {}  # Path: [signature, symbols] of each file indexed.
+        self.modified = False  # Whether the cache file is out of date.
+        self.paths = queue.Queue()
+        self.results = queue.Queue()
+        self._signatures = {}  # Path: signature (in the background thread).
+        self._entries = None  # API entries, until the symbols change.
+        self._thread = None
+        self.result_ready.connect(self.collect)
+
+    def update(self, paths, forget_others=False):
+        """
+        Queue the Python files at the referenced paths to be indexed, if
+        they've changed. If forget_others is True, the symbols of any other
+        files (e.g. in a workspace no longer in use) are forgotten.
+        """
+        if not (self._thread and self._thread.is_alive()):
+            self.paths.put(None)  # Read the cache first.
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        paths = [os.path.abspath(file_path) for file_path in paths]
+        if forget_others:
+            self.paths.put(set(paths))
+        for file_path in paths:
+            self.paths.put(file_path)
+
+    def _run(self):
+        """
+        Read the cached symbols, forget the files no longer wanted and index
+        the queued files (in the background thread).
+        """
+        while True:
+            item = self.paths.get()
+            try:
+                if item is None:
+                    self._load()
+                elif isinstance(item, set):
+                    self._forget_others(item)
+                else:
+                    self._index(item)
+            finally:
+                self.paths.task_done()
+
+    def _load(self):
+        """
+        Report the cached symbols, and then check their files for changes.
+        """
+        try:
+            with open(self.cache_path) as f:
+                cache = [(file_path, signature, found) for
+                         file_path, (signature, found) in json.load(f)]
+        except FileNotFoundError:
+            return
+        except (OSError, TypeError, ValueError):
+            logger.error('Could not read symbol cache {}.'.format(
+                         self.cache_path))
+            return
+        for file_path, signature, found in cache:
+            self._signatures[file_path] = signature
+            self.results.put((file_path, signature, found))
+        self.result_ready.emit()
+        for file_path, _, _ in cache:
+            self._index(file_path)
+
+    def _forget_others(self, paths):
+        """
+        Report that the files indexed, other than those at the referenced
+        paths, are removed.
+        """
+        for file_path in list(self._signatures):
+            if file_path not in paths:
+                del self._signatures[file_path]
+                self.results.put((file_path, None, None))
+        self.result_ready.emit()
+
+    def _index(self, path):
+        """
+        Parse the file at the referenced path, if it's changed, and report
+        the symbols found in it.
+        """
+        signature = file_signature(path)
+        if signature is not None:
+            signature = list(signature)  # As it is in the JSON cache.
+        if signature == self._signatures.get(path):
+            return
+        self._signatures[path] = signature
+        found = None
+        if signature is not None:
+            try:
+                text, _ = read_and_decode(path)
+                found = symbols.find_symbols(text, symbols.module_name(path))
+            except (OSError, UnicodeDecodeError, SyntaxError,
+                    ValueError) as ex:
+                logger.info('Could not index {}: {}'.format(path, ex))
+            except Exception:
+                # Don't let one file (e.g. too deeply nested to parse) stop
+                # the rest being indexed.
+                logger.exception('Could not index {}.'.format(path))
+        self.results.put((path, signature, found))
+        self.result_ready.emit()
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Update the symbols with those found so far, and emit the changed
+        signal if they're different.
+        """
+        changed = False
+        while True:
+            try:
+                path, signature, found = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.modified = True
+            old = self.files.get(path, [None, []])[1]
+            if signature is None:
+                self.files.pop(path, None)  # The file's been removed.
+                found = []
+            else:
+                if found is None:
+                    found = old  # It couldn't be parsed.
+                self.files[path] = [signature, found]
+            changed = changed or found != old
+        if changed:
+            self._entries = None
+            self.changed.emit()
+
+    def wait(self):
+        """
+        Block until the queued files have been indexed and then update the
+        symbols.
+        """
+        self.paths.join()
+        self.collect()
+
+    def api(self):
+        """
+        Return the API entries for all the symbols (see
+        mu.symbols.api_entry).
+        """
+        if self._entries is None:
+            self._entries = sorted(symbols.api_entry(symbol)
+                                   for _, found in self.files.values()
+                                   for symbol in found)
+        return self._entries
+
+    def definitions(self, name):
+        """
+        Return a list of the paths of the files that define the named
+        symbol, along with its definition in each.
+        """
+        definitions = []
+        for file_path in sorted(self.files):
+            for symbol in self.files[file_path][1]:
+                if symbol['name'].rsplit('.', 1)[-1] == name:
+                    definitions.append((file_path, symbol))
+        return definitions
+
+    def save(self):
+        """
+        Write the symbols to the cache file, if they've changed.
+        """
+        if not self.modified:
+            return
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump(sorted(self.files.items()), f)
+        except OSError:
+            logger.error('Could not write symbol cache {}.'.format(
+                         self.cache_path))
+        else:
+            self.modified = False
+
+
+class Outliner(QObject):
+    """
+    Outlines the code in tabs in a background thread, so outlining a long
+    script never holds up typing.
+
+    What's known about the last version of each of the most recently
+    outlined documents is kept, so outlining one again only outlines the
+    top-level statements that have changed (see
+    mu.outline.IncrementalOutline). If requests arrive while the thread is
+    busy, only the latest is outlined.
+
+    The outlined signal is emitted with the document and its outline. As
+    with FileWriter, this is emitted on the thread that created the
+    outliner when Qt's event loop gets round to it, or when collect is
+    called.
+    """
+
+    outlined = pyqtSignal(object, list)
+    #: Emitted (from the background thread) when a result is waiting.
+    result_ready = pyqtSignal()
+    #: The number of documents for which what's known is kept.
+    size = 10
+
+    def __init__(self):
+        super().__init__()
+        self.job = 0  # The latest request. Results for others are ignored.
+        self.documents = OrderedDict()  # Document: IncrementalOutline.
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self._thread = None
+        self.result_ready.connect(self.collect)
+
+    def outline(self, document, code):
+        """
+        Outline the code being edited in the document (any value identifying
+        where it's being edited), in place of any request waiting.
+        """
+        self.job += 1
+        self.requests.put((self.job, document, code))
+        if not (self._thread and self._thread.is_alive()):
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """
+        Outline the latest request (in the background thread).
+        """
+        while True:
+            request = self.requests.get()
+            try:
+                while True:
+                    try:
+                        newer = self.requests.get_nowait()
+                    except queue.Empty:
+                        break
+                    self.requests.task_done()
+                    request = newer
+                self._outline(*request)
+            finally:
+                self.requests.task_done()
+
+    def _outline(self, job, document, code):
+        """
+        Outline the code, using what's known about the document.
+        """
+        if document not in self.documents:
+            self.documents[document] = outline.IncrementalOutline()
+            if len(self.documents) > self.size:
+                self.documents.popitem(last=False)
+        self.documents.move_to_end(document)
+        items = self.documents[document].outline(code)
+        self.results.put((job, document, items))
+        self.result_ready.emit()
+
+    @pyqtSlot()
+    def collect(self):
+        """
+        Emit the outlined signal for the latest request, if it's been
+        outlined.
+        """
+        while True:
+            try:
+                job, document, items = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if job == self.job:
+                self.outlined.emit(document, items)
+
+    def wait(self):
+        """
+        Block until the requests have been outlined and then emit the
+        outlined signal.
+        """
+        self.requests.join()
+        self.collect()
@@ -0,0 +1,111 @@
+"""
+Keeps track of the files in the workspace directories used by Mu.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import logging
+from PyQt5.QtCore import QObject, pyqtSignal
+from mu.watcher import FileWatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+# The index for each directory, shared by everything that needs it.
+_INDEXES = {}
+
+
+class WorkspaceIndex(QObject):
+    """
+    The names of the files in a directory, kept up to date as files are added
+    to or removed from it.
+
+    The directory is listed with os.scandir, which finds out whether each
+    entry is a file as part of the listing rather than with a call per entry.
+    It's watched (see mu.watcher.FileWatcher) so it's only listed again when
+    something changes. The changed signal is emitted with the names of the
+    files added and removed so views can update just those entries. If the
+    directory can't be watched, it's listed again each time the files are
+    asked for.
+    """
+
+    #: Emitted with the (sorted) names of the files added and removed.
+    changed = pyqtSignal(list, list)
+
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.names = None  # Until the directory is first listed.
+        self.watching = False
+        self.watcher = FileWatcher(parent=self)
+        self.watcher.file_changed.connect(self.refresh)
+
+    def scan(self):
+        """
+        Return the set of names of the files in the directory.
+        """
+        names = set()
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            names.add(entry.name)
+                    except OSError:
+                        continue  # Removed while being listed.
+        except OSError as ex:
+            logger.warning('Could not list {}: {}'.format(self.directory, ex))
+        return names
+
+    def refresh(self):
+        """
+        List the directory again and emit the changed signal if files have
+        been added or removed. Returns the names of the files added and
+        removed.
+        """
+        names = self.scan()
+        old = self.names or set()
+        added = sorted(names - old)
+        removed = sorted(old - names)
+        self.names = names
+        if added or removed:
+            logger.debug('Files added to {}: {}, removed: {}'.format(
+                self.directory, added, removed))
+            self.changed.emit(added, removed)
+        return added, removed
+
+    def files(self):
+        """
+        Return the sorted names of the files in the directory.
+        """
+        if self.names is None:
+            self.watching = self.watcher.watch(self.directory)
+            self.refresh()
+        elif not self.watching:
+            self.refresh()
+        return sorted(self.names)
+
+
+def workspace_index(directory):
+    """
+    Return the index of the files in the referenced directory, shared with
+    everything else that asks for it.
+    """
+    directory = os.path.abspath(directory)
+    if directory not in _INDEXES:
+        _INDEXES[directory] = WorkspaceIndex(directory)
+    return _INDEXES[directory]
@@ -4,8 +4,12 @@ Tests for the user interface elements of Mu.
 """
 from PyQt5.QtWidgets import QApplication, QDialog, QWidget
 from unittest import mock
-from mu.modes import PythonMode, AdafruitMode, MicrobitMode, DebugMode
+from mu.modes.python3 import PythonMode
+from mu.modes.adafruit import AdafruitMode
+from mu.modes.microbit import MicrobitMode
+from mu.modes.debugger import DebugMode
 import mu.interface.dialogs
+import mu.logs
 import pytest
 
 
@@ -96,16 +100,125 @@ def test_ModeSelector_get_mode():
         ms.get_mode()
 
 
-def test_LogWidget_setup():
+def log_widget(tmpdir, log, chunk_size=None):
     """
-    Ensure the log widget displays the referenced log file string in the
-    expected way.
+    Return a LogWidget showing a log file containing the referenced text.
     """
-    log = 'this is the contents of a log file'
+    log_path = tmpdir.join('mu.log')
+    log_path.write_binary(log.encode('utf-8'))
     lw = mu.interface.dialogs.LogWidget()
-    lw.setup(log)
+    chunk_size = chunk_size or mu.logs.CHUNK_SIZE
+    with mock.patch('mu.interface.dialogs.LogFile',
+                    lambda p: mu.logs.LogFile(p, chunk_size)):
+        lw.setup(str(log_path))
+    return lw, log_path
+
+
+def test_LogWidget_setup(tmpdir):
+    """
+    Ensure the log widget displays the referenced log file in the expected
+    way.
+    """
+    log = 'this is the contents of a log file\n'
+    lw, log_path = log_widget(tmpdir, log)
     assert lw.log_text_area.toPlainText() == log
     assert lw.log_text_area.isReadOnly()
+    assert lw.follow_timer.isActive()
+    lw.stop()
+    assert not lw.follow_timer.isActive()
+
+
+def test_LogWidget_tail(tmpdir):
+    """
+    Only the end of a large log is shown, and earlier chunks are loaded when
+    scrolled to the top.
+    """
+    lines = ['line {}\n'.format(i) for i in range(200)]
+    lw, log_path = log_widget(tmpdir, ''.join(lines), chunk_size=100)
+    shown = lw.log_text_area.toPlainText()
+    assert shown.endswith(lines[-1])
+    assert lines[0] not in shown
+    lw.load_earlier()
+    assert lw.log_text_area.toPlainText().endswith(shown)
+    assert len(lw.log_text_area.toPlainText()) > len(shown)
+
+
+def test_LogWidget_on_scroll(tmpdir):
+    """
+    Earlier chunks are only loaded when scrolled to the top of an unfiltered
+    log.
+    """
+    lw, log_path = log_widget(tmpdir, 'foo\n')
+    lw.load_earlier = mock.MagicMock()
+    lw.on_scroll(1)
+    assert lw.load_earlier.call_count == 0
+    lw.on_scroll(0)
+    assert lw.load_earlier.call_count == 1
+    lw.filtered = True
+    lw.on_scroll(0)
+    assert lw.load_earlier.call_count == 1
+
+
+def test_LogWidget_follow(tmpdir):
+    """
+    Lines added to the log are appended, and the log is shown again from
+    the end if it's been rotated.
+    """
+    lw, log_path = log_widget(tmpdir, 'foo\n')
+    log_path.write_binary(b'foo\nbar\nba')
+    lw.follow()
+    assert lw.log_text_area.toPlainText() == 'foo\nbar\n'
+    log_path.write_binary(b'baz\n')
+    lw.follow()
+    assert lw.log_text_area.toPlainText() == 'baz\n'
+    lw.filtered = True
+    log_path.write_binary(b'baz\nqux\n')
+    lw.follow()
+    assert lw.log_text_area.toPlainText() == 'baz\n'
+
+
+def test_LogWidget_apply_filter(tmpdir):
+    """
+    Filtering by level and text shows matching records from the whole log,
+    and clearing the filter shows the end of the log again.
+    """
+    log = ('2018-06-01 12:00:00,000 - mu.logic:1(foo) INFO: hello\n'
+           '2018-06-01 12:00:01,000 - mu.logic:2(foo) ERROR: oops\n'
+           'Traceback\n'
+           '2018-06-01 12:00:02,000 - mu.logic:3(foo) DEBUG: hello again\n')
+    lw, log_path = log_widget(tmpdir, log)
+    lw.filter_text.setText('HELLO')
+    assert lw.filter_timer.isActive()
+    lw.apply_filter()
+    assert not lw.filter_timer.isActive()
+    assert lw.filtered
+    lw.searcher.wait()
+    assert lw.log_text_area.toPlainText() == (
+        '2018-06-01 12:00:00,000 - mu.logic:1(foo) INFO: hello\n'
+        '2018-06-01 12:00:02,000 - mu.logic:3(foo) DEBUG: hello again\n')
+    lw.filter_text.setText('')
+    lw.level.setCurrentIndex(lw.level.findData('WARNING'))
+    lw.searcher.wait()
+    assert lw.log_text_area.toPlainText() == (
+        '2018-06-01 12:00:01,000 - mu.logic:2(foo) ERROR: oops\n'
+        'Traceback\n')
+    lw.level.setCurrentIndex(0)
+    assert not lw.filtered
+    assert lw.log_text_area.toPlainText() == log
+
+
+def test_LogWidget_apply_filter_stale(tmpdir):
+    """
+    The result of a search superseded by clearing the filter isn't shown.
+    """
+    log = '2018-06-01 12:00:00,000 - mu.logic:1(foo) INFO: hello\n'
+    lw, log_path = log_widget(tmpdir, log)
+    lw.filter_text.setText('bye')
+    lw.apply_filter()
+    lw.filter_text.setText('')
+    lw.apply_filter()
+    lw.searcher.wait()
+    assert lw.log_text_area.toPlainText() == log
 
 
 def test_EnvironmentVariablesWidget_setup():
@@ -133,22 +246,37 @@ def test_MicrobitSettingsWidget_setup():
     assert mbsw.runtime_path.text() == '/foo/bar'
 
 
-def test_AdminDialog_setup():
+def test_CheckerSettingsWidget_setup():
+    """
+    Ensure the widget for editing settings related to checking code displays
+    the referenced settings data in the expected way.
+    """
+    csw = mu.interface.dialogs.CheckerSettingsWidget()
+    csw.setup(True)
+    assert csw.check_as_you_type.isChecked()
+
+
+def test_AdminDialog_setup(tmpdir):
     """
     Ensure the admin dialog is setup properly given the content of a log
     file and envars.
     """
-    log = 'this is the contents of a log file'
+    log = 'this is the contents of a log file\n'
+    log_path = tmpdir.join('mu.log')
+    log_path.write(log)
     settings = {
         'envars': 'name=value',
         'minify': True,
         'microbit_runtime': '/foo/bar',
+        'check_as_you_type': True,
     }
     mock_window = QWidget()
     ad = mu.interface.dialogs.AdminDialog(mock_window)
-    ad.setup(log, settings)
+    ad.setup(str(log_path), settings)
     assert ad.log_widget.log_text_area.toPlainText() == log
     assert ad.settings() == settings
+    ad.done(QDialog.Accepted)
+    assert not ad.log_widget.follow_timer.isActive()
 
 
 def test_FindReplaceDialog_setup():
@@ -176,3 +304,27 @@ def test_FindReplaceDialog_setup_with_args():
     assert frd.find() == find
     assert frd.replace() == replace
     assert frd.replace_flag()
+
+
+def test_FindReplaceDialog_options():
+    """
+    The options for finding the term are shown, defaulting to a case
+    sensitive search of the current tab for the literal text.
+    """
+    frd = mu.interface.dialogs.FindReplaceDialog()
+    frd.setup()
+    assert frd.options() == {
+        'regex': False,
+        'case_sensitive': True,
+        'whole_word': False,
+        'all_files': False,
+    }
+    options = {
+        'regex': True,
+        'case_sensitive': False,
+        'whole_word': True,
+        'all_files': True,
+    }
+    frd = mu.interface.dialogs.FindReplaceDialog()
+    frd.setup('foo', 'bar', False, options)
+    assert frd.options() == options
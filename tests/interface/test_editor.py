@@ -2,8 +2,10 @@
 """
 Tests for the user interface elements of Mu.
 """
+from contextlib import contextmanager
 from unittest import mock
 import mu.interface.editor
+import mu.interface.themes
 import keyword
 import re
 from PyQt5.QtCore import Qt, QMimeData, QUrl, QPointF
@@ -47,6 +49,122 @@ def test_EditorPane_init():
         assert editor.newline == '\r\n'
 
 
+def test_is_large():
+    """
+    Text with too many characters or lines is large.
+    """
+    with mock.patch('mu.interface.editor.LARGE_FILE_SIZE', 10), \
+            mock.patch('mu.interface.editor.LARGE_FILE_LINES', 3):
+        assert not mu.interface.editor.is_large('a\nb\nc\n')
+        assert mu.interface.editor.is_large('a\nb\nc\nd\n')
+        assert mu.interface.editor.is_large('x' * 11)
+
+
+@contextmanager
+def large_editor_pane(text, chunk_size=4):
+    """
+    Return an EditorPane in large file mode for the referenced text, loaded
+    the referenced number of characters at a time.
+    """
+    with mock.patch('mu.interface.editor.is_large', return_value=True), \
+            mock.patch('mu.interface.editor.LOAD_CHUNK_SIZE', chunk_size):
+        ep = mu.interface.editor.EditorPane('/foo/data.csv', text)
+        yield ep
+
+
+def test_EditorPane_large_file():
+    """
+    Large files aren't lexed and autocomplete only uses the API.
+    """
+    with large_editor_pane('foo\n') as ep:
+        ep.finish_loading()
+        assert ep.large
+        assert isinstance(ep.lexer, mu.interface.editor.PlainLexer)
+        assert ep.lexer.lexer() == 'null'
+        assert ep.autoCompletionSource() == ep.AcsAPIs
+    ep = mu.interface.editor.EditorPane('/foo/bar.py', 'foo\n')
+    assert not ep.large
+    assert ep.autoCompletionSource() == ep.AcsAll
+
+
+def test_EditorPane_large_file_chunks():
+    """
+    Large files are loaded a chunk of lines at a time, while the editor is
+    read only. The whole text is available meanwhile, and loading doesn't
+    modify the editor or add to the undo history.
+    """
+    text = 'one\ntwo\nthree\nfour'
+    with large_editor_pane(text) as ep:
+        assert ep.loading
+        assert ep.isReadOnly()
+        assert ep.text() == text
+        assert ep.lines() == 3  # "one", "two" and the start of the next.
+        ep.setReadOnly(False)
+        assert ep.isReadOnly()
+        assert ep.load_next_chunk()
+        assert ep.lines() == 4
+        assert not ep.load_next_chunk()
+        assert not ep.loading
+        assert not ep.isReadOnly()
+        assert ep.text() == text
+        assert not ep.isModified()
+        assert not ep.isUndoAvailable()
+        assert not ep.load_next_chunk()
+
+
+def test_EditorPane_large_file_loaded_when_idle():
+    """
+    The rest of a large file is added when the event loop is idle.
+    """
+    with large_editor_pane('one\ntwo\nthree\n') as ep:
+        assert ep._load_timer.isActive()
+        ep._load_timer.timeout.emit()
+        ep._load_timer.timeout.emit()
+        assert not ep.loading
+        assert not ep._load_timer.isActive()
+
+
+def test_EditorPane_large_file_set_text():
+    """
+    Setting the text of the editor abandons loading.
+    """
+    with large_editor_pane('one\ntwo\nthree\n') as ep:
+        ep.setReadOnly(True)
+        ep.setText('foo')
+        assert not ep.loading
+        assert ep.text() == 'foo'
+        assert ep.isReadOnly()
+
+
+def test_EditorPane_set_text_large():
+    """
+    Setting text that's large (or no longer is), as when a file is reloaded,
+    switches large file mode, keeping the theme and API.
+    """
+    ep = mu.interface.editor.EditorPane('/foo/bar.py', 'foo\n')
+    ep.set_api(['foo.bar(x)'])
+    theme = mu.interface.themes.NightTheme
+    ep.set_theme(theme)
+    with mock.patch('mu.interface.editor.is_large', return_value=True):
+        ep.setText('one\ntwo\n')
+    assert ep.large
+    assert isinstance(ep.lexer, mu.interface.editor.PlainLexer)
+    assert ep.lexer.apis() is ep.api
+    assert ep.autoCompletionSource() == ep.AcsAPIs
+    assert ep.theme is theme
+    assert ep.lexer.paper(0) == theme.Paper
+    assert ep.text() == 'one\ntwo\n'
+    ep.setText('foo\n')
+    assert not ep.large
+    assert not isinstance(ep.lexer, mu.interface.editor.PlainLexer)
+    assert ep.lexer.lexer() == 'python'
+    assert ep.lexer.apis() is ep.api
+    assert ep.autoCompletionSource() == ep.AcsAll
+    lexer = ep.lexer
+    ep.setText('bar\n')
+    assert ep.lexer is lexer
+
+
 def test_EditorPane_configure():
     """
     Check the expected configuration takes place. NOTE - this is checking the
@@ -90,7 +208,7 @@ def test_EditorPane_configure():
     assert ep.setBraceMatching.call_count == 1
     assert ep.SendScintilla.call_count == 1
     assert ep.set_theme.call_count == 1
-    assert ep.markerDefine.call_count == 1
+    assert ep.markerDefine.call_count == 2
     assert ep.setMarginSensitivity.call_count == 2
     assert ep.setIndicatorDrawUnder.call_count == 1
     assert ep.setAnnotationDisplay.call_count == 1
@@ -125,12 +243,53 @@ def test_EditorPane_set_theme():
     ep = mu.interface.editor.EditorPane('/foo/bar.py', 'baz')
     ep.lexer = mock.MagicMock()
     mock_api = mock.MagicMock()
-    with mock.patch('mu.interface.editor.QsciAPIs',
+    with mock.patch('mu.interface.editor.get_prepared_api',
                     return_value=mock_api) as mapi:
-        ep.set_api(api)
-        mapi.assert_called_once_with(ep.lexer)
+        ep.set_api(api, ['foo.bar(x)'])
+        mapi.assert_called_once_with(api, ['foo.bar(x)'])
+    assert ep.api is mock_api
+    assert ep.api_definitions is api
+    assert ep.api_lexer is mock_api.parent()
+    ep.lexer.setAPIs.assert_called_once_with(mock_api)
+
+
+def test_get_prepared_api():
+    """
+    APIs are only prepared once for each list of definitions and then shared.
+    """
+    mock_api = mock.MagicMock()
+    with mock.patch('mu.interface.editor._PREPARED_APIS', {}), \
+            mock.patch('mu.interface.editor.QsciAPIs',
+                       return_value=mock_api) as mapi:
+        api = mu.interface.editor.get_prepared_api(['api help text', ])
+        assert api is mock_api
         mock_api.add.assert_called_once_with('api help text')
         mock_api.prepare.assert_called_once_with()
+        assert mu.interface.editor.get_prepared_api(['api help text', ]) \
+            is mock_api
+        assert mapi.call_count == 1
+        mu.interface.editor.get_prepared_api(['other help text', ])
+        assert mapi.call_count == 2
+
+
+def test_get_prepared_api_symbols():
+    """
+    The APIs include the entries for the symbols defined in the workspace.
+    When these change, the APIs prepared with the old symbols are forgotten.
+    """
+    cache = {}
+    with mock.patch('mu.interface.editor._PREPARED_APIS', cache), \
+            mock.patch('mu.interface.editor.QsciAPIs') as mapi:
+        mu.interface.editor.get_prepared_api(['api help text', ])
+        mapi.return_value.add.reset_mock()
+        api = mu.interface.editor.get_prepared_api(['api help text', ],
+                                                   ['foo.bar(x)'])
+        assert api.add.call_args_list == [mock.call('api help text'),
+                                          mock.call('foo.bar(x)')]
+        assert list(cache) == [(('api help text', ), ('foo.bar(x)', ))]
+        mu.interface.editor.get_prepared_api(['other help text', ],
+                                             ['foo.bar(x)'])
+        assert len(cache) == 2
 
 
 def test_EditorPane_label():
@@ -322,6 +481,102 @@ def test_EditorPane_show_annotations():
                                         ep.annotationDisplay())
 
 
+def test_EditorPane_show_annotations_tracks_lines():
+    """
+    Ensure annotated lines are marked, so they can be found again when lines
+    above them change.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\nc\n')
+    ep.check_indicators['error']['markers'] = {
+        1: [{'message': 'message 1', 'line_no': 1}],
+    }
+    ep.show_annotations()
+    assert list(ep.check_handles) == [1]
+    assert ep.markerLine(ep.check_handles[1]) == 1
+    ep.reset_check_indicators()
+    assert ep.check_handles == {}
+
+
+def test_EditorPane_annotation_text():
+    """
+    The text of a line's annotation combines the messages of each type.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'baz')
+    ep.check_indicators['error']['markers'] = {
+        1: [{'message': 'message 1', 'line_no': 1}],
+    }
+    ep.check_indicators['style']['markers'] = {
+        1: [{'message': 'message 2', 'line_no': 1}],
+    }
+    assert ep.annotation_text(1) == '\u2191 message 1\n\u2191 message 2'
+    assert ep.annotation_text(2) == ''
+
+
+def test_EditorPane_update_annotations():
+    """
+    Only the lines where the feedback has changed are annotated again.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\nc\nd\n')
+    ep.annotate = mock.MagicMock()
+    ep.update_annotations({
+        'error': {0: [{'message': 'one', 'line_no': 0, 'column': 1}]},
+        'style': {2: [{'message': 'two', 'line_no': 2, 'column': 0}]},
+    })
+    assert ep.annotate.call_count == 2
+    ep.annotate.assert_any_call(0, '\u2191 one', ep.annotationDisplay())
+    ep.annotate.assert_any_call(2, '\u2191 two', ep.annotationDisplay())
+    assert sorted(ep.check_handles) == [0, 2]
+    ep.annotate.reset_mock()
+    ep.clearAnnotations = mock.MagicMock()
+    ep.update_annotations({
+        'error': {0: [{'message': 'one', 'line_no': 0, 'column': 1}]},
+        'style': {3: [{'message': 'three', 'line_no': 3, 'column': 0}]},
+    })
+    ep.annotate.assert_called_once_with(3, '\u2191 three',
+                                        ep.annotationDisplay())
+    ep.clearAnnotations.assert_called_once_with(2)
+    assert sorted(ep.check_handles) == [0, 3]
+    assert ep.check_indicators['style']['markers'] == {
+        3: [{'message': 'three', 'line_no': 3, 'column': 0}],
+    }
+
+
+def test_EditorPane_update_annotations_moved_lines():
+    """
+    Annotations move with their lines when lines are added above them, so
+    the same feedback about the moved lines doesn't annotate them again.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\nc\n')
+    ep.update_annotations({
+        'error': {1: [{'message': 'one', 'line_no': 1, 'column': 0}]},
+    })
+    ep.insertAt('x\ny\n', 0, 0)
+    ep.annotate = mock.MagicMock()
+    ep.update_annotations({
+        'error': {3: [{'message': 'one', 'line_no': 3, 'column': 0}]},
+    })
+    assert ep.annotate.call_count == 0
+    assert list(ep.check_handles) == [3]
+    assert ep.check_indicators['error']['markers'] == {
+        3: [{'message': 'one', 'line_no': 3, 'column': 0}],
+    }
+
+
+def test_EditorPane_update_annotations_cleared():
+    """
+    When there's no feedback, all the annotations are removed.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\nc\n')
+    ep.update_annotations({
+        'error': {1: [{'message': 'one', 'line_no': 1, 'column': 0}]},
+    })
+    ep.clearAnnotations = mock.MagicMock()
+    ep.update_annotations({})
+    ep.clearAnnotations.assert_called_once_with(1)
+    assert ep.check_handles == {}
+    assert ep.check_indicators['error']['markers'] == {}
+
+
 def test_EditorPane_find_next_match():
     """
     Ensures that the expected arg values are passed through to QsciScintilla
@@ -490,6 +745,208 @@ def test_EditorPane_highlight_selected_matches_cursor_remains():
     assert ep.getCursorPosition() == (line1, index1 - select_n_chars)
 
 
+def lines_on_screen(ep, lines):
+    """
+    Pretend the referenced number of lines fit on the editor's screen.
+    """
+    send = ep.SendScintilla
+
+    def send_scintilla(message, *args):
+        if message == ep.SCI_LINESONSCREEN:
+            return lines
+        return send(message, *args)
+
+    ep.SendScintilla = send_scintilla
+
+
+def test_EditorPane_highlight_selected_matches_large_file():
+    """
+    In large file mode only the matches on (or near) the screen are
+    highlighted, and the highlights are refreshed when scrolling.
+    """
+    text = 'foo bar foo\n' * 100
+    with large_editor_pane(text, chunk_size=len(text)) as ep:
+        ep.finish_loading()
+        ep.firstVisibleLine = mock.MagicMock(return_value=10)
+        lines_on_screen(ep, 5)
+        ep.setSelection(12, 0, 12, 3)
+        positions = ep.search_indicators['selection']['positions']
+        margin = mu.interface.editor.HIGHLIGHT_MARGIN
+        lines = set(range(max(10 - margin, 0), 16 + margin))
+        assert len(positions) == len(lines) * 2 - 1
+        assert {p['line_start'] for p in positions} == lines
+        ep.firstVisibleLine.return_value = 50
+        ep.refresh_visible_matches()
+        positions = ep.search_indicators['selection']['positions']
+        lines = set(range(50 - margin, 56 + margin))
+        assert {p['line_start'] for p in positions} == lines
+        ep.setSelection(-1, -1, -1, -1)
+        ep.refresh_visible_matches()
+        assert ep.search_indicators['selection']['positions'] == []
+
+
+def test_EditorPane_visible_matches_end():
+    """
+    Lines past the end of the text aren't searched.
+    """
+    with large_editor_pane('foo\nfoo', chunk_size=100) as ep:
+        ep.firstVisibleLine = mock.MagicMock(return_value=0)
+        lines_on_screen(ep, 40)
+        assert list(ep.visible_matches('foo')) == [(0, 0, 0, 3), (1, 0, 1, 3)]
+
+
+def test_EditorPane_visible_matches_margin():
+    """
+    Only the matches on the lines on screen, or within HIGHLIGHT_MARGIN lines
+    of them, are found.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'foo\n' * 100)
+    ep.firstVisibleLine = mock.MagicMock(return_value=40)
+    lines_on_screen(ep, 10)
+    with mock.patch('mu.interface.editor.HIGHLIGHT_MARGIN', 5):
+        lines = [line for line, _, _, _ in ep.visible_matches('foo')]
+    assert lines == list(range(35, 56))
+
+
+def test_EditorPane_visible_matches_folded():
+    """
+    Lines hidden by folding aren't on screen, so the lines on screen are
+    further down the document than the first visible (display) line.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'foo\n' * 100)
+    ep.SendScintilla(ep.SCI_HIDELINES, 10, 29)
+    ep.firstVisibleLine = mock.MagicMock(return_value=15)
+    lines_on_screen(ep, 10)
+    with mock.patch('mu.interface.editor.HIGHLIGHT_MARGIN', 5):
+        lines = [line for line, _, _, _ in ep.visible_matches('foo')]
+    assert lines == list(range(30, 51))
+
+
+def test_EditorPane_visible_matches_not_a_word():
+    """
+    Text that isn't a word (so isn't in the word index) is searched for in
+    each line, and isn't treated as a regular expression.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'foo-bar fooxbar\nfoo-bar\n')
+    assert list(ep.visible_matches('foo-bar')) == [(0, 0, 0, 7),
+                                                   (1, 0, 1, 7)]
+    assert list(ep.visible_matches('foo.bar')) == []
+
+
+def test_EditorPane_highlight_selected_matches_after_edit():
+    """
+    The matches for the selected word are found in text that's been edited,
+    since the word index is kept up to date.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'foo\nbar\nfoo\n')
+    ep.setSelection(0, 0, 0, 3)
+    positions = ep.search_indicators['selection']['positions']
+    assert [p['line_start'] for p in positions] == [2]
+    ep.insertAt('x\nfoo foo\n', 1, 0)
+    ep.setSelection(-1, -1, -1, -1)
+    ep.setSelection(0, 0, 0, 3)
+    positions = ep.search_indicators['selection']['positions']
+    assert [(p['line_start'], p['col_start']) for p in positions] == [
+        (2, 0), (2, 4), (4, 0)]
+    ep.setSelection(1, 0, 3, 0)
+    ep.removeSelectedText()
+    ep.setSelection(0, 0, 0, 3)
+    positions = ep.search_indicators['selection']['positions']
+    assert [p['line_start'] for p in positions] == [2]
+
+
+def test_EditorPane_on_modified():
+    """
+    Insertions and deletions update the word index from the line where they
+    happened.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'foo\nbar\nbaz\n')
+    ep.word_index = mock.MagicMock()
+    ep.on_modified(4, ep.SC_MOD_INSERTTEXT, b'x\ny\n', 4, 2, 0, 0, 0, 0, 0)
+    ep.word_index.changed.assert_called_once_with(1, 2)
+    ep.word_index.reset_mock()
+    ep.on_modified(0, ep.SC_MOD_DELETETEXT, b'foo\n', 4, -1, 0, 0, 0, 0, 0)
+    ep.word_index.changed.assert_called_once_with(0, -1)
+    ep.word_index.reset_mock()
+    ep.on_modified(0, ep.SC_MOD_CHANGESTYLE, None, 4, 0, 0, 0, 0, 0, 0)
+    assert ep.word_index.changed.call_count == 0
+
+
+def test_EditorPane_word_index_large_file():
+    """
+    The word index is reset as each chunk of a large file is added, since
+    the changes aren't reported while loading.
+    """
+    text = 'foo bar\n' * 10
+    with large_editor_pane(text, chunk_size=len(text) // 2) as ep:
+        ep.finish_loading()
+        assert len(ep.word_index.lines) == ep.lines()
+        assert ep.word_index.occurrences('bar', 9) == [4]
+
+
+def test_WordIndex():
+    """
+    The words on each line are only found when needed, and again once the
+    line has changed.
+    """
+    lines = ['foo bar foo\n', 'bar\n', '']
+    line_text = mock.MagicMock(side_effect=lambda line: lines[line])
+    index = mu.interface.editor.WordIndex(line_text, 3)
+    assert index.occurrences('foo', 0) == [0, 8]
+    assert index.occurrences('bar', 0) == [4]
+    assert index.occurrences('baz', 0) == []
+    assert line_text.call_count == 1
+    # Lines added after the first.
+    lines[1:1] = ['baz\n', 'baz\n']
+    index.changed(0, 2)
+    assert index.occurrences('baz', 2) == [0]
+    assert index.occurrences('bar', 3) == [0]
+    # Lines removed after the first.
+    del lines[1:3]
+    index.changed(0, -2)
+    assert len(index.lines) == 3
+    assert index.occurrences('bar', 1) == [0]
+    index.reset(1)
+    assert index.lines == [None]
+
+
+def test_EditorPane_replace_matches():
+    """
+    The matches are replaced with a single edit, which is undone in one go.
+    """
+    ep = mu.interface.editor.EditorPane(None, '\u00e9 foo = foo\nbar\nfoo\n')
+    matches = [
+        {'line': 0, 'column': 2, 'end_line': 0, 'end_column': 5,
+         'replacement': 'x'},
+        {'line': 0, 'column': 8, 'end_line': 1, 'end_column': 3,
+         'replacement': '\u00e9\u00e9'},
+        {'line': 2, 'column': 0, 'end_line': 2, 'end_column': 3,
+         'replacement': 'quux'},
+    ]
+    ep.replace_matches(matches)
+    assert ep.text() == '\u00e9 x = \u00e9\u00e9\nquux\n'
+    ep.undo()
+    assert ep.text() == '\u00e9 foo = foo\nbar\nfoo\n'
+
+
+def test_EditorPane_select_next_match():
+    """
+    The next match after the cursor is selected and returned, wrapping round
+    to the start of the text.
+    """
+    ep = mu.interface.editor.EditorPane(None, '\u00e9 foo = foo\nbar\n')
+    pattern = re.compile('fo+')
+    ep.setCursorPosition(0, 3)
+    match = ep.select_next_match(pattern)
+    assert (match['line'], match['column']) == (0, 8)
+    assert ep.getSelection() == (0, 8, 0, 11)
+    assert ep.selectedText() == 'foo'
+    match = ep.select_next_match(pattern)
+    assert ep.getSelection() == (0, 2, 0, 5)
+    assert ep.select_next_match(re.compile('x')) is None
+    assert ep.getSelection() == (0, 2, 0, 5)
+
+
 def test_EditorPane_selection_change_listener():
     """
     Enusure that is there is a change to the selected text then controll is
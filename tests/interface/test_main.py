@@ -10,7 +10,9 @@ from mu import __version__
 import mu.interface.main
 import mu.interface.themes
 import mu.interface.editor
+import mu.interface.panes
 import pytest
+import re
 
 
 def test_ButtonBar_init():
@@ -213,6 +215,7 @@ def test_FileTabs_change_tab():
     tab_id = 1
     qtw.change_tab(tab_id)
     mock_window.update_title.assert_called_once_with(mock_tab.label)
+    mock_window.tab_changed.emit.assert_called_once_with(mock_tab)
 
 
 def test_FileTabs_change_tab_no_tabs():
@@ -226,6 +229,7 @@ def test_FileTabs_change_tab_no_tabs():
     qtw.nativeParentWidget = mock.MagicMock(return_value=mock_window)
     qtw.change_tab(0)
     mock_window.update_title.assert_called_once_with(None)
+    mock_window.tab_changed.emit.assert_called_once_with(None)
 
 
 def test_Window_attributes():
@@ -302,8 +306,24 @@ def test_Window_change_mode():
     w.button_bar = mock.MagicMock()
     w.change_mode(mock_mode)
     w.button_bar.change_mode.assert_called_with(mock_mode)
-    tab1.set_api.assert_called_once_with(api)
-    tab2.set_api.assert_called_once_with(api)
+    tab1.set_api.assert_called_once_with(api, ())
+    tab2.set_api.assert_called_once_with(api, ())
+
+
+def test_Window_set_symbols():
+    """
+    The symbols defined in the workspace are offered in every tab, along
+    with the API for each tab's mode.
+    """
+    w = mu.interface.main.Window()
+    tab = mock.MagicMock()
+    w.tabs = mock.MagicMock()
+    w.tabs.count.return_value = 1
+    w.tabs.widget.return_value = tab
+    symbols = ['foo.bar(x)']
+    w.set_symbols(symbols)
+    assert w.symbols is symbols
+    tab.set_api.assert_called_once_with(tab.api_definitions, symbols)
 
 
 def test_Window_zoom_in():
@@ -453,6 +473,7 @@ def test_Window_add_tab():
     ep.connect_margin = mock.MagicMock()
     ep.setFocus = mock.MagicMock(return_value=None)
     ep.setReadOnly = mock.MagicMock()
+    ep.set_theme = mock.MagicMock()
     mock_ed = mock.MagicMock(return_value=ep)
     path = '/foo/bar.py'
     text = 'print("Hello, World!")'
@@ -464,9 +485,10 @@ def test_Window_add_tab():
     w.tabs.addTab.assert_called_once_with(ep, ep.label)
     w.tabs.setCurrentIndex.assert_called_once_with(new_tab_index)
     w.connect_zoom.assert_called_once_with(ep)
-    w.set_theme.assert_called_once_with(w.theme)
+    assert w.set_theme.call_count == 0
+    ep.set_theme.assert_called_once_with(mu.interface.themes.DayTheme)
     ep.connect_margin.assert_called_once_with(w.breakpoint_toggle)
-    ep.set_api.assert_called_once_with(api)
+    ep.set_api.assert_called_once_with(api, ())
     ep.setFocus.assert_called_once_with()
     ep.setReadOnly.assert_called_once_with(w.read_only_tabs)
     on_modified = ep.modificationChanged.connect.call_args[0][0]
@@ -474,6 +496,48 @@ def test_Window_add_tab():
     w.tabs.setTabText.assert_called_once_with(new_tab_index, ep.label)
 
 
+def test_Window_add_tab_at_index_without_focus():
+    """
+    A tab can be inserted at a given index without becoming the current tab.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.connect_zoom = mock.MagicMock()
+    w.set_theme = mock.MagicMock()
+    w.theme = mock.MagicMock()
+    w.read_only_tabs = False
+    w.breakpoint_toggle = mock.MagicMock()
+    ep = mock.MagicMock()
+    with mock.patch('mu.interface.main.EditorPane', return_value=ep):
+        assert w.add_tab('/foo/bar.py', 'baz', [], '\n', index=2,
+                         focus=False) is ep
+    w.tabs.insertTab.assert_called_once_with(2, ep, ep.label)
+    assert w.tabs.addTab.call_count == 0
+    assert w.tabs.setCurrentIndex.call_count == 0
+    assert ep.setFocus.call_count == 0
+
+
+def test_Window_add_tab_code_changed():
+    """
+    Changes to the code in a new tab are signalled with the tab.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.connect_zoom = mock.MagicMock()
+    w.set_theme = mock.MagicMock()
+    w.theme = mock.MagicMock()
+    w.read_only_tabs = False
+    w.breakpoint_toggle = mock.MagicMock()
+    mock_slot = mock.MagicMock()
+    w.code_changed.connect(mock_slot)
+    ep = mock.MagicMock()
+    with mock.patch('mu.interface.main.EditorPane', return_value=ep):
+        w.add_tab('/foo/bar.py', 'baz', [], '\n')
+    on_text_changed = ep.textChanged.connect.call_args[0][0]
+    on_text_changed()
+    mock_slot.assert_called_once_with(ep)
+
+
 def test_Window_focus_tab():
     """
     Given a tab instance, ensure it has focus.
@@ -1073,7 +1137,7 @@ def test_Window_set_theme():
     tab2 = mock.MagicMock()
     tab2.set_theme = mock.MagicMock()
     w.tabs.widget = mock.MagicMock(side_effect=[tab1, tab2, tab1, tab2, tab1,
-                                                tab2])
+                                                tab2, tab1, tab2])
     w.button_bar = mock.MagicMock()
     w.button_bar.slots = {
         'theme': mock.MagicMock()
@@ -1129,6 +1193,11 @@ def test_Window_set_theme():
                       QIcon)
     w.repl_pane.set_theme.assert_called_once_with('day')
     w.plotter_pane.set_theme.assert_called_once_with('day')
+    w.load_theme.emit.reset_mock()
+    tab1.set_theme.reset_mock()
+    w.set_theme('day')
+    assert w.load_theme.emit.call_count == 0
+    tab1.set_theme.assert_called_once_with(mu.interface.themes.DayTheme)
 
 
 def test_Window_show_admin():
@@ -1274,6 +1343,23 @@ def test_Window_update_title():
     w.setWindowTitle.assert_called_once_with('Mu - foo.py')
 
 
+def test_Window_bring_to_front():
+    """
+    A minimised window is restored, raised and activated.
+    """
+    w = mu.interface.main.Window()
+    w.windowState = mock.MagicMock(return_value=Qt.WindowMinimized)
+    w.setWindowState = mock.MagicMock()
+    w.show = mock.MagicMock()
+    w.raise_ = mock.MagicMock()
+    w.activateWindow = mock.MagicMock()
+    w.bring_to_front()
+    w.setWindowState.assert_called_once_with(Qt.WindowActive)
+    w.show.assert_called_once_with()
+    w.raise_.assert_called_once_with()
+    w.activateWindow.assert_called_once_with()
+
+
 def test_Window_autosize_window():
     """
     Check the correct calculations take place and methods are called so the
@@ -1535,6 +1621,15 @@ def test_Window_connect_find_replace():
     shortcut.activated.connect.assert_called_once_with(mock_handler)
 
 
+#: The options chosen in the find/replace dialog (see FindReplaceDialog).
+FIND_OPTIONS = {
+    'regex': False,
+    'case_sensitive': True,
+    'whole_word': False,
+    'all_files': False,
+}
+
+
 def test_Window_show_find_replace():
     """
     The find/replace dialog is setup with the right arguments and, if
@@ -1545,12 +1640,13 @@ def test_Window_show_find_replace():
     mock_dialog.find.return_value = 'foo'
     mock_dialog.replace.return_value = 'bar'
     mock_dialog.replace_flag.return_value = True
+    mock_dialog.options.return_value = FIND_OPTIONS
     mock_FRDialog = mock.MagicMock(return_value=mock_dialog)
     mock_FRDialog.exec.return_value = True
     with mock.patch('mu.interface.main.FindReplaceDialog', mock_FRDialog):
-        result = window.show_find_replace('', '', False)
-    mock_dialog.setup.assert_called_once_with('', '', False)
-    assert result == ('foo', 'bar', True)
+        result = window.show_find_replace('', '', False, FIND_OPTIONS)
+    mock_dialog.setup.assert_called_once_with('', '', False, FIND_OPTIONS)
+    assert result == ('foo', 'bar', True, FIND_OPTIONS)
 
 
 def test_Window_replace_text_not_current_tab():
@@ -1561,21 +1657,46 @@ def test_Window_replace_text_not_current_tab():
     w = mu.interface.main.Window()
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = None
-    assert w.replace_text('foo', 'bar', False) == 0
+    assert w.replace_text('foo', 'bar', False, FIND_OPTIONS) == 0
 
 
 def test_Window_replace_text_not_global_found():
     """
     If the text to be replaced is found in the source, and the global_replace
-    flag is false, return 1 (to indicate the number of changes made).
+    flag is false, return 1 (to indicate the number of changes made). The
+    next match after the cursor is selected and replaced.
     """
     w = mu.interface.main.Window()
     mock_tab = mock.MagicMock()
+    match = {'line': 0, 'column': 0, 'end_line': 0, 'end_column': 3,
+             'text': 'foo', 'replacement': 'bar'}
+    mock_tab.select_next_match.return_value = match
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = mock_tab
-    mock_tab.findFirst.return_value = True
-    assert w.replace_text('foo', 'bar', False) == 1
-    mock_tab.replace.assert_called_once_with('bar')
+    assert w.replace_text('foo', 'bar', False, FIND_OPTIONS) == 1
+    pattern, replacement = mock_tab.select_next_match.call_args[0]
+    assert pattern.pattern == 'foo'
+    assert not pattern.flags & re.IGNORECASE
+    assert replacement(pattern.search('foo')) == 'bar'
+    mock_tab.replace_matches.assert_called_once_with([match])
+
+
+def test_Window_replace_text_not_global_regex():
+    """
+    Replacing a single match uses Python's regular expressions (like a
+    global replace) rather than Scintilla's own dialect.
+    """
+    w = mu.interface.main.Window()
+    tab = mu.interface.editor.EditorPane('path', 'a = 12\nb = 3 # 45\n')
+    w.tabs = mock.MagicMock()
+    w.tabs.currentWidget.return_value = tab
+    options = dict(FIND_OPTIONS, regex=True)
+    tab.setCursorPosition(0, 5)
+    assert w.replace_text(r'(?<== )(\d+)', r'<\1>', False, options) == 1
+    assert tab.text() == 'a = 12\nb = <3> # 45\n'
+    assert w.replace_text(r'(?<== )(\d+)', r'<\1>', False, options) == 1
+    assert tab.text() == 'a = <12>\nb = <3> # 45\n'
+    assert w.replace_text(r'(?i)X+', 'y', False, options) == 0
 
 
 def test_Window_replace_text_not_global_missing():
@@ -1585,26 +1706,45 @@ def test_Window_replace_text_not_global_missing():
     """
     w = mu.interface.main.Window()
     mock_tab = mock.MagicMock()
-    mock_tab.findFirst.return_value = False
+    mock_tab.select_next_match.return_value = None
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = mock_tab
-    assert w.replace_text('foo', 'bar', False) == 0
+    assert w.replace_text('foo', 'bar', False, FIND_OPTIONS) == 0
+    assert mock_tab.replace_matches.call_count == 0
 
 
 def test_Window_replace_text_global_found():
     """
     If the text to be replaced is found several times in the source, and the
     global_replace flag is true, return X (to indicate X changes made) -- where
-    X is some integer.
+    X is some integer. The matches are replaced with a single edit.
     """
     w = mu.interface.main.Window()
     mock_tab = mock.MagicMock()
-    mock_tab.findFirst.return_value = True
-    mock_tab.findNext.side_effect = [True, False, ]
+    mock_tab.text.return_value = 'foo = Foo\nfoo()\n'
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = mock_tab
-    assert w.replace_text('foo', 'bar', True) == 2
-    assert mock_tab.replace.call_count == 2
+    assert w.replace_text('foo', 'bar', True, FIND_OPTIONS) == 2
+    assert mock_tab.replace.call_count == 0
+    matches = mock_tab.replace_matches.call_args[0][0]
+    assert [(m['line'], m['column'], m['replacement']) for m in matches] == [
+        (0, 0, 'bar'), (1, 0, 'bar')]
+
+
+def test_Window_replace_text_global_options():
+    """
+    A global replace uses the options for finding the text to replace.
+    """
+    w = mu.interface.main.Window()
+    mock_tab = mock.MagicMock()
+    mock_tab.text.return_value = 'foo = Foo\nfoobar()\n'
+    w.tabs = mock.MagicMock()
+    w.tabs.currentWidget.return_value = mock_tab
+    options = dict(FIND_OPTIONS, regex=True, case_sensitive=False,
+                   whole_word=True)
+    assert w.replace_text('(f)oo', r'\1un', True, options) == 2
+    matches = mock_tab.replace_matches.call_args[0][0]
+    assert [m['replacement'] for m in matches] == ['fun', 'Fun']
 
 
 def test_Window_replace_text_global_missing():
@@ -1614,24 +1754,45 @@ def test_Window_replace_text_global_missing():
     """
     w = mu.interface.main.Window()
     mock_tab = mock.MagicMock()
-    mock_tab.findFirst.return_value = False
+    mock_tab.text.return_value = 'bar\n'
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = mock_tab
-    assert w.replace_text('foo', 'bar', True) == 0
+    assert w.replace_text('foo', 'bar', True, FIND_OPTIONS) == 0
+    assert mock_tab.replace_matches.call_count == 0
 
 
 def test_Window_highlight_text():
     """
-    Given target_text, highlights the first instance via Scintilla's findFirst
-    method.
+    Given target_text, selects the next match after the cursor for the
+    pattern compiled with the options.
     """
     w = mu.interface.main.Window()
     mock_tab = mock.MagicMock()
-    mock_tab.findFirst.return_value = True
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = mock_tab
-    assert w.highlight_text('foo')
-    mock_tab.findFirst.assert_called_once_with('foo', True, True, False, True)
+    options = dict(FIND_OPTIONS, regex=True, whole_word=True)
+    assert w.highlight_text('foo', options)
+    pattern = mock_tab.select_next_match.call_args[0][0]
+    assert pattern.search('a foo b')
+    assert not pattern.search('foobar')
+    mock_tab.select_next_match.return_value = None
+    assert w.highlight_text('foo', options) is False
+
+
+def test_Window_highlight_text_regex():
+    """
+    Highlighting uses Python's regular expressions, rather than Scintilla's
+    own dialect.
+    """
+    w = mu.interface.main.Window()
+    tab = mu.interface.editor.EditorPane('path', 'x = 1\ny = 22\n')
+    w.tabs = mock.MagicMock()
+    w.tabs.currentWidget.return_value = tab
+    options = dict(FIND_OPTIONS, regex=True)
+    assert w.highlight_text(r'\d{2}', options)
+    assert tab.getSelection() == (1, 4, 1, 6)
+    assert w.highlight_text(r'(?i)Y', options)
+    assert tab.getSelection() == (1, 0, 1, 1)
 
 
 def test_Window_highlight_text_no_tab():
@@ -1641,7 +1802,118 @@ def test_Window_highlight_text_no_tab():
     w = mu.interface.main.Window()
     w.tabs = mock.MagicMock()
     w.tabs.currentWidget.return_value = None
-    assert w.highlight_text('foo') is False
+    assert w.highlight_text('foo', FIND_OPTIONS) is False
+
+
+def test_Window_add_search_results():
+    """
+    The search results pane is added once, and emptied when it's added
+    again. Its request to open a match is bubbled up.
+    """
+    w = mu.interface.main.Window()
+    w.addDockWidget = mock.MagicMock()
+    w.connect_zoom = mock.MagicMock()
+    pane = w.add_search_results()
+    assert isinstance(pane, mu.interface.panes.SearchResultsPane)
+    assert w.search_results.widget() is pane
+    assert w.addDockWidget.call_count == 1
+    w.connect_zoom.assert_called_once_with(pane)
+    mock_slot = mock.MagicMock()
+    w.open_match.connect(mock_slot)
+    pane.open_match.emit('foo.py', 1, 2, 1, 5)
+    mock_slot.assert_called_once_with('foo.py', 1, 2, 1, 5)
+    w.add_search_matches('foo.py', [{'line': 1, 'column': 2, 'end_line': 1,
+                                     'end_column': 5, 'text': 'x = foo'}])
+    assert pane.topLevelItemCount() == 1
+    assert w.add_search_results() is pane
+    assert pane.topLevelItemCount() == 0
+    assert w.addDockWidget.call_count == 1
+
+
+def test_Window_add_search_matches_no_pane():
+    """
+    Matches found once the search results pane has been removed are ignored.
+    """
+    w = mu.interface.main.Window()
+    w.add_search_matches('foo.py', [])
+    assert w.search_results is None
+
+
+def test_Window_remove_search_results():
+    """
+    Check the search results pane is removed.
+    """
+    w = mu.interface.main.Window()
+    mock_results = mock.MagicMock()
+    w.search_results = mock_results
+    w.search_pane = mock.MagicMock()
+    w.remove_search_results()
+    mock_results.setParent.assert_called_once_with(None)
+    mock_results.deleteLater.assert_called_once_with()
+    assert w.search_results is None
+    assert w.search_pane is None
+
+
+def test_Window_add_outline():
+    """
+    The outline pane is added, and its request to show a line is handled.
+    """
+    w = mu.interface.main.Window()
+    w.addDockWidget = mock.MagicMock()
+    w.connect_zoom = mock.MagicMock()
+    w.show_line = mock.MagicMock()
+    w.add_outline()
+    pane = w.outline_pane
+    assert isinstance(pane, mu.interface.panes.OutlinePane)
+    assert w.outline.widget() is pane
+    w.addDockWidget.assert_called_once_with(Qt.LeftDockWidgetArea,
+                                            w.outline)
+    w.connect_zoom.assert_called_once_with(pane)
+    pane.open_line.emit(3, 4)
+    w.show_line.assert_called_once_with(3, 4)
+    outline = [{'name': 'foo', 'kind': 'variable', 'line': 0, 'column': 0,
+                'depth': 0}]
+    w.set_outline(outline)
+    assert pane.topLevelItemCount() == 1
+
+
+def test_Window_set_outline_no_pane():
+    """
+    Outlines arriving once the outline pane has been removed are ignored.
+    """
+    w = mu.interface.main.Window()
+    w.set_outline([])
+    assert w.outline is None
+
+
+def test_Window_remove_outline():
+    """
+    Check the outline pane is removed.
+    """
+    w = mu.interface.main.Window()
+    mock_outline = mock.MagicMock()
+    w.outline = mock_outline
+    w.outline_pane = mock.MagicMock()
+    w.remove_outline()
+    mock_outline.setParent.assert_called_once_with(None)
+    mock_outline.deleteLater.assert_called_once_with()
+    assert w.outline is None
+    assert w.outline_pane is None
+
+
+def test_Window_show_line():
+    """
+    Showing a line moves the cursor in the current tab to it.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    tab = w.tabs.currentWidget()
+    w.show_line(3, 4)
+    tab.setCursorPosition.assert_called_once_with(3, 4)
+    tab.ensureLineVisible.assert_called_once_with(3)
+    tab.setFocus.assert_called_once_with()
+    w.tabs.currentWidget.return_value = None
+    w.show_line(3, 4)
 
 
 def test_Window_connect_toggle_comments():
@@ -1663,6 +1935,44 @@ def test_Window_connect_toggle_comments():
     shortcut.activated.connect.assert_called_once_with(mock_handler)
 
 
+def test_Window_connect_go_to_definition():
+    """
+    Ensure the passed in handler is connected to a shortcut triggered by the
+    shortcut.
+    """
+    window = mu.interface.main.Window()
+    mock_handler = mock.MagicMock()
+    mock_shortcut = mock.MagicMock()
+    mock_sequence = mock.MagicMock()
+    with mock.patch('mu.interface.main.QShortcut', mock_shortcut), \
+            mock.patch('mu.interface.main.QKeySequence', mock_sequence):
+        window.connect_go_to_definition(mock_handler, 'F12')
+    mock_sequence.assert_called_once_with('F12')
+    ks = mock_sequence('F12')
+    mock_shortcut.assert_called_once_with(ks, window)
+    shortcut = mock_shortcut(ks, window)
+    shortcut.activated.connect.assert_called_once_with(mock_handler)
+
+
+def test_Window_connect_toggle_outline():
+    """
+    Ensure the passed in handler is connected to a shortcut triggered by the
+    shortcut.
+    """
+    window = mu.interface.main.Window()
+    mock_handler = mock.MagicMock()
+    mock_shortcut = mock.MagicMock()
+    mock_sequence = mock.MagicMock()
+    with mock.patch('mu.interface.main.QShortcut', mock_shortcut), \
+            mock.patch('mu.interface.main.QKeySequence', mock_sequence):
+        window.connect_toggle_outline(mock_handler, 'Ctrl+Shift+O')
+    mock_sequence.assert_called_once_with('Ctrl+Shift+O')
+    ks = mock_sequence('Ctrl+Shift+O')
+    mock_shortcut.assert_called_once_with(ks, window)
+    shortcut = mock_shortcut(ks, window)
+    shortcut.activated.connect.assert_called_once_with(mock_handler)
+
+
 def test_Window_toggle_comments():
     """
     If there's a current tab, call its toggle_comments method.
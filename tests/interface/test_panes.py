@@ -726,28 +726,49 @@ def test_FileSystemPane_show_warning():
 
 def test_FileSystemPane_on_ls():
     """
-    When lists of files have been obtained from the micro:bit and local
-    filesystem, make sure they're properly processed by the on_ls event
-    handler.
+    When the list of files has been obtained from the micro:bit make sure it's
+    properly processed by the on_ls event handler. The list of local files is
+    kept up to date by the workspace index.
     """
     fsp = mu.interface.panes.FileSystemPane('homepath')
     microbit_files = ['foo.py', 'bar.py', ]
     fsp.microbit_fs = mock.MagicMock()
     fsp.local_fs = mock.MagicMock()
     fsp.enable = mock.MagicMock()
-    local_files = ['qux.py', 'baz.py', ]
-    mock_listdir = mock.MagicMock(return_value=local_files)
-    mock_isfile = mock.MagicMock(return_value=True)
-    with mock.patch('mu.interface.panes.os.listdir', mock_listdir),\
-            mock.patch('mu.interface.panes.os.path.isfile', mock_isfile):
-        fsp.on_ls(microbit_files)
+    fsp.index = mock.MagicMock()
+    fsp.on_ls(microbit_files)
     fsp.microbit_fs.clear.assert_called_once_with()
-    fsp.local_fs.clear.assert_called_once_with()
     assert fsp.microbit_fs.addItem.call_count == 2
-    assert fsp.local_fs.addItem.call_count == 2
+    assert fsp.local_fs.clear.call_count == 0
+    fsp.index.files.assert_called_once_with()
     fsp.enable.assert_called_once_with()
 
 
+def test_FileSystemPane_local_files(tmpdir):
+    """
+    The local files are listed (in order) when the pane is created, and only
+    the files added or removed are updated after that.
+    """
+    tmpdir.join('qux.py').write('')
+    tmpdir.join('baz.py').write('')
+    tmpdir.mkdir('images')
+    with mock.patch('mu.workspace._INDEXES', {}):
+        fsp = mu.interface.panes.FileSystemPane(str(tmpdir))
+    local_fs = fsp.local_fs
+
+    def names():
+        return [local_fs.item(i).text() for i in range(local_fs.count())]
+
+    assert names() == ['baz.py', 'qux.py']
+    baz = local_fs.item(0)
+    tmpdir.join('qux.py').remove()
+    tmpdir.join('bar.py').write('')
+    tmpdir.join('foo.py').write('')
+    fsp.index.refresh()
+    assert names() == ['bar.py', 'baz.py', 'foo.py']
+    assert local_fs.item(1) is baz
+
+
 def test_FileSystemPane_on_ls_fail():
     """
     A warning is emitted and the widget disabled if listing files fails.
@@ -1986,6 +2007,117 @@ def test_DebugInspector_set_theme():
     di.set_theme('test')
 
 
+def test_SearchResultsPane_add_matches():
+    """
+    The matches in a file are listed under it, and activating one asks for it
+    to be shown.
+    """
+    srp = mu.interface.panes.SearchResultsPane()
+    srp.add_matches('/foo/bar.py', [
+        {'line': 0, 'column': 4, 'end_line': 0, 'end_column': 7,
+         'text': '    foo()'},
+        {'line': 9, 'column': 0, 'end_line': 10, 'end_column': 1,
+         'text': 'foo'},
+    ])
+    assert srp.topLevelItemCount() == 1
+    file_item = srp.topLevelItem(0)
+    assert file_item.text(0) == 'bar.py (2)'
+    assert file_item.isExpanded()
+    assert file_item.child(0).text(0) == '1: foo()'
+    assert file_item.child(1).text(0) == '10: foo'
+    mock_slot = mock.MagicMock()
+    srp.open_match.connect(mock_slot)
+    srp.on_activated(file_item, 0)
+    assert mock_slot.call_count == 0
+    srp.on_activated(file_item.child(1), 0)
+    mock_slot.assert_called_once_with('/foo/bar.py', 9, 0, 10, 1)
+
+
+def test_SearchResultsPane_set_font_size():
+    """
+    Check the correct stylesheet values are being set.
+    """
+    srp = mu.interface.panes.SearchResultsPane()
+    srp.setStyleSheet = mock.MagicMock()
+    srp.set_font_size(16)
+    style = srp.setStyleSheet.call_args[0][0]
+    assert 'font-size: 16pt;' in style
+
+
+def test_SearchResultsPane_zoom():
+    """
+    Ensure zooming in and out changes the font size.
+    """
+    srp = mu.interface.panes.SearchResultsPane()
+    srp.set_font_size = mock.MagicMock()
+    old_size = srp.font().pointSize()
+    srp.zoomIn(delta=4)
+    srp.set_font_size.assert_called_once_with(old_size + 4)
+    srp.set_font_size.reset_mock()
+    srp.zoomOut(delta=4)
+    srp.set_font_size.assert_called_once_with(old_size - 4)
+    srp.set_theme('test')
+
+
+def test_OutlinePane_set_outline():
+    """
+    The items in an outline are listed nested in the classes they're in, and
+    activating one asks for its line to be shown.
+    """
+    op = mu.interface.panes.OutlinePane()
+    outline = [
+        {'name': 'Ship', 'kind': 'class', 'line': 0, 'column': 6,
+         'depth': 0},
+        {'name': 'move', 'kind': 'function', 'line': 2, 'column': 8,
+         'depth': 1},
+        {'name': 'speed', 'kind': 'variable', 'line': 5, 'column': 0,
+         'depth': 0},
+    ]
+    op.set_outline(outline)
+    assert op.topLevelItemCount() == 2
+    ship = op.topLevelItem(0)
+    assert ship.text(0) == 'class Ship'
+    assert ship.isExpanded()
+    assert ship.child(0).text(0) == 'def move'
+    assert ship.child(0).toolTip(0) == 'Line 3'
+    assert op.topLevelItem(1).text(0) == 'speed'
+    mock_slot = mock.MagicMock()
+    op.open_line.connect(mock_slot)
+    op.on_activated(ship.child(0), 0)
+    mock_slot.assert_called_once_with(2, 8)
+    op.clear = mock.MagicMock()
+    op.set_outline(list(outline))
+    assert op.clear.call_count == 0
+    op.set_outline([])
+    op.clear.assert_called_once_with()
+
+
+def test_OutlinePane_set_font_size():
+    """
+    Check the correct stylesheet values are being set.
+    """
+    op = mu.interface.panes.OutlinePane()
+    op.setStyleSheet = mock.MagicMock()
+    op.set_font_size(16)
+    style = op.setStyleSheet.call_args[0][0]
+    assert 'font-size: 16pt;' in style
+
+
+def test_OutlinePane_zoom():
+    """
+    Ensure zooming in and out changes the font size.
+    """
+    op = mu.interface.panes.OutlinePane()
+    op.set_font_size = mock.MagicMock()
+    old_size = op.font().pointSize()
+    op.zoomIn(delta=4)
+    op.set_font_size.assert_called_once_with(old_size + 4)
+    op.set_font_size.reset_mock()
+    op.zoomOut(delta=4)
+    op.set_font_size.assert_called_once_with(old_size - 4)
+    op.set_theme('test')
+
+
 def test_PlotterPane_init():
     """
     Ensure the plotter pane is created in the expected manner.
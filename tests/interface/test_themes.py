@@ -62,6 +62,42 @@ def test_theme_apply_to():
     assert lexer.setPaper.call_count == 16
 
 
+def test_theme_styles():
+    """
+    The fonts and colours of a theme's styles are worked out once, and each
+    theme has its own.
+    """
+    class TestTheme(mu.interface.themes.Theme):
+        Keyword = mu.interface.themes.Font(color='#73a46a', paper='#222')
+        Comment = mu.interface.themes.Font(color='gray')
+
+    with mock.patch('mu.interface.themes.Font.load') as mock_load:
+        font, styles = TestTheme.styles()
+        assert mock_load.call_count == 3
+        assert TestTheme.styles() == (font, styles)
+        assert mock_load.call_count == 3
+    name, color, paper, _ = styles[0]
+    assert name == 'Keyword'
+    assert color.name() == '#73a46a'
+    assert paper.name() == '#222222'
+    assert len(mu.interface.themes.DayTheme.styles()[1]) == 16
+    assert '_styles' not in mu.interface.themes.Theme.__dict__
+
+
+def test_get_theme():
+    """
+    Themes are found by name, defaulting to the day theme.
+    """
+    assert mu.interface.themes.get_theme('night') is \
+        mu.interface.themes.NightTheme
+    assert mu.interface.themes.get_theme('contrast') is \
+        mu.interface.themes.ContrastTheme
+    assert mu.interface.themes.get_theme('day') is \
+        mu.interface.themes.DayTheme
+    assert mu.interface.themes.get_theme(None) is \
+        mu.interface.themes.DayTheme
+
+
 def test_Font_loading():
     with mock.patch("mu.interface.themes.FONT_NAME", "Source Code Pro"):
         mu.interface.themes.Font._DATABASE = None
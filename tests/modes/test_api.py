@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the catalogues of API definitions.
+"""
+import os
+import json
+from unittest import mock
+from mu.modes.api import API_DIR, CATALOGUES, get_api
+
+
+def test_catalogues_exist():
+    """
+    Every catalogue that comes with Mu is a non-empty list of strings.
+    """
+    for name in CATALOGUES:
+        with open(os.path.join(API_DIR, name + '.json'),
+                  encoding='utf-8') as f:
+            catalogue = json.load(f)
+        assert catalogue
+        assert all(isinstance(entry, str) for entry in catalogue)
+
+
+def test_get_api():
+    """
+    A catalogue is only read and translated the first time it's needed.
+    """
+    mock_open = mock.mock_open(read_data='["foo() \\nFoo.", "bar(x) \\nBar."]')
+    mock_gettext = mock.MagicMock(side_effect=lambda s: s.upper())
+    with mock.patch('mu.modes.api._LOADED', {}), \
+            mock.patch('builtins.open', mock_open), \
+            mock.patch('builtins._', mock_gettext):
+        api = get_api('foo')
+        assert api == ['FOO() \nFOO.', 'BAR(X) \nBAR.']
+        assert get_api('foo') is api
+    mock_open.assert_called_once_with(os.path.join(API_DIR, 'foo.json'),
+                                      encoding='utf-8')
+    assert mock_gettext.call_count == 2
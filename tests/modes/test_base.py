@@ -207,9 +207,9 @@ def test_micropython_mode_find_device():
         mock_port.serialNumber = mock.MagicMock(return_value='12345')
         mock_os = mock.MagicMock()
         mock_os.name = 'nt'
-        with mock.patch('mu.modes.base.QSerialPortInfo.availablePorts',
+        with mock.patch('mu.modes.devices.QSerialPortInfo.availablePorts',
                         return_value=[mock_port, ]), \
-                mock.patch('mu.modes.base.os', mock_os):
+                mock.patch('mu.modes.devices.os', mock_os):
             assert mm.find_device() == ('COM0', '12345')
 
 
@@ -220,7 +220,7 @@ def test_micropython_mode_find_device_no_ports():
     editor = mock.MagicMock()
     view = mock.MagicMock()
     mm = MicroPythonMode(editor, view)
-    with mock.patch('mu.modes.base.QSerialPortInfo.availablePorts',
+    with mock.patch('mu.modes.devices.QSerialPortInfo.availablePorts',
                     return_value=[]):
         assert mm.find_device() == (None, None)
 
@@ -236,7 +236,7 @@ def test_micropython_mode_find_device_but_no_device():
     mock_port.productIdentifier = mock.MagicMock(return_value=666)
     mock_port.vendorIdentifier = mock.MagicMock(return_value=999)
     mock_port.serialNumber = mock.MagicMock(return_value='123456')
-    with mock.patch('mu.modes.base.QSerialPortInfo.availablePorts',
+    with mock.patch('mu.modes.devices.QSerialPortInfo.availablePorts',
                     return_value=[mock_port, ]):
         assert mm.find_device() == (None, None)
 
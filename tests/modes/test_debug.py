@@ -53,11 +53,9 @@ def test_debug_start():
     mock_debugger_class = mock.MagicMock(return_value=mock_debugger)
     dm = DebugMode(editor, view)
     dm.workspace_dir = mock.MagicMock(return_value='/bar')
-    with mock.patch('builtins.open') as oa, \
-            mock.patch('mu.modes.debugger.Debugger', mock_debugger_class), \
-            mock.patch('mu.modes.debugger.write_and_flush'):
+    with mock.patch('mu.modes.debugger.Debugger', mock_debugger_class):
         dm.start()
-        oa.assert_called_once_with('/foo', 'w', newline='')
+    editor.save_tab_now.assert_called_once_with(view.current_tab)
     view.add_python3_runner.assert_called_once_with('/foo', '/bar',
                                                     debugger=True,
                                                     envars=[['name', 'value']])
@@ -101,6 +99,22 @@ def test_debug_start_prompt_for_unsaved_file():
     dm.stop.assert_called_once_with()
 
 
+def test_debug_start_save_failed():
+    """
+    If the modified script can't be saved, it isn't debugged.
+    """
+    editor = mock.MagicMock()
+    editor.save_tab_now.return_value = False
+    view = mock.MagicMock()
+    view.current_tab.path = '/foo'
+    view.current_tab.isModified.return_value = True
+    dm = DebugMode(editor, view)
+    dm.stop = mock.MagicMock()
+    dm.start()
+    assert view.add_python3_runner.call_count == 0
+    dm.stop.assert_called_once_with()
+
+
 def test_debug_stop():
     """
     Ensure the script runner is cleaned up properly.
@@ -7,7 +7,7 @@ import os.path
 import pytest
 from mu.logic import HOME_DIRECTORY
 from mu.modes.microbit import MicrobitMode, FileManager, DeviceFlasher
-from mu.modes.api import MICROBIT_APIS, SHARED_APIS
+from mu.modes.api import get_api
 from mu.contrib import uflash
 from unittest import mock
 from tokenize import TokenError
@@ -1290,7 +1290,7 @@ def test_api():
     editor = mock.MagicMock()
     mm = MicrobitMode(editor, view)
     api = mm.api()
-    assert api == SHARED_APIS + MICROBIT_APIS
+    assert api == get_api('shared') + get_api('microbit')
 
 
 def test_on_data_flood():
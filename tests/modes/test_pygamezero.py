@@ -4,7 +4,7 @@ Tests for the PyGameZero mode.
 """
 import os.path
 from mu.modes.pygamezero import PyGameZeroMode
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS, PYGAMEZERO_APIS
+from mu.modes.api import get_api
 from unittest import mock
 
 
@@ -45,7 +45,8 @@ def test_pgzero_api():
     view = mock.MagicMock()
     pm = PyGameZeroMode(editor, view)
     result = pm.api()
-    assert result == SHARED_APIS + PYTHON3_APIS + PI_APIS + PYGAMEZERO_APIS
+    assert result == (get_api('shared') + get_api('python3') + get_api('pi') +
+                      get_api('pygamezero'))
 
 
 def test_pgzero_play_toggle_on():
@@ -121,10 +122,8 @@ def test_pgzero_run_game():
     view.add_python3_runner.return_value = mock_runner
     pm = PyGameZeroMode(editor, view)
     pm.workspace_dir = mock.MagicMock(return_value='/bar')
-    with mock.patch('builtins.open') as oa, \
-            mock.patch('mu.modes.pygamezero.write_and_flush'):
-        pm.run_game()
-        oa.assert_called_once_with('/foo', 'w', newline='')
+    pm.run_game()
+    editor.save_tab_now.assert_called_once_with(view.current_tab)
     py_args = ['-m', 'pgzero']
     view.add_python3_runner.assert_called_once_with('/foo', '/bar',
                                                     interactive=False,
@@ -133,6 +132,22 @@ def test_pgzero_run_game():
     mock_runner.process.waitForStarted.assert_called_once_with()
 
 
+def test_pgzero_run_game_save_failed():
+    """
+    If the modified game can't be saved, it isn't run.
+    """
+    editor = mock.MagicMock()
+    editor.save_tab_now.return_value = False
+    view = mock.MagicMock()
+    view.current_tab.path = '/foo'
+    view.current_tab.isModified.return_value = True
+    pm = PyGameZeroMode(editor, view)
+    pm.stop_game = mock.MagicMock()
+    pm.run_game()
+    assert view.add_python3_runner.call_count == 0
+    pm.stop_game.assert_called_once_with()
+
+
 def test_pgzero_run_game_no_editor():
     """
     If there's no active tab, there can be no runner either.
@@ -4,7 +4,7 @@ Tests for the Python3 mode.
 """
 import sys
 from mu.modes.python3 import PythonMode, KernelRunner
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS
+from mu.modes.api import get_api
 from unittest import mock
 
 
@@ -99,7 +99,7 @@ def test_python_api():
     view = mock.MagicMock()
     pm = PythonMode(editor, view)
     result = pm.api()
-    assert result == SHARED_APIS + PYTHON3_APIS + PI_APIS
+    assert result == get_api('shared') + get_api('python3') + get_api('pi')
 
 
 def test_python_run_toggle_on():
@@ -185,10 +185,8 @@ def test_python_run_script():
     view.add_python3_runner.return_value = mock_runner
     pm = PythonMode(editor, view)
     pm.workspace_dir = mock.MagicMock(return_value='/bar')
-    with mock.patch('builtins.open') as oa, \
-            mock.patch('mu.modes.python3.write_and_flush'):
-        pm.run_script()
-        oa.assert_called_once_with('/foo', 'w', newline='')
+    pm.run_script()
+    editor.save_tab_now.assert_called_once_with(view.current_tab)
     view.add_python3_runner.assert_called_once_with('/foo', '/bar',
                                                     interactive=True,
                                                     envars=editor.envars)
@@ -197,19 +195,31 @@ def test_python_run_script():
     # mode are also in play.
     pm.set_buttons = mock.MagicMock()
     pm.kernel_runner = True
-    with mock.patch('builtins.open') as oa, \
-            mock.patch('mu.modes.python3.write_and_flush'):
-        pm.run_script()
+    pm.run_script()
     pm.set_buttons.assert_called_once_with(plotter=False)
     pm.set_buttons.reset_mock()
     pm.kernel_runner = False
     pm.plotter = True
-    with mock.patch('builtins.open') as oa, \
-            mock.patch('mu.modes.python3.write_and_flush'):
-        pm.run_script()
+    pm.run_script()
     pm.set_buttons.assert_called_once_with(repl=False)
 
 
+def test_python_run_script_save_failed():
+    """
+    If the modified script can't be saved, it isn't run.
+    """
+    editor = mock.MagicMock()
+    editor.save_tab_now.return_value = False
+    view = mock.MagicMock()
+    view.current_tab.path = '/foo'
+    view.current_tab.isModified.return_value = True
+    pm = PythonMode(editor, view)
+    pm.stop_script = mock.MagicMock()
+    pm.run_script()
+    assert view.add_python3_runner.call_count == 0
+    pm.stop_script.assert_called_once_with()
+
+
 def test_python_run_script_no_editor():
     """
     If there's no active tab, there can be no runner either.
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the mode registry.
+"""
+from unittest import mock
+from mu.modes.base import BaseMode, MicroPythonMode
+from mu.modes.python3 import PythonMode
+from mu.modes.registry import ModeSpec, ModeRegistry, BUILTIN_MODES
+
+
+def test_builtin_modes_match_classes():
+    """
+    The cheap descriptions of the built in modes must agree with the classes
+    that implement them (from which their names, descriptions and icons are
+    read).
+    """
+    for spec in BUILTIN_MODES:
+        mode_class = spec.load()
+        assert spec.name == mode_class.name
+        assert spec.description == mode_class.description
+        assert spec.icon == mode_class.icon
+        assert spec.is_debugger == mode_class.is_debugger
+        assert spec.file_extensions == mode_class.file_extensions
+        assert spec.detects_device == issubclass(mode_class, MicroPythonMode)
+        assert spec.valid_boards == getattr(mode_class, 'valid_boards', [])
+
+
+def test_ModeSpec_from_class():
+    """
+    A spec can be created from a mode's class.
+    """
+    spec = ModeSpec.from_class('python', PythonMode)
+    assert spec.key == 'python'
+    assert spec.load() is PythonMode
+    assert spec.name == PythonMode.name
+    assert spec.description == PythonMode.description
+    assert spec.icon == 'python'
+    assert spec.is_debugger is False
+    assert spec.file_extensions == []
+    assert spec.detects_device is False
+    spec = ModeSpec.from_class('mpy', MicroPythonMode)
+    assert spec.detects_device is True
+    assert spec.valid_boards == MicroPythonMode.valid_boards
+
+
+def test_ModeSpec_find_device():
+    """
+    A spec finds its mode's boards without importing the mode.
+    """
+    spec = ModeSpec('foo', 'foo:Foo', valid_boards=[(1, 2)])
+    with mock.patch('mu.modes.registry.find_device',
+                    return_value=('/dev/tty1', '123')) as find, \
+            mock.patch.object(spec, 'load') as load:
+        assert spec.find_device() == ('/dev/tty1', '123')
+    find.assert_called_once_with([(1, 2)], with_logging=False)
+    assert load.call_count == 0
+
+
+def test_ModeSpec_is_available():
+    """
+    A spec is only available if the module it requires can be found.
+    """
+    spec = ModeSpec('foo', 'foo:Foo', 'Foo', 'Foo mode.', 'foo')
+    assert spec.is_available()
+    spec = ModeSpec('foo', 'foo:Foo', 'Foo', 'Foo mode.', 'foo',
+                    requires='foo')
+    with mock.patch('mu.modes.registry.find_spec',
+                    return_value=None) as find:
+        assert spec.is_available() is False
+    find.assert_called_once_with('foo')
+    with mock.patch('mu.modes.registry.find_spec', return_value=True):
+        assert spec.is_available() is True
+
+
+def test_ModeSpec_metadata():
+    """
+    Unless they're given, the name, description and icon of a mode are read
+    from its class, which is only imported when they're first needed.
+    """
+    spec = ModeSpec('python', 'mu.modes.python3:PythonMode')
+    with mock.patch.object(spec, 'load', return_value=PythonMode) as load:
+        assert load.call_count == 0
+        assert spec.name == PythonMode.name
+        assert spec.description == PythonMode.description
+        assert spec.icon == 'python'
+        assert spec.name == PythonMode.name
+    assert load.call_count == 3
+    spec = ModeSpec('foo', 'foo:Foo', 'Foo', 'Foo mode.', 'foo')
+    assert (spec.name, spec.description, spec.icon) == ('Foo', 'Foo mode.',
+                                                        'foo')
+
+
+def test_ModeSpec_load():
+    """
+    The target of a spec is only imported when the spec is loaded.
+    """
+    spec = ModeSpec('base', 'mu.modes.base:BaseMode', 'Base', 'Base mode.',
+                    'help')
+    mock_import = mock.MagicMock(return_value=mock.MagicMock(BaseMode='X'))
+    with mock.patch('mu.modes.registry.importlib.import_module',
+                    mock_import):
+        assert spec.load() == 'X'
+    mock_import.assert_called_once_with('mu.modes.base')
+
+
+def test_ModeRegistry_lazy():
+    """
+    Modes are only instantiated when first looked up and then only once.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    mode = mock.MagicMock()
+    mode_class = mock.MagicMock(return_value=mode)
+    spec = ModeSpec('foo', mode_class, 'Foo', 'Foo mode.', 'foo')
+    modes = ModeRegistry(editor, view, [spec, ])
+    assert 'foo' in modes
+    assert 'bar' not in modes
+    assert list(modes) == ['foo', ]
+    assert len(modes) == 1
+    assert modes.specs['foo'] is spec
+    assert not modes.is_loaded('foo')
+    assert mode_class.call_count == 0
+    assert modes['foo'] is mode
+    assert modes['foo'] is mode
+    assert modes.is_loaded('foo')
+    mode_class.assert_called_once_with(editor, view)
+
+
+def test_ModeRegistry_register_duplicate():
+    """
+    A mode cannot replace one that's already registered.
+    """
+    first = ModeSpec('foo', 'foo:Foo', 'Foo', 'Foo mode.', 'foo')
+    second = ModeSpec('foo', 'bar:Bar', 'Bar', 'Bar mode.', 'bar')
+    modes = ModeRegistry(None, None, [first, second])
+    assert modes.specs['foo'] is first
+
+
+def test_ModeRegistry_register_unavailable():
+    """
+    Modes whose dependencies are missing aren't registered.
+    """
+    spec = ModeSpec('foo', 'foo:Foo', 'Foo', 'Foo mode.', 'foo',
+                    requires='foo')
+    with mock.patch('mu.modes.registry.find_spec', return_value=None):
+        modes = ModeRegistry(None, None, [spec, ])
+    assert 'foo' not in modes
+
+
+def test_ModeRegistry_load_entry_points():
+    """
+    Third party modes referenced by entry points are registered, whether the
+    entry point references a spec or a mode class. Broken entry points are
+    logged and ignored.
+    """
+    spec = ModeSpec('spec', 'foo:Foo', 'Foo', 'Foo mode.', 'foo')
+    ep_spec = mock.MagicMock()
+    ep_spec.name = 'spec'
+    ep_spec.load.return_value = spec
+    ep_class = mock.MagicMock()
+    ep_class.name = 'cls'
+    ep_class.load.return_value = BaseMode
+    ep_broken = mock.MagicMock()
+    ep_broken.name = 'broken'
+    ep_broken.load.side_effect = ImportError('boom')
+    entry_points = [ep_spec, ep_class, ep_broken]
+    modes = ModeRegistry(None, None)
+    with mock.patch('mu.modes.registry.iter_entry_points',
+                    return_value=entry_points) as iter_eps, \
+            mock.patch('mu.modes.registry.logger.error') as log:
+        modes.load_entry_points()
+    iter_eps.assert_called_once_with('mu.modes')
+    assert list(modes) == ['spec', 'cls']
+    assert modes.specs['spec'] is spec
+    assert modes.specs['cls'].load() is BaseMode
+    assert log.call_count == 1
+
+
+def test_iter_entry_points():
+    """
+    Entry points are found via importlib.metadata.
+    """
+    from mu.modes.registry import iter_entry_points
+    ep = mock.MagicMock()
+    eps = mock.MagicMock()
+    eps.select.return_value = [ep, ]
+    with mock.patch('importlib.metadata.entry_points', return_value=eps):
+        assert list(iter_entry_points('mu.modes')) == [ep, ]
+    eps.select.assert_called_once_with(group='mu.modes')
@@ -5,9 +5,11 @@ Tests for the app script.
 import sys
 import os.path
 from unittest import mock
-from mu.app import excepthook, run, setup_logging, debug, setup_modes
+from mu.app import (excepthook, run, setup_logging, debug, setup_modes,
+                    report_startup_profile)
 from mu.logic import LOG_FILE, LOG_DIR, DEBUGGER_PORT, ENCODING
 from mu.interface.themes import NIGHT_STYLE, DAY_STYLE, CONTRAST_STYLE
+from mu.profiler import StartupProfiler
 
 
 def test_setup_logging():
@@ -17,6 +19,9 @@ def test_setup_logging():
     with mock.patch('mu.app.TimedRotatingFileHandler') as log_conf, \
             mock.patch('mu.app.os.path.exists', return_value=False),\
             mock.patch('mu.app.logging') as logging, \
+            mock.patch('mu.app.queue_handler') as queue_handler, \
+            mock.patch('mu.app.load_levels', return_value={'mu': 'INFO'}), \
+            mock.patch('mu.app.configure_levels') as configure_levels, \
             mock.patch('mu.app.os.makedirs', return_value=None) as mkdir:
         setup_logging()
         mkdir.assert_called_once_with(LOG_DIR)
@@ -24,6 +29,11 @@ def test_setup_logging():
                                          backupCount=5, delay=0,
                                          encoding=ENCODING)
         logging.getLogger.assert_called_once_with()
+        # Records are written to the file in the background.
+        queue_handler.assert_called_once_with(log_conf())
+        logging.getLogger().addHandler.assert_called_once_with(
+            queue_handler())
+        configure_levels.assert_called_once_with({'mu': 'INFO'})
         assert sys.excepthook == excepthook
 
 
@@ -31,7 +41,7 @@ def test_setup_modes_with_pgzero():
     """
     If pgzero is installed, allow Pygame Zero mode.
     """
-    with mock.patch('mu.app.pkgutil.iter_modules', return_value=['pgzero', ]):
+    with mock.patch('mu.modes.registry.find_spec', return_value=True):
         mock_editor = mock.MagicMock()
         mock_view = mock.MagicMock()
         modes = setup_modes(mock_editor, mock_view)
@@ -43,13 +53,25 @@ def test_setup_modes_without_pgzero():
     If pgzero is NOT installed, do not add Pygame Zero mode to the list of
     available modes.
     """
-    with mock.patch('mu.app.pkgutil.iter_modules', return_value=['foo', ]):
+    with mock.patch('mu.modes.registry.find_spec', return_value=None):
         mock_editor = mock.MagicMock()
         mock_view = mock.MagicMock()
         modes = setup_modes(mock_editor, mock_view)
         assert 'pygamezero' not in modes
 
 
+def test_setup_modes_is_lazy():
+    """
+    Setting up the modes doesn't instantiate any of them and third party
+    modes are looked for.
+    """
+    with mock.patch('mu.app.ModeRegistry.load_entry_points') as load_eps:
+        modes = setup_modes(mock.MagicMock(), mock.MagicMock())
+    assert 'python' in modes
+    assert not any(modes.is_loaded(key) for key in modes)
+    load_eps.assert_called_once_with()
+
+
 def test_run():
     """
     Ensure the run function sets things up in the expected way.
@@ -81,6 +103,8 @@ def test_run():
     window = Win()
 
     with mock.patch('mu.app.setup_logging') as set_log, \
+            mock.patch('mu.app.forward_paths', return_value=False), \
+            mock.patch('mu.app.InstanceServer') as instance, \
             mock.patch('mu.app.QApplication') as qa, \
             mock.patch('mu.app.QSplashScreen') as qsp, \
             mock.patch('mu.app.Editor') as ed, \
@@ -102,8 +126,9 @@ def test_run():
         assert ed.call_count == 1
         assert len(ed.mock_calls) == 3
         assert win.call_count == 1
-        assert len(win.mock_calls) == 11
+        assert len(win.mock_calls) == 13
         assert ex.call_count == 1
+        instance().listen.assert_called_once_with()
         window.load_theme.emit('day')
         qa.assert_has_calls([mock.call().setStyleSheet(DAY_STYLE)])
         window.load_theme.emit('night')
@@ -112,6 +137,95 @@ def test_run():
         qa.assert_has_calls([mock.call().setStyleSheet(CONTRAST_STYLE)])
 
 
+def test_run_profile_startup():
+    """
+    If startup profiling is asked for, the phases of startup are timed, the
+    flag isn't treated as a file to open and the report is written once the
+    session's files are restored and the event loop starts.
+    """
+    profiler = StartupProfiler(enabled=True)
+    with mock.patch('mu.app.setup_logging'), \
+            mock.patch('mu.app.forward_paths') as forward, \
+            mock.patch('mu.app.InstanceServer'), \
+            mock.patch('mu.app.QApplication'), \
+            mock.patch('mu.app.QSplashScreen'), \
+            mock.patch('mu.app.Editor') as ed, \
+            mock.patch('mu.app.load_pixmap'), \
+            mock.patch('mu.app.Window'), \
+            mock.patch('mu.app.QTimer') as timer, \
+            mock.patch('mu.app.PROFILER', profiler), \
+            mock.patch('sys.argv', ['mu', '--profile-startup', 'foo.py']), \
+            mock.patch('sys.exit'):
+        run()
+        assert timer.singleShot.call_count == 0
+        ed().when_restored.call_args[0][0]()
+    # Profiling needs a fresh start.
+    assert forward.call_count == 0
+    ed().restore_session.assert_called_once_with(['foo.py'])
+    timer.singleShot.assert_called_once_with(0, report_startup_profile)
+    names = [phase['name'] for phase in profiler.phases]
+    assert names == ['imports', 'QApplication()', 'Window()', 'Editor.setup',
+                     'Window.setup', 'restore_session']
+
+
+def test_run_forward_paths():
+    """
+    If Mu is already running, the files to open are passed to it and no new
+    application is started.
+    """
+    with mock.patch('mu.app.setup_logging'), \
+            mock.patch('mu.app.forward_paths', return_value=True) as forward, \
+            mock.patch('mu.app.QApplication') as qa, \
+            mock.patch('sys.argv', ['mu', 'foo.py']):
+        run()
+    forward.assert_called_once_with(['foo.py'])
+    assert qa.call_count == 0
+
+
+def test_run_instance_server():
+    """
+    Paths forwarded by later copies of Mu are opened and the window is
+    brought to the front. Mu listens for them before restoring the session.
+    """
+    with mock.patch('mu.app.setup_logging'), \
+            mock.patch('mu.app.forward_paths', return_value=False), \
+            mock.patch('mu.app.InstanceServer') as instance, \
+            mock.patch('mu.app.QApplication'), \
+            mock.patch('mu.app.QSplashScreen'), \
+            mock.patch('mu.app.Editor') as ed, \
+            mock.patch('mu.app.load_pixmap'), \
+            mock.patch('mu.app.Window') as win, \
+            mock.patch('mu.app.QTimer'), \
+            mock.patch('sys.argv', ['mu']), \
+            mock.patch('sys.exit'):
+        listening = []
+        ed().restore_session.side_effect = lambda paths: listening.append(
+            instance().listen.call_count)
+        run()
+    assert listening == [1]
+    connect = instance().paths_received.connect
+    assert connect.call_args_list[0] == mock.call(ed().load_cli)
+    connect.call_args_list[1][0][0](['foo.py'])
+    win().bring_to_front.assert_called_once_with()
+
+
+def test_report_startup_profile():
+    """
+    The startup profile is written to the log directory and the user is told
+    where to find it.
+    """
+    with mock.patch('mu.app.PROFILER') as profiler, \
+            mock.patch('builtins.print') as mock_print:
+        profiler.finish.return_value = 'profile.txt'
+        report_startup_profile()
+        profiler.finish.assert_called_once_with(LOG_DIR)
+        mock_print.assert_called_once_with(
+            'Startup profile written to profile.txt')
+        profiler.finish.return_value = None
+        report_startup_profile()
+        assert mock_print.call_count == 1
+
+
 def test_excepthook():
     """
     Test that custom excepthook logs error and calls sys.exit.
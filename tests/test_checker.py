@@ -0,0 +1,646 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for checking code with PyFlakes and PyCodeStyle.
+"""
+import sys
+import ast
+import queue
+import pickle
+import random
+import subprocess
+from unittest import mock
+import mu.checker
+
+
+def test_check_flake():
+    """
+    Ensure the check_flake method calls PyFlakes with the expected code
+    reporter.
+    """
+    mock_r = mock.MagicMock()
+    mock_r.log = [{'line_no': 2, 'column': 0, 'message': 'b'}]
+    with mock.patch('mu.checker.MuFlakeCodeReporter', return_value=mock_r), \
+            mock.patch('mu.checker.check', return_value=None) as mock_check:
+        result = mu.checker.check_flake('foo.py', 'some code')
+        assert result == {2: mock_r.log}
+        mock_check.assert_called_once_with('some code', 'foo.py', mock_r)
+
+
+def test_check_flake_needing_expansion():
+    """
+    Ensure the check_flake method calls PyFlakes with the expected code
+    reporter.
+    """
+    mock_r = mock.MagicMock()
+    msg = "'microbit.foo' imported but unused"
+    mock_r.log = [{'line_no': 2, 'column': 0, 'message': msg}]
+    with mock.patch('mu.checker.MuFlakeCodeReporter', return_value=mock_r), \
+            mock.patch('mu.checker.check', return_value=None) as mock_check:
+        code = 'from microbit import *'
+        result = mu.checker.check_flake('foo.py', code)
+        assert result == {}
+        mock_check.assert_called_once_with(mu.checker.EXPANDED_IMPORT,
+                                           'foo.py', mock_r)
+
+
+def test_check_flake_with_builtins():
+    """
+    If a list of assumed builtin symbols is passed, any "undefined name"
+    messages for them are ignored.
+    """
+    mock_r = mock.MagicMock()
+    mock_r.log = [{'line_no': 2, 'column': 0,
+                  'message': "undefined name 'foo'"}]
+    with mock.patch('mu.checker.MuFlakeCodeReporter', return_value=mock_r), \
+            mock.patch('mu.checker.check', return_value=None) as mock_check:
+        result = mu.checker.check_flake('foo.py', 'some code',
+                                        builtins=['foo', ])
+        assert result == {}
+        mock_check.assert_called_once_with('some code', 'foo.py', mock_r)
+
+
+def test_check_pycodestyle():
+    """
+    Ensure the expected result if generated from the PEP8 style validator.
+    """
+    code = "import foo\n\n\n\n\n\ndef bar():\n    pass\n"  # Generate E303
+    result = mu.checker.check_pycodestyle(code)
+    assert len(result) == 1
+    assert result[6][0]['line_no'] == 6
+    assert result[6][0]['column'] == 0
+    assert ' above this line' in result[6][0]['message']
+    assert result[6][0]['code'] == 'E303'
+
+
+def test_check_pycodestyle_with_non_ascii():
+    """
+    Ensure pycodestyle can at least see a file with non-ASCII characters
+    """
+    code = "x='\u2005'\n"
+    try:
+        mu.checker.check_pycodestyle(code)
+    except Exception as exc:
+        assert False, "Exception was raised: %s" % exc
+    #
+    # Doesn't actually matter what pycodestyle returns; we just want to make
+    # sure it didn't error out
+    #
+
+
+def test_MuFlakeCodeReporter_init():
+    """
+    Check state is set up as expected.
+    """
+    r = mu.checker.MuFlakeCodeReporter()
+    assert r.log == []
+
+
+def test_MuFlakeCodeReporter_unexpected_error():
+    """
+    Check the reporter handles unexpected errors.
+    """
+    r = mu.checker.MuFlakeCodeReporter()
+    r.unexpectedError('foo.py', 'Nobody expects the Spanish Inquisition!')
+    assert len(r.log) == 1
+    assert r.log[0]['line_no'] == 0
+    assert r.log[0]['filename'] == 'foo.py'
+    assert r.log[0]['message'] == 'Nobody expects the Spanish Inquisition!'
+
+
+def test_MuFlakeCodeReporter_syntax_error():
+    """
+    Check the reporter handles syntax errors in a humane and kid friendly
+    manner.
+    """
+    msg = ('Syntax error. Python cannot understand this line. Check for '
+           'missing characters!')
+    r = mu.checker.MuFlakeCodeReporter()
+    r.syntaxError('foo.py', 'something incomprehensible to kids', '2', 3,
+                  'source')
+    assert len(r.log) == 1
+    assert r.log[0]['line_no'] == 1
+    assert r.log[0]['message'] == msg
+    assert r.log[0]['column'] == 2
+    assert r.log[0]['source'] == 'source'
+
+
+def test_MuFlakeCodeReporter_flake_matched():
+    """
+    Check the reporter handles flake (regular) errors that match the expected
+    message structure.
+    """
+    r = mu.checker.MuFlakeCodeReporter()
+    err = "foo.py:4: something went wrong"
+    r.flake(err)
+    assert len(r.log) == 1
+    assert r.log[0]['line_no'] == 3
+    assert r.log[0]['column'] == 0
+    assert r.log[0]['message'] == 'something went wrong'
+
+
+def test_MuFlakeCodeReporter_flake_un_matched():
+    """
+    Check the reporter handles flake errors that do not conform to the expected
+    message structure.
+    """
+    r = mu.checker.MuFlakeCodeReporter()
+    err = "something went wrong"
+    r.flake(err)
+    assert len(r.log) == 1
+    assert r.log[0]['line_no'] == 0
+    assert r.log[0]['column'] == 0
+    assert r.log[0]['message'] == 'something went wrong'
+
+
+def test_check_pycodestyle_in_memory():
+    """
+    The code is checked without writing it to a file or printing the results.
+    """
+    code = "import foo\n\n\n\n\n\ndef bar():\n    pass\n"  # Generate E303
+    with mock.patch('tempfile.mkstemp') as mock_mkstemp, \
+            mock.patch('sys.stdout') as mock_stdout:
+        result = mu.checker.check_pycodestyle(code)
+    assert 6 in result
+    assert mock_mkstemp.call_count == 0
+    assert mock_stdout.write.call_count == 0
+
+
+def test_check_pycodestyle_ignored():
+    """
+    Problems the PEP8 rules Mu ignores are not reported.
+    """
+    code = "x = 1+2\n"  # E226
+    assert mu.checker.check_pycodestyle(code) == {}
+
+
+def test_serve():
+    """
+    Each request is checked and the PyFlakes results are put on the results
+    queue before the PyCodeStyle results.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    requests.put((1, 'foo.py', 'import foo\n', None, None))
+
+    def stop(code):
+        requests.put(None)
+        return {1: ['b']}
+
+    with mock.patch('mu.checker.check_flake', return_value={0: ['a']}), \
+            mock.patch('mu.checker.check_pycodestyle', side_effect=stop):
+        mu.checker.serve(requests, results)
+    assert results.get_nowait() == (1, 'error', {0: ['a']})
+    assert results.get_nowait() == (1, 'style', {1: ['b']})
+    # Stopping is acknowledged.
+    assert results.get_nowait() is None
+
+
+def test_serve_latest_only():
+    """
+    If several requests are waiting, only the latest is checked.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    requests.put((1, 'foo.py', 'x = 1\n', None, None))
+    requests.put((2, 'foo.py', 'x = 2\n', None, None))
+
+    def stop(code):
+        requests.put(None)
+        return {}
+
+    with mock.patch('mu.checker.check_flake', return_value={}), \
+            mock.patch('mu.checker.check_pycodestyle', side_effect=stop):
+        mu.checker.serve(requests, results)
+    assert results.get_nowait() == (2, 'error', {})
+    assert results.get_nowait() == (2, 'style', {})
+    assert results.get_nowait() is None
+
+
+def test_serve_skips_stale_style_check():
+    """
+    If another request arrives while checking, the style check of the stale
+    code is skipped.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    requests.put((1, 'foo.py', 'x = 1\n', None, None))
+
+    def flake(filename, code, builtins):
+        if code == 'x = 1\n':
+            requests.put((2, 'foo.py', 'x = 2\n', None, None))
+        else:
+            requests.put(None)
+        return {}
+
+    with mock.patch('mu.checker.check_flake', side_effect=flake), \
+            mock.patch('mu.checker.check_pycodestyle', return_value={}) as m:
+        mu.checker.serve(requests, results)
+    assert results.get_nowait() == (1, 'error', {})
+    assert results.get_nowait() == (2, 'error', {})
+    assert results.get_nowait() is None
+    assert m.call_count == 0
+
+
+def test_check_key():
+    """
+    The key changes with the code, the builtins and the checkers' versions,
+    but not the order of the builtins.
+    """
+    key = mu.checker.check_key('x = 1\n', ['foo', 'bar'])
+    assert key == mu.checker.check_key('x = 1\n', ['bar', 'foo'])
+    assert key != mu.checker.check_key('x = 2\n', ['foo', 'bar'])
+    assert key != mu.checker.check_key('x = 1\n', ['foo'])
+    assert key != mu.checker.check_key('x = 1\n')
+    with mock.patch('mu.checker.VERSION', 'pyflakes 99'):
+        assert key != mu.checker.check_key('x = 1\n', ['foo', 'bar'])
+
+
+def test_builtins_regex():
+    """
+    The regex for each set of builtins is only made once.
+    """
+    regex = mu.checker.builtins_regex(('foo', 'bar'))
+    assert regex is mu.checker.builtins_regex(('foo', 'bar'))
+    assert regex.match("undefined name 'bar'")
+    assert not regex.match("undefined name 'baz'")
+
+
+SCRIPT = '''import os
+
+
+# Say hello.
+def hello(name):
+    print("Hello, " + name)
+
+
+@staticmethod
+def path():
+    return os.getcwd()
+x = undefined
+'''
+
+
+def test_split_blocks():
+    """
+    Each top-level statement's block starts with the blank lines and comments
+    before it, and its decorators.
+    """
+    lines = SCRIPT.splitlines(True)
+    tree = ast.parse(SCRIPT)
+    assert mu.checker.split_blocks(tree, lines) == [0, 1, 6, 11]
+
+
+def test_split_blocks_multi_line_string():
+    """
+    A block never includes the end of the statement before it (such as the
+    blank lines of a multi-line string).
+    """
+    code = 'x = """\n\n"""\ny = 1\n'
+    lines = code.splitlines(True)
+    starts = mu.checker.split_blocks(ast.parse(code), lines)
+    assert starts[1] >= 2
+
+
+def test_module_names():
+    """
+    The names bound at the top level are found, including those bound by
+    global statements in functions, but not names local to functions.
+    """
+    code = ('import os.path\nfrom foo import bar as baz\nx, y = 1, 2\n'
+            'def f(a):\n    global z\n    z = a\n    w = a\n'
+            'class C:\n    q = 1\n'
+            'for i in range(3):\n    pass\n')
+    assert mu.checker.module_names(ast.parse(code)) == {
+        'os', 'baz', 'x', 'y', 'f', 'z', 'C', 'i'}
+
+
+def test_module_names_star_import():
+    """
+    A star import means the names can't be known, unless it's "from
+    microbit import *".
+    """
+    assert mu.checker.module_names(ast.parse('from os import *\n')) is None
+    names = mu.checker.module_names(ast.parse('from microbit import *\n'))
+    assert 'display' in names
+
+
+def test_summarize():
+    """
+    A top-level statement is summarized by the names it binds, its imports,
+    the names they import and the names it uses and deletes.
+    """
+    tree = ast.parse('def f(a):\n    import os.path\n    del a\n'
+                     '    return os\n')
+    bound, imports, imported, used, deleted = mu.checker.summarize(
+        tree.body[0])
+    assert bound == {'f'}
+    assert imports == [ast.dump(tree.body[0].body[0])]
+    assert imported == {'os'}
+    assert used == {'a', 'os'}
+    assert deleted == {'a'}
+
+
+def test_IncrementalCheck_first_check():
+    """
+    The first check is of all the code.
+    """
+    checker = mu.checker.IncrementalCheck()
+    flake, style = checker.check('foo.py', SCRIPT)
+    assert flake == mu.checker.check_flake('foo.py', SCRIPT)
+    assert style == mu.checker.check_pycodestyle(SCRIPT)
+
+
+def test_IncrementalCheck_changed_block():
+    """
+    Only the changed blocks are checked again, and the feedback is the same
+    as checking all the code.
+    """
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', SCRIPT)
+    code = SCRIPT.replace('print("Hello, " + name)',
+                          'print("Hello, " + nme)  ')
+    with mock.patch('mu.checker.check_flake',
+                    wraps=mu.checker.check_flake) as flake_mock:
+        flake, style = checker.check('foo.py', code)
+    # The names bound before and after the block are bound around it.
+    flake_mock.assert_called_once_with(
+        'foo.py', 'os = None\n\n\n# Say hello.\ndef hello(name):\n'
+        '    print("Hello, " + nme)  \npath = x = None\n', None)
+    assert flake == mu.checker.check_flake('foo.py', code)
+    assert style == mu.checker.check_pycodestyle(code)
+
+
+def test_IncrementalCheck_moved_block():
+    """
+    Feedback about unchanged blocks moves with them.
+    """
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', SCRIPT)
+    code = SCRIPT.replace('# Say hello.\n', '# Say hello.\n# Really.\n')
+    flake, style = checker.check('foo.py', code)
+    assert flake == mu.checker.check_flake('foo.py', code)
+    assert style == mu.checker.check_pycodestyle(code)
+
+
+def test_IncrementalCheck_defined_elsewhere():
+    """
+    Names bound in other blocks aren't undefined in a changed block.
+    """
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', SCRIPT)
+    code = SCRIPT.replace('return os.getcwd()', 'return hello(os)')
+    flake, style = checker.check('foo.py', code)
+    assert flake == mu.checker.check_flake('foo.py', code)
+
+
+def test_IncrementalCheck_changed_imports():
+    """
+    All the code is checked again if a changed block contains an import, or
+    the names bound at the top level change.
+    """
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', SCRIPT)
+    for code in (SCRIPT.replace('import os', 'import os, sys'),
+                 SCRIPT.replace('x = undefined', 'y = undefined')):
+        with mock.patch('mu.checker.check_flake',
+                        wraps=mu.checker.check_flake) as flake_mock:
+            flake, style = checker.check('foo.py', code)
+        flake_mock.assert_called_once_with('foo.py', code, None)
+        assert flake == mu.checker.check_flake('foo.py', code)
+
+
+def test_IncrementalCheck_full_check():
+    """
+    All the code is checked again if checking a changed block on its own
+    might give different feedback, such as when it redefines a name, comes
+    before an import, uses a name only bound later or blocks are added.
+    """
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', SCRIPT)
+    edits = (
+        SCRIPT.replace('def path():', 'def hello():'),
+        SCRIPT.replace('import os', 'x = 1\nimport os'),
+        SCRIPT.replace('# Say hello.\n', 'print(x)\n'),
+        SCRIPT.replace('return os.getcwd()', 'del x'),
+        SCRIPT + 'y = 1\n',
+        SCRIPT.replace('x = undefined', 'x = undefined\t'),
+        SCRIPT,
+    )
+    for code in edits:
+        flake, style = checker.check('foo.py', code)
+        assert flake == mu.checker.check_flake('foo.py', code)
+        assert style == mu.checker.check_pycodestyle(code)
+
+
+def test_IncrementalCheck_line_references():
+    """
+    Feedback that refers to other lines is never reused, since the lines may
+    move.
+    """
+    code = 'def foo():\n    pass\n\n\nx = 1\n\n\ndef foo():\n    pass\n'
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', code)
+    assert checker.references
+    code = '# Foo.\n' + code.replace('x = 1', 'x = 2')
+    flake, style = checker.check('foo.py', code)
+    assert flake == mu.checker.check_flake('foo.py', code)
+    assert 'line 2' in flake[8][0]['message']
+
+
+def test_IncrementalCheck_random_edits():
+    """
+    However the code is edited, the feedback is the same as checking all of
+    it.
+    """
+    snippets = [
+        'import os\n', 'from sys import path\n', '"""Docstring."""\n',
+        '__all__ = ["foo"]\n', 'x = 1\n', 'x=2\n', 'y = x + 1\n',
+        'print(z)\n', 'z = os.getcwd()\n', 'del x\n',
+        'def foo():\n    return x\n', 'def foo():\n    pass\n',
+        'def bar(a):\n    return a + y\n',
+        'def baz():\n    global w\n    w = 1\n',
+        'def qux():\n    print(x)\n    x = 2\n',
+        'def loop():\n    for path in []:\n        pass\n',
+        'class Foo:\n    a = x\n\n    def m(self):\n        return bar\n',
+        '@decorator\ndef deco():\n    pass\n', '# A comment\n', '\n\n\n',
+        'if x:\n    import json\n', 'print(undefined_name)\n',
+    ]
+    for seed in range(60):
+        rng = random.Random(seed)
+        code = ''.join(rng.choice(snippets) for _ in range(6))
+        checker = mu.checker.IncrementalCheck()
+        for _ in range(8):
+            assert checker.check('foo.py', code) == (
+                mu.checker.check_flake('foo.py', code),
+                mu.checker.check_pycodestyle(code))
+            lines = code.splitlines(True)
+            line = rng.randrange(len(lines)) if lines else 0
+            edit = rng.randrange(4)
+            if edit == 0 or not lines:
+                lines.insert(line, rng.choice(snippets))
+            elif edit == 1:
+                del lines[line]
+            elif edit == 2:
+                lines[line] = rng.choice([
+                    lines[line].replace('x', 'y'),
+                    lines[line].replace(' = ', '='),
+                    lines[line].replace('foo', 'bar'),
+                    lines[line].rstrip('\n') + '  # c\n'])
+            else:
+                lines.insert(rng.randrange(len(lines)), lines.pop(line))
+            code = ''.join(lines)
+
+
+def test_binding_line():
+    """
+    A line binding names binds them all at once.
+    """
+    assert mu.checker.binding_line({'b', 'a'}) == 'a = b = None\n'
+    assert mu.checker.binding_line(set()) == ''
+
+
+def test_IncrementalCheck_syntax_error():
+    """
+    Code that can't be parsed is checked all at once, and forgotten.
+    """
+    checker = mu.checker.IncrementalCheck()
+    checker.check('foo.py', SCRIPT)
+    code = SCRIPT + 'def broken(:\n'
+    flake, style = checker.check('foo.py', code)
+    assert flake == mu.checker.check_flake('foo.py', code)
+    assert checker.blocks == []
+    assert checker.context is None
+
+
+def test_serve_document():
+    """
+    Code from a document is checked incrementally, using the same
+    IncrementalCheck each time.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    requests.put((1, 'foo.py', 'x = 1\n', None, 'doc'))
+    mock_check = mock.MagicMock()
+
+    def check(filename, code, builtins):
+        if code == 'x = 1\n':
+            requests.put((2, 'foo.py', 'x = 2\n', None, 'doc'))
+        else:
+            requests.put(None)
+        return {0: ['a']}, {1: ['b']}
+
+    mock_check.check.side_effect = check
+    with mock.patch('mu.checker.IncrementalCheck',
+                    return_value=mock_check) as mock_class:
+        mu.checker.serve(requests, results)
+    assert mock_class.call_count == 1
+    assert mock_check.check.call_count == 2
+    assert results.get_nowait() == (1, 'error', {0: ['a']})
+    assert results.get_nowait() == (1, 'style', {1: ['b']})
+    assert results.get_nowait() == (2, 'error', {0: ['a']})
+    assert results.get_nowait() == (2, 'style', {1: ['b']})
+    assert results.get_nowait() is None
+
+
+def test_serve_forgets_documents():
+    """
+    Only what's known about the last MAX_DOCUMENTS documents checked is
+    kept.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    documents = list(range(mu.checker.MAX_DOCUMENTS + 1)) + [0]
+    requests.put((0, 'foo.py', 'x = 1\n', None, documents.pop(0)))
+
+    def check(filename, code, builtins):
+        if documents:
+            requests.put((0, 'foo.py', 'x = 1\n', None, documents.pop(0)))
+        else:
+            requests.put(None)
+        return {}, {}
+
+    def incremental():
+        m = mock.MagicMock()
+        m.check.side_effect = check
+        return m
+
+    with mock.patch('mu.checker.IncrementalCheck',
+                    side_effect=incremental) as mock_class:
+        mu.checker.serve(requests, results)
+    # The first document was forgotten, so is checked from scratch again.
+    assert mock_class.call_count == mu.checker.MAX_DOCUMENTS + 2
+
+
+def test_serve_error():
+    """
+    If checking fails, the job gets empty feedback rather than the worker
+    dying.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    requests.put((1, 'foo.py', 'x = 1\n', None, None))
+
+    def stop(code):
+        requests.put(None)
+        raise MemoryError()
+
+    with mock.patch('mu.checker.check_flake', side_effect=RecursionError), \
+            mock.patch('mu.checker.check_pycodestyle', side_effect=stop):
+        mu.checker.serve(requests, results)
+    assert results.get_nowait() == (1, 'error', {})
+    assert results.get_nowait() == (1, 'style', {})
+    assert results.get_nowait() is None
+
+
+def test_serve_document_error():
+    """
+    If checking a document fails, the job gets empty feedback and what's
+    known about the document is forgotten.
+    """
+    requests = queue.Queue()
+    results = queue.Queue()
+    requests.put((1, 'foo.py', 'x = 1\n', None, 'doc'))
+
+    def fail(filename, code, builtins):
+        requests.put((2, 'foo.py', 'x = 1\n', None, 'doc'))
+        raise RecursionError()
+
+    def stop(filename, code, builtins):
+        requests.put(None)
+        return {}, {}
+
+    first, second = mock.MagicMock(), mock.MagicMock()
+    first.check.side_effect = fail
+    second.check.side_effect = stop
+    with mock.patch('mu.checker.IncrementalCheck',
+                    side_effect=[first, second]):
+        mu.checker.serve(requests, results)
+    assert results.get_nowait() == (1, 'error', {})
+    assert results.get_nowait() == (1, 'style', {})
+    assert results.get_nowait() == (2, 'error', {})
+    assert results.get_nowait() == (2, 'style', {})
+    assert results.get_nowait() is None
+    assert second.check.call_count == 1
+
+
+def test_main():
+    """
+    The worker process reads pickled requests from stdin and writes pickled
+    results to stdout, and stops when stdin is closed.
+    """
+    worker = subprocess.Popen([sys.executable, '-m', 'mu.checker'],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        pickle.dump((1, 'foo.py', 'import foo\n', None, None), worker.stdin)
+        worker.stdin.flush()
+        job, part, feedback = pickle.load(worker.stdout)
+        assert (job, part) == (1, 'error')
+        assert feedback[0][0]['message'] == "'foo' imported but unused"
+        assert pickle.load(worker.stdout)[:2] == (1, 'style')
+        worker.stdin.close()
+        assert pickle.load(worker.stdout) is None
+        assert worker.wait(30) == 0
+    finally:
+        worker.stdout.close()
+        if worker.poll() is None:
+            worker.kill()
@@ -0,0 +1,549 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for reading and writing the files edited in Mu.
+"""
+import os
+import codecs
+import contextlib
+import locale
+import mmap
+import re
+import shutil
+import tempfile
+from unittest import mock
+
+import pytest
+import mu.files
+
+
+ENCODING_COOKIE = '# -*- coding: {} -*- {}'.format(mu.files.ENCODING,
+                                                   mu.files.NEWLINE)
+
+
+@contextlib.contextmanager
+def generate_python_file(text=""):
+    """Create a temp directory and populate it with one .py file, then remove
+    it
+    """
+    dirpath = tempfile.mkdtemp(prefix="mu-")
+    filepath = os.path.join(dirpath, "file.py")
+    #
+    # Write using newline="" so line-ending tests can work!
+    #
+    with open(filepath, "w", encoding=mu.files.ENCODING, newline="") as f:
+        f.write(text)
+    yield filepath
+    shutil.rmtree(dirpath)
+
+
+def test_write_and_flush():
+    """
+    Ensure the write and flush function tries to write to the filesystem and
+    flush so the write happens immediately.
+    """
+    mock_fd = mock.MagicMock()
+    mock_content = mock.MagicMock()
+    with mock.patch('mu.files.os.fsync') as fsync:
+        mu.files.write_and_flush(mock_fd, mock_content)
+        fsync.assert_called_once_with(mock_fd)
+    mock_fd.write.assert_called_once_with(mock_content)
+    mock_fd.flush.assert_called_once_with()
+
+
+def test_save_and_encode():
+    """
+    When saving, ensure that encoding cookies are honoured, otherwise fall back
+    to the default encoding (UTF-8 -- as per Python standard practice).
+    """
+    encoding_cookie = '# -*- coding: latin-1 -*-'
+    text = encoding_cookie + '\n\nprint("Hello")'
+    mock_open = mock.MagicMock()
+    mock_wandf = mock.MagicMock()
+    # Valid cookie
+    with mock.patch('mu.files.open', mock_open), \
+            mock.patch('mu.files.write_and_flush', mock_wandf):
+        mu.files.save_and_encode(text, 'foo.py')
+    mock_open.assert_called_once_with('foo.py', 'w', encoding='latin-1',
+                                      newline='')
+    assert mock_wandf.call_count == 1
+    mock_open.reset_mock()
+    mock_wandf.reset_mock()
+    # Invalid cookie
+    encoding_cookie = '# -*- coding: utf-42 -*-'
+    text = encoding_cookie + '\n\nprint("Hello")'
+    with mock.patch('mu.files.open', mock_open), \
+            mock.patch('mu.files.write_and_flush', mock_wandf):
+        mu.files.save_and_encode(text, 'foo.py')
+    mock_open.assert_called_once_with('foo.py', 'w',
+                                      encoding=mu.files.ENCODING,
+                                      newline='')
+    assert mock_wandf.call_count == 1
+    mock_open.reset_mock()
+    mock_wandf.reset_mock()
+    # No cookie
+    text = 'print("Hello")'
+    with mock.patch('mu.files.open', mock_open), \
+            mock.patch('mu.files.write_and_flush', mock_wandf):
+        mu.files.save_and_encode(text, 'foo.py')
+    mock_open.assert_called_once_with('foo.py', 'w',
+                                      encoding=mu.files.ENCODING,
+                                      newline='')
+    assert mock_wandf.call_count == 1
+
+
+def test_save_and_encode_atomic():
+    """
+    When saving atomically the file is replaced, keeping its permissions, and
+    no temporary files are left behind. If the file is a symlink, the file it
+    links to is replaced.
+    """
+    with generate_python_file('old') as filepath:
+        os.chmod(filepath, 0o640)
+        mu.files.save_and_encode('new\nfile', filepath, '\r\n', atomic=True)
+        with open(filepath, newline='') as f:
+            assert f.read() == 'new\r\nfile'
+        assert os.stat(filepath).st_mode & 0o777 == 0o640
+        link = filepath + '.link.py'
+        os.symlink(filepath, link)
+        mu.files.save_and_encode('newer', link, '\n', atomic=True)
+        assert os.path.islink(link)
+        with open(filepath) as f:
+            assert f.read() == 'newer'
+        assert len(os.listdir(os.path.dirname(filepath))) == 2
+
+
+def test_save_and_encode_atomic_fallback():
+    """
+    If the file can't be replaced atomically, it's written in place.
+    """
+    mock_open = mock.mock_open()
+    with mock.patch('mu.files.write_atomically', return_value=False), \
+            mock.patch('mu.files.open', mock_open), \
+            mock.patch('mu.files.write_and_flush'):
+        mu.files.save_and_encode('foo', 'foo.py', atomic=True)
+    mock_open.assert_called_once_with('foo.py', 'w',
+                                      encoding=mu.files.ENCODING,
+                                      newline='')
+
+
+def test_write_atomically_no_temp_file():
+    """
+    If the temporary file can't be created, nothing is written.
+    """
+    with mock.patch('mu.files.tempfile.mkstemp', side_effect=OSError()):
+        assert mu.files.write_atomically(b'foo', 'foo.py') is False
+
+
+def test_write_atomically_no_rename():
+    """
+    If the temporary file can't replace the file, the temporary file is
+    removed and the original file is left alone.
+    """
+    with generate_python_file('old') as filepath:
+        with mock.patch('mu.files.os.replace', side_effect=OSError()):
+            assert mu.files.write_atomically(b'new', filepath) is False
+        with open(filepath) as f:
+            assert f.read() == 'old'
+        assert os.listdir(os.path.dirname(filepath)) == [
+            os.path.basename(filepath)]
+
+
+def test_sniff_encoding_from_BOM():
+    """
+    Ensure an expected BOM detected at the start of the referenced file is
+    used to set the expected encoding.
+    """
+    with mock.patch('mu.files.open',
+                    mock.mock_open(read_data=codecs.BOM_UTF8 + b'# hello')):
+        assert mu.files.sniff_encoding('foo.py') == 'utf-8-sig'
+
+
+def test_sniff_encoding_from_cookie():
+    """
+    If there's a cookie present, then use that to work out the expected
+    encoding.
+    """
+    encoding_cookie = b'# -*- coding: latin-1 -*-'
+    mock_locale = mock.MagicMock()
+    mock_locale.getpreferredencoding.return_value = 'UTF-8'
+    with mock.patch('mu.files.open',
+                    mock.mock_open(read_data=encoding_cookie)), \
+            mock.patch('mu.files.locale', mock_locale):
+        assert mu.files.sniff_encoding('foo.py') == 'latin-1'
+
+
+def test_sniff_encoding_from_bad_cookie():
+    """
+    If there's a cookie present but we can't even read it, then return None.
+    """
+    encoding_cookie = '# -*- coding: silly-你好 -*-'.encode('utf-8')
+    mock_locale = mock.MagicMock()
+    mock_locale.getpreferredencoding.return_value = 'ascii'
+    with mock.patch('mu.files.open',
+                    mock.mock_open(read_data=encoding_cookie)), \
+            mock.patch('mu.files.locale', mock_locale):
+        assert mu.files.sniff_encoding('foo.py') is None
+
+
+def test_sniff_encoding_fallback_to_locale():
+    """
+    If there's no encoding information in the file, just return None.
+    """
+    mock_locale = mock.MagicMock()
+    mock_locale.getpreferredencoding.return_value = 'ascii'
+    with mock.patch('mu.files.open',
+                    mock.mock_open(read_data=b'# hello')), \
+            mock.patch('mu.files.locale', mock_locale):
+        assert mu.files.sniff_encoding('foo.py') is None
+
+
+def test_sniff_newline_convention():
+    """
+    Ensure sniff_newline_convention returns the expected newline convention.
+    """
+    text = 'the\r\ncat\nsat\non\nthe\r\nmat'
+    assert mu.files.sniff_newline_convention(text) == '\n'
+
+
+def test_sniff_newline_convention_local():
+    """
+    Ensure sniff_newline_convention returns the local newline convention if it
+    cannot determine it from the text.
+    """
+    text = 'There are no new lines here'
+    assert mu.files.sniff_newline_convention(text) == os.linesep
+
+
+def test_sniff_newline_convention_blank_lines():
+    """
+    Consecutive newlines (i.e. blank lines) are all counted.
+    """
+    text = 'print("Hello")\n\n\nprint("Goodbye")\r\nprint(1)\r\n'
+    assert mu.files.sniff_newline_convention(text) == '\n'
+
+
+def test_sniff_encoding_from_line():
+    """
+    The encoding can be determined from the first line of a file.
+    """
+    assert mu.files.sniff_encoding_from_line(codecs.BOM_UTF8) == 'utf-8-sig'
+    assert mu.files.sniff_encoding_from_line(
+        b'# -*- coding: latin-1 -*-\n') == 'latin-1'
+    assert mu.files.sniff_encoding_from_line(b'print("Hello")\n') is None
+
+
+def test_file_identity():
+    """
+    Different paths to the same file have the same identity. Missing files
+    have no identity.
+    """
+    path = os.path.abspath(__file__)
+    other_path = os.path.join(os.path.dirname(path), '.',
+                              os.path.basename(path))
+    assert mu.files.file_identity(path) is not None
+    assert mu.files.file_identity(path) == mu.files.file_identity(other_path)
+    assert mu.files.file_identity(path) != mu.files.file_identity(
+        os.path.dirname(path))
+    assert mu.files.file_identity(path + '.missing') is None
+
+
+def test_file_signature():
+    """
+    A file's signature changes when the file is modified. Missing files have
+    no signature.
+    """
+    with generate_python_file('foo') as filepath:
+        signature = mu.files.file_signature(filepath)
+        assert signature == mu.files.file_signature(filepath)
+        with open(filepath, 'w') as f:
+            f.write('foo bar')
+        assert mu.files.file_signature(filepath) != signature
+    assert mu.files.file_signature(filepath) is None
+
+
+def test_content_hash():
+    """
+    The hash of some text changes with its content but not its newlines.
+    """
+    assert mu.files.content_hash('a\nb') == mu.files.content_hash('a\r\nb')
+    assert mu.files.content_hash('a\nb') != mu.files.content_hash('a\nc')
+
+
+#
+# Tests for newline detection
+# Mu should detect the majority newline convention
+# in a loaded file and use that convention when writing
+# the file out again. Internally all newlines are MU_NEWLINE
+#
+
+def test_read_newline_no_text():
+    """If the file being loaded is empty, use the platform default newline
+    """
+    with generate_python_file() as filepath:
+        text, newline = mu.files.read_and_decode(filepath)
+        assert text.count("\r\n") == 0
+        assert newline == os.linesep
+
+
+def test_read_newline_all_unix():
+    """If the file being loaded has only the Unix convention, use that
+    """
+    with generate_python_file("abc\ndef") as filepath:
+        text, newline = mu.files.read_and_decode(filepath)
+        assert text.count("\r\n") == 0
+        assert newline == "\n"
+
+
+def test_read_newline_all_windows():
+    """If the file being loaded has only the Windows convention, use that
+    """
+    with generate_python_file("abc\r\ndef") as filepath:
+        text, newline = mu.files.read_and_decode(filepath)
+        assert text.count("\r\n") == 0
+        assert newline == "\r\n"
+
+
+def test_read_newline_most_unix():
+    """If the file being loaded has mostly the Unix convention, use that
+    """
+    with generate_python_file("\nabc\r\ndef\n") as filepath:
+        text, newline = mu.files.read_and_decode(filepath)
+        assert text.count("\r\n") == 0
+        assert newline == "\n"
+
+
+def test_read_newline_most_windows():
+    """If the file being loaded has mostly the Windows convention, use that
+    """
+    with generate_python_file("\r\nabc\ndef\r\n") as filepath:
+        text, newline = mu.files.read_and_decode(filepath)
+        assert text.count("\r\n") == 0
+        assert newline == "\r\n"
+
+
+def test_read_newline_equal_match():
+    """If the file being loaded has an equal number of Windows and
+    Unix newlines, use the platform default
+    """
+    with generate_python_file("\r\nabc\ndef") as filepath:
+        text, newline = mu.files.read_and_decode(filepath)
+        assert text.count("\r\n") == 0
+        assert newline == os.linesep
+
+
+def test_read_and_decode_reads_once():
+    """
+    The file is only opened and read once.
+    """
+    with generate_python_file("abc\r\ndef") as filepath:
+        with mock.patch('mu.files.open', wraps=open) as mock_open:
+            text, newline = mu.files.read_and_decode(filepath)
+    mock_open.assert_called_once_with(filepath, 'rb')
+    assert text == "abc\ndef"
+    assert newline == "\r\n"
+
+
+def test_read_and_decode_mmap():
+    """
+    Large files are memory mapped and decoded in exactly the same way as
+    small ones.
+    """
+    lines = ["# -*- coding: iso-8859-1 -*-", UNICODE_TEST_STRING, "\n"]
+    test_string = "\r\n".join(lines)
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(test_string.encode("iso-8859-1"))
+        with mock.patch('mu.files.MMAP_THRESHOLD', 0), \
+                mock.patch('mu.files.mmap.mmap', wraps=mmap.mmap) as mapped:
+            text, newline = mu.files.read_and_decode(filepath)
+    assert mapped.call_count == 1
+    assert text == test_string.replace("\r\n", "\n")
+    assert newline == "\r\n"
+
+
+def test_read_and_decode_single_line():
+    """
+    A BOM is found in a file with only one line (and no newline).
+    """
+    with generate_python_file() as filepath:
+        with open(filepath, "w", encoding="utf-8-sig") as f:
+            f.write(UNICODE_TEST_STRING)
+        text, _ = mu.files.read_and_decode(filepath)
+    assert text == UNICODE_TEST_STRING
+
+
+#
+# When writing Mu should honour the line-ending convention found inbound
+#
+def test_write_newline_to_unix():
+    """If the file had Unix newlines it should be saved with Unix newlines
+
+    (In principle this check is unnecessary as Unix newlines are currently
+    the Mu internal default; but we leave it here in case that situation
+    changes)
+    """
+    with generate_python_file() as filepath:
+        test_string = "\r\n".join("the cat sat on the mat".split())
+        mu.files.save_and_encode(test_string, filepath, "\n")
+        with open(filepath, newline="") as f:
+            text = f.read()
+            assert text.count("\r\n") == 0
+            assert text.count("\n") == test_string.count("\r\n")
+
+
+def test_write_newline_to_windows():
+    """If the file had Windows newlines it should be saved with Windows
+    newlines
+    """
+    with generate_python_file() as filepath:
+        test_string = "\n".join("the cat sat on the mat".split())
+        mu.files.save_and_encode(test_string, filepath, "\r\n")
+        with open(filepath, newline="") as f:
+            text = f.read()
+            assert len(re.findall("[^\r]\n", text)) == 0
+            assert text.count("\r\n") == test_string.count("\n")
+
+
+#
+# Generate a Unicode test string which includes all the usual
+# 7-bit characters but also an 8th-bit range which tends to
+# trip things up between encodings
+#
+BYTES_TEST_STRING = bytes(range(0x20, 0x80)) + bytes(range(0xa0, 0xff))
+UNICODE_TEST_STRING = BYTES_TEST_STRING.decode("iso-8859-1")
+
+
+#
+# Tests for encoding detection
+# Mu should detect:
+# - BOM (UTF8/16)
+# - Encoding cooke, eg # -*- coding: utf-8 -*-
+# - fallback to the platform default (locale.getpreferredencoding())
+#
+def test_read_utf8bom():
+    """Successfully decode from utf-8 encoded with BOM
+    """
+    with generate_python_file() as filepath:
+        with open(filepath, "w", encoding="utf-8-sig") as f:
+            f.write(UNICODE_TEST_STRING)
+        text, _ = mu.files.read_and_decode(filepath)
+        assert text == UNICODE_TEST_STRING
+
+
+def test_read_utf16bebom():
+    """Successfully decode from utf-16 BE encoded with BOM
+    """
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(codecs.BOM_UTF16_BE)
+            f.write(UNICODE_TEST_STRING.encode("utf-16-be"))
+        text, _ = mu.files.read_and_decode(filepath)
+        assert text == UNICODE_TEST_STRING
+
+
+def test_read_utf16lebom():
+    """Successfully decode from utf-16 LE encoded with BOM
+    """
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(codecs.BOM_UTF16_LE)
+            f.write(UNICODE_TEST_STRING.encode("utf-16-le"))
+        text, _ = mu.files.read_and_decode(filepath)
+        assert text == UNICODE_TEST_STRING
+
+
+def test_read_encoding_cookie():
+    """Successfully decode from iso-8859-1 with an encoding cookie
+    """
+    encoding_cookie = ENCODING_COOKIE.replace(
+        mu.files.ENCODING, "iso-8859-1")
+    test_string = encoding_cookie + UNICODE_TEST_STRING
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(test_string.encode("iso-8859-1"))
+        text, _ = mu.files.read_and_decode(filepath)
+        assert text == test_string
+
+
+def test_read_encoding_mu_default():
+    """Successfully decode from the mu default
+    """
+    test_string = UNICODE_TEST_STRING.encode(mu.files.ENCODING)
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(test_string)
+        text, _ = mu.files.read_and_decode(filepath)
+        assert text == UNICODE_TEST_STRING
+
+
+def test_read_encoding_default():
+    """Successfully decode from the default locale
+    """
+    test_string = UNICODE_TEST_STRING.encode(locale.getpreferredencoding())
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(test_string)
+        text, _ = mu.files.read_and_decode(filepath)
+        assert text == UNICODE_TEST_STRING
+
+
+def test_read_encoding_unsuccessful():
+    """Fail to decode encoded text
+    """
+    #
+    # Have to work quite hard to produce text which will definitely
+    # fail to decode since UTF-8 and cp1252 (the default on this
+    # computer) will, between them, decode nearly anything!
+    #
+    with generate_python_file() as filepath:
+        with open(filepath, "wb") as f:
+            f.write(codecs.BOM_UTF8)
+            f.write(b"\xd8\x00")
+        with pytest.raises(UnicodeDecodeError):
+            text, _ = mu.files.read_and_decode(filepath)
+
+
+#
+# When writing, if the text has an encoding cookie, then that encoding
+# should be used. Otherwise, UTF-8 should be used and no encoding cookie
+# added
+#
+def test_write_encoding_cookie_no_cookie():
+    """If the text has no cookie of its own utf-8 will be used
+    when saving and no cookie added
+    """
+    test_string = UNICODE_TEST_STRING
+    with generate_python_file() as filepath:
+        mu.files.save_and_encode(test_string, filepath)
+        with open(filepath, encoding=mu.files.ENCODING) as f:
+            for line in f:
+                assert line == test_string
+                break
+
+
+def test_write_encoding_cookie_existing_cookie():
+    """If the text has a encoding cookie of its own then that encoding will
+    be used when saving and no change made to the cookie
+    """
+    encoding = "iso-8859-1"
+    cookie = ENCODING_COOKIE.replace(mu.files.ENCODING, encoding)
+    test_string = cookie + UNICODE_TEST_STRING
+    with generate_python_file() as filepath:
+        mu.files.save_and_encode(test_string, filepath)
+        with open(filepath, encoding=encoding) as f:
+            assert next(f) == cookie
+            assert next(f) == UNICODE_TEST_STRING
+
+
+def test_write_invalid_codec():
+    """If an encoding cookie is present but specifies an unknown codec,
+    utf-8 will be used instead
+    """
+    encoding = "INVALID"
+    cookie = ENCODING_COOKIE.replace(mu.files.ENCODING, encoding)
+    test_string = cookie + UNICODE_TEST_STRING
+    with generate_python_file() as filepath:
+        mu.files.save_and_encode(test_string, filepath)
+        with open(filepath, encoding=mu.files.ENCODING) as f:
+            assert next(f) == cookie
+            assert next(f) == UNICODE_TEST_STRING
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for handing files to a copy of Mu that's already running.
+"""
+import os
+import uuid
+from unittest import mock
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtNetwork import QLocalSocket
+import mu.instance
+from mu.instance import InstanceServer, forward_paths, server_name, is_stale
+
+
+def process_events(server, count=20):
+    """
+    Give the server's sockets a chance to do their work.
+    """
+    for _ in range(count):
+        QCoreApplication.processEvents()
+        server.server.waitForNewConnection(10)
+
+
+def test_server_name():
+    """
+    Each user has their own socket.
+    """
+    with mock.patch('mu.instance.getpass.getuser', return_value='alice'):
+        assert server_name() == 'mu-editor-alice'
+    with mock.patch('mu.instance.getpass.getuser', side_effect=KeyError()):
+        assert server_name() == 'mu-editor-'
+
+
+def test_forward_paths_no_server():
+    """
+    If no copy of Mu is running, forwarding fails.
+    """
+    assert forward_paths(['foo.py'], 'mu-test-{}'.format(uuid.uuid4())) \
+        is False
+
+
+def test_forward_paths_bad_path():
+    """
+    Paths that can't be made absolute mean Mu starts as usual (so the problem
+    is reported).
+    """
+    assert forward_paths([None], 'mu-test-{}'.format(uuid.uuid4())) is False
+
+
+def test_forward_paths():
+    """
+    Paths are made absolute and received by the running copy of Mu.
+    """
+    name = 'mu-test-{}'.format(uuid.uuid4())
+    server = InstanceServer(name)
+    assert server.listen()
+    received = mock.MagicMock()
+    server.paths_received.connect(received)
+    try:
+        assert forward_paths(['foo.py'], name)
+        process_events(server)
+    finally:
+        server.server.close()
+    received.assert_called_once_with([os.path.abspath('foo.py')])
+    assert server.buffers == {}
+
+
+def test_forward_no_paths():
+    """
+    A copy of Mu started without any files to open still reaches the running
+    copy, with an empty list of paths (so it comes to the front).
+    """
+    name = 'mu-test-{}'.format(uuid.uuid4())
+    server = InstanceServer(name)
+    assert server.listen()
+    received = mock.MagicMock()
+    server.paths_received.connect(received)
+    try:
+        assert forward_paths([], name)
+        process_events(server)
+    finally:
+        server.server.close()
+    received.assert_called_once_with([])
+
+
+def test_InstanceServer_bad_message():
+    """
+    Garbled messages are logged and ignored.
+    """
+    server = InstanceServer('foo')
+    socket = mock.MagicMock()
+    socket.readAll.return_value = b'{"path": []}\n'
+    server.buffers[socket] = b''
+    received = mock.MagicMock()
+    server.paths_received.connect(received)
+    with mock.patch('mu.instance.logger.error') as log:
+        server.on_ready_read(socket)
+    assert log.call_count == 1
+    assert received.call_count == 0
+    socket.disconnectFromServer.assert_called_once_with()
+
+
+def test_InstanceServer_partial_message():
+    """
+    Messages that arrive in several pieces are put back together.
+    """
+    server = InstanceServer('foo')
+    socket = mock.MagicMock()
+    socket.readAll.side_effect = [b'{"paths": ', b'["foo.py"]}\n']
+    server.buffers[socket] = b''
+    received = mock.MagicMock()
+    server.paths_received.connect(received)
+    server.on_ready_read(socket)
+    assert received.call_count == 0
+    server.on_ready_read(socket)
+    received.assert_called_once_with(['foo.py'])
+
+
+def test_InstanceServer_close():
+    """
+    Disconnected sockets are forgotten.
+    """
+    server = InstanceServer('foo')
+    socket = mock.MagicMock()
+    socket.readAll.return_value = b''
+    server.buffers[socket] = b''
+    server.close(socket)
+    assert server.buffers == {}
+    socket.deleteLater.assert_called_once_with()
+
+
+def test_InstanceServer_listen_stale():
+    """
+    A socket left behind by a copy of Mu that crashed is removed.
+    """
+    server = InstanceServer('foo')
+    server.server = mock.MagicMock()
+    server.server.listen.side_effect = [False, True]
+    with mock.patch('mu.instance.is_stale', return_value=True), \
+            mock.patch('mu.instance.QLocalServer.removeServer') as remove:
+        assert server.listen() is True
+    remove.assert_called_once_with('foo')
+    server.server.listen.side_effect = [False, False]
+    with mock.patch('mu.instance.is_stale', return_value=True), \
+            mock.patch('mu.instance.QLocalServer.removeServer'), \
+            mock.patch('mu.instance.logger.warning') as log:
+        assert server.listen() is False
+    assert log.call_count == 1
+
+
+def test_InstanceServer_listen_in_use():
+    """
+    A socket used by a running copy of Mu (even one too slow to answer
+    forward_paths) is left alone.
+    """
+    server = InstanceServer('foo')
+    server.server = mock.MagicMock()
+    server.server.listen.return_value = False
+    with mock.patch('mu.instance.is_stale', return_value=False), \
+            mock.patch('mu.instance.QLocalServer.removeServer') as remove:
+        assert server.listen() is False
+    assert remove.call_count == 0
+
+
+def test_is_stale():
+    """
+    A socket is only stale if there's no such socket or nothing is listening
+    on it, not if the copy of Mu listening on it is slow to respond.
+    """
+    name = 'mu-test-{}'.format(uuid.uuid4())
+    assert is_stale(name) is True
+    server = InstanceServer(name)
+    assert server.listen()
+    try:
+        assert is_stale(name) is False
+    finally:
+        server.server.close()
+    socket = mock.MagicMock()
+    socket.waitForConnected.return_value = False
+    for error, stale in ((QLocalSocket.ServerNotFoundError, True),
+                         (QLocalSocket.ConnectionRefusedError, True),
+                         (QLocalSocket.SocketTimeoutError, False)):
+        socket.error.return_value = error
+        with mock.patch('mu.instance.QLocalSocket') as socket_class:
+            socket_class.return_value = socket
+            socket_class.ServerNotFoundError = QLocalSocket.ServerNotFoundError
+            socket_class.ConnectionRefusedError = \
+                QLocalSocket.ConnectionRefusedError
+            assert is_stale(name) is stale
+    socket.waitForConnected.assert_called_with(mu.instance.STALE_TIMEOUT)
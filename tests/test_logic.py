@@ -4,11 +4,8 @@ Tests for the Editor and REPL logic.
 """
 import sys
 import os
-import codecs
 import contextlib
 import json
-import locale
-import re
 import shutil
 import subprocess
 import tempfile
@@ -17,6 +14,9 @@ import uuid
 
 import pytest
 import mu.logic
+import mu.checker
+import mu.search
+from mu.modes.registry import ModeRegistry, ModeSpec
 from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtCore import pyqtSignal, QObject
 
@@ -33,8 +33,6 @@ SESSION = json.dumps({
         ['name', 'value'],
     ],
 })
-ENCODING_COOKIE = '# -*- coding: {} -*- {}'.format(mu.logic.ENCODING,
-                                                   mu.logic.NEWLINE)
 
 
 #
@@ -160,6 +158,35 @@ def mocked_view(text, path, newline):
     return view
 
 
+def mocked_modes(**modes):
+    """Return a mode registry containing the (mocked) mode instances passed in
+
+    Looking up a key in the registry returns the associated mock. Mocks that
+    define a list of file_extensions are registered as handling those types
+    of file.
+    """
+    registry = ModeRegistry(None, None)
+    for key, mode in modes.items():
+        extensions = mode.file_extensions
+        if not isinstance(extensions, list):
+            extensions = []
+        registry.register(ModeSpec(key, mock.MagicMock(return_value=mode),
+                                   mode.name, mode.description, mode.icon,
+                                   is_debugger=mode.is_debugger,
+                                   file_extensions=extensions,
+                                   valid_boards=[key]))
+    return registry
+
+
+def attached_devices(**devices):
+    """Pretend the devices (a port and serial number for each key of a mode
+    made by mocked_modes) are attached.
+    """
+    return mock.patch('mu.modes.registry.find_device',
+                      lambda boards, with_logging: devices.get(boards[0],
+                                                               (None, None)))
+
+
 def mocked_editor(mode="python", text=None, path=None, newline=None):
     """Return a mocked editor with a mocked view
 
@@ -174,9 +201,7 @@ def mocked_editor(mode="python", text=None, path=None, newline=None):
     mock_mode.save_timeout = 5
     mock_mode.workspace_dir.return_value = '/fake/path'
     mock_mode.api.return_value = ["API Specification"]
-    ed.modes = {
-        mode: mock_mode,
-    }
+    ed.modes = mocked_modes(**{mode: mock_mode})
     return ed
 
 
@@ -189,127 +214,6 @@ def test_CONSTANTS():
     assert mu.logic.WORKSPACE_NAME
 
 
-def test_write_and_flush():
-    """
-    Ensure the write and flush function tries to write to the filesystem and
-    flush so the write happens immediately.
-    """
-    mock_fd = mock.MagicMock()
-    mock_content = mock.MagicMock()
-    with mock.patch('mu.logic.os.fsync') as fsync:
-        mu.logic.write_and_flush(mock_fd, mock_content)
-        fsync.assert_called_once_with(mock_fd)
-    mock_fd.write.assert_called_once_with(mock_content)
-    mock_fd.flush.assert_called_once_with()
-
-
-def test_save_and_encode():
-    """
-    When saving, ensure that encoding cookies are honoured, otherwise fall back
-    to the default encoding (UTF-8 -- as per Python standard practice).
-    """
-    encoding_cookie = '# -*- coding: latin-1 -*-'
-    text = encoding_cookie + '\n\nprint("Hello")'
-    mock_open = mock.MagicMock()
-    mock_wandf = mock.MagicMock()
-    # Valid cookie
-    with mock.patch('mu.logic.open', mock_open), \
-            mock.patch('mu.logic.write_and_flush', mock_wandf):
-        mu.logic.save_and_encode(text, 'foo.py')
-    mock_open.assert_called_once_with('foo.py', 'w', encoding='latin-1',
-                                      newline='')
-    assert mock_wandf.call_count == 1
-    mock_open.reset_mock()
-    mock_wandf.reset_mock()
-    # Invalid cookie
-    encoding_cookie = '# -*- coding: utf-42 -*-'
-    text = encoding_cookie + '\n\nprint("Hello")'
-    with mock.patch('mu.logic.open', mock_open), \
-            mock.patch('mu.logic.write_and_flush', mock_wandf):
-        mu.logic.save_and_encode(text, 'foo.py')
-    mock_open.assert_called_once_with('foo.py', 'w',
-                                      encoding=mu.logic.ENCODING,
-                                      newline='')
-    assert mock_wandf.call_count == 1
-    mock_open.reset_mock()
-    mock_wandf.reset_mock()
-    # No cookie
-    text = 'print("Hello")'
-    with mock.patch('mu.logic.open', mock_open), \
-            mock.patch('mu.logic.write_and_flush', mock_wandf):
-        mu.logic.save_and_encode(text, 'foo.py')
-    mock_open.assert_called_once_with('foo.py', 'w',
-                                      encoding=mu.logic.ENCODING,
-                                      newline='')
-    assert mock_wandf.call_count == 1
-
-
-def test_sniff_encoding_from_BOM():
-    """
-    Ensure an expected BOM detected at the start of the referenced file is
-    used to set the expected encoding.
-    """
-    with mock.patch('mu.logic.open',
-                    mock.mock_open(read_data=codecs.BOM_UTF8 + b'# hello')):
-        assert mu.logic.sniff_encoding('foo.py') == 'utf-8-sig'
-
-
-def test_sniff_encoding_from_cookie():
-    """
-    If there's a cookie present, then use that to work out the expected
-    encoding.
-    """
-    encoding_cookie = b'# -*- coding: latin-1 -*-'
-    mock_locale = mock.MagicMock()
-    mock_locale.getpreferredencoding.return_value = 'UTF-8'
-    with mock.patch('mu.logic.open',
-                    mock.mock_open(read_data=encoding_cookie)), \
-            mock.patch('mu.logic.locale', mock_locale):
-        assert mu.logic.sniff_encoding('foo.py') == 'latin-1'
-
-
-def test_sniff_encoding_from_bad_cookie():
-    """
-    If there's a cookie present but we can't even read it, then return None.
-    """
-    encoding_cookie = '# -*- coding: silly-你好 -*-'.encode('utf-8')
-    mock_locale = mock.MagicMock()
-    mock_locale.getpreferredencoding.return_value = 'ascii'
-    with mock.patch('mu.logic.open',
-                    mock.mock_open(read_data=encoding_cookie)), \
-            mock.patch('mu.logic.locale', mock_locale):
-        assert mu.logic.sniff_encoding('foo.py') is None
-
-
-def test_sniff_encoding_fallback_to_locale():
-    """
-    If there's no encoding information in the file, just return None.
-    """
-    mock_locale = mock.MagicMock()
-    mock_locale.getpreferredencoding.return_value = 'ascii'
-    with mock.patch('mu.logic.open',
-                    mock.mock_open(read_data=b'# hello')), \
-            mock.patch('mu.logic.locale', mock_locale):
-        assert mu.logic.sniff_encoding('foo.py') is None
-
-
-def test_sniff_newline_convention():
-    """
-    Ensure sniff_newline_convention returns the expected newline convention.
-    """
-    text = 'the\r\ncat\nsat\non\nthe\r\nmat'
-    assert mu.logic.sniff_newline_convention(text) == '\n'
-
-
-def test_sniff_newline_convention_local():
-    """
-    Ensure sniff_newline_convention returns the local newline convention if it
-    cannot determine it from the text.
-    """
-    text = 'There are no new lines here'
-    assert mu.logic.sniff_newline_convention(text) == os.linesep
-
-
 def test_get_admin_file_path():
     """
     Finds an admin file in the application location, when Mu is run as if
@@ -447,146 +351,6 @@ def test_extract_envars():
     ]
 
 
-def test_check_flake():
-    """
-    Ensure the check_flake method calls PyFlakes with the expected code
-    reporter.
-    """
-    mock_r = mock.MagicMock()
-    mock_r.log = [{'line_no': 2, 'column': 0, 'message': 'b'}]
-    with mock.patch('mu.logic.MuFlakeCodeReporter', return_value=mock_r), \
-            mock.patch('mu.logic.check', return_value=None) as mock_check:
-        result = mu.logic.check_flake('foo.py', 'some code')
-        assert result == {2: mock_r.log}
-        mock_check.assert_called_once_with('some code', 'foo.py', mock_r)
-
-
-def test_check_flake_needing_expansion():
-    """
-    Ensure the check_flake method calls PyFlakes with the expected code
-    reporter.
-    """
-    mock_r = mock.MagicMock()
-    msg = "'microbit.foo' imported but unused"
-    mock_r.log = [{'line_no': 2, 'column': 0, 'message': msg}]
-    with mock.patch('mu.logic.MuFlakeCodeReporter', return_value=mock_r), \
-            mock.patch('mu.logic.check', return_value=None) as mock_check:
-        code = 'from microbit import *'
-        result = mu.logic.check_flake('foo.py', code)
-        assert result == {}
-        mock_check.assert_called_once_with(mu.logic.EXPANDED_IMPORT, 'foo.py',
-                                           mock_r)
-
-
-def test_check_flake_with_builtins():
-    """
-    If a list of assumed builtin symbols is passed, any "undefined name"
-    messages for them are ignored.
-    """
-    mock_r = mock.MagicMock()
-    mock_r.log = [{'line_no': 2, 'column': 0,
-                  'message': "undefined name 'foo'"}]
-    with mock.patch('mu.logic.MuFlakeCodeReporter', return_value=mock_r), \
-            mock.patch('mu.logic.check', return_value=None) as mock_check:
-        result = mu.logic.check_flake('foo.py', 'some code',
-                                      builtins=['foo', ])
-        assert result == {}
-        mock_check.assert_called_once_with('some code', 'foo.py', mock_r)
-
-
-def test_check_pycodestyle():
-    """
-    Ensure the expected result if generated from the PEP8 style validator.
-    """
-    code = "import foo\n\n\n\n\n\ndef bar():\n    pass\n"  # Generate E303
-    result = mu.logic.check_pycodestyle(code)
-    assert len(result) == 1
-    assert result[6][0]['line_no'] == 6
-    assert result[6][0]['column'] == 0
-    assert ' above this line' in result[6][0]['message']
-    assert result[6][0]['code'] == 'E303'
-
-
-def test_check_pycodestyle_with_non_ascii():
-    """
-    Ensure pycodestyle can at least see a file with non-ASCII characters
-    """
-    code = "x='\u2005'\n"
-    try:
-        mu.logic.check_pycodestyle(code)
-    except Exception as exc:
-        assert False, "Exception was raised: %s" % exc
-    #
-    # Doesn't actually matter what pycodestyle returns; we just want to make
-    # sure it didn't error out
-    #
-
-
-def test_MuFlakeCodeReporter_init():
-    """
-    Check state is set up as expected.
-    """
-    r = mu.logic.MuFlakeCodeReporter()
-    assert r.log == []
-
-
-def test_MuFlakeCodeReporter_unexpected_error():
-    """
-    Check the reporter handles unexpected errors.
-    """
-    r = mu.logic.MuFlakeCodeReporter()
-    r.unexpectedError('foo.py', 'Nobody expects the Spanish Inquisition!')
-    assert len(r.log) == 1
-    assert r.log[0]['line_no'] == 0
-    assert r.log[0]['filename'] == 'foo.py'
-    assert r.log[0]['message'] == 'Nobody expects the Spanish Inquisition!'
-
-
-def test_MuFlakeCodeReporter_syntax_error():
-    """
-    Check the reporter handles syntax errors in a humane and kid friendly
-    manner.
-    """
-    msg = ('Syntax error. Python cannot understand this line. Check for '
-           'missing characters!')
-    r = mu.logic.MuFlakeCodeReporter()
-    r.syntaxError('foo.py', 'something incomprehensible to kids', '2', 3,
-                  'source')
-    assert len(r.log) == 1
-    assert r.log[0]['line_no'] == 1
-    assert r.log[0]['message'] == msg
-    assert r.log[0]['column'] == 2
-    assert r.log[0]['source'] == 'source'
-
-
-def test_MuFlakeCodeReporter_flake_matched():
-    """
-    Check the reporter handles flake (regular) errors that match the expected
-    message structure.
-    """
-    r = mu.logic.MuFlakeCodeReporter()
-    err = "foo.py:4: something went wrong"
-    r.flake(err)
-    assert len(r.log) == 1
-    assert r.log[0]['line_no'] == 3
-    assert r.log[0]['column'] == 0
-    assert r.log[0]['message'] == 'something went wrong'
-
-
-def test_MuFlakeCodeReporter_flake_un_matched():
-    """
-    Check the reporter handles flake errors that do not conform to the expected
-    message structure.
-    """
-    r = mu.logic.MuFlakeCodeReporter()
-    err = "something went wrong"
-    r.flake(err)
-    assert len(r.log) == 1
-    assert r.log[0]['line_no'] == 0
-    assert r.log[0]['column'] == 0
-    assert r.log[0]['message'] == 'something went wrong'
-
-
 def test_REPL_posix():
     """
     The port is set correctly in a posix environment.
@@ -632,6 +396,7 @@ def test_editor_init():
         assert e.envars == []
         assert e.minify is False
         assert e.microbit_runtime == ''
+        assert e.check_as_you_type is False
         assert e.connected_devices == set()
         assert e.find == ''
         assert e.replace == ''
@@ -654,12 +419,14 @@ def test_editor_setup():
     }
     with mock.patch('os.path.exists', return_value=False), \
             mock.patch('os.makedirs', return_value=None) as mkd, \
-            mock.patch('shutil.copy') as mock_shutil:
+            mock.patch('shutil.copy') as mock_shutil, \
+            mock.patch('mu.logic.MODULE_NAMES') as mock_names:
         e.setup(mock_modes)
         assert mkd.call_count == 5
         assert mkd.call_args_list[0][0][0] == 'foo'
         assert mock_shutil.call_count == 3
     assert e.modes == mock_modes
+    mock_names.refresh_in_background.assert_called_once_with()
     view.set_usb_checker.assert_called_once_with(1, e.check_usb)
 
 
@@ -674,6 +441,7 @@ def test_editor_restore_session_existing_runtime():
         with generate_session(theme, mode, file_contents,
                               microbit_runtime='/foo'):
             ed.restore_session()
+            ed._file_reader.wait()
 
     assert ed.theme == theme
     assert ed._view.add_tab.call_count == len(file_contents)
@@ -694,6 +462,7 @@ def test_editor_restore_session_missing_runtime():
 
     with generate_session(theme, mode, file_contents, microbit_runtime='/foo'):
         ed.restore_session()
+        ed._file_reader.wait()
 
     assert ed.theme == theme
     assert ed._view.add_tab.call_count == len(file_contents)
@@ -703,6 +472,16 @@ def test_editor_restore_session_missing_runtime():
     assert ed.microbit_runtime == ''  # File does not exist so set to ''
 
 
+def test_editor_restore_session_check_as_you_type():
+    """
+    Whether to check code as you type is restored from the session.
+    """
+    ed = mocked_editor()
+    with generate_session(check_as_you_type=True):
+        ed.restore_session()
+    assert ed.check_as_you_type is True
+
+
 def test_editor_restore_session_missing_files():
     """
     Missing files that were opened tabs in the previous session are safely
@@ -844,18 +623,155 @@ def test_editor_session_and_open_focus_passed_file():
                   "path/bar.py"]}, )
     mock_open = mock.mock_open(read_data=settings)
     with mock.patch('builtins.open', mock_open), \
-            mock.patch('os.path.exists', return_value=True):
+            mock.patch('os.path.exists', return_value=True), \
+            mock.patch('mu.logic.file_identity', side_effect=lambda p: p), \
+            mock.patch('mu.logic.FileReader') as mock_reader:
         ed.restore_session(paths=['path/foo.py'])
 
-    # direct_load should be called twice (once for each path)
-    assert ed.direct_load.call_count == 2
+    # "bar.py" is restored in the background without taking the focus.
+    mock_reader().read.assert_called_once_with(os.path.abspath('path/bar.py'))
+    assert ed._restore_focus == (os.path.abspath('path/bar.py'), False)
     # However, "foo.py" as the passed_filename should be direct_load-ed
-    # at the end so it has focus, despite being the first file listed in
-    # the restored session.
-    assert ed.direct_load.call_args_list[0][0][0] == os.path.abspath(
-        'path/bar.py')
-    assert ed.direct_load.call_args_list[1][0][0] == os.path.abspath(
-        'path/foo.py')
+    # so it has focus, despite being the first file listed in the restored
+    # session.
+    ed.direct_load.assert_called_once_with(os.path.abspath('path/foo.py'))
+
+
+def restoring_editor(*paths):
+    """
+    Return a mocked editor with no tabs that's restoring the referenced
+    paths from the previous session (each path is its own file identity).
+    The reader is mocked, so the test decides when and in what order files
+    arrive by calling _on_file_restored.
+    """
+    ed = mocked_editor()
+    ed._view.tab_count = 0
+    ed._view.widgets = []
+    ed.direct_load = mock.MagicMock()
+    with mock.patch('mu.logic.file_identity', side_effect=lambda p: p), \
+            mock.patch('mu.logic.FileReader') as mock_reader:
+        ed._restore_files(list(paths), current_path='b.py')
+    return ed, mock_reader.return_value
+
+
+def test_restore_files_order():
+    """
+    The file that was current in the last session is read first, followed by
+    the others in order.
+    """
+    ed, reader = restoring_editor('a.py', 'b.py', 'c.py')
+    assert reader.read.call_args_list == [mock.call('b.py'),
+                                          mock.call('a.py'),
+                                          mock.call('c.py')]
+    # The last file is shown first if the current file isn't known.
+    with mock.patch('mu.logic.file_identity', side_effect=lambda p: p), \
+            mock.patch('mu.logic.FileReader'):
+        ed._restore_files(['d.py', 'e.py'])
+    assert ed._restore_focus == ('e.py', True)
+
+
+def test_restore_files_progressive():
+    """
+    Files arriving before the file that was current in the last session are
+    held back until it's shown. Each tab is put in the same position as in
+    the last session and only the current file gets the focus.
+    """
+    ed, reader = restoring_editor('a.py', 'b.py', 'c.py', 'd.py')
+    ed._on_file_restored('c.py', ('c', '\n'))
+    assert ed._view.add_tab.call_count == 0
+    ed._on_file_restored('b.py', ('b', '\n'))
+    api = ed.modes['python'].api()
+    assert ed._view.add_tab.call_args_list == [
+        mock.call('b.py', 'b', api, '\n', index=0, focus=True),
+        mock.call('c.py', 'c', api, '\n', index=1, focus=False),
+    ]
+    ed._view.add_tab.reset_mock()
+    ed._view.tab_count = 2
+    ed._on_file_restored('d.py', ('d', '\n'))
+    ed._on_file_restored('a.py', ('a', '\n'))
+    assert ed._view.add_tab.call_args_list == [
+        mock.call('d.py', 'd', api, '\n', index=2, focus=False),
+        mock.call('a.py', 'a', api, '\n', index=0, focus=False),
+    ]
+    # All done, so tidy up.
+    assert ed._file_reader is None
+    assert ed._restore_ids == set()
+    assert ed._restored == []
+    reader.pool.shutdown.assert_called_once_with(wait=False)
+
+
+def test_when_restored():
+    """
+    Callbacks are called once the files from the last session have all been
+    restored, or straight away if there are none being restored.
+    """
+    ed, reader = restoring_editor('a.py', 'b.py')
+    callback = mock.MagicMock()
+    ed.when_restored(callback)
+    ed._on_file_restored('b.py', ('b', '\n'))
+    assert callback.call_count == 0
+    ed._on_file_restored('a.py', ('a', '\n'))
+    callback.assert_called_once_with()
+    assert ed._restored_callbacks == []
+    ed.when_restored(callback)
+    assert callback.call_count == 2
+
+
+def test_restore_files_failed():
+    """
+    If a file can't be read in the background, the usual loading code is used
+    so the user is told what went wrong. If there are no tabs once all files
+    have arrived, a blank one is added.
+    """
+    ed, reader = restoring_editor('b.py', )
+    ed._on_file_restored('b.py', UnicodeDecodeError('utf-8', b'', 0, 1, 'x'))
+    ed.direct_load.assert_called_once_with('b.py')
+    ed._view.add_tab.assert_called_once_with(
+        None, _('# Write your code here :-)') + mu.logic.NEWLINE,
+        ed.modes['python'].api(), mu.logic.NEWLINE)
+
+
+def test_restore_files_skipped():
+    """
+    Missing files and duplicates (including files that are already open) are
+    ignored, and files that aren't Python scripts are loaded immediately.
+    """
+    ed = mocked_editor()
+    open_tab = mock.MagicMock()
+    open_tab.path = 'a.py'
+    ed._view.widgets = [open_tab, mock.MagicMock(path=None)]
+    ed._view.tab_count = 1
+    ed.direct_load = mock.MagicMock()
+    ids = {'a.py': 1, 'b.py': 2, 'link_to_b.py': 2, 'c.hex': 3,
+           'missing.py': None}
+    with mock.patch('mu.logic.file_identity', side_effect=ids.get), \
+            mock.patch('mu.logic.FileReader') as mock_reader:
+        ed._restore_files(['missing.py', 'a.py', 'b.py', 'link_to_b.py',
+                           'c.hex'])
+    mock_reader().read.assert_called_once_with('b.py')
+    ed.direct_load.assert_called_once_with('c.hex')
+    assert ed._restore_order == {'b.py': 0}
+    assert ed._restore_index == 1
+    # Nothing to restore.
+    mock_reader.reset_mock()
+    with mock.patch('mu.logic.file_identity', side_effect=ids.get), \
+            mock.patch('mu.logic.FileReader') as mock_reader:
+        ed._restore_files(['missing.py', 'a.py'])
+    assert mock_reader.call_count == 0
+
+
+def test_restore_session_waits_for_files():
+    """
+    No blank tab is added while files from the last session are still to
+    arrive.
+    """
+    ed = mocked_editor()
+    ed._view.tab_count = 0
+    ed._view.widgets = []
+    with generate_session(file_contents=['x = 1', ]):
+        with mock.patch('mu.logic.FileReader'):
+            ed.restore_session()
+    assert ed._view.add_tab.call_count == 0
 
 
 def test_toggle_theme_to_night():
@@ -954,6 +870,20 @@ def test_load_python_file():
         newline)
 
 
+def test_load_file_being_restored():
+    """
+    A file that's still being restored from the last session isn't opened a
+    second time.
+    """
+    ed = mocked_editor()
+    with generate_python_file('python') as filepath:
+        ed._restore_ids = {mu.logic.file_identity(filepath)}
+        with mock.patch('mu.logic.read_and_decode') as mock_read:
+            ed.direct_load(filepath)
+    assert mock_read.call_count == 0
+    assert ed._view.add_tab.call_count == 0
+
+
 def test_load_python_file_case_insensitive_file_type():
     """
     If the user specifies a Python file (*.PY) then ensure it's loaded and
@@ -1020,9 +950,7 @@ def test_no_duplicate_load_python_file():
     editor = mu.logic.Editor(view=editor_window)
     mock_mode = mock.MagicMock()
     mock_mode.workspace_dir.return_value = '/fake/path'
-    editor.modes = {
-        'python': mock_mode,
-    }
+    editor.modes = mocked_modes(python=mock_mode)
 
     editor.load()
     message = 'The file "{}" is already open.'.format(os.path.basename(
@@ -1051,10 +979,7 @@ def test_load_other_file():
     mock_mb.workspace_dir.return_value = '/fake/path'
     mock_mb.open_file.return_value = file_content
     mock_mb.file_extensions = ['hex']
-    ed.modes = {
-        'python': mock_py,
-        'microbit': mock_mb,
-    }
+    ed.modes = mocked_modes(python=mock_py, microbit=mock_mb)
     ed.mode = 'microbit'
     with mock.patch('builtins.open', mock.mock_open()), \
             mock.patch('os.path.isfile', return_value=True):
@@ -1062,6 +987,7 @@ def test_load_other_file():
     assert view.get_load_path.call_count == 1
     assert view.show_confirmation.call_count == 0
     assert ed.change_mode.call_count == 0
+    assert mock_py.open_file.call_count == 0
     view.add_tab.assert_called_once_with(None, file_content, api, os.linesep)
 
 
@@ -1088,10 +1014,7 @@ def test_load_other_file_change_mode():
     mock_mb.workspace_dir.return_value = '/fake/path'
     mock_mb.open_file.return_value = file_content
     mock_mb.file_extensions = ['hex']
-    ed.modes = {
-        'python': mock_py,
-        'microbit': mock_mb,
-    }
+    ed.modes = mocked_modes(python=mock_py, microbit=mock_mb)
     ed.mode = 'python'
     with mock.patch('builtins.open', mock.mock_open()), \
             mock.patch('os.path.isfile', return_value=True):
@@ -1117,9 +1040,7 @@ def test_load_other_file_with_exception():
     mock_mb.workspace_dir.return_value = '/fake/path'
     mock_mb.open_file = mock.MagicMock(side_effect=Exception(':('))
     mock_mb.file_extensions = ['hex']
-    ed.modes = {
-        'microbit': mock_mb,
-    }
+    ed.modes = mocked_modes(microbit=mock_mb)
     ed.mode = 'microbit'
     mock_open = mock.mock_open()
     with mock.patch('builtins.open', mock_open), \
@@ -1189,9 +1110,10 @@ def test_save_restores_newline():
         "the cat sat on the mat".split()
     )
     with generate_python_file(test_text) as filepath:
-        with mock.patch("mu.logic.save_and_encode") as mock_save:
+        with mock.patch("mu.workers.save_and_encode") as mock_save:
             ed = mocked_editor(text=test_text, newline=newline, path=filepath)
             ed.save()
+            ed._file_writer.wait()
             assert mock_save.called_with(test_text, filepath, newline)
 
 
@@ -1206,9 +1128,7 @@ def test_load_error():
     mock_open = mock.MagicMock(side_effect=FileNotFoundError())
     mock_mode = mock.MagicMock()
     mock_mode.workspace_dir.return_value = '/fake/path'
-    ed.modes = {
-        'python': mock_mode,
-    }
+    ed.modes = mocked_modes(python=mock_mode)
     with mock.patch('builtins.open', mock_open):
         ed.load()
     assert view.get_load_path.call_count == 1
@@ -1253,9 +1173,10 @@ def test_save_no_path():
     ed = mocked_editor(text=text, path=None, newline=newline)
     ed._view.get_save_path.return_value = path
     ed.check_for_shadow_module = mock.MagicMock(return_value=False)
-    with mock.patch("mu.logic.save_and_encode") as mock_save:
+    with mock.patch("mu.workers.save_and_encode") as mock_save:
         ed.save()
-    mock_save.assert_called_with(text, path, newline)
+        ed._file_writer.wait()
+    mock_save.assert_called_with(text, path, newline, atomic=True)
 
 
 def test_save_no_path_no_path_given():
@@ -1305,10 +1226,38 @@ def test_save_file_with_exception():
     ed = mu.logic.Editor(view)
     with mock.patch('builtins.open', mock_open):
         ed.save()
+        ed._file_writer.wait()
     assert view.current_tab.setModified.call_count == 0
     assert view.show_message.call_count == 1
 
 
+def test_save_tab_changed_while_saving():
+    """
+    If the tab was changed after it was queued to be saved, it's still
+    modified once the save is written.
+    """
+    ed = mocked_editor(text='new', path='foo.py')
+    tab = ed._view.current_tab
+    ed._view.widgets = [tab, ]
+    ed._on_file_saved('foo.py', 'old')
+    assert tab.setModified.call_count == 0
+    ed._on_file_saved('foo.py', 'new')
+    tab.setModified.assert_called_once_with(False)
+
+
+def test_save_indexes_symbols():
+    """
+    Once a Python script is saved, its symbols are indexed again.
+    """
+    ed = mocked_editor()
+    ed._view.widgets = []
+    ed._symbol_index = mock.MagicMock()
+    ed._on_file_saved('foo.txt', 'foo')
+    assert ed._symbol_index.update.call_count == 0
+    ed._on_file_saved('foo.py', 'foo')
+    ed._symbol_index.update.assert_called_once_with(['foo.py'])
+
+
 def test_save_file_with_encoding_error():
     """
     If Mu encounters a UnicodeEncodeError when trying to write the file,
@@ -1316,12 +1265,14 @@ def test_save_file_with_encoding_error():
     """
     text, path, newline = "foo", "foo", "\n"
     ed = mocked_editor(text=text, path=path, newline=newline)
-    with mock.patch("mu.logic.save_and_encode") as mock_save:
+    with mock.patch("mu.workers.save_and_encode") as mock_save:
         mock_save.side_effect = UnicodeEncodeError(mu.logic.ENCODING, "",
                                                    0, 0, "Unable to encode")
         ed.save()
+        ed._file_writer.wait()
 
     assert ed._view.current_tab.setModified.call_count == 0
+    assert ed._view.show_message.call_count == 1
 
 
 def test_save_python_file():
@@ -1337,11 +1288,13 @@ def test_save_python_file():
     view.current_tab.newline = "\n"
     view.get_save_path = mock.MagicMock(return_value=path)
     view.current_tab.setModified = mock.MagicMock(return_value=None)
+    view.widgets = [view.current_tab, ]
     ed = mu.logic.Editor(view)
-    with mock.patch("mu.logic.save_and_encode") as mock_save:
+    with mock.patch("mu.workers.save_and_encode") as mock_save:
         ed.save()
+        ed._file_writer.wait()
 
-    mock_save.assert_called_once_with(contents, path, newline)
+    mock_save.assert_called_once_with(contents, path, newline, atomic=True)
     assert view.get_save_path.call_count == 0
     view.current_tab.setModified.assert_called_once_with(False)
 
@@ -1352,9 +1305,11 @@ def test_save_with_no_file_extension():
     """
     text, path, newline = "foo", "foo", "\n"
     ed = mocked_editor(text=text, path=path, newline=newline)
-    with mock.patch('mu.logic.save_and_encode') as mock_save:
+    with mock.patch('mu.workers.save_and_encode') as mock_save:
         ed.save()
-    mock_save.assert_called_once_with(text, path + ".py", newline)
+        ed._file_writer.wait()
+    mock_save.assert_called_once_with(text, path + ".py", newline,
+                                      atomic=True)
     ed._view.get_save_path.call_count == 0
 
 
@@ -1365,9 +1320,10 @@ def test_save_with_non_py_file_extension():
     text, path, newline = "foo", "foo.txt", "\n"
     ed = mocked_editor(text=text, path=path, newline=newline)
     ed._view.get_save_path.return_value = path
-    with mock.patch('mu.logic.save_and_encode') as mock_save:
+    with mock.patch('mu.workers.save_and_encode') as mock_save:
         ed.save()
-    mock_save.assert_called_once_with(text, path, newline)
+        ed._file_writer.wait()
+    mock_save.assert_called_once_with(text, path, newline, atomic=True)
     ed._view.get_save_path.call_count == 0
 
 
@@ -1442,7 +1398,7 @@ def test_zoom_out():
 
 def test_check_code_on():
     """
-    Checking code correctly results in something the UI layer can parse.
+    Checking code starts a check in the background of the current tab's code.
     """
     view = mock.MagicMock()
     tab = mock.MagicMock()
@@ -1450,21 +1406,114 @@ def test_check_code_on():
     tab.path = 'foo.py'
     tab.text.return_value = 'import this\n'
     view.current_tab = tab
-    flake = {2: {'line_no': 2, 'message': 'a message', }, }
+    tab.check_results = None
+    mock_mode = mock.MagicMock()
+    mock_mode.builtins = ['foo', ]
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock_mode, }
+    ed._code_checker = mock.MagicMock()
+    ed._check_results = mock.MagicMock()
+    ed._check_results.get.return_value = None
+    ed.check_code()
+    assert tab.has_annotations is True
+    view.reset_annotations.assert_called_once_with()
+    ed._code_checker.check.assert_called_once_with('foo.py', 'import this\n',
+                                                   ['foo', ])
+    tab.textChanged.connect.assert_called_once_with(ed._cancel_check)
+    assert ed._checking is tab
+
+
+def test_check_code_results():
+    """
+    The results of a check annotate the tab that was checked, even if another
+    tab is now current.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    view.widgets = [tab, ]
+    view.current_tab = mock.MagicMock()
+    flake = {2: [{'line_no': 2, 'message': 'a message', }, ], }
     pep8 = {2: [{'line_no': 2, 'message': 'another message', }],
             3: [{'line_no': 3, 'message': 'yet another message', }]}
+    ed = mu.logic.Editor(view)
+    ed.show_status_message = mock.MagicMock()
+    ed._check_results = mock.MagicMock()
+    ed._checking = tab
+    ed._check_key = 'key'
+    ed._on_code_checked('error', flake)
+    ed._on_code_checked('style', pep8)
+    ed._on_check_finished()
+    tab.annotate_code.assert_has_calls([mock.call(flake, 'error'),
+                                        mock.call(pep8, 'style')])
+    assert tab.show_annotations.call_count == 2
+    assert view.annotate_code.call_count == 0
+    assert tab.has_annotations is True
+    assert ed._checking is None
+    assert ed.show_status_message.call_count == 0
+    # The results are remembered.
+    results = {'error': flake, 'style': pep8}
+    assert tab.check_results == ('key', results)
+    ed._check_results.put.assert_called_once_with(tab.path, 'key', results)
+
+
+def test_check_code_unchanged():
+    """
+    If the code in the tab hasn't changed since it was last checked, the
+    previous results are used rather than checking it again.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = False
+    tab.path = None
+    tab.text.return_value = 'import this\n'
+    view.current_tab = tab
+    view.widgets = [tab, ]
+    flake = {0: [{'line_no': 0, 'message': 'a message', }, ], }
+    key = mu.checker.check_key('import this\n', None)
+    tab.check_results = (key, {'error': flake, 'style': {}})
     mock_mode = mock.MagicMock()
     mock_mode.builtins = None
-    with mock.patch('mu.logic.check_flake', return_value=flake), \
-            mock.patch('mu.logic.check_pycodestyle', return_value=pep8):
-        ed = mu.logic.Editor(view)
-        ed.modes = {'python': mock_mode, }
-        ed.check_code()
-        assert tab.has_annotations is True
-        view.reset_annotations.assert_called_once_with()
-        view.annotate_code.assert_has_calls([mock.call(flake, 'error'),
-                                             mock.call(pep8, 'style')],
-                                            any_order=True)
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock_mode, }
+    ed._code_checker = mock.MagicMock()
+    ed.check_code()
+    assert ed._code_checker.check.call_count == 0
+    tab.annotate_code.assert_called_once_with(flake, 'error')
+    assert tab.has_annotations is True
+    assert ed._checking is None
+    # Once the code changes, it's checked again.
+    tab.text.return_value = 'import that\n'
+    ed.check_code()
+    ed.check_code()
+    assert ed._code_checker.check.call_count == 1
+
+
+def test_check_code_unchanged_file(tmpdir):
+    """
+    The results of checking recently checked files are remembered, so a file
+    whose code hasn't changed isn't checked again when it's reopened.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = False
+    tab.path = str(tmpdir.join('foo.py'))
+    tab.text.return_value = 'x = 1\n'
+    tab.check_results = None
+    view.current_tab = tab
+    view.widgets = [tab, ]
+    key = mu.checker.check_key('x = 1\n', ['foo', ])
+    mock_mode = mock.MagicMock()
+    mock_mode.builtins = ['foo', ]
+    ed = mu.logic.Editor(view)
+    ed.show_status_message = mock.MagicMock()
+    ed.modes = {'python': mock_mode, }
+    ed._code_checker = mock.MagicMock()
+    ed._check_results = mu.logic.CheckResults(str(tmpdir.join('c.json')))
+    ed._check_results.put(tab.path, key, {'error': {}, 'style': {}})
+    ed.check_code()
+    assert ed._code_checker.check.call_count == 0
+    assert ed.show_status_message.call_count == 1
+    assert tab.has_annotations is False
 
 
 def test_check_code_no_problems():
@@ -1478,17 +1527,74 @@ def test_check_code_no_problems():
     tab.path = 'foo.py'
     tab.text.return_value = 'import this\n'
     view.current_tab = tab
-    flake = {}
-    pep8 = {}
+    tab.check_results = None
+    view.widgets = [tab, ]
     mock_mode = mock.MagicMock()
     mock_mode.builtins = None
-    with mock.patch('mu.logic.check_flake', return_value=flake), \
-            mock.patch('mu.logic.check_pycodestyle', return_value=pep8):
-        ed = mu.logic.Editor(view)
-        ed.show_status_message = mock.MagicMock()
-        ed.modes = {'python': mock_mode, }
-        ed.check_code()
-        assert ed.show_status_message.call_count == 1
+    ed = mu.logic.Editor(view)
+    ed.show_status_message = mock.MagicMock()
+    ed.modes = {'python': mock_mode, }
+    ed._code_checker = mock.MagicMock()
+    ed._check_results = mock.MagicMock()
+    ed._check_results.get.return_value = None
+    ed.check_code()
+    ed._on_code_checked('error', {})
+    ed._on_code_checked('style', {})
+    ed._on_check_finished()
+    assert ed.show_status_message.call_count == 1
+    assert tab.has_annotations is False
+    assert tab.annotate_code.call_count == 0
+
+
+def test_check_code_text_changed():
+    """
+    Changing the code being checked cancels the check.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = True
+    ed = mu.logic.Editor(view)
+    ed._code_checker = mock.MagicMock()
+    ed._checking = tab
+    ed._cancel_check()
+    ed._code_checker.cancel.assert_called_once_with()
+    tab.textChanged.disconnect.assert_called_once_with(ed._cancel_check)
+    assert tab.has_annotations is False
+    assert ed._checking is None
+
+
+def test_check_code_tab_closed():
+    """
+    If the tab being checked is closed, the check is cancelled.
+    """
+    view = mock.MagicMock()
+    view.widgets = []
+    tab = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed._code_checker = mock.MagicMock()
+    ed._checking = tab
+    ed._on_code_checked('error', {1: [{'line_no': 1, 'message': 'a'}]})
+    assert tab.annotate_code.call_count == 0
+    ed._code_checker.cancel.assert_called_once_with()
+    assert ed._checking is None
+
+
+def test_check_code_toggled_while_checking():
+    """
+    Checking the code again while it's being checked toggles the check off.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = True
+    view.current_tab = tab
+    ed = mu.logic.Editor(view)
+    ed._code_checker = mock.MagicMock()
+    ed._checking = tab
+    ed.check_code()
+    assert tab.has_annotations is False
+    ed._code_checker.cancel.assert_called_once_with()
+    assert ed._code_checker.check.call_count == 0
+    view.reset_annotations.assert_called_once_with()
 
 
 def test_check_code_off():
@@ -1516,47 +1622,154 @@ def test_check_code_no_tab():
     assert view.annotate_code.call_count == 0
 
 
-def test_show_help():
+def test_code_changed_live_check():
     """
-    Help should attempt to open up the user's browser and point it to the
-    expected help documentation.
+    When checking as you type, a change to the current tab's code (re)starts
+    the timer after which it's checked.
     """
     view = mock.MagicMock()
+    tab = mock.MagicMock()
+    view.current_tab = tab
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.webbrowser.open_new', return_value=None) as wb, \
-            mock.patch('mu.logic.locale.getdefaultlocale',
-                       return_value=('en_GB', 'UTF-8')):
-        ed.show_help()
-        version = '.'.join(__version__.split('.')[:2])
-        url = 'https://codewith.mu/en/help/{}'.format(version)
-        wb.assert_called_once_with(url)
+    ed._live_check_timer = mock.MagicMock()
+    ed._on_code_changed(tab)
+    assert ed._live_check_timer.start.call_count == 0
+    ed.check_as_you_type = True
+    ed._on_code_changed(mock.MagicMock())
+    assert ed._live_check_timer.start.call_count == 0
+    ed._on_code_changed(tab)
+    ed._live_check_timer.start.assert_called_once_with()
 
 
-def test_show_help_exploding_getdefaultlocale():
+def test_code_changed_while_live_checking():
     """
-    Sometimes, on OSX the getdefaultlocale method causes a TypeError or
-    ValueError. Ensure when this happens, Mu defaults to 'en' as the language
-    code.
+    If the code changes while it's being checked as you type, the check is
+    stopped since it's out of date.
     """
     view = mock.MagicMock()
+    tab = mock.MagicMock()
+    view.current_tab = tab
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.webbrowser.open_new', return_value=None) as wb, \
-            mock.patch('mu.logic.locale.getdefaultlocale',
-                       side_effect=TypeError('Boom!')):
-        ed.show_help()
-        version = '.'.join(__version__.split('.')[:2])
-        url = 'https://codewith.mu/en/help/{}'.format(version)
-        wb.assert_called_once_with(url)
+    ed.check_as_you_type = True
+    ed._live_check_timer = mock.MagicMock()
+    ed._code_checker = mock.MagicMock()
+    ed._checking = tab
+    ed._live_check = True
+    ed._on_code_changed(tab)
+    ed._code_checker.cancel.assert_called_once_with()
+    assert ed._checking is None
+    assert ed._live_check is False
+    ed._live_check_timer.start.assert_called_once_with()
 
 
-def test_quit_modified_cancelled_from_button():
+def test_live_check():
     """
-    If the user quits and there's unsaved work, and they cancel the "quit" then
-    do nothing.
+    Checking as you type checks the current tab's code incrementally.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.large = False
+    tab.path = 'foo.py'
+    tab.text.return_value = 'import this\n'
+    view.current_tab = tab
+    mock_mode = mock.MagicMock()
+    mock_mode.builtins = ['foo', ]
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock_mode, }
+    ed._code_checker = mock.MagicMock()
+    ed.live_check()
+    ed._code_checker.check.assert_called_once_with(
+        'foo.py', 'import this\n', ['foo', ], document=id(tab))
+    assert ed._checking is tab
+    assert ed._live_check is True
+
+
+def test_live_check_large_file():
+    """
+    Large files aren't checked as you type.
+    """
+    view = mock.MagicMock()
+    view.current_tab.large = True
+    ed = mu.logic.Editor(view)
+    ed._code_checker = mock.MagicMock()
+    ed.live_check()
+    assert ed._code_checker.check.call_count == 0
+    view.current_tab = None
+    ed.live_check()
+    assert ed._code_checker.check.call_count == 0
+
+
+def test_live_check_results():
+    """
+    The results of checking as you type update the tab's annotations all at
+    once, without any status message, and aren't remembered.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.check_results = None
+    view.widgets = [tab, ]
+    flake = {2: [{'line_no': 2, 'message': 'a message', }, ], }
+    ed = mu.logic.Editor(view)
+    ed.show_status_message = mock.MagicMock()
+    ed._check_results = mock.MagicMock()
+    ed._code_checker = mock.MagicMock()
+    ed._checking = tab
+    ed._live_check = True
+    ed._on_code_checked('error', flake)
+    ed._on_code_checked('style', {})
+    assert tab.annotate_code.call_count == 0
+    ed._on_check_finished()
+    tab.update_annotations.assert_called_once_with({'error': flake,
+                                                    'style': {}})
+    assert tab.has_annotations is True
+    assert ed._checking is None
+    assert ed._live_check is False
+    assert tab.check_results is None
+    assert ed._check_results.put.call_count == 0
+    assert ed.show_status_message.call_count == 0
+
+
+def test_show_help():
+    """
+    Help should attempt to open up the user's browser and point it to the
+    expected help documentation.
     """
     view = mock.MagicMock()
-    view.modified = True
-    view.show_confirmation = mock.MagicMock(return_value=QMessageBox.Cancel)
+    ed = mu.logic.Editor(view)
+    with mock.patch('mu.logic.webbrowser.open_new', return_value=None) as wb, \
+            mock.patch('mu.logic.locale.getdefaultlocale',
+                       return_value=('en_GB', 'UTF-8')):
+        ed.show_help()
+        version = '.'.join(__version__.split('.')[:2])
+        url = 'https://codewith.mu/en/help/{}'.format(version)
+        wb.assert_called_once_with(url)
+
+
+def test_show_help_exploding_getdefaultlocale():
+    """
+    Sometimes, on OSX the getdefaultlocale method causes a TypeError or
+    ValueError. Ensure when this happens, Mu defaults to 'en' as the language
+    code.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    with mock.patch('mu.logic.webbrowser.open_new', return_value=None) as wb, \
+            mock.patch('mu.logic.locale.getdefaultlocale',
+                       side_effect=TypeError('Boom!')):
+        ed.show_help()
+        version = '.'.join(__version__.split('.')[:2])
+        url = 'https://codewith.mu/en/help/{}'.format(version)
+        wb.assert_called_once_with(url)
+
+
+def test_quit_modified_cancelled_from_button():
+    """
+    If the user quits and there's unsaved work, and they cancel the "quit" then
+    do nothing.
+    """
+    view = mock.MagicMock()
+    view.modified = True
+    view.show_confirmation = mock.MagicMock(return_value=QMessageBox.Cancel)
     ed = mu.logic.Editor(view)
     mock_open = mock.MagicMock()
     mock_open.return_value.__enter__ = lambda s: s
@@ -1666,6 +1879,101 @@ def test_quit_save_tabs_with_paths():
     assert os.path.abspath('foo.py') in session['paths']
 
 
+def test_quit_save_restoring_and_current_paths():
+    """
+    Files from the last session that haven't been restored yet are kept in the
+    session, along with the path of the current tab.
+    """
+    view = mock.MagicMock()
+    view.modified = False
+    w1 = mock.MagicMock()
+    w1.path = 'foo.py'
+    view.widgets = [w1, ]
+    view.current_tab = w1
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed._restore_order = {os.path.abspath('bar.py'): 1}
+    mock_open = mock.mock_open()
+    with mock.patch('sys.exit', return_value=None), \
+            mock.patch('builtins.open', mock_open):
+        ed.quit()
+    recovered = ''.join([i[0][0] for i
+                        in mock_open.return_value.write.call_args_list])
+    session = json.loads(recovered)
+    assert session['paths'] == [os.path.abspath('foo.py'),
+                                os.path.abspath('bar.py')]
+    assert session['current_path'] == os.path.abspath('foo.py')
+
+
+def test_quit_waits_for_saves():
+    """
+    Files queued to be saved are written before Mu quits.
+    """
+    view = mock.MagicMock()
+    view.modified = False
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed._file_writer = mock.MagicMock()
+    with mock.patch('sys.exit', return_value=None), \
+            mock.patch('builtins.open', mock.mock_open()):
+        ed.quit()
+    ed._file_writer.wait.assert_called_once_with()
+
+
+def test_quit_saves_check_results():
+    """
+    The results of checking recently checked files are saved when Mu quits.
+    """
+    view = mock.MagicMock()
+    view.modified = False
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed._check_results = mock.MagicMock()
+    with mock.patch('sys.exit', return_value=None), \
+            mock.patch('builtins.open', mock.mock_open()):
+        ed.quit()
+    ed._check_results.save.assert_called_once_with()
+
+
+def test_quit_saves_symbols():
+    """
+    The symbols defined in the workspace are saved when Mu quits.
+    """
+    view = mock.MagicMock()
+    view.modified = False
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed._symbol_index = mock.MagicMock()
+    with mock.patch('sys.exit', return_value=None), \
+            mock.patch('builtins.open', mock.mock_open()):
+        ed.quit()
+    ed._symbol_index.save.assert_called_once_with()
+
+
+def test_quit_save_check_as_you_type():
+    """
+    When saving the session, ensure whether to check code as you type is
+    logged in the session file.
+    """
+    view = mock.MagicMock()
+    view.modified = False
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed.check_as_you_type = True
+    mock_open = mock.mock_open()
+    with mock.patch('sys.exit', return_value=None), \
+            mock.patch('builtins.open', mock_open):
+        ed.quit()
+    recovered = ''.join([i[0][0] for i
+                        in mock_open.return_value.write.call_args_list])
+    session = json.loads(recovered)
+    assert session['check_as_you_type'] is True
+
+
 def test_quit_save_theme():
     """
     When saving the session, ensure the theme is logged in the session file.
@@ -1784,23 +2092,23 @@ def test_show_admin():
     ed.envars = [['name', 'value'], ]
     ed.minify = True
     ed.microbit_runtime = '/foo/bar'
+    ed.check_as_you_type = True
     settings = {
         'envars': 'name=value',
         'minify': True,
-        'microbit_runtime': '/foo/bar'
+        'microbit_runtime': '/foo/bar',
+        'check_as_you_type': True,
     }
     view.show_admin.return_value = settings
-    mock_open = mock.mock_open()
-    with mock.patch('builtins.open', mock_open), \
-            mock.patch('os.path.isfile', return_value=True):
+    with mock.patch('os.path.isfile', return_value=True):
         ed.show_admin(None)
-        mock_open.assert_called_once_with(mu.logic.LOG_FILE, 'r',
-                                          encoding='utf8')
         assert view.show_admin.call_count == 1
+        assert view.show_admin.call_args[0][0] == mu.logic.LOG_FILE
         assert view.show_admin.call_args[0][1] == settings
         assert ed.envars == [['name', 'value']]
         assert ed.minify is True
         assert ed.microbit_runtime == '/foo/bar'
+        assert ed.check_as_you_type is True
 
 
 def test_show_admin_missing_microbit_runtime():
@@ -1813,19 +2121,18 @@ def test_show_admin_missing_microbit_runtime():
     ed.envars = [['name', 'value'], ]
     ed.minify = True
     ed.microbit_runtime = '/foo/bar'
+    ed.check_as_you_type = True
     settings = {
         'envars': 'name=value',
         'minify': True,
-        'microbit_runtime': '/foo/bar'
+        'microbit_runtime': '/foo/bar',
+        'check_as_you_type': True,
     }
     view.show_admin.return_value = settings
-    mock_open = mock.mock_open()
-    with mock.patch('builtins.open', mock_open), \
-            mock.patch('os.path.isfile', return_value=False):
+    with mock.patch('os.path.isfile', return_value=False):
         ed.show_admin(None)
-        mock_open.assert_called_once_with(mu.logic.LOG_FILE, 'r',
-                                          encoding='utf8')
         assert view.show_admin.call_count == 1
+        assert view.show_admin.call_args[0][0] == mu.logic.LOG_FILE
         assert view.show_admin.call_args[0][1] == settings
         assert ed.envars == [['name', 'value']]
         assert ed.minify is True
@@ -1842,13 +2149,13 @@ def test_select_mode():
     mode = mock.MagicMock()
     mode.is_debugger = False
     ed = mu.logic.Editor(view)
-    ed.modes = {
-        'python': mode,
-    }
+    ed.modes = mocked_modes(python=mode)
     ed.change_mode = mock.MagicMock()
+    ed.index_workspace = mock.MagicMock()
     ed.select_mode(None)
     assert view.select_mode.call_count == 1
     ed.change_mode.assert_called_once_with('foo')
+    ed.index_workspace.assert_called_once_with()
 
 
 def test_select_mode_debug_mode():
@@ -1979,15 +2286,239 @@ def test_autosave():
     view.modified = True
     mock_tab = mock.MagicMock()
     mock_tab.path = 'foo'
+    mock_tab.text.return_value = 'bar'
     mock_tab.isModified.return_value = True
     view.widgets = [mock_tab, ]
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.save_and_encode') as mock_save:
+    with mock.patch('mu.workers.save_and_encode') as mock_save:
         ed.autosave()
+        ed._file_writer.wait()
     assert mock_save.call_count == 1
     mock_tab.setModified.assert_called_once_with(False)
 
 
+def test_autosave_unchanged():
+    """
+    Tabs whose content hasn't changed from what's on disk (e.g. after an
+    undo) aren't written, but are no longer shown as modified.
+    """
+    ed = mocked_editor(text='foo', path='foo.py', newline='\n')
+    tab = ed._view.current_tab
+    tab.isModified.return_value = True
+    ed._view.widgets = [tab, ]
+    ed._view.modified = True
+    ed._persisted['foo.py'] = (mu.logic.content_hash('foo'), (1, 3))
+    ed._file_writer = mock.MagicMock()
+    ed.autosave()
+    assert ed._file_writer.save.call_count == 0
+    tab.setModified.assert_called_once_with(False)
+    # Changed since loaded, so written as long as the file is unchanged.
+    tab.text.return_value = 'bar'
+    ed.autosave()
+    ed._file_writer.save.assert_called_once_with('foo.py', 'bar', '\n',
+                                                 (1, 3))
+
+
+def test_autosave_external_change():
+    """
+    Once a file is found to have been changed by another program, it's not
+    autosaved again and the user is told. Saving or reloading the file clears
+    this.
+    """
+    ed = mocked_editor(text='foo', path='foo.py')
+    tab = ed._view.current_tab
+    tab.isModified.return_value = True
+    ed._view.widgets = [tab, ]
+    ed._view.modified = True
+    ed._on_save_failed('foo.py', mu.logic.FileChangedError('foo.py'))
+    assert ed._view.show_message.call_count == 0
+    assert ed._view.status_bar.set_message.call_count == 1
+    ed._file_writer = mock.MagicMock()
+    ed.autosave()
+    assert ed._file_writer.save.call_count == 0
+    ed._on_file_saved('foo.py', 'foo')
+    ed.autosave()
+    assert ed._file_writer.save.call_count == 0  # Unchanged.
+    tab.text.return_value = 'bar'
+    ed.autosave()
+    assert ed._file_writer.save.call_count == 1
+
+
+def test_load_records_persisted():
+    """
+    The content and signature of loaded files are remembered.
+    """
+    ed = mocked_editor()
+    with generate_python_file('foo') as filepath:
+        ed.direct_load(filepath)
+        assert ed._persisted[filepath] == (
+            mu.logic.content_hash('foo'), mu.logic.file_signature(filepath))
+
+
+def test_load_watches_file():
+    """
+    Loaded files are watched for changes made by other programs.
+    """
+    ed = mocked_editor()
+    with generate_python_file('foo') as filepath:
+        ed.direct_load(filepath)
+        assert filepath in ed._file_watcher.paths
+
+
+def changed_file_editor(filepath, modified=False):
+    """
+    Return a mocked editor with a tab for the file at the referenced path,
+    as it was when loaded.
+    """
+    ed = mocked_editor(path=filepath)
+    tab = ed._view.current_tab
+    tab.isModified.return_value = modified
+    tab.getCursorPosition.return_value = (5, 2)
+    tab.lines.return_value = 2
+    ed._view.widgets = [tab, ]
+    with open(filepath, encoding='utf-8') as f:
+        ed._record_persisted(filepath, f.read())
+    ed.show_status_message = mock.MagicMock()
+    return ed, tab
+
+
+def test_on_file_changed_reload():
+    """
+    A tab without unsaved changes is reloaded when another program changes
+    its file, keeping the cursor on screen.
+    """
+    with generate_python_file('foo') as filepath:
+        ed, tab = changed_file_editor(filepath)
+        with open(filepath, 'w', newline='') as f:
+            f.write('bar\r\nbaz\r\n')
+        ed._on_file_changed(filepath)
+        tab.setText.assert_called_once_with('bar\nbaz\n')
+        assert tab.newline == '\r\n'
+        tab.setCursorPosition.assert_called_once_with(1, 2)
+        tab.setModified.assert_called_once_with(False)
+        assert ed._persisted[filepath][0] == mu.logic.content_hash('bar\n'
+                                                                   'baz\n')
+        assert ed.show_status_message.call_count == 1
+
+
+def test_on_file_changed_modified():
+    """
+    A tab with unsaved changes isn't reloaded, but no longer autosaved, and
+    the user is told.
+    """
+    with generate_python_file('foo') as filepath:
+        ed, tab = changed_file_editor(filepath, modified=True)
+        with open(filepath, 'w') as f:
+            f.write('bar')
+        ed._on_file_changed(filepath)
+        assert tab.setText.call_count == 0
+        assert filepath in ed._external_changes
+        assert ed.show_status_message.call_count == 1
+
+
+def test_on_file_changed_ignored():
+    """
+    Files saved by Mu, only touched, removed or about to be saved aren't
+    reloaded.
+    """
+    with generate_python_file('foo') as filepath:
+        ed, tab = changed_file_editor(filepath)
+        # Unchanged.
+        ed._on_file_changed(filepath)
+        # Touched.
+        os.utime(filepath, ns=(1, 1))
+        ed._on_file_changed(filepath)
+        assert ed._persisted[filepath][1] == mu.logic.file_signature(filepath)
+        # Written by Mu but not yet recorded.
+        with open(filepath, 'w') as f:
+            f.write('bar')
+        ed._file_writer.written[filepath] = mu.logic.file_signature(filepath)
+        ed._on_file_changed(filepath)
+        # About to be saved.
+        ed._file_writer.written.clear()
+        ed._file_writer.pending[filepath] = ('bar', '\n', None)
+        ed._on_file_changed(filepath)
+        ed._file_writer.pending.clear()
+        # Can't be read.
+        with mock.patch('mu.logic.read_and_decode', side_effect=OSError()):
+            ed._on_file_changed(filepath)
+    # Removed.
+    ed._on_file_changed(filepath)
+    assert tab.setText.call_count == 0
+    assert ed.show_status_message.call_count == 0
+
+
+def test_on_file_changed_closed():
+    """
+    Files no longer open in a tab stop being watched.
+    """
+    with generate_python_file('foo') as filepath:
+        ed, tab = changed_file_editor(filepath)
+        ed._view.widgets = []
+        ed._on_file_changed(filepath)
+        assert filepath not in ed._file_watcher.paths
+
+
+def modifiable_tab(tab):
+    """
+    Make the referenced mocked tab report whether it's modified as set.
+    """
+    modified = [True]
+    tab.isModified.side_effect = lambda: modified[0]
+    tab.setModified.side_effect = lambda value: modified.__setitem__(0,
+                                                                     value)
+    return tab
+
+
+def test_save_tab_now():
+    """
+    Saving a tab now writes it with the file writer before returning, and
+    says if it was saved.
+    """
+    with generate_python_file('foo') as filepath:
+        ed = mocked_editor(text='bar', path=filepath, newline='\n')
+        tab = modifiable_tab(ed._view.current_tab)
+        ed._view.widgets = [tab, ]
+        assert ed.save_tab_now(tab) is True
+        with open(filepath) as f:
+            assert f.read() == 'bar'
+        assert ed._persisted[filepath][0] == mu.logic.content_hash('bar')
+        tab.setModified(True)
+        with mock.patch('mu.workers.save_and_encode', side_effect=OSError()):
+            assert ed.save_tab_now(tab) is False
+
+
+def test_run_modified_script_not_reloaded():
+    """
+    Running a script with unsaved changes saves it through the file writer,
+    so the file watcher doesn't mistake the save for a change made by another
+    program, and the script is still autosaved afterwards.
+    """
+    from mu.modes.python3 import PythonMode
+    with generate_python_file('foo') as filepath:
+        ed, tab = changed_file_editor(filepath)
+        modifiable_tab(tab)
+        tab.text.return_value = 'print("bar")\n'
+        tab.newline = '\n'
+        mode = PythonMode(ed, ed._view)
+        mode.workspace_dir = mock.MagicMock(return_value='/bar')
+        mode.run_script()
+        ed._view.add_python3_runner.assert_called_once_with(
+            filepath, '/bar', interactive=True, envars=ed.envars)
+        ed._on_file_changed(filepath)
+        assert tab.setText.call_count == 0
+        assert filepath not in ed._external_changes
+        tab.setModified(True)
+        tab.text.return_value = 'print("baz")\n'
+        ed._view.modified = True
+        ed.autosave()
+        ed._file_writer.wait()
+        assert filepath not in ed._external_changes
+        assert tab.isModified() is False
+        with open(filepath) as f:
+            assert f.read().rstrip() == 'print("baz")'
+
+
 def test_check_usb():
     """
     Ensure the check_usb callback actually checks for connected USB devices.
@@ -1998,16 +2529,16 @@ def test_check_usb():
     ed.change_mode = mock.MagicMock()
     mode_mb = mock.MagicMock()
     mode_mb.name = 'BBC micro:bit'
-    mode_mb.find_device.return_value = ('/dev/ttyUSB0', '12345')
-    ed.modes = {
-        'microbit': mode_mb,
-    }
+    ed.modes = mocked_modes(microbit=mode_mb)
     ed.show_status_message = mock.MagicMock()
-    ed.check_usb()
+    with attached_devices(microbit=('/dev/ttyUSB0', '12345')):
+        ed.check_usb()
     expected = 'Detected new BBC micro:bit device.'
     ed.show_status_message.assert_called_with(expected)
     assert view.show_confirmation.called
     ed.change_mode.assert_called_once_with('microbit')
+    # The mode is only built once it's changed to.
+    assert not ed.modes.is_loaded('microbit')
 
 
 def test_check_usb_change_mode_cancel():
@@ -2020,12 +2551,10 @@ def test_check_usb_change_mode_cancel():
     ed.change_mode = mock.MagicMock()
     mode_cp = mock.MagicMock()
     mode_cp.name = 'CircuitPlayground'
-    mode_cp.find_device.return_value = ('/dev/ttyUSB1', '12345')
-    ed.modes = {
-        'circuitplayground': mode_cp,
-    }
+    ed.modes = mocked_modes(circuitplayground=mode_cp)
     ed.show_status_message = mock.MagicMock()
-    ed.check_usb()
+    with attached_devices(circuitplayground=('/dev/ttyUSB1', '12345')):
+        ed.check_usb()
     expected = 'Detected new CircuitPlayground device.'
     ed.show_status_message.assert_called_with(expected)
     assert view.show_confirmation.called
@@ -2042,16 +2571,12 @@ def test_check_usb_already_in_mode():
     ed.change_mode = mock.MagicMock()
     mode_mb = mock.MagicMock()
     mode_mb.name = 'BBC micro:bit'
-    mode_mb.find_device.return_value = ('/dev/ttyUSB0', '12345')
     mode_cp = mock.MagicMock()
-    mode_cp.find_device.return_value = (None, None)
-    ed.modes = {
-        'microbit': mode_mb,
-        'circuitplayground': mode_cp
-    }
+    ed.modes = mocked_modes(microbit=mode_mb, circuitplayground=mode_cp)
     ed.mode = 'microbit'
     ed.show_status_message = mock.MagicMock()
-    ed.check_usb()
+    with attached_devices(microbit=('/dev/ttyUSB0', '12345')):
+        ed.check_usb()
     view.show_confirmation.assert_not_called()
     ed.change_mode.assert_not_called()
 
@@ -2066,16 +2591,13 @@ def test_check_usb_multiple_devices():
     ed.change_mode = mock.MagicMock()
     mode_mb = mock.MagicMock()
     mode_mb.name = 'BBC micro:bit'
-    mode_mb.find_device.return_value = ('/dev/ttyUSB0', '12345')
     mode_cp = mock.MagicMock()
     mode_cp.name = 'CircuitPlayground'
-    mode_cp.find_device.return_value = ('/dev/ttyUSB1', '54321')
-    ed.modes = {
-        'microbit': mode_mb,
-        'circuitplayground': mode_cp
-    }
+    ed.modes = mocked_modes(microbit=mode_mb, circuitplayground=mode_cp)
     ed.show_status_message = mock.MagicMock()
-    ed.check_usb()
+    with attached_devices(microbit=('/dev/ttyUSB0', '12345'),
+                          circuitplayground=('/dev/ttyUSB1', '54321')):
+        ed.check_usb()
     expected_mb = mock.call('Detected new BBC micro:bit device.')
     expected_cp = mock.call('Detected new CircuitPlayground device.')
     ed.show_status_message.assert_has_calls((expected_mb, expected_cp),
@@ -2095,19 +2617,35 @@ def test_check_usb_when_selecting_mode_is_silent():
     ed.change_mode = mock.MagicMock()
     mode_cp = mock.MagicMock()
     mode_cp.name = 'CircuitPlayground'
-    mode_cp.find_device.return_value = ('/dev/ttyUSB1', '12345')
-    ed.modes = {
-        'circuitplayground': mode_cp,
-    }
+    ed.modes = mocked_modes(circuitplayground=mode_cp)
     ed.show_status_message = mock.MagicMock()
     ed.selecting_mode = True
-    ed.check_usb()
+    with attached_devices(circuitplayground=('/dev/ttyUSB1', '12345')):
+        ed.check_usb()
     expected = 'Detected new CircuitPlayground device.'
     ed.show_status_message.assert_called_with(expected)
     assert view.show_confirmation.call_count == 0
     ed.change_mode.assert_not_called()
 
 
+def test_check_usb_only_loads_device_modes():
+    """
+    Ensure the check_usb doesn't load modes to look for their devices, and
+    only asks modes that work with boards.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.modes = mocked_modes(python=mock.MagicMock(),
+                            microbit=mock.MagicMock())
+    ed.modes.specs['python'].valid_boards = []
+    with mock.patch('mu.modes.registry.find_device',
+                    return_value=(None, None)) as find:
+        ed.check_usb()
+    assert not ed.modes.is_loaded('python')
+    assert not ed.modes.is_loaded('microbit')
+    find.assert_called_once_with(['microbit'], with_logging=False)
+
+
 def test_check_usb_remove_disconnected_devices():
     """
     Ensure that if a device is no longer connected, it is removed from
@@ -2115,7 +2653,7 @@ def test_check_usb_remove_disconnected_devices():
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    ed.modes = {}
+    ed.modes = mocked_modes()
     ed.show_status_message = mock.MagicMock()
     ed.connected_devices = {('microbit', '/dev/ttyACM1')}
     ed.check_usb()
@@ -2338,245 +2876,6 @@ def test_logic_independent_import_app():
     subprocess.run([sys.executable, "-c", "from mu import app"], check=True)
 
 
-#
-# Tests for newline detection
-# Mu should detect the majority newline convention
-# in a loaded file and use that convention when writing
-# the file out again. Internally all newlines are MU_NEWLINE
-#
-
-def test_read_newline_no_text():
-    """If the file being loaded is empty, use the platform default newline
-    """
-    with generate_python_file() as filepath:
-        text, newline = mu.logic.read_and_decode(filepath)
-        assert text.count("\r\n") == 0
-        assert newline == os.linesep
-
-
-def test_read_newline_all_unix():
-    """If the file being loaded has only the Unix convention, use that
-    """
-    with generate_python_file("abc\ndef") as filepath:
-        text, newline = mu.logic.read_and_decode(filepath)
-        assert text.count("\r\n") == 0
-        assert newline == "\n"
-
-
-def test_read_newline_all_windows():
-    """If the file being loaded has only the Windows convention, use that
-    """
-    with generate_python_file("abc\r\ndef") as filepath:
-        text, newline = mu.logic.read_and_decode(filepath)
-        assert text.count("\r\n") == 0
-        assert newline == "\r\n"
-
-
-def test_read_newline_most_unix():
-    """If the file being loaded has mostly the Unix convention, use that
-    """
-    with generate_python_file("\nabc\r\ndef\n") as filepath:
-        text, newline = mu.logic.read_and_decode(filepath)
-        assert text.count("\r\n") == 0
-        assert newline == "\n"
-
-
-def test_read_newline_most_windows():
-    """If the file being loaded has mostly the Windows convention, use that
-    """
-    with generate_python_file("\r\nabc\ndef\r\n") as filepath:
-        text, newline = mu.logic.read_and_decode(filepath)
-        assert text.count("\r\n") == 0
-        assert newline == "\r\n"
-
-
-def test_read_newline_equal_match():
-    """If the file being loaded has an equal number of Windows and
-    Unix newlines, use the platform default
-    """
-    with generate_python_file("\r\nabc\ndef") as filepath:
-        text, newline = mu.logic.read_and_decode(filepath)
-        assert text.count("\r\n") == 0
-        assert newline == os.linesep
-
-
-#
-# When writing Mu should honour the line-ending convention found inbound
-#
-def test_write_newline_to_unix():
-    """If the file had Unix newlines it should be saved with Unix newlines
-
-    (In principle this check is unnecessary as Unix newlines are currently
-    the Mu internal default; but we leave it here in case that situation
-    changes)
-    """
-    with generate_python_file() as filepath:
-        test_string = "\r\n".join("the cat sat on the mat".split())
-        mu.logic.save_and_encode(test_string, filepath, "\n")
-        with open(filepath, newline="") as f:
-            text = f.read()
-            assert text.count("\r\n") == 0
-            assert text.count("\n") == test_string.count("\r\n")
-
-
-def test_write_newline_to_windows():
-    """If the file had Windows newlines it should be saved with Windows
-    newlines
-    """
-    with generate_python_file() as filepath:
-        test_string = "\n".join("the cat sat on the mat".split())
-        mu.logic.save_and_encode(test_string, filepath, "\r\n")
-        with open(filepath, newline="") as f:
-            text = f.read()
-            assert len(re.findall("[^\r]\n", text)) == 0
-            assert text.count("\r\n") == test_string.count("\n")
-
-
-#
-# Generate a Unicode test string which includes all the usual
-# 7-bit characters but also an 8th-bit range which tends to
-# trip things up between encodings
-#
-BYTES_TEST_STRING = bytes(range(0x20, 0x80)) + bytes(range(0xa0, 0xff))
-UNICODE_TEST_STRING = BYTES_TEST_STRING.decode("iso-8859-1")
-
-
-#
-# Tests for encoding detection
-# Mu should detect:
-# - BOM (UTF8/16)
-# - Encoding cooke, eg # -*- coding: utf-8 -*-
-# - fallback to the platform default (locale.getpreferredencoding())
-#
-def test_read_utf8bom():
-    """Successfully decode from utf-8 encoded with BOM
-    """
-    with generate_python_file() as filepath:
-        with open(filepath, "w", encoding="utf-8-sig") as f:
-            f.write(UNICODE_TEST_STRING)
-        text, _ = mu.logic.read_and_decode(filepath)
-        assert text == UNICODE_TEST_STRING
-
-
-def test_read_utf16bebom():
-    """Successfully decode from utf-16 BE encoded with BOM
-    """
-    with generate_python_file() as filepath:
-        with open(filepath, "wb") as f:
-            f.write(codecs.BOM_UTF16_BE)
-            f.write(UNICODE_TEST_STRING.encode("utf-16-be"))
-        text, _ = mu.logic.read_and_decode(filepath)
-        assert text == UNICODE_TEST_STRING
-
-
-def test_read_utf16lebom():
-    """Successfully decode from utf-16 LE encoded with BOM
-    """
-    with generate_python_file() as filepath:
-        with open(filepath, "wb") as f:
-            f.write(codecs.BOM_UTF16_LE)
-            f.write(UNICODE_TEST_STRING.encode("utf-16-le"))
-        text, _ = mu.logic.read_and_decode(filepath)
-        assert text == UNICODE_TEST_STRING
-
-
-def test_read_encoding_cookie():
-    """Successfully decode from iso-8859-1 with an encoding cookie
-    """
-    encoding_cookie = ENCODING_COOKIE.replace(
-        mu.logic.ENCODING, "iso-8859-1")
-    test_string = encoding_cookie + UNICODE_TEST_STRING
-    with generate_python_file() as filepath:
-        with open(filepath, "wb") as f:
-            f.write(test_string.encode("iso-8859-1"))
-        text, _ = mu.logic.read_and_decode(filepath)
-        assert text == test_string
-
-
-def test_read_encoding_mu_default():
-    """Successfully decode from the mu default
-    """
-    test_string = UNICODE_TEST_STRING.encode(mu.logic.ENCODING)
-    with generate_python_file() as filepath:
-        with open(filepath, "wb") as f:
-            f.write(test_string)
-        text, _ = mu.logic.read_and_decode(filepath)
-        assert text == UNICODE_TEST_STRING
-
-
-def test_read_encoding_default():
-    """Successfully decode from the default locale
-    """
-    test_string = UNICODE_TEST_STRING.encode(locale.getpreferredencoding())
-    with generate_python_file() as filepath:
-        with open(filepath, "wb") as f:
-            f.write(test_string)
-        text, _ = mu.logic.read_and_decode(filepath)
-        assert text == UNICODE_TEST_STRING
-
-
-def test_read_encoding_unsuccessful():
-    """Fail to decode encoded text
-    """
-    #
-    # Have to work quite hard to produce text which will definitely
-    # fail to decode since UTF-8 and cp1252 (the default on this
-    # computer) will, between them, decode nearly anything!
-    #
-    with generate_python_file() as filepath:
-        with open(filepath, "wb") as f:
-            f.write(codecs.BOM_UTF8)
-            f.write(b"\xd8\x00")
-        with pytest.raises(UnicodeDecodeError):
-            text, _ = mu.logic.read_and_decode(filepath)
-
-
-#
-# When writing, if the text has an encoding cookie, then that encoding
-# should be used. Otherwise, UTF-8 should be used and no encoding cookie
-# added
-#
-def test_write_encoding_cookie_no_cookie():
-    """If the text has no cookie of its own utf-8 will be used
-    when saving and no cookie added
-    """
-    test_string = UNICODE_TEST_STRING
-    with generate_python_file() as filepath:
-        mu.logic.save_and_encode(test_string, filepath)
-        with open(filepath, encoding=mu.logic.ENCODING) as f:
-            for line in f:
-                assert line == test_string
-                break
-
-
-def test_write_encoding_cookie_existing_cookie():
-    """If the text has a encoding cookie of its own then that encoding will
-    be used when saving and no change made to the cookie
-    """
-    encoding = "iso-8859-1"
-    cookie = ENCODING_COOKIE.replace(mu.logic.ENCODING, encoding)
-    test_string = cookie + UNICODE_TEST_STRING
-    with generate_python_file() as filepath:
-        mu.logic.save_and_encode(test_string, filepath)
-        with open(filepath, encoding=encoding) as f:
-            assert next(f) == cookie
-            assert next(f) == UNICODE_TEST_STRING
-
-
-def test_write_invalid_codec():
-    """If an encoding cookie is present but specifies an unknown codec,
-    utf-8 will be used instead
-    """
-    encoding = "INVALID"
-    cookie = ENCODING_COOKIE.replace(mu.logic.ENCODING, encoding)
-    test_string = cookie + UNICODE_TEST_STRING
-    with generate_python_file() as filepath:
-        mu.logic.save_and_encode(test_string, filepath)
-        with open(filepath, encoding=mu.logic.ENCODING) as f:
-            assert next(f) == cookie
-            assert next(f) == UNICODE_TEST_STRING
-
-
 def test_handle_open_file():
     """
     Ensure on_open_file event handler fires as expected with the editor's
@@ -2584,6 +2883,9 @@ def test_handle_open_file():
     """
     class Dummy(QObject):
         open_file = pyqtSignal(str)
+        code_changed = pyqtSignal(object)
+        open_match = pyqtSignal(str, int, int, int, int)
+        tab_changed = pyqtSignal(object)
     view = Dummy()
     edit = mu.logic.Editor(view)
     m = mock.MagicMock()
@@ -2637,6 +2939,15 @@ def test_abspath_fail():
     assert os.path.abspath('bar') in result
 
 
+#: The options chosen in the find/replace dialog (see FindReplaceDialog).
+FIND_OPTIONS = {
+    'regex': False,
+    'case_sensitive': True,
+    'whole_word': False,
+    'all_files': False,
+}
+
+
 def test_find_replace_cancelled():
     """
     If the activated find/replace dialog is cancelled, no status message is
@@ -2656,7 +2967,8 @@ def test_find_replace_no_find():
     message to explain the problem.
     """
     mock_view = mock.MagicMock()
-    mock_view.show_find_replace.return_value = ('', '', False)
+    result = ('', '', False, FIND_OPTIONS)
+    mock_view.show_find_replace.return_value = result
     ed = mu.logic.Editor(mock_view)
     ed.show_message = mock.MagicMock()
     ed.find_replace()
@@ -2671,12 +2983,13 @@ def test_find_replace_find_matched():
     the expected status message should be shown.
     """
     mock_view = mock.MagicMock()
-    mock_view.show_find_replace.return_value = ('foo', '', False)
+    result = ('foo', '', False, FIND_OPTIONS)
+    mock_view.show_find_replace.return_value = result
     mock_view.highlight_text.return_value = True
     ed = mu.logic.Editor(mock_view)
     ed.show_status_message = mock.MagicMock()
     ed.find_replace()
-    mock_view.highlight_text.assert_called_once_with('foo')
+    mock_view.highlight_text.assert_called_once_with('foo', FIND_OPTIONS)
     assert ed.find == 'foo'
     assert ed.replace == ''
     assert ed.global_replace is False
@@ -2690,7 +3003,8 @@ def test_find_replace_find_unmatched():
     then the expected status message should be shown.
     """
     mock_view = mock.MagicMock()
-    mock_view.show_find_replace.return_value = ('foo', '', False)
+    result = ('foo', '', False, FIND_OPTIONS)
+    mock_view.show_find_replace.return_value = result
     mock_view.highlight_text.return_value = False
     ed = mu.logic.Editor(mock_view)
     ed.show_status_message = mock.MagicMock()
@@ -2705,7 +3019,8 @@ def test_find_replace_replace_no_match():
     UN-matched in the code, then the expected status message should be shown.
     """
     mock_view = mock.MagicMock()
-    mock_view.show_find_replace.return_value = ('foo', 'bar', False)
+    result = ('foo', 'bar', False, FIND_OPTIONS)
+    mock_view.show_find_replace.return_value = result
     mock_view.replace_text.return_value = 0
     ed = mu.logic.Editor(mock_view)
     ed.show_status_message = mock.MagicMock()
@@ -2713,7 +3028,8 @@ def test_find_replace_replace_no_match():
     assert ed.find == 'foo'
     assert ed.replace == 'bar'
     assert ed.global_replace is False
-    mock_view.replace_text.assert_called_once_with('foo', 'bar', False)
+    mock_view.replace_text.assert_called_once_with('foo', 'bar', False,
+                                                   FIND_OPTIONS)
     ed.show_status_message.\
         assert_called_once_with('Could not find "foo".')
 
@@ -2724,7 +3040,8 @@ def test_find_replace_replace_single_match():
     matched once in the code, then the expected status message should be shown.
     """
     mock_view = mock.MagicMock()
-    mock_view.show_find_replace.return_value = ('foo', 'bar', False)
+    result = ('foo', 'bar', False, FIND_OPTIONS)
+    mock_view.show_find_replace.return_value = result
     mock_view.replace_text.return_value = 1
     ed = mu.logic.Editor(mock_view)
     ed.show_status_message = mock.MagicMock()
@@ -2732,7 +3049,8 @@ def test_find_replace_replace_single_match():
     assert ed.find == 'foo'
     assert ed.replace == 'bar'
     assert ed.global_replace is False
-    mock_view.replace_text.assert_called_once_with('foo', 'bar', False)
+    mock_view.replace_text.assert_called_once_with('foo', 'bar', False,
+                                                   FIND_OPTIONS)
     ed.show_status_message.\
         assert_called_once_with('Replaced "foo" with "bar".')
 
@@ -2744,7 +3062,8 @@ def test_find_replace_replace_multi_match():
     shown.
     """
     mock_view = mock.MagicMock()
-    mock_view.show_find_replace.return_value = ('foo', 'bar', True)
+    result = ('foo', 'bar', True, FIND_OPTIONS)
+    mock_view.show_find_replace.return_value = result
     mock_view.replace_text.return_value = 4
     ed = mu.logic.Editor(mock_view)
     ed.show_status_message = mock.MagicMock()
@@ -2752,11 +3071,344 @@ def test_find_replace_replace_multi_match():
     assert ed.find == 'foo'
     assert ed.replace == 'bar'
     assert ed.global_replace is True
-    mock_view.replace_text.assert_called_once_with('foo', 'bar', True)
+    mock_view.replace_text.assert_called_once_with('foo', 'bar', True,
+                                                   FIND_OPTIONS)
     ed.show_status_message.\
         assert_called_once_with('Replaced 4 matches of "foo" with "bar".')
 
 
+def test_find_replace_invalid_regex():
+    """
+    If the find term isn't a valid regular expression, the user is told why.
+    """
+    mock_view = mock.MagicMock()
+    options = dict(FIND_OPTIONS, regex=True)
+    mock_view.show_find_replace.return_value = ('(foo', '', False, options)
+    ed = mu.logic.Editor(mock_view)
+    ed.find_replace()
+    assert mock_view.show_message.call_count == 1
+    assert mock_view.show_message.call_args[0][0] == \
+        'Could not search for "(foo".'
+    assert mock_view.highlight_text.call_count == 0
+
+
+def test_find_replace_invalid_replacement():
+    """
+    If the replacement refers to a group the find term doesn't have, the user
+    is told why and nothing is replaced.
+    """
+    mock_view = mock.MagicMock()
+    options = dict(FIND_OPTIONS, regex=True)
+    mock_view.show_find_replace.return_value = ('foo', r'\1', True, options)
+    ed = mu.logic.Editor(mock_view)
+    ed.find_replace()
+    assert mock_view.show_message.call_count == 1
+    assert mock_view.show_message.call_args[0][0] == \
+        'Could not replace with "\\1".'
+    assert mock_view.replace_text.call_count == 0
+    # It's used literally if it's not a regular expression.
+    mock_view.replace_text.return_value = 1
+    mock_view.show_find_replace.return_value = ('foo', r'\1', True,
+                                                FIND_OPTIONS)
+    ed.find_replace()
+    assert mock_view.replace_text.call_count == 1
+
+
+def test_find_replace_all_files():
+    """
+    If the user asks to search all the files, they're searched in the
+    background.
+    """
+    mock_view = mock.MagicMock()
+    options = dict(FIND_OPTIONS, all_files=True)
+    mock_view.show_find_replace.return_value = ('foo', '', False, options)
+    ed = mu.logic.Editor(mock_view)
+    ed.find_in_files = mock.MagicMock()
+    ed.find_replace()
+    ed.find_in_files.assert_called_once_with()
+    assert ed.find_options == options
+    assert mock_view.highlight_text.call_count == 0
+
+
+def test_find_in_files(tmpdir):
+    """
+    The open tabs and the Python scripts in the workspace that aren't open
+    are searched in the background, and the search results pane is shown.
+    """
+    tmpdir.join('open.py').write('foo')
+    tmpdir.join('closed.py').write('foo')
+    tmpdir.join('image.png').write('foo')
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.path = str(tmpdir.join('open.py'))
+    tab.text.return_value = 'foo = 1'
+    untitled = mock.MagicMock()
+    untitled.path = None
+    view.widgets = [tab, untitled]
+    ed = mu.logic.Editor(view)
+    mock_mode = mock.MagicMock()
+    mock_mode.workspace_dir.return_value = str(tmpdir)
+    ed.modes = {'python': mock_mode, }
+    ed._file_searcher = mock.MagicMock()
+    ed.find = 'foo'
+    ed.find_in_files()
+    view.add_search_results.assert_called_once_with()
+    pattern, buffers, paths, replacement = \
+        ed._file_searcher.search.call_args[0]
+    assert pattern.pattern == 'foo'
+    assert buffers == {tab.path: 'foo = 1'}
+    assert paths == [str(tmpdir.join('closed.py'))]
+    assert replacement is None
+    ed.replace = 'bar'
+    ed.find_in_files()
+    replacement = ed._file_searcher.search.call_args[0][3]
+    assert replacement(None) == 'bar'
+
+
+def test_find_in_files_found():
+    """
+    The matches found are listed. When replacing, those in an open tab are
+    replaced with a single edit, unless the tab has changed.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.text.return_value = 'foo'
+    view.widgets = [tab, ]
+    ed = mu.logic.Editor(view)
+    ed._search_tabs = {'foo.py': (tab, 'foo')}
+    matches = [{'line': 0, 'column': 0, 'end_line': 0, 'end_column': 3,
+                'text': 'foo'}]
+    ed._on_found('foo.py', matches)
+    view.add_search_matches.assert_called_once_with('foo.py', matches)
+    assert tab.replace_matches.call_count == 0
+    matches[0]['replacement'] = 'bar'
+    ed._on_found('bar.py', matches)
+    assert tab.replace_matches.call_count == 0
+    ed._on_found('foo.py', matches)
+    tab.replace_matches.assert_called_once_with(matches)
+    tab.text.return_value = 'changed'
+    ed._on_found('foo.py', matches)
+    assert tab.replace_matches.call_count == 1
+
+
+def test_find_in_files_replaced():
+    """
+    Files that aren't open are saved once their matches are replaced, unless
+    they've changed since they were read.
+    """
+    ed = mu.logic.Editor(mock.MagicMock())
+    ed._file_writer = mock.MagicMock()
+    ed._on_replaced('foo.py', 'bar', '\n', (1, 2))
+    ed._file_writer.save.assert_called_once_with('foo.py', 'bar', '\n',
+                                                 (1, 2))
+
+
+def test_find_in_files_finished():
+    """
+    Once all the files have been searched, the user is told how many matches
+    were found (or replaced) in how many files.
+    """
+    ed = mu.logic.Editor(mock.MagicMock())
+    ed.show_status_message = mock.MagicMock()
+    ed.find = 'foo'
+    ed._search_tabs = {'foo.py': None}
+    ed._on_search_finished(0, 0)
+    ed.show_status_message.assert_called_with('Could not find "foo".')
+    assert ed._search_tabs == {}
+    ed._on_search_finished(3, 2)
+    ed.show_status_message.assert_called_with(
+        'Found 3 matches of "foo" in 2 files.')
+    ed.replace = 'bar'
+    ed._on_search_finished(3, 2)
+    ed.show_status_message.assert_called_with(
+        'Replaced 3 matches of "foo" with "bar" in 2 files.')
+
+
+def test_show_match():
+    """
+    A match from the search results is selected in its file's tab.
+    """
+    ed = mu.logic.Editor(mock.MagicMock())
+    tab = mock.MagicMock()
+    ed.get_tab = mock.MagicMock(return_value=tab)
+    ed.show_match('foo.py', 1, 2, 3, 4)
+    ed.get_tab.assert_called_once_with('foo.py')
+    tab.setSelection.assert_called_once_with(1, 2, 3, 4)
+    tab.ensureLineVisible.assert_called_once_with(1)
+
+
+def test_index_workspace(tmpdir):
+    """
+    The Python scripts in the workspace and open tabs are indexed, and the
+    symbols of any others are forgotten.
+    """
+    tmpdir.join('foo.py').write('')
+    tmpdir.join('bar.txt').write('')
+    ed = mocked_editor()
+    ed.modes['python'].workspace_dir.return_value = str(tmpdir)
+    ed._symbol_index = mock.MagicMock()
+    ed._view.widgets = [mock.MagicMock(path='/elsewhere/baz.py'),
+                        mock.MagicMock(path='/elsewhere/qux.txt'),
+                        mock.MagicMock(path=None)]
+    ed.index_workspace()
+    ed._symbol_index.update.assert_called_once_with(
+        [str(tmpdir.join('foo.py')), '/elsewhere/baz.py'], forget_others=True)
+
+
+def test_on_symbols_changed():
+    """
+    When the symbols defined in the workspace change, they're offered in
+    every tab.
+    """
+    ed = mu.logic.Editor(mock.MagicMock())
+    ed._symbol_index = mock.MagicMock()
+    ed._on_symbols_changed()
+    ed._view.set_symbols.assert_called_once_with(ed._symbol_index.api())
+
+
+def test_go_to_definition():
+    """
+    The definition of the name at the cursor is shown, preferring those in
+    the current tab's file.
+    """
+    ed = mocked_editor(path='bar.py')
+    tab = ed._view.current_tab
+    tab.getCursorPosition.return_value = (3, 4)
+    tab.wordAtLineIndex.return_value = 'foo'
+    ed._symbol_index = mock.MagicMock()
+    ed._symbol_index.definitions.return_value = [
+        ('/a/baz.py', {'kind': 'function', 'line': 1, 'column': 4}),
+        (os.path.abspath('bar.py'),
+         {'kind': 'class', 'line': 5, 'column': 6}),
+    ]
+    ed.show_match = mock.MagicMock()
+    ed.go_to_definition()
+    tab.wordAtLineIndex.assert_called_once_with(3, 4)
+    ed._symbol_index.definitions.assert_called_once_with('foo')
+    ed.show_match.assert_called_once_with(os.path.abspath('bar.py'),
+                                          5, 6, 5, 9)
+    ed.show_match.reset_mock()
+    ed._symbol_index.definitions.return_value = [
+        ('/a/foo.py', {'kind': 'module', 'line': 0, 'column': 0}),
+    ]
+    ed.go_to_definition()
+    ed.show_match.assert_called_once_with('/a/foo.py', 0, 0, 0, 0)
+
+
+def test_go_to_definition_not_found():
+    """
+    If the name at the cursor isn't defined in the workspace, the user is
+    told. If there's no name at the cursor (or no tab), nothing happens.
+    """
+    ed = mocked_editor(path='bar.py')
+    tab = ed._view.current_tab
+    tab.getCursorPosition.return_value = (3, 4)
+    tab.wordAtLineIndex.return_value = 'foo'
+    ed._symbol_index = mock.MagicMock()
+    ed._symbol_index.definitions.return_value = []
+    ed.show_status_message = mock.MagicMock()
+    ed.go_to_definition()
+    ed.show_status_message.assert_called_once_with(
+        'Could not find the definition of "foo".')
+    tab.wordAtLineIndex.return_value = ''
+    ed.go_to_definition()
+    assert ed._symbol_index.definitions.call_count == 1
+    ed._view.current_tab = None
+    ed.go_to_definition()
+    assert ed._symbol_index.definitions.call_count == 1
+
+
+def test_code_changed_outline():
+    """
+    If the outline pane is shown, a change to the current tab's code
+    (re)starts the timer after which it's outlined.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    view.current_tab = tab
+    view.outline = None
+    ed = mu.logic.Editor(view)
+    ed._outline_timer = mock.MagicMock()
+    ed._on_code_changed(tab)
+    assert ed._outline_timer.start.call_count == 0
+    view.outline = mock.MagicMock()
+    ed._on_code_changed(mock.MagicMock())
+    assert ed._outline_timer.start.call_count == 0
+    ed._on_code_changed(tab)
+    ed._outline_timer.start.assert_called_once_with()
+
+
+def test_toggle_outline():
+    """
+    Toggling the outline shows the pane and outlines the current tab, or
+    hides it.
+    """
+    view = mock.MagicMock()
+    view.outline = None
+    ed = mu.logic.Editor(view)
+    ed.update_outline = mock.MagicMock()
+    ed._outline_timer = mock.MagicMock()
+    ed.toggle_outline()
+    view.add_outline.assert_called_once_with()
+    ed.update_outline.assert_called_once_with()
+    view.outline = mock.MagicMock()
+    ed.toggle_outline()
+    view.remove_outline.assert_called_once_with()
+    ed._outline_timer.stop.assert_called_once_with()
+    assert ed.update_outline.call_count == 1
+
+
+def test_update_outline():
+    """
+    The code in the current tab is outlined, if the outline pane is shown.
+    If there's no tab, the outline is empty.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.text.return_value = 'foo = 1\n'
+    view.current_tab = tab
+    view.outline = None
+    ed = mu.logic.Editor(view)
+    ed._outliner = mock.MagicMock()
+    ed.update_outline()
+    assert ed._outliner.outline.call_count == 0
+    view.outline = mock.MagicMock()
+    ed.update_outline()
+    ed._outliner.outline.assert_called_once_with(id(tab), 'foo = 1\n')
+    view.current_tab = None
+    ed.update_outline()
+    view.set_outline.assert_called_once_with([])
+
+
+def test_on_outlined():
+    """
+    An outline is shown only if it's of the code in the current tab.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    view.current_tab = tab
+    ed = mu.logic.Editor(view)
+    ed._on_outlined(id(mock.MagicMock()), [])
+    assert view.set_outline.call_count == 0
+    ed._on_outlined(id(tab), ['foo'])
+    view.set_outline.assert_called_once_with(['foo'])
+    view.current_tab = None
+    ed._on_outlined(id(tab), ['foo'])
+    assert view.set_outline.call_count == 1
+
+
+def test_on_tab_changed():
+    """
+    When the current tab changes, its code is outlined straight away.
+    """
+    ed = mu.logic.Editor(mock.MagicMock())
+    ed._outline_timer = mock.MagicMock()
+    ed.update_outline = mock.MagicMock()
+    ed._on_tab_changed(mock.MagicMock())
+    ed._outline_timer.stop.assert_called_once_with()
+    ed.update_outline.assert_called_once_with()
+
+
 def test_toggle_comments():
     """
     Ensure the method in the view for toggling comments on and off is called.
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the logging helpers.
+"""
+import json
+import logging
+from unittest import mock
+from mu.logs import (Payload, RateLimitFilter, queue_handler,
+                     configure_levels, load_levels, LogFile, PAYLOAD_LIMIT)
+
+
+def make_record(level=logging.DEBUG, lineno=1, msg='foo'):
+    """
+    Return a log record from the referenced line.
+    """
+    return logging.LogRecord('mu', level, 'foo.py', lineno, msg, None, None)
+
+
+def test_Payload():
+    """
+    Small payloads are logged as they are and large ones are truncated.
+    """
+    assert str(Payload('foo')) == 'foo'
+    assert str(Payload({'a': 1})) == "{'a': 1}"
+    text = 'x' * (PAYLOAD_LIMIT + 10)
+    assert str(Payload(text)) == 'x' * PAYLOAD_LIMIT + \
+        '... [10 more characters]'
+    assert str(Payload('abcdef', limit=3)) == 'abc... [3 more characters]'
+
+
+def test_Payload_lazy():
+    """
+    The payload isn't converted into a string unless it's logged.
+    """
+    value = mock.MagicMock()
+    log = logging.getLogger('mu.test_logs')
+    log.setLevel(logging.INFO)
+    log.debug(Payload(value))
+    assert value.__str__.call_count == 0
+
+
+def test_RateLimitFilter():
+    """
+    Each line may only log so many records below WARNING in each period.
+    The number dropped is noted on the next record from that line.
+    """
+    rate_limit = RateLimitFilter(rate=2, per=10)
+    with mock.patch('mu.logs.time.monotonic', return_value=0):
+        assert rate_limit.filter(make_record())
+        assert rate_limit.filter(make_record())
+        assert not rate_limit.filter(make_record())
+        assert not rate_limit.filter(make_record())
+        # Other lines and warnings are unaffected.
+        assert rate_limit.filter(make_record(lineno=2))
+        assert rate_limit.filter(make_record(level=logging.WARNING))
+    with mock.patch('mu.logs.time.monotonic', return_value=10):
+        record = make_record()
+        assert rate_limit.filter(record)
+        assert record.getMessage() == 'foo [2 similar messages dropped]'
+        record = make_record()
+        assert rate_limit.filter(record)
+        assert record.getMessage() == 'foo'
+
+
+def test_queue_handler():
+    """
+    Records are passed to the referenced handlers by a background thread,
+    which is stopped (writing any waiting records) when Python exits.
+    """
+    target = mock.MagicMock()
+    target.level = logging.DEBUG
+    with mock.patch('mu.logs.atexit.register') as register:
+        handler = queue_handler(target)
+    assert isinstance(handler.filters[0], RateLimitFilter)
+    handler.handle(make_record())
+    stop = register.call_args[0][0]
+    stop()
+    assert target.handle.call_count == 1
+    assert target.handle.call_args[0][0].getMessage() == 'foo'
+
+
+def test_configure_levels():
+    """
+    The levels of loggers for parts of Mu can be set. Bad levels are logged
+    and ignored.
+    """
+    with mock.patch('mu.logs.logger.error') as error:
+        configure_levels({'mu.test_logs.a': 'info',
+                          'mu.test_logs.b': 'WARNING',
+                          'mu.test_logs.c': 'LOUD'})
+        assert error.call_count == 1
+        configure_levels(['mu.test_logs.a'])
+        assert error.call_count == 2
+    assert logging.getLogger('mu.test_logs.a').level == logging.INFO
+    assert logging.getLogger('mu.test_logs.b').level == logging.WARNING
+    assert logging.getLogger('mu.test_logs.c').level == logging.NOTSET
+
+
+def test_load_levels(tmpdir):
+    """
+    Levels are read from the settings file, if it can be read.
+    """
+    settings = tmpdir.join('settings.json')
+    assert load_levels(str(settings)) == {}
+    settings.write('[]')
+    assert load_levels(str(settings)) == {}
+    settings.write(json.dumps({'log_levels': {'mu': 'INFO'}}))
+    assert load_levels(str(settings)) == {'mu': 'INFO'}
+    settings.write('not json')
+    assert load_levels(str(settings)) == {}
+
+
+def record(level, message, second=0):
+    """
+    Return a line of a log file, in Mu's format.
+    """
+    return ('2018-06-01 12:00:{:02d},123 - mu.logic:1(foo) {}: {}\n'.format(
+        second, level, message))
+
+
+def test_LogFile_missing(tmpdir):
+    """
+    A log file which doesn't exist (yet) is empty.
+    """
+    log = LogFile(str(tmpdir.join('mu.log')))
+    assert log.size() == 0
+    assert log.tail() == ''
+    assert log.earlier() == ''
+    assert log.newer() == ''
+    assert log.search('foo') == ''
+
+
+def test_LogFile_tail_and_earlier(tmpdir):
+    """
+    The tail starts at the beginning of a complete line and stops at the end
+    of the last complete line. Earlier chunks lead back to the start of the
+    file.
+    """
+    lines = ['line {}\n'.format(i) for i in range(100)]
+    log_path = tmpdir.join('mu.log')
+    log_path.write(''.join(lines) + 'partial')
+    log = LogFile(str(log_path), chunk_size=50)
+    tail = log.tail()
+    assert tail.endswith(lines[-1])
+    assert tail.splitlines(True)[0] in lines
+    assert log.end == log.size() - len('partial')
+    text = tail
+    chunk = log.earlier()
+    while chunk:
+        assert chunk.endswith('\n')
+        text = chunk + text
+        chunk = log.earlier()
+    assert log.start == 0
+    assert text == ''.join(lines)
+
+
+def test_LogFile_earlier_long_line(tmpdir):
+    """
+    A line longer than a chunk is read in pieces.
+    """
+    log_path = tmpdir.join('mu.log')
+    log_path.write('x' * 30 + '\nfoo\n')
+    log = LogFile(str(log_path), chunk_size=10)
+    assert log.tail() == 'foo\n'
+    assert log.earlier() == 'xxxxxxxxx\n'
+    assert log.earlier() == 'x' * 10
+    assert log.earlier() == 'x' * 10
+    assert log.earlier() == 'x'
+    assert log.earlier() == ''
+
+
+def test_LogFile_newer(tmpdir):
+    """
+    Complete lines added since the file was last read are returned. If the
+    file has been rotated, None is returned.
+    """
+    log_path = tmpdir.join('mu.log')
+    log_path.write('foo\n')
+    log = LogFile(str(log_path))
+    assert log.tail() == 'foo\n'
+    assert log.newer() == ''
+    log_path.write('foo\nbar\nb')
+    assert log.newer() == 'bar\n'
+    log_path.write('foo\nbar\nbaz\n')
+    assert log.newer() == 'baz\n'
+    log_path.write('')
+    assert log.newer() is None
+
+
+def test_LogFile_decode(tmpdir):
+    """
+    The log is decoded as UTF-8, replacing anything that can't be decoded.
+    """
+    log_path = tmpdir.join('mu.log')
+    log_path.write_binary('température\n'.encode('utf-8') + b'\xff\n')
+    assert LogFile(str(log_path)).tail() == 'température\n\ufffd\n'
+
+
+def test_LogFile_search(tmpdir):
+    """
+    Records containing the text (ignoring case) at or above the level are
+    found. Lines which aren't the start of a record are part of the record
+    above them.
+    """
+    log_path = tmpdir.join('mu.log')
+    log_path.write('Before the first record\n' +
+                   record('DEBUG', 'Hello', 1) +
+                   record('ERROR', 'Oops', 2) +
+                   'Traceback hello\n' +
+                   record('INFO', 'hello again', 3) +
+                   record('WARNING', 'Last'))
+    log = LogFile(str(log_path))
+    assert log.search('hello') == (record('DEBUG', 'Hello', 1) +
+                                   record('ERROR', 'Oops', 2) +
+                                   'Traceback hello\n' +
+                                   record('INFO', 'hello again', 3))
+    assert log.search(level='WARNING') == (record('ERROR', 'Oops', 2) +
+                                           'Traceback hello\n' +
+                                           record('WARNING', 'Last'))
+    assert log.search('HELLO', 'INFO') == (record('ERROR', 'Oops', 2) +
+                                           'Traceback hello\n' +
+                                           record('INFO', 'hello again', 3))
+    assert log.search('before') == 'Before the first record\n'
+    assert log.search('hello', limit=1) == record('INFO', 'hello again', 3)
+
+
+def test_LogFile_search_cancelled(tmpdir):
+    """
+    The search stops (returning None) once cancelled returns True.
+    """
+    log_path = tmpdir.join('mu.log')
+    log_path.write(record('INFO', 'a', 1) + record('INFO', 'b', 2) +
+                   record('INFO', 'c', 3))
+    log = LogFile(str(log_path))
+    cancelled = mock.MagicMock(side_effect=[False, True])
+    assert log.search('a', cancelled=cancelled) is None
+    assert cancelled.call_count == 2
+
+
+def test_LogFile_read_error(tmpdir):
+    """
+    Errors reading the log are logged and nothing is returned.
+    """
+    log_path = tmpdir.join('mu.log')
+    log_path.write(record('INFO', 'foo'))
+    log = LogFile(str(log_path))
+    with mock.patch('mu.logs.mmap.mmap', side_effect=OSError('boom')), \
+            mock.patch('mu.logs.logger.error') as error:
+        assert log.tail() == ''
+        assert log.search('foo') == ''
+    assert error.call_count == 2
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for outlining Python code.
+"""
+import tokenize
+from unittest import mock
+import mu.outline
+
+
+CODE = '''"""
+A game.
+"""
+import os
+WIDTH, HEIGHT = 800, 600
+score: int = 0
+
+
+@decorator
+class Ship(Base):
+    speed = 3
+
+    def __init__(self):
+        def inner():
+            pass
+
+    async def move(self):
+        pass
+
+
+def update():
+    x = 1
+'''
+
+OUTLINE = [
+    ('WIDTH', 'variable', 4, 0, 0),
+    ('HEIGHT', 'variable', 4, 7, 0),
+    ('score', 'variable', 5, 0, 0),
+    ('Ship', 'class', 9, 6, 0),
+    ('__init__', 'function', 12, 8, 1),
+    ('move', 'function', 16, 14, 1),
+    ('update', 'function', 20, 4, 0),
+]
+
+
+def summary(outline):
+    """
+    Return the outline as a list of tuples, for brevity.
+    """
+    return [(item['name'], item['kind'], item['line'], item['column'],
+             item['depth']) for item in outline]
+
+
+def test_tolerant_tokens():
+    """
+    Tokenizing carries on after lines that can't be tokenized.
+    """
+    lines = ['x = """\n', 'def f():\n', '  pass\n', ' y\n']
+    tokens = list(mu.outline.tolerant_tokens(lines))
+    assert tokens.count(None) == 2
+    names = [(token.string, token.start) for token in tokens
+             if token and token.type == tokenize.NAME]
+    assert names == [('x', (1, 0)), ('def', (2, 0)), ('f', (2, 4)),
+                     ('pass', (3, 2)), ('y', (4, 1))]
+
+
+def test_top_level_starts():
+    """
+    The line on which each top-level statement starts is found, with
+    decorators belonging to the statement they decorate.
+    """
+    lines = CODE.splitlines(True)
+    assert list(mu.outline.top_level_starts(lines)) == [0, 3, 4, 5, 8, 20]
+    assert list(mu.outline.top_level_starts(lines, 8)) == [8, 20]
+
+
+def test_outline_block():
+    """
+    Classes, functions (other than those in functions) and top-level
+    assignments are outlined, with the position of their names.
+    """
+    lines = CODE.splitlines(True)
+    assert summary(mu.outline.outline_block(lines)) == OUTLINE
+
+
+def test_outline_block_syntax_error():
+    """
+    Code that can't be parsed is outlined from its tokens.
+    """
+    lines = CODE.replace('def update():', 'def update(:').splitlines(True)
+    with mock.patch('mu.outline.outline_tokens',
+                    wraps=mu.outline.outline_tokens) as mock_tokens:
+        assert summary(mu.outline.outline_block(lines)) == OUTLINE
+    assert mock_tokens.call_count == 1
+
+
+def test_outline_block_unclosed_bracket():
+    """
+    Code after a bracket that's never closed is still outlined.
+    """
+    lines = CODE.replace('speed = 3', 'speed = (').splitlines(True)
+    with mock.patch('mu.outline.ast.parse') as mock_parse:
+        assert summary(mu.outline.outline_block(lines)) == OUTLINE
+    assert mock_parse.call_count == 0
+
+
+def test_outline_tokens_assignments():
+    """
+    Only names at the start of a line followed by "=" or ":" are assigned.
+    """
+    code = 'a, b = 1\nc == 2\nelse:\nd.e = 3\nf: int\n'
+    tokens = list(mu.outline.tolerant_tokens(code.splitlines(True)))
+    assert [item['name'] for item in mu.outline.outline_tokens(tokens)] == \
+        ['a', 'b', 'f']
+
+
+def test_char_column():
+    """
+    Byte offsets from ast are converted to columns.
+    """
+    assert mu.outline.char_column('é = ü = 1', 5) == 4
+
+
+def test_IncrementalOutline():
+    """
+    Only the top-level statements that have changed are outlined again.
+    """
+    outliner = mu.outline.IncrementalOutline()
+    with mock.patch('mu.outline.outline_block',
+                    wraps=mu.outline.outline_block) as mock_block:
+        assert summary(outliner.outline(CODE)) == OUTLINE
+        assert mock_block.call_count == 6
+        mock_block.reset_mock()
+        assert summary(outliner.outline(CODE)) == OUTLINE
+        assert mock_block.call_count == 0
+        code = CODE.replace('    x = 1', '    x = 2')
+        assert summary(outliner.outline(code)) == OUTLINE
+        assert mock_block.call_count == 1
+        mock_block.reset_mock()
+        code = code.replace('score: int = 0\n', 'score: int = 0\nlives = 3\n')
+        outline = summary(outliner.outline(code))
+        assert mock_block.call_count == 2
+    assert outline[3] == ('lives', 'variable', 6, 0, 0)
+    assert outline[-1] == ('update', 'function', 21, 4, 0)
+    assert outline == summary(mu.outline.IncrementalOutline().outline(code))
+
+
+def test_IncrementalOutline_edits():
+    """
+    However the code is edited, the outline is the same as if the code were
+    outlined afresh.
+    """
+    outliner = mu.outline.IncrementalOutline()
+    outliner.outline(CODE)
+    edits = [
+        CODE.replace('WIDTH,', 'W,'),
+        'x = 1\n' + CODE,
+        CODE + '\ndef more(',
+        CODE.replace('    async', '  async'),
+        CODE.replace('"""\nA game.', '"""A game.'),
+        CODE.replace('A game.\n"""', 'A game.'),
+        '',
+        CODE,
+    ]
+    for code in edits:
+        expected = mu.outline.IncrementalOutline().outline(code)
+        assert outliner.outline(code) == expected
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the startup profiler.
+"""
+import os
+import json
+from unittest import mock
+from mu.profiler import (StartupProfiler, is_enabled, REPORT_JSON,
+                         REPORT_TEXT)
+
+
+def test_is_enabled():
+    """
+    Profiling is switched on with a command line flag or environment variable.
+    """
+    assert is_enabled(['mu'], {}) is False
+    assert is_enabled(['mu', '--profile-startup'], {}) is True
+    assert is_enabled(['mu'], {'MU_PROFILE_STARTUP': '1'}) is True
+    assert is_enabled(['mu'], {'MU_PROFILE_STARTUP': ''}) is False
+
+
+def test_StartupProfiler_disabled():
+    """
+    Nothing is recorded or written if profiling isn't switched on.
+    """
+    profiler = StartupProfiler()
+    with profiler.phase('foo'):
+        pass
+    profiler.imports_done()
+    assert profiler.phases == []
+    assert profiler.finish('logs') is None
+
+
+def test_StartupProfiler_phases():
+    """
+    Phases are timed in order, with phases started within another phase
+    nested inside it.
+    """
+    profiler = StartupProfiler(enabled=True)
+    profiler.imports_done()
+    with profiler.phase('foo'):
+        with profiler.phase('bar'):
+            pass
+    try:
+        with profiler.phase('baz'):
+            raise ValueError('boom')
+    except ValueError:
+        pass
+    assert [(p['name'], p['depth']) for p in profiler.phases] == [
+        ('imports', 0), ('foo', 0), ('bar', 1), ('baz', 0)]
+    assert profiler.phases[0]['modules'] >= 0
+    for phase in profiler.phases:
+        assert phase['wall_ms'] >= 0
+        assert phase['cpu_ms'] >= 0
+
+
+def test_StartupProfiler_summary():
+    """
+    The summary lists each phase, indented by depth, and the totals.
+    """
+    report = {
+        'version': '1.0.1',
+        'platform': 'Linux',
+        'timestamp': '2018-10-01T12:00:00',
+        'total_wall_ms': 123.45,
+        'total_cpu_ms': 100.0,
+        'phases': [
+            {'name': 'imports', 'depth': 0, 'wall_ms': 100.0, 'cpu_ms': 90.0,
+             'modules': 42},
+            {'name': 'load ' + 'x' * 100, 'depth': 1, 'wall_ms': 1.0,
+             'cpu_ms': 0.5},
+        ],
+    }
+    lines = StartupProfiler.summary(report).splitlines()
+    assert lines[0] == 'Mu 1.0.1 startup profile (2018-10-01T12:00:00)'
+    assert lines[4].startswith('imports (42 modules) ')
+    assert lines[4].endswith('100.0      90.0')
+    assert lines[5].startswith('  load xxx')
+    assert '...' in lines[5]
+    assert lines[6].startswith('Total')
+    assert lines[6].endswith('123.5     100.0')
+
+
+def test_StartupProfiler_finish(tmpdir):
+    """
+    Finishing writes the JSON report and summary to the referenced directory
+    and stops any further recording.
+    """
+    profiler = StartupProfiler(enabled=True)
+    with profiler.phase('foo'):
+        pass
+    log_dir = str(tmpdir)
+    assert profiler.finish(log_dir) == os.path.join(log_dir, REPORT_TEXT)
+    with open(os.path.join(log_dir, REPORT_JSON)) as f:
+        report = json.load(f)
+    assert report['phases'][0]['name'] == 'foo'
+    assert report['total_wall_ms'] >= report['phases'][0]['wall_ms']
+    with open(os.path.join(log_dir, REPORT_TEXT)) as f:
+        assert 'foo' in f.read()
+    assert profiler.enabled is False
+    with profiler.phase('bar'):
+        pass
+    assert len(profiler.phases) == 1
+
+
+def test_StartupProfiler_finish_fails():
+    """
+    If the report can't be written the problem is logged.
+    """
+    profiler = StartupProfiler(enabled=True)
+    with mock.patch('builtins.open', side_effect=OSError('boom')), \
+            mock.patch('mu.profiler.logger.error') as log:
+        assert profiler.finish('logs') is None
+    assert log.call_count == 1
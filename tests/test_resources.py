@@ -2,6 +2,7 @@
 """
 Tests for the resources sub-module.
 """
+import os
 import mu.resources
 from unittest import mock
 from PyQt5.QtGui import QIcon, QPixmap
@@ -9,12 +10,22 @@ from PyQt5.QtGui import QIcon, QPixmap
 
 def test_path():
     """
-    Ensure the resource_filename function is called with the expected args and
-    the path function under test returns its result.
+    Ensure the path function returns the expected filename in the resources
+    directory.
     """
-    with mock.patch('mu.resources.resource_filename', return_value='bar') as r:
-        assert mu.resources.path('foo') == 'bar'
-        r.assert_called_once_with(mu.resources.__name__, 'images/foo')
+    with mock.patch('mu.resources.RESOURCE_DIR', 'bar'):
+        assert mu.resources.path('foo') == os.path.join('bar', 'images/foo')
+        assert mu.resources.path('foo', 'css/') == os.path.join('bar',
+                                                                'css/foo')
+
+
+def test_resource_dir():
+    """
+    The resources directory is where the resources sub-module lives.
+    """
+    expected = os.path.dirname(os.path.abspath(mu.resources.__file__))
+    assert os.path.samefile(mu.resources.RESOURCE_DIR, expected)
+    assert os.path.isfile(mu.resources.path('icon.png'))
 
 
 def test_load_icon():
@@ -25,6 +36,16 @@ def test_load_icon():
     assert isinstance(result, QIcon)
 
 
+def test_load_icon_cached():
+    """
+    Icons are only loaded once.
+    """
+    with mock.patch('mu.resources._ICONS', {}), \
+            mock.patch('mu.resources.QIcon') as mock_icon:
+        assert mu.resources.load_icon('foo') is mu.resources.load_icon('foo')
+    mock_icon.assert_called_once_with(mu.resources.path('foo'))
+
+
 def test_load_pixmap():
     """
     Check the load_pixmap function returns the expected QPixmap object.
@@ -33,20 +54,37 @@ def test_load_pixmap():
     assert isinstance(result, QPixmap)
 
 
+def test_load_pixmap_cached():
+    """
+    Pixmaps are only loaded once.
+    """
+    with mock.patch('mu.resources._PIXMAPS', {}), \
+            mock.patch('mu.resources.QPixmap') as mock_pixmap:
+        assert mu.resources.load_pixmap('foo') is \
+            mu.resources.load_pixmap('foo')
+    mock_pixmap.assert_called_once_with(mu.resources.path('foo'))
+
+
 def test_stylesheet():
     """
-    Ensure the resource_string function is called with the expected args and
-    the load_stylesheet function returns its result.
+    Ensure the stylesheet is read from the css directory (only once) and the
+    load_stylesheet function returns its content.
     """
-    with mock.patch('mu.resources.resource_string', return_value=b'foo') as rs:
+    mock_open = mock.mock_open(read_data='foo')
+    with mock.patch('mu.resources._STYLESHEETS', {}), \
+            mock.patch('builtins.open', mock_open):
+        assert 'foo' == mu.resources.load_stylesheet('foo')
         assert 'foo' == mu.resources.load_stylesheet('foo')
-        rs.assert_called_once_with(mu.resources.__name__, 'css/foo')
+    mock_open.assert_called_once_with(mu.resources.path('foo', 'css/'),
+                                      encoding='utf8')
 
 
 def test_load_font_data():
     """
     Ensure font data can be loaded
     """
-    with mock.patch('mu.resources.resource_string', return_value=b'foo') as rs:
+    mock_open = mock.mock_open(read_data=b'foo')
+    with mock.patch('builtins.open', mock_open):
         assert b'foo' == mu.resources.load_font_data('foo')
-        rs.assert_called_once_with(mu.resources.__name__, 'fonts/foo')
+    mock_open.assert_called_once_with(mu.resources.path('foo', 'fonts/'),
+                                      'rb')
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for finding and replacing text in code.
+"""
+import re
+import pytest
+import mu.search
+
+
+def test_compile_pattern_literal():
+    """
+    By default the text is matched literally and case sensitively.
+    """
+    pattern = mu.search.compile_pattern('a.b')
+    assert pattern.findall('a.b axb A.B') == ['a.b']
+
+
+def test_compile_pattern_options():
+    """
+    The text can be a regular expression, matched case insensitively and
+    only as whole words.
+    """
+    pattern = mu.search.compile_pattern('fo+', regex=True,
+                                        case_sensitive=False,
+                                        whole_word=True)
+    assert pattern.findall('foo FOO food fo') == ['foo', 'FOO', 'fo']
+
+
+def test_compile_pattern_invalid():
+    """
+    An invalid regular expression raises re.error.
+    """
+    with pytest.raises(re.error):
+        mu.search.compile_pattern('(foo', regex=True)
+
+
+def test_replacer():
+    """
+    Replacements refer to the match's groups only if they're regular
+    expressions.
+    """
+    match = re.search('(f)oo', 'foo')
+    assert mu.search.replacer(r'\1un', regex=True)(match) == 'fun'
+    assert mu.search.replacer(r'\1un')(match) == r'\1un'
+
+
+def test_check_replacement():
+    """
+    Replacements that refer to groups the pattern doesn't have, or that end
+    in a backslash, are reported with re.error, even if nothing matches.
+    """
+    pattern = re.compile('(?P<f>f)oo')
+    mu.search.check_replacement(pattern, r'\1\g<f>un')
+    for replace in (r'\2', 'a\\', r'\g<x>'):
+        with pytest.raises(re.error):
+            mu.search.check_replacement(pattern, replace)
+
+
+def test_find_matches():
+    """
+    Each match is found with where it starts and ends and the text of the
+    line on which it starts.
+    """
+    text = 'foo = 1\nbar = foo\n\nfoo'
+    pattern = mu.search.compile_pattern('foo')
+    assert mu.search.find_matches(pattern, text) == [
+        {'line': 0, 'column': 0, 'end_line': 0, 'end_column': 3,
+         'text': 'foo = 1'},
+        {'line': 1, 'column': 6, 'end_line': 1, 'end_column': 9,
+         'text': 'bar = foo'},
+        {'line': 3, 'column': 0, 'end_line': 3, 'end_column': 3,
+         'text': 'foo'},
+    ]
+
+
+def test_find_matches_multi_line():
+    """
+    Matches can span lines, and the lines after them are still counted
+    correctly.
+    """
+    text = 'a\nfoo\nbar\nfoo\n'
+    pattern = mu.search.compile_pattern('o\nb', regex=True)
+    matches = mu.search.find_matches(pattern, text)
+    assert matches == [{'line': 1, 'column': 2, 'end_line': 2,
+                        'end_column': 1, 'text': 'foo'}]
+    pattern = mu.search.compile_pattern('foo|bar', regex=True)
+    lines = [m['line'] for m in mu.search.find_matches(pattern, text)]
+    assert lines == [1, 2, 3]
+
+
+def test_find_matches_replacement():
+    """
+    With a replacement function, each match has its replacement.
+    """
+    pattern = mu.search.compile_pattern(r'(\w+) = (\w+)', regex=True)
+    replacement = mu.search.replacer(r'\2 = \1', regex=True)
+    matches = mu.search.find_matches(pattern, 'x = y\n', replacement)
+    assert matches[0]['replacement'] == 'y = x'
+
+
+def test_find_matches_empty():
+    """
+    Empty matches are ignored.
+    """
+    pattern = mu.search.compile_pattern('x*', regex=True)
+    assert len(mu.search.find_matches(pattern, 'axxb\nx')) == 2
+
+
+def test_find_next():
+    """
+    The first match at or after the line and column is found, wrapping round
+    to the start of the text.
+    """
+    pattern = mu.search.compile_pattern(r'\d+', regex=True)
+    text = 'a1 b22\nc333\n'
+    match = mu.search.find_next(pattern, text, 0, 2)
+    assert (match['line'], match['column'], match['end_column'],
+            match['text']) == (0, 4, 6, 'a1 b22')
+    match = mu.search.find_next(pattern, text, 1, 0)
+    assert (match['line'], match['column'], match['end_column'],
+            match['text']) == (1, 1, 4, 'c333')
+    match = mu.search.find_next(pattern, text, 1, 4)
+    assert (match['line'], match['column']) == (0, 1)
+    match = mu.search.find_next(pattern, text, 9, 0)
+    assert (match['line'], match['column']) == (0, 1)
+
+
+def test_find_next_replacement():
+    """
+    The match contains its replacement, if a replacement function is given.
+    Python's regular expressions are used, including lookarounds.
+    """
+    pattern = mu.search.compile_pattern(r'(?<=b)(\d)', regex=True)
+    replacement = mu.search.replacer(r'<\1>', regex=True)
+    match = mu.search.find_next(pattern, 'a1 b22\n', 0, 0, replacement)
+    assert (match['column'], match['replacement']) == (4, '<2>')
+
+
+def test_find_next_missing():
+    """
+    If there are no (non-empty) matches, None is returned.
+    """
+    pattern = mu.search.compile_pattern('x*', regex=True)
+    assert mu.search.find_next(pattern, 'abc\n', 0, 1) is None
+
+
+def test_replace_matches():
+    """
+    All the non-empty matches are replaced, and counted.
+    """
+    pattern = mu.search.compile_pattern('x*', regex=True)
+    replacement = mu.search.replacer('y')
+    assert mu.search.replace_matches(pattern, 'axxb\nx',
+                                     replacement) == ('ayb\ny', 2)
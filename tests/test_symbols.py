@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for finding the symbols defined in Python code.
+"""
+import sys
+import ast
+from unittest import mock
+import pytest
+import mu.symbols
+
+
+CODE = '''"""
+A module.
+"""
+
+
+def foo(a, b=1, *args, c, d=None, **kwargs):
+    """Do foo."""
+
+
+@decorator
+class Bar(Base):
+    """A bar."""
+
+    def __init__(self, x, y=f()):
+        pass
+
+    async def baz(self):
+
+        def inner():
+            pass
+'''
+
+
+def test_module_name():
+    """
+    Modules are named after their files.
+    """
+    assert mu.symbols.module_name('/foo/bar.py') == 'bar'
+
+
+def test_format_default():
+    """
+    Defaults that aren't literals, can't be evaluated or are too deeply
+    nested to evaluate are shown as "...".
+    """
+    def default(code):
+        return mu.symbols.format_default(ast.parse(code).body[0].value)
+
+    assert default('(1, "a")') == "(1, 'a')"
+    assert default('f()') == '...'
+    assert default('{[]: 1}') == '...'
+    with mock.patch('mu.symbols.ast.literal_eval',
+                    side_effect=RecursionError()):
+        assert default('1') == '...'
+
+
+def test_format_signature():
+    """
+    Signatures show the arguments, with literal defaults. The first argument
+    of a method is left out.
+    """
+    tree = ast.parse('def f(self, a, b=f(), *, c=\'x\', d): pass')
+    arguments = tree.body[0].args
+    assert mu.symbols.format_signature(arguments) == \
+        "(self, a, b=..., *, c='x', d)"
+    assert mu.symbols.format_signature(arguments, method=True) == \
+        "(a, b=..., *, c='x', d)"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8),
+                    reason='Positional only arguments need Python 3.8')
+def test_format_signature_positional_only():
+    """
+    Positional only arguments are followed by "/", and defaults line up with
+    the positional arguments whichever side of the "/" they are.
+    """
+    def signature(code, method=False):
+        arguments = ast.parse(code).body[0].args
+        return mu.symbols.format_signature(arguments, method)
+
+    assert signature('def f(a, b=1, /, c=2, *, d): pass') == \
+        '(a, b=1, /, c=2, *, d)'
+    assert signature('def f(self, a, /, b): pass', True) == '(a, /, b)'
+    assert signature('def f(self, /, a): pass', True) == '(a)'
+    assert signature('def f(a=1, /): pass') == '(a=1, /)'
+
+
+def test_is_staticmethod():
+    """
+    Functions decorated with staticmethod (by name or as an attribute) are
+    static methods.
+    """
+    def is_staticmethod(code):
+        return mu.symbols.is_staticmethod(ast.parse(code).body[0])
+
+    assert is_staticmethod('@staticmethod\ndef f(): pass')
+    assert is_staticmethod('@builtins.staticmethod\ndef f(): pass')
+    assert not is_staticmethod('@classmethod\ndef f(cls): pass')
+    assert not is_staticmethod('@decorate()\ndef f(): pass')
+    assert not is_staticmethod('def f(self): pass')
+
+
+def test_find_symbols_method_signatures():
+    """
+    Methods and class methods are shown without their self or cls argument,
+    and static methods with all their arguments.
+    """
+    code = ('class Foo:\n'
+            '    def method(self, a): pass\n'
+            '    @classmethod\n'
+            '    def make(cls, b): pass\n'
+            '    @staticmethod\n'
+            '    def helper(c, d): pass\n')
+    symbols = mu.symbols.find_symbols(code, 'foo')
+    signatures = {s['name']: s['signature'] for s in symbols}
+    assert signatures['foo.Foo.method'] == '(a)'
+    assert signatures['foo.Foo.make'] == '(b)'
+    assert signatures['foo.Foo.helper'] == '(c, d)'
+
+
+def test_find_symbols():
+    """
+    The module, and the classes and functions defined at its top level or in
+    its classes, are found with the position of their names.
+    """
+    symbols = mu.symbols.find_symbols(CODE, 'foo')
+    assert [(s['name'], s['kind'], s['line'], s['column'])
+            for s in symbols] == [
+        ('foo', 'module', 0, 0),
+        ('foo.foo', 'function', 5, 4),
+        ('foo.Bar', 'class', 10, 6),
+        ('foo.Bar.__init__', 'function', 13, 8),
+        ('foo.Bar.baz', 'function', 16, 14),
+    ]
+    assert symbols[0]['doc'] == 'A module.'
+    assert symbols[1]['signature'] == '(a, b=1, *args, c, d=None, **kwargs)'
+    assert symbols[1]['doc'] == 'Do foo.'
+    assert symbols[2]['signature'] == '(x, y=...)'
+    assert symbols[4]['doc'] == ''
+
+
+def test_find_symbols_syntax_error():
+    """
+    Code that can't be parsed raises SyntaxError.
+    """
+    with pytest.raises(SyntaxError):
+        mu.symbols.find_symbols('def foo(:', 'foo')
+
+
+def test_api_entry():
+    """
+    API entries are in the same format as those for the modes.
+    """
+    symbols = mu.symbols.find_symbols(CODE, 'foo')
+    assert mu.symbols.api_entry(symbols[0]) == 'foo \nA module.'
+    assert mu.symbols.api_entry(symbols[2]) == 'foo.Bar(x, y=...) \nA bar.'
+    assert mu.symbols.api_entry(symbols[4]) == 'foo.Bar.baz()'
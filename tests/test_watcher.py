@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for watching files for changes.
+"""
+import signal
+from unittest import mock
+from PyQt5.QtWidgets import QApplication
+import pytest
+from mu.watcher import FileWatcher, watch_file
+
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_FileWatcher_watch(tmpdir):
+    """
+    Files (and directories) are only added to the underlying watcher once,
+    and can be unwatched.
+    """
+    path = str(tmpdir.join('foo.py'))
+    fw = FileWatcher()
+    assert not fw.watch(path)  # It doesn't exist.
+    open(path, 'w').close()
+    assert fw.watch(path)
+    assert fw.watch(path)
+    assert fw.watcher.files() == [path]
+    fw.on_file_changed(path)
+    fw.unwatch(path)
+    assert fw.watcher.files() == []
+    assert fw.paths == set()
+    assert fw.changed == set()
+    # Directories too.
+    assert fw.watch(str(tmpdir))
+    assert fw.watch(str(tmpdir))
+    assert fw.watcher.directories() == [str(tmpdir)]
+    fw.unwatch(str(tmpdir))
+    assert fw.watcher.directories() == []
+
+
+def test_FileWatcher_debounce(tmpdir):
+    """
+    Several changes in quick succession are reported once, after the timer
+    runs out.
+    """
+    path = str(tmpdir.join('foo.py'))
+    open(path, 'w').close()
+    fw = FileWatcher()
+    fw.watch(path)
+    fw.file_changed = mock.MagicMock()
+    fw.on_file_changed(path)
+    fw.on_file_changed(path)
+    assert fw.timer.isActive()
+    assert fw.file_changed.emit.call_count == 0
+    fw.report_changes()
+    fw.file_changed.emit.assert_called_once_with(path)
+    fw.report_changes()
+    assert fw.file_changed.emit.call_count == 1
+
+
+def test_FileWatcher_replaced(tmpdir):
+    """
+    A file replaced by renaming is watched again once the change is reported.
+    Unwatched files aren't reported.
+    """
+    path = str(tmpdir.join('foo.py'))
+    open(path, 'w').close()
+    fw = FileWatcher()
+    fw.watch(path)
+    fw.file_changed = mock.MagicMock()
+    fw.watcher.removePath(path)  # As happens when it's replaced.
+    fw.on_file_changed(path)
+    fw.on_file_changed('bar.py')
+    fw.report_changes()
+    fw.file_changed.emit.assert_called_once_with(path)
+    assert fw.watcher.files() == [path]
+
+
+def test_FileWatcher_notified(tmpdir):
+    """
+    Changes to watched files are noticed via the operating system.
+    """
+    path = str(tmpdir.join('foo.py'))
+    open(path, 'w').close()
+    fw = FileWatcher(debounce=10)
+    fw.watch(path)
+    changed = []
+    fw.file_changed.connect(changed.append)
+    with open(path, 'w') as f:
+        f.write('foo')
+    for _ in range(100):
+        app.processEvents()
+        if changed:
+            break
+        fw.thread().msleep(10)
+    assert changed == [path]
+
+
+def test_watch_file(tmpdir):
+    """
+    The function is called each time the file changes, until the event loop
+    is stopped. The Ctrl-C handler is put back afterwards.
+    """
+    path = str(tmpdir.join('foo.py'))
+    open(path, 'w').close()
+    func = mock.MagicMock()
+    previous = signal.getsignal(signal.SIGINT)
+
+    def exec_():
+        assert signal.getsignal(signal.SIGINT) is not previous
+        return 0
+
+    mock_app = mock.MagicMock()
+    mock_app.exec_.side_effect = exec_
+    with mock.patch('mu.watcher.QCoreApplication.instance',
+                    return_value=mock_app), \
+            mock.patch('mu.watcher.FileWatcher') as mock_fw:
+        mock_fw.return_value.watch.return_value = True
+        watch_file(path, func, 'foo', bar='baz')
+    assert mock_app.exec_.call_count == 1
+    callback = mock_fw.return_value.file_changed.connect.call_args[0][0]
+    callback(path)
+    func.assert_called_once_with('foo', bar='baz')
+    mock_fw.return_value.unwatch.assert_called_once_with(path)
+    assert signal.getsignal(signal.SIGINT) is previous
+
+
+def test_watch_file_missing(tmpdir):
+    """
+    An error is raised if the file can't be watched.
+    """
+    with pytest.raises(IOError):
+        watch_file(str(tmpdir.join('foo.py')), mock.MagicMock())
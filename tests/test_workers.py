@@ -0,0 +1,706 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the objects that do Mu's slower work in the background.
+"""
+import os
+import io
+import json
+import pickle
+import re
+from unittest import mock
+
+import mu.files
+import mu.search
+import mu.workers
+
+
+def test_CodeChecker():
+    """
+    Code is checked in a worker process and the results are emitted as they
+    arrive, followed by the finished signal.
+    """
+    cc = mu.workers.CodeChecker()
+    checked = []
+    finished = []
+    cc.checked.connect(lambda kind, feedback: checked.append(kind))
+    cc.finished.connect(lambda: finished.append(True))
+    cc.check('foo.py', 'import foo\n', None)
+    try:
+        cc.wait(30)
+        assert checked == ['error', 'style']
+        assert finished == [True]
+        assert cc.job is None
+    finally:
+        cc.stop()
+    assert cc.process.poll() == 0
+
+
+def test_CodeChecker_worker_dies():
+    """
+    If the worker process dies mid-check, the parts of the check that never
+    arrived are emitted with no feedback, so the check still finishes.
+    """
+    cc = mu.workers.CodeChecker()
+    checked = []
+    finished = []
+    cc.checked.connect(lambda kind, feedback: checked.append((kind, feedback)))
+    cc.finished.connect(lambda: finished.append(True))
+    process = mock.MagicMock()
+    process.stdout = io.BytesIO(pickle.dumps((1, 'error', {1: ['a']})))
+    process.wait.return_value = -9
+    cc.job = 1
+    cc._receive(process)
+    cc.collect()
+    assert checked == [('error', {1: ['a']}), ('style', {})]
+    assert finished == [True]
+
+
+def test_CodeChecker_cancelled():
+    """
+    Results from a cancelled (or superseded) check are thrown away.
+    """
+    cc = mu.workers.CodeChecker()
+    cc.checked = mock.MagicMock()
+    cc.finished = mock.MagicMock()
+    cc.job = 2
+    cc.results.put((1, 'error', {1: []}))
+    cc.results.put((1, 'style', {}))
+    cc.results.put((2, 'error', {2: []}))
+    cc.collect()
+    cc.checked.emit.assert_called_once_with('error', {2: []})
+    assert cc.finished.emit.call_count == 0
+    cc.cancel()
+    cc.results.put((2, 'style', {}))
+    cc.collect()
+    assert cc.checked.emit.call_count == 1
+    assert cc.finished.emit.call_count == 0
+
+
+def test_CheckResults(tmpdir):
+    """
+    Results are remembered by path and key, and saved to (and loaded from)
+    the cache file.
+    """
+    cache_path = str(tmpdir.join('check_results.json'))
+    results = {'error': {3: [{'line_no': 3, 'message': 'a'}]}, 'style': {}}
+    cr = mu.workers.CheckResults(cache_path)
+    assert cr.get('foo.py', 'key') is None
+    cr.put('foo.py', 'key', results)
+    assert cr.get('foo.py', 'key') == results
+    assert cr.get('foo.py', 'other key') is None
+    assert cr.get('bar.py', 'key') is None
+    cr.save()
+    assert not cr.changed
+    cr = mu.workers.CheckResults(cache_path)
+    assert cr.get('foo.py', 'key') == results
+
+
+def test_CheckResults_recent_only(tmpdir):
+    """
+    Only the results for the most recently checked files are kept.
+    """
+    cr = mu.workers.CheckResults(str(tmpdir.join('check_results.json')))
+    cr.size = 2
+    cr.put('foo.py', 'key', {})
+    cr.put('bar.py', 'key', {})
+    cr.get('foo.py', 'key')
+    cr.put('baz.py', 'key', {})
+    assert list(cr.results) == ['foo.py', 'baz.py']
+
+
+def test_CheckResults_unchanged(tmpdir):
+    """
+    The cache file is only written if the results have changed.
+    """
+    cr = mu.workers.CheckResults(str(tmpdir.join('check_results.json')))
+    with mock.patch('builtins.open') as mock_open:
+        cr.save()
+    assert mock_open.call_count == 0
+
+
+def test_CheckResults_corrupt(tmpdir):
+    """
+    A corrupt cache file is ignored (and logged).
+    """
+    cache = tmpdir.join('check_results.json')
+    cache.write('not json')
+    cr = mu.workers.CheckResults(str(cache))
+    with mock.patch('mu.workers.logger.error') as mock_error:
+        assert cr.get('foo.py', 'key') is None
+    assert mock_error.call_count == 1
+
+
+def test_FileReader():
+    """
+    Files are read in the background and the results, including any errors,
+    are passed to the callback.
+    """
+    callback = mock.MagicMock()
+    reader = mu.workers.FileReader(callback)
+    error = UnicodeDecodeError('utf-8', b'', 0, 1, 'bad')
+    with mock.patch('mu.workers.read_and_decode',
+                    side_effect=[('foo', '\n'), error]):
+        reader.read('foo.py')
+        reader.read('bar.py')
+        reader.wait()
+    assert callback.call_args_list == [mock.call('foo.py', ('foo', '\n')),
+                                       mock.call('bar.py', error)]
+    # Nothing left to collect.
+    reader.collect()
+    assert callback.call_count == 2
+
+
+def test_FileWriter_coalesces():
+    """
+    Repeated saves to the same path before it's written only write the
+    latest content, once. Each path is written in the order first queued.
+    """
+    saved = mock.MagicMock()
+    writer = mu.workers.FileWriter()
+    writer.saved.connect(saved)
+    with mock.patch('mu.workers.threading.Thread'):
+        writer.save('foo.py', 'a', '\n')
+        writer.save('bar.py', 'b', '\n')
+        writer.save('foo.py', 'c', '\r\n')
+    assert writer.paths.qsize() == 2
+    with mock.patch('mu.workers.save_and_encode') as mock_save:
+        writer._write(writer.paths.get())
+        writer._write(writer.paths.get())
+    assert mock_save.call_args_list == [
+        mock.call('c', 'foo.py', '\r\n', atomic=True),
+        mock.call('b', 'bar.py', '\n', atomic=True),
+    ]
+    writer.collect()
+    assert saved.call_args_list == [mock.call('foo.py', 'c'),
+                                    mock.call('bar.py', 'b')]
+
+
+def test_FileWriter_failed():
+    """
+    Files are written in a background thread and problems are reported via
+    the failed signal.
+    """
+    saved = mock.MagicMock()
+    failed = mock.MagicMock()
+    writer = mu.workers.FileWriter()
+    writer.saved.connect(saved)
+    writer.failed.connect(failed)
+    error = OSError('boom')
+    with mock.patch('mu.workers.save_and_encode', side_effect=[None, error]):
+        writer.save('foo.py', 'a', '\n')
+        writer.wait()
+        writer.save('foo.py', 'b', '\n')
+        writer.wait()
+    saved.assert_called_once_with('foo.py', 'a')
+    failed.assert_called_once_with('foo.py', error)
+
+
+def test_FileWriter_external_change(tmpdir):
+    """
+    If a file has been changed by another program since it was loaded, it
+    isn't written. Changes made by the writer itself don't count.
+    """
+    failed = mock.MagicMock()
+    saved = mock.MagicMock()
+    writer = mu.workers.FileWriter()
+    writer.failed.connect(failed)
+    writer.saved.connect(saved)
+    foo = tmpdir.join('foo.py')
+    foo.write('foo')
+    filepath = str(foo)
+    signature = mu.files.file_signature(filepath)
+    writer.save(filepath, 'bar', '\n', expected=signature)
+    writer.wait()
+    writer.save(filepath, 'baz', '\n', expected=signature)
+    writer.wait()
+    assert foo.read() == 'baz'
+    assert saved.call_count == 2
+    os.utime(filepath, ns=(0, 0))
+    writer.save(filepath, 'qux', '\n', expected=signature)
+    writer.wait()
+    assert foo.read() == 'baz'
+    assert failed.call_count == 1
+    assert isinstance(failed.call_args[0][1], mu.workers.FileChangedError)
+
+
+def test_FileSearcher_search(tmpdir):
+    """
+    The open tabs and then the files are searched in the background, and the
+    matches in each are reported as they're found, followed by the totals.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('x = 1\nfoo(x)\n')
+    bar = tmpdir.join('bar.py')
+    bar.write('y = 2\n')
+    searcher = mu.workers.FileSearcher()
+    found = mock.MagicMock()
+    finished = mock.MagicMock()
+    searcher.found.connect(found)
+    searcher.finished.connect(finished)
+    pattern = mu.search.compile_pattern('x')
+    searcher.search(pattern, {'tab.py': 'x\n'}, [str(foo), str(bar)])
+    searcher.wait()
+    assert [c[0][0] for c in found.call_args_list] == ['tab.py', str(foo)]
+    matches = found.call_args_list[1][0][1]
+    assert [(m['line'], m['column']) for m in matches] == [(0, 0), (1, 4)]
+    finished.assert_called_once_with(3, 2)
+
+
+def test_FileSearcher_reads_changed_files_only(tmpdir):
+    """
+    The text of the files searched is kept, so they're only read again once
+    they've changed. Files that can't be read, or aren't text, are skipped.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('x = 1\n')
+    binary = tmpdir.join('binary.py')
+    binary.write_binary(b'x\0')
+    missing = str(tmpdir.join('missing.py'))
+    searcher = mu.workers.FileSearcher()
+    finished = mock.MagicMock()
+    searcher.finished.connect(finished)
+    pattern = mu.search.compile_pattern('x')
+    paths = [str(foo), str(binary), missing]
+    with mock.patch('mu.workers.read_and_decode',
+                    wraps=mu.workers.read_and_decode) as mock_read:
+        searcher.search(pattern, {}, paths)
+        searcher.wait()
+        assert mock_read.call_count == 3
+        searcher.search(pattern, {}, paths)
+        searcher.wait()
+        assert mock_read.call_count == 3
+        foo.write('x = x\n')
+        os.utime(str(foo), ns=(0, 0))
+        searcher.search(pattern, {}, paths)
+        searcher.wait()
+        assert mock_read.call_count == 4
+    assert finished.call_args_list == [mock.call(1, 1), mock.call(1, 1),
+                                       mock.call(2, 1)]
+
+
+def test_FileSearcher_replace(tmpdir):
+    """
+    When replacing, the new text of the files that aren't open is reported
+    (with what's needed to save it), but not that of the open tabs.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('x = 1\r\nx\r\n')
+    searcher = mu.workers.FileSearcher()
+    replaced = mock.MagicMock()
+    searcher.replaced.connect(replaced)
+    pattern = mu.search.compile_pattern('x')
+    searcher.search(pattern, {'tab.py': 'x\n'}, [str(foo)],
+                    mu.search.replacer('y'))
+    searcher.wait()
+    replaced.assert_called_once_with(str(foo), 'y = 1\ny\n', '\r\n',
+                                     mu.files.file_signature(str(foo)))
+
+
+def test_FileSearcher_cancel():
+    """
+    Once a search is cancelled (or replaced by another) nothing more is
+    reported about it.
+    """
+    searcher = mu.workers.FileSearcher()
+    found = mock.MagicMock()
+    searcher.found.connect(found)
+    pattern = mu.search.compile_pattern('x')
+    searcher.search(pattern, {'tab.py': 'x\n'}, [])
+    searcher._thread.join()
+    searcher.cancel()
+    searcher.collect()
+    assert found.call_count == 0
+    searcher.search(pattern, {'tab.py': 'x\n'}, [])
+    searcher.wait()
+    assert found.call_count == 1
+
+
+def test_FileSearcher_error():
+    """
+    If searching fails unexpectedly, it's logged and the search still
+    finishes.
+    """
+    searcher = mu.workers.FileSearcher()
+    finished = mock.MagicMock()
+    searcher.finished.connect(finished)
+    pattern = mu.search.compile_pattern('x')
+    with mock.patch('mu.workers.search.find_matches',
+                    side_effect=[[{'line': 0}], re.error('bad')]), \
+            mock.patch('mu.workers.logger.exception') as mock_exception:
+        searcher.search(pattern, {'a.py': 'x\n', 'b.py': 'x\n'}, [])
+        searcher.wait()
+    assert mock_exception.call_count == 1
+    finished.assert_called_once_with(1, 1)
+
+
+def test_LogSearcher():
+    """
+    The log is searched in the background and the found signal is emitted
+    with the result of the current search. A superseded search is cancelled
+    and its result ignored.
+    """
+    searcher = mu.workers.LogSearcher()
+    found = mock.MagicMock()
+    searcher.found.connect(found)
+    stale = []
+
+    def search(text, level, cancelled):
+        if text == 'old':
+            searcher.cancel()  # As if superseded.
+            stale.append(cancelled())
+            return None
+        return 'records'
+
+    log_file = mock.MagicMock()
+    log_file.search.side_effect = search
+    searcher.search(log_file, 'old')
+    searcher.wait()
+    assert found.call_count == 0
+    searcher.search(log_file, 'new', 'INFO')
+    searcher.wait()
+    assert stale == [True]
+    found.assert_called_once_with('records')
+    searcher.cancel()
+    searcher.results.put((searcher.job - 1, 'stale'))
+    searcher.collect()
+    assert found.call_count == 1
+
+
+def test_SymbolIndex_update(tmpdir):
+    """
+    Files are parsed in the background, and the changed signal is emitted
+    once their symbols are known. Files are only parsed again once they've
+    changed, and their symbols are forgotten once they're removed.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('def bar(x):\n    """Do bar."""\n')
+    index = mu.workers.SymbolIndex(str(tmpdir.join('symbols.json')))
+    changed = mock.MagicMock()
+    index.changed.connect(changed)
+    with mock.patch('mu.workers.read_and_decode',
+                    wraps=mu.workers.read_and_decode) as mock_read:
+        index.update([str(foo)])
+        index.wait()
+        assert changed.call_count == 1
+        assert index.api() == ['foo', 'foo.bar(x) \nDo bar.']
+        index.update([str(foo)])
+        index.wait()
+        assert mock_read.call_count == 1
+    assert changed.call_count == 1
+    assert index.definitions('bar') == [
+        (str(foo), index.files[str(foo)][1][1])]
+    foo.remove()
+    index.update([str(foo)])
+    index.wait()
+    assert changed.call_count == 2
+    assert index.api() == []
+    assert index.definitions('bar') == []
+
+
+def test_SymbolIndex_syntax_error(tmpdir):
+    """
+    If a file can't be parsed, the symbols found in it before are kept.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('def bar(x):\n    pass\n')
+    index = mu.workers.SymbolIndex(str(tmpdir.join('symbols.json')))
+    index.update([str(foo)])
+    index.wait()
+    foo.write('def bar(x:\n    pass\n')
+    index.update([str(foo)])
+    index.wait()
+    assert index.api() == ['foo', 'foo.bar(x)']
+    assert index.files[str(foo)][0] == list(mu.files.file_signature(str(foo)))
+
+
+def test_SymbolIndex_unexpected_error(tmpdir):
+    """
+    If indexing a file fails unexpectedly, it's logged and the other files
+    are still indexed.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('x = 1\n')
+    bar = tmpdir.join('bar.py')
+    bar.write('def bar():\n    pass\n')
+    index = mu.workers.SymbolIndex(str(tmpdir.join('symbols.json')))
+    with mock.patch('mu.workers.symbols.find_symbols',
+                    side_effect=[RecursionError(), [{'name': 'bar'}]]), \
+            mock.patch('mu.workers.logger.exception') as mock_exception:
+        index.update([str(foo), str(bar)])
+        index.wait()
+    assert mock_exception.call_count == 1
+    assert str(foo) in mock_exception.call_args[0][0]
+    assert index.files[str(foo)][1] == []
+    assert index.files[str(bar)][1] == [{'name': 'bar'}]
+
+
+def test_SymbolIndex_forget_others(tmpdir):
+    """
+    If asked, the symbols of files other than those being indexed are
+    forgotten, including those read from the cache, and they're indexed
+    again if they're wanted later.
+    """
+    old = tmpdir.mkdir('old').join('old.py')
+    old.write('def old():\n    pass\n')
+    new = tmpdir.mkdir('new').join('new.py')
+    new.write('def new():\n    pass\n')
+    cache_path = str(tmpdir.join('symbols.json'))
+    index = mu.workers.SymbolIndex(cache_path)
+    index.update([str(old)])
+    index.wait()
+    index.save()
+    index = mu.workers.SymbolIndex(cache_path)
+    changed = mock.MagicMock()
+    index.changed.connect(changed)
+    index.update([str(new)], forget_others=True)
+    index.wait()
+    assert index.api() == ['new', 'new.new()']
+    assert list(index.files) == [str(new)]
+    assert changed.call_count
+    index.update([str(old)])
+    index.wait()
+    assert index.api() == ['new', 'new.new()', 'old', 'old.old()']
+    index.save()
+    index = mu.workers.SymbolIndex(cache_path)
+    index.update([str(old)], forget_others=True)
+    index.wait()
+    assert index.api() == ['old', 'old.old()']
+
+
+def test_SymbolIndex_cache(tmpdir):
+    """
+    The symbols are saved, so once Mu restarts only the files that have
+    changed in the meantime are parsed.
+    """
+    foo = tmpdir.join('foo.py')
+    foo.write('def foo():\n    pass\n')
+    bar = tmpdir.join('bar.py')
+    bar.write('def bar():\n    pass\n')
+    cache_path = str(tmpdir.join('symbols.json'))
+    index = mu.workers.SymbolIndex(cache_path)
+    index.save()
+    assert not tmpdir.join('symbols.json').exists()
+    index.update([str(foo), str(bar)])
+    index.wait()
+    index.save()
+    assert not index.modified
+    bar.write('def bar_baz():\n    pass\n')
+    index = mu.workers.SymbolIndex(cache_path)
+    with mock.patch('mu.workers.read_and_decode',
+                    wraps=mu.workers.read_and_decode) as mock_read:
+        index.update([])
+        index.wait()
+    mock_read.assert_called_once_with(str(bar))
+    assert index.api() == ['bar', 'bar.bar_baz()', 'foo', 'foo.foo()']
+
+
+def test_SymbolIndex_bad_cache(tmpdir):
+    """
+    If the cache file can't be read, all the files are parsed.
+    """
+    cache = tmpdir.join('symbols.json')
+    cache.write('{"foo": "bar"}')
+    foo = tmpdir.join('foo.py')
+    foo.write('def foo():\n    pass\n')
+    index = mu.workers.SymbolIndex(str(cache))
+    with mock.patch('mu.workers.logger.error') as mock_error:
+        index.update([str(foo)])
+        index.wait()
+    assert mock_error.call_count == 1
+    assert index.api() == ['foo', 'foo.foo()']
+
+
+def test_SymbolIndex_save_fails(tmpdir):
+    """
+    If the symbols can't be saved, it's logged.
+    """
+    index = mu.workers.SymbolIndex(str(tmpdir.join('missing', 'symbols.json')))
+    index.modified = True
+    with mock.patch('mu.workers.logger.error') as mock_error:
+        index.save()
+    assert mock_error.call_count == 1
+    assert index.modified
+
+
+def test_Outliner_outline():
+    """
+    Code is outlined in the background, and the outlined signal is emitted
+    with the document and its outline.
+    """
+    outliner = mu.workers.Outliner()
+    slot = mock.MagicMock()
+    outliner.outlined.connect(slot)
+    outliner.outline('foo', 'def foo():\n    pass\n')
+    outliner.wait()
+    slot.assert_called_once_with('foo', [{'name': 'foo', 'kind': 'function',
+                                          'line': 0, 'column': 4,
+                                          'depth': 0}])
+
+
+def test_Outliner_latest_only():
+    """
+    Only the latest request is outlined (or has its outline emitted).
+    """
+    outliner = mu.workers.Outliner()
+    slot = mock.MagicMock()
+    outliner.outlined.connect(slot)
+    outliner._thread = mock.MagicMock()  # Don't start the thread yet.
+    outliner.outline('foo', 'foo = 1\n')
+    outliner.outline('bar', 'bar = 1\n')
+    outliner._thread = None
+    outliner.outline('baz', 'baz = 1\n')
+    outliner.wait()
+    assert slot.call_count == 1
+    assert slot.call_args[0][0] == 'baz'
+    assert list(outliner.documents) == ['baz']
+    outliner.results.put((1, 'foo', []))
+    outliner.collect()
+    assert slot.call_count == 1
+
+
+def test_Outliner_documents():
+    """
+    What's known about only the most recently outlined documents is kept.
+    """
+    outliner = mu.workers.Outliner()
+    outliner.size = 2
+    for document in ('foo', 'bar', 'foo', 'baz'):
+        outliner._outline(1, document, 'x = 1\n')
+    assert list(outliner.documents) == ['foo', 'baz']
+
+
+def test_ModuleIndex_init():
+    """
+    Before the path has been scanned only the builtin module names are known.
+    """
+    mi = mu.workers.ModuleIndex('foo.json')
+    assert mi.cache_path == 'foo.json'
+    assert 'sys' in mi.names
+    assert 'builtins' in mi.names
+    assert 'turtle' not in mi.names
+    assert mi.ready is False
+
+
+def test_ModuleIndex_contains_before_scan():
+    """
+    Until the names are ready, checking for a name asks the import system
+    about it rather than waiting for the background refresh to finish.
+    """
+    mi = mu.workers.ModuleIndex('foo.json')
+    mi._thread = mock.MagicMock()
+    mi._thread.is_alive.return_value = True
+    assert 'sys' in mi
+    assert 'turtle' in mi
+    assert 'mu_no_such_module' not in mi
+    with mock.patch('mu.workers.find_spec', side_effect=ValueError):
+        assert 'foo' not in mi
+    assert mi._thread.join.call_count == 0
+    mi.ready = True
+    with mock.patch('mu.workers.find_spec') as find_spec:
+        assert 'turtle' not in mi
+    assert find_spec.call_count == 0
+
+
+def test_ModuleIndex_path_signature():
+    """
+    The signature is the entries on sys.path and their modification times.
+    Missing entries have no modification time.
+    """
+    with mock.patch('sys.path', ['', 'foo', 'bar']), \
+            mock.patch('os.stat', side_effect=[mock.MagicMock(st_mtime=1),
+                                               mock.MagicMock(st_mtime=2),
+                                               FileNotFoundError()]) as st:
+        sig = mu.workers.ModuleIndex.path_signature()
+    assert sig == [['', 1], ['foo', 2], ['bar', None]]
+    assert st.call_args_list[0][0][0] == os.curdir
+
+
+def test_ModuleIndex_scan():
+    """
+    Scanning finds the names of modules on the path and the builtins.
+    """
+    mi = mu.workers.ModuleIndex('foo.json')
+    with mock.patch('pkgutil.iter_modules',
+                    return_value=[(None, 'turtle', False), ]):
+        names = mi.scan()
+    assert 'turtle' in names
+    assert 'sys' in names
+    assert 'builtins' in names
+
+
+def test_ModuleIndex_refresh_cache_fresh(tmpdir):
+    """
+    If the cache matches the current state of the path, its names are used
+    without scanning the path.
+    """
+    cache_path = os.path.join(str(tmpdir), 'module_names.json')
+    with open(cache_path, 'w') as f:
+        json.dump({'path': [['foo', 1]], 'names': ['turtle']}, f)
+    mi = mu.workers.ModuleIndex(cache_path)
+    mi.scan = mock.MagicMock()
+    with mock.patch.object(mi, 'path_signature', return_value=[['foo', 1]]):
+        mi.refresh()
+    assert mi.scan.call_count == 0
+    assert mi.ready is True
+    assert 'turtle' in mi
+    assert 'sys' in mi
+
+
+def test_ModuleIndex_refresh_cache_stale(tmpdir):
+    """
+    If the path has changed since the cache was written, the path is scanned
+    and the cache is updated.
+    """
+    cache_path = os.path.join(str(tmpdir), 'module_names.json')
+    with open(cache_path, 'w') as f:
+        json.dump({'path': [['foo', 1]], 'names': ['turtle']}, f)
+    mi = mu.workers.ModuleIndex(cache_path)
+    mi.scan = mock.MagicMock(return_value={'sys', 'turtle', 'pgzero'})
+    with mock.patch.object(mi, 'path_signature', return_value=[['foo', 2]]):
+        mi.refresh()
+    assert mi.names == {'sys', 'turtle', 'pgzero'}
+    with open(cache_path) as f:
+        assert json.load(f) == {'path': [['foo', 2]],
+                                'names': ['pgzero', 'sys', 'turtle']}
+
+
+def test_ModuleIndex_refresh_no_cache(tmpdir):
+    """
+    If there's no cache the path is scanned and a new cache is written.
+    """
+    cache_path = os.path.join(str(tmpdir), 'module_names.json')
+    mi = mu.workers.ModuleIndex(cache_path)
+    mi.scan = mock.MagicMock(return_value={'turtle'})
+    with mock.patch.object(mi, 'path_signature', return_value=[]):
+        mi.refresh()
+    assert mi.ready is True
+    assert 'turtle' in mi
+    assert os.path.exists(cache_path)
+
+
+def test_ModuleIndex_refresh_bad_cache(tmpdir):
+    """
+    A cache that can't be read or written is logged and the names found by
+    scanning the path are still used.
+    """
+    cache_path = os.path.join(str(tmpdir), 'module_names.json')
+    with open(cache_path, 'w') as f:
+        f.write('not json')
+    mi = mu.workers.ModuleIndex(cache_path)
+    mi.scan = mock.MagicMock(return_value={'turtle'})
+    with mock.patch('mu.workers.logger.error') as log, \
+            mock.patch('json.dump', side_effect=OSError()):
+        mi.refresh()
+    assert log.call_count == 2
+    assert 'turtle' in mi
+
+
+def test_ModuleIndex_refresh_in_background():
+    """
+    The refresh happens in a daemon thread.
+    """
+    mi = mu.workers.ModuleIndex('foo.json')
+    with mock.patch('threading.Thread') as mock_thread:
+        mi.refresh_in_background()
+    mock_thread.assert_called_once_with(target=mi.refresh, daemon=True)
+    mi._thread.start.assert_called_once_with()
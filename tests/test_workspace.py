@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the index of files in workspace directories.
+"""
+import os
+from unittest import mock
+from PyQt5.QtWidgets import QApplication
+from mu.workspace import WorkspaceIndex, workspace_index
+
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_WorkspaceIndex_scan(tmpdir):
+    """
+    Only files are found, using scandir.
+    """
+    tmpdir.join('foo.py').write('')
+    tmpdir.join('bar.txt').write('')
+    tmpdir.mkdir('images')
+    index = WorkspaceIndex(str(tmpdir))
+    with mock.patch('os.path.isfile') as mock_isfile:
+        assert index.scan() == {'foo.py', 'bar.txt'}
+    assert mock_isfile.call_count == 0
+
+
+def test_WorkspaceIndex_scan_fail(tmpdir):
+    """
+    A directory that can't be listed has no files and a warning is logged.
+    """
+    index = WorkspaceIndex(str(tmpdir.join('missing')))
+    with mock.patch('mu.workspace.logger.warning') as mock_warning:
+        assert index.scan() == set()
+    assert mock_warning.call_count == 1
+
+
+def test_WorkspaceIndex_refresh(tmpdir):
+    """
+    Refreshing reports and emits the names of the files added and removed.
+    """
+    tmpdir.join('foo.py').write('')
+    index = WorkspaceIndex(str(tmpdir))
+    index.changed = mock.MagicMock()
+    assert index.refresh() == (['foo.py'], [])
+    tmpdir.join('foo.py').remove()
+    tmpdir.join('baz.py').write('')
+    tmpdir.join('bar.py').write('')
+    assert index.refresh() == (['bar.py', 'baz.py'], ['foo.py'])
+    assert index.refresh() == ([], [])
+    assert index.changed.emit.call_args_list == [
+        mock.call(['foo.py'], []),
+        mock.call(['bar.py', 'baz.py'], ['foo.py']),
+    ]
+
+
+def test_WorkspaceIndex_files_watched(tmpdir):
+    """
+    A watched directory is listed once, and again when it changes.
+    """
+    tmpdir.join('foo.py').write('')
+    index = WorkspaceIndex(str(tmpdir))
+    with mock.patch.object(index, 'scan', wraps=index.scan) as mock_scan:
+        assert index.files() == ['foo.py']
+        assert index.watching
+        tmpdir.join('bar.py').write('')
+        assert index.files() == ['foo.py']
+        assert mock_scan.call_count == 1
+        index.watcher.file_changed.emit(str(tmpdir))
+        assert index.files() == ['bar.py', 'foo.py']
+        assert mock_scan.call_count == 2
+
+
+def test_WorkspaceIndex_files_not_watched(tmpdir):
+    """
+    A directory that can't be watched is listed each time.
+    """
+    tmpdir.join('foo.py').write('')
+    index = WorkspaceIndex(str(tmpdir))
+    index.watcher.watch = mock.MagicMock(return_value=False)
+    assert index.files() == ['foo.py']
+    tmpdir.join('bar.py').write('')
+    assert index.files() == ['bar.py', 'foo.py']
+
+
+def test_WorkspaceIndex_notified(tmpdir):
+    """
+    Files added to the directory are noticed via the operating system.
+    """
+    index = WorkspaceIndex(str(tmpdir))
+    index.watcher.timer.setInterval(10)
+    assert index.files() == []
+    changes = []
+    index.changed.connect(lambda added, removed: changes.append(added))
+    tmpdir.join('foo.py').write('')
+    for _ in range(100):
+        app.processEvents()
+        if changes:
+            break
+        index.thread().msleep(10)
+    assert changes == [['foo.py']]
+
+
+def test_workspace_index(tmpdir):
+    """
+    The index for each directory is shared.
+    """
+    with mock.patch('mu.workspace._INDEXES', {}):
+        index = workspace_index(str(tmpdir))
+        assert workspace_index(str(tmpdir) + os.sep) is index
+        assert index.directory == str(tmpdir)
+        assert workspace_index(str(tmpdir.mkdir('foo'))) is not index
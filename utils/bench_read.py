@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Measures how long Mu takes to read and decode large files, such as the CSV
+and log files produced by data-logging projects.
+
+Files of several sizes are generated in a temporary directory. For each, the
+time taken by mu.files.read_and_decode is compared with the time taken to
+simply read the raw bytes, which is the best that could be done. Run from the
+root of the repository:
+
+    $ python utils/bench_read.py [runs]
+"""
+import os
+import sys
+import random
+import shutil
+import tempfile
+import statistics
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '..')))
+from mu.files import read_and_decode  # noqa: E402
+
+
+#: Sizes, in megabytes, of the files to generate.
+SIZES = (1, 4, 16)
+
+
+def csv_line(i):
+    """
+    Return a line of a CSV file of readings from a micro:bit.
+    """
+    return '{:.2f},{},{},{},{}'.format(
+        i * 0.02, random.randint(-1024, 1024), random.randint(-1024, 1024),
+        random.randint(-1024, 1024), random.randint(0, 255))
+
+
+def log_line(i):
+    """
+    Return a line of a log file (including some non-ASCII characters).
+    """
+    return '2018-06-{:02d} 12:{:02d}:{:02d} INFO température={:.1f}°C'.format(
+        i % 28 + 1, i % 60, i % 60, random.uniform(10, 30))
+
+
+def generate(path, make_line, megabytes, newline):
+    """
+    Write a file of (roughly) the referenced size made of lines created by
+    the make_line function.
+    """
+    target = megabytes * 1024 * 1024
+    size = 0
+    i = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        while size < target:
+            line = make_line(i) + newline
+            f.write(line)
+            size += len(line)
+            i += 1
+
+
+def read_bytes(path):
+    """
+    The baseline: read the file's bytes and do nothing with them.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def timeit(func, path, runs):
+    """
+    Return the median time taken (in ms) by calling func(path).
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(path)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    random.seed(42)
+    tmp_dir = tempfile.mkdtemp(prefix='mu-bench-')
+    try:
+        print('{:<32}{:>10}{:>12}{:>12}{:>10}'.format(
+            'File (median of {} runs)'.format(runs), 'MB', 'Read ms',
+            'Decode ms', 'MB/s'))
+        for megabytes in SIZES:
+            for kind, make_line, newline in (('csv', csv_line, '\n'),
+                                             ('log', log_line, '\r\n')):
+                name = '{}_{}mb.{}'.format(kind, megabytes, kind)
+                path = os.path.join(tmp_dir, name)
+                generate(path, make_line, megabytes, newline)
+                read_and_decode(path)  # Warm up the OS file cache.
+                read_ms = timeit(read_bytes, path, runs)
+                decode_ms = timeit(read_and_decode, path, runs)
+                size = os.path.getsize(path) / (1024 * 1024)
+                print('{:<32}{:>10.1f}{:>12.1f}{:>12.1f}{:>10.1f}'.format(
+                    name + ' ({!r})'.format(newline), size, read_ms,
+                    decode_ms, size / decode_ms * 1000))
+    finally:
+        shutil.rmtree(tmp_dir)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Measures how long Mu's window takes to open many tabs, as when restoring a
+session with lots of files.
+
+Fifty tabs of Python code are added to a window, as the editor does. The time
+taken to add the first and last ten is reported, along with how many times
+the application's stylesheet was applied. If adding a tab costs more the more
+tabs there are, the last ten take longer than the first. Pass --retheme to
+theme every tab (and reload the stylesheet) each time a tab is added, as Mu
+used to, for comparison. Run from the root of the repository:
+
+    $ python utils/bench_tabs.py [--retheme] [tabs]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '..')))
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+import mu  # noqa: E402 (Sets up gettext, required by mu.interface.)
+from mu.interface import Window  # noqa: E402
+from mu.interface.themes import DAY_STYLE  # noqa: E402
+
+
+#: The number of tabs to open.
+TABS = 50
+
+
+class Mode:
+    """
+    Stands in for one of Mu's modes, with no buttons or API of its own.
+    """
+
+    def actions(self):
+        return []
+
+    def api(self):
+        return []
+
+
+def code(i):
+    """
+    Return the code of a (roughly 300 line) Python script to open in a tab.
+    """
+    lines = ['"""', 'Script {}.'.format(i), '"""', 'import random', '']
+    for j in range(40):
+        lines.extend([
+            '',
+            'def function_{}(x, y=1):'.format(j),
+            '    """Add the numbers."""',
+            '    total = x + y  # Add them up.',
+            "    print('The total is', total)",
+            '    return random.choice([total, {}])'.format(j),
+        ])
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    retheme = '--retheme' in args
+    if retheme:
+        args.remove('--retheme')
+    tabs = int(args[0]) if args else TABS
+    app = QApplication(sys.argv)
+    window = Window()
+    stylesheets = []
+
+    @window.load_theme.connect
+    def load_theme(theme):
+        stylesheets.append(theme)
+        app.setStyleSheet(DAY_STYLE)
+
+    # Where the window is placed on the screen doesn't matter.
+    window.autosize_window = lambda: None
+    window.setup(lambda *args: None, 'day')
+    window.change_mode(Mode())
+    window.set_theme('day')
+    window.show()
+    app.processEvents()
+    del stylesheets[:]
+    times = []
+    start = time.perf_counter()
+    for i in range(tabs):
+        tab_start = time.perf_counter()
+        window.add_tab('script_{}.py'.format(i), code(i), [], '\n')
+        if retheme:
+            window.loaded_theme = None
+            window.set_theme(window.theme)
+        app.processEvents()
+        times.append((time.perf_counter() - tab_start) * 1000)
+    total = (time.perf_counter() - start) * 1000
+    chunk = min(10, tabs)
+    print('Opened {} tabs{} in {:.0f} ms'.format(
+        tabs, ' (re-theming every tab)' if retheme else '', total))
+    print('First {} tabs: {:.1f} ms per tab'.format(
+        chunk, sum(times[:chunk]) / chunk))
+    print('Last {} tabs: {:.1f} ms per tab'.format(
+        chunk, sum(times[-chunk:]) / chunk))
+    print('Stylesheet applied {} times'.format(len(stylesheets)))
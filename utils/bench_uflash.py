@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Measures the startup cost of importing uflash and the (deferred) cost of
+loading the bundled MicroPython runtime for the first time.
+
+Each measurement is taken in a fresh interpreter so previously imported
+modules don't skew the results. Run from the root of the repository:
+
+    $ python utils/bench_uflash.py [runs]
+
+Uses the resource module, so only works on Unix-like systems (such as the
+Raspberry Pi).
+"""
+import sys
+import json
+import statistics
+import subprocess
+
+
+PROBE = """
+import json, resource, time
+import mu  # Exclude Mu's own gettext setup from the measurement.
+rss = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+rss_start = rss()
+start = time.perf_counter()
+from mu.contrib import uflash
+import_time = time.perf_counter() - start
+rss_import = rss()
+start = time.perf_counter()
+if hasattr(uflash, 'get_runtime'):
+    uflash.get_runtime()
+runtime_time = time.perf_counter() - start
+print(json.dumps({
+    'import_ms': import_time * 1000,
+    'import_rss_kb': rss_import - rss_start,
+    'runtime_ms': runtime_time * 1000,
+    'runtime_rss_kb': rss() - rss_import,
+}))
+"""
+
+
+def probe():
+    """
+    Run the probe in a new interpreter and return the measurements.
+    """
+    output = subprocess.check_output([sys.executable, '-c', PROBE])
+    return json.loads(output.decode('utf-8'))
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    probe()  # Warm up the bytecode cache and OS file cache.
+    results = [probe() for _ in range(runs)]
+    print('uflash startup cost (median of {} runs):'.format(runs))
+    for key in ('import_ms', 'import_rss_kb', 'runtime_ms', 'runtime_rss_kb'):
+        print('    {:<16}{:>10.1f}'.format(
+            key, statistics.median(r[key] for r in results)))
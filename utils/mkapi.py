@@ -1,23 +1,83 @@
 #!/usr/bin/env python3
 """
-Takes a JSON representation of an API and emits elements to be inserted into a
-Python list such that they conform to Scintilla's API description DSL.
+Takes a JSON representation of an API and emits a catalogue of definitions
+that conform to Scintilla's API description DSL, to be saved in the
+mu/modes/api directory:
+
+    $ python utils/mkapi.py pgzero_api.json > mu/modes/api/pygamezero.json
+
+The definitions in the catalogues are translated when Mu loads them. To
+extract them for translators, pass the catalogues with the --pot flag and add
+the output to the messages.pot file created by pygettext:
+
+    $ python utils/mkapi.py --pot mu/modes/api/*.json >> messages.pot
 """
 import sys
 import json
+import argparse
 
 
-if __name__ == '__main__':
-    f = sys.argv[1]
-    with open(f) as api_file:
-        api = json.load(api_file)
+def make_catalogue(api):
+    """
+    Given a list of JSON objects describing an API, return a list of strings
+    in the format parsed by Scintilla.
+    """
     # Sort the JSON objects so diffing code is easier to do.
     sorted_api = sorted(api, key=lambda k: k['name'])
-    # Emit a representation of the API information in the format parsed by
-    # the Scintilla.
+    catalogue = []
     for i in sorted_api:
         name = i['name']
         args = ', '.join(i['args']) if i['args'] else ''
         description = i['description'].replace('\u2013', '--')
-        content = repr('{}({}) \n{}'.format(name, args, description))
-        print('    _({}),'.format(content))
+        catalogue.append('{}({}) \n{}'.format(name, args, description))
+    return catalogue
+
+
+def po_string(text):
+    """
+    Return the text quoted as a (possibly multi-line) string for a .pot file.
+    """
+    escaped = text.replace('\\', '\\\\').replace('"', '\\"').replace(
+        '\t', '\\t')
+    lines = escaped.split('\n')
+    if len(lines) == 1:
+        return '"{}"'.format(escaped)
+    quoted = ['"{}\\n"'.format(line) for line in lines[:-1]]
+    if lines[-1]:
+        quoted.append('"{}"'.format(lines[-1]))
+    return '""\n' + '\n'.join(quoted)
+
+
+def make_pot(catalogue_paths):
+    """
+    Return the entries for a .pot file for the definitions found in the
+    referenced catalogues (ignoring duplicates).
+    """
+    seen = set()
+    entries = []
+    for path in catalogue_paths:
+        with open(path, encoding='utf-8') as catalogue_file:
+            catalogue = json.load(catalogue_file)
+        for i, definition in enumerate(catalogue):
+            if definition in seen:
+                continue
+            seen.add(definition)
+            entries.append('#: {}:{}\nmsgid {}\nmsgstr ""\n'.format(
+                path, i + 1, po_string(definition)))
+    return '\n'.join(entries)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--pot', action='store_true',
+                        help='emit .pot entries for existing catalogues')
+    parser.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+    if args.pot:
+        print(make_pot(args.paths))
+    else:
+        with open(args.paths[0]) as api_file:
+            api = json.load(api_file)
+        json.dump(make_catalogue(api), sys.stdout, ensure_ascii=False,
+                  indent=0)
+        print()